@@ -7,6 +7,7 @@
  * containing Zod schemas for runtime parameter validation.
  */
 
+import { createHash } from 'crypto';
 import * as fs from 'fs';
 import * as path from 'path';
 
@@ -158,6 +159,17 @@ export function metadataToZodSchema(
     return lines.join('\n');
 }
 
+/**
+ * Hash of a script's parameter definitions
+ *
+ * Must match paramSchemaHash() in the CLI's param-validator.ts: clients send
+ * it with params they validated, and equal hashes mean both sides validated
+ * against the same definitions.
+ */
+export function paramSchemaHash(params: Record<string, ParamDefinition> | undefined): string {
+    return createHash('sha256').update(JSON.stringify(params ?? {})).digest('hex').slice(0, 16);
+}
+
 /**
  * Generate the complete schemas file from manifest
  */
@@ -197,6 +209,18 @@ export function generateAllSchemas(
     lines.push('} as const;');
     lines.push('');
 
+    // Parameter definition hashes for skipping validation of pre-validated params
+    lines.push('/**');
+    lines.push(' * Hash of each script\'s parameter definitions');
+    lines.push(' * Params sent with a matching paramsSchemaHash were already validated by the client');
+    lines.push(' */');
+    lines.push('export const scriptSchemaHashes: Record<string, string> = {');
+    for (const [alias, scriptData] of Object.entries(manifest.scripts)) {
+        lines.push(`  "${alias}": "${paramSchemaHash(scriptData.metadata.params)}",`);
+    }
+    lines.push('};');
+    lines.push('');
+
     // Add TypeScript utility types
     lines.push('/**');
     lines.push(' * TypeScript type for the schemas object');
@@ -115,6 +115,7 @@ export class BridgeContext implements IBridgeContext {
     private _outputChannel?: vscode.OutputChannel;
     private _signal?: AbortSignal;
     private _mode?: string;
+    private _emitRecord?: (record: unknown) => void;
     private _testEnvironmentService?: TestEnvironmentService;
 
     constructor(extensionContext: vscode.ExtensionContext, options: IBridgeContextOptions = {}) {
@@ -125,6 +126,7 @@ export class BridgeContext implements IBridgeContext {
         this.extensionContext = extensionContext;
         this._signal = options.signal;
         this._mode = options.mode;
+        this._emitRecord = options.emitRecord;
 
         // Initialize enhanced logger with script name if provided
         // Use provided outputChannel (DI) or create new one
@@ -182,6 +184,28 @@ export class BridgeContext implements IBridgeContext {
         return this._mode;
     }
 
+    /**
+     * Sink for streamed result records
+     */
+    get emitRecord(): ((record: unknown) => void) | undefined {
+        return this._emitRecord;
+    }
+
+    /**
+     * Per-request view of this context
+     *
+     * The factory keeps one BridgeContext per extension context, so the
+     * request-scoped options (signal, mode, record sink) are carried by a
+     * view that delegates everything else to the shared instance.
+     */
+    forRequest(options: Pick<IBridgeContextOptions, 'signal' | 'mode' | 'emitRecord'>): BridgeContext {
+        const view = Object.create(this) as BridgeContext;
+        view._signal = options.signal;
+        view._mode = options.mode;
+        view._emitRecord = options.emitRecord;
+        return view;
+    }
+
     /**
      * Output channel for direct access
      */
@@ -25,6 +25,12 @@ export interface IBridgeContext {
      */
     readonly mode?: string;
 
+    /**
+     * Stream one result item to the client as it is produced (optional)
+     * Present when the transport can carry streamed records
+     */
+    readonly emitRecord?: (record: unknown) => void;
+
     /**
      * Output channel for logging
      */
@@ -318,4 +324,9 @@ export interface IBridgeContextOptions {
      * Request mode (normal/danger)
      */
     mode?: string;
+
+    /**
+     * Sink for streamed result records
+     */
+    emitRecord?: (record: unknown) => void;
 }
\ No newline at end of file
@@ -1,5 +1,6 @@
 import * as vscode from 'vscode';
 import { waitUntilPausedAndGetLocation } from './debug-polling-helpers';
+import { DebugEventHub } from './event-hub';
 
 /**
  * Generate a unique run ID for session correlation
@@ -166,7 +167,8 @@ export async function startDebugAndWait(params: DebugAndWaitParams): Promise<Deb
       }, Math.min(timeoutMs / 2, 10000));
     });
 
-    // 4. Start debugging (listeners are already set up)
+    // 4. Start debugging (listeners are already set up); stops from here on count
+    const after = DebugEventHub.instance.cursor();
     const folder = params.folder || vscode.workspace.workspaceFolders?.[0];
     const started = await vscode.debug.startDebugging(folder, config);
 
@@ -188,13 +190,10 @@ export async function startDebugAndWait(params: DebugAndWaitParams): Promise<Deb
       };
     }
 
-    // 6. Wait for session to initialize
-    await new Promise(resolve => setTimeout(resolve, 500));
+    // 6. Wait for the first stop/termination (DebugEventHub, polling fallback)
+    const result = await waitUntilPausedAndGetLocation(session, timeoutMs, vscode, false, { after });
 
-    // 7. Wait for outcome using standard polling helper
-    const result = await waitUntilPausedAndGetLocation(session, timeoutMs, vscode);
-
-    // 8. Return result with sessionId (already included, but ensure it's set)
+    // 7. Return result with sessionId (already included, but ensure it's set)
     return {
       ...result,
       sessionId: session.id
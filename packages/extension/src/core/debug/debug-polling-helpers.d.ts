@@ -7,6 +7,18 @@
 
 import { DebugErrorCode } from '../errors/debug-errors';
 
+/**
+ * How a stop was detected and how long it took
+ */
+export type StopDetection = {
+  /** 'event': DebugEventHub delivered the DAP event; 'poll': fallback polling */
+  via: 'event' | 'poll';
+  /** ms from the start of the wait until the stop was detected */
+  waitMs: number;
+  /** ms spent querying stackTrace to format the location */
+  locateMs: number;
+};
+
 /**
  * Standard debug outcome result from polling helper
  *
@@ -21,10 +33,13 @@ export type PollingResult =
       functionName: string;
       threadId: number;
       sessionId: string;
+      stopDetection?: StopDetection;
     }
   | {
       event: 'terminated';
       sessionId: string;
+      exitCode?: number;
+      stopDetection?: StopDetection;
     }
   | {
       event: 'error';
@@ -56,23 +71,37 @@ export function waitForStoppedEventAndGetLocation(
 ): Promise<PollingResult>;
 
 /**
- * Poll until debugger is paused, terminated, or error occurs
+ * Wait until debugger is paused, terminated, or error occurs
  *
  * NEVER THROWS - Returns error outcome with IDebugError fields on timeout/failure
  *
  * @param session - VS Code debug session (or null if useActiveSession=true)
  * @param timeoutMs - Maximum time to wait in milliseconds
  * @param vscode - VS Code API (for checking active session)
- * @param useActiveSession - If true, use vscode.debug.activeDebugSession dynamically each poll
+ * @param useActiveSession - If true, accept stops from the whole session tree and
+ *   use vscode.debug.activeDebugSession when polling
+ * @param options.after - DebugEventHub cursor taken before the session was started
  * @returns Promise resolving to debug outcome (stopped | terminated | error)
  */
 export function waitUntilPausedAndGetLocation(
   session: any,
   timeoutMs?: number,
   vscode?: any,
-  useActiveSession?: boolean
+  useActiveSession?: boolean,
+  options?: { after?: number }
 ): Promise<PollingResult>;
 
+/**
+ * Location of a paused session (throws if it is not paused)
+ *
+ * @param session - VS Code debug session
+ * @param stoppedThreadId - threadId from the stopped event, if known
+ */
+export function queryPausedLocation(
+  session: any,
+  stoppedThreadId?: number
+): Promise<PollingResult & { event: 'stopped' }>;
+
 /**
  * Centralized formatter for paused location info
  *
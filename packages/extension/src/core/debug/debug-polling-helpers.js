@@ -1,15 +1,145 @@
 /**
- * Reusable debug polling helpers for step commands
+ * Reusable debug stop-detection helpers for step, continue and start commands
  *
- * These functions provide a simple polling-based approach to waiting for
- * debug state changes, avoiding race conditions with event-based approaches.
+ * Stops are detected from DebugEventHub: its Debug Adapter Trackers see the
+ * adapter's `stopped`, `terminated` and `exited` events as they are sent, so
+ * a step returns as soon as the adapter reports the new location. Polling is
+ * kept only as a fallback for sessions whose events the hub cannot see (hub
+ * not installed, tracker attached too late): it starts after a grace period
+ * and races the event waiter under the same timeout.
+ *
+ * Every outcome carries `stopDetection: { via, waitMs, locateMs }`:
+ * - via: 'event' (hub) or 'poll' (fallback)
+ * - waitMs: from the start of the wait until the stop was detected
+ * - locateMs: stackTrace round-trip(s) to format the location
  *
  * Per Subtask 001 ST001b: Standardized to return IDebugError objects (never throw).
  */
 
 const { findCoreclrThreadWithSource } = require('@core/debug/session-helpers');
+const { DebugEventHub } = require('@core/debug/event-hub');
 const { DebugErrorCode, createDebugError } = require('@core/errors/debug-errors');
 
+/** ms between fallback polling attempts */
+const POLL_INTERVAL_MS = 50;
+
+/** Fallback polling starts this long after the wait when the hub is installed */
+const EVENT_GRACE_MS = 1000;
+
+/**
+ * Resolve after `ms`, or early when the signal aborts
+ */
+function delay(ms, signal) {
+    return new Promise(resolve => {
+        if (signal?.aborted) {
+            resolve();
+            return;
+        }
+        const timer = setTimeout(done, ms);
+        function done() {
+            clearTimeout(timer);
+            signal?.removeEventListener('abort', done);
+            resolve();
+        }
+        signal?.addEventListener('abort', done);
+    });
+}
+
+/**
+ * Run stop detectors concurrently; the first to produce a detection wins and
+ * the rest are aborted
+ *
+ * Each detector is `(signal) => Promise<{via, detectedAt, result} | undefined>`.
+ * A detector that throws fails the whole wait (same as the old single loop).
+ *
+ * @returns {Promise<object|undefined>} Winning detection, or undefined on timeout
+ */
+function raceDetectors(detectors, timeoutMs) {
+    const controller = new AbortController();
+    const timer = setTimeout(() => controller.abort(), timeoutMs);
+    let pending = detectors.length;
+
+    return new Promise((resolve, reject) => {
+        const finish = (fn, value) => {
+            clearTimeout(timer);
+            controller.abort();
+            fn(value);
+        };
+        if (pending === 0) {
+            finish(resolve, undefined);
+            return;
+        }
+        for (const detector of detectors) {
+            detector(controller.signal).then(
+                detection => {
+                    if (detection) {
+                        finish(resolve, detection);
+                    } else if (--pending === 0) {
+                        finish(resolve, undefined);
+                    }
+                },
+                error => finish(reject, error)
+            );
+        }
+    });
+}
+
+/**
+ * Attach stop-detection timing to an outcome
+ */
+function withStopDetection(detection, startTime) {
+    return {
+        ...detection.result,
+        stopDetection: {
+            via: detection.via,
+            waitMs: detection.detectedAt - startTime,
+            locateMs: Date.now() - detection.detectedAt
+        }
+    };
+}
+
+function timeoutOutcome(session, message) {
+    // Return IDebugError instead of throwing (ST001b)
+    const timeoutError = createDebugError(DebugErrorCode.E_NOT_STOPPED, message);
+
+    return {
+        event: 'error',
+        sessionId: session?.id || 'unknown',
+        code: timeoutError.code,
+        message: timeoutError.message,
+        hint: timeoutError.hint,
+        detail: timeoutError.detail
+    };
+}
+
+/**
+ * Detector that waits on DebugEventHub and formats the stopped location
+ */
+function hubDetector(hub, session, options) {
+    return async signal => {
+        const stop = await hub.waitForStop({ ...options, session, signal });
+        if (!stop) {
+            return undefined;
+        }
+
+        const detectedAt = Date.now();
+        if (stop.outcome.kind !== 'stopped') {
+            return {
+                via: 'event',
+                detectedAt,
+                result: { event: 'terminated', sessionId: session.id, exitCode: stop.outcome.exitCode }
+            };
+        }
+
+        const stoppedSession = hub.getSession(stop.sessionId) || session;
+        return {
+            via: 'event',
+            detectedAt,
+            result: await queryPausedLocation(stoppedSession, stop.outcome.threadId)
+        };
+    };
+}
+
 /**
  * Wait for a stopped event after a step operation (capture-query approach)
  *
@@ -17,10 +147,10 @@ const { DebugErrorCode, createDebugError } = require('@core/errors/debug-errors'
  * The customRequest() returns immediately to acknowledge the request, but the actual
  * step happens later. The debug adapter sends a 'stopped' event when ready.
  *
- * This function uses DebugSessionCaptureService to detect when the debugger stops:
- * 1. Record the current count of stopped events
+ * 1. Take the DebugEventHub cursor (and the capture service's stopped count)
  * 2. Send the step operation
- * 3. Poll the capture service until a NEW stopped event appears
+ * 3. Wait for a stop/termination recorded after the cursor; after
+ *    EVENT_GRACE_MS also poll the capture service as a fallback
  * 4. Query stackTrace once (state is fresh)
  *
  * @param {any} session - VS Code debug session
@@ -31,231 +161,287 @@ const { DebugErrorCode, createDebugError } = require('@core/errors/debug-errors'
  * @returns {Promise<object>} Debug outcome {event: 'stopped', file, line, ...}
  */
 async function waitForStoppedEventAndGetLocation(session, threadId, _vscode, stepOperation, timeoutMs = 5000) {
-    const startTime = Date.now();
-    const pollInterval = 50; // ms between polling attempts
+    const hub = DebugEventHub.instance;
 
     // Get the capture service instance from global (installed by extension activation)
     const captureService = global.debugSessionCaptureService;
-    const capturedSession = captureService.getSession(session.id);
+    const capturedSession = captureService?.getSession(session.id);
 
-    if (!capturedSession) {
+    if (!hub.isInstalled() && !capturedSession) {
         throw new Error(`No captured session data found for session ${session.id}`);
     }
 
-    // Record how many stopped events existed BEFORE we send the step request
-    const initialStoppedCount = capturedSession.stoppedEvents.length;
+    // Record where we are BEFORE we send the step request
+    const cursor = hub.cursor();
+    const initialStoppedCount = capturedSession ? capturedSession.stoppedEvents.length : 0;
 
     // Send the step operation
     await stepOperation();
+    const startTime = Date.now();
 
-    // Poll until we see a NEW stopped event or termination in the capture service
-    while (Date.now() - startTime < timeoutMs) {
-        // Check if session terminated (program exited)
-        if (capturedSession.terminated) {
-            return {
-                event: 'terminated',
-                sessionId: session.id,
-                exitCode: capturedSession.exitCode
-            };
-        }
-
-        const currentStoppedCount = capturedSession.stoppedEvents.length;
-
-        // New stopped event detected!
-        if (currentStoppedCount > initialStoppedCount) {
-            // Get the latest stopped event
-            const latestStoppedEvent = capturedSession.stoppedEvents[currentStoppedCount - 1];
-
-            // Now query the fresh location
-            const stackResponse = await session.customRequest('stackTrace', {
-                threadId: latestStoppedEvent.threadId || threadId,
-                startFrame: 0,
-                levels: 1
-            });
-
-            if (!stackResponse.stackFrames || stackResponse.stackFrames.length === 0) {
-                throw new Error('No stack frames available after step');
+    const detectors = [];
+    if (hub.isInstalled()) {
+        detectors.push(hubDetector(hub, session, { after: cursor, scope: 'session', timeoutMs }));
+    }
+    if (capturedSession) {
+        // Fallback: poll the capture service for a NEW stopped event or termination
+        detectors.push(async signal => {
+            if (hub.isInstalled()) {
+                await delay(EVENT_GRACE_MS, signal);
             }
+            while (!signal.aborted) {
+                if (capturedSession.terminated) {
+                    return {
+                        via: 'poll',
+                        detectedAt: Date.now(),
+                        result: { event: 'terminated', sessionId: session.id, exitCode: capturedSession.exitCode }
+                    };
+                }
 
-            const topFrame = stackResponse.stackFrames[0];
-
-            // Use the centralized formatter
-            return formatPausedLocation(session, topFrame, latestStoppedEvent.threadId || threadId);
-        }
+                const currentStoppedCount = capturedSession.stoppedEvents.length;
+                if (currentStoppedCount > initialStoppedCount) {
+                    const detectedAt = Date.now();
+                    const latestStoppedEvent = capturedSession.stoppedEvents[currentStoppedCount - 1];
+                    return {
+                        via: 'poll',
+                        detectedAt,
+                        result: await queryPausedLocation(session, latestStoppedEvent.threadId || threadId)
+                    };
+                }
 
-        // Not stopped yet, wait and poll again
-        await new Promise(resolve => setTimeout(resolve, pollInterval));
+                await delay(POLL_INTERVAL_MS, signal);
+            }
+            return undefined;
+        });
     }
 
-    // Timeout - return IDebugError instead of throwing (ST001b)
-    const timeoutError = createDebugError(
-        DebugErrorCode.E_NOT_STOPPED,
-        `Timeout waiting for stopped event after ${timeoutMs}ms. The debugger did not pause within the expected time.`
-    );
-
-    return {
-        event: 'error',
-        sessionId: session.id,
-        code: timeoutError.code,
-        message: timeoutError.message,
-        hint: timeoutError.hint,
-        detail: timeoutError.detail
-    };
+    const detection = await raceDetectors(detectors, timeoutMs);
+    if (!detection) {
+        return timeoutOutcome(
+            session,
+            `Timeout waiting for stopped event after ${timeoutMs}ms. The debugger did not pause within the expected time.`
+        );
+    }
+    return withStopDetection(detection, startTime);
 }
 
 /**
- * Poll until debugger is paused, terminated, or error occurs
+ * Wait until debugger is paused, terminated, or error occurs
  *
  * This function handles ALL possible debug outcomes:
  * - stopped: Debugger paused at breakpoint or after step
  * - terminated: Debug session ended (program exit)
  * - error: Timeout or other error
  *
+ * Stops are taken from DebugEventHub. Pass `options.after` (a hub cursor
+ * taken before the session was started) so a breakpoint hit before the wait
+ * began still counts. Without it, an already-paused session is detected by
+ * one immediate probe. Either way, polling runs as a fallback after EVENT_GRACE_MS.
+ *
  * @param {any} session - VS Code debug session (or null if useActiveSession=true)
  * @param {number} timeoutMs - Maximum time to wait in milliseconds
  * @param {any} vscode - VS Code API (for checking active session)
- * @param {boolean} useActiveSession - If true, use vscode.debug.activeDebugSession dynamically each poll (for debug-single)
+ * @param {boolean} useActiveSession - If true, accept stops from any session in the
+ *   session's tree and query vscode.debug.activeDebugSession when polling (for debug-single)
+ * @param {{after?: number}} options - Hub cursor to accept stops from
  * @returns {Promise<object>} Debug outcome {event: 'stopped'|'terminated'|'error', ...}
  */
-async function waitUntilPausedAndGetLocation(session, timeoutMs = 5000, vscode = null, useActiveSession = false) {
+async function waitUntilPausedAndGetLocation(session, timeoutMs = 5000, vscode = null, useActiveSession = false, options = {}) {
     const startTime = Date.now();
-    const pollInterval = 50; // ms between polling attempts
-
-    while (Date.now() - startTime < timeoutMs) {
-        try {
-            // Get the session to query (either the passed session or the current active session)
-            const currentSession = useActiveSession ? vscode?.debug.activeDebugSession : session;
-
-            if (!currentSession) {
-                // No active session - means terminated
-                return {
-                    event: 'terminated',
-                    sessionId: session?.id || 'unknown'
-                };
+    const hub = DebugEventHub.instance;
+
+    const detectors = [];
+    if (hub.isInstalled() && session) {
+        detectors.push(hubDetector(hub, session, {
+            after: options.after,
+            scope: useActiveSession ? 'tree' : 'session',
+            timeoutMs
+        }));
+    }
+    detectors.push(async signal => {
+        // With the hub installed and a cursor, the event covers the whole wait:
+        // poll only after the grace period. Without a cursor, one immediate
+        // probe catches a session that was already paused.
+        let first = true;
+        if (hub.isInstalled() && options.after !== undefined) {
+            await delay(EVENT_GRACE_MS, signal);
+            first = false;
+        }
+        while (!signal.aborted) {
+            const result = await probePausedLocation(session, vscode, useActiveSession);
+            if (result) {
+                return { via: 'poll', detectedAt: Date.now(), result };
             }
+            await delay(first && hub.isInstalled() ? EVENT_GRACE_MS : POLL_INTERVAL_MS, signal);
+            first = false;
+        }
+        return undefined;
+    });
+
+    const detection = await raceDetectors(detectors, timeoutMs);
+    if (!detection) {
+        return timeoutOutcome(
+            session,
+            `Timeout waiting for debug outcome after ${timeoutMs}ms. The debugger did not pause within the expected time.`
+        );
+    }
+    return withStopDetection(detection, startTime);
+}
 
-            // Try to get threads - only succeeds when paused
-            const threadsResponse = await currentSession.customRequest('threads');
+/**
+ * One polling attempt: the paused location, a terminated outcome, or
+ * undefined if the session is still running
+ */
+async function probePausedLocation(session, vscode, useActiveSession) {
+    try {
+        // Get the session to query (either the passed session or the current active session)
+        const currentSession = useActiveSession ? vscode?.debug.activeDebugSession : session;
 
-            if (!threadsResponse.threads || threadsResponse.threads.length === 0) {
-                throw new Error('No threads available');
-            }
+        if (!currentSession) {
+            // No active session - means terminated
+            return {
+                event: 'terminated',
+                sessionId: session?.id || 'unknown'
+            };
+        }
 
-            let threadId;
-            let topFrame;
-
-            // C#-SPECIFIC: Use shared helper to find thread with actual source code
-            if (currentSession.type === 'coreclr') {
-                const result = await findCoreclrThreadWithSource(currentSession);
-                if (result) {
-                    threadId = result.threadId;
-                    topFrame = result.frame;
-                } else {
-                    // Fallback to first thread if no valid source found
-                    threadId = threadsResponse.threads[0].id;
-                    const stackResponse = await currentSession.customRequest('stackTrace', {
-                        threadId,
-                        startFrame: 0,
-                        levels: 1
-                    });
-                    topFrame = stackResponse.stackFrames?.[0];
+        return await queryPausedLocation(currentSession);
+
+    } catch (error) {
+        // Check if session terminated using vscode API (most reliable)
+        if (vscode) {
+            const activeSession = vscode.debug.activeDebugSession;
+
+            if (useActiveSession) {
+                // Mode for debug-single: Just check if ANY active session exists
+                if (!activeSession) {
+                    // TERMINATED - no active session at all
+                    return {
+                        event: 'terminated',
+                        sessionId: session?.id || 'unknown'
+                    };
                 }
             } else {
-                // Other languages: Find which thread is actually paused (has stack frames with source code)
-                // CRITICAL for multi-threaded/isolate languages (Dart, Java, C#)
-                let foundPausedThread = false;
-
-                for (const thread of threadsResponse.threads) {
-                    try {
-                        const stackResponse = await currentSession.customRequest('stackTrace', {
-                            threadId: thread.id,
-                            startFrame: 0,
-                            levels: 1  // Only need top frame
-                        });
-
-                        // Check if this thread has frames with actual source code
-                        if (stackResponse.stackFrames?.length > 0 &&
-                            stackResponse.stackFrames[0].source?.path) {
-                            threadId = thread.id;
-                            topFrame = stackResponse.stackFrames[0];
-                            foundPausedThread = true;
-                            break;
-                        }
-                    } catch (error) {
-                        // Thread not paused or error - continue to next thread
-                        continue;
-                    }
-                }
-
-                if (!foundPausedThread) {
-                    throw new Error('No thread found with source code paused');
+                // Mode for step commands: Validate specific session ID
+                if (!activeSession || activeSession.id !== session.id) {
+                    // TERMINATED - session no longer active
+                    return {
+                        event: 'terminated',
+                        sessionId: session.id
+                    };
                 }
             }
+        }
 
-            if (!topFrame) {
-                throw new Error('No stack frames available');
-            }
+        // Also check error message patterns for termination
+        if (error.message?.includes('Session') ||
+            error.message?.includes('terminated') ||
+            error.message?.includes('No debugger available') ||
+            error.message?.includes('not stopped')) {
+            // TERMINATED - detected from error message
+            return {
+                event: 'terminated',
+                sessionId: session?.id || 'unknown'
+            };
+        }
 
-            // STOPPED - Call centralized formatter
-            return formatPausedLocation(currentSession, topFrame, threadId);
+        // Not paused yet
+        return undefined;
+    }
+}
 
-        } catch (error) {
-            // Check if session terminated using vscode API (most reliable)
-            if (vscode) {
-                const activeSession = vscode.debug.activeDebugSession;
-
-                if (useActiveSession) {
-                    // Mode for debug-single: Just check if ANY active session exists
-                    if (!activeSession) {
-                        // TERMINATED - no active session at all
-                        return {
-                            event: 'terminated',
-                            sessionId: session?.id || 'unknown'
-                        };
-                    }
-                } else {
-                    // Mode for step commands: Validate specific session ID
-                    if (!activeSession || activeSession.id !== session.id) {
-                        // TERMINATED - session no longer active
-                        return {
-                            event: 'terminated',
-                            sessionId: session.id
-                        };
-                    }
-                }
+/**
+ * Location of a paused session; throws if it is not paused
+ *
+ * When the stopped event named a thread, its top frame is used directly.
+ * Otherwise (or if that thread has no frames) the threads are scanned.
+ *
+ * @param {any} session - VS Code debug session
+ * @param {number} [stoppedThreadId] - threadId from the stopped event
+ * @returns {Promise<object>} Formatted paused location
+ */
+async function queryPausedLocation(session, stoppedThreadId) {
+    // C#-SPECIFIC: the stopped thread is often [External Code]; always use the helper
+    if (stoppedThreadId !== undefined && stoppedThreadId !== null && session.type !== 'coreclr') {
+        try {
+            const stackResponse = await session.customRequest('stackTrace', {
+                threadId: stoppedThreadId,
+                startFrame: 0,
+                levels: 1
+            });
+            const topFrame = stackResponse.stackFrames?.[0];
+            if (topFrame) {
+                return formatPausedLocation(session, topFrame, stoppedThreadId);
             }
+        } catch (error) {
+            // Fall through to the thread scan
+        }
+    }
+
+    // Try to get threads - only succeeds when paused
+    const threadsResponse = await session.customRequest('threads');
 
-            // Also check error message patterns for termination
-            if (error.message?.includes('Session') ||
-                error.message?.includes('terminated') ||
-                error.message?.includes('No debugger available') ||
-                error.message?.includes('not stopped')) {
-                // TERMINATED - detected from error message
-                return {
-                    event: 'terminated',
-                    sessionId: session.id
-                };
+    if (!threadsResponse.threads || threadsResponse.threads.length === 0) {
+        throw new Error('No threads available');
+    }
+
+    let threadId;
+    let topFrame;
+
+    // C#-SPECIFIC: Use shared helper to find thread with actual source code
+    if (session.type === 'coreclr') {
+        const result = await findCoreclrThreadWithSource(session);
+        if (result) {
+            threadId = result.threadId;
+            topFrame = result.frame;
+        } else {
+            // Fallback to first thread if no valid source found
+            threadId = threadsResponse.threads[0].id;
+            const stackResponse = await session.customRequest('stackTrace', {
+                threadId,
+                startFrame: 0,
+                levels: 1
+            });
+            topFrame = stackResponse.stackFrames?.[0];
+        }
+    } else {
+        // Other languages: Find which thread is actually paused (has stack frames with source code)
+        // CRITICAL for multi-threaded/isolate languages (Dart, Java, C#)
+        let foundPausedThread = false;
+
+        for (const thread of threadsResponse.threads) {
+            try {
+                const stackResponse = await session.customRequest('stackTrace', {
+                    threadId: thread.id,
+                    startFrame: 0,
+                    levels: 1  // Only need top frame
+                });
+
+                // Check if this thread has frames with actual source code
+                if (stackResponse.stackFrames?.length > 0 &&
+                    stackResponse.stackFrames[0].source?.path) {
+                    threadId = thread.id;
+                    topFrame = stackResponse.stackFrames[0];
+                    foundPausedThread = true;
+                    break;
+                }
+            } catch (error) {
+                // Thread not paused or error - continue to next thread
+                continue;
             }
+        }
 
-            // Not paused yet, continue polling
-            await new Promise(resolve => setTimeout(resolve, pollInterval));
+        if (!foundPausedThread) {
+            throw new Error('No thread found with source code paused');
         }
     }
 
-    // TIMEOUT - return IDebugError with proper code (ST001b)
-    const timeoutError = createDebugError(
-        DebugErrorCode.E_NOT_STOPPED,
-        `Timeout waiting for debug outcome after ${timeoutMs}ms. The debugger did not pause within the expected time.`
-    );
+    if (!topFrame) {
+        throw new Error('No stack frames available');
+    }
 
-    return {
-        event: 'error',
-        sessionId: session.id,
-        code: timeoutError.code,
-        message: timeoutError.message,
-        hint: timeoutError.hint,
-        detail: timeoutError.detail
-    };
+    // STOPPED - Call centralized formatter
+    return formatPausedLocation(session, topFrame, threadId);
 }
 
 /**
@@ -288,5 +474,6 @@ function formatPausedLocation(session, topFrame, threadId) {
 module.exports = {
     waitUntilPausedAndGetLocation,
     waitForStoppedEventAndGetLocation,
+    queryPausedLocation,
     formatPausedLocation
 };
@@ -1,4 +1,5 @@
 import * as vscode from 'vscode';
+import { OutputLog } from './output-log';
 
 /**
  * Captured output event from DAP
@@ -23,6 +24,10 @@ export interface ExceptionEvent {
   threadId?: number;
   message?: string;
   description?: string;
+  /** Output sequence number (OutputLog.nextSeq) when the exception was reported */
+  outputSeq: number;
+  /** Index of the matching 'exception' stopped event in stoppedEvents */
+  stoppedIndex?: number;
 }
 
 /**
@@ -35,6 +40,8 @@ export interface StoppedEvent {
   text?: string;
   hitBreakpointIds?: number[];
   allThreadsStopped?: boolean;
+  /** Output sequence number (OutputLog.nextSeq) when the stop was reported */
+  outputSeq: number;
 }
 
 /**
@@ -47,7 +54,8 @@ export interface CapturedSession {
   parentSessionId?: string;
   startTime: number;
   endTime?: number;
-  outputs: OutputEvent[];
+  /** Bounded output log; `outputs.dropped` counts events evicted to stay within budget */
+  outputs: OutputLog;
   exceptions: ExceptionEvent[];
   stoppedEvents: StoppedEvent[];
   lastStoppedThreadId?: number;  // Cache most recent stopped thread ID for getActiveThreadId()
@@ -55,6 +63,36 @@ export interface CapturedSession {
   terminated: boolean;
 }
 
+/**
+ * Memory limits for captured output
+ */
+export interface CaptureLimits {
+  /** Output bytes kept per session; older output is evicted first */
+  maxSessionBytes: number;
+  /** Output bytes kept across all sessions */
+  maxTotalBytes: number;
+  /** Terminated sessions kept (least recently used are evicted) */
+  maxTerminatedSessions: number;
+}
+
+export const DEFAULT_CAPTURE_LIMITS: Readonly<CaptureLimits> = {
+  maxSessionBytes: 16 * 1024 * 1024,
+  maxTotalBytes: 64 * 1024 * 1024,
+  maxTerminatedSessions: 20
+};
+
+/**
+ * Capture memory usage and eviction counters
+ */
+export interface CaptureStats {
+  sessions: number;
+  retainedBytes: number;
+  droppedOutputs: number;
+  droppedBytes: number;
+  evictedSessions: number;
+  limits: CaptureLimits;
+}
+
 /**
  * Singleton service for capturing all debug session DAP events.
  *
@@ -62,6 +100,11 @@ export interface CapturedSession {
  * output events, exceptions, stopped events, and exit codes from ALL debug
  * sessions. Data is stored in-memory and accessible via simple query methods.
  *
+ * Output is bounded: each session keeps at most `maxSessionBytes` of output
+ * (oldest evicted first), all sessions together at most `maxTotalBytes`, and
+ * only the `maxTerminatedSessions` most recently used terminated sessions are
+ * kept. Limits come from the `vscBridge.capture.*` settings.
+ *
  * Usage:
  *   - Install at extension activation: DebugSessionCaptureService.instance.install(context)
  *   - Query latest session: DebugSessionCaptureService.instance.getSession()
@@ -77,11 +120,19 @@ export class DebugSessionCaptureService {
     return (this._instance ??= new DebugSessionCaptureService());
   }
 
+  /** Map order is least to most recently used */
   private sessions = new Map<string, CapturedSession>();
   private lastSessionId: string | null = null;
   private disposables: vscode.Disposable[] = [];
   private installed = false;
 
+  private limits: CaptureLimits = { ...DEFAULT_CAPTURE_LIMITS };
+  private retainedBytes = 0;
+  private evictedSessions = 0;
+  /** Drops from sessions that have since been evicted */
+  private evictedDroppedOutputs = 0;
+  private evictedDroppedBytes = 0;
+
   private constructor() {
     // Private constructor for singleton
   }
@@ -96,6 +147,15 @@ export class DebugSessionCaptureService {
     if (this.installed) return;
     this.installed = true;
 
+    this.configure(readCaptureLimits());
+    const configListener = vscode.workspace.onDidChangeConfiguration(e => {
+      if (e.affectsConfiguration('vscBridge.capture')) {
+        this.configure(readCaptureLimits());
+      }
+    });
+    this.disposables.push(configListener);
+    context.subscriptions.push(configListener);
+
     // Register tracker factory for ALL debug types
     const trackerFactory: vscode.DebugAdapterTrackerFactory = {
       createDebugAdapterTracker: (session: vscode.DebugSession) => {
@@ -109,7 +169,7 @@ export class DebugSessionCaptureService {
           name: session.name,
           parentSessionId: session.parentSession?.id,
           startTime: Date.now(),
-          outputs: [],
+          outputs: new OutputLog(),
           exceptions: [],
           stoppedEvents: [],
           terminated: false
@@ -131,7 +191,7 @@ export class DebugSessionCaptureService {
 
             switch (message.event) {
               case 'output':
-                sessionData.outputs.push({
+                this.appendOutput(sessionData, {
                   ts,
                   category: message.body?.category || 'console',
                   text: message.body?.output || '',
@@ -139,7 +199,6 @@ export class DebugSessionCaptureService {
                   line: message.body?.line,
                   column: message.body?.column
                 });
-                console.log(`[DebugSessionCapture] 📝 Output [${message.body?.category || 'console'}]: ${(message.body?.output || '').substring(0, 60)}${(message.body?.output || '').length > 60 ? '...' : ''}`);
                 break;
 
               case 'stopped':
@@ -149,7 +208,8 @@ export class DebugSessionCaptureService {
                   threadId: message.body?.threadId,
                   text: message.body?.text,
                   hitBreakpointIds: message.body?.hitBreakpointIds,
-                  allThreadsStopped: message.body?.allThreadsStopped
+                  allThreadsStopped: message.body?.allThreadsStopped,
+                  outputSeq: sessionData.outputs.nextSeq
                 };
                 sessionData.stoppedEvents.push(stoppedEvent);
 
@@ -166,7 +226,9 @@ export class DebugSessionCaptureService {
                     ts,
                     threadId: message.body?.threadId,
                     message: message.body?.text,
-                    description: message.body?.description
+                    description: message.body?.description,
+                    outputSeq: stoppedEvent.outputSeq,
+                    stoppedIndex: sessionData.stoppedEvents.length - 1
                   });
                   console.log(`[DebugSessionCapture] ❌ Exception captured: ${message.body?.text || 'unknown'}`);
                 }
@@ -182,7 +244,8 @@ export class DebugSessionCaptureService {
                 sessionData.terminated = true;
                 sessionData.endTime = Date.now();
                 console.log(`[DebugSessionCapture] ⏹️  Terminated: ${session.id}`);
-                console.log(`[DebugSessionCapture]    └─ Captured: ${sessionData.outputs.length} outputs, ${sessionData.exceptions.length} exceptions, ${sessionData.stoppedEvents.length} stops`);
+                console.log(`[DebugSessionCapture]    └─ Captured: ${sessionData.outputs.length} outputs (${sessionData.outputs.dropped} dropped), ${sessionData.exceptions.length} exceptions, ${sessionData.stoppedEvents.length} stops`);
+                this.evictTerminatedSessions();
                 break;
             }
           },
@@ -199,7 +262,7 @@ export class DebugSessionCaptureService {
 
           onError: (error: Error) => {
             // Store error as special output event
-            sessionData.outputs.push({
+            this.appendOutput(sessionData, {
               ts: Date.now(),
               category: 'stderr',
               text: `[Adapter Error] ${error.message || String(error)}`
@@ -222,16 +285,18 @@ export class DebugSessionCaptureService {
    * @returns The captured session data, or undefined if not found
    */
   getSession(sessionId?: string): CapturedSession | undefined {
-    if (sessionId) {
-      return this.sessions.get(sessionId);
+    const id = sessionId || this.lastSessionId;
+    if (!id) {
+      return undefined;
     }
 
-    // Return latest session
-    if (this.lastSessionId) {
-      return this.sessions.get(this.lastSessionId);
+    const session = this.sessions.get(id);
+    if (session) {
+      // Mark as most recently used
+      this.sessions.delete(id);
+      this.sessions.set(id, session);
     }
-
-    return undefined;
+    return session;
   }
 
   /**
@@ -252,12 +317,110 @@ export class DebugSessionCaptureService {
     return this.lastSessionId;
   }
 
+  /**
+   * Override capture limits (unspecified limits keep their current value)
+   */
+  configure(limits: Partial<CaptureLimits>): void {
+    this.limits = { ...this.limits, ...limits };
+    for (const session of this.sessions.values()) {
+      this.trimSession(session);
+    }
+    this.trimTotal(undefined);
+    this.evictTerminatedSessions();
+  }
+
+  /**
+   * Memory usage and eviction counters
+   */
+  getStats(): CaptureStats {
+    let droppedOutputs = this.evictedDroppedOutputs;
+    let droppedBytes = this.evictedDroppedBytes;
+    for (const session of this.sessions.values()) {
+      droppedOutputs += session.outputs.dropped;
+      droppedBytes += session.outputs.droppedBytes;
+    }
+    return {
+      sessions: this.sessions.size,
+      retainedBytes: this.retainedBytes,
+      droppedOutputs,
+      droppedBytes,
+      evictedSessions: this.evictedSessions,
+      limits: { ...this.limits }
+    };
+  }
+
   /**
    * Clear all captured session data
    */
   clear(): void {
     this.sessions.clear();
     this.lastSessionId = null;
+    this.retainedBytes = 0;
+  }
+
+  private appendOutput(session: CapturedSession, event: OutputEvent): void {
+    // Sessions evicted while their adapter is still talking are not resurrected
+    if (this.sessions.get(session.sessionId) !== session) return;
+
+    this.retainedBytes += session.outputs.append(event);
+    this.trimSession(session);
+    this.trimTotal(session);
+  }
+
+  /**
+   * Evict a session's oldest output until it fits its budget
+   */
+  private trimSession(session: CapturedSession): void {
+    while (session.outputs.bytes > this.limits.maxSessionBytes && session.outputs.length > 0) {
+      this.retainedBytes -= session.outputs.evictOldest();
+    }
+  }
+
+  /**
+   * Evict until all sessions fit the global budget: terminated sessions
+   * first (least recently used), then the oldest output of the largest session
+   */
+  private trimTotal(active: CapturedSession | undefined): void {
+    while (this.retainedBytes > this.limits.maxTotalBytes) {
+      const terminated = Array.from(this.sessions.values())
+        .find(session => session.terminated && session !== active && session.outputs.length > 0);
+      if (terminated) {
+        this.evictSession(terminated);
+        continue;
+      }
+
+      let largest: CapturedSession | undefined;
+      for (const session of this.sessions.values()) {
+        if (!largest || session.outputs.bytes > largest.outputs.bytes) {
+          largest = session;
+        }
+      }
+      if (!largest || largest.outputs.length === 0) break;
+      this.retainedBytes -= largest.outputs.evictOldest();
+    }
+  }
+
+  /**
+   * Keep only the most recently used terminated sessions
+   */
+  private evictTerminatedSessions(): void {
+    const terminated = Array.from(this.sessions.values()).filter(session => session.terminated);
+    const excess = terminated.length - this.limits.maxTerminatedSessions;
+    for (let i = 0; i < excess; i++) {
+      this.evictSession(terminated[i]);
+    }
+  }
+
+  private evictSession(session: CapturedSession): void {
+    this.sessions.delete(session.sessionId);
+    this.retainedBytes -= session.outputs.bytes;
+    this.evictedSessions++;
+    this.evictedDroppedOutputs += session.outputs.dropped + session.outputs.length;
+    this.evictedDroppedBytes += session.outputs.droppedBytes + session.outputs.bytes;
+    if (this.lastSessionId === session.sessionId) {
+      this.lastSessionId = null;
+    }
+    console.log(`[DebugSessionCapture] 🗑️  Evicted session ${session.sessionId} (${session.outputs.length} outputs)`);
   }
 
   /**
@@ -268,6 +431,20 @@ export class DebugSessionCaptureService {
     this.disposables = [];
     this.sessions.clear();
     this.lastSessionId = null;
+    this.retainedBytes = 0;
     this.installed = false;
   }
 }
+
+/**
+ * Read capture limits from the vscBridge.capture.* settings (values in MB)
+ */
+function readCaptureLimits(): CaptureLimits {
+  const config = vscode.workspace.getConfiguration('vscBridge.capture');
+  const mb = 1024 * 1024;
+  return {
+    maxSessionBytes: config.get<number>('maxSessionMB', DEFAULT_CAPTURE_LIMITS.maxSessionBytes / mb) * mb,
+    maxTotalBytes: config.get<number>('maxTotalMB', DEFAULT_CAPTURE_LIMITS.maxTotalBytes / mb) * mb,
+    maxTerminatedSessions: config.get<number>('maxTerminatedSessions', DEFAULT_CAPTURE_LIMITS.maxTerminatedSessions)
+  };
+}
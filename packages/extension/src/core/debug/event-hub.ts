@@ -1,20 +1,22 @@
 import * as vscode from 'vscode';
 
 /**
- * @deprecated This event-based debug tracking approach has been replaced by the polling-based
- * approach in debug-polling-helpers.ts. All debug operations now use waitUntilPausedAndGetLocation()
- * for consistent behavior across step commands, test debugging, and launch config debugging.
+ * Debug Event Hub - raw DAP events for every session, with outcome waiters
  *
- * This file is kept for backwards compatibility but will be removed in a future cleanup phase.
+ * Installed at activation. Debug Adapter Trackers deliver `stopped`,
+ * `terminated` and `exited` events the moment the adapter sends them, so the
+ * stop-detection helpers in debug-polling-helpers.js wait on waitForStop()
+ * instead of polling. Each event gets a global sequence number: a caller
+ * takes cursor() before starting, stepping or continuing, and waitForStop()
+ * then also accepts a stop that arrived before the wait began (no race
+ * between sending the request and registering the waiter).
  *
- * Migration path: Replace DebugEventHub.waitForOutcome() with waitUntilPausedAndGetLocation()
- * See: debug-polling-helpers.ts for the standard polling implementation
+ * Location formatting stays in formatPausedLocation() (debug-polling-helpers),
+ * the single source of truth for the outcome shape.
  *
- * Standardization benefits:
- * - Single source of truth for debug outcome format (formatPausedLocation function)
- * - Future enhancements (like adding local variables) propagate to ALL debug operations automatically
- * - No race conditions with event timing
- * - Consistent behavior across all debug commands
+ * onDidReceiveEvent() exposes every tracked event (including the standard
+ * `continued` and `invalidated` events, which never reach
+ * onDidReceiveDebugSessionCustomEvent) to per-pause caches.
  */
 
 /**
@@ -53,24 +55,70 @@ export type DebugOutcome =
       output?: string;
     };
 
+/**
+ * Stop, termination or exit recorded by the hub
+ */
+export type StopEvent = {
+  /** Session that sent the event */
+  sessionId: string;
+  /** Global sequence number (see cursor()) */
+  seq: number;
+  /** Date.now() when the hub received the event */
+  at: number;
+  outcome: Extract<DebugOutcome, { kind: 'stopped' | 'terminated' | 'exited' }>;
+};
+
+/**
+ * Options for waitForStop()
+ */
+export type StopWaitOptions = {
+  /** Session to watch (undefined = any session) */
+  session?: vscode.DebugSession | string;
+  /**
+   * 'session': stops from the session or its children, termination of the session itself
+   * 'tree': stops from any session sharing its root, termination of the root
+   */
+  scope?: 'session' | 'tree';
+  /** Accept events recorded after this cursor() value (default: only new events) */
+  after?: number;
+  timeoutMs: number;
+  /** Abort the wait (resolves undefined) */
+  signal?: AbortSignal;
+};
+
+type StopWaiter = {
+  matches: (event: StopEvent) => boolean;
+  resolve: (event: StopEvent | undefined) => void;
+};
+
+/** Recorded stops kept for waiters that start after the event */
+const MAX_RECORDED_STOPS = 256;
+
 /**
  * Singleton hub for managing debug events across all sessions.
  * Uses Debug Adapter Trackers to capture raw DAP events, avoiding race conditions.
  */
 export class DebugEventHub {
-  private static _instance: DebugEventHub | null = null;
-
   /**
    * Get the singleton instance
+   *
+   * Kept on `global`: each built-in script is a separate bundle with its own
+   * copy of this class, and must reach the hub installed by the extension.
    */
   static get instance(): DebugEventHub {
-    return (this._instance ??= new DebugEventHub());
+    return ((global as any).debugEventHub ??= new DebugEventHub());
   }
 
   private disposables: vscode.Disposable[] = [];
   private buffers = new Map<string, DapEvent[]>(); // sessionId -> buffered events
   private waiters = new Map<string, ((outcome: DebugOutcome) => void)[]>(); // sessionId -> callbacks
   private lastStoppedEvents = new Map<string, DapEvent>(); // sessionId -> last stopped event
+  private sessions = new Map<string, vscode.DebugSession>(); // sessionId -> session
+  private parents = new Map<string, string>(); // sessionId -> parent sessionId
+  private sequence = 0;
+  private stops: StopEvent[] = [];
+  private stopWaiters: StopWaiter[] = [];
+  private listeners = new Set<(sessionId: string, event: DapEvent) => void>();
   private installed = false;
 
   private constructor() {
@@ -96,6 +144,7 @@ export class DebugEventHub {
         //   name: session.name,
         //   parentId: session.parentSession?.id
         // });
+        this.trackSession(session);
         this.ensureBuffer(session.id);
       }),
 
@@ -111,6 +160,8 @@ export class DebugEventHub {
           this.buffers.delete(session.id);
           this.waiters.delete(session.id);
           this.lastStoppedEvents.delete(session.id);
+          this.sessions.delete(session.id);
+          this.parents.delete(session.id);
         }, 5000);
       }),
 
@@ -136,6 +187,7 @@ export class DebugEventHub {
             //   name: session.name,
             //   parentId: session.parentSession?.id
             // });
+            this.trackSession(session);
 
             const tracker: vscode.DebugAdapterTracker = {
               onWillStartSession: () => {
@@ -200,9 +252,146 @@ export class DebugEventHub {
     this.buffers.clear();
     this.waiters.clear();
     this.lastStoppedEvents.clear();
+    this.sessions.clear();
+    this.parents.clear();
+    this.stops = [];
+    for (const waiter of this.stopWaiters.splice(0)) {
+      waiter.resolve(undefined);
+    }
     this.installed = false;
   }
 
+  /**
+   * Whether trackers are registered (events are flowing)
+   */
+  isInstalled(): boolean {
+    return this.installed;
+  }
+
+  /**
+   * Listen to every DAP event from tracked sessions
+   *
+   * Listeners survive dispose()/install(); dispose the returned handle to stop.
+   */
+  onDidReceiveEvent(listener: (sessionId: string, event: DapEvent) => void): vscode.Disposable {
+    this.listeners.add(listener);
+    return { dispose: () => { this.listeners.delete(listener); } };
+  }
+
+  /**
+   * Current event sequence number; pass as `after` to waitForStop() to
+   * accept stops from this point on
+   */
+  cursor(): number {
+    return this.sequence;
+  }
+
+  /**
+   * Debug session by id, for sessions seen by the hub
+   */
+  getSession(sessionId: string): vscode.DebugSession | undefined {
+    return this.sessions.get(sessionId);
+  }
+
+  private trackSession(session: vscode.DebugSession) {
+    this.sessions.set(session.id, session);
+    if (session.parentSession) {
+      this.parents.set(session.id, session.parentSession.id);
+    }
+  }
+
+  private rootOf(sessionId: string): string {
+    let current = sessionId;
+    for (let parent = this.parents.get(current); parent && parent !== current; parent = this.parents.get(current)) {
+      current = parent;
+    }
+    return current;
+  }
+
+  private isWithin(sessionId: string, ancestorId: string): boolean {
+    for (let current: string | undefined = sessionId; current; current = this.parents.get(current)) {
+      if (current === ancestorId) {
+        return true;
+      }
+    }
+    return false;
+  }
+
+  /**
+   * Wait for the next stop, termination or exit matching the options
+   *
+   * Resolves undefined on timeout or abort; never rejects.
+   */
+  waitForStop(options: StopWaitOptions): Promise<StopEvent | undefined> {
+    const target = typeof options.session === 'string' ? options.session : options.session?.id;
+    const after = options.after ?? this.sequence;
+
+    const matches = (event: StopEvent): boolean => {
+      if (event.seq <= after) {
+        return false;
+      }
+      if (!target) {
+        return true;
+      }
+      if (options.scope === 'tree') {
+        const root = this.rootOf(target);
+        return event.outcome.kind === 'stopped'
+          ? this.rootOf(event.sessionId) === root
+          : event.sessionId === root;
+      }
+      return event.outcome.kind === 'stopped'
+        ? this.isWithin(event.sessionId, target)
+        : event.sessionId === target;
+    };
+
+    const recorded = this.stops.find(matches);
+    if (recorded) {
+      return Promise.resolve(recorded);
+    }
+    if (options.signal?.aborted) {
+      return Promise.resolve(undefined);
+    }
+
+    return new Promise<StopEvent | undefined>(resolve => {
+      const waiter: StopWaiter = {
+        matches,
+        resolve: event => {
+          clearTimeout(timeoutHandle);
+          options.signal?.removeEventListener('abort', onAbort);
+          const index = this.stopWaiters.indexOf(waiter);
+          if (index >= 0) {
+            this.stopWaiters.splice(index, 1);
+          }
+          resolve(event);
+        }
+      };
+      const onAbort = () => waiter.resolve(undefined);
+      const timeoutHandle = setTimeout(() => waiter.resolve(undefined), options.timeoutMs);
+      options.signal?.addEventListener('abort', onAbort);
+      this.stopWaiters.push(waiter);
+    });
+  }
+
+  /**
+   * Record a stop/termination/exit and wake matching waiters
+   */
+  private recordStop(sessionId: string, event: DapEvent) {
+    const outcome = this.toOutcome(event);
+    if (!outcome || outcome.kind === 'error') {
+      return;
+    }
+    const stop: StopEvent = { sessionId, seq: this.sequence, at: Date.now(), outcome };
+    this.stops.push(stop);
+    if (this.stops.length > MAX_RECORDED_STOPS) {
+      this.stops.shift();
+    }
+    for (const waiter of this.stopWaiters.slice()) {
+      if (waiter.matches(stop)) {
+        waiter.resolve(stop);
+      }
+    }
+  }
+
   /**
    * Ensure a buffer exists for the session
    */
@@ -219,6 +408,11 @@ export class DebugEventHub {
     this.ensureBuffer(sessionId);
     const buffer = this.buffers.get(sessionId)!;
     buffer.push(event);
+    this.sequence++;
+
+    if (event.event === 'stopped' || event.event === 'terminated' || event.event === 'exited') {
+      this.recordStop(sessionId, event);
+    }
 
     // Keep buffer size reasonable (last 100 events)
     if (buffer.length > 100) {
@@ -230,6 +424,14 @@ export class DebugEventHub {
       this.lastStoppedEvents.set(sessionId, event);
     }
 
+    for (const listener of this.listeners) {
+      try {
+        listener(sessionId, event);
+      } catch (err) {
+        console.warn('[DebugEventHub] Event listener failed:', err);
+      }
+    }
+
     // Check if this is an outcome event
     if (this.isOutcomeEvent(event)) {
       const outcome = this.toOutcome(event);
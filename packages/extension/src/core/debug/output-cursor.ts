@@ -0,0 +1,39 @@
+/**
+ * Opaque cursors for paging through captured DAP output
+ *
+ * A cursor names a session and an output sequence number (see
+ * OutputLog.firstSeq/nextSeq). Sequence numbers survive eviction, so a cursor
+ * stays valid while older output is dropped; a query resumed from a cursor
+ * whose position has been evicted simply starts at the oldest retained event.
+ *
+ * The position is where the next page starts: for oldest-first queries the
+ * first sequence number to visit, for newest-first queries the (exclusive)
+ * upper bound.
+ */
+
+export interface OutputCursor {
+  sessionId: string;
+  seq: number;
+}
+
+/**
+ * Encode a cursor as a URL-safe token
+ */
+export function encodeOutputCursor(cursor: OutputCursor): string {
+  return Buffer.from(JSON.stringify({ s: cursor.sessionId, q: cursor.seq }), 'utf8').toString('base64url');
+}
+
+/**
+ * Decode a token from encodeOutputCursor(); undefined if it is not one
+ */
+export function decodeOutputCursor(token: string): OutputCursor | undefined {
+  try {
+    const raw = JSON.parse(Buffer.from(token, 'base64url').toString('utf8'));
+    if (typeof raw?.s !== 'string' || !Number.isInteger(raw?.q) || raw.q < 0) {
+      return undefined;
+    }
+    return { sessionId: raw.s, seq: raw.q };
+  } catch {
+    return undefined;
+  }
+}
@@ -0,0 +1,722 @@
+/**
+ * Compact, bounded storage for DAP output events
+ *
+ * Output events are stored column-wise in fixed-size chunks (typed arrays for
+ * timestamps, positions and interned category/source ids, one string for all
+ * the text in a chunk) rather than as one object per line. Eviction drops the
+ * oldest chunk, so a session behaves like a ring buffer under its byte budget.
+ *
+ * Events are addressed by sequence number: the first event ever appended is 0
+ * and numbers are never reused, so callers can tell how many events were
+ * evicted ahead of what they see.
+ *
+ * The log also maintains the aggregates the dap.* queries need at append time
+ * (per category, source, hour and second, plus the most frequent messages)
+ * and a per-chunk index (time range, category mask and a trigram filter over
+ * the lowercased text) so scans can skip chunks that cannot match.
+ */
+
+import type { OutputEvent } from './debug-session-capture';
+
+/**
+ * Events per chunk
+ */
+const CHUNK_EVENTS = 256;
+
+/**
+ * Text characters per chunk before it is sealed early
+ */
+const CHUNK_CHARS = 32 * 1024;
+
+/**
+ * Trigram filter size bounds (bits, powers of two)
+ */
+const MIN_GRAM_BITS = 1 << 9;
+const MAX_GRAM_BITS = 1 << 16;
+
+/**
+ * Messages tracked for topMessages() (Space-Saving counters)
+ */
+const TOP_MESSAGE_SLOTS = 64;
+
+/**
+ * Message prefix used to group repeated output
+ */
+export const MESSAGE_KEY_CHARS = 100;
+
+/**
+ * Estimated bytes per event besides its text (typed-array columns plus slack)
+ */
+export const EVENT_OVERHEAD_BYTES = 32;
+
+const HOUR_MS = 60 * 60 * 1000;
+
+/**
+ * Estimated retained size of one event
+ */
+export function estimateEventBytes(text: string): number {
+  return EVENT_OVERHEAD_BYTES + text.length * 2;
+}
+
+type OutputSource = NonNullable<OutputEvent['source']>;
+
+/**
+ * Interned categories and sources, shared by every session
+ */
+class InternPool {
+  readonly categories: string[] = [];
+  readonly sources: OutputSource[] = [];
+  private categoryIds = new Map<string, number>();
+  private sourceIds = new Map<string, number>();
+
+  category(category: string): number {
+    let id = this.categoryIds.get(category);
+    if (id === undefined) {
+      id = this.categories.length;
+      this.categories.push(category);
+      this.categoryIds.set(category, id);
+    }
+    return id;
+  }
+
+  /**
+   * Id of a category that has been seen, without interning it
+   */
+  knownCategory(category: string): number | undefined {
+    return this.categoryIds.get(category);
+  }
+
+  source(source: OutputEvent['source']): number {
+    if (!source || (source.path === undefined && source.name === undefined)) {
+      return -1;
+    }
+    const key = `${source.path ?? ''}\0${source.name ?? ''}`;
+    let id = this.sourceIds.get(key);
+    if (id === undefined) {
+      id = this.sources.length;
+      // Copy only the fields we report; adapters attach large sourceReference payloads
+      this.sources.push({ path: source.path, name: source.name });
+      this.sourceIds.set(key, id);
+    }
+    return id;
+  }
+}
+
+const pool = new InternPool();
+
+function categoryBit(id: number): number {
+  return 1 << (id & 31);
+}
+
+/**
+ * Hash of the trigram ending at text[i] (lowercased text)
+ */
+function gramHash(text: string, i: number): number {
+  let h = Math.imul(text.charCodeAt(i - 2), 0x9e3779b1);
+  h = Math.imul(h ^ text.charCodeAt(i - 1), 0x85ebca6b);
+  h = Math.imul(h ^ text.charCodeAt(i), 0xc2b2ae35);
+  return (h ^ (h >>> 15)) >>> 0;
+}
+
+/**
+ * One fixed-capacity block of events
+ */
+class OutputChunk {
+  readonly ts = new Float64Array(CHUNK_EVENTS);
+  readonly category = new Uint16Array(CHUNK_EVENTS);
+  readonly source = new Int32Array(CHUNK_EVENTS);
+  readonly line = new Int32Array(CHUNK_EVENTS);
+  readonly column = new Int32Array(CHUNK_EVENTS);
+  /** End offset of each event's text in `text` */
+  readonly ends = new Uint32Array(CHUNK_EVENTS);
+
+  count = 0;
+  bytes = 0;
+  chars = 0;
+  minTs = Infinity;
+  maxTs = -Infinity;
+  /** Categories present (bit per category id mod 32) */
+  categoryMask = 0;
+
+  /** Text of the open chunk, joined into `text` when sealed */
+  private pieces: string[] | null = [];
+  private text = '';
+  /** Trigram filter over the lowercased text, built when sealed */
+  private grams: Uint32Array | null = null;
+
+  get full(): boolean {
+    return this.pieces === null || this.count === CHUNK_EVENTS || this.chars >= CHUNK_CHARS;
+  }
+
+  push(event: OutputEvent): void {
+    const i = this.count++;
+    const category = pool.category(event.category);
+    this.ts[i] = event.ts;
+    this.category[i] = category;
+    this.source[i] = pool.source(event.source);
+    this.line[i] = event.line ?? -1;
+    this.column[i] = event.column ?? -1;
+    this.chars += event.text.length;
+    this.ends[i] = this.chars;
+    this.bytes += estimateEventBytes(event.text);
+    this.pieces!.push(event.text);
+    this.minTs = Math.min(this.minTs, event.ts);
+    this.maxTs = Math.max(this.maxTs, event.ts);
+    this.categoryMask |= categoryBit(category);
+  }
+
+  /**
+   * Join the text and build the trigram filter; returns the bytes added
+   */
+  seal(): number {
+    if (!this.pieces) return 0;
+    this.text = this.pieces.join('');
+    this.pieces = null;
+
+    let bits = MIN_GRAM_BITS;
+    while (bits < this.chars * 2 && bits < MAX_GRAM_BITS) bits <<= 1;
+    const grams = new Uint32Array(bits >>> 5);
+    const lower = this.text.toLowerCase();
+    for (let i = 2; i < lower.length; i++) {
+      const h = gramHash(lower, i) & (bits - 1);
+      grams[h >>> 5] |= 1 << (h & 31);
+    }
+    this.grams = grams;
+    this.bytes += grams.byteLength;
+    return grams.byteLength;
+  }
+
+  /**
+   * False if the chunk certainly holds no event containing every literal
+   * (literals must be lowercased); the open chunk always may
+   */
+  mayContain(literals: string[]): boolean {
+    const grams = this.grams;
+    if (!grams) return true;
+    const mask = grams.length * 32 - 1;
+    for (const literal of literals) {
+      for (let i = 2; i < literal.length; i++) {
+        const h = gramHash(literal, i) & mask;
+        if ((grams[h >>> 5] & (1 << (h & 31))) === 0) return false;
+      }
+    }
+    return true;
+  }
+
+  textAt(i: number): string {
+    if (this.pieces) {
+      return this.pieces[i];
+    }
+    return this.text.slice(i === 0 ? 0 : this.ends[i - 1], this.ends[i]);
+  }
+
+  eventAt(i: number): OutputEvent {
+    const event: OutputEvent = {
+      ts: this.ts[i],
+      category: pool.categories[this.category[i]] as OutputEvent['category'],
+      text: this.textAt(i)
+    };
+    if (this.source[i] !== -1) event.source = pool.sources[this.source[i]];
+    if (this.line[i] !== -1) event.line = this.line[i];
+    if (this.column[i] !== -1) event.column = this.column[i];
+    return event;
+  }
+}
+
+/**
+ * Approximate most-frequent messages (Space-Saving with a fixed slot count)
+ *
+ * Counts are exact for messages that never left the table; evicted output
+ * is subtracted when it is still tracked.
+ */
+class TopMessages {
+  private counts = new Map<string, number>();
+
+  add(key: string): void {
+    const count = this.counts.get(key);
+    if (count !== undefined) {
+      this.counts.set(key, count + 1);
+      return;
+    }
+    if (this.counts.size < TOP_MESSAGE_SLOTS) {
+      this.counts.set(key, 1);
+      return;
+    }
+
+    // Replace the smallest counter; the newcomer inherits its count
+    let minKey = '';
+    let minCount = Infinity;
+    for (const [k, c] of this.counts) {
+      if (c < minCount) {
+        minKey = k;
+        minCount = c;
+      }
+    }
+    this.counts.delete(minKey);
+    this.counts.set(key, minCount + 1);
+  }
+
+  remove(key: string): void {
+    const count = this.counts.get(key);
+    if (count === undefined) return;
+    if (count <= 1) {
+      this.counts.delete(key);
+    } else {
+      this.counts.set(key, count - 1);
+    }
+  }
+
+  entries(): Array<[string, number]> {
+    return Array.from(this.counts.entries());
+  }
+}
+
+function bump<K>(map: Map<K, number>, key: K, delta: number): void {
+  const count = (map.get(key) ?? 0) + delta;
+  if (count > 0) {
+    map.set(key, count);
+  } else {
+    map.delete(key);
+  }
+}
+
+/**
+ * Options for OutputLog.scan()
+ */
+export interface ScanOptions {
+  /** Only events in these categories */
+  categories?: string[];
+  /** Only events at or after this timestamp */
+  since?: number;
+  /** Only events at or before this timestamp */
+  until?: number;
+  /**
+   * Substrings every matching event contains (any case); chunks whose
+   * trigram filter rules one out are skipped. See requiredLiterals().
+   */
+  literals?: string[];
+  /** Text predicate, evaluated before the event is materialized */
+  match?: (text: string) => boolean;
+  /** Only events with a sequence number at or after this (see firstSeq/nextSeq) */
+  fromSeq?: number;
+  /** Only events with a sequence number before this */
+  toSeq?: number;
+  /** Visit newest first */
+  backward?: boolean;
+}
+
+/**
+ * Work done by a scan
+ */
+export interface ScanStats {
+  chunksScanned: number;
+  chunksSkipped: number;
+}
+
+/**
+ * Per-second output counts (for timelines)
+ */
+export interface SecondBucket {
+  outputs: number;
+  stderr: number;
+}
+
+/**
+ * Index of the last character of an escape's payload, given the index of the
+ * letter or digit after the backslash
+ */
+function skipEscapePayload(source: string, i: number): number {
+  const skipWhile = (from: number, max: number, allowed: RegExp) => {
+    let end = from;
+    while (end - from < max && end + 1 < source.length && allowed.test(source[end + 1])) end++;
+    return end;
+  };
+  const skipTo = (close: string) => {
+    const end = source.indexOf(close, i + 1);
+    return end === -1 ? source.length - 1 : end;
+  };
+
+  switch (source[i]) {
+    case 'x':
+      return skipWhile(i, 2, /[0-9A-Fa-f]/);
+    case 'u':
+      return source[i + 1] === '{' ? skipTo('}') : skipWhile(i, 4, /[0-9A-Fa-f]/);
+    case 'c':
+      return skipWhile(i, 1, /[A-Za-z]/);
+    case 'p':
+    case 'P':
+      return source[i + 1] === '{' ? skipTo('}') : i;
+    case 'k':
+      return source[i + 1] === '<' ? skipTo('>') : i;
+    default:
+      // Backreference or octal escape (\1, \12, \012)
+      return /[0-9]/.test(source[i]) ? skipWhile(i, Infinity, /[0-9]/) : i;
+  }
+}
+
+/**
+ * Substrings (3+ characters, lowercased) that every match of a regex must contain
+ *
+ * Conservative: only top-level literal runs are used, and patterns with
+ * alternation yield nothing, so a chunk is never skipped wrongly.
+ */
+export function requiredLiterals(source: string): string[] {
+  if (source.includes('|')) return [];
+
+  const literals: string[] = [];
+  let run = '';
+  let depth = 0;
+  const flush = () => {
+    if (run.length >= 3) literals.push(run.toLowerCase());
+    run = '';
+  };
+
+  for (let i = 0; i < source.length; i++) {
+    const c = source[i];
+    if (c === '\\') {
+      const next = source[++i];
+      if (next === undefined || /[0-9A-Za-z]/.test(next)) {
+        // Class, character or control escape, or backreference; its payload
+        // (\x41, \u0041, \u{1F600}, \cJ, \p{L}, \k<name>, \12) is not literal text
+        flush();
+        i = skipEscapePayload(source, i);
+      } else if (depth === 0) {
+        run += next;
+      }
+    } else if (c === '[') {
+      flush();
+      while (i < source.length && source[i] !== ']') {
+        if (source[i] === '\\') i++;
+        i++;
+      }
+    } else if (c === '(') {
+      flush();
+      depth++;
+    } else if (c === ')') {
+      flush();
+      depth = Math.max(0, depth - 1);
+    } else if (c === '*' || c === '?' || c === '{') {
+      // The previous atom may be absent
+      run = run.slice(0, -1);
+      flush();
+      if (c === '{') {
+        while (i < source.length && source[i] !== '}') i++;
+      }
+    } else if (c === '+' || c === '.' || c === '^' || c === '$') {
+      flush();
+    } else if (depth === 0) {
+      run += c;
+    }
+  }
+  flush();
+  return literals;
+}
+
+/**
+ * Append-only, evict-from-the-front log of one session's output
+ *
+ * Read access mirrors the array methods the dap.* scripts use (length, at,
+ * slice, forEach, filter, iteration); events are materialized on read.
+ */
+export class OutputLog implements Iterable<OutputEvent> {
+  private chunks: OutputChunk[] = [];
+
+  /** Retained events */
+  length = 0;
+
+  /** Estimated retained bytes */
+  bytes = 0;
+
+  /** Retained text characters */
+  chars = 0;
+
+  /** Events evicted to stay within budget */
+  dropped = 0;
+
+  /** Estimated bytes evicted */
+  droppedBytes = 0;
+
+  private categoryCounts = new Map<number, number>();
+  private sourceCounts = new Map<number, number>();
+  private hourCounts = new Map<number, number>();
+  private secondCounts = new Map<number, SecondBucket>();
+  private messages = new TopMessages();
+
+  /**
+   * Sequence number of the oldest retained event
+   */
+  get firstSeq(): number {
+    return this.dropped;
+  }
+
+  /**
+   * Sequence number the next appended event will get
+   */
+  get nextSeq(): number {
+    return this.dropped + this.length;
+  }
+
+  /**
+   * Append an event; returns its estimated size in bytes
+   */
+  append(event: OutputEvent): number {
+    let added = 0;
+    let chunk = this.chunks[this.chunks.length - 1];
+    if (!chunk || chunk.full) {
+      added += chunk?.seal() ?? 0;
+      chunk = new OutputChunk();
+      this.chunks.push(chunk);
+    }
+
+    const before = chunk.bytes;
+    chunk.push(event);
+    added += chunk.bytes - before;
+
+    this.length++;
+    this.bytes += added;
+    this.chars += event.text.length;
+    this.count(chunk, chunk.count - 1, 1);
+    return added;
+  }
+
+  /**
+   * Drop the oldest chunk; returns the bytes freed (0 when empty)
+   */
+  evictOldest(): number {
+    const chunk = this.chunks.shift();
+    if (!chunk) return 0;
+
+    for (let i = 0; i < chunk.count; i++) {
+      this.count(chunk, i, -1);
+    }
+    this.length -= chunk.count;
+    this.bytes -= chunk.bytes;
+    this.chars -= chunk.chars;
+    this.dropped += chunk.count;
+    this.droppedBytes += chunk.bytes;
+    return chunk.bytes;
+  }
+
+  /**
+   * Retained events per category
+   */
+  countByCategory(): Record<string, number> {
+    const counts: Record<string, number> = {};
+    for (const [id, count] of this.categoryCounts) {
+      counts[pool.categories[id]] = count;
+    }
+    return counts;
+  }
+
+  /**
+   * Retained events per source file (path, or name when there is no path)
+   */
+  countBySource(): Record<string, number> {
+    const counts: Record<string, number> = {};
+    for (const [id, count] of this.sourceCounts) {
+      const source = pool.sources[id];
+      const file = (source.path || source.name)!;
+      counts[file] = (counts[file] ?? 0) + count;
+    }
+    return counts;
+  }
+
+  /**
+   * Retained events per hour, keyed by hour start (epoch ms), in time order
+   */
+  countByHour(): Array<[number, number]> {
+    return Array.from(this.hourCounts.entries())
+      .map(([hour, count]): [number, number] => [hour * HOUR_MS, count])
+      .sort((a, b) => a[0] - b[0]);
+  }
+
+  /**
+   * Retained events per second, keyed by second start (epoch ms), in time order
+   */
+  countBySecond(): Array<[number, SecondBucket]> {
+    return Array.from(this.secondCounts.entries())
+      .map(([second, bucket]): [number, SecondBucket] => [second * 1000, { ...bucket }])
+      .sort((a, b) => a[0] - b[0]);
+  }
+
+  /**
+   * Most frequent messages (first MESSAGE_KEY_CHARS characters), approximate
+   */
+  topMessages(): Array<[string, number]> {
+    return this.messages.entries();
+  }
+
+  /**
+   * Visit matching events in order, skipping chunks the index rules out
+   *
+   * `visit` gets the event and its retained index; returning false stops.
+   * The event's sequence number is `firstSeq + index`.
+   */
+  scan(options: ScanOptions, visit: (event: OutputEvent, index: number) => boolean | void): ScanStats {
+    const stats: ScanStats = { chunksScanned: 0, chunksSkipped: 0 };
+
+    let categoryMask = -1;
+    let categoryIds: Set<number> | undefined;
+    if (options.categories) {
+      categoryIds = new Set();
+      categoryMask = 0;
+      for (const category of options.categories) {
+        const id = pool.knownCategory(category);
+        if (id !== undefined) {
+          categoryIds.add(id);
+          categoryMask |= categoryBit(id);
+        }
+      }
+    }
+    const since = options.since ?? -Infinity;
+    const until = options.until ?? Infinity;
+    const literals = (options.literals ?? [])
+      .filter(literal => literal.length >= 3)
+      .map(literal => literal.toLowerCase());
+
+    // Sequence bounds as retained indexes
+    const from = Math.max(0, (options.fromSeq ?? this.firstSeq) - this.firstSeq);
+    const to = Math.min(this.length, (options.toSeq ?? this.nextSeq) - this.firstSeq);
+
+    const bases: number[] = [];
+    let offset = 0;
+    for (const chunk of this.chunks) {
+      bases.push(offset);
+      offset += chunk.count;
+    }
+
+    for (let c = 0; c < this.chunks.length; c++) {
+      const n = options.backward ? this.chunks.length - 1 - c : c;
+      const chunk = this.chunks[n];
+      const base = bases[n];
+
+      // Outside the sequence range: not part of this scan at all
+      if (base + chunk.count <= from || base >= to) continue;
+
+      if (
+        (chunk.categoryMask & categoryMask) === 0 ||
+        chunk.maxTs < since ||
+        chunk.minTs > until ||
+        (literals.length > 0 && !chunk.mayContain(literals))
+      ) {
+        stats.chunksSkipped++;
+        continue;
+      }
+      stats.chunksScanned++;
+
+      const start = Math.max(0, from - base);
+      const end = Math.min(chunk.count, to - base);
+      for (let k = start; k < end; k++) {
+        const i = options.backward ? end - 1 - (k - start) : k;
+        if (categoryIds && !categoryIds.has(chunk.category[i])) continue;
+        const ts = chunk.ts[i];
+        if (ts < since || ts > until) continue;
+        if (options.match && !options.match(chunk.textAt(i))) continue;
+        if (visit(chunk.eventAt(i), base + i) === false) return stats;
+      }
+    }
+    return stats;
+  }
+
+  /**
+   * Event at a retained index (negative counts from the end)
+   */
+  at(index: number): OutputEvent | undefined {
+    if (index < 0) index += this.length;
+    if (index < 0 || index >= this.length) return undefined;
+
+    for (const chunk of this.chunks) {
+      if (index < chunk.count) return chunk.eventAt(index);
+      index -= chunk.count;
+    }
+    return undefined;
+  }
+
+  /**
+   * Events in [start, end) of the retained range, with Array.prototype.slice semantics
+   */
+  slice(start = 0, end = this.length): OutputEvent[] {
+    const clamp = (n: number) => Math.max(0, Math.min(this.length, n < 0 ? n + this.length : n));
+    const from = clamp(start);
+    const to = clamp(end);
+    const events: OutputEvent[] = [];
+    if (from >= to) return events;
+
+    let offset = 0;
+    for (const chunk of this.chunks) {
+      const chunkEnd = offset + chunk.count;
+      if (chunkEnd > from) {
+        for (let i = Math.max(0, from - offset); i < chunk.count && offset + i < to; i++) {
+          events.push(chunk.eventAt(i));
+        }
+      }
+      offset = chunkEnd;
+      if (offset >= to) break;
+    }
+    return events;
+  }
+
+  toArray(): OutputEvent[] {
+    return this.slice();
+  }
+
+  /**
+   * Serialize as a plain event array (dynamic scripts return sessions as-is)
+   */
+  toJSON(): OutputEvent[] {
+    return this.slice();
+  }
+
+  forEach(callback: (event: OutputEvent, index: number) => void): void {
+    let index = 0;
+    for (const event of this) {
+      callback(event, index++);
+    }
+  }
+
+  filter(predicate: (event: OutputEvent, index: number) => boolean): OutputEvent[] {
+    const events: OutputEvent[] = [];
+    this.forEach((event, index) => {
+      if (predicate(event, index)) events.push(event);
+    });
+    return events;
+  }
+
+  *[Symbol.iterator](): Iterator<OutputEvent> {
+    for (const chunk of this.chunks) {
+      for (let i = 0; i < chunk.count; i++) {
+        yield chunk.eventAt(i);
+      }
+    }
+  }
+
+  /**
+   * Add (delta 1) or remove (delta -1) one event from the aggregates
+   */
+  private count(chunk: OutputChunk, i: number, delta: 1 | -1): void {
+    const ts = chunk.ts[i];
+    const category = chunk.category[i];
+    bump(this.categoryCounts, category, delta);
+    if (chunk.source[i] !== -1) {
+      bump(this.sourceCounts, chunk.source[i], delta);
+    }
+    bump(this.hourCounts, Math.floor(ts / HOUR_MS), delta);
+
+    const second = Math.floor(ts / 1000);
+    let bucket = this.secondCounts.get(second);
+    if (!bucket) {
+      bucket = { outputs: 0, stderr: 0 };
+      this.secondCounts.set(second, bucket);
+    }
+    bucket.outputs += delta;
+    if (pool.categories[category] === 'stderr') bucket.stderr += delta;
+    if (bucket.outputs <= 0) this.secondCounts.delete(second);
+
+    const key = chunk.textAt(i).slice(0, MESSAGE_KEY_CHARS);
+    if (delta > 0) {
+      this.messages.add(key);
+    } else {
+      this.messages.remove(key);
+    }
+  }
+}
@@ -31,11 +31,21 @@ async function executeStepOperation(bridgeContext, params, config) {
     const { getDebugSession } = require('@core/debug/session-helpers');
     const session = getDebugSession(vscode, params.sessionId);
 
+    // Cached threads/stackTrace/scopes/variables are only valid for one pause
+    const { RuntimeInspectionService } = require('@core/runtime-inspection/RuntimeInspectionService');
+    const invalidatePauseCache = () => RuntimeInspectionService.getInstance().invalidateCache(session.id);
+
     // Phase 1: Resolve which threads to step
     const threadIds = await threadResolver.resolve(session, vscode);
 
-    // Phase 2: Execute the step operation
-    const stepOperation = () => stepExecutor.execute(session, threadIds);
+    // Phase 2: Execute the step operation (execution resumes once it is sent)
+    const stepOperation = async () => {
+        try {
+            return await stepExecutor.execute(session, threadIds);
+        } finally {
+            invalidatePauseCache();
+        }
+    };
 
     // Phase 3: Wait for outcome (stopped, terminated, or error)
     const result = await waitStrategy.wait(
@@ -46,6 +56,9 @@ async function executeStepOperation(bridgeContext, params, config) {
         params.timeoutMs || 5000
     );
 
+    // Anything cached while running belongs to no pause
+    invalidatePauseCache();
+
     // Phase 4: Log outcome to output channel
     if (outputChannel) {
         if (result.event === 'stopped') {
@@ -13,6 +13,7 @@
  */
 
 const { getActiveThreadId } = require('@core/debug/session-helpers');
+const { DebugEventHub } = require('@core/debug/event-hub');
 const { waitForStoppedEventAndGetLocation, waitUntilPausedAndGetLocation } = require('@core/debug/debug-polling-helpers');
 
 // ============================================================================
@@ -151,8 +152,8 @@ class WaitStrategy {
 /**
  * Event-driven wait strategy (RECOMMENDED)
  *
- * Uses DebugSessionCaptureService to detect stopped events from the debug adapter.
- * Faster and more reliable than polling (detects events immediately instead of every 50ms).
+ * Waits on DebugEventHub for the adapter's stopped event (DebugSessionCaptureService
+ * polling as a fallback). Detects the stop as soon as the adapter sends it.
  */
 class EventDrivenWaitStrategy extends WaitStrategy {
     async wait(session, threadIds, vscode, stepOperation, timeoutMs) {
@@ -171,22 +172,27 @@ class EventDrivenWaitStrategy extends WaitStrategy {
 /**
  * Polling wait strategy (LEGACY)
  *
- * Polls stackTrace every 50ms until the debugger pauses.
- * Slower than event-driven but doesn't require DebugSessionCaptureService.
+ * Doesn't require DebugSessionCaptureService. Still takes the stop from
+ * DebugEventHub when it is installed; stackTrace polling every 50ms only
+ * runs as the fallback.
  *
  * NOTE: Event-driven is preferred. Polling kept for compatibility.
  */
 class PollingWaitStrategy extends WaitStrategy {
     async wait(session, threadIds, vscode, stepOperation, timeoutMs) {
+        // Take the hub cursor so a stop arriving during the request still counts
+        const after = DebugEventHub.instance.cursor();
+
         // Execute the step operation first
         await stepOperation();
 
-        // Then poll until paused
+        // Then wait until paused
         return await waitUntilPausedAndGetLocation(
             session,
             timeoutMs,
             vscode,
-            false  // useActiveSession=false for step commands
+            false,  // useActiveSession=false for step commands
+            { after }
         );
     }
 }
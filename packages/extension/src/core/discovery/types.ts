@@ -15,6 +15,7 @@ export const ScriptMetadataSchema = z.object({
         default: z.any().optional()
     })).optional(),
     response: z.enum(['action', 'query', 'waitable', 'stream']).optional().default('action'),
+    priority: z.enum(['fast', 'normal', 'blocking']).optional(),
     errors: z.array(z.string()).optional(),
     cli: z.object({
         command: z.string().optional(),
@@ -35,6 +36,8 @@ export type ScriptMetadata = z.infer<typeof ScriptMetadataSchema>;
 export interface ManifestEntry {
     metadata: ScriptMetadata;
     scriptRelPath: string;
+    /** Export name of the script class in vsc-scripts/index (build-time snapshot) */
+    exportName?: string;
 }
 
 /**
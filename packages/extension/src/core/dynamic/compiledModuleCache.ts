@@ -0,0 +1,127 @@
+/**
+ * Compiled Module Cache
+ *
+ * Agents run the same dynamic scripts (scripts/sample/dynamic/*.js) hundreds
+ * of times per session. Rewriting their `export` forms and compiling them is
+ * the same work every time, so the compiled result is kept in a bounded LRU:
+ * - Source sent by the CLI is keyed by a hash of its content
+ * - Scripts loaded from disk are keyed by path, versioned by mtime and size,
+ *   so an edited file is recompiled on its next use
+ *
+ * Only the compiled function is cached for source scripts: each invocation
+ * still runs it against a fresh `module`, so module-level state is not
+ * shared between runs.
+ */
+
+import { createHash } from 'node:crypto';
+
+/**
+ * Default cap on cached modules per cache
+ */
+const DEFAULT_MAX_ENTRIES = 64;
+
+/**
+ * Compiled module cache counters
+ */
+export interface ICompiledModuleCacheStats {
+    /** Lookups answered from the cache */
+    hits: number;
+
+    /** Lookups that compiled (including stale entries) */
+    misses: number;
+
+    /** Misses caused by a changed version (edited file) */
+    stale: number;
+
+    /** Entries dropped to stay under the cap */
+    evictions: number;
+
+    /** Modules currently cached */
+    entries: number;
+
+    /** hits / (hits + misses), 0 before the first lookup */
+    hitRate: number;
+}
+
+interface CacheEntry<T> {
+    version: string;
+    value: T;
+}
+
+/**
+ * Content hash of a script source (plus anything else the compiled result depends on)
+ */
+export function hashSource(source: string, ...salt: string[]): string {
+    const hash = createHash('sha256');
+    hash.update(source);
+    for (const part of salt) {
+        hash.update('\0');
+        hash.update(part);
+    }
+    return hash.digest('hex');
+}
+
+/**
+ * Bounded LRU of compiled modules
+ */
+export class CompiledModuleCache<T> {
+    private entries = new Map<string, CacheEntry<T>>();
+    private hits = 0;
+    private misses = 0;
+    private stale = 0;
+    private evictions = 0;
+
+    constructor(private readonly maxEntries: number = DEFAULT_MAX_ENTRIES) {}
+
+    /**
+     * Cached value for `key` at `version`, compiling it on a miss
+     *
+     * A failed compile is not cached, so a fixed script compiles on the next call.
+     */
+    get(key: string, compile: () => T, version = ''): T {
+        const cached = this.entries.get(key);
+        if (cached && cached.version === version) {
+            // Most recently used goes last
+            this.entries.delete(key);
+            this.entries.set(key, cached);
+            this.hits++;
+            return cached.value;
+        }
+
+        this.misses++;
+        if (cached) {
+            this.stale++;
+            this.entries.delete(key);
+        }
+
+        const value = compile();
+        this.entries.set(key, { version, value });
+        if (this.entries.size > this.maxEntries) {
+            this.entries.delete(this.entries.keys().next().value!);
+            this.evictions++;
+        }
+        return value;
+    }
+
+    /**
+     * Drop everything
+     */
+    clear(): void {
+        this.entries.clear();
+    }
+
+    /**
+     * Hit/miss counters and current size
+     */
+    stats(): ICompiledModuleCacheStats {
+        const lookups = this.hits + this.misses;
+        return {
+            hits: this.hits,
+            misses: this.misses,
+            stale: this.stale,
+            evictions: this.evictions,
+            entries: this.entries.size,
+            hitRate: lookups === 0 ? 0 : this.hits / lookups
+        };
+    }
+}
@@ -7,6 +7,10 @@
  */
 
 import * as vscode from 'vscode';
+import { CompiledModuleCache, hashSource } from './compiledModuleCache';
+
+/** Compiled script functions by source hash; each run gets a fresh module */
+const compiledScripts = new CompiledModuleCache<Function>();
 
 export interface DynamicScriptResult {
     success?: boolean;
@@ -43,68 +47,10 @@ export async function executeDynamicScript(
         exports: {} as any,
     };
 
-    // Transform the source to handle ESM-style exports
-    // This is a simple transformation for common patterns
-    let transformedSource = source;
-
-    // Handle: export default async function(...) or export default function(...)
-    transformedSource = transformedSource.replace(
-        /export\s+default\s+(async\s+)?function/g,
-        'module.exports.default = $1function'
-    );
-
-    // Handle: export default async (...) => or export default (...) =>
-    transformedSource = transformedSource.replace(
-        /export\s+default\s+(async\s+)?\(/g,
-        'module.exports.default = $1('
-    );
-
-    // Handle: export default async params => or export default params =>
-    transformedSource = transformedSource.replace(
-        /export\s+default\s+(async\s+)?(\w+)\s+=>/g,
-        'module.exports.default = $1$2 =>'
-    );
-
-    // Handle: export const meta = { ... }
-    transformedSource = transformedSource.replace(
-        /export\s+const\s+meta\s*=/g,
-        'module.exports.meta ='
-    );
-
-    // Handle: export function name(...)
-    transformedSource = transformedSource.replace(
-        /export\s+function\s+(\w+)/g,
-        'module.exports.$1 = function'
-    );
-
-    // Handle: export { ... }
-    // This is more complex and we'll skip named exports for now
-
     try {
-        // Create a function with limited scope
+        // Create a function with limited scope (compiled once per distinct source)
         // We provide module but not require, process, or fs
-        const scriptFunction = new Function(
-            'module',
-            'console',
-            'setTimeout',
-            'setInterval',
-            'clearTimeout',
-            'clearInterval',
-            'Promise',
-            'Date',
-            'Math',
-            'JSON',
-            'Array',
-            'Object',
-            'String',
-            'Number',
-            'Boolean',
-            'Map',
-            'Set',
-            'RegExp',
-            'Error',
-            transformedSource
-        );
+        const scriptFunction = compiledScripts.get(hashSource(source), () => compileScript(source));
 
         // Execute the script to populate module.exports
         scriptFunction(
@@ -190,6 +136,71 @@ export async function executeDynamicScript(
     }
 }
 
+/**
+ * Rewrite ESM-style exports and compile the script body
+ */
+function compileScript(source: string): Function {
+    // Transform the source to handle ESM-style exports
+    // This is a simple transformation for common patterns
+    let transformedSource = source;
+
+    // Handle: export default async function(...) or export default function(...)
+    transformedSource = transformedSource.replace(
+        /export\s+default\s+(async\s+)?function/g,
+        'module.exports.default = $1function'
+    );
+
+    // Handle: export default async (...) => or export default (...) =>
+    transformedSource = transformedSource.replace(
+        /export\s+default\s+(async\s+)?\(/g,
+        'module.exports.default = $1('
+    );
+
+    // Handle: export default async params => or export default params =>
+    transformedSource = transformedSource.replace(
+        /export\s+default\s+(async\s+)?(\w+)\s+=>/g,
+        'module.exports.default = $1$2 =>'
+    );
+
+    // Handle: export const meta = { ... }
+    transformedSource = transformedSource.replace(
+        /export\s+const\s+meta\s*=/g,
+        'module.exports.meta ='
+    );
+
+    // Handle: export function name(...)
+    transformedSource = transformedSource.replace(
+        /export\s+function\s+(\w+)/g,
+        'module.exports.$1 = function'
+    );
+
+    // Handle: export { ... }
+    // This is more complex and we'll skip named exports for now
+
+    return new Function(
+        'module',
+        'console',
+        'setTimeout',
+        'setInterval',
+        'clearTimeout',
+        'clearInterval',
+        'Promise',
+        'Date',
+        'Math',
+        'JSON',
+        'Array',
+        'Object',
+        'String',
+        'Number',
+        'Boolean',
+        'Map',
+        'Set',
+        'RegExp',
+        'Error',
+        transformedSource
+    );
+}
+
 /**
  * Validate that a script has proper structure
  *
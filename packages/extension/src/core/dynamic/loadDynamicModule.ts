@@ -1,8 +1,23 @@
 /**
  * Load dynamic script module from source code string
  * This extracts the module loading logic to be reusable
+ *
+ * The rewritten and compiled source is cached by content hash (see
+ * compiledModuleCache); every call still runs it against a fresh module.
  */
 
+import { CompiledModuleCache, hashSource } from './compiledModuleCache';
+import type { ICompiledModuleCacheStats } from './compiledModuleCache';
+
+const compiledModules = new CompiledModuleCache<Function>();
+
+/**
+ * Hit/miss counters of the compiled dynamic module cache
+ */
+export function dynamicModuleCacheStats(): ICompiledModuleCacheStats {
+    return compiledModules.stats();
+}
+
 /**
  * Load a dynamic script module from source string
  * @param source The JavaScript source code
@@ -10,7 +25,6 @@
  */
 export function loadDynamicModule(source: string, vscode?: any, extensionRoot?: string): any {
     // Import required modules
-    const vm = require('node:vm');
     const path = require('node:path');
     const { createRequire } = require('node:module');
     
@@ -19,45 +33,6 @@ export function loadDynamicModule(source: string, vscode?: any, extensionRoot?:
         exports: {} as any,
     };
 
-    // Transform the source to handle various export patterns
-    let transformedSource = source;
-
-    // Handle: export default async function(...) or export default function(...)
-    transformedSource = transformedSource.replace(
-        /export\s+default\s+(async\s+)?function/g,
-        'module.exports = $1function'
-    );
-
-    // Handle: export default async (...) => or export default (...) =>
-    transformedSource = transformedSource.replace(
-        /export\s+default\s+(async\s+)?\(/g,
-        'module.exports = $1('
-    );
-
-    // Handle: export default async params => or export default params =>
-    transformedSource = transformedSource.replace(
-        /export\s+default\s+(async\s+)?(\w+)\s+=>/g,
-        'module.exports = $1$2 =>'
-    );
-
-    // Handle: export const meta = { ... }
-    transformedSource = transformedSource.replace(
-        /export\s+const\s+meta\s*=/g,
-        'module.exports.meta ='
-    );
-
-    // Handle: export function name(...)
-    transformedSource = transformedSource.replace(
-        /export\s+function\s+(\w+)/g,
-        'module.exports.$1 = function'
-    );
-
-    // Handle: export { ... as default }
-    transformedSource = transformedSource.replace(
-        /export\s+\{\s*(\w+)\s+as\s+default\s*\}/g,
-        'module.exports = $1'
-    );
-
     // Determine the virtual location for the dynamic script
     // This is important for require resolution
     const virtualPath = extensionRoot 
@@ -70,16 +45,10 @@ export function loadDynamicModule(source: string, vscode?: any, extensionRoot?:
     // This allows the dynamic script to require both Node built-ins and extension modules
     const nodeRequire = createRequire(virtualPath);
 
-    // Compile in the CURRENT context to preserve prototype chains
-    // This is why instanceof checks work correctly
-    const compiledFunction = vm.compileFunction(
-        transformedSource,
-        ['module', 'exports', 'require', '__filename', '__dirname', 'vscode', 'console', 'setTimeout', 'setInterval', 'clearTimeout', 'clearInterval', 'Promise', 'Date', 'Math', 'JSON', 'Array', 'Object', 'String', 'Number', 'Boolean', 'Map', 'Set', 'RegExp', 'Error'],
-        { 
-            filename: virtualPath,  // Improves stack traces and debugging
-            lineOffset: 0,
-            columnOffset: 0
-        }
+    // Rewrite and compile once per distinct source (and location)
+    const compiledFunction = compiledModules.get(
+        hashSource(source, virtualPath),
+        () => compileDynamicModule(source, virtualPath)
     );
 
     // Execute the compiled function with the anchored require
@@ -143,4 +112,62 @@ export function loadDynamicModule(source: string, vscode?: any, extensionRoot?:
     // If we have an object with multiple exports, return it as-is
     // The caller will need to handle it appropriately
     return scriptModule;
-}
\ No newline at end of file
+}
+
+/**
+ * Rewrite `export` forms to CommonJS and compile the source
+ */
+function compileDynamicModule(source: string, virtualPath: string): Function {
+    const vm = require('node:vm');
+
+    // Transform the source to handle various export patterns
+    let transformedSource = source;
+
+    // Handle: export default async function(...) or export default function(...)
+    transformedSource = transformedSource.replace(
+        /export\s+default\s+(async\s+)?function/g,
+        'module.exports = $1function'
+    );
+
+    // Handle: export default async (...) => or export default (...) =>
+    transformedSource = transformedSource.replace(
+        /export\s+default\s+(async\s+)?\(/g,
+        'module.exports = $1('
+    );
+
+    // Handle: export default async params => or export default params =>
+    transformedSource = transformedSource.replace(
+        /export\s+default\s+(async\s+)?(\w+)\s+=>/g,
+        'module.exports = $1$2 =>'
+    );
+
+    // Handle: export const meta = { ... }
+    transformedSource = transformedSource.replace(
+        /export\s+const\s+meta\s*=/g,
+        'module.exports.meta ='
+    );
+
+    // Handle: export function name(...)
+    transformedSource = transformedSource.replace(
+        /export\s+function\s+(\w+)/g,
+        'module.exports.$1 = function'
+    );
+
+    // Handle: export { ... as default }
+    transformedSource = transformedSource.replace(
+        /export\s+\{\s*(\w+)\s+as\s+default\s*\}/g,
+        'module.exports = $1'
+    );
+
+    // Compile in the CURRENT context to preserve prototype chains
+    // This is why instanceof checks work correctly
+    return vm.compileFunction(
+        transformedSource,
+        ['module', 'exports', 'require', '__filename', '__dirname', 'vscode', 'console', 'setTimeout', 'setInterval', 'clearTimeout', 'clearInterval', 'Promise', 'Date', 'Math', 'JSON', 'Array', 'Object', 'String', 'Number', 'Boolean', 'Map', 'Set', 'RegExp', 'Error'],
+        { 
+            filename: virtualPath,  // Improves stack traces and debugging
+            lineOffset: 0,
+            columnOffset: 0
+        }
+    );
+}
@@ -3,7 +3,7 @@ import * as fs from 'fs';
 import * as path from 'path';
 import { promises as fsPromises } from 'fs';
 import * as crypto from 'crypto';
-import { BridgeInfo, HostJson } from './types';
+import { BridgeInfo, HostJson, SocketEndpoint } from './types';
 import { writeJsonAtomicAsync } from './io';
 
 /**
@@ -150,6 +150,28 @@ async function writeHostMetadata(hostJsonPath: string, metadata: HostJson): Prom
   await writeJsonAtomicAsync(hostJsonPath, metadata);
 }
 
+/**
+ * Advertise (or withdraw) the local socket endpoint in host.json
+ *
+ * Rewrites host.json atomically with the socket field merged in, so clients
+ * reading it mid-update see either the old or the new metadata.
+ */
+export async function advertiseSocketEndpoint(
+  hostJsonPath: string,
+  endpoint: SocketEndpoint | undefined
+): Promise<void> {
+  const hostData = await fsPromises.readFile(hostJsonPath, 'utf8');
+  const host = JSON.parse(hostData) as HostJson;
+
+  if (endpoint) {
+    host.socket = endpoint;
+  } else {
+    delete host.socket;
+  }
+
+  await writeHostMetadata(hostJsonPath, host);
+}
+
 /**
  * Check if a process is alive by PID
  */
@@ -3,6 +3,13 @@ import * as path from 'path';
 import { promises as fsPromises } from 'fs';
 import { isDlqJob } from './dlq';
 import { NodeFilesystem } from './fs-abstraction';
+import { getJobIndex, noteJobMarker, noteJobRemoved, JobIndex, JobRecord } from './job-index';
+import { getJobJournal, journalJobTransition, JobJournal } from './journal';
+
+/**
+ * DLQ jobs are retained for 7 days regardless of maxAge
+ */
+const DLQ_RETENTION_MS = 7 * 24 * 60 * 60 * 1000;
 
 /**
  * Cleanup statistics
@@ -32,11 +39,13 @@ export function startGarbageCollection(
     console.error(`[GC] Initial cleanup failed: ${err}`);
   });
 
-  // Schedule periodic cleanup
+  // Schedule periodic cleanup (and journal compaction)
   return setInterval(() => {
-    cleanOldJobs(executeDir, maxAgeMs).catch(err => {
-      console.error(`[GC] Cleanup failed: ${err}`);
-    });
+    cleanOldJobs(executeDir, maxAgeMs)
+      .then(() => getJobJournal(executeDir)?.compact())
+      .catch(err => {
+        console.error(`[GC] Cleanup failed: ${err}`);
+      });
   }, intervalMs);
 }
 
@@ -54,6 +63,16 @@ export async function cleanOldJobs(
     errors: 0
   };
 
+  const journal = getJobJournal(executeDir);
+  if (journal) {
+    return cleanOldJournaledJobs(journal, maxAgeMs, stats);
+  }
+
+  const index = getJobIndex(executeDir);
+  if (index) {
+    return cleanOldIndexedJobs(index, maxAgeMs, stats);
+  }
+
   try {
     const entries = await fsPromises.readdir(executeDir, { withFileTypes: true });
 
@@ -89,6 +108,98 @@ export async function cleanOldJobs(
   return stats;
 }
 
+/**
+ * cleanOldJobs() from the bridge journal's age order, without listing execute/
+ *
+ * Finished jobs are visited oldest first until one is too young; jobs still
+ * claimed after twice the max age are removed like the directory walk does.
+ */
+async function cleanOldJournaledJobs(
+  journal: JobJournal,
+  maxAgeMs: number,
+  stats: CleanupStats
+): Promise<CleanupStats> {
+  const now = Date.now();
+  const expired = journal.expired(maxAgeMs, DLQ_RETENTION_MS, now);
+  const abandoned = journal.claimed()
+    .filter(state => !state.keep && now - state.claim!.t > maxAgeMs * 2)
+    .map(state => state.id);
+
+  for (const id of [...expired, ...abandoned]) {
+    stats.scanned++;
+    const jobDir = path.join(journal.executeDir, id);
+
+    try {
+      await fsPromises.rm(jobDir, { recursive: true, force: true });
+      noteJobRemoved(jobDir);
+      journalJobTransition(jobDir, 'delete');
+      stats.deleted++;
+      console.log(`[GC] Deleted old job: ${id}`);
+    } catch (err) {
+      console.error(`[GC] Error processing ${id}: ${err}`);
+      stats.errors++;
+    }
+  }
+
+  if (stats.deleted > 0) {
+    console.log(`[GC] Cleanup complete: deleted ${stats.deleted}`);
+  }
+
+  return stats;
+}
+
+/**
+ * cleanOldJobs() against a live job index: only expired jobs touch the disk
+ */
+async function cleanOldIndexedJobs(
+  index: JobIndex,
+  maxAgeMs: number,
+  stats: CleanupStats
+): Promise<CleanupStats> {
+  const now = Date.now();
+
+  for (const record of index.all()) {
+    stats.scanned++;
+
+    if (!isRecordExpired(record, maxAgeMs, now)) {
+      stats.kept++;
+      continue;
+    }
+
+    try {
+      await fsPromises.rm(record.dir, { recursive: true, force: true });
+      index.remove(record.id);
+      journalJobTransition(record.dir, 'delete');
+      stats.deleted++;
+      console.log(`[GC] Deleted old job: ${record.id}`);
+    } catch (err) {
+      console.error(`[GC] Error processing ${record.id}: ${err}`);
+      stats.errors++;
+    }
+  }
+
+  if (stats.deleted > 0) {
+    console.log(`[GC] Cleanup complete: deleted ${stats.deleted}, kept ${stats.kept}`);
+  }
+
+  return stats;
+}
+
+/**
+ * Same retention rules as shouldDeleteJob(), applied to an indexed record
+ */
+function isRecordExpired(record: JobRecord, maxAgeMs: number, now: number): boolean {
+  if (record.keep) {
+    return false;
+  }
+
+  const effectiveMaxAge = record.dlq ? DLQ_RETENTION_MS : maxAgeMs;
+  if (record.done) {
+    return now - (record.doneMs ?? record.mtimeMs) > effectiveMaxAge;
+  }
+  return now - record.mtimeMs > effectiveMaxAge * 2;
+}
+
 /**
  * Determine if a job should be deleted
  */
@@ -104,7 +215,6 @@ export async function shouldDeleteJob(
   // Check if this is a DLQ job - apply 7-day retention
   const nodeFs = new NodeFilesystem();
   const isDlq = await isDlqJob(jobDir, nodeFs);
-  const DLQ_RETENTION_MS = 7 * 24 * 60 * 60 * 1000; // 7 days
   const effectiveMaxAge = isDlq ? DLQ_RETENTION_MS : maxAgeMs;
 
   // Check if job is complete
@@ -150,6 +260,8 @@ export async function markJobForKeeping(jobDir: string, reason?: string): Promis
   const keepPath = path.join(jobDir, 'keep');
   const content = reason || `Kept for debugging at ${new Date().toISOString()}`;
   await fsPromises.writeFile(keepPath, content, 'utf8');
+  noteJobMarker(jobDir, 'keep');
+  journalJobTransition(jobDir, 'keep');
 }
 
 /**
@@ -172,6 +284,29 @@ export async function getJobStats(executeDir: string): Promise<{
     newestJob: undefined as Date | undefined
   };
 
+  const index = getJobIndex(executeDir);
+  if (index) {
+    for (const record of index.all()) {
+      stats.total++;
+      if (record.done) {
+        stats.completed++;
+        const jobTime = new Date(record.doneMs ?? record.mtimeMs);
+        if (!stats.oldestJob || jobTime < stats.oldestJob) {
+          stats.oldestJob = jobTime;
+        }
+        if (!stats.newestJob || jobTime > stats.newestJob) {
+          stats.newestJob = jobTime;
+        }
+      } else {
+        stats.incomplete++;
+      }
+      if (record.keep) {
+        stats.kept++;
+      }
+    }
+    return stats;
+  }
+
   try {
     const entries = await fsPromises.readdir(executeDir, { withFileTypes: true });
 
@@ -242,6 +377,8 @@ export async function cleanAllJobs(
         }
 
         await fsPromises.rm(jobDir, { recursive: true, force: true });
+        noteJobRemoved(jobDir);
+        journalJobTransition(jobDir, 'delete');
         stats.deleted++;
       } catch (err) {
         console.error(`[GC] Error deleting ${entry.name}: ${err}`);
@@ -18,6 +18,8 @@
 import * as path from 'path';
 import { writeJsonAtomicAsync } from './io';
 import { IFilesystem } from './fs-abstraction';
+import { noteJobMarker } from './job-index';
+import { journalJobTransition } from './journal';
 
 /**
  * DLQ marker metadata stored in job directory
@@ -66,6 +68,8 @@ export async function writeDlqMarker(jobDir: string, metadata: DlqMarker): Promi
     };
 
     await writeJsonAtomicAsync(dlqPath, data);
+    noteJobMarker(jobDir, 'dlq');
+    journalJobTransition(jobDir, 'dlq');
   } catch (err: any) {
     // KISS: Single attempt, log error, continue (no retry)
     console.error(`[DLQ] Failed to write marker for ${path.basename(jobDir)}:`, err.message);
@@ -11,15 +11,15 @@ import {
   initBridge,
   initBridgeForWorkspace,
   startHealthHeartbeat,
-  checkBridgeHealth
+  checkBridgeHealth,
+  advertiseSocketEndpoint
 } from './bridge';
 import {
   claimJobAtomic,
   processCommand,
   launchJob,
   EventWriter,
-  inFlight,
-  MAX_CONCURRENT
+  jobScheduler
 } from './processor';
 import {
   startRecoveryTimer,
@@ -42,12 +42,29 @@ import { exists } from './io';
 import { isDlqJob } from './dlq';
 import { VsCodeFilesystem } from './fs-abstraction';
 import { scanForUnclaimedJobs } from './scanner';
+import { BridgeSocketServer } from './socket-server';
+import {
+  JobIndex,
+  registerJobIndex,
+  unregisterJobIndex,
+  noteJobMarker,
+  noteJobRemoved,
+  getJobIndex
+} from './job-index';
+import {
+  JobJournal,
+  registerJobJournal,
+  unregisterJobJournal,
+  journalJobTransition
+} from './journal';
 import { ITelemetry } from '../telemetry';
 
 // Export all types
 export * from './types';
-export { EventWriter } from './processor';
+export { EventWriter, setPriorityResolver } from './processor';
+export { PriorityClass, priorityFromMetadata, slowestPriority } from './scheduler';
 export { checkBridgeHealth } from './bridge';
+export { JOURNAL_FILE } from './journal';
 
 /**
  * Global bridge manager
@@ -91,6 +108,29 @@ class BridgeManager {
   ): Promise<void> {
     const executeDir = path.join(bridge.bridgeDir, 'execute');
 
+    // 0. Replay the job journal, then index job state once; every startup
+    //    step below and the periodic scans work from memory instead of
+    //    walking execute/ (only jobs the journal cannot vouch for are read)
+    const indexStartTime = Date.now();
+    try {
+      bridge.journal = await JobJournal.open(bridge.bridgeDir);
+      registerJobJournal(bridge.journal);
+    } catch (err: any) {
+      console.warn(`[BridgeManager] Job journal unavailable: ${err.message}`);
+      bridge.journal = undefined;
+    }
+    try {
+      bridge.jobIndex = await JobIndex.build(executeDir, bridge.journal);
+      registerJobIndex(bridge.jobIndex);
+      bridge.jobIndex.watch();
+      bridge.journal?.reconcile(bridge.jobIndex.all());
+      console.log(`[BridgeManager] Indexed ${bridge.jobIndex.size} jobs in ${Date.now() - indexStartTime}ms`);
+    } catch (err: any) {
+      // Consumers fall back to walking the directory when no index is registered
+      console.warn(`[BridgeManager] Job index unavailable, using directory scans: ${err.message}`);
+      bridge.jobIndex = undefined;
+    }
+
     // 1. Start health heartbeat
     bridge.healthTimer = startHealthHeartbeat(bridge.hostJsonPath);
     console.log(`[BridgeManager] Started health heartbeat for ${bridge.bridgeDir}`);
@@ -170,6 +210,28 @@ class BridgeManager {
     const safetyScanTimer = this.startPeriodicSafetyScan(executeDir, bridge.bridgeId);
     this.safetyScanTimers.set(bridge.bridgeDir, safetyScanTimer);
     console.log(`[BridgeManager] Started periodic safety scan for ${bridge.bridgeDir}`);
+
+    // 11. Start local socket transport (optional fast path; file queue stays authoritative)
+    const socketEnabled = vscode.workspace.getConfiguration('vscBridge').get<boolean>('socket.enabled', true);
+    if (socketEnabled && this.scriptExecutor) {
+      try {
+        bridge.socketServer = await BridgeSocketServer.start(
+          bridge.bridgeDir,
+          bridge.bridgeId,
+          this.scriptExecutor,
+          this.telemetry
+        );
+        await advertiseSocketEndpoint(bridge.hostJsonPath, bridge.socketServer.endpoint);
+        console.log(`[BridgeManager] Started socket transport for ${bridge.bridgeDir}`);
+      } catch (err: any) {
+        // Clients fall back to the file queue when host.json has no socket entry
+        console.warn(`[BridgeManager] Socket transport unavailable: ${err.message}`);
+        if (bridge.socketServer) {
+          bridge.socketServer.close().catch(() => {});
+          bridge.socketServer = undefined;
+        }
+      }
+    }
   }
 
   /**
@@ -188,12 +250,15 @@ class BridgeManager {
     let deleted = 0;
 
     try {
-      // Read all job directories
-      const entries = await vscode.workspace.fs.readDirectory(vscode.Uri.file(executeDir));
-
-      for (const [name, type] of entries) {
-        if (type !== vscode.FileType.Directory) continue;
-
+      // Read all job directories (only unclaimed ones when the index is live)
+      const index = getJobIndex(executeDir);
+      const names = index
+        ? index.inState('new').map(record => record.id)
+        : (await vscode.workspace.fs.readDirectory(vscode.Uri.file(executeDir)))
+          .filter(([, type]) => type === vscode.FileType.Directory)
+          .map(([name]) => name);
+
+      for (const name of names) {
         const jobDir = path.join(executeDir, name);
 
         // Check if this job is unclaimed
@@ -207,6 +272,8 @@ class BridgeManager {
           // Delete the entire job directory
           try {
             await vscode.workspace.fs.delete(vscode.Uri.file(jobDir), { recursive: true });
+            noteJobRemoved(jobDir);
+            journalJobTransition(jobDir, 'delete');
             deleted++;
           } catch (err) {
             console.error(`[BridgeManager] Failed to delete unclaimed job ${name}:`, err);
@@ -240,11 +307,11 @@ class BridgeManager {
         if (!this.scriptExecutor) return;
 
         // Use scanner module (T018: Integration)
-        // inFlight is imported from processor.ts and reflects actual concurrent job count
+        // Queued jobs count as taken: launching more only grows the scheduler queue
         const unclaimedJobs = await scanForUnclaimedJobs(
           executeDir,
-          inFlight,
-          MAX_CONCURRENT,
+          jobScheduler.runningCount + jobScheduler.queuedCount,
+          jobScheduler.capacity,
           fs
         );
 
@@ -292,6 +359,7 @@ class BridgeManager {
       const jobId = path.basename(jobDir);
 
       console.log(`[BridgeManager] Command detected (create/change): ${jobId}`);
+      noteJobMarker(jobDir, 'command.json');
 
       // Try to claim the job (idempotent - safe to call multiple times)
       if (!claimJobAtomic(jobDir, bridge.bridgeId)) {
@@ -381,6 +449,21 @@ class BridgeManager {
       if (bridge.watcher) {
         bridge.watcher.dispose();
       }
+      if (bridge.jobIndex) {
+        unregisterJobIndex(bridge.jobIndex);
+        bridge.jobIndex = undefined;
+      }
+      if (bridge.journal) {
+        unregisterJobJournal(bridge.journal);
+        bridge.journal = undefined;
+      }
+      if (bridge.socketServer) {
+        const hostJsonPath = bridge.hostJsonPath;
+        bridge.socketServer.close()
+          .then(() => advertiseSocketEndpoint(hostJsonPath, undefined))
+          .catch(() => {});
+        bridge.socketServer = undefined;
+      }
     }
     this.bridges.clear();
   }
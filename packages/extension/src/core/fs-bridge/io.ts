@@ -8,6 +8,7 @@
 
 import * as fs from 'fs';
 import * as path from 'path';
+import * as zlib from 'zlib';
 import { promises as fsPromises } from 'fs';
 
 /**
@@ -31,8 +32,8 @@ export function writeJsonAtomic(filePath: string, data: unknown): void {
 
   const fd = fs.openSync(tmp, 'w');
   try {
-    // Write and flush data
-    const json = JSON.stringify(data, null, 2);
+    // Write and flush data (compact: bridge files are read by programs, not people)
+    const json = JSON.stringify(data);
     fs.writeFileSync(fd, json, 'utf8');
 
     // Force flush to disk (not needed on Windows, critical on POSIX)
@@ -67,16 +68,21 @@ export function writeJsonAtomic(filePath: string, data: unknown): void {
  * Write JSON data atomically (async version)
  */
 export async function writeJsonAtomicAsync(filePath: string, data: unknown): Promise<void> {
+  await writeFileAtomicAsync(filePath, JSON.stringify(data));
+}
+
+/**
+ * Write already-serialized contents atomically (temp file, fsync, rename)
+ */
+export async function writeFileAtomicAsync(filePath: string, contents: string): Promise<void> {
   const dir = path.dirname(filePath);
   const base = path.basename(filePath);
   const tmp = path.join(dir, `.${base}.${process.pid}.${Date.now()}.tmp`);
 
-  const json = JSON.stringify(data, null, 2);
-
   // Write to temp file
   const handle = await fsPromises.open(tmp, 'w');
   try {
-    await handle.writeFile(json, 'utf8');
+    await handle.writeFile(contents, 'utf8');
 
     // Force flush on POSIX systems
     if (process.platform !== 'win32') {
@@ -111,6 +117,63 @@ export async function writeJsonAtomicAsync(filePath: string, data: unknown): Pro
   }
 }
 
+/**
+ * Write a file produced piece by piece, atomically (temp file + rename)
+ *
+ * `next` is called until it returns undefined; each piece is written with
+ * backpressure, so only about one piece is held in memory at a time. With
+ * `gzip` the output is compressed on the way to disk (fastest level).
+ *
+ * Unlike writeJsonAtomicAsync() the file is not fsynced: it is a bulk side
+ * file whose reader only looks at it after a separately (and durably)
+ * written marker references it.
+ *
+ * @returns Bytes written to disk
+ */
+export async function writeChunksAtomicAsync(
+  filePath: string,
+  next: () => string | undefined,
+  options: { gzip?: boolean } = {}
+): Promise<number> {
+  const dir = path.dirname(filePath);
+  const base = path.basename(filePath);
+  const tmp = path.join(dir, `.${base}.${process.pid}.${Date.now()}.tmp`);
+
+  const file = fs.createWriteStream(tmp);
+  const gzip = options.gzip ? zlib.createGzip({ level: zlib.constants.Z_BEST_SPEED }) : undefined;
+  const sink: NodeJS.WritableStream = gzip ?? file;
+  gzip?.pipe(file);
+
+  const finished = new Promise<void>((resolve, reject) => {
+    file.once('close', resolve);
+    file.once('error', reject);
+    gzip?.once('error', reject);
+  });
+  // Errors surface through the awaits below
+  finished.catch(() => {});
+
+  try {
+    let piece: string | undefined;
+    while ((piece = next()) !== undefined) {
+      if (!sink.write(piece, 'utf8')) {
+        await new Promise<void>((resolve, reject) => {
+          sink.once('drain', resolve);
+          finished.catch(reject);
+        });
+      }
+    }
+    sink.end();
+    await finished;
+  } catch (err) {
+    file.destroy();
+    await fsPromises.unlink(tmp).catch(() => {});
+    throw err;
+  }
+
+  await fsPromises.rename(tmp, filePath);
+  return file.bytesWritten;
+}
+
 /**
  * Read JSON file safely with retry logic
  *
@@ -0,0 +1,468 @@
+/**
+ * @file job-index.ts
+ * @brief In-memory job state index for the execute directory
+ *
+ * The safety scan, GC, stats, crash detection, stale-claim recovery and the
+ * startup cleaners all need the same facts about every job directory: which
+ * markers exist (command.json, claimed.json, done, dlq, keep) and a couple of
+ * timestamps. Walking execute/ for each of them costs O(jobs × markers)
+ * syscalls, every few seconds, for thousands of retained job dirs.
+ *
+ * JobIndex builds that picture once at startup (one readdir of execute/ plus
+ * one readdir + stat per job the bridge journal cannot vouch for), then keeps
+ * it current from:
+ * - In-process writes: claim, done, DLQ, keep and deletions call
+ *   noteJobMarker() / noteJobRemoved(), which find the registered index
+ * - fs.watch on execute/ for job dirs created or removed by clients
+ * - reconcile(): a single readdir of execute/ that picks up anything the
+ *   watcher missed (run by the periodic safety scan)
+ *
+ * Consumers look up the live index with getJobIndex(executeDir). When none is
+ * registered (unit tests, ad-hoc calls) they fall back to walking the tree.
+ */
+
+import * as fs from 'fs';
+import * as path from 'path';
+import { promises as fsPromises } from 'fs';
+import type { JobJournal } from './journal';
+
+/**
+ * Marker files that define a job's state
+ */
+export type JobMarker = 'command.json' | 'claimed.json' | 'done' | 'dlq' | 'keep';
+
+/**
+ * Lifecycle state derived from markers
+ * - pending: directory exists but command.json has not landed (or never will: orphan)
+ * - new: command.json present, unclaimed
+ * - claimed: being processed (or crashed mid-flight)
+ * - done: completed (response/error written)
+ * - dlq: quarantined
+ */
+export type JobState = 'pending' | 'new' | 'claimed' | 'done' | 'dlq';
+
+/**
+ * Indexed facts about one job directory
+ */
+export interface JobRecord {
+  /** Job ID (directory name) */
+  id: string;
+
+  /** Absolute job directory path */
+  dir: string;
+
+  hasCommand: boolean;
+  claimed: boolean;
+  done: boolean;
+  dlq: boolean;
+  keep: boolean;
+
+  /** Job directory mtime (ms) when indexed, bumped on in-process marker writes */
+  mtimeMs: number;
+
+  /** done marker mtime (ms), if done */
+  doneMs?: number;
+}
+
+/**
+ * Derive lifecycle state from a record's markers
+ */
+export function jobState(record: JobRecord): JobState {
+  if (record.dlq) return 'dlq';
+  if (record.done) return 'done';
+  if (record.claimed) return 'claimed';
+  if (record.hasCommand) return 'new';
+  return 'pending';
+}
+
+/**
+ * Number of job directories read concurrently while building
+ */
+const BUILD_CONCURRENCY = 64;
+
+/**
+ * Live job indexes keyed by resolved execute directory
+ */
+const registry = new Map<string, JobIndex>();
+
+/**
+ * Job state index for one execute directory
+ */
+export class JobIndex {
+  private records = new Map<string, JobRecord>();
+  private newJobs = new Set<string>();
+  private watcher: fs.FSWatcher | null = null;
+  private refreshQueue = new Set<string>();
+  private refreshTimer: NodeJS.Timeout | null = null;
+
+  /** Bumped on every in-process update so refresh() can detect races */
+  private generation = 0;
+
+  private constructor(public readonly executeDir: string) {}
+
+  /**
+   * Build an index from the current contents of executeDir
+   *
+   * Jobs the journal records as finished (complete, failed or DLQ) are taken
+   * from it as-is; only the rest (new, in flight, unknown) are read from disk.
+   */
+  static async build(executeDir: string, journal?: JobJournal): Promise<JobIndex> {
+    const index = new JobIndex(path.resolve(executeDir));
+    const names = await index.listJobDirs();
+
+    const toRead: string[] = [];
+    for (const name of names) {
+      const state = journal?.get(name);
+      if (state && (state.outcome || state.dlq)) {
+        const mtimeMs = Math.max(state.outcome?.t ?? 0, state.dlq?.t ?? 0, state.keep?.t ?? 0);
+        index.records.set(name, {
+          ...index.emptyRecord(name, mtimeMs),
+          hasCommand: true,
+          claimed: true,
+          done: state.outcome !== undefined,
+          doneMs: state.outcome?.t,
+          dlq: state.dlq !== undefined,
+          keep: state.keep !== undefined
+        });
+      } else {
+        toRead.push(name);
+      }
+    }
+
+    for (let i = 0; i < toRead.length; i += BUILD_CONCURRENCY) {
+      await Promise.all(toRead.slice(i, i + BUILD_CONCURRENCY).map(name => index.refresh(name)));
+    }
+
+    return index;
+  }
+
+  /**
+   * Number of indexed job directories
+   */
+  get size(): number {
+    return this.records.size;
+  }
+
+  get(id: string): JobRecord | undefined {
+    return this.records.get(id);
+  }
+
+  /**
+   * All indexed jobs (snapshot, safe to mutate the index while iterating)
+   */
+  all(): JobRecord[] {
+    return Array.from(this.records.values());
+  }
+
+  /**
+   * Job directories with command.json that are unclaimed, not done and not in DLQ
+   */
+  unclaimedJobDirs(): string[] {
+    return Array.from(this.newJobs, id => path.join(this.executeDir, id));
+  }
+
+  /**
+   * Jobs currently in the given state
+   */
+  inState(state: JobState): JobRecord[] {
+    if (state === 'new') {
+      return Array.from(this.newJobs, id => this.records.get(id)!);
+    }
+    return this.all().filter(record => jobState(record) === state);
+  }
+
+  /**
+   * Record that a marker was created (or removed) by this process
+   */
+  noteMarker(id: string, marker: JobMarker, present = true): void {
+    let record = this.records.get(id);
+    if (!record) {
+      if (!present) return;
+      record = this.emptyRecord(id, Date.now());
+      this.records.set(id, record);
+    }
+
+    const now = Date.now();
+    switch (marker) {
+      case 'command.json': record.hasCommand = present; break;
+      case 'claimed.json': record.claimed = present; break;
+      case 'dlq': record.dlq = present; break;
+      case 'keep': record.keep = present; break;
+      case 'done':
+        record.done = present;
+        record.doneMs = present ? now : undefined;
+        break;
+    }
+    record.mtimeMs = now;
+    this.generation++;
+    this.updateMembership(record);
+  }
+
+  /**
+   * Drop a job that was deleted
+   */
+  remove(id: string): void {
+    this.records.delete(id);
+    this.newJobs.delete(id);
+    this.generation++;
+  }
+
+  /**
+   * Re-read one job directory from disk (removes it if gone)
+   *
+   * If this process updates the index while the read is in flight (e.g. the
+   * job is claimed between readdir and now), the read is retried so a stale
+   * snapshot never overwrites newer in-process state.
+   */
+  async refresh(id: string): Promise<JobRecord | undefined> {
+    for (let attempt = 0; attempt < 3; attempt++) {
+      const startGeneration = this.generation;
+      const record = await this.readRecord(id);
+      if (this.generation !== startGeneration && attempt < 2) {
+        continue;
+      }
+
+      if (record) {
+        this.records.set(id, record);
+        this.updateMembership(record);
+      } else {
+        this.records.delete(id);
+        this.newJobs.delete(id);
+      }
+      return record;
+    }
+    return this.records.get(id);
+  }
+
+  /**
+   * Catch up with changes the watcher missed
+   *
+   * One readdir of execute/: unknown directories are indexed, vanished ones
+   * dropped, and jobs still waiting for command.json are re-read (the
+   * command can land after the directory was first seen).
+   */
+  async reconcile(): Promise<void> {
+    const started = Date.now();
+    const names = await this.listJobDirs();
+    const onDisk = new Set(names);
+
+    for (const record of this.all()) {
+      // Records touched after the listing started may be newer than it
+      if (!onDisk.has(record.id) && record.mtimeMs < started) {
+        this.remove(record.id);
+      }
+    }
+
+    const stale = names.filter(id => {
+      const record = this.records.get(id);
+      return !record || !record.hasCommand;
+    });
+    for (let i = 0; i < stale.length; i += BUILD_CONCURRENCY) {
+      await Promise.all(stale.slice(i, i + BUILD_CONCURRENCY).map(id => this.refresh(id)));
+    }
+  }
+
+  /**
+   * Watch execute/ for job directories created or removed by other processes
+   */
+  watch(): void {
+    if (this.watcher) return;
+
+    try {
+      this.watcher = fs.watch(this.executeDir, (_event, filename) => {
+        if (!filename) {
+          // Platform did not say what changed; the next reconcile() catches up
+          return;
+        }
+        this.scheduleRefresh(filename.toString());
+      });
+      this.watcher.on('error', err => {
+        console.warn(`[JobIndex] Watcher error, relying on reconcile: ${err.message}`);
+        this.unwatch();
+      });
+    } catch (err: any) {
+      console.warn(`[JobIndex] Cannot watch ${this.executeDir}, relying on reconcile: ${err.message}`);
+      this.watcher = null;
+    }
+  }
+
+  /**
+   * Stop watching and cancel pending refreshes
+   */
+  unwatch(): void {
+    if (this.watcher) {
+      try {
+        this.watcher.close();
+      } catch {
+        // Already closed
+      }
+      this.watcher = null;
+    }
+    if (this.refreshTimer) {
+      clearTimeout(this.refreshTimer);
+      this.refreshTimer = null;
+    }
+    this.refreshQueue.clear();
+  }
+
+  /**
+   * Counts per state (no filesystem access)
+   */
+  counts(): Record<JobState, number> & { total: number; kept: number } {
+    const counts = { total: 0, kept: 0, pending: 0, new: 0, claimed: 0, done: 0, dlq: 0 };
+    for (const record of this.records.values()) {
+      counts.total++;
+      counts[jobState(record)]++;
+      if (record.keep) counts.kept++;
+    }
+    return counts;
+  }
+
+  private scheduleRefresh(id: string): void {
+    this.refreshQueue.add(id);
+    if (this.refreshTimer) return;
+
+    // Coalesce bursts (mkdir + command write + claim all land within ms)
+    this.refreshTimer = setTimeout(() => {
+      this.refreshTimer = null;
+      const ids = Array.from(this.refreshQueue);
+      this.refreshQueue.clear();
+      for (const queued of ids) {
+        this.refresh(queued).catch(() => {});
+      }
+    }, 20);
+  }
+
+  private async readRecord(id: string): Promise<JobRecord | undefined> {
+    const dir = path.join(this.executeDir, id);
+
+    let names: string[];
+    let dirStat: fs.Stats;
+    try {
+      [names, dirStat] = await Promise.all([fsPromises.readdir(dir), fsPromises.stat(dir)]);
+    } catch {
+      return undefined;
+    }
+    if (!dirStat.isDirectory()) {
+      return undefined;
+    }
+
+    const present = new Set(names);
+    const record = this.emptyRecord(id, dirStat.mtimeMs);
+    record.hasCommand = present.has('command.json');
+    record.claimed = present.has('claimed.json');
+    record.dlq = present.has('dlq');
+    record.keep = present.has('keep');
+    record.done = present.has('done');
+
+    if (record.done) {
+      try {
+        record.doneMs = (await fsPromises.stat(path.join(dir, 'done'))).mtimeMs;
+      } catch {
+        record.doneMs = dirStat.mtimeMs;
+      }
+    }
+
+    return record;
+  }
+
+  private async listJobDirs(): Promise<string[]> {
+    try {
+      const entries = await fsPromises.readdir(this.executeDir, { withFileTypes: true });
+      return entries.filter(entry => entry.isDirectory()).map(entry => entry.name);
+    } catch (err: any) {
+      if (err.code === 'ENOENT') return [];
+      throw err;
+    }
+  }
+
+  private emptyRecord(id: string, mtimeMs: number): JobRecord {
+    return {
+      id,
+      dir: path.join(this.executeDir, id),
+      hasCommand: false,
+      claimed: false,
+      done: false,
+      dlq: false,
+      keep: false,
+      mtimeMs
+    };
+  }
+
+  private updateMembership(record: JobRecord): void {
+    if (jobState(record) === 'new') {
+      this.newJobs.add(record.id);
+    } else {
+      this.newJobs.delete(record.id);
+    }
+  }
+}
+
+/**
+ * Make an index the live source of truth for its execute directory
+ */
+export function registerJobIndex(index: JobIndex): void {
+  registry.set(index.executeDir, index);
+}
+
+/**
+ * Stop using an index (also stops its watcher)
+ */
+export function unregisterJobIndex(index: JobIndex): void {
+  index.unwatch();
+  if (registry.get(index.executeDir) === index) {
+    registry.delete(index.executeDir);
+  }
+}
+
+/**
+ * Live index for an execute directory, if one is registered
+ */
+export function getJobIndex(executeDir: string): JobIndex | undefined {
+  return registry.size === 0 ? undefined : registry.get(path.resolve(executeDir));
+}
+
+/**
+ * Tell the live index (if any) that this process wrote or removed a marker
+ */
+export function noteJobMarker(jobDir: string, marker: JobMarker, present = true): void {
+  if (registry.size === 0) return;
+  const resolved = path.resolve(jobDir);
+  registry.get(path.dirname(resolved))?.noteMarker(path.basename(resolved), marker, present);
+}
+
+/**
+ * Tell the live index (if any) that this process deleted a job directory
+ */
+export function noteJobRemoved(jobDir: string): void {
+  if (registry.size === 0) return;
+  const resolved = path.resolve(jobDir);
+  registry.get(path.dirname(resolved))?.remove(path.basename(resolved));
+}
+
+/**
+ * Job directory names worth examining in executeDir
+ *
+ * With a live index, only jobs whose indexed record matches the predicate are
+ * returned (callers still verify on disk before acting). Without one, every
+ * directory is returned, matching the original readdir walk.
+ *
+ * @returns Candidate names plus the total number of job directories
+ */
+export async function listJobCandidates(
+  executeDir: string,
+  predicate: (record: JobRecord) => boolean
+): Promise<{ names: string[]; total: number }> {
+  const index = getJobIndex(executeDir);
+  if (index) {
+    const records = index.all();
+    return {
+      names: records.filter(predicate).map(record => record.id),
+      total: records.length
+    };
+  }
+
+  const entries = await fsPromises.readdir(executeDir, { withFileTypes: true });
+  const names = entries.filter(entry => entry.isDirectory()).map(entry => entry.name);
+  return { names, total: names.length };
+}
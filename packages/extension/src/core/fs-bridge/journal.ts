@@ -0,0 +1,385 @@
+/**
+ * @file journal.ts
+ * @brief Append-only job journal for the bridge
+ *
+ * Each owned bridge keeps `.vsc-bridge/journal.ndjson`: one JSON line per job
+ * lifecycle transition this extension host made (claim, complete, fail, DLQ,
+ * keep, delete) with a timestamp and the owner PID. Replaying it tells the
+ * bridge what every job it ever touched looks like without probing marker
+ * files, so:
+ * - JobIndex.build() only reads job directories the journal cannot vouch for
+ *   (new, unknown, or last seen "claimed")
+ * - GC deletes in the journal's age order and stops at the first job that is
+ *   too young, without listing execute/
+ *
+ * The journal is compacted (rewritten with only the entries of jobs that
+ * still exist) at startup and on every GC pass, never from append(), so
+ * claim/done transitions only ever cost one small write. A truncated last
+ * line from a crash mid-append is ignored.
+ *
+ * Activation cleanup keeps the journal and execute/ (see extension.ts), so
+ * the startup replay covers jobs from the previous extension host.
+ *
+ * The journal is advisory: marker files stay authoritative, and callers
+ * verify on disk before acting on a job.
+ */
+
+import * as fs from 'fs';
+import * as path from 'path';
+import { promises as fsPromises } from 'fs';
+import type { JobRecord } from './job-index';
+
+/**
+ * Journal file name inside the bridge directory
+ */
+export const JOURNAL_FILE = 'journal.ndjson';
+
+/**
+ * Lifecycle transitions recorded in the journal
+ */
+export type JournalOp = 'claim' | 'complete' | 'fail' | 'dlq' | 'keep' | 'delete';
+
+/**
+ * One journal line
+ */
+export interface JournalEntry {
+  /** Epoch milliseconds */
+  t: number;
+  op: JournalOp;
+  /** Job ID (directory name) */
+  id: string;
+  /** PID of the extension host that made the transition (0 = adopted from disk) */
+  pid: number;
+}
+
+/**
+ * Replayed state of one job
+ */
+export interface JournalJobState {
+  id: string;
+  /** Latest claim */
+  claim?: JournalEntry;
+  /** Outcome of the latest claim (complete or fail) */
+  outcome?: JournalEntry;
+  dlq?: JournalEntry;
+  keep?: JournalEntry;
+}
+
+/**
+ * Live journals keyed by resolved execute directory
+ */
+const registry = new Map<string, JobJournal>();
+
+/**
+ * Last lifecycle transition of a job ('claim', 'complete' or 'fail')
+ */
+export function lastTransition(state: JournalJobState): 'claim' | 'complete' | 'fail' | undefined {
+  if (state.outcome) return state.outcome.op as 'complete' | 'fail';
+  return state.claim ? 'claim' : undefined;
+}
+
+/**
+ * When a job became terminal (first of outcome and DLQ), if it has
+ */
+export function terminalAt(state: JournalJobState): number | undefined {
+  const times = [state.outcome?.t, state.dlq?.t].filter((t): t is number => t !== undefined);
+  return times.length > 0 ? Math.min(...times) : undefined;
+}
+
+/**
+ * Append-only journal for one bridge
+ */
+export class JobJournal {
+  private jobs = new Map<string, JournalJobState>();
+
+  /** Terminal jobs in age order (Map iteration follows insertion order) */
+  private byAge = new Map<string, number>();
+
+  private fd: number | null = null;
+  private closed = false;
+  private entriesWritten = 0;
+
+  private constructor(
+    public readonly filePath: string,
+    public readonly executeDir: string
+  ) {}
+
+  /**
+   * Open (or create) the journal for a bridge directory and replay it
+   */
+  static async open(bridgeDir: string): Promise<JobJournal> {
+    const journal = new JobJournal(
+      path.join(bridgeDir, JOURNAL_FILE),
+      path.resolve(bridgeDir, 'execute')
+    );
+
+    let text = '';
+    try {
+      text = await fsPromises.readFile(journal.filePath, 'utf8');
+    } catch (err: any) {
+      if (err.code !== 'ENOENT') throw err;
+    }
+
+    for (const line of text.split('\n')) {
+      if (!line) continue;
+      try {
+        journal.apply(JSON.parse(line) as JournalEntry);
+        journal.entriesWritten++;
+      } catch {
+        // Truncated or corrupt line (crash mid-append); the disk check covers it
+      }
+    }
+
+    journal.rebuildAgeOrder();
+    journal.fd = fs.openSync(journal.filePath, 'a');
+    return journal;
+  }
+
+  /**
+   * Number of jobs with journal state
+   */
+  get size(): number {
+    return this.jobs.size;
+  }
+
+  get(id: string): JournalJobState | undefined {
+    return this.jobs.get(id);
+  }
+
+  /**
+   * Record a transition (synchronous so entries keep the order they happened in)
+   */
+  append(id: string, op: JournalOp): void {
+    const entry: JournalEntry = { t: Date.now(), op, id, pid: process.pid };
+    this.apply(entry);
+
+    if (this.fd === null) return;
+    try {
+      fs.writeSync(this.fd, JSON.stringify(entry) + '\n');
+      this.entriesWritten++;
+    } catch (err: any) {
+      // Journal is advisory: a lost entry only means an extra disk check later
+      console.warn(`[Journal] Failed to append ${op} for ${id}: ${err.message}`);
+    }
+  }
+
+  /**
+   * Lines in the journal file, including superseded and deleted jobs' entries
+   */
+  get entryCount(): number {
+    return this.entriesWritten;
+  }
+
+  /**
+   * Terminal jobs past retention, oldest first
+   *
+   * Walks the age order and stops at the first job younger than maxAgeMs, so
+   * the cost is proportional to what is expired (plus retained DLQ/kept jobs)
+   * rather than to every job.
+   */
+  expired(maxAgeMs: number, dlqRetentionMs: number, now = Date.now()): string[] {
+    const ids: string[] = [];
+    for (const [id, t] of this.byAge) {
+      const age = now - t;
+      if (age <= maxAgeMs) break;
+
+      const state = this.jobs.get(id)!;
+      if (state.keep) continue;
+      if (state.dlq && age <= dlqRetentionMs) continue;
+      ids.push(id);
+    }
+    return ids;
+  }
+
+  /**
+   * Jobs whose last transition is a claim (in progress, or crashed mid-flight)
+   */
+  claimed(): JournalJobState[] {
+    return Array.from(this.jobs.values()).filter(state => lastTransition(state) === 'claim' && !state.dlq);
+  }
+
+  /**
+   * Align the journal with the job directories that actually exist
+   *
+   * Jobs unknown to the journal (created before it existed, or whose entries
+   * were lost) are adopted from their indexed markers with PID 0; journal
+   * entries for directories that are gone are dropped. Ends with a compaction.
+   */
+  reconcile(records: JobRecord[]): void {
+    const onDisk = new Set<string>();
+    for (const record of records) {
+      onDisk.add(record.id);
+
+      const known = this.jobs.get(record.id);
+      if (known) {
+        // Finished after the last entry was written (crash between done and append)
+        if (lastTransition(known) === 'claim' && record.done) {
+          this.apply({ t: record.doneMs ?? record.mtimeMs, op: 'complete', id: record.id, pid: 0 });
+        }
+        continue;
+      }
+      if (!record.claimed) continue;
+
+      const adopt = (op: JournalOp, t: number) => this.apply({ t, op, id: record.id, pid: 0 });
+      adopt('claim', record.mtimeMs);
+      if (record.done) adopt('complete', record.doneMs ?? record.mtimeMs);
+      if (record.dlq) adopt('dlq', record.doneMs ?? record.mtimeMs);
+      if (record.keep) adopt('keep', record.mtimeMs);
+    }
+
+    for (const id of Array.from(this.jobs.keys())) {
+      if (!onDisk.has(id)) {
+        this.forget(id);
+      }
+    }
+
+    this.compact();
+  }
+
+  /**
+   * Rewrite the journal with only the entries of live jobs
+   *
+   * Each job's entries are written together (claim, outcome, DLQ, keep), jobs
+   * in flight first and finished jobs in age order. Called from startup
+   * reconciliation and the GC timer, off the claim/done path.
+   */
+  compact(): void {
+    if (this.closed) return;
+
+    const states = Array.from(this.jobs.values());
+    const age = (state: JournalJobState) => terminalAt(state) ?? 0;
+    states.sort((a, b) => age(a) - age(b));
+
+    const entries: JournalEntry[] = [];
+    for (const state of states) {
+      for (const entry of [state.claim, state.outcome, state.dlq, state.keep]) {
+        if (entry) entries.push(entry);
+      }
+    }
+
+    const tmp = `${this.filePath}.${process.pid}.tmp`;
+    try {
+      fs.writeFileSync(tmp, entries.map(entry => JSON.stringify(entry) + '\n').join(''), 'utf8');
+      if (this.fd !== null) {
+        fs.closeSync(this.fd);
+        this.fd = null;
+      }
+      fs.renameSync(tmp, this.filePath);
+    } catch (err: any) {
+      console.warn(`[Journal] Compaction failed: ${err.message}`);
+      fs.rmSync(tmp, { force: true });
+    } finally {
+      if (this.fd === null) {
+        try {
+          this.fd = fs.openSync(this.filePath, 'a');
+        } catch (err: any) {
+          console.warn(`[Journal] Cannot reopen ${this.filePath}, journaling disabled: ${err.message}`);
+        }
+      }
+    }
+
+    this.entriesWritten = entries.length;
+    this.rebuildAgeOrder();
+  }
+
+  /**
+   * Close the journal file
+   */
+  close(): void {
+    this.closed = true;
+    if (this.fd !== null) {
+      try {
+        fs.closeSync(this.fd);
+      } catch {
+        // Already closed
+      }
+      this.fd = null;
+    }
+  }
+
+  private apply(entry: JournalEntry): void {
+    if (entry.op === 'delete') {
+      this.forget(entry.id);
+      return;
+    }
+
+    let state = this.jobs.get(entry.id);
+    if (!state) {
+      state = { id: entry.id };
+      this.jobs.set(entry.id, state);
+    }
+
+    switch (entry.op) {
+      case 'claim':
+        // A reclaim starts a new attempt
+        state.claim = entry;
+        state.outcome = undefined;
+        break;
+      case 'complete':
+      case 'fail':
+        state.outcome = entry;
+        break;
+      case 'dlq':
+        state.dlq = entry;
+        break;
+      case 'keep':
+        state.keep = entry;
+        break;
+    }
+
+    const terminal = terminalAt(state);
+    if (terminal === undefined) {
+      this.byAge.delete(entry.id);
+    } else if (!this.byAge.has(entry.id)) {
+      this.byAge.set(entry.id, terminal);
+    }
+  }
+
+  private forget(id: string): void {
+    this.jobs.delete(id);
+    this.byAge.delete(id);
+  }
+
+  private rebuildAgeOrder(): void {
+    const terminal: Array<[string, number]> = [];
+    for (const state of this.jobs.values()) {
+      const t = terminalAt(state);
+      if (t !== undefined) terminal.push([state.id, t]);
+    }
+    terminal.sort((a, b) => a[1] - b[1]);
+    this.byAge = new Map(terminal);
+  }
+}
+
+/**
+ * Make a journal the live one for its bridge
+ */
+export function registerJobJournal(journal: JobJournal): void {
+  registry.set(journal.executeDir, journal);
+}
+
+/**
+ * Stop using a journal (also closes its file)
+ */
+export function unregisterJobJournal(journal: JobJournal): void {
+  journal.close();
+  if (registry.get(journal.executeDir) === journal) {
+    registry.delete(journal.executeDir);
+  }
+}
+
+/**
+ * Live journal for an execute directory, if one is registered
+ */
+export function getJobJournal(executeDir: string): JobJournal | undefined {
+  return registry.size === 0 ? undefined : registry.get(path.resolve(executeDir));
+}
+
+/**
+ * Record a transition in the live journal (if any) for a job directory
+ */
+export function journalJobTransition(jobDir: string, op: JournalOp): void {
+  if (registry.size === 0) return;
+  const resolved = path.resolve(jobDir);
+  registry.get(path.dirname(resolved))?.append(path.basename(resolved), op);
+}
@@ -0,0 +1,227 @@
+/**
+ * @file json-stream.ts
+ * @brief Incremental JSON serialization for large job results
+ *
+ * JSON.stringify() builds the whole document as one string. For results of
+ * tens of megabytes (variable dumps, log exports) that string, the measuring
+ * copy and the pretty-printed copy written to disk dominate the extension
+ * host's memory. JsonChunker produces the same compact JSON a piece at a time
+ * so it can be written out while it is generated; peak memory beyond the
+ * result object itself stays around one chunk.
+ */
+
+/**
+ * Target size of one serialized chunk (characters)
+ */
+export const JSON_CHUNK_CHARS = 64 * 1024;
+
+type Frame =
+  | { kind: 'array'; value: unknown[]; index: number }
+  | { kind: 'object'; value: Record<string, unknown>; keys: string[]; index: number; written: number };
+
+/**
+ * Apply toJSON() and unwrap boxed primitives, as JSON.stringify() does
+ */
+function normalize(value: unknown, key: string): unknown {
+  if (value !== null && typeof value === 'object' && typeof (value as any).toJSON === 'function') {
+    value = (value as any).toJSON(key);
+  }
+  if (value instanceof Number || value instanceof String || value instanceof Boolean) {
+    value = value.valueOf();
+  }
+  return value;
+}
+
+/**
+ * Values JSON.stringify() omits from objects (and writes as null in arrays)
+ */
+function isSkipped(value: unknown): boolean {
+  return value === undefined || typeof value === 'function' || typeof value === 'symbol';
+}
+
+/**
+ * True for an array or object with no nested objects (serialized in one step)
+ */
+function isFlat(container: object): boolean {
+  if (Array.isArray(container)) {
+    for (let i = 0; i < container.length; i++) {
+      const item = container[i];
+      if (item !== null && typeof item === 'object') return false;
+    }
+    return true;
+  }
+  for (const key of Object.keys(container)) {
+    const item = (container as Record<string, unknown>)[key];
+    if (item !== null && typeof item === 'object') return false;
+  }
+  return true;
+}
+
+/**
+ * Resumable serializer producing compact JSON in chunks
+ *
+ * Output is identical to JSON.stringify(value) (no replacer, no indent);
+ * circular structures and BigInt throw the same TypeErrors.
+ *
+ * @example
+ * const chunker = new JsonChunker(result);
+ * while (!chunker.done) {
+ *   await write(chunker.next());
+ * }
+ */
+export class JsonChunker {
+  private stack: Frame[] = [];
+  private ancestors = new Set<object>();
+  private started = false;
+
+  constructor(private readonly root: unknown) {}
+
+  /**
+   * True once the whole value has been produced
+   */
+  get done(): boolean {
+    return this.started && this.stack.length === 0;
+  }
+
+  /**
+   * Produce the next piece of output (about `chunkChars` characters;
+   * one large string value may exceed it)
+   */
+  next(chunkChars = JSON_CHUNK_CHARS): string {
+    const parts: string[] = [];
+    let size = 0;
+    const emit = (text: string) => {
+      parts.push(text);
+      size += text.length;
+    };
+
+    if (!this.started) {
+      this.started = true;
+      const root = normalize(this.root, '');
+      this.open(isSkipped(root) ? null : root, emit);
+    }
+
+    while (this.stack.length > 0 && size < chunkChars) {
+      const frame = this.stack[this.stack.length - 1];
+
+      if (frame.kind === 'array') {
+        if (frame.index >= frame.value.length) {
+          emit(']');
+          this.close(frame.value);
+          continue;
+        }
+        const index = frame.index++;
+        const item = normalize(frame.value[index], String(index));
+        if (index > 0) emit(',');
+        this.open(isSkipped(item) ? null : item, emit);
+      } else {
+        if (frame.index >= frame.keys.length) {
+          emit('}');
+          this.close(frame.value);
+          continue;
+        }
+        const key = frame.keys[frame.index++];
+        const item = normalize(frame.value[key], key);
+        if (isSkipped(item)) continue;
+        emit((frame.written++ > 0 ? ',' : '') + JSON.stringify(key) + ':');
+        this.open(item, emit);
+      }
+    }
+
+    return parts.join('');
+  }
+
+  /**
+   * Write a scalar, or the opening bracket of a container and push its frame
+   */
+  private open(value: unknown, emit: (text: string) => void): void {
+    if (value === null) {
+      emit('null');
+      return;
+    }
+    switch (typeof value) {
+      case 'string':
+        emit(JSON.stringify(value));
+        return;
+      case 'number':
+        emit(Number.isFinite(value) ? String(value) : 'null');
+        return;
+      case 'boolean':
+        emit(value ? 'true' : 'false');
+        return;
+      case 'bigint':
+        throw new TypeError('Do not know how to serialize a BigInt');
+    }
+
+    const container = value as object;
+
+    // Leaf containers (rows, small records) are the bulk of large results;
+    // JSON.stringify() is much faster than walking them here
+    if (isFlat(container)) {
+      emit(JSON.stringify(container));
+      return;
+    }
+
+    if (this.ancestors.has(container)) {
+      throw new TypeError('Converting circular structure to JSON');
+    }
+    this.ancestors.add(container);
+
+    if (Array.isArray(container)) {
+      emit('[');
+      this.stack.push({ kind: 'array', value: container, index: 0 });
+    } else {
+      emit('{');
+      this.stack.push({
+        kind: 'object',
+        value: container as Record<string, unknown>,
+        keys: Object.keys(container),
+        index: 0,
+        written: 0
+      });
+    }
+  }
+
+  private close(container: object): void {
+    this.stack.pop();
+    this.ancestors.delete(container);
+  }
+}
+
+/**
+ * Serialize an array as NDJSON (one compact JSON value per line), in chunks
+ *
+ * Each element is produced by its own JsonChunker, so a reader can parse
+ * and release one line at a time.
+ */
+export class NdjsonChunker {
+  private index = 0;
+  private current?: JsonChunker;
+
+  constructor(private readonly items: unknown[]) {}
+
+  get done(): boolean {
+    return this.index >= this.items.length && !this.current;
+  }
+
+  next(chunkChars = JSON_CHUNK_CHARS): string {
+    const parts: string[] = [];
+    let size = 0;
+
+    while (size < chunkChars && !this.done) {
+      if (!this.current) {
+        this.current = new JsonChunker(this.items[this.index++]);
+      }
+      const text = this.current.next(chunkChars - size);
+      parts.push(text);
+      size += text.length;
+      if (this.current.done) {
+        parts.push('\n');
+        size++;
+        this.current = undefined;
+      }
+    }
+
+    return parts.join('');
+  }
+}
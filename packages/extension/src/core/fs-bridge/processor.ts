@@ -9,22 +9,49 @@ import {
   EventJson,
   ErrorCode,
   CancellationError,
+  LargeDataEncoding,
   ResponseMeta
 } from './types';
-import { writeJsonAtomic, writeJsonAtomicAsync } from './io';
+import { writeChunksAtomicAsync, writeFileAtomicAsync, writeJsonAtomic, writeJsonAtomicAsync } from './io';
+import { JsonChunker, NdjsonChunker } from './json-stream';
 import { writeDlqMarker } from './dlq';
+import { noteJobMarker } from './job-index';
+import { journalJobTransition } from './journal';
+import { JobScheduler, PriorityClass, SchedulerRejection, SchedulerTicket } from './scheduler';
 import { ITelemetry } from '../telemetry';
 
 /**
- * Maximum number of concurrent jobs
+ * Maximum number of concurrent jobs in the default (normal) priority class
  */
 export const MAX_CONCURRENT = 10;
 
 /**
- * Current number of in-flight jobs
+ * Current number of in-flight jobs (all priority classes)
  */
 export let inFlight = 0;
 
+/**
+ * Scheduler shared by the file queue and the socket transport
+ */
+export const jobScheduler = new JobScheduler({
+  limits: { normal: MAX_CONCURRENT },
+  onRunningChange: running => {
+    inFlight = running;
+  }
+});
+
+/**
+ * Maps a command to its priority class (installed by the extension from script metadata)
+ */
+let resolvePriority: (command: CommandJson) => PriorityClass = () => 'normal';
+
+/**
+ * Install the command → priority class mapping
+ */
+export function setPriorityResolver(resolver: (command: CommandJson) => PriorityClass): void {
+  resolvePriority = resolver;
+}
+
 /**
  * Failure timestamps for flood protection (rolling 60-second window)
  */
@@ -47,14 +74,29 @@ export function resetFloodProtection(): void {
  * Event writer for streaming events to NDJSON file
  */
 export class EventWriter {
-  private seq = 0;
+  protected seq = 0;
   private stream: fs.WriteStream | null = null;
-  private closed = false;
+  protected closed = false;
   private pendingWrites: Promise<void> = Promise.resolve();
   private lastError: Error | null = null;
+  private abortController = new AbortController();
 
   constructor(private eventPath: string) {}
 
+  /**
+   * Aborted when the job is cancelled, so long-running scripts can stop early
+   */
+  get signal(): AbortSignal {
+    return this.abortController.signal;
+  }
+
+  /**
+   * Mark the job cancelled (aborts signal)
+   */
+  cancel(): void {
+    this.abortController.abort();
+  }
+
   private ensureStream(): fs.WriteStream {
     if (!this.stream && !this.closed) {
       this.stream = fs.createWriteStream(this.eventPath, { flags: 'a' });
@@ -161,6 +203,13 @@ export class EventWriter {
     this.writeEvent('error', { text, data }).catch(() => {});
   }
 
+  /**
+   * Stream one result item (scripts returning results incrementally)
+   */
+  writeRecord(data: unknown): void {
+    this.writeEvent('record', { data }).catch(() => {});
+  }
+
   close(): Promise<void> {
     if (this.closed && !this.stream) {
       // Already closed, idempotent
@@ -194,6 +243,36 @@ export class EventWriter {
   }
 }
 
+/**
+ * Event writer that hands each event to a callback instead of a file
+ *
+ * Used by the socket transport, where events travel over the client
+ * connection rather than through events.ndjson.
+ */
+export class ForwardingEventWriter extends EventWriter {
+  constructor(private forward: (event: EventJson) => void) {
+    super('');
+  }
+
+  async writeEvent(type: EventJson['type'], data: Partial<EventJson>): Promise<void> {
+    if (this.closed) {
+      throw new Error('Cannot write to closed EventWriter');
+    }
+
+    this.forward({
+      ts: Date.now(),
+      seq: this.seq++,
+      type,
+      ...data
+    });
+  }
+
+  close(): Promise<void> {
+    this.closed = true;
+    return Promise.resolve();
+  }
+}
+
 /**
  * Check if bridge is flooded (10 failures in 60 seconds)
  * Returns flood status and retryAfter seconds if flooded
@@ -215,18 +294,31 @@ function isFlooded(): { flooded: boolean; retryAfter?: number } {
 }
 
 /**
- * Launch a job with capacity checking and counter management
+ * Result of admitJob(): a slot to run in, or the error envelope to deliver
+ */
+export type Admission =
+  | { ticket: SchedulerTicket; rejection?: undefined }
+  | { ticket?: undefined; rejection: ErrorJson };
+
+/**
+ * Admit a job against flood protection and the scheduler
  *
- * Checks if we're at capacity (MAX_CONCURRENT). If so, writes E_CAPACITY error
- * and returns immediately. Otherwise, increments counter, launches processCommand
- * in fire-and-forget mode, and ensures counter is decremented in finally block.
+ * Shared by the file queue (launchJob) and the socket transport. Flood checks
+ * and a free slot in the job's priority class are resolved synchronously (the
+ * in-flight counter is already incremented when admitJob() returns, before
+ * the promise settles); otherwise the job waits in the scheduler's queue. On
+ * success the caller MUST call releaseJob() with the ticket when the job
+ * finishes.
+ *
+ * @param command - Used to pick the priority class, client and wait deadline
+ * @param signal - Aborting removes a queued job (client cancellation)
  */
-export function launchJob(
-  jobDir: string,
-  bridgeId: string,
-  executor: (command: CommandJson, eventWriter: EventWriter) => Promise<any>,
-  telemetry?: ITelemetry
-): void {
+export function admitJob(
+  requestId: string,
+  telemetry?: ITelemetry,
+  command?: CommandJson,
+  signal?: AbortSignal
+): Promise<Admission> {
   // Check flood protection FIRST (before capacity)
   const floodCheck = isFlooded();
   if (floodCheck.flooded) {
@@ -251,7 +343,7 @@ export function launchJob(
     const errorEnvelope = createErrorEnvelope(
       ErrorCode.E_CIRCUIT_OPEN,
       `Bridge is flooded (10 failures in 60 seconds). Try again in ${floodCheck.retryAfter}s.`,
-      path.basename(jobDir),
+      requestId,
       Date.now()
     );
 
@@ -261,60 +353,125 @@ export function launchJob(
       retryAfter: floodCheck.retryAfter
     };
 
-    writeResponse(jobDir, errorEnvelope)
-      .then(() => writeDone(jobDir))
-      .catch(err => console.error(`[Processor] Failed to write flood error: ${err}`));
-
-    console.log(`[Processor] Job rejected (flood): ${path.basename(jobDir)}`);
-    return;
+    console.log(`[Processor] Job rejected (flood): ${requestId}`);
+    return Promise.resolve({ rejection: errorEnvelope });
   }
 
-  // Check capacity
-  if (inFlight >= MAX_CONCURRENT) {
-    // Send JobCapacityReached event (T014, T013)
-    try {
-      if (telemetry?.isEnabled()) {
-        telemetry.sendEvent('JobCapacityReached', {
-          sessionId: telemetry.getSessionId(),
-          reason: 'capacity_exceeded',
-          telemetrySchemaVersion: '2' // Phase 3: Privacy-enhanced schema (Finding DR-05)
-        }, {
-          inFlightCount: inFlight,
-          maxConcurrent: MAX_CONCURRENT
-        });
+  const priority = command ? resolvePriority(command) : 'normal';
+  const ticket = jobScheduler.acquire({
+    requestId,
+    priority,
+    clientId: command?.clientId,
+    maxWaitMs: command?.timeout,
+    signal
+  });
+
+  return ticket.then(
+    granted => {
+      console.log(`[Processor] Job launched (${priority}, inFlight: ${inFlight}, waited ${granted.waitMs}ms): ${requestId}`);
+      return { ticket: granted };
+    },
+    (err: SchedulerRejection) => {
+      if (err.reason === 'cancelled') {
+        return { rejection: createErrorEnvelope(ErrorCode.E_CANCELLED, 'Operation cancelled by user', requestId, Date.now()) };
       }
-    } catch (error) {
-      // Graceful degradation
+
+      // Send JobCapacityReached event (T014, T013)
+      try {
+        if (telemetry?.isEnabled()) {
+          telemetry.sendEvent('JobCapacityReached', {
+            sessionId: telemetry.getSessionId(),
+            reason: err.reason === 'timeout' ? 'queue_timeout' : 'capacity_exceeded',
+            priority,
+            telemetrySchemaVersion: '2' // Phase 3: Privacy-enhanced schema (Finding DR-05)
+          }, {
+            inFlightCount: inFlight,
+            queuedCount: jobScheduler.queuedCount
+          });
+        }
+      } catch (error) {
+        // Graceful degradation
+      }
+
+      console.log(`[Processor] Job rejected (${err.reason}): ${requestId}`);
+      return {
+        rejection: createErrorEnvelope(
+          ErrorCode.E_CAPACITY,
+          err.message,
+          requestId,
+          Date.now(),
+          { reason: err.reason, priority, queueDepth: err.queueDepth }
+        )
+      };
     }
+  );
+}
 
-    // Write E_CAPACITY error inline
-    const errorEnvelope = createErrorEnvelope(
-      ErrorCode.E_CAPACITY,
-      `Capacity limit reached (${MAX_CONCURRENT} concurrent jobs)`,
-      path.basename(jobDir),
-      Date.now()
-    );
+/**
+ * Release the slot granted by admitJob()
+ */
+export function releaseJob(requestId: string, ticket: SchedulerTicket): void {
+  jobScheduler.release(ticket);
+  console.log(`[Processor] Job completed (inFlight: ${inFlight}, queued: ${jobScheduler.queuedCount}): ${requestId}`);
+}
 
-    // Write error and done marker synchronously (blocking is acceptable for rejection)
-    writeResponse(jobDir, errorEnvelope)
-      .then(() => writeDone(jobDir))
-      .catch(err => console.error(`[Processor] Failed to write capacity error: ${err}`));
+/**
+ * Record scheduling facts on a response envelope
+ */
+function withQueueMeta<T extends ResponseJson | ErrorJson>(envelope: T, ticket?: SchedulerTicket): T {
+  if (ticket) {
+    envelope.meta.priority = ticket.priority;
+    envelope.meta.queueDepth = ticket.queueDepth;
+    envelope.meta.queueWaitMs = ticket.waitMs;
+  }
+  return envelope;
+}
 
-    console.log(`[Processor] Job rejected (capacity): ${path.basename(jobDir)}`);
-    return;
+/**
+ * Read command.json without failing (used to classify a job before it runs)
+ */
+async function readCommand(jobDir: string): Promise<CommandJson | undefined> {
+  try {
+    return JSON.parse(await fsPromises.readFile(path.join(jobDir, 'command.json'), 'utf8')) as CommandJson;
+  } catch {
+    // processCommand() reads it again and reports unreadable commands
+    return undefined;
   }
+}
 
-  // Increment counter
-  inFlight++;
-  console.log(`[Processor] Job launched (inFlight: ${inFlight}/${MAX_CONCURRENT}): ${path.basename(jobDir)}`);
+/**
+ * Launch a job through the scheduler
+ *
+ * Fire-and-forget: returns before the job is admitted. command.json is read
+ * once (asynchronously) to pick the priority class, then the job goes through
+ * admitJob(), so no slot is taken until that read completes. If rejected
+ * (flood, queue full, queue wait timed out), writes the error envelope and
+ * done marker. Otherwise runs processCommand with the parsed command once a
+ * slot is granted and releases the slot in finally.
+ */
+export function launchJob(
+  jobDir: string,
+  bridgeId: string,
+  executor: (command: CommandJson, eventWriter: EventWriter) => Promise<any>,
+  telemetry?: ITelemetry
+): void {
+  const jobId = path.basename(jobDir);
+
+  readCommand(jobDir).then(command => admitJob(jobId, telemetry, command).then(admission => {
+    if (admission.rejection) {
+      // Write error and done marker
+      return writeResponse(jobDir, admission.rejection)
+        .then(() => writeDone(jobDir, 'fail'))
+        .catch(err => console.error(`[Processor] Failed to write rejection: ${err}`));
+    }
 
-  // Launch job without awaiting (fire-and-forget)
-  processCommand(jobDir, bridgeId, executor, telemetry)
-    .finally(() => {
-      // Always decrement counter
-      inFlight--;
-      console.log(`[Processor] Job completed (inFlight: ${inFlight}/${MAX_CONCURRENT}): ${path.basename(jobDir)}`);
-    });
+    const ticket = admission.ticket;
+    return processCommand(jobDir, bridgeId, executor, telemetry, ticket, command)
+      .finally(() => {
+        // Always release the slot
+        releaseJob(jobId, ticket);
+      });
+  }));
 }
 
 /**
@@ -340,6 +497,8 @@ export function claimJobAtomic(jobDir: string, bridgeId: string): boolean {
     // No need for atomic write here since 'wx' already guarantees atomicity
     fs.writeFileSync(fd, JSON.stringify(claim, null, 2));
     fs.closeSync(fd);
+    noteJobMarker(jobDir, 'claimed.json');
+    journalJobTransition(jobDir, 'claim');
 
     console.log(`[Processor] Successfully claimed job: ${path.basename(jobDir)}`);
     return true;
@@ -369,50 +528,113 @@ export async function checkCancellation(jobDir: string): Promise<boolean> {
   }
 }
 
+/**
+ * Results larger than this (serialized characters) go to a separate data file
+ */
+export const LARGE_DATA_THRESHOLD = 2 * 1024 * 1024;
+
 /**
  * Write response atomically
+ *
+ * Data is serialized once, incrementally. Results up to LARGE_DATA_THRESHOLD
+ * are written inline; larger ones are streamed to a data file referenced by
+ * `dataRef`, so the payload is never held as one string. Clients that list
+ * encodings in CommandJson.accept get array results as NDJSON and/or a
+ * gzipped data file.
+ *
+ * @param accept - Large-result encodings the client can read
  */
 export async function writeResponse(
   jobDir: string,
-  envelope: ResponseJson | ErrorJson
+  envelope: ResponseJson | ErrorJson,
+  accept: LargeDataEncoding[] = []
 ): Promise<void> {
   const isError = !envelope.ok;
   const filename = isError ? 'error.json' : 'response.json';
   const filePath = path.join(jobDir, filename);
 
-  // Check for large payload (only for success responses)
-  if (!isError && envelope.data) {
-    const dataSize = JSON.stringify(envelope.data).length;
+  // Write error or response without data
+  if (isError || !envelope.data) {
+    await writeJsonAtomicAsync(filePath, envelope);
+    return;
+  }
 
-    if (dataSize > 2 * 1024 * 1024) { // 2MB threshold
-      // Write large data to separate file atomically
-      const dataPath = path.join(jobDir, 'data.json');
-      await writeJsonAtomicAsync(dataPath, envelope.data);
+  const serialized = await serializeResponseData(jobDir, envelope, accept);
+  if (serialized.inline !== undefined) {
+    await writeFileAtomicAsync(filePath, serialized.inline);
+  } else {
+    await writeJsonAtomicAsync(filePath, serialized.withRef);
+  }
+}
 
-      // Create response with reference
-      const responseWithRef: ResponseJson = {
-        ...envelope,
-        data: undefined,
-        dataRef: 'data.json'
-      };
+/**
+ * Serialize a success envelope, streaming data past LARGE_DATA_THRESHOLD to a file
+ *
+ * Shared by writeResponse() and the socket transport. Returns the envelope
+ * JSON with the data inline, or the envelope with `dataRef` naming the data
+ * file written in `dataDir` (created if needed).
+ *
+ * @param accept - Large-result encodings the client can read
+ */
+export async function serializeResponseData(
+  dataDir: string,
+  envelope: ResponseJson,
+  accept: LargeDataEncoding[] = []
+): Promise<{ inline: string; withRef?: undefined } | { inline?: undefined; withRef: ResponseJson }> {
+  // Serialize up to the threshold; most results finish here
+  const chunker = new JsonChunker(envelope.data);
+  const head: string[] = [];
+  let headChars = 0;
+  while (!chunker.done && headChars <= LARGE_DATA_THRESHOLD) {
+    const piece = chunker.next();
+    head.push(piece);
+    headChars += piece.length;
+  }
 
-      await writeJsonAtomicAsync(filePath, responseWithRef);
-    } else {
-      // Write inline for small responses
-      await writeJsonAtomicAsync(filePath, envelope);
-    }
+  if (chunker.done && headChars <= LARGE_DATA_THRESHOLD) {
+    // Inline: splice the serialized data into the envelope
+    const rest = JSON.stringify({ ...envelope, data: undefined });
+    return { inline: `${rest.slice(0, -1)},"data":${head.join('')}}` };
+  }
+
+  // Large payload: stream the rest to a separate file (array results as NDJSON when accepted)
+  const ndjson = Array.isArray(envelope.data) && accept.includes('ndjson');
+  const gzip = accept.includes('gzip');
+  const dataRef = (ndjson ? 'data.ndjson' : 'data.json') + (gzip ? '.gz' : '');
+
+  let next: () => string | undefined;
+  if (ndjson) {
+    const lines = new NdjsonChunker(envelope.data);
+    head.length = 0;
+    next = () => (lines.done ? undefined : lines.next());
   } else {
-    // Write error or response without data
-    await writeJsonAtomicAsync(filePath, envelope);
+    next = () => head.length > 0 ? head.shift() : chunker.done ? undefined : chunker.next();
   }
+  await fsPromises.mkdir(dataDir, { recursive: true });
+  await writeChunksAtomicAsync(path.join(dataDir, dataRef), next, { gzip });
+
+  // Create response with reference
+  return {
+    withRef: {
+      ...envelope,
+      data: undefined,
+      dataRef,
+      ...(ndjson && { dataFormat: 'ndjson' as const }),
+      ...(gzip && { dataEncoding: 'gzip' as const })
+    }
+  };
 }
 
 /**
  * Write done marker file
+ *
+ * @param outcome - Recorded in the bridge journal ('fail' when an error envelope was written)
  */
-export async function writeDone(jobDir: string): Promise<void> {
+export async function writeDone(jobDir: string, outcome: 'complete' | 'fail' = 'complete'): Promise<void> {
   const donePath = path.join(jobDir, 'done');
   await fsPromises.writeFile(donePath, '');
+  noteJobMarker(jobDir, 'done');
+  journalJobTransition(jobDir, outcome);
 }
 
 /**
@@ -468,23 +690,29 @@ export function createSuccessEnvelope(
 
 /**
  * Process a command with cancellation support
+ *
+ * `preloaded` is the already-parsed command.json (from launchJob); without it
+ * the file is read here.
  */
 export async function processCommand(
   jobDir: string,
   bridgeId: string,
   executor: (command: CommandJson, eventWriter: EventWriter) => Promise<any>,
-  telemetry?: ITelemetry
+  telemetry?: ITelemetry,
+  ticket?: SchedulerTicket,
+  preloaded?: CommandJson
 ): Promise<void> {
   const startTime = Date.now();
   const commandPath = path.join(jobDir, 'command.json');
   const eventWriter = new EventWriter(path.join(jobDir, 'events.ndjson'));
   let scriptName = 'unknown';
   let cancelled = false;
+  let failed = false;
+  let cancelPoll: NodeJS.Timeout | undefined;
 
   try {
-    // Read command
-    const commandData = await fsPromises.readFile(commandPath, 'utf8');
-    const command = JSON.parse(commandData) as CommandJson;
+    // Read command (unless the caller already has it)
+    const command = preloaded ?? JSON.parse(await fsPromises.readFile(commandPath, 'utf8')) as CommandJson;
     scriptName = command.scriptName;
 
     // Log command details to console for debugging
@@ -503,9 +731,10 @@ export async function processCommand(
 
     // Create a promise that rejects on cancellation
     const cancelPromise = new Promise<never>((_, reject) => {
-      const interval = setInterval(async () => {
+      cancelPoll = setInterval(async () => {
         if (await checkCancellation(jobDir)) {
-          clearInterval(interval);
+          clearInterval(cancelPoll);
+          eventWriter.cancel();
           reject(new CancellationError());
         }
       }, cancelPollMs);
@@ -524,8 +753,8 @@ export async function processCommand(
     }
 
     // Write success response (preserving editorContext from Phase 2)
-    const envelope = createSuccessEnvelope(result.data, command.id, startTime, result.editorContext);
-    await writeResponse(jobDir, envelope);
+    const envelope = withQueueMeta(createSuccessEnvelope(result.data, command.id, startTime, result.editorContext), ticket);
+    await writeResponse(jobDir, envelope, command.accept);
 
     eventWriter.writeLog('info', 'Command completed successfully');
 
@@ -548,6 +777,7 @@ export async function processCommand(
 
   } catch (err: any) {
     let errorEnvelope: ErrorJson;
+    failed = true;
 
     if (err instanceof CancellationError) {
       cancelled = true;
@@ -573,17 +803,7 @@ export async function processCommand(
       eventWriter.writeError('Command failed', { error: message });
 
       // Write DLQ marker for failed jobs (immediate quarantine, no retry)
-      // Read command to get script name for DLQ metadata
-      let scriptName = 'unknown';
-      try {
-        const commandPath = path.join(jobDir, 'command.json');
-        const commandData = await fsPromises.readFile(commandPath, 'utf8');
-        const command = JSON.parse(commandData) as CommandJson;
-        scriptName = command.scriptName;
-      } catch {
-        // Ignore if we can't read command; use 'unknown'
-      }
-
+      // scriptName stays 'unknown' if command.json could not be read
       await writeDlqMarker(jobDir, {
         reason: ErrorCode.E_INTERNAL,
         scriptName,
@@ -594,7 +814,7 @@ export async function processCommand(
       });
     }
 
-    await writeResponse(jobDir, errorEnvelope);
+    await writeResponse(jobDir, withQueueMeta(errorEnvelope, ticket));
 
     // Send CommandProcessingCompleted event (T016, T013 - error/cancelled path)
     try {
@@ -614,6 +834,9 @@ export async function processCommand(
     }
 
   } finally {
+    // Stop polling for the cancel sentinel once the job has settled
+    clearInterval(cancelPoll);
+
     // Always write done marker and close event stream (per /didyouknow Insight #3: KISS)
     try {
       await eventWriter.close();
@@ -621,6 +844,91 @@ export async function processCommand(
       console.error(`[Processor] EventWriter close failed: ${err}`);
       // Continue to done marker anyway
     }
-    await writeDone(jobDir);
+    await writeDone(jobDir, failed ? 'fail' : 'complete');
   }
-}
\ No newline at end of file
+}
+
+/**
+ * Execute a command that did not arrive through a job directory
+ *
+ * Mirrors processCommand() for transports that carry CommandJson directly
+ * (the socket endpoint): same executor contract, envelopes, flood accounting
+ * and telemetry, but no claimed/response/done files and no DLQ marker.
+ * The caller is responsible for admitJob()/releaseJob().
+ *
+ * @param cancelled - Promise that rejects with CancellationError when the client cancels
+ * @param ticket - Scheduler slot, recorded in the response meta
+ */
+export async function executeCommandInMemory(
+  command: CommandJson,
+  executor: (command: CommandJson, eventWriter: EventWriter) => Promise<any>,
+  eventWriter: EventWriter,
+  cancelled: Promise<never>,
+  telemetry?: ITelemetry,
+  ticket?: SchedulerTicket
+): Promise<ResponseJson | ErrorJson> {
+  const startTime = Date.now();
+  let envelope: ResponseJson | ErrorJson;
+  let isCancelled = false;
+
+  try {
+    console.log(`[Processor] Processing command (socket): ${command.scriptName}`);
+    eventWriter.writeLog('info', `Processing command: ${command.scriptName}`);
+
+    // Let the script see the cancellation too, not just the race
+    cancelled.catch(() => eventWriter.cancel());
+
+    const result = await Promise.race([
+      executor(command, eventWriter),
+      cancelled
+    ]);
+
+    envelope = createSuccessEnvelope(result.data, command.id, startTime, result.editorContext);
+    eventWriter.writeLog('info', 'Command completed successfully');
+  } catch (err: any) {
+    if (err instanceof CancellationError) {
+      isCancelled = true;
+      envelope = createErrorEnvelope(
+        ErrorCode.E_CANCELLED,
+        'Operation cancelled by user',
+        command.id,
+        startTime
+      );
+      eventWriter.writeLog('warn', 'Command cancelled');
+    } else {
+      // Record failure for flood tracking (non-cancellation errors only)
+      failureTimestamps.push(Date.now());
+
+      const message = err.message || 'Unknown error';
+      envelope = createErrorEnvelope(
+        ErrorCode.E_INTERNAL,
+        message,
+        command.id,
+        startTime,
+        { error: String(err), stack: err.stack }
+      );
+      eventWriter.writeError('Command failed', { error: message });
+    }
+  } finally {
+    await eventWriter.close().catch(() => {});
+  }
+
+  // Send CommandProcessingCompleted event (same shape as the file queue)
+  try {
+    if (telemetry?.isEnabled()) {
+      telemetry.sendEvent('CommandProcessingCompleted', {
+        sessionId: telemetry.getSessionId(),
+        scriptName: command.scriptName,
+        success: envelope.ok ? 'true' : 'false',
+        cancelled: isCancelled ? 'true' : 'false',
+        telemetrySchemaVersion: '2'
+      }, {
+        durationMs: Date.now() - startTime
+      });
+    }
+  } catch (error) {
+    // Graceful degradation
+  }
+
+  return withQueueMeta(envelope, ticket);
+}
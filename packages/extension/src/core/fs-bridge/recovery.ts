@@ -5,6 +5,8 @@ import * as vscode from 'vscode';
 import { ClaimedJson, CommandJson } from './types';
 import { claimJobAtomic, processCommand } from './processor';
 import { writeDlqMarker } from './dlq';
+import { listJobCandidates, noteJobMarker, noteJobRemoved } from './job-index';
+import { journalJobTransition } from './journal';
 
 /**
  * Recovery statistics
@@ -59,13 +61,16 @@ export async function detectCrashedJobs(
   };
 
   try {
-    const entries = await fsPromises.readdir(executeDir, { withFileTypes: true });
+    // With a live job index only claimed-but-unfinished jobs are examined
+    const { names, total } = await listJobCandidates(
+      executeDir,
+      job => job.hasCommand && job.claimed && !job.done && !job.dlq
+    );
+    stats.scanned = total;
+    stats.skipped = total - names.length;
 
-    for (const entry of entries) {
-      if (!entry.isDirectory()) continue;
-
-      stats.scanned++;
-      const jobDir = path.join(executeDir, entry.name);
+    for (const name of names) {
+      const jobDir = path.join(executeDir, name);
 
       try {
         // Check job state markers
@@ -108,7 +113,7 @@ export async function detectCrashedJobs(
           scriptName = command.scriptName;
         } catch (err) {
           // Malformed command.json - still quarantine but no script name
-          console.error(`[Recovery] Failed to read command.json for ${entry.name}:`, err);
+          console.error(`[Recovery] Failed to read command.json for ${name}:`, err);
         }
 
         // Create DLQ marker
@@ -124,12 +129,12 @@ export async function detectCrashedJobs(
 
         // Log to OutputChannel if provided
         if (output) {
-          output.appendLine(`[Recovery] Quarantined crashed job: ${entry.name} (script: ${scriptName || 'unknown'})`);
+          output.appendLine(`[Recovery] Quarantined crashed job: ${name} (script: ${scriptName || 'unknown'})`);
         } else {
-          console.log(`[Recovery] Quarantined crashed job: ${entry.name} (script: ${scriptName || 'unknown'})`);
+          console.log(`[Recovery] Quarantined crashed job: ${name} (script: ${scriptName || 'unknown'})`);
         }
       } catch (err) {
-        console.error(`[Recovery] Error processing ${entry.name}:`, err);
+        console.error(`[Recovery] Error processing ${name}:`, err);
         stats.skipped++;
       }
     }
@@ -181,32 +186,31 @@ export async function recoverStaleJobs(
   };
 
   try {
-    const entries = await fsPromises.readdir(executeDir, { withFileTypes: true });
-
-    for (const entry of entries) {
-      if (!entry.isDirectory()) continue;
+    // Quarantined jobs (e.g. crashed in a previous session) are never re-run
+    const { names, total } = await listJobCandidates(executeDir, job => job.claimed && !job.done && !job.dlq);
+    stats.scanned = total;
 
-      stats.scanned++;
-      const jobDir = path.join(executeDir, entry.name);
+    for (const name of names) {
+      const jobDir = path.join(executeDir, name);
 
       try {
         const isStale = await isJobStale(jobDir, leaseMs);
 
         if (isStale) {
           stats.stale++;
-          console.log(`[Recovery] Found stale job: ${entry.name}`);
+          console.log(`[Recovery] Found stale job: ${name}`);
 
           const recovered = await reclaimAndProcess(jobDir, bridgeId, executor);
 
           if (recovered) {
             stats.recovered++;
-            console.log(`[Recovery] Successfully recovered: ${entry.name}`);
+            console.log(`[Recovery] Successfully recovered: ${name}`);
           } else {
             stats.failed++;
           }
         }
       } catch (err) {
-        console.error(`[Recovery] Error processing ${entry.name}: ${err}`);
+        console.error(`[Recovery] Error processing ${name}: ${err}`);
         stats.failed++;
       }
     }
@@ -225,13 +229,22 @@ export async function recoverStaleJobs(
 export async function isJobStale(jobDir: string, leaseMs: number): Promise<boolean> {
   const claimedPath = path.join(jobDir, 'claimed.json');
   const donePath = path.join(jobDir, 'done');
+  const dlqPath = path.join(jobDir, 'dlq');
 
   try {
     // If done exists, job is complete (not stale)
     await fsPromises.access(donePath);
     return false;
   } catch {
-    // Done doesn't exist, check if claimed
+    // Done doesn't exist, check for DLQ
+  }
+
+  try {
+    // Quarantined jobs are not reclaimed
+    await fsPromises.access(dlqPath);
+    return false;
+  } catch {
+    // Not in DLQ, check if claimed
   }
 
   try {
@@ -288,6 +301,7 @@ export async function reclaimAndProcess(
   try {
     // Remove the stale claim
     await fsPromises.unlink(claimedPath);
+    noteJobMarker(jobDir, 'claimed.json', false);
     console.log(`[Recovery] Removed stale claim: ${path.basename(jobDir)}`);
 
     // Try to claim it ourselves
@@ -340,12 +354,10 @@ export async function cleanOrphanedJobs(executeDir: string): Promise<number> {
   let cleaned = 0;
 
   try {
-    const entries = await fsPromises.readdir(executeDir, { withFileTypes: true });
+    const { names } = await listJobCandidates(executeDir, job => !job.hasCommand);
 
-    for (const entry of entries) {
-      if (!entry.isDirectory()) continue;
-
-      const jobDir = path.join(executeDir, entry.name);
+    for (const name of names) {
+      const jobDir = path.join(executeDir, name);
       const commandPath = path.join(jobDir, 'command.json');
 
       try {
@@ -360,11 +372,13 @@ export async function cleanOrphanedJobs(executeDir: string): Promise<number> {
 
           if (age > 60000) { // Older than 1 minute
             await fsPromises.rm(jobDir, { recursive: true, force: true });
-            console.log(`[Recovery] Cleaned orphaned job: ${entry.name}`);
+            noteJobRemoved(jobDir);
+            journalJobTransition(jobDir, 'delete');
+            console.log(`[Recovery] Cleaned orphaned job: ${name}`);
             cleaned++;
           }
         } catch (err) {
-          console.error(`[Recovery] Failed to clean orphaned job ${entry.name}: ${err}`);
+          console.error(`[Recovery] Failed to clean orphaned job ${name}: ${err}`);
         }
       }
     }
@@ -388,12 +402,10 @@ export async function cleanAllPendingJobs(executeDir: string): Promise<number> {
   let cleaned = 0;
 
   try {
-    const entries = await fsPromises.readdir(executeDir, { withFileTypes: true });
-
-    for (const entry of entries) {
-      if (!entry.isDirectory()) continue;
+    const { names } = await listJobCandidates(executeDir, job => !job.done && !job.keep && !job.dlq);
 
-      const jobDir = path.join(executeDir, entry.name);
+    for (const name of names) {
+      const jobDir = path.join(executeDir, name);
       const donePath = path.join(jobDir, 'done');
       const keepPath = path.join(jobDir, 'keep');
       const dlqPath = path.join(jobDir, 'dlq');
@@ -425,10 +437,12 @@ export async function cleanAllPendingJobs(executeDir: string): Promise<number> {
 
         // Delete this pending job
         await fsPromises.rm(jobDir, { recursive: true, force: true });
-        console.log(`[Recovery] Cleaned pending job on startup: ${entry.name}`);
+        noteJobRemoved(jobDir);
+        journalJobTransition(jobDir, 'delete');
+        console.log(`[Recovery] Cleaned pending job on startup: ${name}`);
         cleaned++;
       } catch (err) {
-        console.error(`[Recovery] Failed to clean pending job ${entry.name}: ${err}`);
+        console.error(`[Recovery] Failed to clean pending job ${name}: ${err}`);
       }
     }
 
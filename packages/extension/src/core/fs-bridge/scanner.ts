@@ -9,12 +9,14 @@
  * - Capacity-aware: skips scanning when at MAX_CONCURRENT
  * - DLQ-aware: skips jobs in dead letter queue
  * - Optimized: early exits to reduce filesystem stat() calls
+ * - Indexed: with a live JobIndex, one readdir to reconcile instead of a full walk
  * - Testable: uses IFilesystem abstraction for unit testing
  */
 
 import * as path from 'path';
 import { IFilesystem, FileType } from './fs-abstraction';
 import { isDlqJob } from './dlq';
+import { getJobIndex } from './job-index';
 
 /**
  * Scan execute directory for unclaimed jobs
@@ -44,6 +46,18 @@ export async function scanForUnclaimedJobs(
     return [];
   }
 
+  const index = getJobIndex(executeDir);
+  if (index) {
+    try {
+      // Watcher keeps the index current; reconcile catches anything it missed
+      await index.reconcile();
+      return index.unclaimedJobDirs();
+    } catch (err) {
+      console.warn(`[Scanner] Error reconciling job index for ${executeDir}:`, err);
+      return [];
+    }
+  }
+
   const unclaimedJobs: string[] = [];
 
   try {
@@ -0,0 +1,356 @@
+/**
+ * @file scheduler.ts
+ * @brief Priority-class job scheduler with a bounded, fair wait queue
+ *
+ * Scripts declare a priority class in their .meta.yaml (`priority:`), or get
+ * one derived from their response type:
+ * - fast: short read-only queries (debug.status, breakpoint.list, dap.*)
+ * - normal: everything else
+ * - blocking: long waits (debug.wait-for-hit, debug.start, step/continue)
+ *
+ * Each class has its own concurrency limit, so a handful of long waits can
+ * never take the slots fast calls need. When a class is full, jobs wait in a
+ * bounded queue instead of being rejected outright. Queued jobs are grouped
+ * by client and dispatched round-robin across clients, and one client may
+ * only hold part of the queue. A job that cannot start before its wait
+ * deadline is rejected.
+ */
+
+import type { ScriptMetadata } from '../discovery/types';
+
+/**
+ * Scheduling classes, from most to least latency-sensitive
+ */
+export type PriorityClass = 'fast' | 'normal' | 'blocking';
+
+export const PRIORITY_CLASSES: readonly PriorityClass[] = ['fast', 'normal', 'blocking'];
+
+/**
+ * Concurrent jobs per class (normal keeps the historical MAX_CONCURRENT of 10)
+ */
+export const DEFAULT_CLASS_LIMITS: Readonly<Record<PriorityClass, number>> = {
+  fast: 8,
+  normal: 10,
+  blocking: 4
+};
+
+/**
+ * Jobs that may wait for a slot across all classes
+ */
+export const MAX_QUEUED_JOBS = 100;
+
+/**
+ * Longest a job waits for a slot when its command has no timeout
+ */
+export const MAX_QUEUE_WAIT_MS = 60_000;
+
+/**
+ * Derive a script's class from its manifest metadata
+ *
+ * An explicit `priority` wins; otherwise 'waitable' scripts are blocking,
+ * 'query' scripts are fast and the rest are normal.
+ */
+export function priorityFromMetadata(metadata: ScriptMetadata | undefined): PriorityClass {
+  if (!metadata) return 'normal';
+  if (metadata.priority) return metadata.priority;
+  if (metadata.response === 'waitable') return 'blocking';
+  if (metadata.response === 'query') return 'fast';
+  return 'normal';
+}
+
+/**
+ * The least latency-sensitive of several classes (e.g. for a batch of steps)
+ */
+export function slowestPriority(classes: PriorityClass[]): PriorityClass {
+  let slowest: PriorityClass = 'fast';
+  for (const priority of classes) {
+    if (PRIORITY_CLASSES.indexOf(priority) > PRIORITY_CLASSES.indexOf(slowest)) {
+      slowest = priority;
+    }
+  }
+  return slowest;
+}
+
+/**
+ * A job asking for a slot
+ */
+export interface ScheduleRequest {
+  requestId: string;
+  priority: PriorityClass;
+  /** Client process (CommandJson.clientId); fairness is per client */
+  clientId?: string;
+  /** Longest time to wait in the queue (capped at maxWaitMs) */
+  maxWaitMs?: number;
+  /** Aborting removes the job from the queue */
+  signal?: AbortSignal;
+}
+
+/**
+ * A granted slot; pass back to release()
+ */
+export interface SchedulerTicket {
+  requestId: string;
+  priority: PriorityClass;
+  clientId: string;
+  /** Jobs ahead of this one in its class queue when it was queued (0 = started immediately) */
+  queueDepth: number;
+  /** Time spent waiting for the slot */
+  waitMs: number;
+}
+
+/**
+ * Why a job could not be scheduled
+ */
+export class SchedulerRejection extends Error {
+  constructor(
+    public readonly reason: 'queue_full' | 'timeout' | 'cancelled',
+    message: string,
+    public readonly queueDepth: number
+  ) {
+    super(message);
+    this.name = 'SchedulerRejection';
+  }
+}
+
+export interface JobSchedulerOptions {
+  limits?: Partial<Record<PriorityClass, number>>;
+  maxQueued?: number;
+  maxWaitMs?: number;
+  /** Called whenever the number of running jobs changes */
+  onRunningChange?: (running: number) => void;
+}
+
+interface Waiter {
+  request: ScheduleRequest;
+  clientId: string;
+  queuedAt: number;
+  queueDepth: number;
+  resolve: (ticket: SchedulerTicket) => void;
+  reject: (rejection: SchedulerRejection) => void;
+  timer: NodeJS.Timeout;
+  onAbort?: () => void;
+}
+
+/**
+ * Per-class slots plus a bounded, per-client round-robin wait queue
+ */
+export class JobScheduler {
+  readonly limits: Record<PriorityClass, number>;
+  readonly maxQueued: number;
+  readonly maxWaitMs: number;
+
+  private running: Record<PriorityClass, number> = { fast: 0, normal: 0, blocking: 0 };
+
+  /** Per class: client → FIFO of waiters; Map order is the round-robin order */
+  private queues: Record<PriorityClass, Map<string, Waiter[]>> = {
+    fast: new Map(),
+    normal: new Map(),
+    blocking: new Map()
+  };
+
+  private queuedByClass: Record<PriorityClass, number> = { fast: 0, normal: 0, blocking: 0 };
+  private queuedByClient = new Map<string, number>();
+  private onRunningChange?: (running: number) => void;
+
+  constructor(options: JobSchedulerOptions = {}) {
+    this.limits = { ...DEFAULT_CLASS_LIMITS, ...options.limits };
+    this.maxQueued = options.maxQueued ?? MAX_QUEUED_JOBS;
+    this.maxWaitMs = options.maxWaitMs ?? MAX_QUEUE_WAIT_MS;
+    this.onRunningChange = options.onRunningChange;
+  }
+
+  /**
+   * Jobs currently running (all classes)
+   */
+  get runningCount(): number {
+    return this.running.fast + this.running.normal + this.running.blocking;
+  }
+
+  /**
+   * Jobs waiting for a slot (all classes)
+   */
+  get queuedCount(): number {
+    return this.queuedByClass.fast + this.queuedByClass.normal + this.queuedByClass.blocking;
+  }
+
+  /**
+   * Running plus queued jobs the scheduler can hold before rejecting
+   */
+  get capacity(): number {
+    return this.limits.fast + this.limits.normal + this.limits.blocking + this.maxQueued;
+  }
+
+  /**
+   * Ask for a slot
+   *
+   * If the class has a free slot the slot is taken synchronously and the
+   * returned promise is already resolved. Otherwise the job is queued. The
+   * promise rejects with a SchedulerRejection if the queue is full, the wait
+   * deadline passes, or the signal aborts.
+   */
+  acquire(request: ScheduleRequest): Promise<SchedulerTicket> {
+    const clientId = request.clientId || 'unknown';
+    const priority = request.priority;
+
+    if (this.running[priority] < this.limits[priority] && this.queuedByClass[priority] === 0) {
+      return Promise.resolve(this.start(request, clientId, 0, Date.now()));
+    }
+
+    const clientQueued = this.queuedByClient.get(clientId) ?? 0;
+    if (this.queuedCount >= this.maxQueued || clientQueued >= Math.ceil(this.maxQueued / 2)) {
+      return Promise.reject(new SchedulerRejection(
+        'queue_full',
+        `Capacity limit reached (${this.running[priority]} ${priority} jobs running, ${this.queuedCount} queued)`,
+        this.queuedByClass[priority]
+      ));
+    }
+
+    return new Promise<SchedulerTicket>((resolve, reject) => {
+      const waitMs = Math.min(request.maxWaitMs ?? this.maxWaitMs, this.maxWaitMs);
+      const waiter: Waiter = {
+        request,
+        clientId,
+        queuedAt: Date.now(),
+        queueDepth: this.queuedByClass[priority],
+        resolve,
+        reject,
+        timer: setTimeout(() => {
+          if (this.dequeue(waiter)) {
+            reject(new SchedulerRejection(
+              'timeout',
+              `Timed out after ${waitMs}ms waiting for a ${priority} slot`,
+              waiter.queueDepth
+            ));
+          }
+        }, waitMs)
+      };
+
+      if (request.signal) {
+        if (request.signal.aborted) {
+          clearTimeout(waiter.timer);
+          reject(new SchedulerRejection('cancelled', 'Cancelled while queued', waiter.queueDepth));
+          return;
+        }
+        waiter.onAbort = () => {
+          if (this.dequeue(waiter)) {
+            reject(new SchedulerRejection('cancelled', 'Cancelled while queued', waiter.queueDepth));
+          }
+        };
+        request.signal.addEventListener('abort', waiter.onAbort, { once: true });
+      }
+
+      this.enqueue(waiter);
+    });
+  }
+
+  /**
+   * Return a slot and start the next queued job of that class
+   */
+  release(ticket: SchedulerTicket): void {
+    this.running[ticket.priority] = Math.max(0, this.running[ticket.priority] - 1);
+    this.onRunningChange?.(this.runningCount);
+    this.dispatch(ticket.priority);
+  }
+
+  /**
+   * Running and queued counts per class
+   */
+  snapshot(): Record<PriorityClass, { running: number; queued: number; limit: number }> {
+    const snapshot = {} as Record<PriorityClass, { running: number; queued: number; limit: number }>;
+    for (const priority of PRIORITY_CLASSES) {
+      snapshot[priority] = {
+        running: this.running[priority],
+        queued: this.queuedByClass[priority],
+        limit: this.limits[priority]
+      };
+    }
+    return snapshot;
+  }
+
+  /**
+   * Drop all state, rejecting queued jobs (for testing only)
+   * @internal
+   */
+  reset(): void {
+    for (const priority of PRIORITY_CLASSES) {
+      for (const waiters of Array.from(this.queues[priority].values())) {
+        for (const waiter of [...waiters]) {
+          this.dequeue(waiter);
+          waiter.reject(new SchedulerRejection('cancelled', 'Scheduler reset', 0));
+        }
+      }
+      this.running[priority] = 0;
+    }
+    this.onRunningChange?.(0);
+  }
+
+  private start(request: ScheduleRequest, clientId: string, queueDepth: number, queuedAt: number): SchedulerTicket {
+    this.running[request.priority]++;
+    this.onRunningChange?.(this.runningCount);
+    return {
+      requestId: request.requestId,
+      priority: request.priority,
+      clientId,
+      queueDepth,
+      waitMs: Date.now() - queuedAt
+    };
+  }
+
+  private dispatch(priority: PriorityClass): void {
+    const queue = this.queues[priority];
+    while (this.running[priority] < this.limits[priority] && queue.size > 0) {
+      // Next client in round-robin order; it moves to the back if it still has work
+      const [clientId, waiters] = queue.entries().next().value as [string, Waiter[]];
+      const waiter = waiters[0];
+      this.dequeue(waiter);
+      if (waiters.length > 0) {
+        queue.delete(clientId);
+        queue.set(clientId, waiters);
+      }
+      waiter.resolve(this.start(waiter.request, waiter.clientId, waiter.queueDepth, waiter.queuedAt));
+    }
+  }
+
+  private enqueue(waiter: Waiter): void {
+    const priority = waiter.request.priority;
+    const queue = this.queues[priority];
+    const waiters = queue.get(waiter.clientId);
+    if (waiters) {
+      waiters.push(waiter);
+    } else {
+      queue.set(waiter.clientId, [waiter]);
+    }
+    this.queuedByClass[priority]++;
+    this.queuedByClient.set(waiter.clientId, (this.queuedByClient.get(waiter.clientId) ?? 0) + 1);
+  }
+
+  /**
+   * Remove a waiter from its queue; false if it was already dispatched
+   */
+  private dequeue(waiter: Waiter): boolean {
+    const priority = waiter.request.priority;
+    const queue = this.queues[priority];
+    const waiters = queue.get(waiter.clientId);
+    const index = waiters ? waiters.indexOf(waiter) : -1;
+    if (!waiters || index === -1) return false;
+
+    waiters.splice(index, 1);
+    if (waiters.length === 0) {
+      queue.delete(waiter.clientId);
+    }
+
+    clearTimeout(waiter.timer);
+    if (waiter.onAbort) {
+      waiter.request.signal?.removeEventListener('abort', waiter.onAbort);
+    }
+
+    this.queuedByClass[priority]--;
+    const clientQueued = (this.queuedByClient.get(waiter.clientId) ?? 1) - 1;
+    if (clientQueued > 0) {
+      this.queuedByClient.set(waiter.clientId, clientQueued);
+    } else {
+      this.queuedByClient.delete(waiter.clientId);
+    }
+    return true;
+  }
+}
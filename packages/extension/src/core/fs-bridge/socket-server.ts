@@ -0,0 +1,370 @@
+/**
+ * Local Socket Transport
+ *
+ * Serves bridge commands over a Unix domain socket (POSIX) or named pipe
+ * (Windows) alongside the file-based job queue. Same-host clients skip the
+ * command.json → claim → response.json → done round trip and get events and
+ * the response envelope pushed over one long-lived connection.
+ *
+ * Wire format is NDJSON, one frame per line:
+ *
+ *   client → server
+ *     { "type": "hello", "version": 1, "token": "<from host.json>" }
+ *     { "type": "request", "command": CommandJson }
+ *     { "type": "cancel", "id": "<command id>" }
+ *
+ *   server → client
+ *     { "type": "welcome", "version": 1, "bridgeId": "..." }
+ *     { "type": "event", "id": "<command id>", "event": EventJson }
+ *     { "type": "response", "id": "<command id>", "envelope": ResponseJson | ErrorJson }
+ *     { "type": "error", "message": "..." }   (fatal, connection is closed)
+ *
+ * Requests are multiplexed by command id. Admission (flood protection and the
+ * priority-class scheduler) is shared with the file queue via admitJob(); a
+ * cancel frame also removes a request that is still queued.
+ *
+ * Results past LARGE_DATA_THRESHOLD are not sent inline when the request lists
+ * `accept` (as the CLI does): the data is streamed to
+ * <bridgeDir>/socket-data/<command id>/ exactly as writeResponse() does for a
+ * job directory, and the response envelope carries `dataRef`. The client
+ * reads the file and removes the directory.
+ */
+
+import * as net from 'net';
+import * as os from 'os';
+import * as path from 'path';
+import * as crypto from 'crypto';
+import { promises as fsPromises } from 'fs';
+import {
+  CommandJson,
+  ResponseJson,
+  ErrorJson,
+  EventJson,
+  CancellationError,
+  ErrorCode,
+  SocketEndpoint
+} from './types';
+import {
+  EventWriter,
+  ForwardingEventWriter,
+  admitJob,
+  releaseJob,
+  executeCommandInMemory,
+  serializeResponseData,
+  createErrorEnvelope
+} from './processor';
+import { isValidJobId } from './ids';
+import { ITelemetry } from '../telemetry';
+
+/**
+ * Socket protocol version (independent of the file protocol version)
+ */
+export const SOCKET_PROTOCOL_VERSION = 1;
+
+/**
+ * Largest single frame accepted from a client (dynamic scripts travel inline)
+ */
+export const MAX_FRAME_BYTES = 16 * 1024 * 1024;
+
+/**
+ * Directory under the bridge dir for large socket results (one subdirectory per command id)
+ */
+export const SOCKET_DATA_DIR = 'socket-data';
+
+/**
+ * Unix socket paths are capped at ~104 bytes (macOS) / 108 bytes (Linux)
+ */
+const MAX_UNIX_SOCKET_PATH = 100;
+
+type ClientFrame =
+  | { type: 'hello'; version: number; token: string }
+  | { type: 'request'; command: CommandJson }
+  | { type: 'cancel'; id: string };
+
+type ServerFrame =
+  | { type: 'welcome'; version: number; bridgeId: string }
+  | { type: 'event'; id: string; event: EventJson }
+  | { type: 'response'; id: string; envelope: ResponseJson | ErrorJson }
+  | { type: 'error'; message: string };
+
+/**
+ * Choose the socket path for a bridge
+ *
+ * POSIX: <bridgeDir>/bridge.sock, falling back to the temp dir when the
+ * workspace path is too deep for sockaddr_un. Windows: a named pipe keyed
+ * by bridge ID.
+ */
+export function resolveSocketPath(bridgeDir: string, bridgeId: string): string {
+  if (process.platform === 'win32') {
+    return `\\\\.\\pipe\\vsc-bridge-${bridgeId}`;
+  }
+
+  const inBridgeDir = path.join(bridgeDir, 'bridge.sock');
+  if (inBridgeDir.length < MAX_UNIX_SOCKET_PATH) {
+    return inBridgeDir;
+  }
+  return path.join(os.tmpdir(), `vsc-bridge-${bridgeId}.sock`);
+}
+
+/**
+ * Constant-time token comparison
+ */
+function tokenMatches(expected: string, actual: unknown): boolean {
+  if (typeof actual !== 'string') {
+    return false;
+  }
+  const a = Buffer.from(expected);
+  const b = Buffer.from(actual);
+  return a.length === b.length && crypto.timingSafeEqual(a, b);
+}
+
+/**
+ * Socket server that executes bridge commands in-process
+ */
+export class BridgeSocketServer {
+  private connections = new Set<net.Socket>();
+
+  private constructor(
+    private server: net.Server,
+    public readonly endpoint: SocketEndpoint,
+    private bridgeId: string,
+    private dataDir: string
+  ) {}
+
+  /**
+   * Start listening on the bridge's socket path
+   *
+   * Any stale socket file and result data left by a crashed owner are removed
+   * first; callers only start the server after acquiring host.lock.
+   */
+  static async start(
+    bridgeDir: string,
+    bridgeId: string,
+    executor: (command: CommandJson, eventWriter: EventWriter) => Promise<any>,
+    telemetry?: ITelemetry
+  ): Promise<BridgeSocketServer> {
+    const socketPath = resolveSocketPath(bridgeDir, bridgeId);
+    const dataDir = path.join(bridgeDir, SOCKET_DATA_DIR);
+    const token = crypto.randomBytes(16).toString('hex');
+
+    if (process.platform !== 'win32') {
+      await fsPromises.unlink(socketPath).catch(() => {});
+    }
+    await fsPromises.rm(dataDir, { recursive: true, force: true }).catch(() => {});
+
+    const server = net.createServer();
+    const instance = new BridgeSocketServer(server, { path: socketPath, token }, bridgeId, dataDir);
+    server.on('connection', socket => instance.handleConnection(socket, executor, telemetry));
+
+    await new Promise<void>((resolve, reject) => {
+      server.once('error', reject);
+      server.listen(socketPath, () => {
+        server.off('error', reject);
+        resolve();
+      });
+    });
+
+    server.on('error', err => {
+      console.error(`[SocketServer] Server error: ${err.message}`);
+    });
+
+    if (process.platform !== 'win32') {
+      await fsPromises.chmod(socketPath, 0o600).catch(err => {
+        console.warn(`[SocketServer] Failed to restrict socket permissions: ${err.message}`);
+      });
+    }
+
+    console.log(`[SocketServer] Listening on ${socketPath}`);
+    return instance;
+  }
+
+  /**
+   * Stop accepting connections, drop live ones and remove the socket file and result data
+   */
+  async close(): Promise<void> {
+    for (const socket of this.connections) {
+      socket.destroy();
+    }
+    this.connections.clear();
+
+    await new Promise<void>(resolve => this.server.close(() => resolve()));
+
+    if (process.platform !== 'win32') {
+      await fsPromises.unlink(this.endpoint.path).catch(() => {});
+    }
+    await fsPromises.rm(this.dataDir, { recursive: true, force: true }).catch(() => {});
+  }
+
+  private handleConnection(
+    socket: net.Socket,
+    executor: (command: CommandJson, eventWriter: EventWriter) => Promise<any>,
+    telemetry?: ITelemetry
+  ): void {
+    this.connections.add(socket);
+
+    let authenticated = false;
+    let closing = false;
+    let buffer = '';
+    const cancellers = new Map<string, (err: CancellationError) => void>();
+
+    const sendLine = (line: string): boolean => {
+      if (socket.destroyed) {
+        return false;
+      }
+      socket.write(line + '\n');
+      return true;
+    };
+
+    const send = (frame: ServerFrame): boolean => sendLine(JSON.stringify(frame));
+
+    // Large results go to a data file for clients that read dataRef (see file header)
+    const respond = async (command: CommandJson, envelope: ResponseJson | ErrorJson) => {
+      if (!envelope.ok || !envelope.data || !command.accept || !isValidJobId(command.id)) {
+        send({ type: 'response', id: command.id, envelope });
+        return;
+      }
+
+      const commandDataDir = path.join(this.dataDir, command.id);
+      let serialized: Awaited<ReturnType<typeof serializeResponseData>>;
+      try {
+        serialized = await serializeResponseData(commandDataDir, envelope, command.accept);
+      } catch (err: any) {
+        await fsPromises.rm(commandDataDir, { recursive: true, force: true }).catch(() => {});
+        send({
+          type: 'response',
+          id: command.id,
+          envelope: createErrorEnvelope(ErrorCode.E_INTERNAL, `Failed to write result data: ${err.message}`, command.id, Date.now())
+        });
+        return;
+      }
+
+      if (serialized.inline !== undefined) {
+        sendLine(`{"type":"response","id":${JSON.stringify(command.id)},"envelope":${serialized.inline}}`);
+      } else if (!send({ type: 'response', id: command.id, envelope: serialized.withRef })) {
+        // Nobody is left to read (and remove) the data file
+        await fsPromises.rm(commandDataDir, { recursive: true, force: true }).catch(() => {});
+      }
+    };
+
+    const fail = (message: string) => {
+      closing = true;
+      send({ type: 'error', message });
+      socket.end();
+    };
+
+    const handleRequest = (command: CommandJson) => {
+      if (!command || typeof command.id !== 'string' || typeof command.scriptName !== 'string') {
+        fail('Malformed request frame');
+        return;
+      }
+      if (cancellers.has(command.id)) {
+        fail(`Duplicate request id: ${command.id}`);
+        return;
+      }
+
+      // Cancelling aborts a queued admission and is raced against execution
+      const queued = new AbortController();
+      const cancelled = new Promise<never>((_, reject) => {
+        cancellers.set(command.id, err => {
+          queued.abort();
+          reject(err);
+        });
+      });
+      // Cancellation is raced inside executeCommandInMemory; avoid an
+      // unhandled rejection if the command has already settled
+      cancelled.catch(() => {});
+
+      admitJob(command.id, telemetry, command, queued.signal).then(admission => {
+        if (admission.rejection) {
+          cancellers.delete(command.id);
+          send({ type: 'response', id: command.id, envelope: admission.rejection });
+          return;
+        }
+
+        const ticket = admission.ticket;
+        const eventWriter = new ForwardingEventWriter(event => {
+          send({ type: 'event', id: command.id, event });
+        });
+
+        return executeCommandInMemory(command, executor, eventWriter, cancelled, telemetry, ticket)
+          .then(envelope => respond(command, envelope))
+          .catch(err => console.error(`[SocketServer] Request ${command.id} failed: ${err}`))
+          .finally(() => {
+            cancellers.delete(command.id);
+            releaseJob(command.id, ticket);
+          });
+      });
+    };
+
+    const handleFrame = (frame: ClientFrame) => {
+      if (!authenticated) {
+        if (frame.type !== 'hello' || !tokenMatches(this.endpoint.token, frame.token)) {
+          fail('Authentication failed');
+          return;
+        }
+        if (frame.version !== SOCKET_PROTOCOL_VERSION) {
+          fail(`Unsupported socket protocol version: ${frame.version}`);
+          return;
+        }
+        authenticated = true;
+        send({ type: 'welcome', version: SOCKET_PROTOCOL_VERSION, bridgeId: this.bridgeId });
+        return;
+      }
+
+      switch (frame.type) {
+        case 'request':
+          handleRequest(frame.command);
+          break;
+        case 'cancel':
+          cancellers.get(frame.id)?.(new CancellationError());
+          break;
+        default:
+          fail(`Unknown frame type: ${(frame as any).type}`);
+      }
+    };
+
+    socket.setEncoding('utf8');
+
+    socket.on('data', (chunk: string) => {
+      if (closing) {
+        return;
+      }
+      buffer += chunk;
+      if (buffer.length > MAX_FRAME_BYTES) {
+        fail('Frame too large');
+        buffer = '';
+        return;
+      }
+
+      let newline: number;
+      while (!closing && (newline = buffer.indexOf('\n')) !== -1) {
+        const line = buffer.slice(0, newline).trim();
+        buffer = buffer.slice(newline + 1);
+        if (!line) {
+          continue;
+        }
+
+        let frame: ClientFrame;
+        try {
+          frame = JSON.parse(line);
+        } catch {
+          fail('Invalid JSON frame');
+          return;
+        }
+        handleFrame(frame);
+      }
+    });
+
+    socket.on('error', err => {
+      console.log(`[SocketServer] Connection error: ${err.message}`);
+    });
+
+    socket.on('close', () => {
+      this.connections.delete(socket);
+      // Client went away: nobody is left to read these results
+      for (const cancel of cancellers.values()) {
+        cancel(new CancellationError());
+      }
+    });
+  }
+}
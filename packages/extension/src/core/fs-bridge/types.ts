@@ -34,8 +34,28 @@ export interface CommandJson {
 
   /** Script content for dynamic execution (when scriptName is '@dynamic') */
   scriptContent?: string;
+
+  /**
+   * Hash of the parameter definitions the client already validated params
+   * against; when it matches scriptSchemaHashes the extension skips its own
+   * validation
+   */
+  paramsSchemaHash?: string;
+
+  /**
+   * Large-result encodings this client can read (see ResponseJson.dataRef);
+   * without it, large results are written as plain JSON
+   */
+  accept?: LargeDataEncoding[];
 }
 
+/**
+ * Optional encodings for large results written beside response.json
+ * - ndjson: array results as one JSON value per line
+ * - gzip: compressed data file
+ */
+export type LargeDataEncoding = 'ndjson' | 'gzip';
+
 /**
  * Claim file written atomically to indicate job ownership
  */
@@ -74,6 +94,25 @@ export interface HostJson {
 
   /** Whether WSL awareness is enabled */
   wslAware: boolean;
+
+  /** Local socket / named pipe endpoint (absent when the socket transport is off) */
+  socket?: SocketEndpoint;
+}
+
+/**
+ * Local socket endpoint advertised in host.json
+ *
+ * Clients on the same host connect here instead of writing job directories.
+ * The token must be presented in the hello frame; host.json lives inside the
+ * (gitignored) workspace bridge dir, so anyone able to read it can already
+ * drop jobs into execute/.
+ */
+export interface SocketEndpoint {
+  /** Unix domain socket path or Windows named pipe (\\.\pipe\...) */
+  path: string;
+
+  /** Shared secret required in the hello frame */
+  token: string;
 }
 
 /**
@@ -86,8 +125,13 @@ export interface EventJson {
   /** Sequence number for ordering */
   seq: number;
 
-  /** Event type */
-  type: 'progress' | 'log' | 'warn' | 'error';
+  /**
+   * Event type
+   *
+   * 'record' events carry one streamed result item in `data` (NDJSON
+   * results for scripts that stream instead of returning one large array)
+   */
+  type: 'progress' | 'log' | 'warn' | 'error' | 'record';
 
   /** Log level (for log events) */
   level?: 'debug' | 'info' | 'warn' | 'error';
@@ -121,6 +165,12 @@ export interface ResponseJson {
   /** Reference to separate data file (for >2MB) */
   dataRef?: string;
 
+  /** Layout of the dataRef file: one JSON document (default) or NDJSON array items */
+  dataFormat?: 'json' | 'ndjson';
+
+  /** Compression of the dataRef file */
+  dataEncoding?: 'gzip';
+
   /** Response metadata */
   meta: ResponseMeta;
 
@@ -172,6 +222,15 @@ export interface ResponseMeta {
 
   /** Optional operation name */
   operation?: string;
+
+  /** Scheduler priority class the job ran in */
+  priority?: 'fast' | 'normal' | 'blocking';
+
+  /** Jobs ahead of this one in its class queue when it was queued (0 = started immediately) */
+  queueDepth?: number;
+
+  /** Milliseconds spent waiting for a slot */
+  queueWaitMs?: number;
 }
 
 /**
@@ -201,6 +260,15 @@ export interface BridgeInfo {
 
   /** Recovery timer for stale jobs (if owner) */
   recoveryTimer?: NodeJS.Timeout;
+
+  /** Local socket server (if owner and socket transport enabled) */
+  socketServer?: import('./socket-server').BridgeSocketServer;
+
+  /** In-memory job state index (if owner) */
+  jobIndex?: import('./job-index').JobIndex;
+
+  /** Append-only job journal (if owner) */
+  journal?: import('./journal').JobJournal;
 }
 
 /**
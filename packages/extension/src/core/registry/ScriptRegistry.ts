@@ -7,7 +7,7 @@ import { ResponseEnvelope, ok, fail } from '../response/envelope';
 import { ErrorCode, ErrorMessages } from '../response/errorTaxonomy';
 import { createMeta, updateMetaDuration } from '../response/serialize';
 import { loadModuleFromDisk } from './dynamicLoader';
-import { scriptSchemas, safeValidateScriptParams } from '../../vsc-scripts/generated/schemas';
+import { scriptSchemas, scriptSchemaHashes, safeValidateScriptParams } from '../../vsc-scripts/generated/schemas';
 import { BridgeContext, BridgeContextFactory, withContext } from '../bridge-context';
 import { typeGuards } from '../bridge-context/type-guards';
 import { EditorContextProvider } from '../context/EditorContextProvider';
@@ -18,15 +18,57 @@ import { getScriptMetadata } from '../scripts/decorators';
 // This enables debugging with source maps and replaces dynamic loading
 import * as ScriptClasses from '../../vsc-scripts/index';
 
+/**
+ * Scripts instantiated in the background after activation (most-used first)
+ */
+export const WARM_UP_SCRIPTS = [
+    'debug.status',
+    'breakpoint.set',
+    'debug.start',
+    'debug.continue',
+    'debug.step-over',
+    'debug.list-variables',
+    'debug.stack',
+    'breakpoint.list'
+];
+
+/**
+ * Activation and lazy-loading timings
+ */
+export interface RegistryStats {
+    /** Scripts known from the manifest (and direct registrations) */
+    discovered: number;
+    /** Scripts instantiated so far */
+    loaded: number;
+    /** Time spent in discover() */
+    discoverMs?: number;
+    /** Registry creation to the start of the first job */
+    firstJobMs?: number;
+    /** Registry creation to the start of the first debug.status */
+    firstDebugStatusMs?: number;
+    /** Time spent resolving scripts on first use or warm-up */
+    loadMs: number;
+}
+
 /**
  * Registry for managing and executing scripts
+ *
+ * discover() only records manifest metadata; each script class is resolved
+ * and instantiated on its first execute() (or by warmUp()). The manifest's
+ * exportName snapshot locates baked-in classes without scanning every
+ * decorated export.
  */
 export class ScriptRegistry {
     private scripts: Map<string, ScriptBase> = new Map();
     private manifests: Map<string, ManifestEntry> = new Map();
+    private loading: Map<string, Promise<ScriptBase>> = new Map();
+    private decoratedClasses?: Map<string, any>;
+    private baseDir = '';
     private extensionContext: vscode.ExtensionContext;
     private outputChannel: vscode.OutputChannel;
     private telemetry?: ITelemetry;
+    private createdAt = Date.now();
+    private timings: Omit<RegistryStats, 'discovered' | 'loaded'> = { loadMs: 0 };
 
     constructor(extensionContext: vscode.ExtensionContext, outputChannel: vscode.OutputChannel, telemetry?: ITelemetry) {
         this.extensionContext = extensionContext;
@@ -67,9 +109,11 @@ export class ScriptRegistry {
     }
 
     /**
-     * Discover and load scripts from manifest
+     * Discover scripts from manifest (scripts are loaded on first use)
      */
     async discover(manifestPath: string): Promise<void> {
+        const discoverStart = Date.now();
+
         // Check if manifest exists
         if (!fs.existsSync(manifestPath)) {
             throw new Error(`Manifest not found: ${manifestPath}`);
@@ -79,50 +123,107 @@ export class ScriptRegistry {
         const manifestContent = fs.readFileSync(manifestPath, 'utf-8');
         const manifest: ScriptManifest = JSON.parse(manifestContent);
 
-        console.log(`[ScriptRegistry] 📦 Loading ${Object.keys(manifest.scripts).length} scripts from manifest at ${new Date().toISOString()}`);
+        console.log(`[ScriptRegistry] 📦 Registering ${Object.keys(manifest.scripts).length} scripts from manifest at ${new Date().toISOString()}`);
         console.log(`[ScriptRegistry] Manifest path: ${manifestPath}`);
 
         // Clear existing scripts
-        const previousCount = this.scripts.size;
+        const previousCount = this.manifests.size;
         if (previousCount > 0) {
-            console.log(`[ScriptRegistry] Clearing ${previousCount} previously loaded scripts`);
+            console.log(`[ScriptRegistry] Clearing ${previousCount} previously registered scripts`);
         }
         this.scripts.clear();
         this.manifests.clear();
+        this.loading.clear();
+        this.baseDir = path.dirname(manifestPath);
 
-        // Load each script
+        // Record each script; classes are resolved on first execute()
         for (const [alias, entry] of Object.entries(manifest.scripts)) {
+            this.manifests.set(alias, entry);
+        }
+
+        // Phase 5 Task T006: Validate manifest entries have decorator metadata
+        this.validateDecoratorMetadata(manifest);
+
+        this.timings.discoverMs = Date.now() - discoverStart;
+        console.log(`[ScriptRegistry] ✅ Registered ${this.manifests.size} scripts in ${this.timings.discoverMs}ms (lazy loading)`);
+    }
+
+    /**
+     * Instantiate scripts ahead of their first use, one at a time, yielding
+     * between scripts so queued jobs are not held up
+     *
+     * Failures are logged; execute() reports them when the script is used.
+     */
+    async warmUp(aliases: readonly string[] = WARM_UP_SCRIPTS): Promise<void> {
+        for (const alias of aliases) {
+            if (!this.manifests.has(alias) || this.scripts.has(alias)) {
+                continue;
+            }
+            await new Promise(resolve => setImmediate(resolve));
             try {
-                await this.loadScript(alias, entry, path.dirname(manifestPath));
+                await this.resolveScript(alias);
             } catch (error: any) {
-                console.error(`[ScriptRegistry] Failed to load script ${alias}: ${error.message}`);
+                console.error(`[ScriptRegistry] Warm-up failed for ${alias}: ${error.message}`);
             }
         }
+    }
 
-        // Phase 5 Task T005: Verify script count matches manifest
-        const manifestCount = Object.keys(manifest.scripts).length;
-        const loadedCount = this.scripts.size;
-
-        console.log(`[ScriptRegistry] ✅ Successfully loaded ${loadedCount} scripts at ${new Date().toISOString()}`);
-
-        if (loadedCount !== manifestCount) {
-            console.error(`[ScriptRegistry] ⚠️  WARNING: Script count mismatch!`);
-            console.error(`[ScriptRegistry]    Manifest entries: ${manifestCount}`);
-            console.error(`[ScriptRegistry]    Successfully loaded: ${loadedCount}`);
-            console.error(`[ScriptRegistry]    Missing: ${manifestCount - loadedCount} scripts`);
+    /**
+     * Activation and lazy-loading timings
+     */
+    stats(): RegistryStats {
+        return {
+            discovered: this.listScripts().length,
+            loaded: this.scripts.size,
+            ...this.timings
+        };
+    }
 
-            // Find which scripts failed to load
-            const loadedAliases = new Set(this.scripts.keys());
-            const missingAliases = Object.keys(manifest.scripts).filter(alias => !loadedAliases.has(alias));
-            if (missingAliases.length > 0) {
-                console.error(`[ScriptRegistry]    Failed to load: ${missingAliases.join(', ')}`);
+    /**
+     * Alias -> class for every decorated baked-in script (built once)
+     */
+    private getDecoratedClasses(): Map<string, any> {
+        if (!this.decoratedClasses) {
+            const metadata = getScriptMetadata();
+            this.decoratedClasses = new Map();
+            for (const value of Object.values(ScriptClasses)) {
+                if (typeof value === 'function') {
+                    const scriptName = metadata.get(value);
+                    if (scriptName) {
+                        this.decoratedClasses.set(scriptName, value);
+                    }
+                }
             }
-        } else {
-            console.log(`[ScriptRegistry] ✅ All ${loadedCount} manifest scripts loaded successfully`);
         }
+        return this.decoratedClasses;
+    }
 
-        // Phase 5 Task T006: Validate manifest entries have decorator metadata
-        this.validateDecoratorMetadata(manifest);
+    /**
+     * Instantiated script for an alias, loading it on first use
+     *
+     * Concurrent first calls share one load; a failed load is retried on the
+     * next call.
+     */
+    private resolveScript(alias: string): Promise<ScriptBase> | ScriptBase | undefined {
+        const loaded = this.scripts.get(alias);
+        if (loaded) {
+            return loaded;
+        }
+        const entry = this.manifests.get(alias);
+        if (!entry) {
+            return undefined;
+        }
+
+        let pending = this.loading.get(alias);
+        if (!pending) {
+            const loadStart = Date.now();
+            pending = this.loadScript(alias, entry, this.baseDir).finally(() => {
+                this.loading.delete(alias);
+                this.timings.loadMs += Date.now() - loadStart;
+            });
+            this.loading.set(alias, pending);
+        }
+        return pending;
     }
 
     /**
@@ -132,18 +233,7 @@ export class ScriptRegistry {
      * which would fail at runtime when registry can't find them.
      */
     private validateDecoratorMetadata(manifest: ScriptManifest): void {
-        const metadata = getScriptMetadata();
-        const decoratedAliases = new Set<string>();
-
-        // Collect all aliases from decorated classes
-        for (const value of Object.values(ScriptClasses)) {
-            if (typeof value === 'function') {
-                const scriptName = metadata.get(value);
-                if (scriptName) {
-                    decoratedAliases.add(scriptName);
-                }
-            }
-        }
+        const decoratedAliases = new Set(this.getDecoratedClasses().keys());
 
         // Check each manifest entry has decorator
         const missingDecorators: string[] = [];
@@ -187,22 +277,19 @@ export class ScriptRegistry {
      * enabling full debugging support. Falls back to dynamic loading only for
      * @dynamic scripts loaded at runtime.
      */
-    private async loadScript(alias: string, entry: ManifestEntry, baseDir: string): Promise<void> {
+    private async loadScript(alias: string, entry: ManifestEntry, baseDir: string): Promise<ScriptBase> {
         const scriptPath = path.join(baseDir, entry.scriptRelPath);
 
-        // Get decorator metadata for all statically imported scripts
-        const metadata = getScriptMetadata();
-
-        // Try to find script class by decorator metadata (baked-in scripts)
+        // Build-time snapshot: the manifest names the exported class
         let ScriptClass: any;
-        for (const [key, value] of Object.entries(ScriptClasses)) {
-            if (typeof value === 'function') {
-                const scriptName = metadata.get(value);
-                if (scriptName === alias) {
-                    ScriptClass = value;
-                    console.log(`[ScriptRegistry]   ✔ Found script via decorator: ${alias} (${key})`);
-                    break;
-                }
+        const snapshotClass = entry.exportName ? (ScriptClasses as Record<string, any>)[entry.exportName] : undefined;
+        if (typeof snapshotClass === 'function' && getScriptMetadata().get(snapshotClass) === alias) {
+            ScriptClass = snapshotClass;
+        } else {
+            // Try to find script class by decorator metadata (baked-in scripts)
+            ScriptClass = this.getDecoratedClasses().get(alias);
+            if (ScriptClass) {
+                console.log(`[ScriptRegistry]   ✔ Found script via decorator: ${alias} (${ScriptClass.name})`);
             }
         }
 
@@ -257,9 +344,9 @@ export class ScriptRegistry {
 
         // Register the script
         this.scripts.set(alias, script);
-        this.manifests.set(alias, entry);
 
-        console.log(`[ScriptRegistry]   ✔ Registered: ${alias}`);
+        console.log(`[ScriptRegistry]   ✔ Loaded: ${alias}`);
+        return script;
     }
 
 
@@ -273,7 +360,8 @@ export class ScriptRegistry {
         requestId: string,
         mode: 'normal' | 'danger',
         signal?: AbortSignal,
-        alias?: string
+        alias?: string,
+        emitRecord?: (record: unknown) => void
     ): Promise<any> {
         if (!this.extensionContext) {
             throw new Error('Extension context not initialized');
@@ -281,11 +369,12 @@ export class ScriptRegistry {
 
         // Create BridgeContext for this execution with request metadata
         // Pass shared outputChannel for dependency injection
+        // The shared context is created once; request options live on a per-request view
         const bridgeContext = BridgeContextFactory.create(this.extensionContext, {
             outputChannel: this.outputChannel,
             signal,
             mode
-        } as any);
+        } as any).forRequest({ signal, mode, emitRecord });
 
         // Set request metadata for logging correlation
         bridgeContext.setRequestMetadata({
@@ -312,7 +401,7 @@ export class ScriptRegistry {
      * This allows dynamic scripts to use the same execution pipeline as regular scripts
      */
     private async createDynamicScript(scriptContent: string): Promise<any> {
-        const { loadDynamicModule } = await import('../dynamic/loadDynamicModule');
+        const { loadDynamicModule, dynamicModuleCacheStats } = await import('../dynamic/loadDynamicModule');
         const vscode = await import('vscode');
         
         try {
@@ -320,6 +409,12 @@ export class ScriptRegistry {
             // This allows dynamic scripts to require extension modules from the out/ directory
             const extensionRoot = this.extensionContext?.extensionPath;
             const moduleExports = loadDynamicModule(scriptContent, vscode, extensionRoot);
+
+            const cacheStats = dynamicModuleCacheStats();
+            this.outputChannel.appendLine(
+                `📦 Compiled module cache: ${cacheStats.hits} hits / ${cacheStats.misses} misses ` +
+                `(${Math.round(cacheStats.hitRate * 100)}%, ${cacheStats.entries} cached)`
+            );
             
             // Create a virtual script object that matches the ScriptBase interface
             const virtualScript = {
@@ -356,6 +451,10 @@ export class ScriptRegistry {
 
     /**
      * Execute a script by alias
+     *
+     * @param paramsSchemaHash - Set by clients that already validated params
+     *   (CLI, MCP server); skips schema validation when it matches the hash
+     *   of the generated schema
      */
     async execute(
         alias: string,
@@ -363,11 +462,22 @@ export class ScriptRegistry {
         requestId: string,
         mode: 'normal' | 'danger',
         signal?: AbortSignal,
-        scriptContent?: string
+        scriptContent?: string,
+        emitRecord?: (record: unknown) => void,
+        paramsSchemaHash?: string
     ): Promise<ResponseEnvelope> {
         const startTime = Date.now();
         const meta = createMeta(requestId, mode, alias);
 
+        // Activation-to-first-job latency
+        if (this.timings.firstJobMs === undefined) {
+            this.timings.firstJobMs = startTime - this.createdAt;
+            this.outputChannel.appendLine(`[ScriptRegistry] First job (${alias}) ${this.timings.firstJobMs}ms after registry creation`);
+        }
+        if (alias === 'debug.status' && this.timings.firstDebugStatusMs === undefined) {
+            this.timings.firstDebugStatusMs = startTime - this.createdAt;
+        }
+
         // Send ScriptExecutionStarted event (T008, T010)
         try {
             if (this.telemetry?.isEnabled()) {
@@ -394,7 +504,7 @@ export class ScriptRegistry {
 
                 // Use the SAME execution pipeline as regular scripts
                 // This ensures dynamic scripts get BridgeContext, AsyncLocalStorage isolation, etc.
-                const result = await this.executeScript(dynamicScript, params, requestId, mode, signal, '@dynamic');
+                const result = await this.executeScript(dynamicScript, params, requestId, mode, signal, '@dynamic', emitRecord);
 
                 // Capture editor context for enrichment (per Discovery 03)
                 const contextStart = Date.now();
@@ -460,8 +570,19 @@ export class ScriptRegistry {
             }
         }
 
-        // Find script
-        const script = this.scripts.get(alias);
+        // Find script (loaded on first use)
+        let script: any;
+        try {
+            script = await this.resolveScript(alias);
+        } catch (error: any) {
+            console.error(`[ScriptRegistry] Failed to load script ${alias}: ${error.message}`);
+            return fail(
+                ErrorCode.E_SCRIPT_NOT_FOUND,
+                ErrorMessages[ErrorCode.E_SCRIPT_NOT_FOUND],
+                { alias, error: error.message },
+                updateMetaDuration(meta)
+            );
+        }
         if (!script) {
             return fail(
                 ErrorCode.E_SCRIPT_NOT_FOUND,
@@ -477,8 +598,12 @@ export class ScriptRegistry {
         // Three-tier validation system
         let validatedParams = params;
 
+        // Params validated and coerced by the client against the same parameter
+        // definitions the schema was generated from skip Tiers 1 and 2
+        const prevalidated = !!paramsSchemaHash && paramsSchemaHash === scriptSchemaHashes[alias];
+
         // Tier 1: Check for generated schema (baked-in scripts)
-        if (scriptSchemas[alias as keyof typeof scriptSchemas]) {
+        if (!prevalidated && scriptSchemas[alias as keyof typeof scriptSchemas]) {
             const validation = safeValidateScriptParams(alias as keyof typeof scriptSchemas, params);
             if (!validation.success) {
                 return fail(
@@ -497,7 +622,7 @@ export class ScriptRegistry {
             validatedParams = validation.data;
         }
         // Tier 2: Check for script's own validation (dynamic scripts)
-        else if (script.paramsSchema || script.validateParams) {
+        else if (!prevalidated && (script.paramsSchema || script.validateParams)) {
             const validation = script.validateParams ?
                 script.validateParams(params) :
                 { success: true, data: params };
@@ -522,7 +647,7 @@ export class ScriptRegistry {
 
         try {
             // Execute the script with validated parameters and BridgeContext
-            const result = await this.executeScript(script, validatedParams, requestId, mode, signal, alias);
+            const result = await this.executeScript(script, validatedParams, requestId, mode, signal, alias, emitRecord);
 
             // Capture editor context for enrichment (per Discovery 03)
             const contextStart = Date.now();
@@ -760,7 +885,7 @@ export class ScriptRegistry {
      * List all registered script aliases
      */
     listScripts(): string[] {
-        return Array.from(this.scripts.keys());
+        return Array.from(new Set([...this.manifests.keys(), ...this.scripts.keys()]));
     }
 
     /**
@@ -774,7 +899,7 @@ export class ScriptRegistry {
      * Check if a script exists
      */
     hasScript(alias: string): boolean {
-        return this.scripts.has(alias);
+        return this.scripts.has(alias) || this.manifests.has(alias);
     }
 
     /**
@@ -0,0 +1,221 @@
+import { ResponseEnvelope, fail } from '../response/envelope';
+import { ErrorCode, ErrorMessages } from '../response/errorTaxonomy';
+import { createMeta, updateMetaDuration } from '../response/serialize';
+import { ScriptMetadata } from '../discovery/types';
+
+/**
+ * Reserved script name for batch jobs (like '@dynamic', never a registry alias)
+ */
+export const BATCH_SCRIPT_NAME = '@batch';
+
+/**
+ * Upper bound on steps per batch, so one job cannot monopolise a slot indefinitely
+ */
+export const MAX_BATCH_STEPS = 100;
+
+/**
+ * One script invocation inside a batch
+ */
+export interface BatchStep {
+    scriptName: string;
+    params?: Record<string, unknown>;
+    /** Client-side validation hash (see CommandJson.paramsSchemaHash) */
+    paramsSchemaHash?: string;
+}
+
+/**
+ * Params carried by a '@batch' command
+ */
+export interface BatchParams {
+    steps: BatchStep[];
+    /** Stop at the first failing step; remaining steps are reported as skipped */
+    stopOnError?: boolean;
+}
+
+/**
+ * Outcome of a single step
+ */
+export interface BatchStepResult {
+    index: number;
+    scriptName: string;
+    ok: boolean;
+    durationMs: number;
+    envelope: ResponseEnvelope;
+}
+
+/**
+ * Data returned for a batch job
+ */
+export interface BatchResult {
+    steps: BatchStepResult[];
+    total: number;
+    succeeded: number;
+    failed: number;
+    skipped: number;
+    stoppedEarly: boolean;
+    durationMs: number;
+}
+
+/**
+ * Subset of ScriptRegistry used to run steps
+ */
+export interface BatchScriptRunner {
+    getMetadata(alias: string): ScriptMetadata | undefined;
+    execute(
+        alias: string,
+        params: unknown,
+        requestId: string,
+        mode: 'normal' | 'danger',
+        signal?: AbortSignal,
+        scriptContent?: string,
+        emitRecord?: (record: unknown) => void,
+        paramsSchemaHash?: string
+    ): Promise<ResponseEnvelope>;
+}
+
+export interface BatchOptions {
+    requestId: string;
+    mode: 'normal' | 'danger';
+    signal?: AbortSignal;
+    /** Called before each step starts (progress reporting) */
+    onStep?: (index: number, total: number, scriptName: string) => void;
+}
+
+/**
+ * Validate and normalise '@batch' params
+ *
+ * @throws Error with a message suitable for an E_INVALID_PARAMS response
+ */
+export function parseBatchParams(params: unknown): BatchParams {
+    const raw = params as Partial<BatchParams> | undefined;
+    if (!raw || !Array.isArray(raw.steps)) {
+        throw new Error('Batch params must include a "steps" array');
+    }
+    if (raw.steps.length === 0) {
+        throw new Error('Batch must contain at least one step');
+    }
+    if (raw.steps.length > MAX_BATCH_STEPS) {
+        throw new Error(`Batch has ${raw.steps.length} steps (maximum ${MAX_BATCH_STEPS})`);
+    }
+
+    const steps = raw.steps.map((step, index) => {
+        if (!step || typeof step.scriptName !== 'string' || !step.scriptName) {
+            throw new Error(`Batch step ${index} is missing "scriptName"`);
+        }
+        if (step.scriptName.startsWith('@')) {
+            throw new Error(`Batch step ${index}: '${step.scriptName}' cannot be used inside a batch`);
+        }
+        if (step.params !== undefined && (typeof step.params !== 'object' || step.params === null || Array.isArray(step.params))) {
+            throw new Error(`Batch step ${index}: "params" must be an object`);
+        }
+        return {
+            scriptName: step.scriptName,
+            params: step.params ?? {},
+            ...(typeof step.paramsSchemaHash === 'string' && { paramsSchemaHash: step.paramsSchemaHash })
+        };
+    });
+
+    return { steps, stopOnError: raw.stopOnError === true };
+}
+
+/**
+ * Run batch steps in order through the script registry
+ *
+ * Each step goes through the same lookup, danger-mode gate and
+ * ScriptRegistry.execute() pipeline as a standalone job, but all of them
+ * share a single claimed job on the bridge.
+ */
+export async function executeBatch(
+    runner: BatchScriptRunner,
+    batch: BatchParams,
+    options: BatchOptions
+): Promise<BatchResult> {
+    const startTime = Date.now();
+    const results: BatchStepResult[] = [];
+    let stoppedEarly = false;
+
+    for (let index = 0; index < batch.steps.length; index++) {
+        // A cancelled job runs no further steps; they are reported as skipped
+        if (options.signal?.aborted) {
+            stoppedEarly = true;
+            break;
+        }
+
+        const step = batch.steps[index];
+        options.onStep?.(index, batch.steps.length, step.scriptName);
+
+        const stepStart = Date.now();
+        const envelope = await runStep(runner, step, `${options.requestId}-${index}`, options);
+        results.push({
+            index,
+            scriptName: step.scriptName,
+            ok: envelope.ok,
+            durationMs: Date.now() - stepStart,
+            envelope
+        });
+
+        if (!envelope.ok && batch.stopOnError) {
+            stoppedEarly = index < batch.steps.length - 1;
+            break;
+        }
+    }
+
+    const succeeded = results.filter(r => r.ok).length;
+    return {
+        steps: results,
+        total: batch.steps.length,
+        succeeded,
+        failed: results.length - succeeded,
+        skipped: batch.steps.length - results.length,
+        stoppedEarly,
+        durationMs: Date.now() - startTime
+    };
+}
+
+async function runStep(
+    runner: BatchScriptRunner,
+    step: BatchStep,
+    stepId: string,
+    options: BatchOptions
+): Promise<ResponseEnvelope> {
+    const meta = createMeta(stepId, options.mode, step.scriptName);
+
+    const metadata = runner.getMetadata(step.scriptName);
+    if (!metadata) {
+        return fail(
+            ErrorCode.E_SCRIPT_NOT_FOUND,
+            `Script '${step.scriptName}' not found`,
+            { alias: step.scriptName },
+            updateMetaDuration(meta)
+        );
+    }
+
+    if ((metadata as any).dangerOnly === true && options.mode !== 'danger') {
+        return fail(
+            ErrorCode.E_DANGER_MODE_REQUIRED,
+            ErrorMessages[ErrorCode.E_DANGER_MODE_REQUIRED],
+            { alias: step.scriptName },
+            updateMetaDuration(meta)
+        );
+    }
+
+    try {
+        return await runner.execute(
+            step.scriptName,
+            step.params ?? {},
+            stepId,
+            options.mode,
+            options.signal,
+            undefined,
+            undefined,
+            step.paramsSchemaHash
+        );
+    } catch (error: any) {
+        return fail(
+            ErrorCode.E_INTERNAL,
+            error?.message || 'Script execution failed',
+            { error: String(error) },
+            updateMetaDuration(meta)
+        );
+    }
+}
@@ -4,6 +4,16 @@ import * as path from 'node:path';
 import * as os from 'node:os';
 import { pathToFileURL } from 'node:url';
 import { createRequire } from 'node:module';
+import { CompiledModuleCache } from '../dynamic/compiledModuleCache';
+import type { ICompiledModuleCacheStats } from '../dynamic/compiledModuleCache';
+
+/** Loaded modules by resolved path, versioned by mtime and size */
+const diskModules = new CompiledModuleCache<any>();
+
+/** Hit/miss counters of the on-disk module cache */
+export function diskModuleCacheStats(): ICompiledModuleCacheStats {
+  return diskModules.stats();
+}
 
 /** Detect WSL (works for WSL1/WSL2) */
 export function isWSL(): boolean {
@@ -22,7 +32,12 @@ function normalizeForPlatform(p: string): string {
   return path.normalize(p);
 }
 
-/** Load a JS module from disk (CJS-first, ESM fallback). */
+/**
+ * Load a JS module from disk (CJS-first, ESM fallback).
+ *
+ * CJS modules are reused while the file's mtime and size are unchanged; an
+ * edited file is reloaded (require cache cleared) on its next load.
+ */
 export async function loadModuleFromDisk(absPath: string): Promise<any> {
   const normalized = normalizeForPlatform(absPath);
   if (!fs.existsSync(normalized)) {
@@ -45,9 +60,12 @@ export async function loadModuleFromDisk(absPath: string): Promise<any> {
   // Try CommonJS first (your scripts are CJS today).
   try {
     const resolved = realRequire.resolve(normalized);
-    // Optional: hot-reload in dev
-    delete (realRequire as any).cache?.[resolved];
-    return realRequire(normalized);
+    const stat = fs.statSync(resolved);
+    return diskModules.get(resolved, () => {
+      // Hot-reload: the file is new or changed since it was last loaded
+      delete (realRequire as any).cache?.[resolved];
+      return realRequire(normalized);
+    }, `${stat.mtimeMs}:${stat.size}`);
   } catch (err: any) {
     // If the target is ESM, CJS loader throws ERR_REQUIRE_ESM — fall back to ESM import.
     if (err?.code === 'ERR_REQUIRE_ESM' || /must use import/i.test(String(err))) {
@@ -0,0 +1,142 @@
+/**
+ * Pause Cache
+ *
+ * Memoizes read-only DAP requests (threads, stackTrace, scopes, variables)
+ * for the current pause of one debug session. Tools called back to back at
+ * the same breakpoint (list-variables, get-variable, scopes, evaluate) then
+ * share one round-trip per unique thread, frame and variables reference.
+ *
+ * Per Critical Discovery 02, references are only valid while paused: the
+ * owning adapter invalidates the cache from its lifecycle hooks (stack item
+ * change, DAP `stopped`/`continued`/`invalidated`/`terminated` via the debug
+ * event hub, session end), when a step or continue is sent, and after any
+ * request that can change program state. Each invalidation starts a new epoch; responses that
+ * arrive for an older epoch are not kept.
+ *
+ * - Concurrent identical requests share one in-flight promise
+ * - Failed requests are not cached, so a retry reaches the debug adapter
+ * - Entries are capped; the oldest are evicted first
+ */
+
+/**
+ * DAP requests whose responses only change when execution resumes
+ */
+export const PAUSE_CACHEABLE_COMMANDS: ReadonlySet<string> = new Set([
+    'threads',
+    'stackTrace',
+    'scopes',
+    'variables'
+]);
+
+/**
+ * Arguments that identify a cached response
+ */
+const KEY_ARGS = ['threadId', 'startFrame', 'levels', 'frameId', 'variablesReference', 'filter', 'start', 'count', 'format'];
+
+/**
+ * DAP defaults: `start: 0` and an omitted start are the same request
+ */
+const DEFAULT_ARGS: Record<string, unknown> = { startFrame: 0, start: 0 };
+
+/**
+ * Default cap on cached responses per session
+ */
+const DEFAULT_MAX_ENTRIES = 5000;
+
+/**
+ * Pause cache counters
+ */
+export interface IPauseCacheStats {
+    /** Invalidations so far (one per pause, frame change, ...) */
+    epoch: number;
+
+    /** Requests answered from the cache, cumulative for the session */
+    hits: number;
+
+    /** Requests sent to the debug adapter, cumulative for the session */
+    misses: number;
+
+    /** Responses currently cached */
+    entries: number;
+}
+
+/**
+ * Per-session cache of read-only DAP responses for the current pause
+ */
+export class PauseCache {
+    private entries = new Map<string, Promise<any>>();
+    private epoch = 0;
+    private hits = 0;
+    private misses = 0;
+
+    constructor(private readonly maxEntries: number = DEFAULT_MAX_ENTRIES) {}
+
+    /**
+     * Cache key for a request, or undefined if it is not cacheable
+     */
+    static key(command: string, args?: any): string | undefined {
+        if (!PAUSE_CACHEABLE_COMMANDS.has(command)) {
+            return undefined;
+        }
+        const parts = [command];
+        for (const name of KEY_ARGS) {
+            if (args?.[name] !== undefined && args[name] !== DEFAULT_ARGS[name]) {
+                parts.push(`${name}=${typeof args[name] === 'object' ? JSON.stringify(args[name]) : args[name]}`);
+            }
+        }
+        return parts.join('|');
+    }
+
+    /**
+     * Response for `command`/`args`, sending it via `send` on a miss
+     */
+    get(command: string, args: any, send: () => PromiseLike<any>): Promise<any> {
+        const key = PauseCache.key(command, args);
+        if (key === undefined) {
+            return Promise.resolve(send());
+        }
+
+        const cached = this.entries.get(key);
+        if (cached) {
+            this.hits++;
+            return cached;
+        }
+
+        this.misses++;
+        const epoch = this.epoch;
+        const response = Promise.resolve(send());
+        this.entries.set(key, response);
+        response.catch(() => {
+            // Don't keep failures (and never touch a newer epoch's entry)
+            if (this.epoch === epoch && this.entries.get(key) === response) {
+                this.entries.delete(key);
+            }
+        });
+
+        if (this.entries.size > this.maxEntries) {
+            this.entries.delete(this.entries.keys().next().value!);
+        }
+
+        return response;
+    }
+
+    /**
+     * Drop all cached responses; the next pause starts empty
+     */
+    invalidate(): void {
+        this.entries = new Map();
+        this.epoch++;
+    }
+
+    /**
+     * Hit/miss counters and current size
+     */
+    stats(): IPauseCacheStats {
+        return {
+            epoch: this.epoch,
+            hits: this.hits,
+            misses: this.misses,
+            entries: this.entries.size
+        };
+    }
+}
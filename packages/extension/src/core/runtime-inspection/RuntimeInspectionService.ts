@@ -133,6 +133,35 @@ export class RuntimeInspectionService {
         return adapter;
     }
 
+    /**
+     * DAP request function for a session, served through its adapter's pause
+     * cache when the session's language is supported
+     * @param session Debug session the requests go to
+     * @param noCache Drop the session's cached responses first
+     */
+    public requestFor(
+        session: vscode.DebugSession,
+        noCache: boolean = false
+    ): (command: string, args?: any) => Promise<any> {
+        const adapter = this.getAdapter(this.sessions.has(session.id) ? session.id : undefined);
+        if ('code' in adapter || adapter.session.id !== session.id) {
+            return async (command, args) => session.customRequest(command, args);
+        }
+
+        if (noCache) {
+            adapter.invalidateCache();
+        }
+        return (command, args) => adapter.request(command, args);
+    }
+
+    /**
+     * Drop a session's cached DAP responses (no-op without an adapter)
+     * @param sessionId Session ID
+     */
+    public invalidateCache(sessionId: string): void {
+        this.adapters.get(sessionId)?.invalidateCache();
+    }
+
     /**
      * Dispose adapter for a session
      * @param sessionId Session ID
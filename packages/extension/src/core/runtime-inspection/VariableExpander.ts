@@ -0,0 +1,319 @@
+/**
+ * Variable Expansion Engine
+ *
+ * Depth-limited expansion of DAP variables for listVariables(), with the
+ * `variables` round-trips pipelined. The tree is still built by one
+ * sequential depth-first pass, so cycle marking, truncation and memory
+ * budget accounting happen in exactly the order a one-request-at-a-time
+ * walk would use. Ahead of that pass, a bounded pool fetches the children
+ * of the siblings it will reach next. Most awaits then find the response
+ * already there.
+ *
+ * - Requests are deduplicated by variablesReference: a shared object or a
+ *   cycle target is fetched once
+ * - Prefetch runs the adapter's inspect() check first, so anything an
+ *   adapter declines to expand (Python properties, generators) is never
+ *   fetched speculatively either
+ * - Prefetch stops once the budget is exhausted or the operation is aborted
+ */
+
+import { IVariableData } from './interfaces';
+import { IMemoryBudget } from './MemoryBudget';
+import { DapRequest } from './VariableStream';
+
+/**
+ * Variable with expansion results, as returned by listVariables()
+ */
+export interface IExpandedVariableData extends IVariableData {
+    children?: IExpandedVariableData[];
+    childrenShown?: number;
+    totalChildren?: number;
+    childrenTruncated?: boolean;
+    truncated?: boolean;
+    truncatedReason?: 'maxDepth' | 'budget' | 'maxChildren';
+    expandable?: boolean;
+    cycle?: boolean;
+    originalValue?: string;
+    cycleVia?: 'variablesReference' | 'Object.is';
+    cycleTarget?: string;
+    error?: string;
+}
+
+/**
+ * Options for VariableExpander
+ */
+export interface IVariableExpanderOptions {
+    /** Variables at this depth are returned unexpanded */
+    maxDepth: number;
+
+    /** Children requested (and expanded) per variable */
+    maxChildren: number;
+
+    /** Background variables/evaluate requests in flight at once */
+    concurrency: number;
+
+    budget: IMemoryBudget;
+
+    estimateSize(variable: IVariableData): number;
+
+    /**
+     * Adapter-specific check before a variable is expanded; return a finished
+     * node to stop there (properties, special types, Object.is() cycles)
+     */
+    inspect?(variable: IVariableData, ancestors: IVariableData[]): Promise<IExpandedVariableData | undefined>;
+
+    signal?: AbortSignal;
+}
+
+/**
+ * Deferred request: queued until a pool slot frees up or the walk needs it
+ */
+interface IScheduled<T> {
+    promise: Promise<T>;
+    /** Start now, regardless of the pool limit */
+    promote(): void;
+}
+
+interface IQueuedJob {
+    started: boolean;
+    start(): void;
+}
+
+/**
+ * Pipelined listVariables() expansion for one paused frame
+ */
+export class VariableExpander {
+    private readonly visited = new Set<number>();
+    private readonly fetches = new Map<number, IScheduled<IVariableData[]>>();
+    private readonly inspections = new Map<IVariableData, IScheduled<IExpandedVariableData | undefined>>();
+    private readonly waiting: IQueuedJob[] = [];
+    private active = 0;
+
+    constructor(
+        private readonly request: DapRequest,
+        private readonly options: IVariableExpanderOptions
+    ) {}
+
+    /**
+     * Expand a list of sibling variables (e.g. one scope's variables)
+     */
+    async expandAll(variables: IVariableData[], depth: number = 1): Promise<IExpandedVariableData[]> {
+        this.prefetch(variables, depth, []);
+
+        const expanded: IExpandedVariableData[] = [];
+        for (const variable of variables) {
+            expanded.push(await this.expand(variable, depth, []));
+        }
+        return expanded;
+    }
+
+    /**
+     * Expand one variable depth-first
+     */
+    async expand(
+        variable: IVariableData,
+        depth: number,
+        ancestors: IVariableData[]
+    ): Promise<IExpandedVariableData> {
+        const { maxDepth, maxChildren, budget, signal } = this.options;
+
+        if (signal?.aborted) {
+            throw new Error('Operation aborted');
+        }
+
+        if (depth >= maxDepth) {
+            return {
+                ...variable,
+                truncated: true,
+                truncatedReason: 'maxDepth',
+                expandable: variable.variablesReference > 0
+            };
+        }
+
+        if (variable.variablesReference === 0) {
+            return variable;
+        }
+
+        // Cycle detection: variablesReference tracking
+        if (this.visited.has(variable.variablesReference)) {
+            return {
+                ...variable,
+                cycle: true,
+                value: '[Circular Reference]',
+                originalValue: variable.value,
+                cycleVia: 'variablesReference'
+            };
+        }
+
+        const stop = await this.claim(this.inspection(variable, ancestors, false));
+        if (stop) {
+            return stop;
+        }
+
+        this.visited.add(variable.variablesReference);
+
+        try {
+            const allChildren = await this.claim(this.fetch(variable.variablesReference, false));
+            const childrenToExpand = allChildren.slice(0, maxChildren);
+            const newAncestors = [...ancestors, variable];
+
+            this.prefetch(childrenToExpand, depth + 1, newAncestors);
+
+            const expandedChildren: IExpandedVariableData[] = [];
+            for (const child of childrenToExpand) {
+                // Check memory budget before expanding
+                if (!budget.addNode(this.options.estimateSize(child)).ok) {
+                    return {
+                        ...variable,
+                        children: expandedChildren,
+                        childrenShown: expandedChildren.length,
+                        totalChildren: allChildren.length,
+                        truncated: true,
+                        truncatedReason: 'budget'
+                    };
+                }
+
+                expandedChildren.push(await this.expand(child, depth + 1, newAncestors));
+            }
+
+            return {
+                ...variable,
+                children: expandedChildren,
+                childrenShown: childrenToExpand.length,
+                totalChildren: variable.namedVariables || variable.indexedVariables || allChildren.length,
+                childrenTruncated: allChildren.length > maxChildren
+            };
+        } catch (error) {
+            return {
+                ...variable,
+                error: error instanceof Error ? error.message : String(error),
+                expandable: true
+            };
+        }
+    }
+
+    /**
+     * Children of a variables reference, fetched once per reference
+     *
+     * Also usable on its own by adapters with their own expansion rules.
+     */
+    children(variablesReference: number): Promise<IVariableData[]> {
+        return this.claim(this.fetch(variablesReference, false));
+    }
+
+    /**
+     * Start fetching, in the background, the children the walk will visit
+     * next among `variables` (which sit at `depth`)
+     */
+    prefetch(variables: IVariableData[], depth: number, ancestors: IVariableData[]): void {
+        if (depth >= this.options.maxDepth || this.stopped()) {
+            return;
+        }
+
+        // The queue is LIFO; push in reverse so the first sibling runs first
+        for (let i = variables.length - 1; i >= 0; i--) {
+            const variable = variables[i];
+            const ref = variable.variablesReference;
+            if (ref === 0 || this.visited.has(ref) || this.fetches.has(ref)) {
+                continue;
+            }
+            this.inspection(variable, ancestors, true).promise.then(stop => {
+                if (!stop && !this.stopped()) {
+                    this.fetch(ref, true);
+                }
+            }, () => undefined);
+        }
+    }
+
+    private stopped(): boolean {
+        return this.options.signal?.aborted === true || this.options.budget.isExceeded();
+    }
+
+    private claim<T>(scheduled: IScheduled<T>): Promise<T> {
+        scheduled.promote();
+        return scheduled.promise;
+    }
+
+    private fetch(variablesReference: number, background: boolean): IScheduled<IVariableData[]> {
+        let scheduled = this.fetches.get(variablesReference);
+        if (!scheduled) {
+            scheduled = this.schedule(async () => {
+                const response = await this.request('variables', {
+                    variablesReference,
+                    count: this.options.maxChildren
+                });
+                return (response?.variables || []) as IVariableData[];
+            }, background);
+            this.fetches.set(variablesReference, scheduled);
+        }
+        return scheduled;
+    }
+
+    private inspection(
+        variable: IVariableData,
+        ancestors: IVariableData[],
+        background: boolean
+    ): IScheduled<IExpandedVariableData | undefined> {
+        const inspect = this.options.inspect;
+        if (!inspect) {
+            return { promise: Promise.resolve(undefined), promote: () => undefined };
+        }
+
+        let scheduled = this.inspections.get(variable);
+        if (!scheduled) {
+            scheduled = this.schedule(() => inspect(variable, ancestors), background);
+            this.inspections.set(variable, scheduled);
+        }
+        return scheduled;
+    }
+
+    /**
+     * Run `task` now (foreground) or when a pool slot frees up (background)
+     */
+    private schedule<T>(task: () => Promise<T>, background: boolean): IScheduled<T> {
+        let open!: () => void;
+        const gate = new Promise<void>(resolve => {
+            open = resolve;
+        });
+        const job: IQueuedJob = {
+            started: false,
+            start: () => {
+                if (job.started) {
+                    return;
+                }
+                job.started = true;
+                this.active++;
+                open();
+            }
+        };
+
+        const promise = gate.then(task).finally(() => {
+            this.active--;
+            this.pump();
+        });
+        // Background results may never be awaited; errors surface to whoever does
+        promise.catch(() => undefined);
+
+        if (background) {
+            this.waiting.push(job);
+            this.pump();
+        } else {
+            job.start();
+        }
+
+        return { promise, promote: job.start };
+    }
+
+    private pump(): void {
+        if (this.stopped()) {
+            this.waiting.length = 0;
+            return;
+        }
+        while (this.active < this.options.concurrency && this.waiting.length > 0) {
+            const job = this.waiting.pop()!;
+            if (!job.started) {
+                job.start();
+            }
+        }
+    }
+}
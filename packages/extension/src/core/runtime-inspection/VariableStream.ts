@@ -0,0 +1,452 @@
+/**
+ * Variable Streaming
+ *
+ * Depth-first traversal of a DAP variable tree that emits one record per node
+ * as it goes, for structures too large for listVariables(). Only the open path
+ * is held in memory (one page of siblings per level), so dumping hundreds of
+ * thousands of nodes costs about as much as dumping one page.
+ *
+ * - The memory budget paces the walk instead of ending it: once a budget's
+ *   worth of records has been produced, the walk waits for the sink to flush,
+ *   resets the budget and carries on.
+ * - A walk stopped early (maxNodes, cancellation, timeout) reports its open
+ *   path as a cursor. Variable references are only valid while paused, so a
+ *   cursor resumes the walk only until execution continues. A resumed walk
+ *   only knows the open path for cycle detection, so an object shared by
+ *   two branches may be written twice across a resume.
+ */
+
+import * as fs from 'fs';
+import { once } from 'events';
+import { IVariableData } from './interfaces';
+import { IMemoryBudget } from './MemoryBudget';
+
+/**
+ * Sends a DAP request to the debug session
+ */
+export type DapRequest = (command: string, args: any) => PromiseLike<any>;
+
+/**
+ * One streamed node
+ *
+ * Records are written parents first; `parent` refers to the `id` of an earlier
+ * record (0 for roots: scopes or the evaluated expression).
+ */
+export interface IVariableStreamRecord {
+    id: number;
+    parent: number;
+    depth: number;
+    name: string;
+    value: string;
+    type?: string;
+    evaluateName?: string;
+    variablesReference: number;
+    namedVariables?: number;
+    indexedVariables?: number;
+    /** Why the children of this node were not walked */
+    truncated?: 'maxDepth' | 'cycle' | 'lazy' | 'special';
+    /** Children could not be fetched */
+    error?: string;
+}
+
+/**
+ * Destination for streamed records
+ */
+export interface IVariableRecordSink {
+    write(record: IVariableStreamRecord): void;
+
+    /**
+     * Resolve once written records have been handed off
+     */
+    flush(): Promise<void>;
+}
+
+/**
+ * Options for a walk
+ */
+export interface IVariableWalkOptions {
+    /** Nodes at this depth are written but not expanded (roots are depth 0) */
+    maxDepth: number;
+
+    /** Children fetched per variables request */
+    pageSize: number;
+
+    /** Whether the adapter honours start/count on variables requests */
+    paging: boolean;
+
+    /** Stop after this many records (the walk can be resumed) */
+    maxNodes?: number;
+
+    /** Flow-control window: the walk flushes the sink each time it fills */
+    budget: IMemoryBudget;
+
+    estimateSize(variable: IVariableData): number;
+
+    /**
+     * Return a reason to write a node without walking its children
+     */
+    skipChildren?(variable: IVariableData): Promise<'lazy' | 'special' | undefined>;
+
+    signal?: AbortSignal;
+}
+
+/**
+ * Children of one node still to be written
+ */
+export interface IWalkFrame {
+    /** variablesReference of the node */
+    ref: number;
+    /** Record id of the node */
+    id: number;
+    /** Depth of the children */
+    depth: number;
+    filter?: 'named' | 'indexed';
+    /** Offset of the next child to write */
+    next: number;
+    /** Number of children in this pass, when the adapter reported it */
+    total?: number;
+    /** Indexed children to walk after the named pass */
+    indexed?: number;
+}
+
+/**
+ * Frame with the page of children currently being written
+ */
+interface IOpenFrame extends IWalkFrame {
+    page: IVariableData[];
+    pageStart: number;
+    /** No further pages in this pass */
+    exhausted: boolean;
+}
+
+/**
+ * Resumable position of a walk
+ */
+export interface IVariableWalkPosition {
+    /** Next root to walk once the open path is finished */
+    root: number;
+    /** Id of the next record */
+    nextId: number;
+    /** Open path, outermost first */
+    path: IWalkFrame[];
+}
+
+/**
+ * Walk position plus the paused frame it was taken in
+ */
+export interface IVariableStreamCursor extends IVariableWalkPosition {
+    sessionId: string;
+    frameId: number;
+    /** Set when the walk covers an expression rather than the frame's scopes */
+    expression?: string;
+}
+
+/**
+ * Outcome of VariableTreeWalker.run()
+ */
+export interface IVariableWalkResult {
+    /** Records written by this run */
+    emitted: number;
+    /** Times the walk paused for the sink to flush */
+    flushes: number;
+    /** False if the walk stopped early; position() then resumes it */
+    complete: boolean;
+}
+
+/**
+ * Resumable depth-first walk over DAP variables
+ */
+export class VariableTreeWalker {
+    private readonly stack: IOpenFrame[];
+    private readonly visited = new Set<number>();
+    private root: number;
+    private nextId: number;
+
+    constructor(
+        private readonly request: DapRequest,
+        private readonly options: IVariableWalkOptions,
+        from?: IVariableWalkPosition
+    ) {
+        this.root = from?.root ?? 0;
+        this.nextId = from?.nextId ?? 1;
+        this.stack = (from?.path ?? []).map(frame => ({ ...frame, page: [], pageStart: frame.next, exhausted: false }));
+
+        // References visited before the cursor are not carried over; the open
+        // path still catches cycles back into an ancestor
+        for (const frame of this.stack) {
+            this.visited.add(frame.ref);
+        }
+    }
+
+    /**
+     * Where the walk stands; pass to the constructor to continue
+     */
+    position(): IVariableWalkPosition {
+        return {
+            root: this.root,
+            nextId: this.nextId,
+            path: this.stack.map(({ ref, id, depth, filter, next, total, indexed }) =>
+                ({ ref, id, depth, filter, next, total, indexed }))
+        };
+    }
+
+    /**
+     * Walk `roots` (and the open path, when resuming) into `sink`
+     */
+    async run(roots: IVariableData[], sink: IVariableRecordSink): Promise<IVariableWalkResult> {
+        const { maxNodes, signal } = this.options;
+        const result: IVariableWalkResult = { emitted: 0, flushes: 0, complete: false };
+
+        while (true) {
+            if (signal?.aborted || (maxNodes !== undefined && result.emitted >= maxNodes)) {
+                return result;
+            }
+
+            const frame = this.stack[this.stack.length - 1];
+
+            if (!frame) {
+                if (this.root >= roots.length) {
+                    result.complete = true;
+                    return result;
+                }
+                await this.emit(roots[this.root++], 0, 0, sink, result);
+                continue;
+            }
+
+            if (frame.next - frame.pageStart >= frame.page.length) {
+                if (frame.exhausted || (frame.total !== undefined && frame.next >= frame.total)) {
+                    this.finishPass(frame);
+                    continue;
+                }
+                try {
+                    await this.fetchPage(frame);
+                } catch (error) {
+                    if (signal?.aborted) {
+                        return result;
+                    }
+                    const message = error instanceof Error ? error.message : String(error);
+                    sink.write({
+                        id: this.nextId++,
+                        parent: frame.id,
+                        depth: frame.depth,
+                        name: '[error]',
+                        value: message,
+                        variablesReference: 0,
+                        error: message
+                    });
+                    result.emitted++;
+                    this.stack.pop();
+                }
+                continue;
+            }
+
+            const child = frame.page[frame.next - frame.pageStart];
+            frame.next++;
+            await this.emit(child, frame.depth, frame.id, sink, result);
+        }
+    }
+
+    /**
+     * Write one node and open its children for walking
+     */
+    private async emit(
+        variable: IVariableData,
+        depth: number,
+        parent: number,
+        sink: IVariableRecordSink,
+        result: IVariableWalkResult
+    ): Promise<void> {
+        const { budget, estimateSize, maxDepth, skipChildren } = this.options;
+        const ref = variable.variablesReference ?? 0;
+        const record: IVariableStreamRecord = {
+            id: this.nextId++,
+            parent,
+            depth,
+            name: variable.name,
+            value: variable.value,
+            type: variable.type,
+            evaluateName: variable.evaluateName,
+            variablesReference: ref,
+            namedVariables: variable.namedVariables,
+            indexedVariables: variable.indexedVariables
+        };
+
+        if (ref > 0) {
+            if (depth >= maxDepth) {
+                record.truncated = 'maxDepth';
+            } else if (this.visited.has(ref)) {
+                record.truncated = 'cycle';
+            } else if (skipChildren) {
+                record.truncated = await skipChildren(variable);
+            }
+        }
+
+        sink.write(record);
+        result.emitted++;
+
+        // Budget as flow control: a full window waits for the sink, then reopens
+        const size = estimateSize(variable);
+        if (!budget.addNode(size).ok) {
+            await sink.flush();
+            result.flushes++;
+            budget.reset();
+            budget.addNode(size);
+        }
+
+        if (ref > 0 && !record.truncated) {
+            this.visited.add(ref);
+            this.stack.push(this.openFrame(variable, record.id, depth + 1));
+        }
+    }
+
+    private openFrame(variable: IVariableData, id: number, depth: number): IOpenFrame {
+        const named = variable.namedVariables ?? 0;
+        const indexed = variable.indexedVariables ?? 0;
+        const frame: IWalkFrame = { ref: variable.variablesReference, id, depth, next: 0 };
+
+        // Split only when both kinds are reported, so an adapter that ignores
+        // the filter is never asked twice for the same children
+        if (named > 0 && indexed > 0) {
+            frame.filter = 'named';
+            frame.total = named;
+            frame.indexed = indexed;
+        } else if (indexed > 0) {
+            frame.filter = 'indexed';
+            frame.total = indexed;
+        }
+
+        return { ...frame, page: [], pageStart: 0, exhausted: false };
+    }
+
+    /**
+     * Move on from a finished pass: to the indexed children, or up a level
+     */
+    private finishPass(frame: IOpenFrame): void {
+        if (frame.filter === 'named' && frame.indexed) {
+            frame.filter = 'indexed';
+            frame.total = frame.indexed;
+            frame.indexed = undefined;
+            frame.next = 0;
+            frame.page = [];
+            frame.pageStart = 0;
+            frame.exhausted = false;
+            return;
+        }
+        this.stack.pop();
+    }
+
+    private async fetchPage(frame: IOpenFrame): Promise<void> {
+        const { pageSize, paging } = this.options;
+        const args: any = { variablesReference: frame.ref };
+        if (frame.filter) args.filter = frame.filter;
+        if (paging) {
+            args.start = frame.next;
+            args.count = pageSize;
+        }
+
+        const response = await this.request('variables', args);
+        let variables: IVariableData[] = response?.variables || [];
+
+        if (!paging || variables.length > pageSize) {
+            // Everything came back at once
+            variables = variables.slice(frame.next);
+            frame.exhausted = true;
+        } else if (variables.length < pageSize) {
+            frame.exhausted = true;
+        } else if (frame.next > 0 && frame.page.length > 0 && variables[0].name === frame.page[0].name) {
+            // Adapter ignored start and repeated the previous page
+            variables = [];
+            frame.exhausted = true;
+        }
+
+        frame.page = variables;
+        frame.pageStart = frame.next;
+    }
+}
+
+/**
+ * Encode a cursor as a URL-safe token
+ */
+export function encodeVariableCursor(cursor: IVariableStreamCursor): string {
+    return Buffer.from(JSON.stringify(cursor), 'utf8').toString('base64url');
+}
+
+/**
+ * Decode a token from encodeVariableCursor(); undefined if it is not one
+ */
+export function decodeVariableCursor(token: string): IVariableStreamCursor | undefined {
+    try {
+        const raw = JSON.parse(Buffer.from(token, 'base64url').toString('utf8'));
+        if (typeof raw?.sessionId !== 'string' || !Number.isInteger(raw.frameId) ||
+            !Number.isInteger(raw.root) || !Number.isInteger(raw.nextId) || !Array.isArray(raw.path)) {
+            return undefined;
+        }
+        for (const frame of raw.path) {
+            if (!Number.isInteger(frame?.ref) || !Number.isInteger(frame.id) ||
+                !Number.isInteger(frame.depth) || !Number.isInteger(frame.next)) {
+                return undefined;
+            }
+        }
+        return raw;
+    } catch {
+        return undefined;
+    }
+}
+
+/**
+ * Writes records to a file as NDJSON, or as indented text lines
+ */
+export class VariableFileSink implements IVariableRecordSink {
+    private readonly stream: fs.WriteStream;
+    private readonly format: 'json' | 'text';
+    private failure?: Error;
+
+    constructor(filePath: string, options: { append?: boolean; format?: 'json' | 'text' } = {}) {
+        this.format = options.format ?? 'json';
+        this.stream = fs.createWriteStream(filePath, { encoding: 'utf8', flags: options.append ? 'a' : 'w' });
+        this.stream.on('error', error => {
+            this.failure = error;
+        });
+    }
+
+    /**
+     * Bytes written to the file by this sink
+     */
+    get bytes(): number {
+        return this.stream.bytesWritten;
+    }
+
+    write(record: IVariableStreamRecord): void {
+        if (this.format === 'text') {
+            const type = record.type ? `: ${record.type}` : '';
+            const note = record.truncated ? ` [${record.truncated}]` : '';
+            this.stream.write(`${'  '.repeat(record.depth)}${record.name}${type} = ${record.value}${note}\n`);
+        } else {
+            this.stream.write(JSON.stringify(record) + '\n');
+        }
+    }
+
+    async flush(): Promise<void> {
+        if (this.failure) {
+            throw this.failure;
+        }
+        if (this.stream.writableNeedDrain) {
+            await once(this.stream, 'drain');
+        }
+    }
+
+    /**
+     * Finish the file; resolves with the bytes written
+     */
+    async close(): Promise<number> {
+        if (!this.stream.closed) {
+            const closed = once(this.stream, 'close');
+            this.stream.end();
+            await closed;
+        }
+        if (this.failure) {
+            throw this.failure;
+        }
+        return this.bytes;
+    }
+}
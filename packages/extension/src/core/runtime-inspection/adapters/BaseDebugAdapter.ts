@@ -22,6 +22,17 @@ import {
     IStreamResult
 } from '../interfaces';
 import { IMemoryBudget, MemoryBudget } from '../MemoryBudget';
+import {
+    IVariableRecordSink,
+    IVariableStreamCursor,
+    VariableFileSink,
+    VariableTreeWalker,
+    decodeVariableCursor,
+    encodeVariableCursor
+} from '../VariableStream';
+import { IVariableExpanderOptions, VariableExpander } from '../VariableExpander';
+import { IPauseCacheStats, PauseCache } from '../PauseCache';
+import { DebugEventHub } from '../../debug/event-hub';
 import {
     IDebugError,
     DebugErrorCode,
@@ -29,13 +40,51 @@ import {
     createLargeDataError
 } from '../../errors/debug-errors';
 
+/**
+ * Default time limit for streamVariables (a stopped walk returns a cursor)
+ */
+const STREAM_TIMEOUT_MS = 5 * 60 * 1000;
+
+/**
+ * DAP requests that change program state (and so invalidate the pause cache)
+ */
+const MUTATING_COMMANDS = new Set(['setVariable', 'setExpression', 'restartFrame', 'goto']);
+
+/**
+ * evaluate contexts adapters run without side effects
+ */
+const SIDE_EFFECT_FREE_CONTEXTS = new Set(['watch', 'hover']);
+
+/**
+ * DAP events after which references from the previous pause are stale
+ */
+const EXECUTION_STATE_EVENTS = new Set(['stopped', 'continued', 'invalidated', 'terminated', 'exited']);
+
+/**
+ * Language-specific pieces of a variable stream
+ */
+export interface IStreamVariablesHooks {
+    /** Thread to inspect when params.threadId is not given */
+    findThread(): Promise<number | null>;
+
+    /** Scopes to walk, after includeExpensive/scopeFilter */
+    filterScopes(scopes: any[]): any[];
+
+    estimateSize(variable: IVariableData): number;
+
+    /** Reason to write a variable without walking its children */
+    skipChildren?(variable: IVariableData, frameId: number): Promise<'lazy' | 'special' | undefined>;
+}
+
 /**
  * Abstract base adapter with common DAP functionality
  */
 export abstract class BaseDebugAdapter implements IDebugAdapter {
     protected readonly memoryBudget: IMemoryBudget;
     protected variableCache: Map<number, IVariableData[]> = new Map();
-    protected scopeCache: Map<number, any> = new Map();
+
+    /** Read-only DAP responses for the current pause (see request()) */
+    protected readonly pauseCache = new PauseCache();
 
     // Per Subtask 001 ST004: Lifecycle management for proper cleanup
     private disposables: vscode.Disposable[] = [];
@@ -44,6 +93,12 @@ export abstract class BaseDebugAdapter implements IDebugAdapter {
     // Per Subtask 001 ST007: Operation locking to prevent concurrent access
     private operationLocks = new Map<string, boolean>();
 
+    /**
+     * Background variables/evaluate requests a listVariables() expansion keeps
+     * in flight (see createExpander); override per adapter
+     */
+    protected readonly expansionConcurrency: number = 8;
+
     constructor(
         public readonly session: vscode.DebugSession,
         public readonly capabilities: IDebugCapabilities
@@ -80,7 +135,8 @@ export abstract class BaseDebugAdapter implements IDebugAdapter {
         this.disposables.push(
             vscode.debug.onDidChangeActiveStackItem(stackItem => {
                 // CRITICAL: Only respond to events for THIS session
-                if (stackItem?.session.id === this.session.id) {
+                // (undefined is fired on resume; it carries no session, so clear)
+                if (!stackItem || stackItem.session.id === this.session.id) {
                     // Conservative: clear on ANY stack item change
                     // Frame or thread changes invalidate all variable references
                     this.clearCaches();
@@ -99,14 +155,14 @@ export abstract class BaseDebugAdapter implements IDebugAdapter {
             })
         );
 
-        // DAP invalidated events - canonical reference invalidation signal
-        // Per Code Review: Listen for DAP-standard invalidated events
-        // This catches execution resume, step, and other state changes that invalidate references
+        // DAP execution-state events - canonical reference invalidation signal
+        // stopped/continued/invalidated/terminated are standard DAP events, so they
+        // never reach onDidReceiveDebugSessionCustomEvent; the event hub's
+        // adapter trackers see them as the debug adapter sends them
         this.disposables.push(
-            vscode.debug.onDidReceiveDebugSessionCustomEvent(event => {
+            DebugEventHub.instance.onDidReceiveEvent((sessionId, event) => {
                 // CRITICAL: Only respond to events for THIS session
-                if (event.session.id === this.session.id && event.event === 'invalidated') {
-                    // DAP spec: invalidated event signals that references are no longer valid
+                if (sessionId === this.session.id && EXECUTION_STATE_EVENTS.has(event.event)) {
                     this.clearCaches();
                 }
             })
@@ -272,12 +328,45 @@ export abstract class BaseDebugAdapter implements IDebugAdapter {
         return controller.signal;
     }
 
+    /**
+     * Send a DAP request to the session
+     *
+     * threads/stackTrace/scopes/variables are answered from the pause cache,
+     * so repeated tool calls at one breakpoint cost one round-trip per unique
+     * thread, frame and reference. Requests that can change program state
+     * (setVariable, setExpression, evaluate outside watch/hover) invalidate
+     * the cache once they complete.
+     */
+    public request(command: string, args?: any): Promise<any> {
+        if (MUTATING_COMMANDS.has(command) || (command === 'evaluate' && !SIDE_EFFECT_FREE_CONTEXTS.has(args?.context))) {
+            const response = Promise.resolve(this.session.customRequest(command, args));
+            const invalidate = () => this.pauseCache.invalidate();
+            response.then(invalidate, invalidate);
+            return response;
+        }
+        return this.pauseCache.get(command, args, () => this.session.customRequest(command, args));
+    }
+
+    /**
+     * Pause cache hit/miss counters
+     */
+    public getCacheStats(): IPauseCacheStats {
+        return this.pauseCache.stats();
+    }
+
+    /**
+     * Drop cached DAP responses so the next requests reach the debug adapter
+     */
+    public invalidateCache(): void {
+        this.pauseCache.invalidate();
+    }
+
     /**
      * Get threads from debug session
      */
     protected async getThreads(): Promise<any[]> {
         try {
-            const response = await this.session.customRequest('threads');
+            const response = await this.request('threads');
             return response.threads || [];
         } catch (error) {
             throw createDebugError(
@@ -292,7 +381,7 @@ export abstract class BaseDebugAdapter implements IDebugAdapter {
      */
     protected async getStackFrames(threadId: number, levels: number = 1): Promise<any[]> {
         try {
-            const response = await this.session.customRequest('stackTrace', {
+            const response = await this.request('stackTrace', {
                 threadId,
                 startFrame: 0,
                 levels
@@ -310,18 +399,9 @@ export abstract class BaseDebugAdapter implements IDebugAdapter {
      * Get scopes for a stack frame
      */
     protected async getScopes(frameId: number): Promise<any[]> {
-        // Check cache first
-        if (this.scopeCache.has(frameId)) {
-            return this.scopeCache.get(frameId)!;
-        }
-
         try {
-            const response = await this.session.customRequest('scopes', { frameId });
-            const scopes = response.scopes || [];
-
-            // Cache for reuse while paused
-            this.scopeCache.set(frameId, scopes);
-            return scopes;
+            const response = await this.request('scopes', { frameId });
+            return response.scopes || [];
         } catch (error) {
             throw createDebugError(
                 DebugErrorCode.E_NO_FRAMES,
@@ -349,7 +429,7 @@ export abstract class BaseDebugAdapter implements IDebugAdapter {
             if (start !== undefined) params.start = start;
             if (count !== undefined) params.count = count;
 
-            const response = await this.session.customRequest('variables', params);
+            const response = await this.request('variables', params);
             return response.variables || [];
         } catch (error) {
             throw createDebugError(
@@ -366,7 +446,7 @@ export abstract class BaseDebugAdapter implements IDebugAdapter {
      */
     public clearCaches(): void {
         this.variableCache.clear();
-        this.scopeCache.clear();
+        this.pauseCache.invalidate();
         this.memoryBudget.reset();
         // Clear operation locks to prevent stuck locks across state changes
         this.operationLocks.clear();
@@ -399,7 +479,7 @@ export abstract class BaseDebugAdapter implements IDebugAdapter {
                 params.frameId = frameId;
             }
 
-            const response = await this.session.customRequest('evaluate', params);
+            const response = await this.request('evaluate', params);
             return response;
         } catch (error) {
             return createDebugError(
@@ -428,6 +508,189 @@ export abstract class BaseDebugAdapter implements IDebugAdapter {
         // Subclasses can override to add additional cleanup
     }
 
+    /**
+     * Create the expansion engine for one listVariables() call
+     *
+     * Sibling `variables` requests are issued ahead of the depth-first walk,
+     * up to expansionConcurrency at a time and once per variablesReference.
+     * Budget accounting (this.memoryBudget) still follows the walk order, so
+     * results are the same as a sequential expansion.
+     */
+    protected createExpander(
+        options: Pick<IVariableExpanderOptions, 'maxDepth' | 'maxChildren' | 'estimateSize' | 'inspect' | 'signal'>
+    ): VariableExpander {
+        return new VariableExpander(
+            (command, args) => this.request(command, args),
+            {
+                ...options,
+                concurrency: this.expansionConcurrency,
+                budget: this.memoryBudget
+            }
+        );
+    }
+
+    /**
+     * Stream the variables of a paused frame (or one expression) to a file
+     * and/or params.onRecord, one record per node
+     *
+     * Shared by adapters whose streamVariables() walks plain DAP variables.
+     * The walk holds only its open path; the memory budget sets how much is
+     * produced between flushes rather than how much can be produced. A walk
+     * stopped by maxNodes, params.signal or the time limit returns a cursor
+     * that continues it while execution stays paused.
+     */
+    protected async streamVariableTree(
+        params: IStreamVariablesParams,
+        hooks: IStreamVariablesHooks
+    ): Promise<IStreamResult> {
+        if (!params.outputPath && !params.onRecord) {
+            return {
+                success: false,
+                error: createDebugError(DebugErrorCode.E_MISSING_REQUIRED_PARAM, 'outputPath or onRecord')
+            };
+        }
+
+        let cursor: IVariableStreamCursor | undefined;
+        if (params.cursor) {
+            cursor = decodeVariableCursor(params.cursor);
+            if (!cursor || cursor.sessionId !== this.session.id) {
+                return {
+                    success: false,
+                    error: createDebugError(
+                        DebugErrorCode.E_STALE_REFERENCE,
+                        'Cursor was not issued for this debug session'
+                    )
+                };
+            }
+        }
+
+        const result = await this.withOperationLock('stream-variables', async (lockSignal) => {
+            const signal = params.signal
+                ? this.combineAbortSignals([lockSignal, params.signal])
+                : lockSignal;
+            let fileSink: VariableFileSink | undefined;
+
+            try {
+                let frameId: number;
+                if (cursor) {
+                    frameId = cursor.frameId;
+                } else {
+                    const threadId = params.threadId ?? await hooks.findThread();
+                    if (threadId === null) {
+                        return { success: false, error: createDebugError(DebugErrorCode.E_NO_THREADS) };
+                    }
+                    const frames = await this.getStackFrames(threadId, 1);
+                    if (frames.length === 0) {
+                        return { success: false, error: createDebugError(DebugErrorCode.E_NO_STACK) };
+                    }
+                    frameId = params.frameId ?? frames[0].id;
+                }
+
+                // Roots: the evaluated expression, or the frame's scopes
+                const expression = cursor ? cursor.expression : params.expression;
+                let roots: IVariableData[];
+                if (expression !== undefined) {
+                    const evaluated = await this.evaluateExpression(expression, frameId);
+                    if ('code' in evaluated) {
+                        return { success: false, error: evaluated };
+                    }
+                    roots = [{
+                        name: expression,
+                        value: evaluated.result,
+                        type: evaluated.type,
+                        evaluateName: expression,
+                        variablesReference: evaluated.variablesReference ?? 0,
+                        namedVariables: evaluated.namedVariables,
+                        indexedVariables: evaluated.indexedVariables
+                    }];
+                } else {
+                    roots = hooks.filterScopes(await this.getScopes(frameId)).map(scope => ({
+                        name: scope.name,
+                        value: '',
+                        type: 'scope',
+                        variablesReference: scope.variablesReference,
+                        namedVariables: scope.namedVariables,
+                        indexedVariables: scope.indexedVariables
+                    }));
+                }
+
+                if (params.outputPath) {
+                    fileSink = new VariableFileSink(params.outputPath, {
+                        append: cursor !== undefined,
+                        format: params.format
+                    });
+                }
+                const onRecord = params.onRecord;
+                const sink: IVariableRecordSink = {
+                    write: record => {
+                        fileSink?.write(record);
+                        onRecord?.(record);
+                    },
+                    flush: async () => {
+                        if (fileSink) {
+                            await fileSink.flush();
+                        }
+                        // Let the event writer (or anything else queued) run
+                        await new Promise(resolve => setImmediate(resolve));
+                    }
+                };
+
+                // Own budget: this.memoryBudget belongs to listVariables()
+                // Pages bypass the pause cache: a walk must not hold the whole tree
+                const walker = new VariableTreeWalker(
+                    (command, args) => this.session.customRequest(command, args),
+                    {
+                        maxDepth: params.maxDepth ?? 10,
+                        pageSize: params.pageSize ?? 500,
+                        paging: this.capabilities.supportsVariablePaging,
+                        maxNodes: params.maxNodes,
+                        budget: new MemoryBudget(this.memoryBudget.maxNodes, this.memoryBudget.maxBytes),
+                        estimateSize: variable => hooks.estimateSize(variable),
+                        skipChildren: hooks.skipChildren
+                            ? variable => hooks.skipChildren!(variable, frameId)
+                            : undefined,
+                        signal
+                    },
+                    cursor
+                );
+
+                const walk = await walker.run(roots, sink);
+                const byteCount = fileSink ? await fileSink.close() : undefined;
+                fileSink = undefined;
+
+                return {
+                    success: true,
+                    outputPath: params.outputPath,
+                    variableCount: walk.emitted,
+                    byteCount,
+                    complete: walk.complete,
+                    cursor: walk.complete
+                        ? undefined
+                        : encodeVariableCursor({ ...walker.position(), sessionId: this.session.id, frameId, expression }),
+                    flushes: walk.flushes
+                };
+            } catch (error) {
+                if (error && typeof error === 'object' && 'code' in error) {
+                    return { success: false, error: error as IDebugError };
+                }
+                return {
+                    success: false,
+                    error: createDebugError(
+                        DebugErrorCode.E_INTERNAL,
+                        error instanceof Error ? error.message : String(error)
+                    )
+                };
+            } finally {
+                await fileSink?.close().catch(() => undefined);
+            }
+        }, { timeoutMs: params.timeoutMs ?? STREAM_TIMEOUT_MS });
+
+        if ('code' in result) {
+            return { success: false, error: result };
+        }
+        return result;
+    }
+
     /**
      * Abstract methods that language-specific adapters must implement
      *
@@ -435,6 +698,7 @@ export abstract class BaseDebugAdapter implements IDebugAdapter {
      * 1. Use checkCapability() at the start of each method to verify adapter support
      * 2. Wrap operations with withOperationLock() for concurrency protection
      * 3. Check memory budget before adding nodes: const result = this.memoryBudget.addNode(bytes)
+     *    (createExpander() does this for listVariables-style expansion)
      * 4. Return structured errors with suggestions when capabilities unsupported
      * 5. Respect the AbortSignal for timeout and session termination
      *
@@ -454,7 +718,7 @@ export abstract class BaseDebugAdapter implements IDebugAdapter {
      *     // 2. Wrap with lock
      *     return await this.withOperationLock('set-variable', async (signal) => {
      *         // 3. Execute operation
-     *         const response = await this.session.customRequest('setVariable', params);
+     *         const response = await this.request('setVariable', params);
      *         return { success: true, ...response };
      *     });
      * }
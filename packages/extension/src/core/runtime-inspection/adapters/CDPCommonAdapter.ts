@@ -35,36 +35,6 @@ import {
     createDebugError
 } from '../../errors/debug-errors';
 
-/**
- * Enhanced variable data with cycle detection and depth tracking
- */
-interface IEnhancedVariableData extends IVariableData {
-    /** Children array if expanded */
-    children?: IEnhancedVariableData[];
-    /** Number of children shown */
-    childrenShown?: number;
-    /** Total children available */
-    totalChildren?: number;
-    /** Whether children were truncated */
-    childrenTruncated?: boolean;
-    /** Truncated due to depth or budget */
-    truncated?: boolean;
-    /** Reason for truncation */
-    truncatedReason?: 'maxDepth' | 'budget' | 'maxChildren';
-    /** Whether this is expandable */
-    expandable?: boolean;
-    /** Circular reference detected */
-    cycle?: boolean;
-    /** Original value before cycle marker */
-    originalValue?: string;
-    /** How cycle was detected */
-    cycleVia?: 'variablesReference' | 'Object.is';
-    /** Target of the cycle (evaluateName) */
-    cycleTarget?: string;
-    /** Error expanding this variable */
-    error?: string;
-}
-
 /**
  * Scope type mapping from CDP scope types to DAP-friendly metadata.
  *
@@ -449,7 +419,7 @@ export abstract class CDPCommonAdapter extends BaseDebugAdapter {
                         requestParams.count = params.count;
                     }
 
-                    const response = await this.session.customRequest('variables', requestParams);
+                    const response = await this.request('variables', requestParams);
                     return response.variables || [];
                 } catch (error) {
                     if (signal.aborted) {
@@ -492,7 +462,7 @@ export abstract class CDPCommonAdapter extends BaseDebugAdapter {
                     // Strategy 1: Try setVariable request first
                     if (this.capabilities.supportsSetVariable && params.variablesReference !== undefined) {
                         try {
-                            const response = await this.session.customRequest('setVariable', {
+                            const response = await this.request('setVariable', {
                                 variablesReference: params.variablesReference,
                                 name: params.name,
                                 value: params.value
@@ -515,7 +485,7 @@ export abstract class CDPCommonAdapter extends BaseDebugAdapter {
                     // Per code review: Prefer setExpression before evaluate assignment
                     if (this.capabilities.supportsSetExpression && params.frameId !== undefined) {
                         try {
-                            const response = await this.session.customRequest('setExpression', {
+                            const response = await this.request('setExpression', {
                                 frameId: params.frameId,
                                 expression: params.name,
                                 value: params.value
@@ -662,157 +632,74 @@ export abstract class CDPCommonAdapter extends BaseDebugAdapter {
                 // Reset memory budget for this operation
                 this.memoryBudget.reset();
 
-                // Track visited references for cycle detection
-                const visited = new Set<number>();
-
-                // Recursive expansion with cycle detection and budget tracking
-                const expandVariable = async (
-                    variable: IVariableData,
-                    currentDepth: number,
-                    ancestors: IVariableData[]
-                ): Promise<IEnhancedVariableData> => {
-                    // Check if aborted
-                    if (signal.aborted) {
-                        throw new Error('Operation aborted');
-                    }
-
-                    // Check depth limit
-                    if (currentDepth >= maxDepth) {
-                        return {
-                            ...variable,
-                            truncated: true,
-                            truncatedReason: 'maxDepth',
-                            expandable: variable.variablesReference > 0
-                        };
-                    }
-
-                    // Leaf node
-                    if (variable.variablesReference === 0) {
-                        return variable;
-                    }
-
-                    // Cycle detection - Strategy 1 (PREFERRED): variablesReference
-                    // This is reliable and fast, use it first
-                    if (visited.has(variable.variablesReference)) {
-                        return {
-                            ...variable,
-                            cycle: true,
-                            value: '[Circular Reference]',
-                            originalValue: variable.value,
-                            cycleVia: 'variablesReference'
-                        };
-                    }
-
-                    // Cycle detection - Strategy 2: Object.is() for JavaScript
-                    // Per Critical Discovery 05: JavaScript requires Object.is() for accurate detection
-                    // Per code review: Add throttling to avoid repeated failed evaluates
-                    if (variable.evaluateName) {
-                        // Check if we've hit the failure limit for this evaluateName
-                        const failures = this.evaluateFailures.get(variable.evaluateName) ?? 0;
-
-                        // Only attempt Object.is() if we haven't exceeded failure threshold
-                        if (failures < this.MAX_EVALUATE_FAILURES) {
-                            // Check against recent ancestors (last 4 to limit perf impact)
-                            const recentAncestors = ancestors.slice(-4);
-
-                            for (const ancestor of recentAncestors) {
-                                if (!ancestor.evaluateName) continue;
-
-                                try {
-                                    const expr = `Object.is(${variable.evaluateName}, ${ancestor.evaluateName})`;
-                                    const evalResponse = await this.session.customRequest('evaluate', {
-                                        expression: expr,
-                                        frameId: frameId,
-                                        context: 'hover' // Side-effect free (throwOnSideEffect)
-                                    });
-
-                                    if (evalResponse.result === 'true') {
-                                        // Reset failure count on success
-                                        this.evaluateFailures.delete(variable.evaluateName);
-
-                                        return {
-                                            ...variable,
-                                            cycle: true,
-                                            value: '[Circular Reference]',
-                                            originalValue: variable.value,
-                                            cycleVia: 'Object.is',
-                                            cycleTarget: ancestor.evaluateName
-                                        };
+                // Pipelined depth-first expansion with cycle detection and budget tracking
+                // Cycle detection - Strategy 1 (PREFERRED): variablesReference (in the expander)
+                const expander = this.createExpander({
+                    maxDepth,
+                    maxChildren,
+                    signal,
+                    estimateSize: variable => this.estimateVariableSize(variable),
+                    inspect: async (variable, ancestors) => {
+                        // Cycle detection - Strategy 2: Object.is() for JavaScript
+                        // Per Critical Discovery 05: JavaScript requires Object.is() for accurate detection
+                        // Per code review: Add throttling to avoid repeated failed evaluates
+                        if (variable.evaluateName) {
+                            // Check if we've hit the failure limit for this evaluateName
+                            const failures = this.evaluateFailures.get(variable.evaluateName) ?? 0;
+
+                            // Only attempt Object.is() if we haven't exceeded failure threshold
+                            if (failures < this.MAX_EVALUATE_FAILURES) {
+                                // Check against recent ancestors (last 4 to limit perf impact)
+                                const recentAncestors = ancestors.slice(-4);
+
+                                for (const ancestor of recentAncestors) {
+                                    if (!ancestor.evaluateName) continue;
+
+                                    try {
+                                        const expr = `Object.is(${variable.evaluateName}, ${ancestor.evaluateName})`;
+                                        const evalResponse = await this.request('evaluate', {
+                                            expression: expr,
+                                            frameId: frameId,
+                                            context: 'hover' // Side-effect free (throwOnSideEffect)
+                                        });
+
+                                        if (evalResponse.result === 'true') {
+                                            // Reset failure count on success
+                                            this.evaluateFailures.delete(variable.evaluateName);
+
+                                            return {
+                                                ...variable,
+                                                cycle: true,
+                                                value: '[Circular Reference]',
+                                                originalValue: variable.value,
+                                                cycleVia: 'Object.is',
+                                                cycleTarget: ancestor.evaluateName
+                                            };
+                                        }
+                                    } catch (error) {
+                                        // Evaluation failed (likely getter/proxy side effects)
+                                        // Increment failure count and back off
+                                        const currentFailures = this.evaluateFailures.get(variable.evaluateName) ?? 0;
+                                        this.evaluateFailures.set(variable.evaluateName, currentFailures + 1);
+
+                                        // Log throttling decision (per code review: add observability)
+                                        if (currentFailures + 1 >= this.MAX_EVALUATE_FAILURES) {
+                                            console.warn(
+                                                `Cycle detection throttle activated for "${variable.evaluateName}". ` +
+                                                `Failed ${this.MAX_EVALUATE_FAILURES} Object.is() attempts. ` +
+                                                `Future checks will rely on variablesReference tracking only.`
+                                            );
+                                        }
+                                        // Continue to next ancestor or fall through
                                     }
-                                } catch (error) {
-                                    // Evaluation failed (likely getter/proxy side effects)
-                                    // Increment failure count and back off
-                                    const currentFailures = this.evaluateFailures.get(variable.evaluateName) ?? 0;
-                                    this.evaluateFailures.set(variable.evaluateName, currentFailures + 1);
-
-                                    // Log throttling decision (per code review: add observability)
-                                    if (currentFailures + 1 >= this.MAX_EVALUATE_FAILURES) {
-                                        console.warn(
-                                            `Cycle detection throttle activated for "${variable.evaluateName}". ` +
-                                            `Failed ${this.MAX_EVALUATE_FAILURES} Object.is() attempts. ` +
-                                            `Future checks will rely on variablesReference tracking only.`
-                                        );
-                                    }
-                                    // Continue to next ancestor or fall through
                                 }
                             }
+                            // If throttled or all ancestors checked, continue with reference tracking
                         }
-                        // If throttled or all ancestors checked, continue with reference tracking
-                    }
-
-                    // Add to visited set
-                    visited.add(variable.variablesReference);
-
-                    // Get children
-                    try {
-                        const childrenResponse = await this.session.customRequest('variables', {
-                            variablesReference: variable.variablesReference,
-                            count: maxChildren
-                        });
-
-                        const allChildren: IVariableData[] = childrenResponse.variables || [];
-                        const childrenToExpand = allChildren.slice(0, maxChildren);
-
-                        // Expand children recursively
-                        const expandedChildren: IEnhancedVariableData[] = [];
-                        const newAncestors = [...ancestors, variable];
-
-                        for (const child of childrenToExpand) {
-                            // Check memory budget before expanding
-                            const estimatedBytes = this.estimateVariableSize(child);
-                            const budgetResult = this.memoryBudget.addNode(estimatedBytes);
-
-                            if (!budgetResult.ok) {
-                                // Budget exceeded, stop expanding
-                                return {
-                                    ...variable,
-                                    children: expandedChildren,
-                                    childrenShown: expandedChildren.length,
-                                    totalChildren: allChildren.length,
-                                    truncated: true,
-                                    truncatedReason: 'budget'
-                                };
-                            }
 
-                            const expanded = await expandVariable(child, currentDepth + 1, newAncestors);
-                            expandedChildren.push(expanded);
-                        }
-
-                        return {
-                            ...variable,
-                            children: expandedChildren,
-                            childrenShown: childrenToExpand.length,
-                            totalChildren: variable.namedVariables || variable.indexedVariables || allChildren.length,
-                            childrenTruncated: allChildren.length > maxChildren
-                        };
-                    } catch (error) {
-                        return {
-                            ...variable,
-                            error: error instanceof Error ? error.message : String(error),
-                            expandable: true
-                        };
+                        return undefined;
                     }
-                };
+                });
 
                 // Process each scope
                 const result: IVariableData[] = [];
@@ -823,19 +710,15 @@ export abstract class CDPCommonAdapter extends BaseDebugAdapter {
                     }
 
                     try {
-                        const varsResponse = await this.session.customRequest('variables', {
+                        const varsResponse = await this.request('variables', {
                             variablesReference: scope.variablesReference,
                             count: 200 // Conservative default
                         });
 
                         const variables: IVariableData[] = varsResponse.variables || [];
 
-                        // Expand each variable
-                        const expandedVariables: IEnhancedVariableData[] = [];
-                        for (const variable of variables) {
-                            const expanded = await expandVariable(variable, 1, []);
-                            expandedVariables.push(expanded);
-                        }
+                        // Expand each variable (siblings' children are fetched ahead)
+                        const expandedVariables = await expander.expandAll(variables);
 
                         // Add scope node to result
                         result.push({
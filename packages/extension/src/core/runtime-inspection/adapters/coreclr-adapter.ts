@@ -38,35 +38,6 @@ import {
     createLargeDataError
 } from '../../errors/debug-errors';
 
-/**
- * Enhanced variable data with cycle detection and depth tracking
- * Same as NodeDebugAdapter but without Object.is() fields
- */
-interface IEnhancedVariableData extends IVariableData {
-    /** Children array if expanded */
-    children?: IEnhancedVariableData[];
-    /** Number of children shown */
-    childrenShown?: number;
-    /** Total children available */
-    totalChildren?: number;
-    /** Whether children were truncated */
-    childrenTruncated?: boolean;
-    /** Truncated due to depth or budget */
-    truncated?: boolean;
-    /** Reason for truncation */
-    truncatedReason?: 'maxDepth' | 'budget' | 'maxChildren';
-    /** Whether this is expandable */
-    expandable?: boolean;
-    /** Circular reference detected */
-    cycle?: boolean;
-    /** Original value before cycle marker */
-    originalValue?: string;
-    /** How cycle was detected (C#: only variablesReference) */
-    cycleVia?: 'variablesReference';
-    /** Error expanding this variable */
-    error?: string;
-}
-
 /**
  * CoreCLR Debug Adapter - Full implementation for C# .NET (coreclr)
  *
@@ -124,13 +95,13 @@ export class CoreClrDebugAdapter extends BaseDebugAdapter {
      */
     private async findActiveThread(): Promise<number | null> {
         try {
-            const threadsResponse = await this.session.customRequest('threads');
+            const threadsResponse = await this.request('threads');
             const threads = threadsResponse.threads || [];
 
             // Iterate all threads to find the one with actual source code
             for (const thread of threads) {
                 try {
-                    const stackResponse = await this.session.customRequest('stackTrace', {
+                    const stackResponse = await this.request('stackTrace', {
                         threadId: thread.id,
                         startFrame: 0,
                         levels: 1
@@ -201,127 +172,19 @@ export class CoreClrDebugAdapter extends BaseDebugAdapter {
 
                 // Filter scopes based on expensive flag and scope filter
                 // C#-SPECIFIC: More conservative about expensive scopes (properties can have side effects)
-                const scopesToProcess = scopes.filter(scope => {
-                    // Check expensive flag
-                    if (scope.expensive && !includeExpensive) {
-                        return false;
-                    }
-
-                    // Apply scope filter
-                    if (scopeFilter !== 'all') {
-                        const scopeName = scope.name.toLowerCase();
-                        if (scopeFilter === 'local' && !scopeName.includes('local')) {
-                            return false;
-                        }
-                        if (scopeFilter === 'closure' && !scopeName.includes('closure')) {
-                            return false;
-                        }
-                        if (scopeFilter === 'global' && !scopeName.includes('global')) {
-                            return false;
-                        }
-                    }
-
-                    return true;
-                });
+                const scopesToProcess = this.filterScopes(scopes, includeExpensive, scopeFilter);
 
                 // Reset memory budget for this operation
                 this.memoryBudget.reset();
 
-                // Track visited references for cycle detection
+                // Pipelined depth-first expansion with cycle detection and budget tracking
                 // C#-SPECIFIC: Only variablesReference tracking, NO Object.is()
-                const visited = new Set<number>();
-
-                // Recursive expansion with cycle detection and budget tracking
-                const expandVariable = async (
-                    variable: IVariableData,
-                    currentDepth: number,
-                    ancestors: IVariableData[]
-                ): Promise<IEnhancedVariableData> => {
-                    // Check if aborted
-                    if (signal.aborted) {
-                        throw new Error('Operation aborted');
-                    }
-
-                    // Check depth limit
-                    if (currentDepth >= maxDepth) {
-                        return {
-                            ...variable,
-                            truncated: true,
-                            truncatedReason: 'maxDepth',
-                            expandable: variable.variablesReference > 0
-                        };
-                    }
-
-                    // Leaf node
-                    if (variable.variablesReference === 0) {
-                        return variable;
-                    }
-
-                    // C#-SPECIFIC: Cycle detection using ONLY variablesReference
-                    // NO Object.is() - doesn't work in C#, simpler implementation
-                    if (visited.has(variable.variablesReference)) {
-                        return {
-                            ...variable,
-                            cycle: true,
-                            value: '[Circular Reference]',
-                            originalValue: variable.value,
-                            cycleVia: 'variablesReference'
-                        };
-                    }
-
-                    // Add to visited set
-                    visited.add(variable.variablesReference);
-
-                    // Get children
-                    try {
-                        const childrenResponse = await this.session.customRequest('variables', {
-                            variablesReference: variable.variablesReference,
-                            count: maxChildren
-                        });
-
-                        const allChildren: IVariableData[] = childrenResponse.variables || [];
-                        const childrenToExpand = allChildren.slice(0, maxChildren);
-
-                        // Expand children recursively
-                        const expandedChildren: IEnhancedVariableData[] = [];
-                        const newAncestors = [...ancestors, variable];
-
-                        for (const child of childrenToExpand) {
-                            // Check memory budget before expanding
-                            const estimatedBytes = this.estimateVariableSize(child);
-                            const budgetResult = this.memoryBudget.addNode(estimatedBytes);
-
-                            if (!budgetResult.ok) {
-                                // Budget exceeded, stop expanding
-                                return {
-                                    ...variable,
-                                    children: expandedChildren,
-                                    childrenShown: expandedChildren.length,
-                                    totalChildren: allChildren.length,
-                                    truncated: true,
-                                    truncatedReason: 'budget'
-                                };
-                            }
-
-                            const expanded = await expandVariable(child, currentDepth + 1, newAncestors);
-                            expandedChildren.push(expanded);
-                        }
-
-                        return {
-                            ...variable,
-                            children: expandedChildren,
-                            childrenShown: childrenToExpand.length,
-                            totalChildren: variable.namedVariables || variable.indexedVariables || allChildren.length,
-                            childrenTruncated: allChildren.length > maxChildren
-                        };
-                    } catch (error) {
-                        return {
-                            ...variable,
-                            error: error instanceof Error ? error.message : String(error),
-                            expandable: true
-                        };
-                    }
-                };
+                const expander = this.createExpander({
+                    maxDepth,
+                    maxChildren,
+                    signal,
+                    estimateSize: variable => this.estimateVariableSize(variable)
+                });
 
                 // Process each scope
                 const result: IVariableData[] = [];
@@ -332,19 +195,15 @@ export class CoreClrDebugAdapter extends BaseDebugAdapter {
                     }
 
                     try {
-                        const varsResponse = await this.session.customRequest('variables', {
+                        const varsResponse = await this.request('variables', {
                             variablesReference: scope.variablesReference,
                             count: 200 // Conservative default
                         });
 
                         const variables: IVariableData[] = varsResponse.variables || [];
 
-                        // Expand each variable
-                        const expandedVariables: IEnhancedVariableData[] = [];
-                        for (const variable of variables) {
-                            const expanded = await expandVariable(variable, 1, []);
-                            expandedVariables.push(expanded);
-                        }
+                        // Expand each variable (siblings' children are fetched ahead)
+                        const expandedVariables = await expander.expandAll(variables);
 
                         // Add scope node to result
                         // vsdbg features (presentationHint, memoryReference) are preserved automatically
@@ -393,6 +252,38 @@ export class CoreClrDebugAdapter extends BaseDebugAdapter {
         }) as Promise<IVariableData[] | IDebugError>;
     }
 
+    /**
+     * Scopes to walk for listVariables/streamVariables
+     */
+    private filterScopes(
+        scopes: any[],
+        includeExpensive: boolean,
+        scopeFilter: 'all' | 'local' | 'closure' | 'global'
+    ): any[] {
+        return scopes.filter(scope => {
+            // Check expensive flag
+            if (scope.expensive && !includeExpensive) {
+                return false;
+            }
+
+            // Apply scope filter
+            if (scopeFilter !== 'all') {
+                const scopeName = scope.name.toLowerCase();
+                if (scopeFilter === 'local' && !scopeName.includes('local')) {
+                    return false;
+                }
+                if (scopeFilter === 'closure' && !scopeName.includes('closure')) {
+                    return false;
+                }
+                if (scopeFilter === 'global' && !scopeName.includes('global')) {
+                    return false;
+                }
+            }
+
+            return true;
+        });
+    }
+
     /**
      * Estimate variable size for memory budget tracking
      * Same logic as NodeDebugAdapter
@@ -428,7 +319,7 @@ export class CoreClrDebugAdapter extends BaseDebugAdapter {
                 const start = params.start ?? 0;
                 const count = params.count ?? 100;
 
-                const response = await this.session.customRequest('variables', {
+                const response = await this.request('variables', {
                     variablesReference: params.variablesReference,
                     start: start,
                     count: count
@@ -460,7 +351,7 @@ export class CoreClrDebugAdapter extends BaseDebugAdapter {
             try {
                 // Strategy 1: Try DAP setVariable (preferred)
                 try {
-                    const result = await this.session.customRequest('setVariable', {
+                    const result = await this.request('setVariable', {
                         variablesReference: params.variablesReference,
                         name: params.name,
                         value: params.value
@@ -490,7 +381,7 @@ export class CoreClrDebugAdapter extends BaseDebugAdapter {
                     const expression = `${params.name} = ${params.value}`;
 
                     try {
-                        const evalResult = await this.session.customRequest('evaluate', {
+                        const evalResult = await this.request('evaluate', {
                             expression: expression,
                             frameId: frameId,
                             context: 'repl'
@@ -526,16 +417,20 @@ export class CoreClrDebugAdapter extends BaseDebugAdapter {
     }
 
     /**
-     * Stream variables (stub for now)
-     * TODO: Implement file streaming for large C# collections
+     * Stream variables to a file or record sink
+     *
+     * Walks the frame (or params.expression) depth-first via the shared
+     * BaseDebugAdapter.streamVariableTree(), using findActiveThread() to pick
+     * the thread with user code.
      */
     async streamVariables(params: IStreamVariablesParams): Promise<IStreamResult> {
-        return {
-            success: false,
-            error: createDebugError(
-                DebugErrorCode.E_NOT_IMPLEMENTED,
-                'Stream variables not yet implemented for C#. Use debug.save-variable instead.'
-            )
-        };
+        const includeExpensive = params.includeExpensive ?? false;
+        const scopeFilter = params.scopeFilter ?? 'all';
+
+        return this.streamVariableTree(params, {
+            findThread: () => this.findActiveThread(),
+            filterScopes: scopes => this.filterScopes(scopes, includeExpensive, scopeFilter),
+            estimateSize: variable => this.estimateVariableSize(variable)
+        });
     }
 }
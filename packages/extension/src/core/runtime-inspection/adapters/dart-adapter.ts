@@ -46,6 +46,7 @@ import {
     IStreamResult
 } from '../interfaces';
 import { BaseDebugAdapter } from './BaseDebugAdapter';
+import { VariableExpander } from '../VariableExpander';
 import {
     IDebugError,
     DebugErrorCode,
@@ -170,7 +171,7 @@ export class DartDebugAdapter extends BaseDebugAdapter {
             // Strategy 1: Use cached isolate ID from stopped event (fast path)
             if (this.lastStoppedIsolateId !== null) {
                 try {
-                    const stack = await this.session.customRequest('stackTrace', {
+                    const stack = await this.request('stackTrace', {
                         threadId: this.lastStoppedIsolateId,
                         startFrame: 0,
                         levels: 1
@@ -191,12 +192,12 @@ export class DartDebugAdapter extends BaseDebugAdapter {
             }
 
             // Strategy 2: Fallback - scan all isolates for one with source code
-            const threadsResponse = await this.session.customRequest('threads');
+            const threadsResponse = await this.request('threads');
             const threads = threadsResponse.threads || [];
 
             for (const thread of threads) {
                 try {
-                    const stack = await this.session.customRequest('stackTrace', {
+                    const stack = await this.request('stackTrace', {
                         threadId: thread.id,
                         startFrame: 0,
                         levels: 1
@@ -324,6 +325,7 @@ export class DartDebugAdapter extends BaseDebugAdapter {
      * @param depth - Current depth
      * @param maxDepth - Maximum depth to traverse
      * @param visited - Set of visited variable references (cycle detection)
+     * @param expander - Fetches children once per reference, ahead of the walk
      * @param parent - Parent variable (for evaluateName building)
      * @returns Enhanced variable data with children
      */
@@ -332,6 +334,7 @@ export class DartDebugAdapter extends BaseDebugAdapter {
         depth: number,
         maxDepth: number,
         visited: Set<number>,
+        expander: VariableExpander,
         parent: IVariableData | null = null
     ): Promise<IEnhancedVariableData> {
         const enhanced: IEnhancedVariableData = { ...variable };
@@ -393,17 +396,13 @@ export class DartDebugAdapter extends BaseDebugAdapter {
         visited.add(variable.variablesReference);
 
         try {
-            // Fetch children
-            const childrenResponse = await this.session.customRequest('variables', {
-                variablesReference: variable.variablesReference,
-                start: 0,
-                count: 100 // Conservative page size
-            });
-
-            const children = childrenResponse.variables || [];
+            // Fetch children (usually already prefetched with the siblings)
+            const children = await expander.children(variable.variablesReference);
             enhanced.children = [];
             enhanced.totalChildren = children.length;
 
+            expander.prefetch(children, depth + 1, []);
+
             // Expand each child recursively
             for (const child of children) {
                 const expandedChild = await this.expandVariable(
@@ -411,6 +410,7 @@ export class DartDebugAdapter extends BaseDebugAdapter {
                     depth + 1,
                     maxDepth,
                     visited,
+                    expander,
                     variable
                 );
                 enhanced.children.push(expandedChild);
@@ -455,7 +455,7 @@ export class DartDebugAdapter extends BaseDebugAdapter {
                 }
 
                 // Get stack trace for frame ID
-                const stackResponse = await this.session.customRequest('stackTrace', {
+                const stackResponse = await this.request('stackTrace', {
                     threadId: isolateId,
                     startFrame: params.frameId || 0,
                     levels: 1
@@ -471,7 +471,7 @@ export class DartDebugAdapter extends BaseDebugAdapter {
                 const frameId = stackResponse.stackFrames[0].id;
 
                 // Get scopes
-                const scopesResponse = await this.session.customRequest('scopes', {
+                const scopesResponse = await this.request('scopes', {
                     frameId: frameId
                 });
 
@@ -503,12 +503,26 @@ export class DartDebugAdapter extends BaseDebugAdapter {
                 const maxDepth = params.maxDepth !== undefined ? params.maxDepth : 3;
                 const visited = new Set<number>();
 
+                // Children requests are pipelined and deduplicated; sentinels
+                // and lazy getters are never fetched ahead (Discoveries 02, 13)
+                const expander = this.createExpander({
+                    maxDepth,
+                    maxChildren: 100, // Conservative page size
+                    signal,
+                    estimateSize: variable => this.estimateVariableSize(variable),
+                    inspect: async variable =>
+                        this.isSentinel(variable.value) || variable.presentationHint?.lazy === true
+                            ? variable
+                            : undefined
+                });
+
                 for (const scope of targetScopes) {
-                    const varsResponse = await this.session.customRequest('variables', {
+                    const varsResponse = await this.request('variables', {
                         variablesReference: scope.variablesReference
                     });
 
                     const scopeVars = varsResponse.variables || [];
+                    expander.prefetch(scopeVars, 0, []);
 
                     // Expand each variable
                     for (const variable of scopeVars) {
@@ -517,6 +531,7 @@ export class DartDebugAdapter extends BaseDebugAdapter {
                             0,
                             maxDepth,
                             visited,
+                            expander,
                             null
                         );
                         allVariables.push(expanded);
@@ -555,7 +570,7 @@ export class DartDebugAdapter extends BaseDebugAdapter {
 
                 // Strategy 1: Try setVariable request (preferred)
                 try {
-                    const result = await this.session.customRequest('setVariable', {
+                    const result = await this.request('setVariable', {
                         variablesReference: params.variablesReference,
                         name: params.name,
                         value: params.value
@@ -570,7 +585,7 @@ export class DartDebugAdapter extends BaseDebugAdapter {
                 } catch (setError) {
                     // Strategy 2: Fall back to evaluate (for expressions)
                     const expr = `${params.name} = ${params.value}`;
-                    const evalResult = await this.session.customRequest('evaluate', {
+                    const evalResult = await this.request('evaluate', {
                         expression: expr,
                         frameId: params.frameId
                     });
@@ -615,7 +630,7 @@ export class DartDebugAdapter extends BaseDebugAdapter {
                     throw new Error('Operation aborted');
                 }
 
-                const response = await this.session.customRequest('variables', {
+                const response = await this.request('variables', {
                     variablesReference: params.variablesReference,
                     start: params.start || 0,
                     count: params.count || 100,
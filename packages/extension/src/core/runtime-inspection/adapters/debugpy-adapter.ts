@@ -41,35 +41,6 @@ import {
     createLargeDataError
 } from '../../errors/debug-errors';
 
-/**
- * Enhanced variable data with cycle detection and depth tracking
- * Same as CoreClrAdapter
- */
-interface IEnhancedVariableData extends IVariableData {
-    /** Children array if expanded */
-    children?: IEnhancedVariableData[];
-    /** Number of children shown */
-    childrenShown?: number;
-    /** Total children available */
-    totalChildren?: number;
-    /** Whether children were truncated */
-    childrenTruncated?: boolean;
-    /** Truncated due to depth or budget */
-    truncated?: boolean;
-    /** Reason for truncation */
-    truncatedReason?: 'maxDepth' | 'budget' | 'maxChildren';
-    /** Whether this is expandable */
-    expandable?: boolean;
-    /** Circular reference detected */
-    cycle?: boolean;
-    /** Original value before cycle marker */
-    originalValue?: string;
-    /** How cycle was detected (Python: only variablesReference) */
-    cycleVia?: 'variablesReference';
-    /** Error expanding this variable */
-    error?: string;
-}
-
 /**
  * Python Debug Adapter (debugpy) - Full implementation for Python
  *
@@ -121,7 +92,7 @@ export class DebugpyAdapter extends BaseDebugAdapter {
      */
     private async getMostRecentlyStoppedThread(): Promise<number | null> {
         try {
-            const threadsResponse = await this.session.customRequest('threads');
+            const threadsResponse = await this.request('threads');
             const threads = threadsResponse.threads || [];
 
             // Python: all threads stop together, use first thread
@@ -168,7 +139,7 @@ import inspect
 isinstance(inspect.getattr_static(type(${objExpr}), '${attrName}', None), property)
             `.trim();
 
-            const response = await this.session.customRequest('evaluate', {
+            const response = await this.request('evaluate', {
                 expression: checkExpr,
                 frameId: frameId,
                 context: 'watch'
@@ -250,76 +221,31 @@ isinstance(inspect.getattr_static(type(${objExpr}), '${attrName}', None), proper
                 const scopes = await this.getScopes(frameId);
 
                 // Filter scopes based on expensive flag and scope filter
-                const scopesToProcess = scopes.filter(scope => {
-                    // Check expensive flag
-                    if (scope.expensive && !includeExpensive) {
-                        return false;
-                    }
-
-                    // Apply scope filter
-                    if (scopeFilter !== 'all') {
-                        const scopeName = scope.name.toLowerCase();
-                        const hint = scope.presentationHint?.toLowerCase();
-
-                        if (scopeFilter === 'local' && !(scopeName.includes('local') || hint === 'locals')) {
-                            return false;
-                        }
-                        if (scopeFilter === 'global' && !(scopeName.includes('global') || hint === 'globals')) {
-                            return false;
-                        }
-                        // Python doesn't typically have closure scope like JavaScript
-                    }
-
-                    return true;
-                });
+                const scopesToProcess = this.filterScopes(scopes, includeExpensive, scopeFilter);
 
                 // Reset memory budget for this operation
                 this.memoryBudget.reset();
 
-                // Track visited references for cycle detection
+                // Pipelined depth-first expansion with cycle detection and budget tracking
                 // PYTHON-SPECIFIC: Only variablesReference tracking, NO id() calls
-                const visited = new Set<number>();
-
-                // Recursive expansion with cycle detection and budget tracking
-                const expandVariable = async (
-                    variable: IVariableData,
-                    currentDepth: number,
-                    ancestors: IVariableData[]
-                ): Promise<IEnhancedVariableData> => {
-                    // Check if aborted
-                    if (signal.aborted) {
-                        throw new Error('Operation aborted');
-                    }
-
-                    // Check depth limit
-                    if (currentDepth >= maxDepth) {
-                        return {
-                            ...variable,
-                            truncated: true,
-                            truncatedReason: 'maxDepth',
-                            expandable: variable.variablesReference > 0
-                        };
-                    }
-
-                    // Leaf node
-                    if (variable.variablesReference === 0) {
-                        return variable;
-                    }
-
-                    // PYTHON-SPECIFIC: Check for special types (generators, coroutines)
-                    if (this.isSpecialType(variable)) {
-                        return {
-                            ...variable,
-                            variablesReference: 0,  // Mark as non-expandable
-                            value: `${variable.value} (exhaustible/non-inspectable)`,
-                            expandable: false
-                        };
-                    }
+                const expander = this.createExpander({
+                    maxDepth,
+                    maxChildren,
+                    signal,
+                    estimateSize: variable => this.estimateVariableSize(variable),
+                    inspect: async variable => {
+                        // PYTHON-SPECIFIC: Check for special types (generators, coroutines)
+                        if (this.isSpecialType(variable)) {
+                            return {
+                                ...variable,
+                                variablesReference: 0,  // Mark as non-expandable
+                                value: `${variable.value} (exhaustible/non-inspectable)`,
+                                expandable: false
+                            };
+                        }
 
-                    // PYTHON-SPECIFIC: Detect properties to prevent side effects
-                    if (variable.evaluateName) {
-                        const isProperty = await this.detectProperty(variable.evaluateName, frameId);
-                        if (isProperty) {
+                        // PYTHON-SPECIFIC: Detect properties to prevent side effects
+                        if (variable.evaluateName && await this.detectProperty(variable.evaluateName, frameId)) {
                             // Mark as lazy to prevent auto-expansion
                             return {
                                 ...variable,
@@ -333,73 +259,10 @@ isinstance(inspect.getattr_static(type(${objExpr}), '${attrName}', None), proper
                                 expandable: true
                             };
                         }
-                    }
-
-                    // PYTHON-SPECIFIC: Cycle detection using ONLY variablesReference
-                    // (same as CoreCLR - simpler than Node's Object.is())
-                    if (visited.has(variable.variablesReference)) {
-                        return {
-                            ...variable,
-                            cycle: true,
-                            value: '[Circular Reference]',
-                            originalValue: variable.value,
-                            cycleVia: 'variablesReference'
-                        };
-                    }
-
-                    // Add to visited set
-                    visited.add(variable.variablesReference);
-
-                    // Get children
-                    try {
-                        const childrenResponse = await this.session.customRequest('variables', {
-                            variablesReference: variable.variablesReference,
-                            count: maxChildren
-                        });
-
-                        const allChildren: IVariableData[] = childrenResponse.variables || [];
-                        const childrenToExpand = allChildren.slice(0, maxChildren);
-
-                        // Expand children recursively
-                        const expandedChildren: IEnhancedVariableData[] = [];
-                        const newAncestors = [...ancestors, variable];
-
-                        for (const child of childrenToExpand) {
-                            // Check memory budget before expanding
-                            const estimatedBytes = this.estimateVariableSize(child);
-                            const budgetResult = this.memoryBudget.addNode(estimatedBytes);
-
-                            if (!budgetResult.ok) {
-                                // Budget exceeded, stop expanding
-                                return {
-                                    ...variable,
-                                    children: expandedChildren,
-                                    childrenShown: expandedChildren.length,
-                                    totalChildren: allChildren.length,
-                                    truncated: true,
-                                    truncatedReason: 'budget'
-                                };
-                            }
-
-                            const expanded = await expandVariable(child, currentDepth + 1, newAncestors);
-                            expandedChildren.push(expanded);
-                        }
 
-                        return {
-                            ...variable,
-                            children: expandedChildren,
-                            childrenShown: childrenToExpand.length,
-                            totalChildren: variable.namedVariables || variable.indexedVariables || allChildren.length,
-                            childrenTruncated: allChildren.length > maxChildren
-                        };
-                    } catch (error) {
-                        return {
-                            ...variable,
-                            error: error instanceof Error ? error.message : String(error),
-                            expandable: true
-                        };
+                        return undefined;
                     }
-                };
+                });
 
                 // Process each scope
                 const result: IVariableData[] = [];
@@ -410,19 +273,15 @@ isinstance(inspect.getattr_static(type(${objExpr}), '${attrName}', None), proper
                     }
 
                     try {
-                        const varsResponse = await this.session.customRequest('variables', {
+                        const varsResponse = await this.request('variables', {
                             variablesReference: scope.variablesReference,
                             count: 200 // Conservative default
                         });
 
                         const variables: IVariableData[] = varsResponse.variables || [];
 
-                        // Expand each variable
-                        const expandedVariables: IEnhancedVariableData[] = [];
-                        for (const variable of variables) {
-                            const expanded = await expandVariable(variable, 1, []);
-                            expandedVariables.push(expanded);
-                        }
+                        // Expand each variable (siblings' children are fetched ahead)
+                        const expandedVariables = await expander.expandAll(variables);
 
                         // Add scope node to result
                         result.push({
@@ -470,6 +329,38 @@ isinstance(inspect.getattr_static(type(${objExpr}), '${attrName}', None), proper
         }) as Promise<IVariableData[] | IDebugError>;
     }
 
+    /**
+     * Scopes to walk for listVariables/streamVariables
+     */
+    private filterScopes(
+        scopes: any[],
+        includeExpensive: boolean,
+        scopeFilter: 'all' | 'local' | 'closure' | 'global'
+    ): any[] {
+        return scopes.filter(scope => {
+            // Check expensive flag
+            if (scope.expensive && !includeExpensive) {
+                return false;
+            }
+
+            // Apply scope filter
+            if (scopeFilter !== 'all') {
+                const scopeName = scope.name.toLowerCase();
+                const hint = scope.presentationHint?.toLowerCase();
+
+                if (scopeFilter === 'local' && !(scopeName.includes('local') || hint === 'locals')) {
+                    return false;
+                }
+                if (scopeFilter === 'global' && !(scopeName.includes('global') || hint === 'globals')) {
+                    return false;
+                }
+                // Python doesn't typically have closure scope like JavaScript
+            }
+
+            return true;
+        });
+    }
+
     /**
      * Estimate variable size for memory budget tracking
      * Same logic as CoreClrAdapter but without memoryReference
@@ -500,7 +391,7 @@ isinstance(inspect.getattr_static(type(${objExpr}), '${attrName}', None), proper
                 const start = params.start ?? 0;
                 const count = params.count ?? 100;
 
-                const response = await this.session.customRequest('variables', {
+                const response = await this.request('variables', {
                     variablesReference: params.variablesReference,
                     start: start,
                     count: count,
@@ -532,7 +423,7 @@ isinstance(inspect.getattr_static(type(${objExpr}), '${attrName}', None), proper
             try {
                 // Strategy 1: Try DAP setVariable (preferred)
                 try {
-                    const result = await this.session.customRequest('setVariable', {
+                    const result = await this.request('setVariable', {
                         variablesReference: params.variablesReference,
                         name: params.name,
                         value: params.value
@@ -562,7 +453,7 @@ isinstance(inspect.getattr_static(type(${objExpr}), '${attrName}', None), proper
                     const expression = `${params.name} = ${params.value}`;
 
                     try {
-                        const evalResult = await this.session.customRequest('evaluate', {
+                        const evalResult = await this.request('evaluate', {
                             expression: expression,
                             frameId: frameId,
                             context: 'repl'
@@ -598,16 +489,30 @@ isinstance(inspect.getattr_static(type(${objExpr}), '${attrName}', None), proper
     }
 
     /**
-     * Stream variables (stub for now)
-     * TODO: Implement file streaming for large Python collections
+     * Stream variables to a file or record sink
+     *
+     * Walks the frame (or params.expression) depth-first via the shared
+     * BaseDebugAdapter.streamVariableTree(), with the same Python safety rules
+     * as listVariables(): generators/coroutines and @property attributes are
+     * written but never expanded.
      */
     async streamVariables(params: IStreamVariablesParams): Promise<IStreamResult> {
-        return {
-            success: false,
-            error: createDebugError(
-                DebugErrorCode.E_NOT_IMPLEMENTED,
-                'Stream variables not yet implemented for Python. Use debug.save-variable instead.'
-            )
-        };
+        const includeExpensive = params.includeExpensive ?? false;
+        const scopeFilter = params.scopeFilter ?? 'all';
+
+        return this.streamVariableTree(params, {
+            findThread: () => this.getMostRecentlyStoppedThread(),
+            filterScopes: scopes => this.filterScopes(scopes, includeExpensive, scopeFilter),
+            estimateSize: variable => this.estimateVariableSize(variable),
+            skipChildren: async (variable, frameId) => {
+                if (this.isSpecialType(variable)) {
+                    return 'special';
+                }
+                if (await this.detectProperty(variable.evaluateName, frameId)) {
+                    return 'lazy';
+                }
+                return undefined;
+            }
+        });
     }
 }
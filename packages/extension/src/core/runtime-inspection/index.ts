@@ -25,6 +25,27 @@ export {
     MemoryBudget
 } from './MemoryBudget';
 
+// Variable streaming
+export {
+    IVariableStreamRecord,
+    IVariableStreamCursor,
+    VariableTreeWalker,
+    encodeVariableCursor,
+    decodeVariableCursor
+} from './VariableStream';
+
+// Variable expansion
+export {
+    IExpandedVariableData,
+    VariableExpander
+} from './VariableExpander';
+
+// Pause cache
+export {
+    IPauseCacheStats,
+    PauseCache
+} from './PauseCache';
+
 // Base adapter
 export {
     BaseDebugAdapter
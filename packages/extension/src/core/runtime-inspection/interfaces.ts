@@ -7,6 +7,8 @@
 
 import * as vscode from 'vscode';
 import { IDebugError } from '../errors/debug-errors';
+import { IVariableStreamRecord } from './VariableStream';
+import { IPauseCacheStats } from './PauseCache';
 
 /**
  * Streaming suggestion for large data operations
@@ -212,8 +214,11 @@ export interface IVariableChildrenParams {
  * Parameters for streamVariables operation
  */
 export interface IStreamVariablesParams {
-    /** Output file path */
-    outputPath: string;
+    /** Output file path (NDJSON); appended to when resuming from a cursor */
+    outputPath?: string;
+
+    /** Receives each record as it is written (e.g. a job event stream) */
+    onRecord?: (record: IVariableStreamRecord) => void;
 
     /** Maximum depth to traverse */
     maxDepth?: number;
@@ -226,6 +231,30 @@ export interface IStreamVariablesParams {
 
     /** Format: 'json' | 'text' */
     format?: 'json' | 'text';
+
+    /** Thread ID (optional, uses the adapter's thread detection if not provided) */
+    threadId?: number;
+
+    /** Frame ID (optional, uses top frame if not provided) */
+    frameId?: number;
+
+    /** Stream this expression's subtree instead of the frame's scopes */
+    expression?: string;
+
+    /** Children fetched per variables request */
+    pageSize?: number;
+
+    /** Stop after this many records and return a cursor */
+    maxNodes?: number;
+
+    /** Resume from IStreamResult.cursor of an earlier call */
+    cursor?: string;
+
+    /** Stops the walk; the result carries a cursor */
+    signal?: AbortSignal;
+
+    /** Overall time limit; the walk stops with a cursor when it expires */
+    timeoutMs?: number;
 }
 
 /**
@@ -244,6 +273,15 @@ export interface IStreamResult {
     /** Number of bytes written */
     byteCount?: number;
 
+    /** False if the walk stopped early (see cursor) */
+    complete?: boolean;
+
+    /** Resume token while the debugger stays paused; set when incomplete */
+    cursor?: string;
+
+    /** Times the walk waited for output to flush */
+    flushes?: number;
+
     /** Error if operation failed */
     error?: IDebugError;
 }
@@ -284,6 +322,22 @@ export interface IDebugAdapter {
      */
     evaluateExpression(expression: string, frameId?: number): Promise<any | IDebugError>;
 
+    /**
+     * Send a DAP request; threads/stackTrace/scopes/variables are served from
+     * the per-pause cache
+     */
+    request(command: string, args?: any): Promise<any>;
+
+    /**
+     * Pause cache hit/miss counters
+     */
+    getCacheStats(): IPauseCacheStats;
+
+    /**
+     * Drop cached DAP responses for the current pause
+     */
+    invalidateCache(): void;
+
     /**
      * Dispose adapter and clean up resources
      */
@@ -0,0 +1,174 @@
+/**
+ * Call Graph - Breadth-first walk of a call hierarchy with budgets
+ *
+ * `symbol.calls` with depth > 1 expands callers (or callees) of callers level
+ * by level instead of making the client issue one request per node:
+ * - Each item is expanded at most once (memoized by key), so cycles and
+ *   shared callers cost one provider call
+ * - Items on the same level are expanded concurrently, up to a limit
+ * - Node and wall-clock budgets stop the walk early and report why
+ *
+ * The walker is independent of VS Code: callers supply the expand function
+ * (provideIncomingCalls / provideOutgoingCalls) and the item key.
+ */
+
+/**
+ * Walk limits
+ */
+export interface CallGraphOptions<T> {
+    /** Levels to expand below the root (1 = the root's own calls) */
+    maxDepth: number;
+
+    /** Stop adding nodes once the graph holds this many (root included) */
+    maxNodes: number;
+
+    /** Stop starting new expansions after this many milliseconds */
+    timeoutMs: number;
+
+    /** Expansions in flight at once */
+    concurrency: number;
+
+    /** Identity of an item; items with the same key are the same node */
+    key: (item: T) => string;
+}
+
+/**
+ * One distinct item in the graph
+ */
+export interface CallGraphNode<T, C> {
+    id: number;
+    item: T;
+
+    /** Level at which the node was first reached (root = 0) */
+    depth: number;
+
+    /** The node's calls, if it was expanded */
+    calls?: C[];
+
+    /** Why expanding the node failed (the walk continues without it) */
+    error?: string;
+}
+
+/**
+ * Call between two nodes, as returned by the expand function
+ */
+export interface CallGraphEdge<C> {
+    /** Expanded node */
+    from: number;
+
+    /** Node reached through the call */
+    to: number;
+
+    call: C;
+}
+
+export interface CallGraph<T, C> {
+    /** Nodes in breadth-first order; nodes[0] is the root */
+    nodes: CallGraphNode<T, C>[];
+    edges: CallGraphEdge<C>[];
+
+    /** Set when a budget cut the walk short */
+    truncated?: 'maxNodes' | 'timeout';
+}
+
+/**
+ * Map over items with at most `limit` calls in flight; results keep input order
+ */
+export async function mapWithConcurrency<T, R>(
+    items: readonly T[],
+    limit: number,
+    fn: (item: T, index: number) => Promise<R>
+): Promise<R[]> {
+    const results = new Array<R>(items.length);
+    let next = 0;
+
+    const worker = async (): Promise<void> => {
+        while (next < items.length) {
+            const index = next++;
+            results[index] = await fn(items[index], index);
+        }
+    };
+
+    const workers = Array.from({ length: Math.min(Math.max(1, limit), items.length) }, worker);
+    await Promise.all(workers);
+    return results;
+}
+
+/**
+ * Walk the call hierarchy below `root` breadth-first
+ *
+ * Errors expanding the root propagate; errors on deeper nodes are recorded
+ * on the node. Edges are listed in level order, then in the order the
+ * expand function returned them, regardless of which expansion finished
+ * first.
+ *
+ * @param root Item to start from
+ * @param expand Calls of an item (one provider round-trip)
+ * @param target Item a call leads to (`from` for incoming, `to` for outgoing)
+ */
+export async function walkCallGraph<T, C>(
+    root: T,
+    expand: (item: T) => Promise<C[]>,
+    target: (call: C) => T,
+    options: CallGraphOptions<T>
+): Promise<CallGraph<T, C>> {
+    const deadline = Date.now() + options.timeoutMs;
+    const graph: CallGraph<T, C> = { nodes: [], edges: [] };
+    const byKey = new Map<string, CallGraphNode<T, C>>();
+
+    const add = (item: T, depth: number): CallGraphNode<T, C> | undefined => {
+        const key = options.key(item);
+        const known = byKey.get(key);
+        if (known) {
+            return known;
+        }
+        if (graph.nodes.length >= options.maxNodes) {
+            graph.truncated ??= 'maxNodes';
+            return undefined;
+        }
+        const node: CallGraphNode<T, C> = { id: graph.nodes.length, item, depth };
+        graph.nodes.push(node);
+        byKey.set(key, node);
+        return node;
+    };
+
+    const rootNode = add(root, 0)!;
+    rootNode.calls = await expand(root);
+    let frontier = [rootNode];
+
+    for (let depth = 1; depth <= options.maxDepth && frontier.length > 0; depth++) {
+        // Expand this level (the root was expanded above)
+        if (depth > 1) {
+            await mapWithConcurrency(frontier, options.concurrency, async node => {
+                if (Date.now() >= deadline) {
+                    graph.truncated ??= 'timeout';
+                    return;
+                }
+                try {
+                    node.calls = await expand(node.item);
+                } catch (error) {
+                    node.error = error instanceof Error ? error.message : String(error);
+                }
+            });
+        }
+
+        // Link in deterministic order; only first-seen nodes go to the next level
+        const next: CallGraphNode<T, C>[] = [];
+        for (const node of frontier) {
+            for (const call of node.calls ?? []) {
+                const isNew = !byKey.has(options.key(target(call)));
+                const child = add(target(call), depth);
+                if (!child) {
+                    continue;
+                }
+                graph.edges.push({ from: node.id, to: child.id, call });
+                if (isNew) {
+                    next.push(child);
+                }
+            }
+        }
+        frontier = next;
+    }
+
+    return graph;
+}
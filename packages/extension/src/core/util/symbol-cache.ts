@@ -0,0 +1,380 @@
+/**
+ * Symbol Cache - Document symbols cached per document version, with lookup indexes
+ *
+ * `vscode.executeDocumentSymbolProvider` can take hundreds of milliseconds on
+ * large files with slow language servers (Pylance, Java). The cache keeps one
+ * DocumentSymbolIndex per URI, tagged with the TextDocument version it was
+ * built from, and drops it when the document changes or closes. The index
+ * answers the lookups symbol-resolver and the symbol tools make:
+ * - Name and qualified-path lookups from hash maps
+ * - Symbol → qualified name without walking the tree
+ * - Position → symbol (selection or innermost range) from interval trees
+ *
+ * Empty results are never cached (the language server may not be ready yet).
+ */
+
+import * as vscode from 'vscode';
+
+/**
+ * Orderable key for a position (line-major)
+ */
+function positionKey(position: vscode.Position): number {
+    return position.line * 0x100000 + Math.min(position.character, 0xfffff);
+}
+
+/**
+ * One symbol in the flattened tree
+ */
+interface IndexedSymbol {
+    symbol: vscode.DocumentSymbol;
+    parent: IndexedSymbol | null;
+    /** Pre-order position in the tree */
+    order: number;
+    qualifiedName: string;
+}
+
+/**
+ * Static interval tree over symbol ranges
+ *
+ * Intervals are sorted by start; each node of the implicit balanced tree
+ * (midpoint of a sorted slice) stores the largest end in its subtree, so a
+ * stabbing query visits O(log n + k) nodes.
+ */
+class IntervalTree {
+    private readonly starts: number[];
+    private readonly ends: number[];
+    private readonly items: IndexedSymbol[];
+    private readonly maxEnd: number[];
+
+    constructor(entries: IndexedSymbol[], range: (entry: IndexedSymbol) => vscode.Range) {
+        const sorted = entries
+            .map(entry => ({ entry, start: positionKey(range(entry).start), end: positionKey(range(entry).end) }))
+            .sort((a, b) => a.start - b.start || a.entry.order - b.entry.order);
+
+        this.starts = sorted.map(s => s.start);
+        this.ends = sorted.map(s => s.end);
+        this.items = sorted.map(s => s.entry);
+        this.maxEnd = new Array(sorted.length).fill(-1);
+        this.build(0, sorted.length - 1);
+    }
+
+    /**
+     * All entries whose interval contains the position, in pre-order
+     */
+    stab(position: vscode.Position): IndexedSymbol[] {
+        const found: IndexedSymbol[] = [];
+        this.query(0, this.items.length - 1, positionKey(position), found);
+        return found.sort((a, b) => a.order - b.order);
+    }
+
+    private build(lo: number, hi: number): number {
+        if (lo > hi) {
+            return -1;
+        }
+        const mid = (lo + hi) >> 1;
+        this.maxEnd[mid] = Math.max(this.ends[mid], this.build(lo, mid - 1), this.build(mid + 1, hi));
+        return this.maxEnd[mid];
+    }
+
+    private query(lo: number, hi: number, key: number, found: IndexedSymbol[]): void {
+        if (lo > hi) {
+            return;
+        }
+        const mid = (lo + hi) >> 1;
+        if (this.maxEnd[mid] < key) {
+            return; // Nothing in this subtree reaches the position
+        }
+        this.query(lo, mid - 1, key, found);
+        if (this.starts[mid] > key) {
+            return; // Everything to the right starts after the position
+        }
+        if (this.ends[mid] >= key) {
+            found.push(this.items[mid]);
+        }
+        this.query(mid + 1, hi, key, found);
+    }
+}
+
+/**
+ * Precomputed lookups over one document's symbol tree
+ *
+ * Results match the recursive traversals in symbol-resolver: where several
+ * symbols qualify, the first in tree (pre-)order wins.
+ */
+export class DocumentSymbolIndex {
+    private static readonly byTree = new WeakMap<vscode.DocumentSymbol[], DocumentSymbolIndex>();
+
+    private readonly entries = new Map<vscode.DocumentSymbol, IndexedSymbol>();
+    private readonly names = new Map<string, vscode.DocumentSymbol[]>();
+    private readonly paths = new Map<string, vscode.DocumentSymbol>();
+    private ranges?: IntervalTree;
+    private selections?: IntervalTree;
+
+    constructor(public readonly symbols: vscode.DocumentSymbol[]) {
+        this.add(symbols, null, true);
+    }
+
+    /**
+     * Index for a symbol tree, built once per tree
+     */
+    static for(symbols: vscode.DocumentSymbol[]): DocumentSymbolIndex {
+        let index = DocumentSymbolIndex.byTree.get(symbols);
+        if (!index) {
+            index = new DocumentSymbolIndex(symbols);
+            DocumentSymbolIndex.byTree.set(symbols, index);
+        }
+        return index;
+    }
+
+    /** Number of symbols in the tree */
+    get size(): number {
+        return this.entries.size;
+    }
+
+    /**
+     * Symbols named `name`, or Java-style `name(params)`, in tree order
+     */
+    byName(name: string): vscode.DocumentSymbol[] {
+        return this.names.get(name) ?? [];
+    }
+
+    /**
+     * Symbol reached by following dot-separated names from the roots, taking
+     * the first child with each name
+     */
+    byPath(qualifiedName: string): vscode.DocumentSymbol | null {
+        return this.paths.get(qualifiedName) ?? null;
+    }
+
+    /**
+     * Dot-joined names from the root to `symbol` ('' if not in this tree)
+     */
+    qualifiedNameOf(symbol: vscode.DocumentSymbol): string {
+        return this.entries.get(symbol)?.qualifiedName ?? '';
+    }
+
+    /**
+     * First symbol (tree order) whose selectionRange contains the position
+     */
+    atSelection(position: vscode.Position): vscode.DocumentSymbol | null {
+        this.selections ??= new IntervalTree([...this.entries.values()], entry => entry.symbol.selectionRange);
+        return this.selections.stab(position)[0]?.symbol ?? null;
+    }
+
+    /**
+     * Innermost symbol whose range contains the position, descending into the
+     * first containing sibling at each level
+     */
+    innermostAt(position: vscode.Position): vscode.DocumentSymbol | null {
+        const chain = this.containingChain(position);
+        return chain.length > 0 ? chain[chain.length - 1] : null;
+    }
+
+    /**
+     * Qualified name of the symbol at a position: containing symbols from the
+     * root, stopping at the first whose selectionRange holds the position
+     */
+    qualifiedNameAt(position: vscode.Position): string | null {
+        const chain = this.containingChain(position);
+        if (chain.length === 0) {
+            return null;
+        }
+        const key = positionKey(position);
+        const stop = chain.findIndex(symbol =>
+            positionKey(symbol.selectionRange.start) <= key && key <= positionKey(symbol.selectionRange.end)
+        );
+        return chain.slice(0, stop === -1 ? chain.length : stop + 1).map(symbol => symbol.name).join('.');
+    }
+
+    private containingChain(position: vscode.Position): vscode.DocumentSymbol[] {
+        this.ranges ??= new IntervalTree([...this.entries.values()], entry => entry.symbol.range);
+
+        // Pre-order: a containing symbol whose parent is the last pick is the
+        // first containing child of that pick
+        const chain: IndexedSymbol[] = [];
+        for (const entry of this.ranges.stab(position)) {
+            if (entry.parent === (chain[chain.length - 1] ?? null)) {
+                chain.push(entry);
+            }
+        }
+        return chain.map(entry => entry.symbol);
+    }
+
+    private add(symbols: vscode.DocumentSymbol[], parent: IndexedSymbol | null, onPath: boolean): void {
+        for (const symbol of symbols) {
+            if (this.entries.has(symbol)) {
+                continue;
+            }
+            const entry: IndexedSymbol = {
+                symbol,
+                parent,
+                order: this.entries.size,
+                qualifiedName: parent ? `${parent.qualifiedName}.${symbol.name}` : symbol.name
+            };
+            this.entries.set(symbol, entry);
+
+            this.addName(symbol.name, symbol);
+            for (let i = symbol.name.indexOf('('); i !== -1; i = symbol.name.indexOf('(', i + 1)) {
+                this.addName(symbol.name.slice(0, i), symbol);
+            }
+
+            // Only the first sibling with a name is reachable by path
+            const reachable = onPath && !symbol.name.includes('.') && !this.paths.has(entry.qualifiedName);
+            if (reachable) {
+                this.paths.set(entry.qualifiedName, symbol);
+            }
+
+            if (symbol.children && symbol.children.length > 0) {
+                this.add(symbol.children, entry, reachable);
+            }
+        }
+    }
+
+    private addName(name: string, symbol: vscode.DocumentSymbol): void {
+        const list = this.names.get(name);
+        if (!list) {
+            this.names.set(name, [symbol]);
+        } else if (list[list.length - 1] !== symbol) {
+            list.push(symbol);
+        }
+    }
+}
+
+/**
+ * Symbol cache counters
+ */
+export interface SymbolCacheStats {
+    hits: number;
+    misses: number;
+    documents: number;
+}
+
+interface CacheEntry {
+    version: number;
+    index: Promise<DocumentSymbolIndex | null>;
+}
+
+/**
+ * Document symbols cached by URI and TextDocument.version
+ */
+export class DocumentSymbolCache {
+    private static instance: DocumentSymbolCache | null = null;
+
+    private readonly entries = new Map<string, CacheEntry>();
+    private disposables: vscode.Disposable[] = [];
+    private hits = 0;
+    private misses = 0;
+
+    private constructor() {
+        this.disposables.push(
+            vscode.workspace.onDidChangeTextDocument(event => {
+                this.entries.delete(event.document.uri.toString());
+            }),
+            vscode.workspace.onDidCloseTextDocument(document => {
+                this.entries.delete(document.uri.toString());
+            })
+        );
+    }
+
+    /**
+     * Get singleton instance (registers the invalidation listeners)
+     */
+    public static getInstance(): DocumentSymbolCache {
+        if (!DocumentSymbolCache.instance) {
+            DocumentSymbolCache.instance = new DocumentSymbolCache();
+        }
+        return DocumentSymbolCache.instance;
+    }
+
+    /**
+     * Symbol index for a document, fetching from the language server only
+     * when the document changed since the last fetch
+     *
+     * @param uri Document URI
+     * @returns Index, or null if the provider returned no symbols
+     */
+    public async getIndex(uri: vscode.Uri): Promise<DocumentSymbolIndex | null> {
+        let version: number;
+        try {
+            version = (await vscode.workspace.openTextDocument(uri)).version;
+        } catch {
+            // Not loadable as a text document: don't cache
+            this.misses++;
+            return this.fetch(uri);
+        }
+
+        const key = uri.toString();
+        const cached = this.entries.get(key);
+        if (cached && cached.version === version) {
+            this.hits++;
+            return cached.index;
+        }
+
+        this.misses++;
+        const index = this.fetch(uri);
+        const entry: CacheEntry = { version, index };
+        this.entries.set(key, entry);
+        index.then(
+            result => {
+                if (!result && this.entries.get(key) === entry) {
+                    this.entries.delete(key);
+                }
+            },
+            () => {
+                if (this.entries.get(key) === entry) {
+                    this.entries.delete(key);
+                }
+            }
+        );
+        return index;
+    }
+
+    /**
+     * Document symbols (the provider's tree) for a document
+     */
+    public async getSymbols(uri: vscode.Uri): Promise<vscode.DocumentSymbol[] | null> {
+        return (await this.getIndex(uri))?.symbols ?? null;
+    }
+
+    /**
+     * Drop one document (or every document) from the cache
+     */
+    public invalidate(uri?: vscode.Uri): void {
+        if (uri) {
+            this.entries.delete(uri.toString());
+        } else {
+            this.entries.clear();
+        }
+    }
+
+    public stats(): SymbolCacheStats {
+        return { hits: this.hits, misses: this.misses, documents: this.entries.size };
+    }
+
+    public dispose(): void {
+        for (const disposable of this.disposables) {
+            disposable.dispose();
+        }
+        this.disposables = [];
+        this.entries.clear();
+        DocumentSymbolCache.instance = null;
+    }
+
+    private async fetch(uri: vscode.Uri): Promise<DocumentSymbolIndex | null> {
+        const symbols = await vscode.commands.executeCommand<vscode.DocumentSymbol[]>(
+            'vscode.executeDocumentSymbolProvider',
+            uri
+        );
+        if (!symbols || symbols.length === 0) {
+            return null;
+        }
+        return DocumentSymbolIndex.for(symbols);
+    }
+}
+
+/**
+ * Cached document symbol index for a URI (see DocumentSymbolCache)
+ */
+export function getDocumentSymbolIndex(uri: vscode.Uri): Promise<DocumentSymbolIndex | null> {
+    return DocumentSymbolCache.getInstance().getIndex(uri);
+}
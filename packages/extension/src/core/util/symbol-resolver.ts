@@ -7,11 +7,22 @@
  * - Hierarchical symbol search with multiple fallback strategies
  * - LSP operation timeout handling
  *
+ * Document symbols come from the version-keyed DocumentSymbolCache, and
+ * lookups go through its DocumentSymbolIndex rather than walking the tree.
+ *
  * Part of Phase 1: Symbol Resolver Foundation
  */
 
 import * as vscode from 'vscode';
 import * as path from 'path';
+import { DocumentSymbolIndex, getDocumentSymbolIndex } from './symbol-cache';
+
+export { DocumentSymbolCache, DocumentSymbolIndex, getDocumentSymbolIndex } from './symbol-cache';
+export type { SymbolCacheStats } from './symbol-cache';
+export { walkCallGraph, mapWithConcurrency } from './call-graph';
+export type { CallGraph, CallGraphEdge, CallGraphNode, CallGraphOptions } from './call-graph';
+export { WorkspaceSymbolIndex, SymbolTable } from './workspace-symbol-index';
+export type { IndexedWorkspaceSymbol, SymbolQueryOptions, WorkspaceSymbolIndexStats } from './workspace-symbol-index';
 
 /**
  * Resolve a file path to absolute, using workspace root for relative paths.
@@ -159,29 +170,9 @@ export function findAllMatchingSymbols(
     symbols: vscode.DocumentSymbol[],
     symbolName: string
 ): vscode.DocumentSymbol[] {
-    const matches: vscode.DocumentSymbol[] = [];
-
-    function traverse(syms: vscode.DocumentSymbol[]): void {
-        for (const symbol of syms) {
-            // Exact match
-            if (symbol.name === symbolName) {
-                matches.push(symbol);
-            }
-            // Java-style signature match: "add" should match "add(int, int)"
-            // This handles Java LSP which returns method names with parameter types
-            else if (symbol.name.startsWith(symbolName + '(')) {
-                matches.push(symbol);
-            }
-
-            // Recurse into children
-            if (symbol.children && symbol.children.length > 0) {
-                traverse(symbol.children);
-            }
-        }
-    }
-
-    traverse(symbols);
-    return matches;
+    // Exact names plus Java-style signatures ("add" matches "add(int, int)"),
+    // which the index files under each prefix ending before a '('
+    return [...DocumentSymbolIndex.for(symbols).byName(symbolName)];
 }
 
 /**
@@ -211,6 +202,7 @@ export function findSymbolInDocument(
 ): vscode.DocumentSymbol | null {
     // Count dots to determine smart ordering
     const dotCount = (symbolName.match(/\./g) || []).length;
+    const index = DocumentSymbolIndex.for(symbols);
 
     // Strategy 1: Exact match (find symbol by exact name)
     function exactMatch(): vscode.DocumentSymbol | null {
@@ -239,36 +231,13 @@ export function findSymbolInDocument(
     }
 
     // Strategy 2: Hierarchical split (traverse by dot-separated path)
+    // (first child with each name at every level, precomputed by the index)
     function hierarchicalSplit(): vscode.DocumentSymbol | null {
-        const parts = symbolName.split('.');
-        if (parts.length === 1) {
+        if (!symbolName.includes('.')) {
             return null; // Can't split, not a qualified name
         }
 
-        let current: vscode.DocumentSymbol[] = symbols;
-
-        for (let i = 0; i < parts.length; i++) {
-            const part = parts[i];
-            const found = current.find(s => s.name === part);
-
-            if (!found) {
-                return null; // Path broken, container not found
-            }
-
-            if (i === parts.length - 1) {
-                // Last part, this is our target symbol
-                return found;
-            }
-
-            // Not last part, descend into children
-            if (!found.children || found.children.length === 0) {
-                return null; // No children to descend into
-            }
-
-            current = found.children;
-        }
-
-        return null;
+        return index.byPath(symbolName);
     }
 
     // Strategy 3: Deep traversal (recursive fallback)
@@ -288,9 +257,8 @@ export function findSymbolInDocument(
         }
 
         // Multiple matches - check if qualified name helps disambiguate
-        // Try to match by building qualified names from tree
         for (const match of matches) {
-            const qualifiedName = buildQualifiedNameForSymbol(symbols, match);
+            const qualifiedName = index.qualifiedNameOf(match);
             if (qualifiedName === symbolName) {
                 return match;
             }
@@ -346,28 +314,7 @@ function buildQualifiedNameForSymbol(
     symbols: vscode.DocumentSymbol[],
     target: vscode.DocumentSymbol
 ): string {
-    const path: string[] = [];
-
-    function findPath(syms: vscode.DocumentSymbol[], targetSym: vscode.DocumentSymbol): boolean {
-        for (const symbol of syms) {
-            if (symbol === targetSym) {
-                path.push(symbol.name);
-                return true;
-            }
-
-            if (symbol.children && symbol.children.length > 0) {
-                if (findPath(symbol.children, targetSym)) {
-                    path.unshift(symbol.name);
-                    return true;
-                }
-            }
-        }
-
-        return false;
-    }
-
-    findPath(symbols, target);
-    return path.join('.');
+    return DocumentSymbolIndex.for(symbols).qualifiedNameOf(target);
 }
 
 /**
@@ -408,15 +355,13 @@ export async function resolveFromFlowspaceId(
     // Convert file path to URI
     const uri = vscode.Uri.file(absolutePath);
 
-    // Get document symbols from LSP
-    const symbols = await vscode.commands.executeCommand<vscode.DocumentSymbol[]>(
-        'vscode.executeDocumentSymbolProvider',
-        uri
-    );
+    // Get document symbols from LSP (cached per document version)
+    const index = await getDocumentSymbolIndex(uri);
 
-    if (!symbols || symbols.length === 0) {
+    if (!index) {
         return null; // No symbols available
     }
+    const symbols = index.symbols;
 
     // If no qualified name, return file reference
     if (!parsed.qualifiedName) {
@@ -462,15 +407,13 @@ export async function resolveFromSymbolName(
     // Convert file path to URI
     const uri = vscode.Uri.file(absolutePath);
 
-    // Get document symbols from LSP
-    const symbols = await vscode.commands.executeCommand<vscode.DocumentSymbol[]>(
-        'vscode.executeDocumentSymbolProvider',
-        uri
-    );
+    // Get document symbols from LSP (cached per document version)
+    const index = await getDocumentSymbolIndex(uri);
 
-    if (!symbols || symbols.length === 0) {
+    if (!index) {
         return null; // No symbols available
     }
+    const symbols = index.symbols;
 
     // Find symbol by name
     const symbol = findSymbolInDocument(symbols, symbolName);
@@ -585,36 +528,9 @@ export function buildQualifiedName(
     symbols: vscode.DocumentSymbol[],
     position: vscode.Position
 ): string | null {
-    const path: string[] = [];
-
-    function traverse(syms: vscode.DocumentSymbol[]): boolean {
-        for (const symbol of syms) {
-            // Check if position is within this symbol's range
-            if (symbol.range.contains(position)) {
-                path.push(symbol.name);
-
-                // Check if position is in selection range (the symbol itself, not just container)
-                if (symbol.selectionRange.contains(position)) {
-                    return true; // Found the exact symbol
-                }
-
-                // Position is in this symbol's range but not selection range
-                // Continue searching children
-                if (symbol.children && symbol.children.length > 0) {
-                    if (traverse(symbol.children)) {
-                        return true;
-                    }
-                }
-
-                // Position in range but no child matched, use this symbol
-                return true;
-            }
-        }
-        return false;
-    }
-
-    const found = traverse(symbols);
-    return found ? path.join('.') : null;
+    // Containing symbols from the root, stopping at the one whose
+    // selectionRange (the symbol itself, not just a container) holds the position
+    return DocumentSymbolIndex.for(symbols).qualifiedNameAt(position);
 }
 
 /**
@@ -630,34 +546,15 @@ export async function findSymbolAtPosition(
     uri: vscode.Uri,
     position: vscode.Position
 ): Promise<vscode.DocumentSymbol | null> {
-    // Get document symbols from LSP
-    const symbols = await vscode.commands.executeCommand<vscode.DocumentSymbol[]>(
-        'vscode.executeDocumentSymbolProvider',
-        uri
-    );
+    // Get document symbols from LSP (cached per document version)
+    const index = await getDocumentSymbolIndex(uri);
 
-    if (!symbols || symbols.length === 0) {
+    if (!index) {
         return null;
     }
 
-    // Find symbol containing the position
-    function traverse(syms: vscode.DocumentSymbol[]): vscode.DocumentSymbol | null {
-        for (const symbol of syms) {
-            // Check if position is in selection range (exact match)
-            if (symbol.selectionRange.contains(position)) {
-                return symbol;
-            }
-
-            // Check children
-            if (symbol.children && symbol.children.length > 0) {
-                const found = traverse(symbol.children);
-                if (found) return found;
-            }
-        }
-        return null;
-    }
-
-    return traverse(symbols);
+    // First symbol whose selection range (exact match) holds the position
+    return index.atSelection(position);
 }
 
 /**
@@ -768,22 +665,19 @@ export async function buildFlowspaceIdAtPosition(
     uri: vscode.Uri,
     position: vscode.Position
 ): Promise<string | null> {
-    // Get all symbols
-    const symbols = await vscode.commands.executeCommand<vscode.DocumentSymbol[]>(
-        'vscode.executeDocumentSymbolProvider',
-        uri
-    );
+    // Get all symbols (one cached fetch serves both lookups)
+    const index = await getDocumentSymbolIndex(uri);
 
-    if (!symbols || symbols.length === 0) {
+    if (!index) {
         return null;
     }
 
     // Find symbol at position
-    const symbol = await findSymbolAtPosition(uri, position);
+    const symbol = index.atSelection(position);
     if (!symbol) {
         return null;
     }
 
     // Build Flowspace ID
-    return buildFlowspaceId(uri.fsPath, symbol, symbols);
+    return buildFlowspaceId(uri.fsPath, symbol, index.symbols);
 }
@@ -0,0 +1,623 @@
+/**
+ * Workspace Symbol Index - Persistent, in-memory index of workspace symbols
+ *
+ * `vscode.executeWorkspaceSymbolProvider` is slow on large workspaces, its
+ * matching differs per language server, and it returns nothing while a
+ * server is still indexing. This index is built from document symbols
+ * instead and answers queries from memory:
+ * - Fuzzy (exact > prefix > substring > subsequence) and prefix queries,
+ *   optionally filtered by kind
+ * - Built once per workspace, then kept current from file system events
+ * - Persisted to `.vsc-bridge/cache/symbol-index.json` (first workspace
+ *   folder), so a reload serves the previous index immediately while files
+ *   whose mtime/size changed are re-read in the background
+ *
+ * Files whose provider returned no symbols are kept unverified and retried
+ * on the next build (the language server may not have been ready).
+ */
+
+import * as vscode from 'vscode';
+import * as fs from 'fs';
+import * as path from 'path';
+import { mapWithConcurrency } from './call-graph';
+
+/**
+ * Directory under `.vsc-bridge/` that survives the startup cleanup
+ */
+export const BRIDGE_CACHE_DIR = 'cache';
+
+/** Persisted index file name inside BRIDGE_CACHE_DIR */
+const INDEX_FILE = 'symbol-index.json';
+
+/** Bump when the persisted layout changes; older files are ignored */
+const INDEX_FORMAT_VERSION = 1;
+
+/** Files considered for indexing */
+const INCLUDE_GLOB = '**/*.{ts,tsx,js,jsx,mjs,cjs,py,java,cs,go,dart,rs,rb,php,kt,swift,c,cc,cpp,h,hpp}';
+
+/** Directories never indexed */
+const EXCLUDED_DIRS = ['node_modules', '.git', '.vsc-bridge', 'dist', 'out', 'build', 'target', 'bin', 'obj', '.venv', 'venv', '__pycache__', '.dart_tool'];
+const EXCLUDE_GLOB = `**/{${EXCLUDED_DIRS.join(',')}}/**`;
+const EXCLUDE_PATTERN = new RegExp(`[\\\\/](${EXCLUDED_DIRS.map(d => d.replace(/\./g, '\\.')).join('|')})[\\\\/]`);
+
+/** Upper bound on indexed files */
+const MAX_FILES = 20000;
+
+/** Document symbol requests in flight at once while building */
+const BUILD_CONCURRENCY = 4;
+
+/** Per-file document symbol timeout */
+const PROVIDER_TIMEOUT_MS = 10000;
+
+/** Delay before re-indexing files reported by the watcher */
+const UPDATE_DEBOUNCE_MS = 300;
+
+/** Delay before writing the index after a change */
+const PERSIST_DEBOUNCE_MS = 2000;
+
+/** mtime of a file whose symbols must be fetched again on the next build */
+const UNVERIFIED = -1;
+
+/**
+ * One symbol in the index, in the shape of a SymbolInformation
+ */
+export interface IndexedWorkspaceSymbol {
+    name: string;
+    kind: number;
+    containerName: string | null;
+    location: {
+        uri: string;
+        range: { start: { line: number; character: number }; end: { line: number; character: number } };
+    };
+}
+
+interface IndexedFile {
+    mtime: number;
+    size: number;
+    symbols: IndexedWorkspaceSymbol[];
+}
+
+/** Persisted symbol: [name, kind, container, startLine, startChar, endLine, endChar] */
+type PersistedSymbol = [string, number, string | null, number, number, number, number];
+
+interface PersistedIndex {
+    version: number;
+    files: Record<string, { mtime: number; size: number; symbols: PersistedSymbol[] }>;
+}
+
+/**
+ * Query options
+ */
+export interface SymbolQueryOptions {
+    /** 'fuzzy' ranks exact, prefix, substring, then subsequence matches; 'prefix' only prefixes */
+    match?: 'fuzzy' | 'prefix';
+
+    /** SymbolKind values to keep (all if omitted or empty) */
+    kinds?: number[];
+}
+
+/**
+ * Symbols grouped by file, with name lookups over all of them
+ *
+ * Independent of VS Code so the query and persistence logic can be tested
+ * directly.
+ */
+export class SymbolTable {
+    private readonly files = new Map<string, IndexedFile>();
+    private flat: IndexedWorkspaceSymbol[] | null = null;
+    private lowerNames: string[] = [];
+    private byName: number[] = [];
+
+    get fileCount(): number {
+        return this.files.size;
+    }
+
+    get symbolCount(): number {
+        return this.all().length;
+    }
+
+    getFile(uri: string): IndexedFile | undefined {
+        return this.files.get(uri);
+    }
+
+    fileUris(): string[] {
+        return [...this.files.keys()];
+    }
+
+    setFile(uri: string, file: IndexedFile): void {
+        this.files.set(uri, file);
+        this.flat = null;
+    }
+
+    removeFile(uri: string): boolean {
+        const removed = this.files.delete(uri);
+        if (removed) {
+            this.flat = null;
+        }
+        return removed;
+    }
+
+    /**
+     * Symbols matching `query` (case-insensitive), best first
+     *
+     * An empty query matches every symbol, in file order.
+     */
+    search(query: string, options: SymbolQueryOptions = {}): IndexedWorkspaceSymbol[] {
+        const symbols = this.all();
+        const kinds = options.kinds && options.kinds.length > 0 ? new Set(options.kinds) : null;
+        const keep = (i: number) => !kinds || kinds.has(symbols[i].kind);
+        const q = query.toLowerCase();
+
+        if (q.length === 0) {
+            return kinds ? symbols.filter(s => kinds.has(s.kind)) : symbols.slice();
+        }
+
+        if (options.match === 'prefix') {
+            // Names sorted lowercase: prefix matches are one contiguous run
+            const out: IndexedWorkspaceSymbol[] = [];
+            for (let i = this.lowerBound(q); i < this.byName.length; i++) {
+                const index = this.byName[i];
+                if (!this.lowerNames[index].startsWith(q)) {
+                    break;
+                }
+                if (keep(index)) {
+                    out.push(symbols[index]);
+                }
+            }
+            return out;
+        }
+
+        const scored: Array<{ index: number; score: number }> = [];
+        for (let i = 0; i < symbols.length; i++) {
+            if (!keep(i)) {
+                continue;
+            }
+            const score = matchScore(this.lowerNames[i], q);
+            if (score >= 0) {
+                scored.push({ index: i, score });
+            }
+        }
+        scored.sort((a, b) =>
+            a.score - b.score ||
+            symbols[a.index].name.length - symbols[b.index].name.length ||
+            a.index - b.index
+        );
+        return scored.map(s => symbols[s.index]);
+    }
+
+    toJSON(): PersistedIndex {
+        const files: PersistedIndex['files'] = {};
+        for (const [uri, file] of this.files) {
+            files[uri] = {
+                mtime: file.mtime,
+                size: file.size,
+                symbols: file.symbols.map(s => {
+                    const { start, end } = s.location.range;
+                    return [s.name, s.kind, s.containerName, start.line, start.character, end.line, end.character];
+                })
+            };
+        }
+        return { version: INDEX_FORMAT_VERSION, files };
+    }
+
+    /**
+     * Table from persisted JSON, or null if the layout is not understood
+     */
+    static fromJSON(data: any): SymbolTable | null {
+        if (!data || data.version !== INDEX_FORMAT_VERSION || typeof data.files !== 'object') {
+            return null;
+        }
+        const table = new SymbolTable();
+        for (const [uri, file] of Object.entries<any>(data.files)) {
+            table.setFile(uri, {
+                mtime: file.mtime,
+                size: file.size,
+                symbols: (file.symbols as PersistedSymbol[]).map(([name, kind, containerName, sl, sc, el, ec]) => ({
+                    name,
+                    kind,
+                    containerName,
+                    location: { uri, range: { start: { line: sl, character: sc }, end: { line: el, character: ec } } }
+                }))
+            });
+        }
+        return table;
+    }
+
+    private all(): IndexedWorkspaceSymbol[] {
+        if (!this.flat) {
+            const flat: IndexedWorkspaceSymbol[] = [];
+            for (const file of this.files.values()) {
+                for (const symbol of file.symbols) {
+                    flat.push(symbol);
+                }
+            }
+            this.flat = flat;
+            this.lowerNames = flat.map(s => s.name.toLowerCase());
+            this.byName = flat.map((_, i) => i).sort((a, b) =>
+                this.lowerNames[a] < this.lowerNames[b] ? -1 : this.lowerNames[a] > this.lowerNames[b] ? 1 : a - b
+            );
+        }
+        return this.flat;
+    }
+
+    private lowerBound(q: string): number {
+        let lo = 0;
+        let hi = this.byName.length;
+        while (lo < hi) {
+            const mid = (lo + hi) >> 1;
+            if (this.lowerNames[this.byName[mid]] < q) {
+                lo = mid + 1;
+            } else {
+                hi = mid;
+            }
+        }
+        return lo;
+    }
+}
+
+/**
+ * Rank of a lowercase name for a lowercase query: 0 exact, 1 prefix,
+ * 2 substring, 3 subsequence, -1 no match
+ */
+function matchScore(name: string, q: string): number {
+    if (name === q) {
+        return 0;
+    }
+    if (name.startsWith(q)) {
+        return 1;
+    }
+    if (name.includes(q)) {
+        return 2;
+    }
+    let j = 0;
+    for (let i = 0; i < name.length && j < q.length; i++) {
+        if (name[i] === q[j]) {
+            j++;
+        }
+    }
+    return j === q.length ? 3 : -1;
+}
+
+/**
+ * Index status and size
+ */
+export interface WorkspaceSymbolIndexStats {
+    /** idle: not started; building: first or re-scan running; ready: scan done */
+    status: 'idle' | 'building' | 'ready';
+
+    /** Symbols were served from the persisted index before the scan finished */
+    loadedFromDisk: boolean;
+
+    files: number;
+    symbols: number;
+
+    /** Duration of the last full scan (files with unchanged mtime/size are not re-read) */
+    buildMs: number | null;
+
+    /** Files re-read during the last full scan */
+    filesRead: number;
+
+    /** Size of the persisted index file */
+    persistedBytes: number | null;
+
+    /** Files waiting to be re-indexed after change events */
+    pending: number;
+}
+
+/**
+ * Workspace symbol index for this extension host (singleton)
+ */
+export class WorkspaceSymbolIndex {
+    private static instance: WorkspaceSymbolIndex | null = null;
+
+    private table = new SymbolTable();
+    private started = false;
+    private building: Promise<void> | null = null;
+    private built = false;
+    private loadedFromDisk = false;
+    private buildMs: number | null = null;
+    private filesRead = 0;
+    private persistedBytes: number | null = null;
+    private readonly pending = new Set<string>();
+    private updateTimer: NodeJS.Timeout | null = null;
+    private persistTimer: NodeJS.Timeout | null = null;
+    private disposables: vscode.Disposable[] = [];
+
+    private constructor() {}
+
+    /**
+     * Get singleton instance
+     */
+    public static getInstance(): WorkspaceSymbolIndex {
+        if (!WorkspaceSymbolIndex.instance) {
+            WorkspaceSymbolIndex.instance = new WorkspaceSymbolIndex();
+        }
+        return WorkspaceSymbolIndex.instance;
+    }
+
+    /**
+     * Persist and dispose the index, if one was created
+     */
+    public static async shutdown(): Promise<void> {
+        const instance = WorkspaceSymbolIndex.instance;
+        if (instance) {
+            await instance.dispose();
+        }
+    }
+
+    /**
+     * Load the persisted index (if any) and start the background scan and
+     * file watching. Idempotent; resolves once persisted symbols are usable.
+     */
+    public async start(): Promise<void> {
+        if (this.started) {
+            return;
+        }
+        this.started = true;
+
+        await this.load();
+
+        const watcher = vscode.workspace.createFileSystemWatcher(INCLUDE_GLOB);
+        this.disposables.push(
+            watcher,
+            watcher.onDidCreate(uri => this.queue(uri)),
+            watcher.onDidChange(uri => this.queue(uri)),
+            watcher.onDidDelete(uri => {
+                if (this.table.removeFile(uri.toString())) {
+                    this.schedulePersist();
+                }
+            }),
+            vscode.workspace.onDidChangeWorkspaceFolders(() => {
+                this.rebuild();
+            })
+        );
+
+        this.rebuild();
+    }
+
+    /**
+     * Start a full scan (or return the one in progress)
+     */
+    public rebuild(): Promise<void> {
+        if (!this.building) {
+            this.building = this.build().finally(() => {
+                this.building = null;
+            });
+        }
+        return this.building;
+    }
+
+    /**
+     * Resolves when the current scan (if any) has finished
+     */
+    public async whenBuilt(): Promise<void> {
+        if (this.building) {
+            await this.building;
+        }
+    }
+
+    /**
+     * Whether the index can answer queries: a scan finished or a persisted
+     * index was loaded (a first scan in progress is incomplete)
+     */
+    public isReady(): boolean {
+        return (this.built || this.loadedFromDisk) && this.table.fileCount > 0;
+    }
+
+    public search(query: string, options?: SymbolQueryOptions): IndexedWorkspaceSymbol[] {
+        return this.table.search(query, options);
+    }
+
+    public stats(): WorkspaceSymbolIndexStats {
+        return {
+            status: this.building ? 'building' : this.built ? 'ready' : 'idle',
+            loadedFromDisk: this.loadedFromDisk,
+            files: this.table.fileCount,
+            symbols: this.table.symbolCount,
+            buildMs: this.buildMs,
+            filesRead: this.filesRead,
+            persistedBytes: this.persistedBytes,
+            pending: this.pending.size
+        };
+    }
+
+    public async dispose(): Promise<void> {
+        for (const disposable of this.disposables) {
+            disposable.dispose();
+        }
+        this.disposables = [];
+        if (this.updateTimer) {
+            clearTimeout(this.updateTimer);
+        }
+        if (this.persistTimer) {
+            clearTimeout(this.persistTimer);
+            this.persistTimer = null;
+            await this.persist();
+        }
+        WorkspaceSymbolIndex.instance = null;
+    }
+
+    private async build(): Promise<void> {
+        const startTime = Date.now();
+        let read = 0;
+
+        const uris = await vscode.workspace.findFiles(INCLUDE_GLOB, EXCLUDE_GLOB, MAX_FILES);
+        const found = new Set(uris.map(uri => uri.toString()));
+        for (const uri of this.table.fileUris()) {
+            if (!found.has(uri)) {
+                this.table.removeFile(uri);
+            }
+        }
+
+        await mapWithConcurrency(uris, BUILD_CONCURRENCY, async uri => {
+            if (await this.indexFile(uri)) {
+                read++;
+            }
+        });
+
+        this.buildMs = Date.now() - startTime;
+        this.filesRead = read;
+        this.built = true;
+        this.schedulePersist();
+    }
+
+    /**
+     * Re-read a file's symbols unless its mtime and size are unchanged
+     * @returns true if the provider was asked
+     */
+    private async indexFile(uri: vscode.Uri): Promise<boolean> {
+        const key = uri.toString();
+        let stat: vscode.FileStat;
+        try {
+            stat = await vscode.workspace.fs.stat(uri);
+        } catch {
+            this.table.removeFile(key);
+            return false;
+        }
+
+        const existing = this.table.getFile(key);
+        if (existing && existing.mtime === stat.mtime && existing.size === stat.size) {
+            return false;
+        }
+
+        const result = await fetchDocumentSymbols(uri);
+        if (result === null) {
+            // Timeout or provider failure: keep what we had, retry next scan
+            if (existing) {
+                existing.mtime = UNVERIFIED;
+            }
+            return true;
+        }
+
+        this.table.setFile(key, {
+            mtime: result.length > 0 ? stat.mtime : UNVERIFIED,
+            size: stat.size,
+            symbols: flattenSymbols(result, key)
+        });
+        return true;
+    }
+
+    private queue(uri: vscode.Uri): void {
+        if (EXCLUDE_PATTERN.test(uri.fsPath)) {
+            return;
+        }
+        this.pending.add(uri.toString());
+        if (!this.updateTimer) {
+            this.updateTimer = setTimeout(() => {
+                this.updateTimer = null;
+                void this.flushPending();
+            }, UPDATE_DEBOUNCE_MS);
+        }
+    }
+
+    private async flushPending(): Promise<void> {
+        const uris = [...this.pending].map(uri => vscode.Uri.parse(uri));
+        this.pending.clear();
+        await mapWithConcurrency(uris, BUILD_CONCURRENCY, uri => this.indexFile(uri));
+        this.schedulePersist();
+    }
+
+    private indexPath(): string | null {
+        const folder = vscode.workspace.workspaceFolders?.[0];
+        return folder ? path.join(folder.uri.fsPath, '.vsc-bridge', BRIDGE_CACHE_DIR, INDEX_FILE) : null;
+    }
+
+    private async load(): Promise<void> {
+        const file = this.indexPath();
+        if (!file) {
+            return;
+        }
+        try {
+            const text = await fs.promises.readFile(file, 'utf8');
+            const table = SymbolTable.fromJSON(JSON.parse(text));
+            if (table && table.fileCount > 0) {
+                this.table = table;
+                this.loadedFromDisk = true;
+                this.persistedBytes = Buffer.byteLength(text);
+            }
+        } catch {
+            // Missing or unreadable: start empty
+        }
+    }
+
+    private schedulePersist(): void {
+        if (this.persistTimer) {
+            return;
+        }
+        this.persistTimer = setTimeout(() => {
+            this.persistTimer = null;
+            void this.persist();
+        }, PERSIST_DEBOUNCE_MS);
+    }
+
+    private async persist(): Promise<void> {
+        const file = this.indexPath();
+        if (!file) {
+            return;
+        }
+        try {
+            const text = JSON.stringify(this.table.toJSON());
+            await fs.promises.mkdir(path.dirname(file), { recursive: true });
+            const tmp = `${file}.${process.pid}.tmp`;
+            await fs.promises.writeFile(tmp, text, 'utf8');
+            await fs.promises.rename(tmp, file);
+            this.persistedBytes = Buffer.byteLength(text);
+        } catch (error) {
+            console.warn(`[WorkspaceSymbolIndex] Failed to persist ${file}: ${error instanceof Error ? error.message : String(error)}`);
+        }
+    }
+}
+
+/**
+ * Document symbols for a file, or null on timeout or provider failure
+ */
+async function fetchDocumentSymbols(uri: vscode.Uri): Promise<any[] | null> {
+    let timer: NodeJS.Timeout | undefined;
+    try {
+        const timeout = new Promise<'timeout'>(resolve => {
+            timer = setTimeout(() => resolve('timeout'), PROVIDER_TIMEOUT_MS);
+        });
+        const result = await Promise.race([
+            Promise.resolve(vscode.commands.executeCommand<any[]>('vscode.executeDocumentSymbolProvider', uri)),
+            timeout
+        ]);
+        return result === 'timeout' ? null : result ?? [];
+    } catch {
+        return null;
+    } finally {
+        clearTimeout(timer);
+    }
+}
+
+/**
+ * DocumentSymbol trees (or flat SymbolInformation lists) as index entries
+ */
+function flattenSymbols(
+    symbols: any[],
+    uri: string,
+    container: string | null = null,
+    out: IndexedWorkspaceSymbol[] = []
+): IndexedWorkspaceSymbol[] {
+    for (const symbol of symbols) {
+        const range = symbol.range ?? symbol.location?.range;
+        if (!range) {
+            continue;
+        }
+        out.push({
+            name: symbol.name,
+            kind: symbol.kind,
+            containerName: container ?? symbol.containerName ?? null,
+            location: {
+                uri,
+                range: {
+                    start: { line: range.start.line, character: range.start.character },
+                    end: { line: range.end.line, character: range.end.character }
+                }
+            }
+        });
+        if (symbol.children && symbol.children.length > 0) {
+            flattenSymbols(symbol.children, uri, symbol.name, out);
+        }
+    }
+    return out;
+}
@@ -4,11 +4,14 @@ import * as vscode from 'vscode';
 import * as path from 'path';
 import * as fs from 'fs';
 import { ScriptRegistry } from './core/registry/ScriptRegistry';
-import { initializeFileSystemBridge, getBridgeManager } from './core/fs-bridge';
-import { CommandJson, EventWriter } from './core/fs-bridge';
+import { BATCH_SCRIPT_NAME, parseBatchParams, executeBatch } from './core/registry/batch';
+import { initializeFileSystemBridge, getBridgeManager, setPriorityResolver, priorityFromMetadata, slowestPriority } from './core/fs-bridge';
+import { CommandJson, EventWriter, JOURNAL_FILE } from './core/fs-bridge';
 import { DebugSessionCaptureService } from './core/debug/debug-session-capture';
+import { DebugEventHub } from './core/debug/event-hub';
 import { EditorContextProvider } from './core/context/EditorContextProvider';
 import { TelemetryService } from './core/telemetry';
+import { WorkspaceSymbolIndex, BRIDGE_CACHE_DIR } from './core/util/workspace-symbol-index';
 
 let scriptRegistry: ScriptRegistry | undefined;
 let bridgeManager: any;
@@ -88,15 +91,22 @@ export async function activate(context: vscode.ExtensionContext) {
 	}
 
 	// Clean up .vsc-bridge directories from all workspace folders on startup (Phase 2, Insight #3)
-	// This ensures fresh state and prevents stale claimed.json files from previous sessions
+	// This ensures fresh state for host/socket/event files from previous sessions
+	// Kept across reloads: cache/ (persistent indexes), plus execute/ and the job
+	// journal so the bridge's startup recovery can replay the previous session
+	// (stale claims are quarantined and pending jobs cleaned there)
+	const preservedBridgeEntries = new Set([BRIDGE_CACHE_DIR, 'execute', JOURNAL_FILE]);
 	const workspaceFolders = vscode.workspace.workspaceFolders;
 	if (workspaceFolders) {
 		for (const folder of workspaceFolders) {
 			const bridgeDir = path.join(folder.uri.fsPath, '.vsc-bridge');
 			try {
 				if (fs.existsSync(bridgeDir)) {
-					await fs.promises.rm(bridgeDir, { recursive: true, force: true });
-					await fs.promises.mkdir(bridgeDir, { recursive: true });
+					for (const entry of await fs.promises.readdir(bridgeDir)) {
+						if (!preservedBridgeEntries.has(entry)) {
+							await fs.promises.rm(path.join(bridgeDir, entry), { recursive: true, force: true });
+						}
+					}
 					output.appendLine(`[Startup] Cleaned .vsc-bridge directory: ${bridgeDir}`);
 				}
 			} catch (err: any) {
@@ -140,6 +150,12 @@ export async function activate(context: vscode.ExtensionContext) {
 	// Expose service globally for dynamic scripts
 	(global as any).debugSessionCaptureService = DebugSessionCaptureService.instance;
 
+	// Install DebugEventHub: step/continue/wait commands wait on its stop events
+	DebugEventHub.instance.install();
+	context.subscriptions.push({ dispose: () => DebugEventHub.instance.dispose() });
+	output.appendLine(`[DebugEventHub] ✅ Stop event hub ready`);
+	output.appendLine(``);
+
 	// Set global base path for script loading
 	(global as any).VSC_BRIDGE_BASE_PATH = context.extensionPath + '/out';
 
@@ -157,7 +173,8 @@ export async function activate(context: vscode.ExtensionContext) {
 
 		output.appendLine(`[ScriptRegistry] Loading scripts from: ${manifestPath}`);
 		await scriptRegistry.discover(manifestPath);
-		output.appendLine(`[ScriptRegistry] ✅ Loaded ${scriptRegistry.listScripts().length} scripts at ${new Date().toISOString()}`);
+		const registryStats = scriptRegistry.stats();
+		output.appendLine(`[ScriptRegistry] ✅ Registered ${registryStats.discovered} scripts in ${registryStats.discoverMs}ms at ${new Date().toISOString()} (loaded on first use)`);
 
 		// Store registry globally for access (context is sealed/frozen)
 		(global as any).scriptRegistry = scriptRegistry;
@@ -174,6 +191,9 @@ export async function activate(context: vscode.ExtensionContext) {
 				throw new Error('ScriptRegistry not initialized');
 			}
 
+			// Scripts that stream results write them as 'record' events on the job's event stream
+			const emitRecord = (record: unknown) => eventWriter.writeRecord(record);
+
 			// Handle dynamic scripts
 			if (command.scriptName === '@dynamic') {
 				// No metadata check for dynamic scripts
@@ -182,8 +202,7 @@ export async function activate(context: vscode.ExtensionContext) {
 				// Execute the dynamic script with content
 				const requestId = command.id;
 				const mode = isDangerMode ? 'danger' : 'normal';
-				const signal = new AbortController().signal;
-				const result = await scriptRegistry.execute(command.scriptName, command.params, requestId, mode, signal, command.scriptContent);
+				const result = await scriptRegistry.execute(command.scriptName, command.params, requestId, mode, eventWriter.signal, command.scriptContent, emitRecord);
 
 				// If the script failed, throw an error to propagate the failure
 				if (!result.ok) {
@@ -197,6 +216,24 @@ export async function activate(context: vscode.ExtensionContext) {
 				return result;
 			}
 
+			// Handle batch jobs: run every step inside this one claimed job
+			if (command.scriptName === BATCH_SCRIPT_NAME) {
+				const batch = parseBatchParams(command.params);
+				const isDangerMode = vscode.workspace.getConfiguration('vscBridge').get<boolean>('dangerMode', false);
+
+				const data = await executeBatch(scriptRegistry, batch, {
+					requestId: command.id,
+					mode: isDangerMode ? 'danger' : 'normal',
+					signal: eventWriter.signal,
+					onStep: (index, total, scriptName) => {
+						eventWriter.writeProgress(Math.round((index / total) * 100), `Step ${index + 1}/${total}: ${scriptName}`);
+					}
+				});
+
+				// Per-step failures live in data.steps; the batch itself succeeded
+				return { ok: true, data };
+			}
+
 			const metadata = scriptRegistry.getMetadata(command.scriptName);
 			if (!metadata) {
 				throw new Error(`Script '${command.scriptName}' not found`);
@@ -211,8 +248,7 @@ export async function activate(context: vscode.ExtensionContext) {
 			// Execute the script through the registry
 			const requestId = command.id;
 			const mode = isDangerMode ? 'danger' : 'normal';
-			const signal = new AbortController().signal;
-			const result = await scriptRegistry.execute(command.scriptName, command.params, requestId, mode, signal);
+			const result = await scriptRegistry.execute(command.scriptName, command.params, requestId, mode, eventWriter.signal, undefined, emitRecord, command.paramsSchemaHash);
 
 			// If the script failed, throw an error to propagate the failure
 			if (!result.ok) {
@@ -226,10 +262,31 @@ export async function activate(context: vscode.ExtensionContext) {
 			return result;
 		};
 
+		// Scheduler classes come from each script's .meta.yaml (a batch runs at its slowest step's class)
+		setPriorityResolver(command => {
+			if (!scriptRegistry) {
+				return 'normal';
+			}
+			if (command.scriptName === BATCH_SCRIPT_NAME) {
+				const steps = Array.isArray(command.params?.steps) ? command.params.steps : [];
+				return slowestPriority(steps.map((step: any) => priorityFromMetadata(scriptRegistry!.getMetadata(step?.scriptName))));
+			}
+			return priorityFromMetadata(scriptRegistry.getMetadata(command.scriptName));
+		});
+
 		output.appendLine(`[FileSystemBridge] Initializing bridge at ${new Date().toISOString()}...`);
 		bridgeManager = await initializeFileSystemBridge(context, scriptExecutor, TelemetryService.instance);
 		output.appendLine(`[FileSystemBridge] ✅ Initialized successfully with session ${sessionId}`);
 
+		// Bridge is serving: load the most-used scripts in the background
+		if (scriptRegistry && config.get<boolean>('scripts.warmUp', true)) {
+			const registry = scriptRegistry;
+			void registry.warmUp().then(() => {
+				const stats = registry.stats();
+				output.appendLine(`[ScriptRegistry] Warm-up done: ${stats.loaded}/${stats.discovered} scripts loaded (${stats.loadMs}ms)`);
+			});
+		}
+
 		// Show toast notification with version and workspace info
 		const version = context.extension.packageJSON.version;
 		const workspaceFolders = vscode.workspace.workspaceFolders;
@@ -376,6 +433,15 @@ export async function deactivate() {
 		}
 	}
 
+	// Write pending workspace symbol index changes
+	try {
+		await WorkspaceSymbolIndex.shutdown();
+	} catch (error) {
+		if (globalOutput) {
+			globalOutput.appendLine(`[SymbolIndex] ⚠️  Failed to persist: ${error instanceof Error ? error.message : String(error)}`);
+		}
+	}
+
 	try {
 		if (bridgeManager) {
 			if (globalOutput) {
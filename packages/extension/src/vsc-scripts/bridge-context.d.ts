@@ -51,6 +51,12 @@ export interface IBridgeContext {
      */
     readonly mode?: string;
 
+    /**
+     * Stream one result item to the client as it is produced
+     * Undefined when the transport cannot carry streamed records
+     */
+    readonly emitRecord?: (record: unknown) => void;
+
     /**
      * Output channel for script logging
      * Prefer using the logger service instead for structured output
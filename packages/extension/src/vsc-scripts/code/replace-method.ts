@@ -5,7 +5,9 @@ import { ScriptResult } from '@core/scripts/ScriptResult';
 import { ErrorCode } from '@core/response/errorTaxonomy';
 import {
     resolveSymbolInput,
-    getLSPResultWithTimeout
+    getLSPResultWithTimeout,
+    DocumentSymbolIndex,
+    getDocumentSymbolIndex
 } from '@core/util/symbol-resolver';
 import * as vscode from 'vscode';
 import * as fs from 'fs';
@@ -76,19 +78,17 @@ export class ReplaceMethodScript extends ActionScript {
             }
 
             // Step 2: Get DocumentSymbol from LSP (proven in dynamic scripts - T007)
-            const symbols = await this._executeDocumentSymbolProvider(
-                vscodeApi,
-                resolution.uri
-            );
+            // Cached per document version, so this reuses resolveSymbolInput's fetch
+            const index = await this._getDocumentSymbolIndex(resolution.uri);
 
-            if (!symbols || symbols.length === 0) {
+            if (!index) {
                 const error: any = new Error('No document symbol provider available for this file type');
                 error.code = 'E_NO_LANGUAGE_SERVER';
                 throw error;
             }
 
             // Step 3: Find target symbol at resolved position (T007)
-            const targetSymbol = this._findSymbolAtPosition(symbols, resolution.position);
+            const targetSymbol = index.innermostAt(resolution.position);
 
             if (!targetSymbol) {
                 const error: any = new Error(`No symbol found at resolved position in ${resolution.uri.fsPath}`);
@@ -145,13 +145,11 @@ export class ReplaceMethodScript extends ActionScript {
     }
 
     /**
-     * Execute DocumentSymbol provider with timeout protection
+     * Get the (cached) document symbol index with timeout protection
      * @private
      */
-    private async _executeDocumentSymbolProvider(vscodeApi: typeof vscode, uri: vscode.Uri): Promise<vscode.DocumentSymbol[]> {
-        const result = await getLSPResultWithTimeout<vscode.DocumentSymbol[]>(
-            Promise.resolve(vscodeApi.commands.executeCommand('vscode.executeDocumentSymbolProvider', uri)) as Promise<vscode.DocumentSymbol[]>
-        );
+    private async _getDocumentSymbolIndex(uri: vscode.Uri): Promise<DocumentSymbolIndex | null> {
+        const result = await getLSPResultWithTimeout(getDocumentSymbolIndex(uri));
 
         if (result === 'timeout') {
             const error: any = new Error('LSP document symbol provider timeout (10s)');
@@ -159,50 +157,7 @@ export class ReplaceMethodScript extends ActionScript {
             throw error;
         }
 
-        return result as vscode.DocumentSymbol[]; // DocumentSymbol[] or null/undefined
-    }
-
-    /**
-     * Find symbol at specified position using hierarchical search
-     * @private
-     */
-    private _findSymbolAtPosition(symbols: vscode.DocumentSymbol[], position: vscode.Position): vscode.DocumentSymbol | null {
-        const findInSymbols = (syms: vscode.DocumentSymbol[]): vscode.DocumentSymbol | null => {
-            for (const sym of syms) {
-                // Check if position is within this symbol's range
-                if (this._containsPosition(sym.range, position)) {
-                    // Check children first (more specific match)
-                    if (sym.children && sym.children.length > 0) {
-                        const childMatch = findInSymbols(sym.children);
-                        if (childMatch) {
-                            return childMatch;
-                        }
-                    }
-                    // Return this symbol if no child match
-                    return sym;
-                }
-            }
-            return null;
-        };
-
-        return findInSymbols(symbols);
-    }
-
-    /**
-     * Check if range contains position
-     * @private
-     */
-    private _containsPosition(range: vscode.Range, position: vscode.Position): boolean {
-        if (position.line < range.start.line || position.line > range.end.line) {
-            return false;
-        }
-        if (position.line === range.start.line && position.character < range.start.character) {
-            return false;
-        }
-        if (position.line === range.end.line && position.character > range.end.character) {
-            return false;
-        }
-        return true;
+        return result; // Index, or null if no symbols
     }
 
     /**
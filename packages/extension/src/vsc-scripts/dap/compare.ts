@@ -79,11 +79,13 @@ export class DapCompareScript extends QueryScript<any> {
         // Timeline comparison (find divergence point)
         if (params.compareBy === 'timeline' || params.compareBy === 'outputs') {
             let divergenceIndex = null;
-            const minLength = Math.min(sessionA.outputs.length, sessionB.outputs.length);
+            const outputsA = sessionA.outputs.toArray();
+            const outputsB = sessionB.outputs.toArray();
+            const minLength = Math.min(outputsA.length, outputsB.length);
 
             for (let i = 0; i < minLength; i++) {
-                const outA = sessionA.outputs[i];
-                const outB = sessionB.outputs[i];
+                const outA = outputsA[i];
+                const outB = outputsB[i];
 
                 if (outA.text !== outB.text || outA.category !== outB.category) {
                     divergenceIndex = i;
@@ -93,12 +95,12 @@ export class DapCompareScript extends QueryScript<any> {
 
             comparison.divergencePoint = divergenceIndex != null ? {
                 outputIndex: divergenceIndex,
-                timestampA: sessionA.outputs[divergenceIndex]?.ts,
-                timestampB: sessionB.outputs[divergenceIndex]?.ts,
-                relativeTimeA: sessionA.outputs[divergenceIndex]?.ts - sessionA.startTime,
-                relativeTimeB: sessionB.outputs[divergenceIndex]?.ts - sessionB.startTime,
-                textA: sessionA.outputs[divergenceIndex]?.text?.slice(0, 100),
-                textB: sessionB.outputs[divergenceIndex]?.text?.slice(0, 100)
+                timestampA: outputsA[divergenceIndex]?.ts,
+                timestampB: outputsB[divergenceIndex]?.ts,
+                relativeTimeA: outputsA[divergenceIndex]?.ts - sessionA.startTime,
+                relativeTimeB: outputsB[divergenceIndex]?.ts - sessionB.startTime,
+                textA: outputsA[divergenceIndex]?.text?.slice(0, 100),
+                textB: outputsB[divergenceIndex]?.text?.slice(0, 100)
             } : {
                 message: 'Sessions matched until one ended',
                 shorterSession: sessionA.outputs.length < sessionB.outputs.length ? 'A' : 'B'
@@ -71,7 +71,7 @@ export class DapExceptionsScript extends QueryScript<any> {
         const exceptionsToShow = session.exceptions.slice(-params.count);
 
         // Build exception details with context
-        const exceptionDetails = exceptionsToShow.map((exception: any, idx: number) => {
+        const exceptionDetails = exceptionsToShow.map((exception: any) => {
             const result: any = {
                 exception: {
                     message: exception.message,
@@ -79,14 +79,13 @@ export class DapExceptionsScript extends QueryScript<any> {
                     typeName: exception.typeName
                 },
                 stackTrace: exception.stackFrames || null,
-                timeSinceStart: null
+                timeSinceStart: exception.ts - session.startTime
             };
 
-            // Find the associated stopped event
-            const stoppedEvent = session.stoppedEvents.find((e: any) =>
-                e.reason === 'exception' &&
-                Math.abs(e.threadId - (exception.threadId || 0)) < 100 // rough match
-            );
+            // The stopped event that reported the exception (recorded at capture time)
+            const stoppedEvent = exception.stoppedIndex != null
+                ? session.stoppedEvents[exception.stoppedIndex]
+                : undefined;
 
             if (stoppedEvent) {
                 result.stoppedEvent = {
@@ -99,32 +98,24 @@ export class DapExceptionsScript extends QueryScript<any> {
 
             // Add context if requested
             if (params.withContext) {
-                // Find exception timestamp by matching with outputs around the same time
-                // Exceptions don't have timestamps, so we estimate based on session progress
-                const exceptionIndex = session.exceptions.indexOf(exception);
-                const estimatedOutputIndex = Math.floor(
-                    (session.outputs.length / session.exceptions.length) * (exceptionIndex + 1)
-                );
-
-                const beforeStart = Math.max(0, estimatedOutputIndex - params.contextLines);
-                const afterEnd = Math.min(session.outputs.length, estimatedOutputIndex + params.contextLines);
+                // Output position recorded when the exception was captured
+                // (negative once the output before it has been evicted)
+                const outputIndex = exception.outputSeq - session.outputs.firstSeq;
+                const beforeStart = Math.max(0, outputIndex - params.contextLines);
+                const afterEnd = Math.max(0, Math.min(session.outputs.length, outputIndex + params.contextLines));
 
                 result.context = {
-                    before: session.outputs.slice(beforeStart, estimatedOutputIndex).map((o: any) => ({
+                    before: session.outputs.slice(beforeStart, Math.max(0, outputIndex)).map((o: any) => ({
                         ts: o.ts,
                         category: o.category,
                         text: o.text.slice(0, 200)
                     })),
-                    after: session.outputs.slice(estimatedOutputIndex, afterEnd).map((o: any) => ({
+                    after: session.outputs.slice(Math.max(0, outputIndex), afterEnd).map((o: any) => ({
                         ts: o.ts,
                         category: o.category,
                         text: o.text.slice(0, 200)
                     }))
                 };
-
-                if (result.context.before.length > 0) {
-                    result.timeSinceStart = result.context.before[0].ts - session.startTime;
-                }
             }
 
             // Extract location from stack trace
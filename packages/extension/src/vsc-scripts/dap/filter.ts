@@ -3,12 +3,18 @@ import { QueryScript, RegisterScript } from '@script-base';
 import type { IBridgeContext } from '../../core/bridge-context/types';
 import { ScriptResult } from '@core/scripts/ScriptResult';
 import { ErrorCode } from '@core/response/errorTaxonomy';
+import { decodeOutputCursor, encodeOutputCursor } from '@core/debug/output-cursor';
 
 /**
  * DAP Filter Script - Advanced Multi-Filter Query
  *
  * Complex filtering with multiple AND-ed criteria.
  * For power users who need precise output filtering.
+ *
+ * With `limit`, results are paged: `nextCursor` marks the first event past
+ * the page, and passing it back as `after` (with the same filters) continues
+ * from there. With `stream`, each event is emitted as a record while scanning
+ * instead of being collected into the response.
  */
 @RegisterScript('dap.filter')
 export class DapFilterScript extends QueryScript<any> {
@@ -27,7 +33,10 @@ export class DapFilterScript extends QueryScript<any> {
                 sources: z.array(z.string()).optional(), // file path filters
                 minLength: z.coerce.number().int().min(0).optional(),
                 maxLength: z.coerce.number().int().min(0).optional()
-            })
+            }),
+            limit: z.coerce.number().int().min(1).optional(),
+            after: z.string().optional(), // cursor from a previous page's nextCursor
+            stream: z.coerce.boolean().optional().default(false)
         });
     }
 
@@ -42,8 +51,25 @@ export class DapFilterScript extends QueryScript<any> {
             );
         }
 
-        // Get session (latest if no ID provided)
-        const sessionId = params.sessionId || service.getLastSessionId();
+        // Resume position from a previous page
+        const cursor = params.after ? decodeOutputCursor(params.after) : undefined;
+        if (params.after && !cursor) {
+            return ScriptResult.failure(
+                'Invalid cursor - pass nextCursor from a previous dap.filter response',
+                ErrorCode.E_INVALID_PARAMS,
+                { after: params.after }
+            );
+        }
+        if (cursor && params.sessionId && params.sessionId !== cursor.sessionId) {
+            return ScriptResult.failure(
+                `Cursor belongs to session "${cursor.sessionId}", not "${params.sessionId}"`,
+                ErrorCode.E_INVALID_PARAMS,
+                { sessionId: params.sessionId, cursorSessionId: cursor.sessionId }
+            );
+        }
+
+        // Get session (cursor's session, else latest if no ID provided)
+        const sessionId = params.sessionId || cursor?.sessionId || service.getLastSessionId();
         if (!sessionId) {
             return ScriptResult.failure(
                 'No debug sessions captured yet',
@@ -62,9 +88,8 @@ export class DapFilterScript extends QueryScript<any> {
         }
 
         const filters = params.filters;
-        let filtered = [...session.outputs];
         const stats = {
-            original: filtered.length,
+            original: session.outputs.length,
             afterCategories: 0,
             afterTimeRange: 0,
             afterExclude: 0,
@@ -73,62 +98,19 @@ export class DapFilterScript extends QueryScript<any> {
             afterLength: 0
         };
 
-        // Apply category filter
-        if (filters.categories && filters.categories.length > 0) {
-            filtered = filtered.filter((o: any) => filters.categories.includes(o.category));
-            stats.afterCategories = filtered.length;
-        }
-
-        // Apply time range filter
-        if (filters.timeRange) {
-            filtered = filtered.filter((o: any) =>
-                o.ts >= filters.timeRange.start &&
-                o.ts <= filters.timeRange.end
-            );
-            stats.afterTimeRange = filtered.length;
-        }
-
-        // Apply exclude patterns (regex)
-        if (filters.exclude && filters.exclude.length > 0) {
-            const excludeRegexes = filters.exclude.map((pattern: string) => new RegExp(pattern, 'i'));
-            filtered = filtered.filter((o: any) => {
-                return !excludeRegexes.some((regex: RegExp) => regex.test(o.text));
-            });
-            stats.afterExclude = filtered.length;
-        }
-
-        // Apply include patterns (regex) - ALL must match
-        if (filters.include && filters.include.length > 0) {
-            const includeRegexes = filters.include.map((pattern: string) => new RegExp(pattern, 'i'));
-            filtered = filtered.filter((o: any) => {
-                return includeRegexes.every((regex: RegExp) => regex.test(o.text));
-            });
-            stats.afterInclude = filtered.length;
-        }
+        const hasCategories = filters.categories && filters.categories.length > 0;
+        const excludeRegexes = (filters.exclude || []).map((pattern: string) => new RegExp(pattern, 'i'));
+        const includeRegexes = (filters.include || []).map((pattern: string) => new RegExp(pattern, 'i'));
+        const hasSources = filters.sources && filters.sources.length > 0;
+        const hasLength = filters.minLength != null || filters.maxLength != null;
 
-        // Apply source file filter
-        if (filters.sources && filters.sources.length > 0) {
-            filtered = filtered.filter((o: any) => {
-                if (!o.source?.path && !o.source?.name) return false;
-                const sourcePath = o.source.path || o.source.name;
-                return filters.sources.some((filterPath: string) => sourcePath.includes(filterPath));
-            });
-            stats.afterSources = filtered.length;
-        }
-
-        // Apply length filters
-        if (filters.minLength != null || filters.maxLength != null) {
-            filtered = filtered.filter((o: any) => {
-                const len = o.text.length;
-                if (filters.minLength != null && len < filters.minLength) return false;
-                if (filters.maxLength != null && len > filters.maxLength) return false;
-                return true;
-            });
-            stats.afterLength = filtered.length;
+        // Category counts come from the capture-time aggregates
+        if (hasCategories) {
+            const byCategory = session.outputs.countByCategory();
+            stats.afterCategories = filters.categories.reduce((sum: number, c: string) => sum + (byCategory[c] || 0), 0);
         }
 
-        // Format results
-        const events = filtered.map((o: any) => ({
+        const formatEvent = (o: any) => ({
             ts: o.ts,
             relativeTime: o.ts - session.startTime,
             category: o.category,
@@ -138,13 +120,80 @@ export class DapFilterScript extends QueryScript<any> {
                 line: o.line,
                 column: o.column
             } : null
-        }));
+        });
+
+        // Category and time range are applied by the output index (whole chunks are skipped);
+        // the remaining filters run per event, in the original order.
+        // With a limit the scan stops at the first event past the page.
+        const stream = params.stream && typeof bridgeContext.emitRecord === 'function';
+        const events: any[] = [];
+        let matched = 0;
+        let nextSeq: number | undefined;
+        let cancelled = false;
+
+        session.outputs.scan({
+            categories: hasCategories ? filters.categories : undefined,
+            since: filters.timeRange?.start,
+            until: filters.timeRange?.end,
+            fromSeq: cursor?.seq
+        }, (o: any, index: number) => {
+            if (bridgeContext.signal?.aborted) {
+                cancelled = true;
+                return false;
+            }
+
+            if (filters.timeRange) stats.afterTimeRange++;
+
+            // Apply exclude patterns (regex)
+            if (excludeRegexes.length > 0) {
+                if (excludeRegexes.some((regex: RegExp) => regex.test(o.text))) return;
+                stats.afterExclude++;
+            }
+
+            // Apply include patterns (regex) - ALL must match
+            if (includeRegexes.length > 0) {
+                if (!includeRegexes.every((regex: RegExp) => regex.test(o.text))) return;
+                stats.afterInclude++;
+            }
+
+            // Apply source file filter
+            if (hasSources) {
+                if (!o.source?.path && !o.source?.name) return;
+                const sourcePath = o.source.path || o.source.name;
+                if (!filters.sources.some((filterPath: string) => sourcePath.includes(filterPath))) return;
+                stats.afterSources++;
+            }
+
+            // Apply length filters
+            if (hasLength) {
+                const len = o.text.length;
+                if (filters.minLength != null && len < filters.minLength) return;
+                if (filters.maxLength != null && len > filters.maxLength) return;
+                stats.afterLength++;
+            }
+
+            if (matched === params.limit) {
+                nextSeq = session.outputs.firstSeq + index;
+                return false;
+            }
+            matched++;
+
+            if (stream) {
+                bridgeContext.emitRecord!(formatEvent(o));
+            } else {
+                events.push(formatEvent(o));
+            }
+        });
 
         return ScriptResult.success({
-            events,
+            ...(stream ? { streamed: matched } : { events }),
             stats,
-            totalFiltered: events.length,
+            totalFiltered: matched,
             totalInSession: session.outputs.length,
+            droppedInSession: session.outputs.dropped,
+            nextCursor: nextSeq != null && !cancelled
+                ? encodeOutputCursor({ sessionId: session.sessionId, seq: nextSeq })
+                : null,
             session: {
                 id: session.sessionId,
                 type: session.type,
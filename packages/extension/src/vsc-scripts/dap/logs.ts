@@ -3,6 +3,7 @@ import { QueryScript, RegisterScript } from '@script-base';
 import type { IBridgeContext } from '../../core/bridge-context/types';
 import { ScriptResult } from '@core/scripts/ScriptResult';
 import { ErrorCode } from '@core/response/errorTaxonomy';
+import { decodeOutputCursor, encodeOutputCursor } from '@core/debug/output-cursor';
 
 /**
  * DAP Logs Script - Recent Logs Viewer
@@ -11,6 +12,11 @@ import { ErrorCode } from '@core/response/errorTaxonomy';
  * Supports filtering by category, search patterns, time windows, and more.
  *
  * Most commonly used script for viewing debug output.
+ *
+ * Results are paged: `nextCursor` is set when more logs match, and passing it
+ * back as `after` (with the same filters) returns the next page. With
+ * `stream`, each log is emitted as a record while scanning instead of being
+ * collected into the response.
  */
 @RegisterScript('dap.logs')
 export class DapLogsScript extends QueryScript<any> {
@@ -23,7 +29,9 @@ export class DapLogsScript extends QueryScript<any> {
             search: z.string().optional(),
             since: z.coerce.number().optional(), // timestamp in ms or negative offset
             reverse: z.coerce.boolean().optional().default(false),
-            showSource: z.coerce.boolean().optional().default(true)
+            showSource: z.coerce.boolean().optional().default(true),
+            after: z.string().optional(), // cursor from a previous page's nextCursor
+            stream: z.coerce.boolean().optional().default(false)
         });
     }
 
@@ -38,8 +46,25 @@ export class DapLogsScript extends QueryScript<any> {
             );
         }
 
-        // Get session (latest if no ID provided)
-        const sessionId = params.sessionId || service.getLastSessionId();
+        // Resume position from a previous page
+        const cursor = params.after ? decodeOutputCursor(params.after) : undefined;
+        if (params.after && !cursor) {
+            return ScriptResult.failure(
+                'Invalid cursor - pass nextCursor from a previous dap.logs response',
+                ErrorCode.E_INVALID_PARAMS,
+                { after: params.after }
+            );
+        }
+        if (cursor && params.sessionId && params.sessionId !== cursor.sessionId) {
+            return ScriptResult.failure(
+                `Cursor belongs to session "${cursor.sessionId}", not "${params.sessionId}"`,
+                ErrorCode.E_INVALID_PARAMS,
+                { sessionId: params.sessionId, cursorSessionId: cursor.sessionId }
+            );
+        }
+
+        // Get session (cursor's session, else latest if no ID provided)
+        const sessionId = params.sessionId || cursor?.sessionId || service.getLastSessionId();
         if (!sessionId) {
             return ScriptResult.failure(
                 'No debug sessions captured yet',
@@ -57,56 +82,21 @@ export class DapLogsScript extends QueryScript<any> {
             );
         }
 
-        // Start with all outputs
-        let filtered = [...session.outputs];
+        const outputs = session.outputs;
+        const searchRegex = params.search ? new RegExp(params.search, 'i') : undefined;
+        // Negative offset: "last N milliseconds"; otherwise an absolute timestamp
+        const cutoff = params.since == null ? undefined
+            : params.since < 0 ? Date.now() + params.since : params.since;
+        const stream = params.stream && typeof bridgeContext.emitRecord === 'function';
+
+        // Counts cover the events examined for this page
         const filterStats = {
             byCategory: 0,
             bySearch: 0,
-            byTime: 0,
-            original: filtered.length
+            byTime: 0
         };
 
-        // Filter by category
-        if (params.category !== 'all') {
-            filtered = filtered.filter((o: any) => o.category === params.category);
-            filterStats.byCategory = filterStats.original - filtered.length;
-        }
-
-        // Filter by search pattern
-        if (params.search) {
-            const searchRegex = new RegExp(params.search, 'i');
-            const beforeSearch = filtered.length;
-            filtered = filtered.filter((o: any) => searchRegex.test(o.text));
-            filterStats.bySearch = beforeSearch - filtered.length;
-        }
-
-        // Filter by time
-        if (params.since != null) {
-            const beforeTime = filtered.length;
-            if (params.since < 0) {
-                // Negative offset: "last N milliseconds"
-                const cutoff = Date.now() + params.since; // since is negative
-                filtered = filtered.filter((o: any) => o.ts >= cutoff);
-            } else {
-                // Absolute timestamp
-                filtered = filtered.filter((o: any) => o.ts >= params.since);
-            }
-            filterStats.byTime = beforeTime - filtered.length;
-        }
-
-        // Reverse if oldest-first requested
-        if (params.reverse) {
-            // Already in chronological order, keep as-is
-        } else {
-            // Default: most recent first
-            filtered.reverse();
-        }
-
-        // Limit count
-        const logs = filtered.slice(0, params.count);
-
-        // Format logs
-        const formattedLogs = logs.map((o: any) => {
+        const formatLog = (o: any) => {
             const result: any = {
                 ts: o.ts,
                 relativeTime: o.ts - session.startTime,
@@ -123,17 +113,63 @@ export class DapLogsScript extends QueryScript<any> {
             }
 
             return result;
+        };
+
+        // Default: most recent first; reverse gives chronological order.
+        // The scan stops at the first log past the page (it starts the next page).
+        const oldestFirst = params.reverse;
+        const formattedLogs: any[] = [];
+        let matched = 0;
+        let nextSeq: number | undefined;
+        let cancelled = false;
+
+        outputs.scan({
+            fromSeq: oldestFirst ? cursor?.seq : undefined,
+            toSeq: oldestFirst ? undefined : cursor?.seq,
+            backward: !oldestFirst
+        }, (o: any, index: number) => {
+            if (bridgeContext.signal?.aborted) {
+                cancelled = true;
+                return false;
+            }
+
+            if (params.category !== 'all' && o.category !== params.category) {
+                filterStats.byCategory++;
+                return;
+            }
+            if (searchRegex && !searchRegex.test(o.text)) {
+                filterStats.bySearch++;
+                return;
+            }
+            if (cutoff != null && o.ts < cutoff) {
+                filterStats.byTime++;
+                return;
+            }
+
+            const seq = outputs.firstSeq + index;
+            if (matched === params.count) {
+                nextSeq = oldestFirst ? seq : seq + 1;
+                return false;
+            }
+            matched++;
+
+            if (stream) {
+                bridgeContext.emitRecord!(formatLog(o));
+            } else {
+                formattedLogs.push(formatLog(o));
+            }
         });
 
         return ScriptResult.success({
-            logs: formattedLogs,
-            matched: logs.length,
-            total: session.outputs.length,
-            filtered: {
-                byCategory: filterStats.byCategory,
-                bySearch: filterStats.bySearch,
-                byTime: filterStats.byTime
-            },
+            ...(stream ? { streamed: matched } : { logs: formattedLogs }),
+            matched,
+            total: outputs.length,
+            // Older output evicted to stay within the capture budget
+            dropped: outputs.dropped,
+            nextCursor: nextSeq != null && !cancelled
+                ? encodeOutputCursor({ sessionId: session.sessionId, seq: nextSeq })
+                : null,
+            filtered: filterStats,
             session: {
                 id: session.sessionId,
                 type: session.type,
@@ -3,12 +3,19 @@ import { QueryScript, RegisterScript } from '@script-base';
 import type { IBridgeContext } from '../../core/bridge-context/types';
 import { ScriptResult } from '@core/scripts/ScriptResult';
 import { ErrorCode } from '@core/response/errorTaxonomy';
+import { requiredLiterals } from '@core/debug/output-log';
+import { decodeOutputCursor, encodeOutputCursor } from '@core/debug/output-cursor';
 
 /**
  * DAP Search Script - Pattern Search Across Outputs
  *
  * Search one or all sessions for text/regex patterns in outputs.
  * Returns matches with surrounding context.
+ *
+ * Results are paged by `limit`: `nextCursor` marks the first match past the
+ * page, and passing it back as `after` (with the same pattern) continues
+ * from there. With `stream`, each match is emitted as a record while
+ * scanning instead of being collected into the response.
  */
 @RegisterScript('dap.search')
 export class DapSearchScript extends QueryScript<any> {
@@ -20,7 +27,9 @@ export class DapSearchScript extends QueryScript<any> {
             category: z.enum(['all', 'stdout', 'stderr', 'console', 'telemetry']).optional(),
             contextLines: z.coerce.number().int().min(0).max(20).optional().default(2),
             limit: z.coerce.number().int().min(1).max(1000).optional().default(50),
-            caseSensitive: z.coerce.boolean().optional().default(false)
+            caseSensitive: z.coerce.boolean().optional().default(false),
+            after: z.string().optional(), // cursor from a previous page's nextCursor
+            stream: z.coerce.boolean().optional().default(false)
         });
     }
 
@@ -35,6 +44,16 @@ export class DapSearchScript extends QueryScript<any> {
             );
         }
 
+        // Resume position from a previous page
+        const cursor = params.after ? decodeOutputCursor(params.after) : undefined;
+        if (params.after && !cursor) {
+            return ScriptResult.failure(
+                'Invalid cursor - pass nextCursor from a previous dap.search response',
+                ErrorCode.E_INVALID_PARAMS,
+                { after: params.after }
+            );
+        }
+
         // Determine which sessions to search
         const sessionsToSearch = [];
         if (params.sessionId === 'all') {
@@ -42,8 +61,8 @@ export class DapSearchScript extends QueryScript<any> {
             const allSessions = service.getAllSessions();
             sessionsToSearch.push(...allSessions);
         } else {
-            // Search specific session or latest
-            const sessionId = params.sessionId || service.getLastSessionId();
+            // Search specific session, the cursor's session, or latest
+            const sessionId = params.sessionId || cursor?.sessionId || service.getLastSessionId();
             if (!sessionId) {
                 return ScriptResult.failure(
                     'No debug sessions captured yet',
@@ -63,27 +82,68 @@ export class DapSearchScript extends QueryScript<any> {
             sessionsToSearch.push(session);
         }
 
+        // A cursor resumes inside its session; sessions searched before it are done
+        if (cursor) {
+            const resumeAt = sessionsToSearch.findIndex((session: any) => session.sessionId === cursor.sessionId);
+            if (resumeAt === -1) {
+                return ScriptResult.failure(
+                    `Cursor session "${cursor.sessionId}" is not part of this search - it may have been cleared`,
+                    ErrorCode.E_INVALID_PARAMS,
+                    { cursorSessionId: cursor.sessionId }
+                );
+            }
+            sessionsToSearch.splice(0, resumeAt);
+        }
+
         // Build regex pattern
         const regex = new RegExp(
             params.pattern,
             params.caseSensitive ? '' : 'i'
         );
 
+        // Literal runs in the pattern let the output index skip chunks that cannot match
+        const literals = requiredLiterals(params.pattern);
+        const categories = params.category && params.category !== 'all' ? [params.category] : undefined;
+        const stream = params.stream && typeof bridgeContext.emitRecord === 'function';
+
         // Search all sessions
         const allMatches: any[] = [];
         const matchesBySession: Record<string, number> = {};
+        let totalMatches = 0;
+        let returned = 0;
+        let nextCursor: string | null = null;
+        let chunksScanned = 0;
+        let chunksSkipped = 0;
+        let cancelled = false;
 
         for (const session of sessionsToSearch) {
-            let outputs = session.outputs;
+            const outputs = session.outputs;
+
+            const scanStats = outputs.scan(
+                {
+                    categories,
+                    literals,
+                    match: (text: string) => regex.test(text),
+                    fromSeq: cursor?.sessionId === session.sessionId ? cursor.seq : undefined
+                },
+                (output: any, idx: number) => {
+                    if (bridgeContext.signal?.aborted) {
+                        cancelled = true;
+                        return false;
+                    }
 
-            // Filter by category if specified
-            if (params.category && params.category !== 'all') {
-                outputs = outputs.filter((o: any) => o.category === params.category);
-            }
+                    totalMatches++;
+                    matchesBySession[session.sessionId] = (matchesBySession[session.sessionId] || 0) + 1;
+
+                    // Only build results we will return; later matches are just counted
+                    if (returned >= params.limit) {
+                        if (!nextCursor) {
+                            nextCursor = encodeOutputCursor({ sessionId: session.sessionId, seq: outputs.firstSeq + idx });
+                        }
+                        return;
+                    }
+                    returned++;
 
-            // Search for pattern
-            outputs.forEach((output: any, idx: number) => {
-                if (regex.test(output.text)) {
                     // Found a match!
                     const match: any = {
                         sessionId: session.sessionId,
@@ -96,7 +156,7 @@ export class DapSearchScript extends QueryScript<any> {
                         matchText: output.text.match(regex)?.[0] || null
                     };
 
-                    // Add context if requested
+                    // Add context if requested (neighbouring output of any category)
                     if (params.contextLines > 0) {
                         const beforeStart = Math.max(0, idx - params.contextLines);
                         const afterEnd = Math.min(outputs.length, idx + params.contextLines + 1);
@@ -115,27 +175,30 @@ export class DapSearchScript extends QueryScript<any> {
                         };
                     }
 
-                    allMatches.push(match);
-
-                    // Track by session
-                    if (!matchesBySession[session.sessionId]) {
-                        matchesBySession[session.sessionId] = 0;
+                    if (stream) {
+                        bridgeContext.emitRecord!(match);
+                    } else {
+                        allMatches.push(match);
                     }
-                    matchesBySession[session.sessionId]++;
                 }
-            });
+            );
+            chunksScanned += scanStats.chunksScanned;
+            chunksSkipped += scanStats.chunksSkipped;
+            if (cancelled) {
+                break;
+            }
         }
 
-        // Limit results
-        const limitedMatches = allMatches.slice(0, params.limit);
-
+        // Counts cover matches from the cursor onward
         return ScriptResult.success({
-            matches: limitedMatches,
-            totalMatches: allMatches.length,
+            ...(stream ? { streamed: returned } : { matches: allMatches }),
+            totalMatches,
             matchesBySession,
             sessionsSearched: sessionsToSearch.length,
             pattern: params.pattern,
-            truncated: allMatches.length > params.limit
+            truncated: totalMatches > params.limit,
+            nextCursor: cancelled ? null : nextCursor,
+            index: { chunksScanned, chunksSkipped }
         });
     }
 }
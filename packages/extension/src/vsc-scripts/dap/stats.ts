@@ -58,38 +58,40 @@ export class DapStatsScript extends QueryScript<any> {
             sessionsToAnalyze.push(session);
         }
 
-        // Aggregate all outputs
-        const allOutputs = sessionsToAnalyze.flatMap((s: any) => s.outputs);
+        // Aggregates are maintained at capture time; merge them per session
         const allExceptions = sessionsToAnalyze.flatMap((s: any) => s.exceptions);
+        const totalOutputs = sessionsToAnalyze.reduce((sum: number, s: any) => sum + s.outputs.length, 0);
 
         // Distribution by category
         const byCategory: Record<string, number> = {};
-        allOutputs.forEach((o: any) => {
-            byCategory[o.category] = (byCategory[o.category] || 0) + 1;
-        });
-
         // Distribution by source file
         const bySource: Record<string, number> = {};
-        allOutputs.forEach((o: any) => {
-            if (o.source?.path || o.source?.name) {
-                const file = o.source.path || o.source.name;
-                bySource[file] = (bySource[file] || 0) + 1;
+        // Distribution over time (hourly buckets)
+        const hourly = new Map<number, number>();
+        // Most frequent messages (first 100 chars)
+        const messageFrequency: Record<string, number> = {};
+
+        for (const session of sessionsToAnalyze) {
+            for (const [category, count] of Object.entries(session.outputs.countByCategory()) as [string, number][]) {
+                byCategory[category] = (byCategory[category] || 0) + count;
             }
-        });
+            for (const [file, count] of Object.entries(session.outputs.countBySource()) as [string, number][]) {
+                bySource[file] = (bySource[file] || 0) + count;
+            }
+            for (const [hour, count] of session.outputs.countByHour() as [number, number][]) {
+                hourly.set(hour, (hourly.get(hour) || 0) + count);
+            }
+            for (const [text, count] of session.outputs.topMessages() as [string, number][]) {
+                messageFrequency[text] = (messageFrequency[text] || 0) + count;
+            }
+        }
 
-        // Distribution over time (hourly buckets)
         const overTime: Record<string, number> = {};
-        allOutputs.forEach((o: any) => {
-            const hour = new Date(o.ts).toISOString().slice(0, 13) + ':00';
-            overTime[hour] = (overTime[hour] || 0) + 1;
+        Array.from(hourly.keys()).sort((a, b) => a - b).forEach(hour => {
+            overTime[new Date(hour).toISOString().slice(0, 13) + ':00'] = hourly.get(hour)!;
         });
 
         // Top N most frequent messages
-        const messageFrequency: Record<string, number> = {};
-        allOutputs.forEach((o: any) => {
-            const msg = o.text.slice(0, 100); // First 100 chars
-            messageFrequency[msg] = (messageFrequency[msg] || 0) + 1;
-        });
         const mostFrequentMessages = Object.entries(messageFrequency)
             .sort((a, b) => b[1] - a[1])
             .slice(0, 10)
@@ -121,12 +123,12 @@ export class DapStatsScript extends QueryScript<any> {
         }, 0);
         const totalDurationSec = totalDuration / 1000;
 
-        const eventsPerSecond = totalDurationSec > 0 ? (allOutputs.length / totalDurationSec).toFixed(2) : '0';
-        const timeBetweenOutputs = allOutputs.length > 1
-            ? Math.round(totalDuration / (allOutputs.length - 1))
+        const eventsPerSecond = totalDurationSec > 0 ? (totalOutputs / totalDurationSec).toFixed(2) : '0';
+        const timeBetweenOutputs = totalOutputs > 1
+            ? Math.round(totalDuration / (totalOutputs - 1))
             : 0;
         const outputsPerSession = sessionsToAnalyze.length > 0
-            ? Math.round(allOutputs.length / sessionsToAnalyze.length)
+            ? Math.round(totalOutputs / sessionsToAnalyze.length)
             : 0;
 
         // Detect anomalies (simple spike detection)
@@ -143,7 +145,7 @@ export class DapStatsScript extends QueryScript<any> {
             const maxCount = Math.max(...Object.values(byCategory));
             charts.categoryDistribution = Object.entries(byCategory).map(([cat, count]) => {
                 const barLength = Math.floor((count / maxCount) * 40);
-                const percentage = ((count / allOutputs.length) * 100).toFixed(1);
+                const percentage = ((count / totalOutputs) * 100).toFixed(1);
                 return {
                     category: cat,
                     count,
@@ -188,7 +190,8 @@ export class DapStatsScript extends QueryScript<any> {
             anomalies,
             charts,
             summary: {
-                totalOutputs: allOutputs.length,
+                totalOutputs,
+                droppedOutputs: sessionsToAnalyze.reduce((sum: number, s: any) => sum + s.outputs.dropped, 0),
                 totalExceptions: allExceptions.length,
                 sessionsAnalyzed: sessionsToAnalyze.length,
                 timespan: `${totalDurationSec.toFixed(2)}s`
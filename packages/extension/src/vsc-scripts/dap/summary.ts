@@ -59,19 +59,20 @@ export class DapSummaryScript extends QueryScript<any> {
         const durationSec = duration / 1000;
 
         const totalOutputs = session.outputs.length;
+        const categoryCounts = session.outputs.countByCategory();
         const byCategory = {
-            stdout: session.outputs.filter((o: any) => o.category === 'stdout').length,
-            stderr: session.outputs.filter((o: any) => o.category === 'stderr').length,
-            console: session.outputs.filter((o: any) => o.category === 'console').length,
-            telemetry: session.outputs.filter((o: any) => o.category === 'telemetry').length
+            stdout: categoryCounts.stdout || 0,
+            stderr: categoryCounts.stderr || 0,
+            console: categoryCounts.console || 0,
+            telemetry: categoryCounts.telemetry || 0
         };
 
-        const totalDataSize = session.outputs.reduce((sum: number, o: any) => sum + (o.text?.length || 0), 0);
+        const totalDataSize = session.outputs.chars;
         const avgOutputLength = totalOutputs > 0 ? Math.round(totalDataSize / totalOutputs) : 0;
         const eventsPerSecond = durationSec > 0 ? (totalOutputs / durationSec).toFixed(2) : '0';
 
         const timeSinceLastEvent = session.outputs.length > 0
-            ? Date.now() - session.outputs[session.outputs.length - 1].ts
+            ? Date.now() - session.outputs.at(-1).ts
             : null;
 
         // Health indicators
@@ -118,7 +119,8 @@ export class DapSummaryScript extends QueryScript<any> {
                 errorRatio: parseFloat(errorRatio),
                 exitCode: session.exitCode,
                 abnormalExit,
-                truncated: session.truncated || false
+                truncated: session.outputs.dropped > 0,
+                droppedOutputs: session.outputs.dropped
             },
             samples: {
                 first: firstOutputs.map((o: any) => ({ ts: o.ts, category: o.category, text: o.text.slice(0, 100) })),
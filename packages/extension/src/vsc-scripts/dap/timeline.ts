@@ -54,13 +54,30 @@ export class DapTimelineScript extends QueryScript<any> {
             );
         }
 
+        // Time window bounds (outputs outside them are skipped by the output index)
+        let since: number | undefined;
+        let until: number | undefined;
+        if (params.window) {
+            if (params.fromEnd) {
+                // Last N milliseconds
+                since = (session.endTime || Date.now()) - params.window;
+            } else {
+                // First N milliseconds
+                until = session.startTime + params.window;
+            }
+        }
+        const inWindow = (ts: number) => (since == null || ts >= since) && (until == null || ts <= until);
+
         // Build timeline events
         const timeline: any[] = [];
         const eventTypesFilter = params.eventTypes || ['output', 'exception', 'stopped', 'exit'];
+        const includeOutputs = eventTypesFilter.includes('output');
 
-        // Add outputs
-        if (eventTypesFilter.includes('output')) {
-            session.outputs.forEach((o: any) => {
+        // Add outputs (summary granularity uses the per-second counters instead)
+        if (includeOutputs && params.granularity !== 'summary') {
+            // Milestones only keep significant output (stderr)
+            const categories = params.granularity === 'milestones' ? ['stderr'] : undefined;
+            session.outputs.scan({ categories, since, until }, (o: any) => {
                 timeline.push({
                     timestamp: o.ts,
                     relativeTime: o.ts - session.startTime,
@@ -74,15 +91,10 @@ export class DapTimelineScript extends QueryScript<any> {
 
         // Add exceptions
         if (eventTypesFilter.includes('exception')) {
-            session.exceptions.forEach((exc: any, idx: number) => {
-                // Estimate timestamp based on session progress
-                const estimatedTs = session.startTime +
-                    ((session.endTime || Date.now()) - session.startTime) *
-                    ((idx + 1) / session.exceptions.length);
-
+            session.exceptions.forEach((exc: any) => {
                 timeline.push({
-                    timestamp: estimatedTs,
-                    relativeTime: estimatedTs - session.startTime,
+                    timestamp: exc.ts,
+                    relativeTime: exc.ts - session.startTime,
                     eventType: 'exception',
                     summary: `Exception: ${exc.message || exc.description}`,
                     significance: 'error',
@@ -94,11 +106,9 @@ export class DapTimelineScript extends QueryScript<any> {
         // Add stopped events
         if (eventTypesFilter.includes('stopped')) {
             session.stoppedEvents.forEach((e: any) => {
-                // Estimate timestamp
-                const estimatedTs = session.startTime + (session.endTime || Date.now() - session.startTime) / 2;
                 timeline.push({
-                    timestamp: estimatedTs,
-                    relativeTime: estimatedTs - session.startTime,
+                    timestamp: e.ts,
+                    relativeTime: e.ts - session.startTime,
                     eventType: 'stopped',
                     summary: `Paused: ${e.reason}${e.text ? ` - ${e.text}` : ''}`,
                     significance: e.reason === 'exception' ? 'error' : 'warning',
@@ -120,23 +130,10 @@ export class DapTimelineScript extends QueryScript<any> {
             });
         }
 
-        // Sort chronologically
-        timeline.sort((a, b) => a.timestamp - b.timestamp);
-
-        // Apply time window filter
-        let filteredTimeline = timeline;
-        if (params.window) {
-            if (params.fromEnd) {
-                // Last N milliseconds
-                const sessionEnd = session.endTime || Date.now();
-                const cutoff = sessionEnd - params.window;
-                filteredTimeline = timeline.filter((e: any) => e.timestamp >= cutoff);
-            } else {
-                // First N milliseconds
-                const cutoff = session.startTime + params.window;
-                filteredTimeline = timeline.filter((e: any) => e.timestamp <= cutoff);
-            }
-        }
+        // Sort chronologically and apply the time window to non-output events
+        let filteredTimeline = timeline
+            .filter((e: any) => e.eventType === 'output' || inWindow(e.timestamp))
+            .sort((a, b) => a.timestamp - b.timestamp);
 
         // Apply granularity
         if (params.granularity === 'milestones') {
@@ -148,33 +145,51 @@ export class DapTimelineScript extends QueryScript<any> {
                 (e.eventType === 'output' && e.significance !== 'normal')
             );
         } else if (params.granularity === 'summary') {
-            // Group events by second
-            const grouped: Record<number, any[]> = {};
-            filteredTimeline.forEach((e: any) => {
-                const second = Math.floor(e.relativeTime / 1000);
-                if (!grouped[second]) {
-                    grouped[second] = [];
+            // Group events by second: O(seconds) from the output counters, plus the discrete events
+            const grouped = new Map<number, { events: number; errors: number; types: Record<string, number> }>();
+            const group = (relativeMs: number, eventType: string, count: number, errors: number) => {
+                const second = Math.floor(relativeMs / 1000);
+                let bucket = grouped.get(second);
+                if (!bucket) {
+                    bucket = { events: 0, errors: 0, types: {} };
+                    grouped.set(second, bucket);
+                }
+                bucket.events += count;
+                bucket.errors += errors;
+                bucket.types[eventType] = (bucket.types[eventType] || 0) + count;
+            };
+
+            if (includeOutputs) {
+                for (const [secondStart, counts] of session.outputs.countBySecond()) {
+                    // Partial seconds at the window edges are kept whole
+                    if (!inWindow(secondStart) && !inWindow(secondStart + 999)) continue;
+                    group(secondStart - session.startTime, 'output', counts.outputs, 0);
                 }
-                grouped[second].push(e);
+            }
+            filteredTimeline.forEach((e: any) => {
+                group(e.relativeTime, e.eventType, 1, e.significance === 'error' ? 1 : 0);
             });
 
-            filteredTimeline = Object.entries(grouped).map(([second, events]) => ({
-                timestamp: session.startTime + parseInt(second) * 1000,
-                relativeTime: parseInt(second) * 1000,
-                eventType: 'summary',
-                summary: `Second ${second}: ${events.length} events (${events.filter((e: any) => e.significance === 'error').length} errors)`,
-                significance: events.some((e: any) => e.significance === 'error') ? 'error' : 'normal',
-                data: { events: events.length, types: events.map((e: any) => e.eventType) }
-            }));
+            filteredTimeline = Array.from(grouped.keys()).sort((a, b) => a - b).map(second => {
+                const bucket = grouped.get(second)!;
+                return {
+                    timestamp: session.startTime + second * 1000,
+                    relativeTime: second * 1000,
+                    eventType: 'summary',
+                    summary: `Second ${second}: ${bucket.events} events (${bucket.errors} errors)`,
+                    significance: bucket.errors > 0 ? 'error' : 'normal',
+                    data: { events: bucket.events, types: bucket.types }
+                };
+            });
         }
 
         // Calculate milestones
         const milestones = {
-            firstOutput: session.outputs.length > 0 ? session.outputs[0].ts : null,
+            firstOutput: session.outputs.length > 0 ? session.outputs.at(0).ts : null,
             firstException: session.exceptions.length > 0 ? session.exceptions[0] : null,
             breakpointHits: session.stoppedEvents
                 .filter((e: any) => e.reason === 'breakpoint')
-                .map((e: any, idx: number) => session.startTime + (idx + 1) * 100), // estimated
+                .map((e: any) => e.ts),
             sessionExit: session.endTime || null
         };
 
@@ -1,6 +1,7 @@
 import { z } from 'zod';
 import { QueryScript, RegisterScript } from '@script-base';
 import type { IBridgeContext } from '../../core/bridge-context/types';
+import { RuntimeInspectionService } from '@core/runtime-inspection/RuntimeInspectionService';
 import { ScriptResult } from '@core/scripts/ScriptResult';
 import { ErrorCode } from '@core/response/errorTaxonomy';
 import { getActiveThreadId } from '@core/debug/session-helpers';
@@ -17,7 +18,8 @@ export class EvaluateScript extends QueryScript<any> {
             expression: z.string().min(1),
             frameId: z.coerce.number().int().min(0).optional(),
             context: z.enum(['repl', 'watch', 'hover']).optional(),
-            sessionId: z.string().optional()
+            sessionId: z.string().optional(),
+            noCache: z.coerce.boolean().optional().default(false)
         });
     }
 
@@ -49,6 +51,9 @@ export class EvaluateScript extends QueryScript<any> {
             }
         }
 
+        // stackTrace comes from the pause cache; a repl evaluate invalidates it
+        const request = RuntimeInspectionService.getInstance().requestFor(session, params.noCache);
+
         try {
             // If no frameId provided, try to get the top frame
             let frameId = params.frameId;
@@ -58,7 +63,7 @@ export class EvaluateScript extends QueryScript<any> {
                     const threadId = await getActiveThreadId(session, bridgeContext.vscode);
 
                     // Get stack trace for the active thread
-                    const stackResponse = await session.customRequest('stackTrace', {
+                    const stackResponse = await request('stackTrace', {
                         threadId: threadId,
                         levels: 1
                     });
@@ -72,7 +77,7 @@ export class EvaluateScript extends QueryScript<any> {
             }
 
             // Use DAP evaluate request
-            const response = await session.customRequest('evaluate', {
+            const response = await request('evaluate', {
                 expression: params.expression,
                 frameId: frameId,
                 context: params.context || 'repl'
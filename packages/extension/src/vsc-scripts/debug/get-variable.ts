@@ -15,6 +15,7 @@ import { ErrorCode } from '@core/response/errorTaxonomy';
  * - Pagination support (start/count)
  * - Filter support (indexed/named)
  * - Memory-efficient for large arrays
+ * - Reuses DAP responses from earlier calls at the same pause (noCache to opt out)
  *
  * Usage:
  *   vscb script run debug.get-variable --variablesReference=123 --start=0 --count=100
@@ -27,7 +28,8 @@ export class GetVariableScript extends QueryScript<any> {
             variablesReference: z.coerce.number().int().positive(),
             start: z.coerce.number().int().min(0).optional().default(0),
             count: z.coerce.number().int().positive().optional().default(100),
-            filter: z.enum(['indexed', 'named', 'all']).optional().default('all')
+            filter: z.enum(['indexed', 'named', 'all']).optional().default('all'),
+            noCache: z.coerce.boolean().optional().default(false)
         });
 
         this.resultSchema = z.object({
@@ -76,6 +78,11 @@ export class GetVariableScript extends QueryScript<any> {
                 return ScriptResult.fromError(adapter, ErrorCode.E_INTERNAL);
             }
 
+            // Opt out of responses cached earlier at this pause
+            if (params.noCache) {
+                adapter.invalidateCache();
+            }
+
             // Call getVariableChildren on the adapter
             const result = await adapter.getVariableChildren({
                 variablesReference: variablesReference,
@@ -115,7 +122,8 @@ export class GetVariableScript extends QueryScript<any> {
                     sessionId: session.id,
                     sessionType: session.type,
                     variablesReference: variablesReference,
-                    filter: filter || 'all'
+                    filter: filter || 'all',
+                    cache: adapter.getCacheStats()
                 }
             });
 
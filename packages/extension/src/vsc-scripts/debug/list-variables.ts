@@ -16,6 +16,7 @@ import { ErrorCode } from '@core/response/errorTaxonomy';
  * - Scope filtering (local, closure, global, all)
  * - Cycle detection
  * - Memory budget tracking
+ * - Reuses DAP responses from earlier calls at the same pause (noCache to opt out)
  */
 @RegisterScript('debug.list-variables')
 export class ListVariablesScript extends QueryScript<any> {
@@ -23,7 +24,8 @@ export class ListVariablesScript extends QueryScript<any> {
         super();
         this.paramsSchema = z.object({
             scope: z.enum(['local', 'closure', 'global', 'all']).optional().default('all'),
-            maxDepth: z.coerce.number().int().min(0).max(10).optional().default(3)
+            maxDepth: z.coerce.number().int().min(0).max(10).optional().default(3),
+            noCache: z.coerce.boolean().optional().default(false)
         });
 
         this.resultSchema = z.object({
@@ -34,7 +36,8 @@ export class ListVariablesScript extends QueryScript<any> {
                 scope: z.string(),
                 maxDepth: z.number(),
                 variableCount: z.number(),
-                budget: z.any().optional()
+                budget: z.any().optional(),
+                cache: z.any().optional()
             }).optional()
         });
     }
@@ -64,6 +67,11 @@ export class ListVariablesScript extends QueryScript<any> {
             return ScriptResult.fromError(adapter, ErrorCode.E_INTERNAL);
         }
 
+        // Opt out of responses cached earlier at this pause
+        if (params.noCache) {
+            adapter.invalidateCache();
+        }
+
         // Call listVariables on the adapter
         // Note: adapter expects 'scopeFilter' not 'scope'
         const result = await adapter.listVariables({
@@ -85,7 +93,8 @@ export class ListVariablesScript extends QueryScript<any> {
                 sessionType: session.type,
                 scope: scope,
                 maxDepth: maxDepth,
-                variableCount: result.length
+                variableCount: result.length,
+                cache: adapter.getCacheStats()
             }
         });
     }
@@ -1,6 +1,7 @@
 import { z } from 'zod';
 import { QueryScript, RegisterScript } from '@script-base';
 import type { IBridgeContext } from '../../core/bridge-context/types';
+import { RuntimeInspectionService } from '@core/runtime-inspection/RuntimeInspectionService';
 import { ScriptResult } from '@core/scripts/ScriptResult';
 import { ErrorCode } from '@core/response/errorTaxonomy';
 
@@ -14,7 +15,8 @@ export class ScopesScript extends QueryScript<any> {
         super();
         this.paramsSchema = z.object({
             frameId: z.coerce.number().int().min(0),
-            sessionId: z.string().optional()
+            sessionId: z.string().optional(),
+            noCache: z.coerce.boolean().optional().default(false)
         });
     }
 
@@ -45,8 +47,9 @@ export class ScopesScript extends QueryScript<any> {
         }
 
         try {
-            // Use DAP scopes request
-            const response = await session.customRequest('scopes', {
+            // Use DAP scopes request (from the pause cache when available)
+            const request = RuntimeInspectionService.getInstance().requestFor(session, params.noCache);
+            const response = await request('scopes', {
                 frameId: params.frameId
             });
 
@@ -4,6 +4,7 @@ import type { IBridgeContext } from '../../core/bridge-context/types';
 import { ScriptResult } from '@core/scripts/ScriptResult';
 import { ErrorCode } from '@core/response/errorTaxonomy';
 import { waitUntilPausedAndGetLocation } from '@core/debug/debug-polling-helpers';
+import { DebugEventHub } from '@core/debug/event-hub';
 
 /**
  * Start debug session waitable script
@@ -60,7 +61,8 @@ export class StartDebugScript extends WaitableScript<any> {
                 });
             });
 
-            // Start debugging with the launch configuration
+            // Start debugging with the launch configuration; stops from here on count
+            const after = DebugEventHub.instance.cursor();
             const started = await vscode.debug.startDebugging(
                 workspaceFolder,
                 params.launch
@@ -75,9 +77,6 @@ export class StartDebugScript extends WaitableScript<any> {
             // Wait for session to be fully initialized
             const session: any = await sessionStartedPromise;
 
-            // Wait a bit for the session to be fully ready
-            await new Promise(resolve => setTimeout(resolve, 500));
-
             // Log to output channel
             if (outputChannel) {
                 outputChannel.appendLine(
@@ -104,8 +103,8 @@ export class StartDebugScript extends WaitableScript<any> {
                 outputChannel.appendLine('[debug.start] wait=true, waiting for breakpoint/error/exit...');
             }
 
-            // Use useActiveSession=true to dynamically query the active session each poll
-            const outcome = await waitUntilPausedAndGetLocation(session, params.timeoutMs, vscode, true);
+            // useActiveSession=true: accept stops from child sessions (and query the active session when polling)
+            const outcome = await waitUntilPausedAndGetLocation(session, params.timeoutMs, vscode, true, { after });
 
             if (outputChannel) {
                 if (outcome.event === 'stopped') {
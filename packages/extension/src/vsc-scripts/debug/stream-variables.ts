@@ -0,0 +1,111 @@
+import { z } from 'zod';
+import * as fs from 'fs';
+import * as path from 'path';
+import { QueryScript, RegisterScript } from '@script-base';
+import type { IBridgeContext } from '../../core/bridge-context/types';
+import { RuntimeInspectionService } from '@core/runtime-inspection/RuntimeInspectionService';
+import { ScriptResult } from '@core/scripts/ScriptResult';
+import { ErrorCode } from '@core/response/errorTaxonomy';
+
+/**
+ * Stream Variables Query Script
+ *
+ * Walks the paused frame's variables (or one expression) depth-first through
+ * the session's debug adapter and writes one record per node as it goes, so
+ * object graphs far beyond debug.list-variables' memory budget can be dumped.
+ *
+ * Features:
+ * - NDJSON file output (records carry id/parent to rebuild the tree)
+ * - `stream`: records also go out as job events while walking
+ * - Budget-paced flushing instead of a hard node limit
+ * - Resumable: a walk stopped by maxNodes or cancellation returns a cursor
+ *
+ * Usage:
+ *   vscb script run debug.stream-variables --param expression="df" --param outputPath="/tmp/df.jsonl"
+ */
+@RegisterScript('debug.stream-variables')
+export class StreamVariablesScript extends QueryScript<any> {
+    constructor() {
+        super();
+        this.paramsSchema = z.object({
+            outputPath: z.string().min(1).optional(),
+            expression: z.string().min(1).optional(),
+            scope: z.enum(['local', 'closure', 'global', 'all']).optional().default('all'),
+            maxDepth: z.coerce.number().int().min(0).optional().default(10),
+            pageSize: z.coerce.number().int().positive().optional().default(500),
+            maxNodes: z.coerce.number().int().positive().optional(),
+            format: z.enum(['json', 'text']).optional().default('json'),
+            cursor: z.string().optional(),
+            stream: z.coerce.boolean().optional().default(false)
+        });
+
+        this.resultSchema = z.object({
+            outputPath: z.string().optional(),
+            variableCount: z.number(),
+            bytes: z.number().optional(),
+            complete: z.boolean(),
+            cursor: z.string().optional(),
+            flushes: z.number()
+        });
+    }
+
+    async execute(bridgeContext: IBridgeContext, params: any): Promise<any> {
+        const vscode = bridgeContext.vscode;
+        const session = vscode.debug.activeDebugSession;
+        const stream = params.stream && typeof bridgeContext.emitRecord === 'function';
+
+        if (!session) {
+            return ScriptResult.failure(
+                'No active debug session',
+                ErrorCode.E_NO_SESSION
+            );
+        }
+
+        if (!params.outputPath && !stream) {
+            return ScriptResult.failure(
+                'Provide outputPath, or stream=true to receive records as events',
+                ErrorCode.E_INVALID_PARAMS
+            );
+        }
+
+        let outputPath: string | undefined;
+        if (params.outputPath) {
+            const workspaceDir = (bridgeContext as any).workspaceFolder?.uri?.fsPath || process.cwd();
+            outputPath = path.isAbsolute(params.outputPath)
+                ? params.outputPath
+                : path.resolve(workspaceDir, params.outputPath);
+            await fs.promises.mkdir(path.dirname(outputPath), { recursive: true });
+        }
+
+        const adapter = RuntimeInspectionService.getInstance().getAdapter();
+        if ('code' in adapter) {
+            return ScriptResult.fromError(adapter, ErrorCode.E_INTERNAL);
+        }
+
+        const result = await adapter.streamVariables({
+            outputPath,
+            onRecord: stream ? record => bridgeContext.emitRecord!(record) : undefined,
+            expression: params.expression,
+            scopeFilter: params.scope,
+            maxDepth: params.maxDepth,
+            pageSize: params.pageSize,
+            maxNodes: params.maxNodes,
+            format: params.format,
+            cursor: params.cursor,
+            signal: bridgeContext.signal
+        });
+
+        if (!result.success || result.error) {
+            return ScriptResult.fromError(result.error!, ErrorCode.E_INTERNAL);
+        }
+
+        return ScriptResult.success({
+            outputPath: result.outputPath,
+            variableCount: result.variableCount ?? 0,
+            bytes: result.byteCount,
+            complete: result.complete ?? true,
+            cursor: result.cursor,
+            flushes: result.flushes ?? 0
+        });
+    }
+}
@@ -3,10 +3,16 @@ import { WaitableScript, RegisterScript } from '@script-base';
 import type { IBridgeContext } from '../../core/bridge-context/types';
 import { ScriptResult } from '@core/scripts/ScriptResult';
 import { ErrorCode } from '@core/response/errorTaxonomy';
+import { DebugEventHub } from '@core/debug/event-hub';
+import { queryPausedLocation } from '@core/debug/debug-polling-helpers';
 
 /**
  * Wait for breakpoint hit waitable script
  * Waits for debugger to hit any breakpoint
+ *
+ * Waits on DebugEventHub for the next `stopped` event from the active
+ * session or its child sessions, then reads the top frame of the stopped
+ * thread. Falls back to onDidChangeActiveStackItem if the hub is not installed.
  */
 @RegisterScript('debug.wait-for-hit')
 export class WaitForHitScript extends WaitableScript<any> {
@@ -27,6 +33,12 @@ export class WaitForHitScript extends WaitableScript<any> {
                 line: z.number(),
                 hitCount: z.number().optional()
             }).optional(),
+            sessionId: z.string().optional(),
+            stopDetection: z.object({
+                via: z.string(),
+                waitMs: z.number(),
+                locateMs: z.number()
+            }).optional(),
             timestamp: z.string()
         });
     }
@@ -45,53 +57,110 @@ export class WaitForHitScript extends WaitableScript<any> {
                 );
             }
 
-            return new Promise((resolve, reject) => {
-                let disposable: any;
-                let timer: any;
-                let disposed = false;
+            const hub = DebugEventHub.instance;
+            if (!hub.isInstalled()) {
+                return this.waitForActiveStackItem(bridgeContext, timeoutMs);
+            }
 
-                const cleanup = () => {
-                    if (disposed) return;
-                    disposed = true;
-                    if (timer) clearTimeout(timer);
-                    if (disposable) disposable.dispose();
-                };
+            const session = vscode.debug.activeDebugSession;
+            const startTime = Date.now();
+            const stop = await hub.waitForStop({ session, scope: 'tree', timeoutMs });
 
-                // Setup timeout
-                timer = setTimeout(() => {
-                    cleanup();
-                    resolve(ScriptResult.success({
-                        event: 'timeout',
-                        timestamp: new Date().toISOString()
-                    }));
-                }, timeoutMs);
-
-                // Listen for breakpoint hit (stopped event)
-                disposable = vscode.debug.onDidChangeActiveStackItem((e: any) => {
-                    if (e && e.source && !disposed) {
-                        cleanup();
-
-                        // Log to output channel
-                        if (bridgeContext.outputChannel) {
-                            bridgeContext.outputChannel.appendLine(
-                                `[dbg.waitForHit] Breakpoint hit at ${e.source.path}:${e.line}`
-                            );
-                        }
-
-                        resolve(ScriptResult.success({
-                            event: 'breakpoint-hit',
-                            breakpoint: {
-                                path: e.source.path || 'unknown',
-                                line: e.line || 0,
-                                hitCount: 1 // VS Code doesn't provide hit count directly
-                            },
-                            timestamp: new Date().toISOString()
-                        }));
-                    }
+            if (!stop) {
+                return ScriptResult.success({
+                    event: 'timeout',
+                    timestamp: new Date().toISOString()
                 });
+            }
+
+            const detectedAt = Date.now();
+            if (stop.outcome.kind !== 'stopped') {
+                return ScriptResult.success({
+                    event: 'terminated',
+                    sessionId: stop.sessionId,
+                    timestamp: new Date().toISOString()
+                });
+            }
+
+            const stoppedSession = hub.getSession(stop.sessionId) || session;
+            const location = await queryPausedLocation(stoppedSession, stop.outcome.threadId);
+
+            // Log to output channel
+            if (bridgeContext.outputChannel) {
+                bridgeContext.outputChannel.appendLine(
+                    `[dbg.waitForHit] Breakpoint hit at ${location.file}:${location.line}`
+                );
+            }
+
+            return ScriptResult.success({
+                event: 'breakpoint-hit',
+                breakpoint: {
+                    path: location.file,
+                    line: location.line || 0,
+                    hitCount: 1 // VS Code doesn't provide hit count directly
+                },
+                sessionId: location.sessionId,
+                stopDetection: {
+                    via: 'event',
+                    waitMs: detectedAt - startTime,
+                    locateMs: Date.now() - detectedAt
+                },
+                timestamp: new Date().toISOString()
             });
         } catch (error: any) {
             return ScriptResult.fromError(error, ErrorCode.E_OPERATION_FAILED);
         }
     }
+
+    /**
+     * Legacy detection via the editor's active stack item (hub not installed)
+     */
+    private waitForActiveStackItem(bridgeContext: IBridgeContext, timeoutMs: number): Promise<any> {
+        const vscode = bridgeContext.vscode;
+        return new Promise((resolve) => {
+            let disposable: any;
+            let timer: any;
+            let disposed = false;
+
+            const cleanup = () => {
+                if (disposed) return;
+                disposed = true;
+                if (timer) clearTimeout(timer);
+                if (disposable) disposable.dispose();
+            };
+
+            // Setup timeout
+            timer = setTimeout(() => {
+                cleanup();
+                resolve(ScriptResult.success({
+                    event: 'timeout',
+                    timestamp: new Date().toISOString()
+                }));
+            }, timeoutMs);
+
+            // Listen for breakpoint hit (stopped event)
+            disposable = vscode.debug.onDidChangeActiveStackItem((e: any) => {
+                if (e && e.source && !disposed) {
+                    cleanup();
+
+                    // Log to output channel
+                    if (bridgeContext.outputChannel) {
+                        bridgeContext.outputChannel.appendLine(
+                            `[dbg.waitForHit] Breakpoint hit at ${e.source.path}:${e.line}`
+                        );
+                    }
+
+                    resolve(ScriptResult.success({
+                        event: 'breakpoint-hit',
+                        breakpoint: {
+                            path: e.source.path || 'unknown',
+                            line: e.line || 0,
+                            hitCount: 1 // VS Code doesn't provide hit count directly
+                        },
+                        timestamp: new Date().toISOString()
+                    }));
+                }
+            });
+        });
+    }
 }
@@ -1,5 +1,5 @@
 // Generated by generate-zod-schemas.ts
-// Generated on: 2025-11-25
+// Generated on: 2026-10-17
 // DO NOT EDIT MANUALLY - This file is auto-generated from script metadata
 
 import { z } from "zod";
@@ -53,6 +53,9 @@ export const scriptSchemas = {
   "dap.filter": z.object({
     sessionId: z.string().optional(),
     filters: z.record(z.string(), z.unknown()),
+    limit: z.coerce.number().min(1).optional(),
+    after: z.string().optional(),
+    stream: z.coerce.boolean().default(false).optional(),
   }).strict(),
 
   "dap.logs": z.object({
@@ -63,6 +66,8 @@ export const scriptSchemas = {
     since: z.coerce.number().optional(),
     reverse: z.coerce.boolean().default(false).optional(),
     showSource: z.coerce.boolean().default(true).optional(),
+    after: z.string().optional(),
+    stream: z.coerce.boolean().default(false).optional(),
   }).strict(),
 
   "dap.search": z.object({
@@ -72,6 +77,8 @@ export const scriptSchemas = {
     contextLines: z.coerce.number().default(2).optional(),
     limit: z.coerce.number().default(50).optional(),
     caseSensitive: z.coerce.boolean().default(false).optional(),
+    after: z.string().optional(),
+    stream: z.coerce.boolean().default(false).optional(),
   }).strict(),
 
   "dap.stats": z.object({
@@ -103,6 +110,7 @@ export const scriptSchemas = {
     frameId: z.coerce.number().optional(),
     context: z.enum(["repl", "watch", "hover"]).optional(),
     sessionId: z.string().optional(),
+    noCache: z.coerce.boolean().default(false).optional(),
   }).strict(),
 
   "debug.get-variable": z.object({
@@ -110,11 +118,13 @@ export const scriptSchemas = {
     start: z.coerce.number().default(0).optional(),
     count: z.coerce.number().default(100).optional(),
     filter: z.enum(["indexed", "named", "all"]).default("all").optional(),
+    noCache: z.coerce.boolean().default(false).optional(),
   }).strict(),
 
   "debug.list-variables": z.object({
     scope: z.enum(["local", "closure", "global", "all"]).default("all").optional(),
     maxDepth: z.coerce.number().default(3).optional(),
+    noCache: z.coerce.boolean().default(false).optional(),
   }).strict(),
 
   "debug.restart": z.object({
@@ -132,6 +142,7 @@ export const scriptSchemas = {
   "debug.scopes": z.object({
     frameId: z.coerce.number(),
     sessionId: z.string().optional(),
+    noCache: z.coerce.boolean().default(false).optional(),
   }).strict(),
 
   "debug.set-variable": z.object({
@@ -172,6 +183,18 @@ export const scriptSchemas = {
     sessionId: z.string().optional(),
   }).strict(),
 
+  "debug.stream-variables": z.object({
+    outputPath: z.string().optional(),
+    expression: z.string().optional(),
+    scope: z.enum(["local", "closure", "global", "all"]).default("all").optional(),
+    maxDepth: z.coerce.number().min(0).default(10).optional(),
+    pageSize: z.coerce.number().default(500).optional(),
+    maxNodes: z.coerce.number().optional(),
+    format: z.enum(["json", "text"]).default("json").optional(),
+    cursor: z.string().optional(),
+    stream: z.coerce.boolean().default(false).optional(),
+  }).strict(),
+
   "debug.threads": z.object({
     sessionId: z.string().optional(),
   }).strict(),
@@ -204,6 +227,8 @@ export const scriptSchemas = {
     limit: z.coerce.number().min(1).max(1000).default(100).optional(),
     includeLocation: z.coerce.boolean().default(true).optional(),
     includeContainer: z.coerce.boolean().default(true).optional(),
+    source: z.enum(["auto", "index", "lsp", "merge"]).default("auto").optional(),
+    match: z.enum(["fuzzy", "prefix"]).default("fuzzy").optional(),
   }).strict(),
 
   "symbol.calls": z.object({
@@ -212,6 +237,9 @@ export const scriptSchemas = {
     symbol: z.string().optional(),
     direction: z.string().default("incoming").optional(),
     enrichWithFlowspaceIds: z.coerce.boolean().default(false).optional(),
+    depth: z.coerce.number().min(1).max(5).default(1).optional(),
+    maxNodes: z.coerce.number().min(1).max(5000).default(200).optional(),
+    timeoutMs: z.coerce.number().min(1000).max(120000).default(30000).optional(),
   }).strict(),
 
   "symbol.navigate": z.object({
@@ -241,6 +269,56 @@ export const scriptSchemas = {
 
 } as const;
 
+/**
+ * Hash of each script's parameter definitions
+ * Params sent with a matching paramsSchemaHash were already validated by the client
+ */
+export const scriptSchemaHashes: Record<string, string> = {
+  "breakpoint.clear.file": "185369d13745db10",
+  "breakpoint.clear.project": "44136fa355b3678a",
+  "breakpoint.list": "44136fa355b3678a",
+  "breakpoint.remove": "69a3f2aadac445c3",
+  "breakpoint.set": "89c59613d5436d45",
+  "code.replace-method": "d3ddaf2da8529798",
+  "dap.compare": "8ec50e68b2eca792",
+  "dap.exceptions": "7fa539bccdeb1f83",
+  "dap.filter": "73f4af9b120cd228",
+  "dap.logs": "ea1cefe68cc96493",
+  "dap.search": "9bf3e10e5c8875b0",
+  "dap.stats": "ae6eb582611cb795",
+  "dap.summary": "11bd814f9b05f31e",
+  "dap.timeline": "fba18124d40dcae3",
+  "debug.continue": "7ce57dcec132c926",
+  "debug.evaluate": "c045eb472bc5518e",
+  "debug.get-variable": "9cda587be9f4a042",
+  "debug.list-variables": "47d0cca832588964",
+  "debug.restart": "6dfa655f7656d8ae",
+  "debug.save-variable": "5cbc90d9f176031f",
+  "debug.scopes": "3991832ccb060c21",
+  "debug.set-variable": "6ef19a65f9719624",
+  "debug.stack": "6dfa655f7656d8ae",
+  "debug.start": "c87c63c098651c0e",
+  "debug.status": "44136fa355b3678a",
+  "debug.step-into": "ddd0e97e66f01a4b",
+  "debug.step-out": "ddd0e97e66f01a4b",
+  "debug.step-over": "ddd0e97e66f01a4b",
+  "debug.stop": "6dfa655f7656d8ae",
+  "debug.stream-variables": "5b6ff095ce4c535e",
+  "debug.threads": "6dfa655f7656d8ae",
+  "debug.tracker": "44136fa355b3678a",
+  "debug.wait-for-hit": "e1b81bae9b6dc1d0",
+  "diagnostic.collect": "b07b67435b9a0147",
+  "editor.get-context": "44136fa355b3678a",
+  "editor.goto-line": "f03b5072d90127fe",
+  "editor.show-testing-ui": "44136fa355b3678a",
+  "search.symbol-search": "75ebcd6edff49fba",
+  "symbol.calls": "c56cb317ab0f9e2b",
+  "symbol.navigate": "fe8bba022b84a73d",
+  "symbol.rename": "e4328aec915d274d",
+  "test.debug-single": "bfaba6c92742f587",
+  "util.restart-vscode": "44136fa355b3678a",
+};
+
 /**
  * TypeScript type for the schemas object
  */
@@ -37,7 +37,7 @@ export { DapStatsScript } from './dap/stats';
 export { DapSummaryScript } from './dap/summary';
 export { DapTimelineScript } from './dap/timeline';
 
-// Debug Scripts (17)
+// Debug Scripts (18)
 export { ContinueDebugScript } from './debug/continue';
 export { EvaluateScript } from './debug/evaluate';
 export { GetVariableScript } from './debug/get-variable';
@@ -53,6 +53,7 @@ export { StepIntoDebugScript } from './debug/step-into';
 export { StepOutDebugScript } from './debug/step-out';
 export { StepOverDebugScript } from './debug/step-over';
 export { StopDebugScript } from './debug/stop';
+export { StreamVariablesScript } from './debug/stream-variables';
 export { ThreadsDebugScript } from './debug/threads';
 export { DebugTrackerScript } from './debug/tracker';
 export { WaitForHitScript } from './debug/wait-for-hit';
@@ -5,6 +5,7 @@ import { QueryScript, RegisterScript } from '@script-base';
 import type { IBridgeContext } from '../../core/bridge-context/types';
 import { ScriptResult } from '@core/scripts/ScriptResult';
 import { ErrorCode } from '@core/response/errorTaxonomy';
+import { WorkspaceSymbolIndex } from '@core/util/symbol-resolver';
 
 /**
  * Symbol kind enum mapping for filtering
@@ -23,6 +24,10 @@ const KIND_NAMES = Object.fromEntries(
 /**
  * Symbol search query script
  * Supports workspace-wide search and document-level outline
+ *
+ * Workspace mode answers from the persistent WorkspaceSymbolIndex when it
+ * has symbols (source=auto), falling back to the workspace symbol provider
+ * when the index is empty or finds nothing. source=merge combines both.
  */
 @RegisterScript('search.symbol-search')
 export class SymbolSearchScript extends QueryScript<any> {
@@ -35,7 +40,9 @@ export class SymbolSearchScript extends QueryScript<any> {
             kinds: z.string().optional(),
             limit: z.coerce.number().int().min(1).max(1000).default(100),
             includeLocation: z.coerce.boolean().default(true),
-            includeContainer: z.coerce.boolean().default(true)
+            includeContainer: z.coerce.boolean().default(true),
+            source: z.enum(['auto', 'index', 'lsp', 'merge']).default('auto'),
+            match: z.enum(['fuzzy', 'prefix']).default('fuzzy')
         }).refine(data => {
             if (data.mode === 'document' && !data.path) {
                 throw new Error('path parameter required for document mode');
@@ -49,12 +56,11 @@ export class SymbolSearchScript extends QueryScript<any> {
             const vscode = bridgeContext.vscode;
 
             let rawSymbols: any[] = [];
+            let source: string | undefined;
+            let indexStats: any;
 
             if (params.mode === 'workspace') {
-                rawSymbols = (await vscode.commands.executeCommand(
-                    'vscode.executeWorkspaceSymbolProvider',
-                    params.query
-                ) as any[]) || [];
+                ({ rawSymbols, source, indexStats } = await this._searchWorkspace(vscode, params));
             } else if (params.mode === 'document') {
                 // Resolve relative path to absolute (supports workspace-relative paths)
                 let resolvedPath = params.path;
@@ -107,20 +113,76 @@ export class SymbolSearchScript extends QueryScript<any> {
             const statistics = this._calculateStatistics(filteredSymbols);
             const formattedSymbols = limitedSymbols.map((s: any) => this._formatSymbol(s, params.includeLocation, params.includeContainer));
 
-            return ScriptResult.success({
+            const result: any = {
                 mode: params.mode,
                 query: params.query,
                 filters: { kinds: appliedKinds, limit: params.limit },
                 results: { total, returned: formattedSymbols.length, truncated },
                 statistics,
                 symbols: formattedSymbols
-            });
+            };
+            if (source) {
+                result.source = source;
+            }
+            if (indexStats) {
+                result.index = indexStats;
+            }
+            return ScriptResult.success(result);
 
         } catch (error: any) {
             return ScriptResult.fromError(error, ErrorCode.E_OPERATION_FAILED);
         }
     }
 
+    /**
+     * Workspace symbols from the index, the workspace symbol provider, or both
+     */
+    private async _searchWorkspace(vscode: any, params: any): Promise<{ rawSymbols: any[]; source: string; indexStats?: any }> {
+        const queryProvider = async () => (await vscode.commands.executeCommand(
+            'vscode.executeWorkspaceSymbolProvider',
+            params.query
+        ) as any[]) || [];
+
+        if (params.source === 'lsp') {
+            return { rawSymbols: await queryProvider(), source: 'lsp' };
+        }
+
+        const index = WorkspaceSymbolIndex.getInstance();
+        await index.start();
+        if (params.source === 'index' && !index.isReady()) {
+            // First scan of this workspace: nothing persisted to answer from
+            await index.whenBuilt();
+        }
+
+        const kinds = params.kinds
+            ? params.kinds.split(',').map((k: string) => SYMBOL_KINDS[k.trim()]).filter((v: number | undefined) => v !== undefined)
+            : undefined;
+        const startTime = Date.now();
+        const indexed = index.search(params.query, { match: params.match, kinds });
+        const indexStats = { ...index.stats(), queryMs: Date.now() - startTime };
+
+        if (params.source === 'index') {
+            return { rawSymbols: indexed, source: 'index', indexStats };
+        }
+
+        if (params.source === 'auto') {
+            if (index.isReady() && indexed.length > 0) {
+                return { rawSymbols: indexed, source: 'index', indexStats };
+            }
+            return { rawSymbols: await queryProvider(), source: 'lsp', indexStats };
+        }
+
+        // merge: index results first, then provider results the index lacks
+        const seen = new Set(indexed.map(s => this._symbolKey(s)));
+        const live = (await queryProvider()).filter(s => !seen.has(this._symbolKey(s)));
+        return { rawSymbols: [...indexed, ...live], source: 'merge', indexStats };
+    }
+
+    private _symbolKey(symbol: any): string {
+        const uri = typeof symbol.location.uri === 'string' ? symbol.location.uri : symbol.location.uri.toString();
+        return `${uri}#${symbol.location.range.start.line}#${symbol.name}`;
+    }
+
     private _flattenDocumentSymbols(docSymbols: any[], uriString: string, container: string | null = null, result: any[] = []): any[] {
         for (const sym of docSymbols) {
             result.push({
@@ -5,10 +5,29 @@ import { ScriptResult } from '@core/scripts/ScriptResult';
 import { ErrorCode } from '@core/response/errorTaxonomy';
 import {
     resolveSymbolInput,
-    getLSPResultWithTimeout
+    getLSPResultWithTimeout,
+    getDocumentSymbolIndex,
+    buildFlowspaceId,
+    walkCallGraph,
+    mapWithConcurrency
 } from '@core/util/symbol-resolver';
 import * as vscode from 'vscode';
 
+/** Deepest call graph walk (levels below the target symbol) */
+const MAX_DEPTH = 5;
+
+/** Default node budget for depth > 1 */
+const DEFAULT_MAX_NODES = 200;
+
+/** Default wall-clock budget for depth > 1 */
+const DEFAULT_WALK_TIMEOUT_MS = 30000;
+
+/** Call hierarchy requests in flight at once during a walk */
+const WALK_CONCURRENCY = 4;
+
+/** Files whose document symbols are fetched at once during enrichment */
+const ENRICH_CONCURRENCY = 8;
+
 /**
  * Call hierarchy script - find incoming/outgoing calls using two-step LSP process
  *
@@ -20,6 +39,10 @@ import * as vscode from 'vscode';
  *
  * Key finding: Must use DocumentSymbol.selectionRange.start (identifier token position)
  * NOT range.start (entire declaration), as Pylance/Python LSP is position-sensitive.
+ *
+ * With depth > 1 the hierarchy is walked breadth-first (callers of callers, or
+ * callees of callees) and returned as a graph, each item expanded once.
+ * Flowspace ID enrichment fetches document symbols once per file, not per call.
  */
 @RegisterScript('symbol.calls')
 export class CallHierarchyScript extends QueryScript {
@@ -35,7 +58,14 @@ export class CallHierarchyScript extends QueryScript {
             direction: z.enum(['incoming', 'outgoing']).default('incoming'),
 
             // Optional: Enrich results with Flowspace IDs (slower)
-            enrichWithFlowspaceIds: z.boolean().optional().default(false)
+            enrichWithFlowspaceIds: z.boolean().optional().default(false),
+
+            // Optional: Walk the hierarchy this many levels deep (1 = direct calls only)
+            depth: z.coerce.number().int().min(1).max(MAX_DEPTH).optional().default(1),
+
+            // Budgets for depth > 1
+            maxNodes: z.coerce.number().int().min(1).max(5000).optional().default(DEFAULT_MAX_NODES),
+            timeoutMs: z.coerce.number().int().min(1000).max(120000).optional().default(DEFAULT_WALK_TIMEOUT_MS)
         }).refine(data => {
             // Validate: Must provide either nodeId OR (path AND symbol)
             const hasNodeId = !!data.nodeId;
@@ -62,6 +92,9 @@ export class CallHierarchyScript extends QueryScript {
         symbol?: string;
         direction: 'incoming' | 'outgoing';
         enrichWithFlowspaceIds?: boolean;
+        depth?: number;
+        maxNodes?: number;
+        timeoutMs?: number;
     }): Promise<any> {
         const vscodeApi = bridgeContext.vscode;
 
@@ -85,19 +118,17 @@ export class CallHierarchyScript extends QueryScript {
 
             // Step 2: Get DocumentSymbol to find selectionRange (identifier token position)
             // CRITICAL: Use selectionRange.start (not range.start) for position-sensitive LSPs
-            const symbols = await vscodeApi.commands.executeCommand<vscode.DocumentSymbol[]>(
-                'vscode.executeDocumentSymbolProvider',
-                resolution.uri
-            );
+            // Cached per document version, so this reuses resolveSymbolInput's fetch
+            const index = await getDocumentSymbolIndex(resolution.uri);
 
-            if (!symbols || symbols.length === 0) {
+            if (!index) {
                 const error: any = new Error('No document symbols available - LSP may not be ready');
                 error.code = 'E_NO_LANGUAGE_SERVER';
                 throw error;
             }
 
-            // Find target symbol at resolved position
-            const targetSymbol = this._findSymbolAtPosition(symbols, resolution.position);
+            // Find target symbol at resolved position (innermost containing symbol)
+            const targetSymbol = index.innermostAt(resolution.position);
 
             if (!targetSymbol) {
                 const error: any = new Error(`No symbol found at resolved position in ${resolution.uri.fsPath}`);
@@ -128,6 +159,17 @@ export class CallHierarchyScript extends QueryScript {
                 throw error;
             }
 
+            const depth = params.depth ?? 1;
+            if (depth > 1) {
+                return await this._walkCalls(vscodeApi, resolution.symbol, hierarchyItems[0], {
+                    direction: params.direction,
+                    depth,
+                    maxNodes: params.maxNodes ?? DEFAULT_MAX_NODES,
+                    timeoutMs: params.timeoutMs ?? DEFAULT_WALK_TIMEOUT_MS,
+                    enrichWithFlowspaceIds: params.enrichWithFlowspaceIds || false
+                });
+            }
+
             // Step 3b: provideIncomingCalls or provideOutgoingCalls (Second LSP call)
             const calls = await this._provideCalls(
                 vscodeApi,
@@ -147,12 +189,10 @@ export class CallHierarchyScript extends QueryScript {
             }
 
             // Step 4: Format results
-            const formattedCalls = await this._formatCalls(
-                vscodeApi,
-                calls,
-                params.direction,
-                params.enrichWithFlowspaceIds || false
-            );
+            const nodeIds = params.enrichWithFlowspaceIds
+                ? await this._buildFlowspaceIds((calls as any[]).map(call => call.from || call.to))
+                : undefined;
+            const formattedCalls = this._formatCalls(calls, params.direction, nodeIds);
 
             return ScriptResult.success({
                 symbol: resolution.symbol,
@@ -166,49 +206,6 @@ export class CallHierarchyScript extends QueryScript {
         }
     }
 
-    /**
-     * Find symbol at specified position using hierarchical search
-     * @private
-     */
-    private _findSymbolAtPosition(symbols: vscode.DocumentSymbol[], position: vscode.Position): vscode.DocumentSymbol | null {
-        const findInSymbols = (syms: vscode.DocumentSymbol[]): vscode.DocumentSymbol | null => {
-            for (const sym of syms) {
-                // Check if position is within this symbol's range
-                if (this._containsPosition(sym.range, position)) {
-                    // Check children first (more specific match)
-                    if (sym.children && sym.children.length > 0) {
-                        const childMatch = findInSymbols(sym.children);
-                        if (childMatch) {
-                            return childMatch;
-                        }
-                    }
-                    // Return this symbol if no child match
-                    return sym;
-                }
-            }
-            return null;
-        };
-
-        return findInSymbols(symbols);
-    }
-
-    /**
-     * Check if range contains position
-     * @private
-     */
-    private _containsPosition(range: vscode.Range, position: vscode.Position): boolean {
-        if (position.line < range.start.line || position.line > range.end.line) {
-            return false;
-        }
-        if (position.line === range.start.line && position.character < range.start.character) {
-            return false;
-        }
-        if (position.line === range.end.line && position.character > range.end.character) {
-            return false;
-        }
-        return true;
-    }
-
     /**
      * Step 3a: Execute prepareCallHierarchy with timeout protection
      * @private
@@ -262,21 +259,101 @@ export class CallHierarchyScript extends QueryScript {
     }
 
     /**
-     * Format call hierarchy results
+     * Walk the call hierarchy breadth-first below the prepared item
      * @private
      */
-    private async _formatCalls(
+    private async _walkCalls(
         vscodeApi: typeof vscode,
+        symbol: string,
+        root: vscode.CallHierarchyItem,
+        options: {
+            direction: 'incoming' | 'outgoing';
+            depth: number;
+            maxNodes: number;
+            timeoutMs: number;
+            enrichWithFlowspaceIds: boolean;
+        }
+    ): Promise<any> {
+        const { direction } = options;
+        const graph = await walkCallGraph<vscode.CallHierarchyItem, any>(
+            root,
+            async item => (await this._provideCalls(vscodeApi, item, direction)) || [],
+            call => call.from || call.to,
+            {
+                maxDepth: options.depth,
+                maxNodes: options.maxNodes,
+                timeoutMs: options.timeoutMs,
+                concurrency: WALK_CONCURRENCY,
+                key: item => `${item.uri.toString()}#${item.selectionRange.start.line}:${item.selectionRange.start.character}`
+            }
+        );
+
+        const nodeIds = options.enrichWithFlowspaceIds
+            ? await this._buildFlowspaceIds(graph.nodes.map(node => node.item))
+            : undefined;
+
+        // Level 1 keeps the depth = 1 shape
+        const calls = this._formatCalls(graph.nodes[0].calls || [], direction, nodeIds);
+
+        const nodes = graph.nodes.map(node => {
+            const formatted: any = {
+                id: node.id,
+                name: node.item.name,
+                kind: vscode.SymbolKind[node.item.kind],
+                file: node.item.uri.fsPath,
+                line: node.item.range.start.line,
+                character: node.item.range.start.character,
+                depth: node.depth,
+                expanded: node.calls !== undefined
+            };
+            const nodeId = nodeIds?.get(node.item);
+            if (nodeId) {
+                formatted.nodeId = nodeId;
+            }
+            if (node.error) {
+                formatted.error = node.error;
+            }
+            return formatted;
+        });
+
+        // Edges always point caller -> callee, whichever direction was walked
+        const edges = graph.edges.map(edge => ({
+            caller: direction === 'incoming' ? edge.to : edge.from,
+            callee: direction === 'incoming' ? edge.from : edge.to,
+            callSites: this._formatCallSites(edge.call.fromRanges || [])
+        }));
+
+        const result: any = {
+            symbol,
+            direction,
+            depth: options.depth,
+            calls,
+            totalCalls: calls.length,
+            graph: {
+                nodes,
+                edges,
+                totalNodes: nodes.length,
+                totalEdges: edges.length
+            }
+        };
+        if (graph.truncated) {
+            result.truncated = graph.truncated;
+        }
+        return ScriptResult.success(result);
+    }
+
+    /**
+     * Format call hierarchy results
+     * @private
+     */
+    private _formatCalls(
         calls: vscode.CallHierarchyIncomingCall[] | vscode.CallHierarchyOutgoingCall[],
         direction: 'incoming' | 'outgoing',
-        enrichWithFlowspaceIds: boolean
-    ): Promise<any[]> {
-        const formatted: any[] = [];
-
-        for (const call of calls) {
+        nodeIds?: Map<vscode.CallHierarchyItem, string>
+    ): any[] {
+        return (calls as any[]).map(call => {
             // incoming uses 'from', outgoing uses 'to'
-            const item = (call as any).from || (call as any).to;
-            const ranges = (call as any).fromRanges || [];
+            const item: vscode.CallHierarchyItem = call.from || call.to;
 
             const callInfo: any = {
                 [direction === 'incoming' ? 'caller' : 'callee']: item.name,
@@ -284,31 +361,71 @@ export class CallHierarchyScript extends QueryScript {
                 file: item.uri.fsPath,
                 line: item.range.start.line,
                 character: item.range.start.character,
-                callSites: ranges.map((r: vscode.Range) => ({
-                    line: r.start.line,
-                    character: r.start.character,
-                    endLine: r.end.line,
-                    endCharacter: r.end.character
-                }))
+                callSites: this._formatCallSites(call.fromRanges || [])
             };
 
-            // Optional: Enrich with Flowspace ID (adds overhead)
-            if (enrichWithFlowspaceIds) {
-                try {
-                    const { buildFlowspaceIdAtPosition } = await import('@core/util/symbol-resolver');
-                    const nodeId = await buildFlowspaceIdAtPosition(item.uri, item.range.start);
-                    if (nodeId) {
-                        callInfo.nodeId = nodeId;
-                    }
-                } catch {
-                    // Enrichment is optional - continue without it
-                }
+            const nodeId = nodeIds?.get(item);
+            if (nodeId) {
+                callInfo.nodeId = nodeId;
             }
 
-            formatted.push(callInfo);
+            return callInfo;
+        });
+    }
+
+    /**
+     * @private
+     */
+    private _formatCallSites(ranges: vscode.Range[]): any[] {
+        return ranges.map(r => ({
+            line: r.start.line,
+            character: r.start.character,
+            endLine: r.end.line,
+            endCharacter: r.end.character
+        }));
+    }
+
+    /**
+     * Flowspace IDs for call hierarchy items, fetching document symbols once
+     * per file (files in parallel). Items without a resolvable symbol are
+     * left out - enrichment is optional.
+     * @private
+     */
+    private async _buildFlowspaceIds(
+        items: vscode.CallHierarchyItem[]
+    ): Promise<Map<vscode.CallHierarchyItem, string>> {
+        const byFile = new Map<string, vscode.CallHierarchyItem[]>();
+        for (const item of items) {
+            const key = item.uri.toString();
+            const group = byFile.get(key);
+            if (group) {
+                group.push(item);
+            } else {
+                byFile.set(key, [item]);
+            }
         }
 
-        return formatted;
+        const nodeIds = new Map<vscode.CallHierarchyItem, string>();
+        await mapWithConcurrency([...byFile.values()], ENRICH_CONCURRENCY, async group => {
+            const uri = group[0].uri;
+            try {
+                const index = await getDocumentSymbolIndex(uri);
+                if (!index) {
+                    return;
+                }
+                for (const item of group) {
+                    // Same lookup as buildFlowspaceIdAtPosition(item.uri, item.range.start)
+                    const symbol = index.atSelection(item.range.start);
+                    if (symbol) {
+                        nodeIds.set(item, buildFlowspaceId(uri.fsPath, symbol, index.symbols));
+                    }
+                }
+            } catch {
+                // Enrichment is optional - continue without it
+            }
+        });
+
+        return nodeIds;
     }
 
     /**
@@ -4,12 +4,14 @@ import type { IBridgeContext } from '../../core/bridge-context/types';
 import { ScriptResult } from '@core/scripts/ScriptResult';
 import { ErrorCode } from '@core/response/errorTaxonomy';
 import { waitUntilPausedAndGetLocation } from '@core/debug/debug-polling-helpers';
+import { DebugEventHub } from '@core/debug/event-hub';
 
 /**
  * Debug single test waitable script
  * Debugs a single test at specified file location using VS Code Testing API
  *
- * Uses standardized polling approach for consistent outcome detection.
+ * Waits for the session to start and then for its first stop via debug
+ * events (DebugEventHub), with polling only as a fallback.
  */
 @RegisterScript('test.debug-single')
 export class DebugSingleTestScript extends WaitableScript<any> {
@@ -69,6 +71,11 @@ export class DebugSingleTestScript extends WaitableScript<any> {
             }
 
             // Phase 1: Execute testing.debugAtCursor to start debug session
+            // Listen for the session and take the hub cursor first, so neither
+            // the session start nor an early breakpoint hit can be missed
+            const sessionStarted = this.waitForSession(vscode, params.timeoutMs, outputChannel);
+            const after = DebugEventHub.instance.cursor();
+
             // NOTE: testing.debugAtCursor blocks until debug completes, so don't await
             vscode.commands.executeCommand('testing.debugAtCursor');
 
@@ -76,32 +83,9 @@ export class DebugSingleTestScript extends WaitableScript<any> {
                 outputChannel.appendLine('[tests.debug-single] Fired testing.debugAtCursor (non-blocking)');
             }
 
-            // Poll for session to appear (languages take different startup times)
+            // Wait for session to appear (languages take different startup times)
             // Python: ~500ms, Jest: ~1.5s, C#: ~2-4s
-            let session = null;
-            const pollInterval = 100;
-            const maxPolls = Math.ceil(params.timeoutMs / pollInterval);
-            let pollCount = 0;
-
-            while (!session && pollCount < maxPolls) {
-                await new Promise(resolve => setTimeout(resolve, pollInterval));
-                session = vscode.debug.activeDebugSession;
-                pollCount++;
-
-                // Provide helpful feedback at intervals
-                if (pollCount === 50 && outputChannel) { // After 5 seconds
-                    outputChannel.appendLine(
-                        `[tests.debug-single] Still waiting for debug session (5s elapsed)... ` +
-                        `If this continues, check Test Explorer to verify test is discovered.`
-                    );
-                }
-                if (pollCount === 150 && outputChannel) { // After 15 seconds
-                    outputChannel.appendLine(
-                        `[tests.debug-single] WARNING: Still no debug session after 15s. ` +
-                        `This usually means test discovery hasn't completed. Check Test Explorer.`
-                    );
-                }
-            }
+            const session = await sessionStarted;
 
             if (!session) {
                 const error: any = new Error(
@@ -132,13 +116,14 @@ export class DebugSingleTestScript extends WaitableScript<any> {
                 );
             }
 
-            // Phase 2: Wait for outcome using standardized polling helper
-            // Use useActiveSession=true to dynamically query the active session each poll
-            // (the session object might become stale after testing.debugAtCursor)
+            // Phase 2: Wait for outcome using the standard stop-detection helper
+            // Use useActiveSession=true to accept stops from child sessions and to query
+            // the active session when polling (the session object might become stale
+            // after testing.debugAtCursor)
             if (outputChannel) {
                 outputChannel.appendLine(`[tests.debug-single] Calling waitUntilPausedAndGetLocation with session ${session.id}, useActiveSession=true`);
             }
-            const result = await waitUntilPausedAndGetLocation(session, params.timeoutMs, vscode, true);
+            const result = await waitUntilPausedAndGetLocation(session, params.timeoutMs, vscode, true, { after });
             if (outputChannel) {
                 outputChannel.appendLine(`[tests.debug-single] waitUntilPausedAndGetLocation returned: ${JSON.stringify(result)}`);
             }
@@ -186,6 +171,37 @@ export class DebugSingleTestScript extends WaitableScript<any> {
             return ScriptResult.fromError(error, ErrorCode.E_OPERATION_FAILED);
         }
     }
+
+    /**
+     * Resolve with the first debug session to start, or null after timeoutMs
+     */
+    private waitForSession(vscode: any, timeoutMs: number, outputChannel: any): Promise<any> {
+        return new Promise(resolve => {
+            const timers: any[] = [];
+            let listener: any;
+
+            const finish = (session: any) => {
+                timers.forEach(clearTimeout);
+                listener?.dispose();
+                resolve(session);
+            };
+
+            listener = vscode.debug.onDidStartDebugSession((session: any) => finish(session));
+            timers.push(setTimeout(() => finish(null), timeoutMs));
+
+            // Provide helpful feedback at intervals
+            if (outputChannel) {
+                timers.push(setTimeout(() => outputChannel.appendLine(
+                    `[tests.debug-single] Still waiting for debug session (5s elapsed)... ` +
+                    `If this continues, check Test Explorer to verify test is discovered.`
+                ), 5000));
+                timers.push(setTimeout(() => outputChannel.appendLine(
+                    `[tests.debug-single] WARNING: Still no debug session after 15s. ` +
+                    `This usually means test discovery hasn't completed. Check Test Explorer.`
+                ), 15000));
+            }
+        });
+    }
 }
 
 export default DebugSingleTestScript;
@@ -0,0 +1,159 @@
+/**
+ * @fileoverview Debug Event Hub Tests
+ *
+ * Tests for DebugEventHub.waitForStop() and the event-driven stop detection in
+ * debug-polling-helpers built on it.
+ *
+ * ## Testing Philosophy
+ * - **Fake adapter**: A vscode mock captures the tracker factory; tests send DAP
+ *   events through the trackers like a debug adapter would
+ * - **No lost stops**: A stop that arrives between cursor() and the wait counts
+ * - **Session trees**: Child-session stops reach the parent's waiters; 'tree'
+ *   scope also accepts siblings
+ * - **Latency**: Step helpers report detection via events, not the poll fallback
+ */
+
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
+
+const adapter = vi.hoisted(() => ({ factory: undefined as any }));
+
+vi.mock('vscode', () => {
+  const noop = { dispose: () => undefined };
+  return {
+    debug: {
+      onDidStartDebugSession: () => noop,
+      onDidTerminateDebugSession: () => noop,
+      onDidReceiveDebugSessionCustomEvent: () => noop,
+      registerDebugAdapterTrackerFactory: (_type: string, factory: any) => {
+        adapter.factory = factory;
+        return noop;
+      }
+    }
+  };
+});
+
+import { DebugEventHub } from '../../../src/core/debug/event-hub';
+import { waitForStoppedEventAndGetLocation } from '../../../src/core/debug/debug-polling-helpers';
+
+function fakeSession(id: string, parentSession?: any) {
+  const session: any = {
+    id,
+    type: 'python',
+    parentSession,
+    requests: [] as string[],
+    customRequest: async (command: string) => {
+      session.requests.push(command);
+      if (command === 'stackTrace') {
+        return { stackFrames: [{ id: 1, name: 'add', line: 7, column: 1, source: { path: '/w/calc.py' } }] };
+      }
+      return { threads: [{ id: 1, name: 'main' }] };
+    }
+  };
+  session.tracker = adapter.factory.createDebugAdapterTracker(session);
+  session.send = (event: string, body: any = {}) => session.tracker.onDidSendMessage({ type: 'event', event, body });
+  return session;
+}
+
+describe('DebugEventHub.waitForStop', () => {
+  let hub: DebugEventHub;
+
+  beforeEach(() => {
+    hub = DebugEventHub.instance;
+    hub.install();
+  });
+
+  afterEach(() => {
+    hub.dispose();
+  });
+
+  it('accepts stops recorded after the cursor, even before the wait starts', async () => {
+    const session = fakeSession('s1');
+    session.send('stopped', { reason: 'entry', threadId: 1 });
+
+    const cursor = hub.cursor();
+    session.send('output', { category: 'stdout', output: 'hello\n' });
+    session.send('stopped', { reason: 'step', threadId: 1 });
+
+    const stop = await hub.waitForStop({ session, after: cursor, timeoutMs: 100 });
+    expect(stop?.outcome).toMatchObject({ kind: 'stopped', reason: 'step', threadId: 1 });
+    expect(stop!.seq).toBeGreaterThan(cursor);
+  });
+
+  it('wakes a waiter when the adapter reports the stop', async () => {
+    const session = fakeSession('s1');
+    const waiting = hub.waitForStop({ session, timeoutMs: 1000 });
+
+    session.send('continued', { threadId: 1 });
+    session.send('stopped', { reason: 'breakpoint', threadId: 1 });
+
+    expect((await waiting)?.outcome.kind).toBe('stopped');
+  });
+
+  it('scopes waits to the session or its whole tree', async () => {
+    const parent = fakeSession('parent');
+    const child = fakeSession('child', parent);
+    const sibling = fakeSession('sibling', parent);
+    const cursor = hub.cursor();
+
+    sibling.send('terminated');
+    child.send('stopped', { reason: 'breakpoint', threadId: 3 });
+
+    const own = await hub.waitForStop({ session: child, after: cursor, scope: 'session', timeoutMs: 50 });
+    expect(own?.sessionId).toBe('child');
+
+    const viaParent = await hub.waitForStop({ session: parent, after: cursor, scope: 'session', timeoutMs: 50 });
+    expect(viaParent?.sessionId).toBe('child');
+
+    // The child's stop reaches a sibling only through 'tree' waits
+    const fromSibling = await hub.waitForStop({ session: sibling, after: cursor, scope: 'tree', timeoutMs: 50 });
+    expect(fromSibling?.sessionId).toBe('child');
+    const siblingOnly = await hub.waitForStop({ session: sibling, after: cursor + 1, scope: 'session', timeoutMs: 50 });
+    expect(siblingOnly).toBeUndefined();
+  });
+
+  it('resolves undefined on timeout and abort', async () => {
+    const session = fakeSession('s1');
+    expect(await hub.waitForStop({ session, timeoutMs: 10 })).toBeUndefined();
+
+    const controller = new AbortController();
+    const waiting = hub.waitForStop({ session, timeoutMs: 10000, signal: controller.signal });
+    controller.abort();
+    expect(await waiting).toBeUndefined();
+  });
+});
+
+describe('waitForStoppedEventAndGetLocation', () => {
+  beforeEach(() => {
+    DebugEventHub.instance.install();
+  });
+
+  afterEach(() => {
+    DebugEventHub.instance.dispose();
+  });
+
+  it('returns the location from the stopped event without polling', async () => {
+    const session = fakeSession('s1');
+
+    const result: any = await waitForStoppedEventAndGetLocation(session, 1, undefined, async () => {
+      session.send('stopped', { reason: 'step', threadId: 1 });
+    }, 2000);
+
+    expect(result).toMatchObject({ event: 'stopped', file: '/w/calc.py', line: 7, threadId: 1, sessionId: 's1' });
+    expect(result.stopDetection.via).toBe('event');
+    expect(result.stopDetection.waitMs).toBeLessThanOrEqual(50);
+    // The stopped thread is known: one stackTrace, no thread scan
+    expect(session.requests).toEqual(['stackTrace']);
+  });
+
+  it('reports termination and times out with E_NOT_STOPPED', async () => {
+    const session = fakeSession('s1');
+
+    const ended: any = await waitForStoppedEventAndGetLocation(session, 1, undefined, async () => {
+      session.send('exited', { exitCode: 3 });
+    }, 2000);
+    expect(ended).toMatchObject({ event: 'terminated', sessionId: 's1', exitCode: 3 });
+
+    const stuck: any = await waitForStoppedEventAndGetLocation(session, 1, undefined, async () => undefined, 20);
+    expect(stuck).toMatchObject({ event: 'error', code: 'E_NOT_STOPPED' });
+  });
+});
@@ -0,0 +1,223 @@
+/**
+ * @fileoverview Output Log Tests
+ *
+ * Tests for OutputLog, the chunked storage behind CapturedSession.outputs.
+ *
+ * ## Testing Philosophy
+ * - **Array parity**: Reads behave like the OutputEvent[] the dap.* scripts used to get
+ * - **Ring eviction**: Oldest chunks go first and every drop is counted
+ * - **Index parity**: Aggregates and indexed scans agree with a full pass
+ * - **Stable paging**: Sequence-bounded scans resume correctly across evictions
+ */
+
+import { describe, it, expect } from 'vitest';
+import { OutputLog, estimateEventBytes, requiredLiterals } from '../../../src/core/debug/output-log';
+import { decodeOutputCursor, encodeOutputCursor } from '../../../src/core/debug/output-cursor';
+import type { OutputEvent } from '../../../src/core/debug/debug-session-capture';
+
+function event(i: number, extra: Partial<OutputEvent> = {}): OutputEvent {
+  return { ts: 1000 + i, category: i % 2 ? 'stderr' : 'stdout', text: `line ${i}\n`, ...extra };
+}
+
+describe('OutputLog', () => {
+  it('round-trips events across chunk boundaries', () => {
+    const log = new OutputLog();
+    const events = Array.from({ length: 600 }, (_, i) => event(i));
+    events[3] = event(3, { source: { path: '/src/app.py', name: 'app.py' }, line: 12, column: 0 });
+    events.forEach(e => log.append(e));
+
+    expect(log.length).toBe(600);
+    expect(log.toArray()).toEqual(events);
+    expect(log.at(3)).toEqual(events[3]);
+    expect(log.at(-1)).toEqual(events[599]);
+    expect(log.at(600)).toBeUndefined();
+    expect(log.slice(250, 260)).toEqual(events.slice(250, 260));
+    expect(log.slice(-3)).toEqual(events.slice(-3));
+    expect(log.filter(e => e.category === 'stderr')).toHaveLength(300);
+    expect([...log]).toHaveLength(600);
+    expect(JSON.parse(JSON.stringify(log))).toEqual(events);
+  });
+
+  it('interns sources and drops unreported source fields', () => {
+    const log = new OutputLog();
+    const source = { path: '/src/app.py', name: 'app.py', sourceReference: 7, adapterData: { big: true } } as any;
+    log.append(event(0, { source }));
+    log.append(event(1, { source: { ...source } }));
+
+    expect(log.at(0)!.source).toEqual({ path: '/src/app.py', name: 'app.py' });
+    expect(log.at(0)!.source).toBe(log.at(1)!.source);
+  });
+
+  it('evicts the oldest chunk and counts what was dropped', () => {
+    const log = new OutputLog();
+    for (let i = 0; i < 600; i++) log.append(event(i));
+    const bytes = log.bytes;
+
+    const freed = log.evictOldest();
+
+    expect(log.dropped).toBe(256);
+    expect(log.firstSeq).toBe(256);
+    expect(log.nextSeq).toBe(600);
+    expect(log.at(0)).toEqual(event(256));
+    expect(log.bytes).toBe(bytes - freed);
+    expect(log.droppedBytes).toBe(freed);
+  });
+
+  it('accounts bytes from text length', () => {
+    const log = new OutputLog();
+    const added = log.append(event(0, { text: 'x'.repeat(100) }));
+
+    expect(added).toBe(estimateEventBytes('x'.repeat(100)));
+    expect(log.chars).toBe(100);
+  });
+
+  it('keeps aggregates in step with appends and evictions', () => {
+    const log = new OutputLog();
+    const HOUR = 60 * 60 * 1000;
+    for (let i = 0; i < 600; i++) {
+      log.append(event(i, {
+        ts: i < 300 ? 0 : HOUR,
+        source: i % 3 === 0 ? { path: '/src/a.py' } : undefined
+      }));
+    }
+
+    expect(log.countByCategory()).toEqual({ stdout: 300, stderr: 300 });
+    expect(log.countBySource()).toEqual({ '/src/a.py': 200 });
+    expect(log.countByHour()).toEqual([[0, 300], [HOUR, 300]]);
+
+    log.evictOldest();
+    const remaining = log.toArray();
+    expect(log.countByCategory()).toEqual({
+      stdout: remaining.filter(e => e.category === 'stdout').length,
+      stderr: remaining.filter(e => e.category === 'stderr').length
+    });
+    expect(log.countByHour()).toEqual([[0, 44], [HOUR, 300]]);
+    expect(log.countBySecond()[0][1]).toEqual({ outputs: 44, stderr: 22 });
+  });
+
+  it('tracks the most frequent messages', () => {
+    const log = new OutputLog();
+    for (let i = 0; i < 500; i++) {
+      log.append(event(i, { text: i % 5 === 0 ? 'heartbeat\n' : `unique ${i}\n` }));
+    }
+
+    const [top] = log.topMessages().sort((a, b) => b[1] - a[1]);
+    expect(top[0]).toBe('heartbeat\n');
+    expect(top[1]).toBeGreaterThanOrEqual(100);
+  });
+
+  it('skips chunks that cannot contain a literal and agrees with a full scan', () => {
+    const log = new OutputLog();
+    for (let i = 0; i < 2000; i++) {
+      log.append(event(i, { text: i === 1500 ? 'Traceback: KeyError foo\n' : `tick ${i}\n` }));
+    }
+    const regex = /keyerror\s+foo/i;
+
+    const matches: number[] = [];
+    const stats = log.scan(
+      { literals: requiredLiterals(regex.source), match: text => regex.test(text) },
+      (_, index) => { matches.push(index); }
+    );
+
+    expect(matches).toEqual([1500]);
+    expect(log.toArray().filter(e => regex.test(e.text))).toHaveLength(1);
+    expect(stats.chunksSkipped).toBeGreaterThan(0);
+    expect(stats.chunksScanned + stats.chunksSkipped).toBe(Math.ceil(2000 / 256));
+  });
+
+  it('prunes scans by category and time range', () => {
+    const log = new OutputLog();
+    for (let i = 0; i < 600; i++) log.append(event(i));
+
+    const seen: number[] = [];
+    log.scan({ categories: ['stderr'], since: 1100, until: 1105 }, e => { seen.push(e.ts); });
+    expect(seen).toEqual([1101, 1103, 1105]);
+
+    const none = log.scan({ categories: ['never-seen'] }, () => { throw new Error('unexpected'); });
+    expect(none.chunksScanned).toBe(0);
+  });
+
+  it('pages forward and backward by sequence number', () => {
+    const log = new OutputLog();
+    for (let i = 0; i < 600; i++) log.append(event(i));
+
+    const forward: number[] = [];
+    log.scan({ fromSeq: 250, toSeq: 260 }, (_, index) => { forward.push(log.firstSeq + index); });
+    expect(forward).toEqual([250, 251, 252, 253, 254, 255, 256, 257, 258, 259]);
+
+    const backward: number[] = [];
+    log.scan({ toSeq: 260, backward: true }, (_, index) => {
+      backward.push(log.firstSeq + index);
+      return backward.length < 3;
+    });
+    expect(backward).toEqual([259, 258, 257]);
+  });
+
+  it('resumes from an evicted position at the oldest retained event', () => {
+    const log = new OutputLog();
+    for (let i = 0; i < 600; i++) log.append(event(i));
+    log.evictOldest();
+
+    const seen: number[] = [];
+    log.scan({ fromSeq: 10 }, e => {
+      seen.push(e.ts - 1000);
+      return false;
+    });
+    expect(seen).toEqual([256]);
+
+    const none = log.scan({ toSeq: 10, backward: true }, () => { throw new Error('unexpected'); });
+    expect(none.chunksScanned).toBe(0);
+  });
+});
+
+describe('requiredLiterals', () => {
+  it('extracts top-level literal runs', () => {
+    expect(requiredLiterals('KeyError: \\w+ not found')).toEqual(['keyerror: ', ' not found']);
+    expect(requiredLiterals('timeout.*retry')).toEqual(['timeout', 'retry']);
+    expect(requiredLiterals('colou?r')).toEqual(['colo']);
+    expect(requiredLiterals('file\\.py')).toEqual(['file.py']);
+  });
+
+  it('gives up on alternation and ignores groups', () => {
+    expect(requiredLiterals('error|warn')).toEqual([]);
+    expect(requiredLiterals('(foo)?barbaz')).toEqual(['barbaz']);
+    expect(requiredLiterals('[abc]+x')).toEqual([]);
+  });
+
+  it('does not treat escape payloads as literal text', () => {
+    expect(requiredLiterals('\\x41bcd')).toEqual(['bcd']);
+    expect(requiredLiterals('\\u0041pple')).toEqual(['pple']);
+    expect(requiredLiterals('\\u{1F600}smile')).toEqual(['smile']);
+    expect(requiredLiterals('\\cJnext')).toEqual(['next']);
+    expect(requiredLiterals('\\p{Lu}upper')).toEqual(['upper']);
+    expect(requiredLiterals('(?<q>.)abc\\k<q>')).toEqual(['abc']);
+    expect(requiredLiterals('(a)xyz\\12345')).toEqual(['xyz']);
+
+    // Every literal really is in the text each pattern matches
+    const cases: Array<[string, string]> = [
+      ['\\x41bcd', 'Abcd'],
+      ['\\u0041pple', 'Apple'],
+      ['\\cJnext', '\nnext']
+    ];
+    for (const [pattern, text] of cases) {
+      expect(new RegExp(pattern).test(text)).toBe(true);
+      for (const literal of requiredLiterals(pattern)) {
+        expect(text.toLowerCase()).toContain(literal);
+      }
+    }
+  });
+});
+
+describe('output cursors', () => {
+  it('round-trips session and sequence number', () => {
+    const token = encodeOutputCursor({ sessionId: 'session-1', seq: 4096 });
+
+    expect(token).toMatch(/^[A-Za-z0-9_-]+$/);
+    expect(decodeOutputCursor(token)).toEqual({ sessionId: 'session-1', seq: 4096 });
+  });
+
+  it('rejects tokens it did not produce', () => {
+    expect(decodeOutputCursor('not-a-cursor')).toBeUndefined();
+    expect(decodeOutputCursor(Buffer.from('{"s":"x","q":-1}').toString('base64url'))).toBeUndefined();
+  });
+});
@@ -0,0 +1,97 @@
+/**
+ * @fileoverview Compiled Module Cache Tests
+ *
+ * Tests for CompiledModuleCache and the dynamic script loaders that use it.
+ *
+ * ## Testing Philosophy
+ * - **LRU**: Recently used entries survive; the least recently used are evicted
+ * - **Versions**: A changed version (edited file) is a stale miss and recompiles
+ * - **Fresh modules**: Cached compiles still give each run its own module state
+ * - **Disk edits**: loadModuleFromDisk reloads a file as soon as it changes
+ */
+
+import { describe, it, expect } from 'vitest';
+import * as fs from 'fs';
+import * as os from 'os';
+import * as path from 'path';
+import { CompiledModuleCache, hashSource } from '../../../src/core/dynamic/compiledModuleCache';
+import { loadDynamicModule, dynamicModuleCacheStats } from '../../../src/core/dynamic/loadDynamicModule';
+import { loadModuleFromDisk } from '../../../src/core/registry/dynamicLoader';
+
+describe('CompiledModuleCache', () => {
+    it('compiles once per key and evicts the least recently used', () => {
+        const cache = new CompiledModuleCache<string>(2);
+        const compiled: string[] = [];
+        const compile = (key: string) => () => {
+            compiled.push(key);
+            return key.toUpperCase();
+        };
+
+        expect(cache.get('a', compile('a'))).toBe('A');
+        cache.get('b', compile('b'));
+        expect(cache.get('a', compile('a'))).toBe('A');
+        cache.get('c', compile('c'));   // evicts b, not the recently used a
+        cache.get('a', compile('a'));
+        cache.get('b', compile('b'));
+
+        expect(compiled).toEqual(['a', 'b', 'c', 'b']);
+        expect(cache.stats()).toMatchObject({ hits: 2, misses: 4, evictions: 2, entries: 2, hitRate: 2 / 6 });
+    });
+
+    it('recompiles when the version changes and never caches failures', () => {
+        const cache = new CompiledModuleCache<number>();
+        let builds = 0;
+
+        cache.get('file', () => ++builds, 'v1');
+        cache.get('file', () => ++builds, 'v1');
+        expect(cache.get('file', () => ++builds, 'v2')).toBe(2);
+
+        expect(() => cache.get('broken', () => { throw new SyntaxError('Unexpected token'); })).toThrow();
+        expect(cache.get('broken', () => 7)).toBe(7);
+        expect(cache.stats()).toMatchObject({ hits: 1, misses: 4, stale: 1 });
+    });
+
+    it('hashes content and salt', () => {
+        expect(hashSource('x')).toBe(hashSource('x'));
+        expect(hashSource('x', '/a')).not.toBe(hashSource('x', '/b'));
+    });
+});
+
+describe('loadDynamicModule', () => {
+    it('reuses the compiled source but gives every run a fresh module', () => {
+        const source = `
+            let calls = 0;
+            export default async function(bridgeContext, params) {
+                calls++;
+                return { calls };
+            }
+        `;
+        const before = dynamicModuleCacheStats();
+
+        const first = loadDynamicModule(source);
+        const second = loadDynamicModule(source);
+
+        expect(first).not.toBe(second);
+        const after = dynamicModuleCacheStats();
+        expect(after.misses - before.misses).toBe(1);
+        expect(after.hits - before.hits).toBe(1);
+    });
+});
+
+describe('loadModuleFromDisk', () => {
+    it('reuses an unchanged file and reloads an edited one', async () => {
+        const dir = fs.mkdtempSync(path.join(os.tmpdir(), 'dynamic-loader-'));
+        const file = path.join(dir, 'script.js');
+        try {
+            fs.writeFileSync(file, 'module.exports = { version: 1 };');
+            const first = await loadModuleFromDisk(file);
+            expect(await loadModuleFromDisk(file)).toBe(first);
+
+            fs.writeFileSync(file, 'module.exports = { version: 22 };');
+            const edited = await loadModuleFromDisk(file);
+            expect(edited.version).toBe(22);
+        } finally {
+            fs.rmSync(dir, { recursive: true, force: true });
+        }
+    });
+});
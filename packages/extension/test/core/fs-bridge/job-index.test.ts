@@ -0,0 +1,161 @@
+/**
+ * @fileoverview Job State Index Tests
+ *
+ * Tests for JobIndex, the in-memory picture of execute/ that replaces the
+ * repeated directory walks in the safety scan, GC, stats and recovery paths.
+ *
+ * ## Testing Philosophy
+ * - **Real filesystem**: Job directories in a temp dir, no filesystem mocks
+ * - **Equivalence**: Indexed lookups must agree with the original walks
+ * - **In-process updates**: Claim/done/DLQ writes are visible without a rescan
+ */
+
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
+import * as fs from 'fs';
+import * as os from 'os';
+import * as path from 'path';
+import {
+  JobIndex,
+  jobState,
+  registerJobIndex,
+  unregisterJobIndex,
+  getJobIndex,
+  listJobCandidates
+} from '../../../src/core/fs-bridge/job-index';
+import { claimJobAtomic, writeDone } from '../../../src/core/fs-bridge/processor';
+import { scanForUnclaimedJobs } from '../../../src/core/fs-bridge/scanner';
+import { cleanOldJobs, getJobStats } from '../../../src/core/fs-bridge/cleaner';
+import { NodeFilesystem } from '../../../src/core/fs-bridge/fs-abstraction';
+
+// scanner/cleaner load fs-abstraction, which imports vscode (unused with NodeFilesystem)
+vi.mock('vscode', () => ({}));
+
+/**
+ * Create a job directory with the given marker files
+ */
+function makeJob(executeDir: string, id: string, markers: string[]): string {
+  const jobDir = path.join(executeDir, id);
+  fs.mkdirSync(jobDir, { recursive: true });
+  for (const marker of markers) {
+    fs.writeFileSync(path.join(jobDir, marker), marker.endsWith('.json') ? '{}' : '');
+  }
+  return jobDir;
+}
+
+describe('JobIndex', () => {
+  let executeDir: string;
+  let index: JobIndex | undefined;
+
+  beforeEach(() => {
+    executeDir = fs.mkdtempSync(path.join(os.tmpdir(), 'job-index-'));
+    makeJob(executeDir, 'new-1', ['command.json']);
+    makeJob(executeDir, 'claimed-1', ['command.json', 'claimed.json']);
+    makeJob(executeDir, 'done-1', ['command.json', 'claimed.json', 'response.json', 'done']);
+    makeJob(executeDir, 'dlq-1', ['command.json', 'claimed.json', 'dlq']);
+    makeJob(executeDir, 'kept-1', ['command.json', 'claimed.json', 'done', 'keep']);
+    makeJob(executeDir, 'orphan-1', []);
+  });
+
+  afterEach(() => {
+    if (index) {
+      unregisterJobIndex(index);
+      index = undefined;
+    }
+    fs.rmSync(executeDir, { recursive: true, force: true });
+  });
+
+  it('derives job state from markers at build time', async () => {
+    index = await JobIndex.build(executeDir);
+
+    expect(index.size).toBe(6);
+    expect(jobState(index.get('new-1')!)).toBe('new');
+    expect(jobState(index.get('claimed-1')!)).toBe('claimed');
+    expect(jobState(index.get('done-1')!)).toBe('done');
+    expect(jobState(index.get('dlq-1')!)).toBe('dlq');
+    expect(jobState(index.get('orphan-1')!)).toBe('pending');
+    expect(index.get('kept-1')!.keep).toBe(true);
+    expect(index.counts()).toMatchObject({ total: 6, new: 1, claimed: 1, done: 2, dlq: 1, pending: 1, kept: 1 });
+  });
+
+  it('returns the same unclaimed jobs as the directory walk', async () => {
+    const walked = await scanForUnclaimedJobs(executeDir, 0, 10, new NodeFilesystem());
+
+    index = await JobIndex.build(executeDir);
+    registerJobIndex(index);
+    const indexed = await scanForUnclaimedJobs(executeDir, 0, 10, new NodeFilesystem());
+
+    expect(indexed.sort()).toEqual(walked.sort());
+    expect(indexed).toEqual([path.join(executeDir, 'new-1')]);
+  });
+
+  it('tracks in-process claim and done writes without rescanning', async () => {
+    index = await JobIndex.build(executeDir);
+    registerJobIndex(index);
+    const jobDir = path.join(executeDir, 'new-1');
+
+    expect(claimJobAtomic(jobDir, 'bridge-1')).toBe(true);
+    expect(index.unclaimedJobDirs()).toEqual([]);
+    expect(jobState(index.get('new-1')!)).toBe('claimed');
+
+    await writeDone(jobDir);
+    expect(jobState(index.get('new-1')!)).toBe('done');
+    expect(index.get('new-1')!.doneMs).toBeTypeOf('number');
+  });
+
+  it('picks up jobs created and removed behind its back on reconcile', async () => {
+    index = await JobIndex.build(executeDir);
+
+    makeJob(executeDir, 'late-1', ['command.json']);
+    fs.rmSync(path.join(executeDir, 'done-1'), { recursive: true });
+    // Command lands after the directory was first indexed
+    fs.writeFileSync(path.join(executeDir, 'orphan-1', 'command.json'), '{}');
+
+    await index.reconcile();
+
+    expect(index.get('done-1')).toBeUndefined();
+    expect(index.unclaimedJobDirs().map(dir => path.basename(dir)).sort()).toEqual(['late-1', 'new-1', 'orphan-1']);
+  });
+
+  it('only yields matching candidates when registered', async () => {
+    const unindexed = await listJobCandidates(executeDir, job => job.claimed && !job.done);
+    expect(unindexed.names).toHaveLength(6);
+
+    index = await JobIndex.build(executeDir);
+    registerJobIndex(index);
+    const indexed = await listJobCandidates(executeDir, job => job.claimed && !job.done);
+
+    expect(indexed.total).toBe(6);
+    expect(indexed.names.sort()).toEqual(['claimed-1', 'dlq-1']);
+  });
+
+  it('agrees with the directory walk for stats and GC', async () => {
+    const walkedStats = await getJobStats(executeDir);
+
+    index = await JobIndex.build(executeDir);
+    registerJobIndex(index);
+    const indexedStats = await getJobStats(executeDir);
+
+    expect(indexedStats.total).toBe(walkedStats.total);
+    expect(indexedStats.completed).toBe(walkedStats.completed);
+    expect(indexedStats.incomplete).toBe(walkedStats.incomplete);
+    expect(indexedStats.kept).toBe(walkedStats.kept);
+
+    // Everything is older than -1ms except kept and DLQ (7-day retention)
+    const gc = await cleanOldJobs(executeDir, -1);
+    expect(gc.deleted).toBe(4);
+    expect(fs.readdirSync(executeDir).sort()).toEqual(['dlq-1', 'kept-1']);
+    expect(index.size).toBe(2);
+  });
+
+  it('is only visible through getJobIndex while registered', async () => {
+    index = await JobIndex.build(executeDir);
+    expect(getJobIndex(executeDir)).toBeUndefined();
+
+    registerJobIndex(index);
+    expect(getJobIndex(executeDir)).toBe(index);
+
+    unregisterJobIndex(index);
+    expect(getJobIndex(executeDir)).toBeUndefined();
+    index = undefined;
+  });
+});
@@ -0,0 +1,186 @@
+/**
+ * @fileoverview Job Journal Tests
+ *
+ * Tests for JobJournal, the append-only record of claim/complete/fail/DLQ/keep
+ * transitions that lets startup and GC skip probing every job directory.
+ *
+ * ## Testing Philosophy
+ * - **Real filesystem**: Journal and job directories in a temp dir
+ * - **Replay**: A reopened journal must reproduce the state that was appended
+ * - **Age order**: GC candidates come oldest first and stop at the first young job
+ */
+
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
+import * as fs from 'fs';
+import * as os from 'os';
+import * as path from 'path';
+import {
+  JobJournal,
+  JOURNAL_FILE,
+  lastTransition,
+  registerJobJournal,
+  unregisterJobJournal
+} from '../../../src/core/fs-bridge/journal';
+import { JobIndex } from '../../../src/core/fs-bridge/job-index';
+import { claimJobAtomic, writeDone } from '../../../src/core/fs-bridge/processor';
+import { cleanOldJobs } from '../../../src/core/fs-bridge/cleaner';
+
+// cleaner loads fs-abstraction, which imports vscode
+vi.mock('vscode', () => ({}));
+
+const DAY = 24 * 60 * 60 * 1000;
+
+function makeJob(executeDir: string, id: string, markers: string[]): string {
+  const jobDir = path.join(executeDir, id);
+  fs.mkdirSync(jobDir, { recursive: true });
+  for (const marker of markers) {
+    fs.writeFileSync(path.join(jobDir, marker), marker.endsWith('.json') ? '{}' : '');
+  }
+  return jobDir;
+}
+
+function readEntries(bridgeDir: string): any[] {
+  return fs.readFileSync(path.join(bridgeDir, JOURNAL_FILE), 'utf8')
+    .split('\n')
+    .filter(Boolean)
+    .map(line => JSON.parse(line));
+}
+
+describe('JobJournal', () => {
+  let bridgeDir: string;
+  let executeDir: string;
+  let journal: JobJournal | undefined;
+
+  beforeEach(() => {
+    bridgeDir = fs.mkdtempSync(path.join(os.tmpdir(), 'job-journal-'));
+    executeDir = path.join(bridgeDir, 'execute');
+    fs.mkdirSync(executeDir);
+  });
+
+  afterEach(() => {
+    vi.useRealTimers();
+    if (journal) {
+      unregisterJobJournal(journal);
+      journal = undefined;
+    }
+    fs.rmSync(bridgeDir, { recursive: true, force: true });
+  });
+
+  it('replays appended transitions after reopening', async () => {
+    journal = await JobJournal.open(bridgeDir);
+    journal.append('a', 'claim');
+    journal.append('a', 'complete');
+    journal.append('b', 'claim');
+    journal.append('c', 'claim');
+    journal.append('c', 'dlq');
+    journal.append('c', 'fail');
+    journal.close();
+
+    journal = await JobJournal.open(bridgeDir);
+    expect(lastTransition(journal.get('a')!)).toBe('complete');
+    expect(lastTransition(journal.get('b')!)).toBe('claim');
+    expect(journal.get('c')!.dlq).toBeDefined();
+    expect(journal.claimed().map(state => state.id)).toEqual(['b']);
+    expect(readEntries(bridgeDir)[0]).toMatchObject({ op: 'claim', id: 'a', pid: process.pid });
+  });
+
+  it('ignores a truncated last line', async () => {
+    fs.writeFileSync(
+      path.join(bridgeDir, JOURNAL_FILE),
+      JSON.stringify({ t: 1, op: 'claim', id: 'a', pid: 1 }) + '\n{"t":2,"op":"comp'
+    );
+
+    journal = await JobJournal.open(bridgeDir);
+    expect(lastTransition(journal.get('a')!)).toBe('claim');
+  });
+
+  it('lists expired jobs oldest first, honouring keep and DLQ retention', async () => {
+    vi.useFakeTimers();
+    journal = await JobJournal.open(bridgeDir);
+    const start = Date.now();
+
+    for (const id of ['old', 'kept', 'quarantined', 'young']) {
+      journal.append(id, 'claim');
+      journal.append(id, id === 'quarantined' ? 'dlq' : 'complete');
+      if (id === 'kept') journal.append(id, 'keep');
+      vi.setSystemTime(Date.now() + DAY);
+    }
+
+    // 'old' finished 4 days ago, 'young' 1 day ago
+    expect(journal.expired(2 * DAY, 7 * DAY)).toEqual(['old']);
+    expect(journal.expired(0, 7 * DAY, start + 20 * DAY)).toEqual(['old', 'quarantined', 'young']);
+  });
+
+  it('compacts to the entries of live jobs only', async () => {
+    journal = await JobJournal.open(bridgeDir);
+    for (let i = 0; i < 5; i++) {
+      journal.append(`job-${i}`, 'claim');
+      journal.append(`job-${i}`, 'complete');
+    }
+    journal.append('job-0', 'delete');
+    journal.append('job-1', 'delete');
+
+    journal.compact();
+
+    const entries = readEntries(bridgeDir);
+    expect(entries).toHaveLength(6);
+    expect(new Set(entries.map(entry => entry.id))).toEqual(new Set(['job-2', 'job-3', 'job-4']));
+  });
+
+  it('never compacts from append()', async () => {
+    journal = await JobJournal.open(bridgeDir);
+    for (let i = 0; i < 1500; i++) {
+      journal.append(`job-${i}`, 'claim');
+      journal.append(`job-${i}`, 'complete');
+      journal.append(`job-${i}`, 'delete');
+    }
+
+    // Superseded entries stay until the GC timer (or startup) compacts
+    expect(journal.size).toBe(0);
+    expect(journal.entryCount).toBe(4500);
+    expect(readEntries(bridgeDir)).toHaveLength(4500);
+
+    journal.compact();
+    expect(journal.entryCount).toBe(0);
+    expect(readEntries(bridgeDir)).toHaveLength(0);
+  });
+
+  it('seeds the job index and adopts jobs it has never seen', async () => {
+    makeJob(executeDir, 'journaled', ['command.json', 'claimed.json', 'done']);
+    makeJob(executeDir, 'legacy', ['command.json', 'claimed.json', 'done', 'keep']);
+    makeJob(executeDir, 'fresh', ['command.json']);
+
+    journal = await JobJournal.open(bridgeDir);
+    journal.append('journaled', 'claim');
+    journal.append('journaled', 'complete');
+    journal.append('vanished', 'claim');
+
+    const index = await JobIndex.build(executeDir, journal);
+    expect(index.get('journaled')!.done).toBe(true);
+    expect(index.unclaimedJobDirs()).toEqual([path.join(executeDir, 'fresh')]);
+
+    journal.reconcile(index.all());
+    expect(journal.get('vanished')).toBeUndefined();
+    expect(journal.get('legacy')).toMatchObject({ keep: expect.any(Object) });
+    expect(journal.get('legacy')!.claim!.pid).toBe(0);
+    expect(journal.get('fresh')).toBeUndefined();
+  });
+
+  it('records in-process transitions and drives GC without listing execute/', async () => {
+    journal = await JobJournal.open(bridgeDir);
+    registerJobJournal(journal);
+
+    const jobDir = makeJob(executeDir, 'job-1', ['command.json']);
+    expect(claimJobAtomic(jobDir, 'bridge-1')).toBe(true);
+    await writeDone(jobDir, 'fail');
+    expect(lastTransition(journal.get('job-1')!)).toBe('fail');
+
+    // A directory the journal does not know about is left alone
+    makeJob(executeDir, 'unknown', ['command.json', 'claimed.json', 'done']);
+
+    const stats = await cleanOldJobs(executeDir, -1);
+    expect(stats.deleted).toBe(1);
+    expect(fs.readdirSync(executeDir)).toEqual(['unknown']);
+    expect(journal.get('job-1')).toBeUndefined();
+  });
+});
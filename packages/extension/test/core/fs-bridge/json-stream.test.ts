@@ -0,0 +1,70 @@
+/**
+ * @fileoverview JSON Stream Tests
+ *
+ * Tests for JsonChunker and NdjsonChunker, the incremental serializers used
+ * to write large job results without building one giant string.
+ *
+ * ## Testing Philosophy
+ * - **Parity**: Joined chunks equal JSON.stringify() output, edge cases included
+ * - **Bounded**: Chunks stay near the requested size
+ */
+
+import { describe, it, expect } from 'vitest';
+import { JsonChunker, NdjsonChunker } from '../../../src/core/fs-bridge/json-stream';
+
+function drain(chunker: { done: boolean; next(chunkChars?: number): string }, chunkChars?: number): string[] {
+  const chunks: string[] = [];
+  while (!chunker.done) {
+    chunks.push(chunker.next(chunkChars));
+  }
+  return chunks;
+}
+
+describe('JsonChunker', () => {
+  it('matches JSON.stringify for awkward values', () => {
+    const values: unknown[] = [
+      42,
+      'quote " and\nnewline',
+      null,
+      [1, undefined, () => 1, NaN, Infinity],
+      { skip: undefined, fn: () => 1, empty: [], nested: { deep: [[{}]] } },
+      { when: new Date(0), custom: { toJSON: () => 'custom' }, boxed: new Number(3) },
+      { '': 'empty key', 'a"b': 1 }
+    ];
+
+    for (const value of values) {
+      expect(drain(new JsonChunker(value), 8).join('')).toBe(JSON.stringify(value));
+    }
+  });
+
+  it('splits large results into bounded chunks', () => {
+    const data = { rows: Array.from({ length: 5000 }, (_, i) => ({ i, name: `row-${i}`, tags: ['a', 'b'] })) };
+
+    const chunks = drain(new JsonChunker(data), 4096);
+
+    expect(chunks.join('')).toBe(JSON.stringify(data));
+    expect(chunks.length).toBeGreaterThan(10);
+    expect(Math.max(...chunks.map(chunk => chunk.length))).toBeLessThan(4096 + 200);
+  });
+
+  it('rejects circular structures like JSON.stringify', () => {
+    const cyclic: any = { name: 'loop' };
+    cyclic.self = { parent: cyclic };
+
+    expect(() => drain(new JsonChunker(cyclic))).toThrow(/circular/);
+
+    // Shared (non-circular) references are fine
+    const shared = { x: 1 };
+    expect(drain(new JsonChunker([{ shared }, { shared }])).join('')).toBe('[{"shared":{"x":1}},{"shared":{"x":1}}]');
+  });
+});
+
+describe('NdjsonChunker', () => {
+  it('writes one array item per line', () => {
+    const items = [{ a: 1 }, undefined, 'text', [1, [2]]];
+
+    const lines = drain(new NdjsonChunker(items), 3).join('').split('\n');
+
+    expect(lines).toEqual(['{"a":1}', 'null', '"text"', '[1,[2]]', '']);
+  });
+});
@@ -0,0 +1,136 @@
+/**
+ * @fileoverview Job Scheduler Tests
+ *
+ * Tests for JobScheduler, the priority-class scheduler that replaced the hard
+ * MAX_CONCURRENT rejection with per-class limits and a bounded wait queue.
+ *
+ * ## Testing Philosophy
+ * - **Isolation**: A full class never delays another class
+ * - **Fairness**: Queued jobs are dispatched round-robin across clients
+ * - **Bounded**: Full queues, wait deadlines and cancellation reject cleanly
+ */
+
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
+import {
+  JobScheduler,
+  SchedulerRejection,
+  SchedulerTicket,
+  priorityFromMetadata,
+  slowestPriority
+} from '../../../src/core/fs-bridge/scheduler';
+
+describe('JobScheduler', () => {
+  let scheduler: JobScheduler;
+  let running: number;
+
+  beforeEach(() => {
+    running = 0;
+    scheduler = new JobScheduler({
+      limits: { fast: 2, normal: 1, blocking: 1 },
+      maxQueued: 4,
+      maxWaitMs: 1000,
+      onRunningChange: n => { running = n; }
+    });
+  });
+
+  afterEach(() => {
+    vi.useRealTimers();
+    scheduler.reset();
+  });
+
+  it('grants free slots synchronously', async () => {
+    const pending = scheduler.acquire({ requestId: 'a', priority: 'fast' });
+    expect(running).toBe(1);
+
+    const ticket = await pending;
+    expect(ticket).toMatchObject({ requestId: 'a', priority: 'fast', queueDepth: 0 });
+
+    scheduler.release(ticket);
+    expect(running).toBe(0);
+  });
+
+  it('keeps fast jobs moving while blocking jobs fill their class', async () => {
+    await scheduler.acquire({ requestId: 'wait-1', priority: 'blocking' });
+    const queuedWait = scheduler.acquire({ requestId: 'wait-2', priority: 'blocking' });
+    queuedWait.catch(() => {});
+
+    const fast = await scheduler.acquire({ requestId: 'status', priority: 'fast' });
+    expect(fast.queueDepth).toBe(0);
+    expect(scheduler.snapshot()).toMatchObject({
+      fast: { running: 1, queued: 0 },
+      blocking: { running: 1, queued: 1 }
+    });
+  });
+
+  it('dispatches queued jobs round-robin across clients', async () => {
+    let ticket = await scheduler.acquire({ requestId: 'hold', priority: 'normal', clientId: 'a' });
+
+    const granted: SchedulerTicket[] = [];
+    for (const [requestId, clientId] of [['a1', 'a'], ['a2', 'a'], ['b1', 'b']]) {
+      scheduler.acquire({ requestId, clientId, priority: 'normal' }).then(t => granted.push(t));
+    }
+
+    // One slot: each release hands it to the next client in turn
+    for (let i = 0; i < 3; i++) {
+      scheduler.release(ticket);
+      await new Promise(resolve => setTimeout(resolve, 0));
+      ticket = granted[i];
+    }
+
+    expect(granted.map(t => t.requestId)).toEqual(['a1', 'b1', 'a2']);
+    expect(granted[2].queueDepth).toBe(1);
+  });
+
+  it('rejects when the queue is full', async () => {
+    await scheduler.acquire({ requestId: 'hold', priority: 'normal', clientId: 'a' });
+    for (let i = 0; i < 2; i++) {
+      scheduler.acquire({ requestId: `a${i}`, priority: 'normal', clientId: 'a' }).catch(() => {});
+    }
+
+    // One client may only hold half the queue
+    await expect(scheduler.acquire({ requestId: 'a2', priority: 'normal', clientId: 'a' }))
+      .rejects.toMatchObject({ reason: 'queue_full' });
+
+    for (let i = 0; i < 2; i++) {
+      scheduler.acquire({ requestId: `b${i}`, priority: 'normal', clientId: 'b' }).catch(() => {});
+    }
+    await expect(scheduler.acquire({ requestId: 'c0', priority: 'normal', clientId: 'c' }))
+      .rejects.toBeInstanceOf(SchedulerRejection);
+  });
+
+  it('rejects a queued job when its wait deadline passes', async () => {
+    vi.useFakeTimers();
+    await scheduler.acquire({ requestId: 'hold', priority: 'normal' });
+    const queued = scheduler.acquire({ requestId: 'late', priority: 'normal', maxWaitMs: 200 });
+    const outcome = expect(queued).rejects.toMatchObject({ reason: 'timeout' });
+
+    await vi.advanceTimersByTimeAsync(250);
+    await outcome;
+    expect(scheduler.queuedCount).toBe(0);
+  });
+
+  it('removes a queued job when its signal aborts', async () => {
+    await scheduler.acquire({ requestId: 'hold', priority: 'normal' });
+    const controller = new AbortController();
+    const queued = scheduler.acquire({ requestId: 'cancel-me', priority: 'normal', signal: controller.signal });
+
+    controller.abort();
+    await expect(queued).rejects.toMatchObject({ reason: 'cancelled' });
+    expect(scheduler.queuedCount).toBe(0);
+  });
+});
+
+describe('priorityFromMetadata', () => {
+  it('prefers an explicit class and falls back to the response type', () => {
+    expect(priorityFromMetadata({ priority: 'fast', response: 'waitable' } as any)).toBe('fast');
+    expect(priorityFromMetadata({ response: 'waitable' } as any)).toBe('blocking');
+    expect(priorityFromMetadata({ response: 'query' } as any)).toBe('fast');
+    expect(priorityFromMetadata({ response: 'action' } as any)).toBe('normal');
+    expect(priorityFromMetadata(undefined)).toBe('normal');
+  });
+
+  it('runs a batch at its slowest step', () => {
+    expect(slowestPriority(['fast', 'blocking', 'normal'])).toBe('blocking');
+    expect(slowestPriority([])).toBe('fast');
+  });
+});
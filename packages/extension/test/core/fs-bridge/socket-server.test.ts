@@ -0,0 +1,229 @@
+/**
+ * @fileoverview Socket Transport Tests
+ *
+ * Tests for BridgeSocketServer, the local socket / named pipe endpoint that
+ * serves commands alongside the execute/ file queue.
+ *
+ * ## Testing Philosophy
+ * - **Real server**: BridgeSocketServer listening on a temp-dir socket
+ * - **Raw client**: NDJSON frames over net.connect (no CLI client code)
+ * - **Shared admission**: Flood/capacity state is the same module state launchJob uses
+ */
+
+import { describe, it, expect, beforeEach, afterEach } from 'vitest';
+import * as fs from 'fs';
+import * as net from 'net';
+import * as os from 'os';
+import * as path from 'path';
+import { BridgeSocketServer, resolveSocketPath, SOCKET_DATA_DIR } from '../../../src/core/fs-bridge/socket-server';
+import { EventWriter, inFlight, resetFloodProtection, LARGE_DATA_THRESHOLD } from '../../../src/core/fs-bridge/processor';
+import { CommandJson, ErrorCode } from '../../../src/core/fs-bridge/types';
+
+/**
+ * Open a connection and collect server frames
+ */
+function connect(socketPath: string): Promise<{
+  socket: net.Socket;
+  send: (frame: unknown) => void;
+  next: (predicate?: (frame: any) => boolean) => Promise<any>;
+}> {
+  return new Promise((resolve, reject) => {
+    const socket = net.connect(socketPath);
+    const frames: any[] = [];
+    const waiters: Array<{ predicate: (frame: any) => boolean; resolve: (frame: any) => void }> = [];
+    let buffer = '';
+
+    socket.setEncoding('utf8');
+    socket.on('data', (chunk: string) => {
+      buffer += chunk;
+      let newline: number;
+      while ((newline = buffer.indexOf('\n')) !== -1) {
+        const frame = JSON.parse(buffer.slice(0, newline));
+        buffer = buffer.slice(newline + 1);
+        const waiter = waiters.findIndex(w => w.predicate(frame));
+        if (waiter !== -1) {
+          waiters.splice(waiter, 1)[0].resolve(frame);
+        } else {
+          frames.push(frame);
+        }
+      }
+    });
+
+    const next = (predicate: (frame: any) => boolean = () => true) => {
+      const index = frames.findIndex(predicate);
+      if (index !== -1) {
+        return Promise.resolve(frames.splice(index, 1)[0]);
+      }
+      return new Promise<any>(res => waiters.push({ predicate, resolve: res }));
+    };
+
+    socket.once('connect', () => resolve({
+      socket,
+      send: frame => socket.write(JSON.stringify(frame) + '\n'),
+      next
+    }));
+    socket.once('error', reject);
+  });
+}
+
+function makeCommand(id: string, scriptName = 'test.echo', params: Record<string, any> = {}): CommandJson {
+  return {
+    version: 1,
+    clientId: 'test',
+    id,
+    createdAt: new Date().toISOString(),
+    scriptName,
+    params
+  };
+}
+
+describe.skipIf(process.platform === 'win32')('Bridge Socket Server', () => {
+  let bridgeDir: string;
+  let server: BridgeSocketServer;
+
+  const executor = async (command: CommandJson, eventWriter: EventWriter) => {
+    if (command.scriptName === 'test.fail') {
+      throw new Error('Simulated failure');
+    }
+    if (command.scriptName === 'test.hang') {
+      return new Promise(() => {});
+    }
+    if (command.scriptName === 'test.big') {
+      const item = 'x'.repeat(100);
+      return { data: Array.from({ length: Math.ceil(LARGE_DATA_THRESHOLD / 100) + 1 }, () => item) };
+    }
+    eventWriter.writeProgress(50, 'halfway');
+    return { data: { echo: command.params } };
+  };
+
+  beforeEach(async () => {
+    bridgeDir = fs.mkdtempSync(path.join(os.tmpdir(), 'sock-srv-'));
+    resetFloodProtection();
+    server = await BridgeSocketServer.start(bridgeDir, 'extHost-test', executor);
+  });
+
+  afterEach(async () => {
+    await server.close();
+    fs.rmSync(bridgeDir, { recursive: true, force: true });
+  });
+
+  it('places the socket in the bridge dir when the path is short enough', () => {
+    expect(server.endpoint.path).toBe(resolveSocketPath(bridgeDir, 'extHost-test'));
+    expect(fs.existsSync(server.endpoint.path)).toBe(true);
+    expect(fs.statSync(server.endpoint.path).mode & 0o777).toBe(0o600);
+  });
+
+  it('falls back to the temp dir for deep workspace paths', () => {
+    const deep = path.join('/', 'x'.repeat(120), '.vsc-bridge');
+    expect(resolveSocketPath(deep, 'extHost-abc')).toBe(path.join(os.tmpdir(), 'vsc-bridge-extHost-abc.sock'));
+  });
+
+  it('rejects clients with the wrong token', async () => {
+    const client = await connect(server.endpoint.path);
+    client.send({ type: 'hello', version: 1, token: 'nope' });
+
+    const frame = await client.next();
+    expect(frame.type).toBe('error');
+    expect(frame.message).toMatch(/Authentication/);
+    client.socket.destroy();
+  });
+
+  it('executes requests and forwards events before the response', async () => {
+    const client = await connect(server.endpoint.path);
+    client.send({ type: 'hello', version: 1, token: server.endpoint.token });
+    expect((await client.next()).type).toBe('welcome');
+
+    client.send({ type: 'request', command: makeCommand('job-1', 'test.echo', { a: 1 }) });
+
+    const progress = await client.next(f => f.type === 'event' && f.event.type === 'progress');
+    expect(progress.id).toBe('job-1');
+
+    const response = await client.next(f => f.type === 'response');
+    expect(response.id).toBe('job-1');
+    expect(response.envelope.ok).toBe(true);
+    expect(response.envelope.data).toEqual({ echo: { a: 1 } });
+    expect(inFlight).toBe(0);
+    client.socket.destroy();
+  });
+
+  it('returns E_INTERNAL envelopes for failing scripts', async () => {
+    const client = await connect(server.endpoint.path);
+    client.send({ type: 'hello', version: 1, token: server.endpoint.token });
+    await client.next();
+
+    client.send({ type: 'request', command: makeCommand('job-2', 'test.fail') });
+    const response = await client.next(f => f.type === 'response');
+    expect(response.envelope.ok).toBe(false);
+    expect(response.envelope.error.code).toBe(ErrorCode.E_INTERNAL);
+    client.socket.destroy();
+  });
+
+  it('cancels in-flight requests on a cancel frame', async () => {
+    const client = await connect(server.endpoint.path);
+    client.send({ type: 'hello', version: 1, token: server.endpoint.token });
+    await client.next();
+
+    client.send({ type: 'request', command: makeCommand('job-3', 'test.hang') });
+    client.send({ type: 'cancel', id: 'job-3' });
+
+    const response = await client.next(f => f.type === 'response');
+    expect(response.envelope.error.code).toBe(ErrorCode.E_CANCELLED);
+    expect(inFlight).toBe(0);
+    client.socket.destroy();
+  });
+
+  it('releases capacity when the client disconnects mid-request', async () => {
+    const client = await connect(server.endpoint.path);
+    client.send({ type: 'hello', version: 1, token: server.endpoint.token });
+    await client.next();
+
+    client.send({ type: 'request', command: makeCommand('job-4', 'test.hang') });
+    await client.next(f => f.type === 'event');
+    expect(inFlight).toBe(1);
+
+    client.socket.destroy();
+    await new Promise(resolve => setTimeout(resolve, 50));
+    expect(inFlight).toBe(0);
+  });
+
+  it('streams large results to a dataRef file for clients that accept it', async () => {
+    const client = await connect(server.endpoint.path);
+    client.send({ type: 'hello', version: 1, token: server.endpoint.token });
+    await client.next();
+
+    client.send({ type: 'request', command: { ...makeCommand('job-5', 'test.big'), accept: ['ndjson'] } });
+    const response = await client.next(f => f.type === 'response');
+
+    expect(response.envelope.ok).toBe(true);
+    expect(response.envelope.data).toBeUndefined();
+    expect(response.envelope.dataRef).toBe('data.ndjson');
+    expect(response.envelope.dataFormat).toBe('ndjson');
+
+    const dataPath = path.join(bridgeDir, SOCKET_DATA_DIR, 'job-5', 'data.ndjson');
+    const lines = fs.readFileSync(dataPath, 'utf8').trim().split('\n');
+    expect(lines).toHaveLength(Math.ceil(LARGE_DATA_THRESHOLD / 100) + 1);
+    expect(JSON.parse(lines[0])).toBe('x'.repeat(100));
+    client.socket.destroy();
+  });
+
+  it('keeps large results inline for clients that do not list accept', async () => {
+    const client = await connect(server.endpoint.path);
+    client.send({ type: 'hello', version: 1, token: server.endpoint.token });
+    await client.next();
+
+    client.send({ type: 'request', command: makeCommand('job-6', 'test.big') });
+    const response = await client.next(f => f.type === 'response');
+
+    expect(response.envelope.dataRef).toBeUndefined();
+    expect(response.envelope.data).toHaveLength(Math.ceil(LARGE_DATA_THRESHOLD / 100) + 1);
+    expect(fs.existsSync(path.join(bridgeDir, SOCKET_DATA_DIR, 'job-6'))).toBe(false);
+    client.socket.destroy();
+  });
+
+  it('removes the socket file on close', async () => {
+    const socketPath = server.endpoint.path;
+    await server.close();
+    expect(fs.existsSync(socketPath)).toBe(false);
+    // afterEach closes again; must be harmless
+  });
+});
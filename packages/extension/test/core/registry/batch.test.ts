@@ -0,0 +1,188 @@
+/**
+ * Batch job tests
+ *
+ * Verifies '@batch' param validation and step sequencing against a fake
+ * registry (no VS Code APIs involved).
+ */
+
+import { describe, it, expect } from 'vitest';
+import {
+    executeBatch,
+    parseBatchParams,
+    BatchScriptRunner,
+    MAX_BATCH_STEPS
+} from '../../../src/core/registry/batch';
+import { ok, fail, ResponseEnvelope } from '../../../src/core/response/envelope';
+import { createMeta } from '../../../src/core/response/serialize';
+
+function fakeRunner(
+    scripts: Record<string, (params: any) => ResponseEnvelope | Promise<ResponseEnvelope>>,
+    dangerOnly: string[] = []
+): BatchScriptRunner & { calls: string[] } {
+    const calls: string[] = [];
+    return {
+        calls,
+        getMetadata: (alias: string) => (alias in scripts
+            ? ({ alias, dangerOnly: dangerOnly.includes(alias) } as any)
+            : undefined),
+        execute: async (alias, params, requestId, mode) => {
+            calls.push(alias);
+            return scripts[alias](params);
+        }
+    };
+}
+
+const meta = () => createMeta('req', 'normal');
+
+describe('parseBatchParams', () => {
+    it('accepts steps and defaults params to {}', () => {
+        const batch = parseBatchParams({ steps: [{ scriptName: 'bp.set' }] });
+        expect(batch.steps).toEqual([{ scriptName: 'bp.set', params: {} }]);
+        expect(batch.stopOnError).toBe(false);
+    });
+
+    it('keeps client-side validation hashes', () => {
+        const batch = parseBatchParams({ steps: [{ scriptName: 'bp.set', params: { line: 3 }, paramsSchemaHash: 'abc123' }] });
+        expect(batch.steps).toEqual([{ scriptName: 'bp.set', params: { line: 3 }, paramsSchemaHash: 'abc123' }]);
+    });
+
+    it('rejects missing or empty steps', () => {
+        expect(() => parseBatchParams({})).toThrow(/steps/);
+        expect(() => parseBatchParams({ steps: [] })).toThrow(/at least one/);
+    });
+
+    it('rejects oversized batches', () => {
+        const steps = Array.from({ length: MAX_BATCH_STEPS + 1 }, () => ({ scriptName: 'x' }));
+        expect(() => parseBatchParams({ steps })).toThrow(/maximum/);
+    });
+
+    it('rejects reserved script names inside a batch', () => {
+        expect(() => parseBatchParams({ steps: [{ scriptName: '@batch' }] })).toThrow(/cannot be used/);
+        expect(() => parseBatchParams({ steps: [{ scriptName: '@dynamic' }] })).toThrow(/cannot be used/);
+    });
+});
+
+describe('executeBatch', () => {
+    it('runs every step in order and reports per-step envelopes', async () => {
+        const runner = fakeRunner({
+            'a': p => ok({ got: p }, meta()),
+            'b': () => ok('b', meta())
+        });
+
+        const result = await executeBatch(
+            runner,
+            parseBatchParams({ steps: [{ scriptName: 'a', params: { n: 1 } }, { scriptName: 'b' }] }),
+            { requestId: 'req', mode: 'normal' }
+        );
+
+        expect(runner.calls).toEqual(['a', 'b']);
+        expect(result.succeeded).toBe(2);
+        expect(result.steps[0].envelope.data).toEqual({ got: { n: 1 } });
+        expect(result.steps.every(s => typeof s.durationMs === 'number')).toBe(true);
+    });
+
+    it('continues past failures by default', async () => {
+        const runner = fakeRunner({
+            'bad': () => fail('E_SCRIPT_FAILED', 'nope', undefined, meta()),
+            'good': () => ok(true, meta())
+        });
+
+        const result = await executeBatch(
+            runner,
+            parseBatchParams({ steps: [{ scriptName: 'bad' }, { scriptName: 'good' }] }),
+            { requestId: 'req', mode: 'normal' }
+        );
+
+        expect(result.failed).toBe(1);
+        expect(result.succeeded).toBe(1);
+        expect(result.stoppedEarly).toBe(false);
+    });
+
+    it('stops at the first failure when stopOnError is set', async () => {
+        const runner = fakeRunner({
+            'bad': () => fail('E_SCRIPT_FAILED', 'nope', undefined, meta()),
+            'good': () => ok(true, meta())
+        });
+
+        const result = await executeBatch(
+            runner,
+            parseBatchParams({ steps: [{ scriptName: 'bad' }, { scriptName: 'good' }], stopOnError: true }),
+            { requestId: 'req', mode: 'normal' }
+        );
+
+        expect(runner.calls).toEqual(['bad']);
+        expect(result.skipped).toBe(1);
+        expect(result.stoppedEarly).toBe(true);
+    });
+
+    it('reports unknown scripts, danger-only scripts and thrown errors as failed steps', async () => {
+        const runner = fakeRunner({
+            'danger.thing': () => ok(true, meta()),
+            'boom': () => { throw new Error('exploded'); }
+        }, ['danger.thing']);
+
+        const result = await executeBatch(
+            runner,
+            parseBatchParams({ steps: [{ scriptName: 'missing' }, { scriptName: 'danger.thing' }, { scriptName: 'boom' }] }),
+            { requestId: 'req', mode: 'normal' }
+        );
+
+        expect(result.steps.map(s => s.envelope.error?.code)).toEqual([
+            'E_SCRIPT_NOT_FOUND',
+            'E_DANGER_MODE_REQUIRED',
+            'E_INTERNAL'
+        ]);
+        expect(runner.calls).toEqual(['boom']);
+    });
+
+    it('skips the remaining steps once the job is cancelled', async () => {
+        const controller = new AbortController();
+        const runner = fakeRunner({
+            'a': () => ok(1, meta()),
+            'cancel': () => { controller.abort(); return ok(2, meta()); }
+        });
+
+        const result = await executeBatch(
+            runner,
+            parseBatchParams({ steps: [{ scriptName: 'a' }, { scriptName: 'cancel' }, { scriptName: 'a' }] }),
+            { requestId: 'req', mode: 'normal', signal: controller.signal }
+        );
+
+        expect(runner.calls).toEqual(['a', 'cancel']);
+        expect(result.skipped).toBe(1);
+        expect(result.stoppedEarly).toBe(true);
+    });
+
+    it('passes the job signal to every step', async () => {
+        const controller = new AbortController();
+        const signals: (AbortSignal | undefined)[] = [];
+        const runner: BatchScriptRunner = {
+            getMetadata: (alias: string) => ({ alias } as any),
+            execute: async (alias, params, requestId, mode, signal) => {
+                signals.push(signal);
+                return ok(true, meta());
+            }
+        };
+
+        await executeBatch(
+            runner,
+            parseBatchParams({ steps: [{ scriptName: 'a' }, { scriptName: 'b' }] }),
+            { requestId: 'req', mode: 'normal', signal: controller.signal }
+        );
+
+        expect(signals).toEqual([controller.signal, controller.signal]);
+    });
+
+    it('reports progress before each step', async () => {
+        const runner = fakeRunner({ 'a': () => ok(1, meta()) });
+        const seen: string[] = [];
+
+        await executeBatch(
+            runner,
+            parseBatchParams({ steps: [{ scriptName: 'a' }, { scriptName: 'a' }] }),
+            { requestId: 'req', mode: 'normal', onStep: (i, n, name) => seen.push(`${i}/${n}:${name}`) }
+        );
+
+        expect(seen).toEqual(['0/2:a', '1/2:a']);
+    });
+});
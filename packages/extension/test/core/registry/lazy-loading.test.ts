@@ -0,0 +1,145 @@
+/**
+ * ScriptRegistry Lazy Loading Tests
+ *
+ * discover() only records manifest entries; scripts are instantiated on first
+ * execute() or by warmUp(). Baked-in scripts, schemas and the dynamic loader
+ * are replaced with fakes so each test can count loads.
+ */
+
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
+import * as fs from 'fs';
+import * as os from 'os';
+import * as path from 'path';
+
+const fakes = vi.hoisted(() => {
+    const constructed: string[] = [];
+    const success = (data: unknown) => ({ ok: true, type: 'success', data });
+
+    class StatusScript {
+        constructor() { constructed.push('debug.status'); }
+        async execute() { return success('status'); }
+    }
+    class ListScript {
+        constructor() { constructed.push('breakpoint.list'); }
+        async execute() { return success([]); }
+    }
+    class DiskScript {
+        constructor() { constructed.push('disk.script'); }
+        async execute() { return success('disk'); }
+    }
+
+    return {
+        constructed,
+        classes: { StatusScript, ListScript },
+        DiskScript,
+        metadata: new Map<any, string>([[StatusScript, 'debug.status'], [ListScript, 'breakpoint.list']]),
+        loadModuleFromDisk: vi.fn()
+    };
+});
+
+vi.mock('vscode', () => ({}));
+vi.mock('../../../src/vsc-scripts/index', () => fakes.classes);
+vi.mock('../../../src/core/scripts/decorators', () => ({ getScriptMetadata: () => fakes.metadata }));
+vi.mock('../../../src/core/registry/dynamicLoader', () => ({ loadModuleFromDisk: fakes.loadModuleFromDisk }));
+vi.mock('../../../src/vsc-scripts/generated/schemas', () => ({
+    scriptSchemas: {},
+    scriptSchemaHashes: {},
+    safeValidateScriptParams: vi.fn()
+}));
+vi.mock('../../../src/core/bridge-context', () => ({
+    BridgeContextFactory: {
+        create: () => ({ forRequest: () => ({ setRequestMetadata: () => undefined }) })
+    },
+    withContext: (_context: unknown, fn: () => unknown) => fn()
+}));
+vi.mock('../../../src/core/bridge-context/type-guards', () => ({ typeGuards: {} }));
+vi.mock('../../../src/core/context/EditorContextProvider', () => ({
+    EditorContextProvider: { capture: async () => undefined }
+}));
+vi.mock('../../../src/core/telemetry', () => ({ scrubPII: (value: string) => value }));
+
+import { ScriptRegistry } from '../../../src/core/registry/ScriptRegistry';
+
+const entry = (alias: string, scriptRelPath: string, exportName?: string) => ({
+    metadata: { alias, name: alias, category: alias.split('.')[0] },
+    scriptRelPath,
+    exportName
+});
+
+describe('ScriptRegistry lazy loading', () => {
+    let dir: string;
+    let registry: ScriptRegistry;
+
+    beforeEach(async () => {
+        fakes.constructed.length = 0;
+        fakes.loadModuleFromDisk.mockReset();
+
+        dir = fs.mkdtempSync(path.join(os.tmpdir(), 'script-registry-'));
+        fs.writeFileSync(path.join(dir, 'disk.js'), '');
+        fs.writeFileSync(path.join(dir, 'manifest.json'), JSON.stringify({
+            version: 2,
+            generatedAt: new Date().toISOString(),
+            scripts: {
+                'debug.status': entry('debug.status', 'debug/status.js', 'StatusScript'),
+                'breakpoint.list': entry('breakpoint.list', 'breakpoint/list.js', 'ListScript'),
+                'disk.script': entry('disk.script', 'disk.js')
+            }
+        }));
+
+        registry = new ScriptRegistry({} as any, { appendLine: vi.fn() } as any);
+        await registry.discover(path.join(dir, 'manifest.json'));
+    });
+
+    afterEach(() => {
+        fs.rmSync(dir, { recursive: true, force: true });
+    });
+
+    it('lists and reports registered scripts before any is loaded', () => {
+        expect(registry.listScripts().sort()).toEqual(['breakpoint.list', 'debug.status', 'disk.script']);
+        expect(registry.hasScript('disk.script')).toBe(true);
+        expect(registry.hasScript('missing.script')).toBe(false);
+        expect(registry.getMetadata('debug.status')?.alias).toBe('debug.status');
+        expect(registry.stats()).toMatchObject({ discovered: 3, loaded: 0 });
+        expect(fakes.constructed).toEqual([]);
+    });
+
+    it('shares one load between concurrent first calls', async () => {
+        fakes.loadModuleFromDisk.mockImplementation(
+            () => new Promise(resolve => setTimeout(() => resolve({ DiskScript: fakes.DiskScript }), 10))
+        );
+
+        const results = await Promise.all([1, 2, 3].map(i => registry.execute('disk.script', {}, `req-${i}`, 'normal')));
+
+        expect(results.map(r => r.ok)).toEqual([true, true, true]);
+        expect(fakes.loadModuleFromDisk).toHaveBeenCalledTimes(1);
+        expect(fakes.constructed).toEqual(['disk.script']);
+        expect(registry.stats().loaded).toBe(1);
+    });
+
+    it('reports a failed load as E_SCRIPT_NOT_FOUND and retries it on the next call', async () => {
+        fakes.loadModuleFromDisk.mockImplementation(async () => {
+            throw new Error('disk unavailable');
+        });
+
+        const failed = await registry.execute('disk.script', {}, 'req-1', 'normal');
+        expect(failed.ok).toBe(false);
+        expect(failed.error?.code).toBe('E_SCRIPT_NOT_FOUND');
+        expect(failed.error?.details).toEqual({ alias: 'disk.script', error: 'disk unavailable' });
+
+        fakes.loadModuleFromDisk.mockImplementation(async () => ({ DiskScript: fakes.DiskScript }));
+        const retried = await registry.execute('disk.script', {}, 'req-2', 'normal');
+
+        expect(retried.ok).toBe(true);
+        expect(retried.data).toBe('disk');
+        expect(fakes.loadModuleFromDisk).toHaveBeenCalledTimes(2);
+    });
+
+    it('warms up only scripts that are not loaded yet', async () => {
+        await registry.execute('debug.status', {}, 'req-1', 'normal');
+
+        await registry.warmUp(['debug.status', 'breakpoint.list', 'missing.script']);
+
+        expect(fakes.constructed).toEqual(['debug.status', 'breakpoint.list']);
+        expect(registry.stats().loaded).toBe(2);
+    });
+});
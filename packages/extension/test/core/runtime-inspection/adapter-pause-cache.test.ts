@@ -0,0 +1,123 @@
+/**
+ * @fileoverview Adapter Pause Cache Invalidation Tests
+ *
+ * Tests that BaseDebugAdapter drops its PauseCache when execution state
+ * changes, so a new stop never reuses threads/stackTrace from the last one.
+ *
+ * ## Testing Philosophy
+ * - **Fake adapter**: A vscode mock captures the tracker factory; tests send DAP
+ *   events through the trackers like a debug adapter would
+ * - **Round-trips**: The fake session counts the requests that reach it
+ */
+
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
+
+const hooks = vi.hoisted(() => ({ factory: undefined as any, activeStackItem: undefined as any }));
+
+vi.mock('vscode', () => {
+    const noop = { dispose: () => undefined };
+    return {
+        debug: {
+            onDidStartDebugSession: () => noop,
+            onDidTerminateDebugSession: () => noop,
+            onDidChangeBreakpoints: () => noop,
+            onDidReceiveDebugSessionCustomEvent: () => noop,
+            onDidChangeActiveStackItem: (listener: any) => {
+                hooks.activeStackItem = listener;
+                return noop;
+            },
+            registerDebugAdapterTrackerFactory: (_type: string, factory: any) => {
+                hooks.factory = factory;
+                return noop;
+            }
+        }
+    };
+});
+
+import { DebugEventHub } from '../../../src/core/debug/event-hub';
+import { BaseDebugAdapter } from '../../../src/core/runtime-inspection/adapters/BaseDebugAdapter';
+
+class TestAdapter extends BaseDebugAdapter {
+    listVariables = vi.fn() as any;
+    setVariable = vi.fn() as any;
+    getVariableChildren = vi.fn() as any;
+    streamVariables = vi.fn() as any;
+
+    stack(threadId: number) {
+        return this.getStackFrames(threadId);
+    }
+}
+
+function fakeSession(id: string) {
+    const session: any = {
+        id,
+        type: 'python',
+        requests: [] as string[],
+        customRequest: async (command: string) => {
+            session.requests.push(command);
+            return command === 'stackTrace' ? { stackFrames: [{ id: session.requests.length }] } : { threads: [] };
+        }
+    };
+    session.tracker = hooks.factory.createDebugAdapterTracker(session);
+    session.send = (event: string, body: any = {}) => session.tracker.onDidSendMessage({ type: 'event', event, body });
+    return session;
+}
+
+describe('BaseDebugAdapter pause cache invalidation', () => {
+    let hub: DebugEventHub;
+    let adapter: TestAdapter | undefined;
+
+    beforeEach(() => {
+        hub = DebugEventHub.instance;
+        hub.install();
+    });
+
+    afterEach(() => {
+        adapter?.dispose();
+        adapter = undefined;
+        hub.dispose();
+    });
+
+    it('sends new stackTrace requests after the next stop', async () => {
+        const session = fakeSession('s1');
+        adapter = new TestAdapter(session, {} as any);
+
+        session.send('stopped', { reason: 'breakpoint', threadId: 1 });
+        const first = await adapter.stack(1);
+        expect(await adapter.stack(1)).toEqual(first);
+        expect(session.requests).toEqual(['stackTrace']);
+
+        session.send('continued', { threadId: 1 });
+        session.send('stopped', { reason: 'step', threadId: 1 });
+        const second = await adapter.stack(1);
+
+        expect(session.requests).toEqual(['stackTrace', 'stackTrace']);
+        expect(second).not.toEqual(first);
+    });
+
+    it('clears on invalidated events and on the undefined stack item fired on resume', async () => {
+        const session = fakeSession('s1');
+        adapter = new TestAdapter(session, {} as any);
+
+        await adapter.stack(1);
+        session.send('invalidated', { areas: ['variables'] });
+        await adapter.stack(1);
+        hooks.activeStackItem(undefined);
+        await adapter.stack(1);
+
+        expect(session.requests).toEqual(['stackTrace', 'stackTrace', 'stackTrace']);
+        expect(adapter.getCacheStats().epoch).toBe(2);
+    });
+
+    it('ignores execution events from other sessions', async () => {
+        const session = fakeSession('s1');
+        const other = fakeSession('s2');
+        adapter = new TestAdapter(session, {} as any);
+
+        await adapter.stack(1);
+        other.send('stopped', { reason: 'breakpoint', threadId: 1 });
+        await adapter.stack(1);
+
+        expect(session.requests).toEqual(['stackTrace']);
+    });
+});
@@ -0,0 +1,77 @@
+/**
+ * @fileoverview Pause Cache Tests
+ *
+ * Tests for PauseCache, the per-pause memo of read-only DAP requests behind
+ * BaseDebugAdapter.request().
+ *
+ * ## Testing Philosophy
+ * - **Fake send**: Counts round-trips instead of talking to a debug adapter
+ * - **Epochs**: Nothing fetched before an invalidation is served after it
+ * - **Counters**: hits/misses report exactly what was and wasn't sent
+ */
+
+import { describe, it, expect } from 'vitest';
+import { PauseCache } from '../../../src/core/runtime-inspection/PauseCache';
+
+function counter() {
+    let sent = 0;
+    return {
+        get sent() { return sent; },
+        send: (value: any) => () => {
+            sent++;
+            return Promise.resolve(value);
+        }
+    };
+}
+
+describe('PauseCache', () => {
+    it('sends each unique request once per pause', async () => {
+        const cache = new PauseCache();
+        const dap = counter();
+
+        // A typical inspect loop: list-variables, then get-variable, then list-variables again
+        for (let i = 0; i < 3; i++) {
+            await cache.get('threads', undefined, dap.send({ threads: [{ id: 1 }] }));
+            await cache.get('stackTrace', { threadId: 1, startFrame: 0, levels: 1 }, dap.send({ stackFrames: [] }));
+            await cache.get('stackTrace', { threadId: 1, levels: 1 }, dap.send({ stackFrames: [] }));
+            await cache.get('scopes', { frameId: 7 }, dap.send({ scopes: [] }));
+            await cache.get('variables', { variablesReference: 5, count: 50 }, dap.send({ variables: [] }));
+        }
+        await cache.get('variables', { variablesReference: 5, start: 50, count: 50 }, dap.send({ variables: [] }));
+
+        expect(dap.sent).toBe(5);
+        expect(cache.stats()).toEqual({ epoch: 0, hits: 11, misses: 5, entries: 5 });
+    });
+
+    it('shares in-flight requests and never serves them after invalidation', async () => {
+        const cache = new PauseCache();
+        const dap = counter();
+        let resolve!: (value: any) => void;
+        const slow = () => new Promise(r => { resolve = r; });
+
+        const first = cache.get('scopes', { frameId: 1 }, slow);
+        const second = cache.get('scopes', { frameId: 1 }, slow);
+        expect(second).toBe(first);
+
+        cache.invalidate();
+        resolve({ scopes: ['old'] });
+        await first;
+
+        const fresh = await cache.get('scopes', { frameId: 1 }, dap.send({ scopes: ['new'] }));
+        expect(fresh).toEqual({ scopes: ['new'] });
+        expect(cache.stats()).toMatchObject({ epoch: 1, entries: 1 });
+    });
+
+    it('does not cache failures or state-changing commands', async () => {
+        const cache = new PauseCache();
+        const dap = counter();
+
+        await cache.get('variables', { variablesReference: 9 }, () => Promise.reject(new Error('busy'))).catch(() => undefined);
+        await cache.get('variables', { variablesReference: 9 }, dap.send({ variables: [] }));
+        await cache.get('evaluate', { expression: 'x', context: 'watch' }, dap.send({ result: '1' }));
+        await cache.get('evaluate', { expression: 'x', context: 'watch' }, dap.send({ result: '1' }));
+
+        expect(dap.sent).toBe(3);
+        expect(PauseCache.key('setVariable', { variablesReference: 9 })).toBeUndefined();
+    });
+});
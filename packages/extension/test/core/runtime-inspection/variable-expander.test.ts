@@ -0,0 +1,102 @@
+/**
+ * @fileoverview Variable Expander Tests
+ *
+ * Tests for VariableExpander, the pipelined listVariables() expansion shared
+ * by the DAP adapters.
+ *
+ * ## Testing Philosophy
+ * - **Fake DAP**: An in-memory object graph with shared objects and cycles,
+ *   answered with random latency so responses complete out of order
+ * - **Determinism**: Output and budget accounting match at any concurrency
+ * - **Bounded**: Requests are deduplicated and in-flight counts stay capped
+ */
+
+import { describe, it, expect } from 'vitest';
+import { VariableExpander, IVariableExpanderOptions } from '../../../src/core/runtime-inspection/VariableExpander';
+import { MemoryBudget } from '../../../src/core/runtime-inspection/MemoryBudget';
+
+/**
+ * Reference n has 6 children; children of n are 6n+1..6n+6 up to 2000, and
+ * every third child points back to reference 1 (shared object / cycle)
+ */
+function children(ref: number): any[] {
+    return Array.from({ length: 6 }, (_, i) => {
+        const child = ref * 6 + i + 1;
+        const variablesReference = i % 3 === 2 ? 1 : child <= 2000 ? child : 0;
+        return { name: `f${i}`, value: `v${child}`, variablesReference };
+    });
+}
+
+function fakeSession(seed: number) {
+    const requested = new Map<number, number>();
+    let inFlight = 0;
+    let maxInFlight = 0;
+    let random = seed;
+    const request = async (_command: string, args: any) => {
+        requested.set(args.variablesReference, (requested.get(args.variablesReference) ?? 0) + 1);
+        inFlight++;
+        maxInFlight = Math.max(maxInFlight, inFlight);
+        random = (random * 16807) % 2147483647;
+        await new Promise(resolve => setTimeout(resolve, random % 3));
+        inFlight--;
+        return { variables: children(args.variablesReference) };
+    };
+    return { request, requested, get maxInFlight() { return maxInFlight; } };
+}
+
+const roots = [
+    { name: 'a', value: 'A', variablesReference: 2 },
+    { name: 'b', value: 'B', variablesReference: 3 },
+    { name: 'shared', value: 'S', variablesReference: 2 }
+];
+
+function options(extra: Partial<IVariableExpanderOptions> = {}): IVariableExpanderOptions {
+    return {
+        maxDepth: 5,
+        maxChildren: 50,
+        concurrency: 8,
+        budget: new MemoryBudget(20000, 5 * 1024 * 1024),
+        estimateSize: variable => 100 + variable.name.length * 2,
+        ...extra
+    };
+}
+
+describe('VariableExpander', () => {
+    it('produces the same tree and budget at any concurrency', async () => {
+        const runs = [];
+        for (const [concurrency, seed] of [[1, 1], [4, 7], [16, 42]]) {
+            const budget = new MemoryBudget(200, 5 * 1024 * 1024);
+            const expander = new VariableExpander(fakeSession(seed).request, options({ concurrency, budget }));
+            runs.push({ tree: await expander.expandAll(roots), nodes: budget.currentNodes, bytes: budget.currentBytes });
+        }
+
+        expect(runs[0].nodes).toBe(200);
+        expect(runs[1]).toEqual(runs[0]);
+        expect(runs[2]).toEqual(runs[0]);
+        expect(JSON.stringify(runs[0].tree)).toContain('"truncatedReason":"budget"');
+        expect(JSON.stringify(runs[0].tree)).toContain('"cycle":true');
+    });
+
+    it('fetches each reference once and caps requests in flight', async () => {
+        const session = fakeSession(3);
+        const expander = new VariableExpander(session.request, options({ concurrency: 4 }));
+
+        await expander.expandAll(roots);
+
+        expect([...session.requested.values()].every(count => count === 1)).toBe(true);
+        // The pool plus the walk's own request
+        expect(session.maxInFlight).toBeLessThanOrEqual(5);
+    });
+
+    it('never fetches variables that inspect() stops', async () => {
+        const session = fakeSession(5);
+        const expander = new VariableExpander(session.request, options({
+            inspect: async variable => variable.name === 'f1' ? { ...variable, expandable: false } : undefined
+        }));
+
+        const tree = await expander.expandAll(roots);
+
+        expect(tree[0].children![1]).toMatchObject({ name: 'f1', expandable: false });
+        expect(session.requested.has(children(2)[1].variablesReference)).toBe(false);
+    });
+});
@@ -0,0 +1,178 @@
+/**
+ * @fileoverview Variable Stream Tests
+ *
+ * Tests for VariableTreeWalker, the depth-first DAP traversal behind
+ * streamVariables() in the debugpy, coreclr and java adapters.
+ *
+ * ## Testing Philosophy
+ * - **Fake DAP**: A small in-memory variables tree stands in for the session
+ * - **Resume parity**: A walk split by cursors writes exactly what one walk does
+ * - **Flow control**: The memory budget triggers flushes, never a cutoff
+ */
+
+import { describe, it, expect } from 'vitest';
+import {
+    VariableTreeWalker,
+    IVariableStreamRecord,
+    IVariableWalkOptions,
+    decodeVariableCursor,
+    encodeVariableCursor
+} from '../../../src/core/runtime-inspection/VariableStream';
+import { MemoryBudget } from '../../../src/core/runtime-inspection/MemoryBudget';
+
+/**
+ * Reference 1 holds 1200 entries; every 100th is an object (reference 1000+i)
+ * with two leaves and a back-reference to 1
+ */
+function children(ref: number): any[] {
+    if (ref === 1) {
+        return Array.from({ length: 1200 }, (_, i) => ({
+            name: `k${i}`,
+            value: String(i),
+            variablesReference: i % 100 === 0 ? 1000 + i : 0
+        }));
+    }
+    if (ref >= 1000) {
+        return [
+            { name: 'a', value: '1', variablesReference: 0 },
+            { name: 'parent', value: '{...}', variablesReference: 1 },
+            { name: 'b', value: '2', variablesReference: 0 }
+        ];
+    }
+    return [];
+}
+
+function fakeSession() {
+    const requests: any[] = [];
+    const request = async (_command: string, args: any) => {
+        requests.push(args);
+        const all = children(args.variablesReference);
+        const start = args.start ?? 0;
+        return { variables: all.slice(start, start + (args.count ?? all.length)) };
+    };
+    return { request, requests };
+}
+
+const roots = [{ name: 'Locals', value: '', variablesReference: 1 }];
+
+function options(extra: Partial<IVariableWalkOptions> = {}): IVariableWalkOptions {
+    return {
+        maxDepth: 10,
+        pageSize: 500,
+        paging: true,
+        budget: new MemoryBudget(100, 1024 * 1024),
+        estimateSize: () => 100,
+        ...extra
+    };
+}
+
+function collect() {
+    const records: IVariableStreamRecord[] = [];
+    let flushes = 0;
+    return {
+        records,
+        get flushes() { return flushes; },
+        sink: {
+            write: (record: IVariableStreamRecord) => { records.push(record); },
+            flush: async () => { flushes++; }
+        }
+    };
+}
+
+describe('VariableTreeWalker', () => {
+    it('walks depth-first in pages and marks cycles', async () => {
+        const { request, requests } = fakeSession();
+        const out = collect();
+
+        const result = await new VariableTreeWalker(request, options()).run(roots, out.sink);
+
+        expect(result.complete).toBe(true);
+        expect(out.records).toHaveLength(1 + 1200 + 12 * 3);
+        expect(out.records.slice(0, 5).map(r => [r.id, r.parent, r.name])).toEqual([
+            [1, 0, 'Locals'], [2, 1, 'k0'], [3, 2, 'a'], [4, 2, 'parent'], [5, 2, 'b']
+        ]);
+        expect(out.records.filter(r => r.truncated === 'cycle')).toHaveLength(12);
+        // Three pages of the root plus one page per object
+        expect(requests.filter(r => r.variablesReference === 1)).toHaveLength(3);
+    });
+
+    it('uses the budget as flow control rather than a limit', async () => {
+        const { request } = fakeSession();
+        const out = collect();
+
+        const result = await new VariableTreeWalker(request, options()).run(roots, out.sink);
+
+        expect(out.records.length).toBeGreaterThan(100);
+        expect(result.flushes).toBe(Math.floor((out.records.length - 1) / 100));
+        expect(out.flushes).toBe(result.flushes);
+    });
+
+    it('resumes from a cursor exactly where it stopped', async () => {
+        const { request } = fakeSession();
+        const whole = collect();
+        await new VariableTreeWalker(request, options()).run(roots, whole.sink);
+
+        const pieces = collect();
+        let position;
+        let runs = 0;
+        while (true) {
+            const walker = new VariableTreeWalker(request, options({ maxNodes: 137 }), position);
+            const result = await walker.run(roots, pieces.sink);
+            runs++;
+            if (result.complete) break;
+            const token = encodeVariableCursor({ ...walker.position(), sessionId: 's1', frameId: 7 });
+            position = decodeVariableCursor(token);
+            expect(position).toMatchObject({ sessionId: 's1', frameId: 7 });
+        }
+
+        expect(runs).toBe(Math.ceil(whole.records.length / 137));
+        expect(pieces.records).toEqual(whole.records);
+    });
+
+    it('stops with a resumable position when aborted', async () => {
+        const { request } = fakeSession();
+        const controller = new AbortController();
+        const out = collect();
+        const walker = new VariableTreeWalker(request, options({
+            signal: controller.signal,
+            skipChildren: async () => {
+                if (out.records.length >= 10) controller.abort();
+                return undefined;
+            }
+        }));
+
+        const result = await walker.run(roots, out.sink);
+
+        expect(result.complete).toBe(false);
+        expect(walker.position().path.length).toBeGreaterThan(0);
+    });
+
+    it('walks named then indexed children and tolerates adapters that ignore paging', async () => {
+        const requests: any[] = [];
+        const request = async (_command: string, args: any) => {
+            requests.push(args);
+            if (args.variablesReference === 1) {
+                return { variables: [{ name: 'list', value: '[...]', variablesReference: 2, namedVariables: 1, indexedVariables: 3 }] };
+            }
+            // Ignores start/count and filter is honoured
+            return {
+                variables: args.filter === 'named'
+                    ? [{ name: 'len', value: '3', variablesReference: 0 }]
+                    : [0, 1, 2].map(i => ({ name: `[${i}]`, value: String(i), variablesReference: 0 }))
+            };
+        };
+        const out = collect();
+
+        await new VariableTreeWalker(request, options({ pageSize: 2 })).run(roots, out.sink);
+
+        expect(out.records.map(r => r.name)).toEqual(['Locals', 'list', 'len', '[0]', '[1]', '[2]']);
+        expect(requests.map(r => r.filter)).toEqual([undefined, 'named', 'indexed']);
+    });
+});
+
+describe('variable cursors', () => {
+    it('rejects tokens it did not produce', () => {
+        expect(decodeVariableCursor('not-a-cursor')).toBeUndefined();
+        expect(decodeVariableCursor(Buffer.from('{"sessionId":"x"}').toString('base64url'))).toBeUndefined();
+    });
+});
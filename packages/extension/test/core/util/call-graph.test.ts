@@ -0,0 +1,106 @@
+/**
+ * @fileoverview Call Graph Tests
+ *
+ * Tests for walkCallGraph, the breadth-first call hierarchy walk behind
+ * symbol.calls with depth > 1.
+ *
+ * ## Testing Philosophy
+ * - **Fake hierarchy**: A caller table stands in for provideIncomingCalls and
+ *   counts expansions and concurrency
+ * - **Memoization**: Cycles and shared callers are expanded once
+ * - **Determinism**: Output order does not depend on which expansion finishes first
+ * - **Budgets**: maxNodes and timeoutMs stop the walk and say so
+ */
+
+import { describe, it, expect } from 'vitest';
+import { walkCallGraph, CallGraphOptions } from '../../../src/core/util/call-graph';
+
+// callee -> callers; main and run call each other
+const CALLERS: Record<string, string[]> = {
+    add: ['sum', 'total', 'add'],
+    sum: ['report', 'main'],
+    total: ['report'],
+    report: ['main'],
+    main: ['run'],
+    run: ['main']
+};
+
+function hierarchy(delay: (name: string) => number = () => 0) {
+    const stats = { expanded: [] as string[], active: 0, maxActive: 0 };
+    const expand = async (name: string) => {
+        stats.expanded.push(name);
+        stats.active++;
+        stats.maxActive = Math.max(stats.maxActive, stats.active);
+        await new Promise(resolve => setTimeout(resolve, delay(name)));
+        stats.active--;
+        if (name === 'broken') {
+            throw new Error('LSP provideIncomingCalls timeout (10s)');
+        }
+        return (CALLERS[name] ?? []).map(from => ({ from }));
+    };
+    return { stats, expand };
+}
+
+const options = (overrides: Partial<CallGraphOptions<string>> = {}): CallGraphOptions<string> => ({
+    maxDepth: 3,
+    maxNodes: 100,
+    timeoutMs: 10000,
+    concurrency: 4,
+    key: name => name,
+    ...overrides
+});
+
+describe('walkCallGraph', () => {
+    it('walks level by level and expands each item once', async () => {
+        const { stats, expand } = hierarchy();
+
+        const graph = await walkCallGraph('add', expand, call => call.from, options({ maxDepth: 5 }));
+
+        expect(graph.nodes.map(n => `${n.item}@${n.depth}`)).toEqual(
+            ['add@0', 'sum@1', 'total@1', 'report@2', 'main@2', 'run@3']
+        );
+        expect([...stats.expanded].sort()).toEqual(['add', 'main', 'report', 'run', 'sum', 'total']);
+        // Recursion (add -> add) and the main <-> run cycle become edges, not new nodes
+        expect(graph.edges.map(e => `${graph.nodes[e.from].item}<-${graph.nodes[e.to].item}`)).toEqual([
+            'add<-sum', 'add<-total', 'add<-add',
+            'sum<-report', 'sum<-main', 'total<-report',
+            'report<-main', 'main<-run',
+            'run<-main'
+        ]);
+        expect(graph.truncated).toBeUndefined();
+    });
+
+    it('does not expand the last level and keeps order under concurrency', async () => {
+        // The first item of each level is the slowest to answer
+        const { stats, expand } = hierarchy(name => (name === 'sum' ? 30 : 1));
+
+        const graph = await walkCallGraph('add', expand, call => call.from, options({ maxDepth: 2, concurrency: 2 }));
+
+        expect(graph.nodes.map(n => n.item)).toEqual(['add', 'sum', 'total', 'report', 'main']);
+        expect(graph.nodes.filter(n => n.calls !== undefined).map(n => n.item)).toEqual(['add', 'sum', 'total']);
+        expect(stats.maxActive).toBeLessThanOrEqual(2);
+    });
+
+    it('stops at the node and time budgets', async () => {
+        const small = await walkCallGraph('add', hierarchy().expand, call => call.from, options({ maxNodes: 4 }));
+        expect(small.nodes).toHaveLength(4);
+        expect(small.truncated).toBe('maxNodes');
+
+        const slow = hierarchy(() => 40);
+        const timed = await walkCallGraph('add', slow.expand, call => call.from, options({ timeoutMs: 20 }));
+        expect(timed.truncated).toBe('timeout');
+        expect(slow.stats.expanded).toEqual(['add']);
+    });
+
+    it('records failures below the root and keeps walking', async () => {
+        CALLERS.sum.push('broken');
+        try {
+            const graph = await walkCallGraph('add', hierarchy().expand, call => call.from, options());
+            const broken = graph.nodes.find(n => n.item === 'broken')!;
+            expect(broken.error).toContain('timeout');
+            expect(graph.nodes.map(n => n.item)).toContain('run');
+        } finally {
+            CALLERS.sum.pop();
+        }
+    });
+});
@@ -0,0 +1,198 @@
+/**
+ * @fileoverview Symbol Cache Tests
+ *
+ * Tests for DocumentSymbolIndex and DocumentSymbolCache, the per-version
+ * document symbol cache behind symbol-resolver and the symbol tools.
+ *
+ * ## Testing Philosophy
+ * - **Equivalence**: Indexed lookups must agree with the recursive traversals
+ *   they replace, on a generated tree with duplicate names and Java signatures
+ * - **Fake workspace**: A minimal vscode mock counts symbol provider calls
+ * - **Versioning**: A new document version or a change event forces a refetch
+ */
+
+import { describe, it, expect, beforeEach, vi } from 'vitest';
+
+const workspace = vi.hoisted(() => {
+    const listeners: Record<string, Array<(arg: any) => void>> = { change: [], close: [] };
+    return {
+        version: 1,
+        providerCalls: 0,
+        symbols: [] as any[],
+        listeners,
+        fire(event: 'change' | 'close', arg: any) {
+            listeners[event].forEach(listener => listener(arg));
+        }
+    };
+});
+
+vi.mock('vscode', () => ({
+    workspace: {
+        onDidChangeTextDocument: (listener: any) => {
+            workspace.listeners.change.push(listener);
+            return { dispose: () => undefined };
+        },
+        onDidCloseTextDocument: (listener: any) => {
+            workspace.listeners.close.push(listener);
+            return { dispose: () => undefined };
+        },
+        openTextDocument: async (uri: any) => ({ uri, version: workspace.version })
+    },
+    commands: {
+        executeCommand: async () => {
+            workspace.providerCalls++;
+            return workspace.symbols;
+        }
+    }
+}));
+
+import { DocumentSymbolCache, DocumentSymbolIndex } from '../../../src/core/util/symbol-cache';
+
+const pos = (line: number, character: number) => ({ line, character });
+
+function contains(range: any, p: any): boolean {
+    const before = (a: any, b: any) => a.line < b.line || (a.line === b.line && a.character <= b.character);
+    return before(range.start, p) && before(p, range.end);
+}
+
+/**
+ * Nested classes with methods; names repeat across classes and some carry
+ * Java-style signatures. Each symbol spans (4 + 6 * children) lines.
+ */
+function buildTree(): any[] {
+    let line = 0;
+    const make = (name: string, depth: number): any => {
+        const start = line;
+        line += 2;
+        const children = depth < 3
+            ? ['add', 'Inner', 'sub(int, int)', depth === 1 ? 'add' : 'run'].map(child => make(child, depth + 1))
+            : [];
+        line += 2;
+        return {
+            name,
+            kind: 5,
+            range: { start: pos(start, 0), end: pos(line - 1, 1) },
+            selectionRange: { start: pos(start, 6), end: pos(start, 6 + name.length) },
+            children
+        };
+    };
+    return [make('Calc', 1), make('Geo', 1), make('Calc', 1)];
+}
+
+// The recursive traversals the index replaces
+function allMatching(symbols: any[], name: string): any[] {
+    const out: any[] = [];
+    const walk = (syms: any[]) => syms.forEach(s => {
+        if (s.name === name || s.name.startsWith(name + '(')) out.push(s);
+        walk(s.children);
+    });
+    walk(symbols);
+    return out;
+}
+
+function hierarchical(symbols: any[], name: string): any {
+    const parts = name.split('.');
+    let current = symbols;
+    for (let i = 0; i < parts.length; i++) {
+        const found = current.find(s => s.name === parts[i]);
+        if (!found) return null;
+        if (i === parts.length - 1) return found;
+        if (!found.children.length) return null;
+        current = found.children;
+    }
+    return null;
+}
+
+function atSelection(symbols: any[], p: any): any {
+    for (const s of symbols) {
+        if (contains(s.selectionRange, p)) return s;
+        const found = atSelection(s.children, p);
+        if (found) return found;
+    }
+    return null;
+}
+
+function innermost(symbols: any[], p: any): any {
+    for (const s of symbols) {
+        if (contains(s.range, p)) return innermost(s.children, p) ?? s;
+    }
+    return null;
+}
+
+describe('DocumentSymbolIndex', () => {
+    const symbols = buildTree();
+    const index = new DocumentSymbolIndex(symbols);
+    const lastLine = symbols[symbols.length - 1].range.end.line;
+
+    it('matches names, signatures and dotted paths like the tree walks', () => {
+        for (const name of ['add', 'sub', 'Inner', 'run', 'Calc', 'missing']) {
+            expect(index.byName(name)).toEqual(allMatching(symbols, name));
+        }
+        for (const path of ['Calc.add', 'Calc.Inner.run', 'Geo.Inner.Inner', 'Calc.sub(int, int)', 'Geo.nope.add']) {
+            expect(index.byPath(path)).toBe(hierarchical(symbols, path));
+        }
+        const deep = symbols[1].children[1].children[2];
+        expect(index.qualifiedNameOf(deep)).toBe('Geo.Inner.sub(int, int)');
+    });
+
+    it('answers position lookups like the tree walks', () => {
+        for (let line = 0; line <= lastLine + 1; line++) {
+            for (const character of [0, 3, 6, 8, 40]) {
+                const p = pos(line, character);
+                expect(index.atSelection(p as any)).toBe(atSelection(symbols, p));
+                expect(index.innermostAt(p as any)).toBe(innermost(symbols, p));
+            }
+        }
+        const method = symbols[1].children[1].children[0];
+        expect(index.qualifiedNameAt(method.selectionRange.start)).toBe('Geo.Inner.add');
+        expect(index.qualifiedNameAt(pos(lastLine + 5, 0) as any)).toBeNull();
+    });
+});
+
+describe('DocumentSymbolCache', () => {
+    const uri = { toString: () => 'file:///src/calc.ts' } as any;
+
+    beforeEach(() => {
+        DocumentSymbolCache.getInstance().dispose();
+        workspace.listeners.change.length = 0;
+        workspace.listeners.close.length = 0;
+        workspace.version = 1;
+        workspace.providerCalls = 0;
+        workspace.symbols = buildTree();
+    });
+
+    it('fetches once per document version', async () => {
+        const cache = DocumentSymbolCache.getInstance();
+
+        const first = await cache.getIndex(uri);
+        expect(await cache.getIndex(uri)).toBe(first);
+        expect(workspace.providerCalls).toBe(1);
+
+        workspace.version = 2;
+        await cache.getIndex(uri);
+        expect(workspace.providerCalls).toBe(2);
+        expect(cache.stats()).toEqual({ hits: 1, misses: 2, documents: 1 });
+    });
+
+    it('drops documents on change and close events', async () => {
+        const cache = DocumentSymbolCache.getInstance();
+        await cache.getIndex(uri);
+
+        workspace.fire('change', { document: { uri } });
+        await cache.getIndex(uri);
+        workspace.fire('close', { uri });
+        await cache.getIndex(uri);
+
+        expect(workspace.providerCalls).toBe(3);
+    });
+
+    it('does not cache empty results', async () => {
+        const cache = DocumentSymbolCache.getInstance();
+        workspace.symbols = [];
+
+        expect(await cache.getIndex(uri)).toBeNull();
+        await cache.getIndex(uri);
+
+        expect(workspace.providerCalls).toBe(2);
+    });
+});
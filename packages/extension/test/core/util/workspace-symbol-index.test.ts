@@ -0,0 +1,173 @@
+/**
+ * @fileoverview Workspace Symbol Index Tests
+ *
+ * Tests for SymbolTable (query and persistence) and WorkspaceSymbolIndex, the
+ * persistent index behind search.symbol-search.
+ *
+ * ## Testing Philosophy
+ * - **Pure table**: Ranking, prefix and kind filtering checked on SymbolTable
+ * - **Fake workspace**: A vscode mock serves files from a table and counts
+ *   document symbol provider calls; the index is persisted to a temp folder
+ * - **Reload**: A second instance answers from disk and re-reads only files
+ *   whose mtime changed
+ */
+
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
+import * as fs from 'fs';
+import * as os from 'os';
+import * as path from 'path';
+
+const workspace = vi.hoisted(() => ({
+    root: '',
+    files: {} as Record<string, { mtime: number; symbols: any[] }>,
+    providerCalls: [] as string[]
+}));
+
+vi.mock('vscode', () => {
+    const uri = (fsPath: string) => ({ fsPath, toString: () => `file://${fsPath}` });
+    const noop = { dispose: () => undefined };
+    return {
+        Uri: { parse: (value: string) => uri(value.replace('file://', '')) },
+        workspace: {
+            get workspaceFolders() {
+                return [{ uri: uri(workspace.root) }];
+            },
+            findFiles: async () => Object.keys(workspace.files).map(uri),
+            fs: {
+                stat: async (u: any) => {
+                    const file = workspace.files[u.fsPath];
+                    if (!file) {
+                        throw new Error('ENOENT');
+                    }
+                    return { mtime: file.mtime, size: 100 };
+                }
+            },
+            createFileSystemWatcher: () => ({
+                ...noop,
+                onDidCreate: () => noop,
+                onDidChange: () => noop,
+                onDidDelete: () => noop
+            }),
+            onDidChangeWorkspaceFolders: () => noop
+        },
+        commands: {
+            executeCommand: async (_command: string, u: any) => {
+                workspace.providerCalls.push(u.fsPath);
+                return workspace.files[u.fsPath]?.symbols ?? [];
+            }
+        }
+    };
+});
+
+import { SymbolTable, WorkspaceSymbolIndex } from '../../../src/core/util/workspace-symbol-index';
+
+const CLASS = 4;
+const METHOD = 5;
+const FUNCTION = 11;
+
+function symbol(name: string, kind: number, line: number, children: any[] = []): any {
+    const range = { start: { line, character: 0 }, end: { line: line + 1, character: 0 } };
+    return { name, kind, range, selectionRange: range, children };
+}
+
+function entry(name: string, kind: number, uri = 'file:///a.ts'): any {
+    return {
+        name,
+        kind,
+        containerName: null,
+        location: { uri, range: { start: { line: 0, character: 0 }, end: { line: 0, character: 1 } } }
+    };
+}
+
+describe('SymbolTable', () => {
+    const table = new SymbolTable();
+    table.setFile('file:///a.ts', {
+        mtime: 1,
+        size: 1,
+        symbols: ['UserService', 'user', 'getUser', 'UserRepository', 'useState', 'parseUrl'].map((name, i) =>
+            entry(name, i % 2 === 0 ? CLASS : FUNCTION)
+        )
+    });
+
+    it('ranks exact, prefix, substring, then subsequence matches', () => {
+        expect(table.search('user').map(s => s.name)).toEqual(['user', 'UserService', 'UserRepository', 'getUser']);
+        expect(table.search('usr').map(s => s.name)).toEqual(['user', 'getUser', 'UserService', 'UserRepository']);
+    });
+
+    it('answers prefix and kind-filtered queries', () => {
+        expect(table.search('USE', { match: 'prefix' }).map(s => s.name)).toEqual(
+            ['user', 'UserRepository', 'UserService', 'useState']
+        );
+        expect(table.search('user', { kinds: [CLASS] }).map(s => s.name)).toEqual(['UserService', 'getUser']);
+        expect(table.search('', { kinds: [FUNCTION] })).toHaveLength(3);
+    });
+
+    it('round-trips through JSON', () => {
+        const copy = SymbolTable.fromJSON(JSON.parse(JSON.stringify(table.toJSON())))!;
+        expect(copy.search('user')).toEqual(table.search('user'));
+        expect(SymbolTable.fromJSON({ version: 0, files: {} })).toBeNull();
+    });
+});
+
+describe('WorkspaceSymbolIndex', () => {
+    beforeEach(() => {
+        workspace.root = fs.mkdtempSync(path.join(os.tmpdir(), 'symbol-index-'));
+        workspace.providerCalls = [];
+        workspace.files = {
+            '/w/calc.ts': { mtime: 1, symbols: [symbol('Calculator', CLASS, 0, [symbol('add', METHOD, 1)])] },
+            '/w/util.ts': { mtime: 1, symbols: [symbol('formatDate', FUNCTION, 0)] }
+        };
+    });
+
+    afterEach(async () => {
+        await WorkspaceSymbolIndex.shutdown();
+        fs.rmSync(workspace.root, { recursive: true, force: true });
+    });
+
+    it('builds from document symbols and reports its size', async () => {
+        const index = WorkspaceSymbolIndex.getInstance();
+        await index.start();
+        await index.whenBuilt();
+
+        const [add] = index.search('add');
+        expect(add.containerName).toBe('Calculator');
+        expect(add.location.uri).toBe('file:///w/calc.ts');
+        expect(index.stats()).toMatchObject({ status: 'ready', loadedFromDisk: false, files: 2, symbols: 3, filesRead: 2 });
+    });
+
+    it('serves the persisted index after a reload and re-reads only changed files', async () => {
+        const first = WorkspaceSymbolIndex.getInstance();
+        await first.start();
+        await first.whenBuilt();
+        await WorkspaceSymbolIndex.shutdown();
+
+        expect(fs.existsSync(path.join(workspace.root, '.vsc-bridge', 'cache', 'symbol-index.json'))).toBe(true);
+
+        workspace.providerCalls = [];
+        workspace.files['/w/util.ts'] = { mtime: 2, symbols: [symbol('formatTime', FUNCTION, 0)] };
+
+        const second = WorkspaceSymbolIndex.getInstance();
+        await second.start();
+        expect(second.isReady()).toBe(true);
+        expect(second.stats().persistedBytes).toBeGreaterThan(0);
+
+        await second.whenBuilt();
+        expect(workspace.providerCalls).toEqual(['/w/util.ts']);
+        expect(second.search('format').map(s => s.name)).toEqual(['formatTime']);
+        expect(second.stats()).toMatchObject({ loadedFromDisk: true, filesRead: 1 });
+    });
+
+    it('retries files whose provider returned nothing', async () => {
+        workspace.files['/w/util.ts'].symbols = [];
+        const index = WorkspaceSymbolIndex.getInstance();
+        await index.start();
+        await index.whenBuilt();
+
+        workspace.files['/w/util.ts'].symbols = [symbol('formatDate', FUNCTION, 0)];
+        workspace.providerCalls = [];
+        await index.rebuild();
+
+        expect(workspace.providerCalls).toEqual(['/w/util.ts']);
+        expect(index.search('formatDate')).toHaveLength(1);
+    });
+});
@@ -6,7 +6,8 @@ import {
   launchJob,
   inFlight,
   MAX_CONCURRENT,
-  processCommand
+  processCommand,
+  jobScheduler
 } from '../../src/core/fs-bridge/processor';import { ErrorCode } from '../../src/core/fs-bridge/types';
 
 describe('Concurrent Job Execution', () => {
@@ -58,6 +59,10 @@ describe('Concurrent Job Execution', () => {
       // Act
       launchJob(jobDir, bridgeId, mockExecutor);
 
+      // command.json is read asynchronously before the job is admitted
+      expect(inFlight).toBe(0);
+      await new Promise(resolve => setTimeout(resolve, 20));
+
       // Assert - check that inFlight increased
       expect(inFlight).toBe(1);
 
@@ -68,25 +73,59 @@ describe('Concurrent Job Execution', () => {
       expect(inFlight).toBe(0);
     });
 
-    test('given_capacity_exceeded_when_launchJob_called_then_E_CAPACITY_written', async () => {
-      // Arrange - fill capacity
-      const executingJobs: string[] = [];
+    test('given_capacity_exceeded_when_launchJob_called_then_job_queued_until_slot_frees', async () => {
+      // Arrange - fill capacity with jobs held open by a gate
+      let openGate!: () => void;
+      const gate = new Promise<void>(resolve => { openGate = resolve; });
       const mockExecutor = vi.fn(async () => {
-        await new Promise(resolve => setTimeout(resolve, 500)); // Keep jobs "in flight"
+        await gate;
         return { success: true };
       });
 
       // Launch MAX_CONCURRENT jobs
       for (let i = 0; i < MAX_CONCURRENT; i++) {
-        const jobDir = createMockJobDir(i);
-        launchJob(jobDir, 'test-bridge', mockExecutor);
-        executingJobs.push(jobDir);
+        launchJob(createMockJobDir(i), 'test-bridge', mockExecutor);
       }
 
-      // Act - try to launch one more (should hit capacity)
+      // Act - launch one more (should wait for a slot instead of failing)
       const overCapacityJob = createMockJobDir(99);
       launchJob(overCapacityJob, 'test-bridge', mockExecutor);
 
+      await new Promise(resolve => setTimeout(resolve, 50));
+      expect(inFlight).toBe(MAX_CONCURRENT);
+      expect(jobScheduler.queuedCount).toBe(1);
+      expect(fs.existsSync(path.join(overCapacityJob, 'error.json'))).toBe(false);
+
+      // Free the slots; the queued job runs and reports its wait
+      openGate();
+      await new Promise(resolve => setTimeout(resolve, 100));
+
+      const response = JSON.parse(fs.readFileSync(path.join(overCapacityJob, 'response.json'), 'utf8'));
+      expect(response.ok).toBe(true);
+      expect(response.meta.priority).toBe('normal');
+      expect(response.meta.queueDepth).toBe(0);
+      expect(response.meta.queueWaitMs).toBeGreaterThanOrEqual(40);
+      expect(inFlight).toBe(0);
+    });
+
+    test('given_queue_full_when_launchJob_called_then_E_CAPACITY_written', async () => {
+      // Arrange - fill capacity and this client's share of the wait queue
+      let openGate!: () => void;
+      const gate = new Promise<void>(resolve => { openGate = resolve; });
+      const mockExecutor = vi.fn(async () => {
+        await gate;
+        return { success: true };
+      });
+
+      const perClientQueue = Math.ceil(jobScheduler.maxQueued / 2);
+      for (let i = 0; i < MAX_CONCURRENT + perClientQueue; i++) {
+        launchJob(createMockJobDir(i), 'test-bridge', mockExecutor);
+      }
+
+      // Act - one more from the same client
+      const overCapacityJob = createMockJobDir(999);
+      launchJob(overCapacityJob, 'test-bridge', mockExecutor);
+
       // Assert - check for E_CAPACITY error
       await new Promise(resolve => setTimeout(resolve, 100)); // Let error write complete
 
@@ -98,9 +137,13 @@ describe('Concurrent Job Execution', () => {
 
       const errorData = JSON.parse(fs.readFileSync(errorPath, 'utf8'));
       expect(errorData.error.code).toBe(ErrorCode.E_CAPACITY);
+      expect(errorData.error.details.reason).toBe('queue_full');
 
-      // Cleanup - wait for executing jobs to complete
-      await new Promise(resolve => setTimeout(resolve, 600));
+      // Cleanup - let the held and queued jobs drain
+      openGate();
+      await new Promise(resolve => setTimeout(resolve, 300));
+      expect(inFlight).toBe(0);
+      expect(jobScheduler.queuedCount).toBe(0);
     });
   });
 
@@ -117,7 +160,8 @@ describe('Concurrent Job Execution', () => {
       // Act
       launchJob(jobDir, bridgeId, failingExecutor);
 
-      // Assert - immediately after launch, inFlight should be 1
+      // Assert - once command.json has been read, inFlight should be 1
+      await new Promise(resolve => setTimeout(resolve, 20));
       expect(inFlight).toBe(1);
 
       // Wait for failure
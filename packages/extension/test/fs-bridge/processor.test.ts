@@ -2,6 +2,7 @@ import * as assert from 'assert';
 import * as fs from 'fs';
 import * as path from 'path';
 import * as os from 'os';
+import * as zlib from 'zlib';
 import { promises as fsPromises } from 'fs';
 import {
   claimJobAtomic,
@@ -244,6 +245,36 @@ describe('Command Processor', () => {
       assert.strictEqual(savedData.items.length, largeArray.length);
     });
 
+    it('should write accepted large array results as gzipped NDJSON', async () => {
+      const rows = Array.from({ length: 60000 }, (_, i) => ({ name: `var${i}`, value: 'x'.repeat(30) }));
+
+      const envelope: ResponseJson = {
+        ok: true,
+        type: 'success',
+        data: rows,
+        meta: {
+          requestId: 'test-123',
+          mode: 'normal',
+          timestamp: new Date().toISOString(),
+          duration: 100
+        }
+      };
+
+      await writeResponse(jobDir, envelope, ['ndjson', 'gzip']);
+
+      const saved = JSON.parse(await fsPromises.readFile(path.join(jobDir, 'response.json'), 'utf8')) as ResponseJson;
+      assert.strictEqual(saved.dataRef, 'data.ndjson.gz');
+      assert.strictEqual(saved.dataFormat, 'ndjson');
+      assert.strictEqual(saved.dataEncoding, 'gzip');
+
+      const lines = zlib.gunzipSync(await fsPromises.readFile(path.join(jobDir, 'data.ndjson.gz')))
+        .toString('utf8')
+        .split('\n')
+        .filter(Boolean);
+      assert.strictEqual(lines.length, rows.length);
+      assert.deepStrictEqual(JSON.parse(lines[12345]), rows[12345]);
+    });
+
     it('should write error response', async () => {
       const envelope: ErrorJson = {
         ok: false,
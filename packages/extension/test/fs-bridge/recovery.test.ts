@@ -88,6 +88,29 @@ describe('Lease Recovery', () => {
       assert.strictEqual(stale, false);
     });
 
+    it('should not consider quarantined jobs as stale', async () => {
+      const jobDir = path.join(executeDir, 'dlq-job');
+      await fsPromises.mkdir(jobDir);
+
+      // Expired claim from a crashed extension host
+      const claim: ClaimedJson = {
+        bridgeId: 'old-bridge',
+        claimedAt: new Date(Date.now() - 120000).toISOString(),
+        pid: 99999,
+        leaseExpiresAt: new Date(Date.now() - 60000).toISOString()
+      };
+      await fsPromises.writeFile(
+        path.join(jobDir, 'claimed.json'),
+        JSON.stringify(claim)
+      );
+
+      // Quarantined by crash detection on startup
+      await fsPromises.writeFile(path.join(jobDir, 'dlq'), '{}');
+
+      const stale = await isJobStale(jobDir, 60000);
+      assert.strictEqual(stale, false);
+    });
+
     it('should not consider jobs with valid lease as stale', async () => {
       const jobDir = path.join(executeDir, 'active-job');
       await fsPromises.mkdir(jobDir);
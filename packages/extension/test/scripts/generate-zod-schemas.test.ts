@@ -1,5 +1,5 @@
 import { describe, it, expect } from 'vitest';
-import { metadataToZodSchema, generateAllSchemas } from '../../scripts/generate-zod-schemas';
+import { metadataToZodSchema, generateAllSchemas, paramSchemaHash } from '../../scripts/generate-zod-schemas';
 import type { ScriptMetadata } from '../../src/vsc-scripts/manifest.json';
 
 describe('Zod Schema Generation', () => {
@@ -295,6 +295,25 @@ describe('Zod Schema Generation', () => {
             expect(result).toContain('export type ScriptParams<T extends keyof ScriptSchemas>');
         });
 
+        it('should emit parameter definition hashes', () => {
+            const params = { line: { type: 'number' as const, required: true, min: 1 } };
+            const manifest = {
+                version: 2,
+                scripts: {
+                    'bp.set': { metadata: { alias: 'bp.set', description: 'Set breakpoint', params } },
+                    'debug.status': { metadata: { alias: 'debug.status', description: 'Status' } }
+                }
+            };
+
+            const result = generateAllSchemas(manifest);
+
+            expect(result).toContain('export const scriptSchemaHashes: Record<string, string> = {');
+            expect(result).toContain(`"bp.set": "${paramSchemaHash(params)}",`);
+            // Same value as the CLI's paramSchemaHash (test-cli/lib/param-validator.test.ts)
+            expect(paramSchemaHash(undefined)).toBe('44136fa355b3678a');
+            expect(result).toContain('"debug.status": "44136fa355b3678a",');
+        });
+
         it('should handle empty manifest', () => {
             const manifest = {
                 version: 2,
@@ -0,0 +1,534 @@
+#!/usr/bin/env npx tsx
+/**
+ * Headless fs-bridge Throughput and Latency Benchmark
+ *
+ * Runs the extension side of the file queue (job index and journal, claim,
+ * scheduler, processCommand, safety scanner, recovery and cleaner) in this
+ * process against a temp workspace, without VS Code, and drives it with the
+ * real CLI client (runCommand() from src/lib/fs-bridge.ts over the
+ * 'filesystem' transport). Scripts are replaced by stub executors, so the
+ * numbers are bridge overhead: polling, atomic writes, fsync, event tailing
+ * and large-result encoding.
+ *
+ * The VS Code file watcher is replaced by a recursive fs.watch on execute/
+ * (with the production 2s safety scan behind it); `vscode` resolves to the
+ * extension's unit-test mock, which only the unused VS Code adapters touch.
+ *
+ * Scenarios:
+ * - single:     sequential round-trips of a no-op script
+ * - concurrent: the same calls from 1/10/50 concurrent clients
+ * - payload:    results of 64 KiB, 1 MiB and 8 MiB (above 2 MiB results go
+ *               to a data file)
+ * - events:     jobs that stream progress events the client tails
+ * - recovery:   extension startup over N stale jobs left claimed by a dead
+ *               host (index, crash detection, cleanup, stale-job recovery),
+ *               then the first call and a GC pass over the finished jobs
+ *
+ * Usage:
+ *   npx tsx scripts/bench/bridge-headless.ts [options]
+ *
+ * Options:
+ *   --scenarios <list>  Comma-separated scenarios (default: all)
+ *   --iterations <n>    Calls per run (default: 200)
+ *   --clients <list>    Concurrent clients (default: 1,10,50)
+ *   --payloads <list>   Result sizes in bytes (default: 65536,1048576,8388608)
+ *   --events <n>        Events per job in the events scenario (default: 1000)
+ *   --stale <n>         Stale jobs in the recovery scenario (default: 10000)
+ *   --json              Output results as JSON
+ *
+ * @module scripts/bench/bridge-headless
+ */
+
+import { existsSync, promises as fs, watch, type FSWatcher } from 'fs';
+import Module, { createRequire } from 'module';
+import * as os from 'os';
+import * as path from 'path';
+import { fileURLToPath } from 'url';
+import { runCommand, sortableId, type CommandJson } from '../../src/lib/fs-bridge.js';
+
+type Scenario = 'single' | 'concurrent' | 'payload' | 'events' | 'recovery';
+const SCENARIOS: Scenario[] = ['single', 'concurrent', 'payload', 'events', 'recovery'];
+
+interface LoadResult {
+  scenario: Exclude<Scenario, 'recovery'>;
+  clients: number;
+  payloadBytes?: number;
+  eventsPerJob?: number;
+  calls: number;
+  failures: number;
+  p50Ms: number;
+  p95Ms: number;
+  p99Ms: number;
+  meanMs: number;
+  maxMs: number;
+  callsPerSec: number;
+  mbPerSec?: number;
+  eventsPerSec?: number;
+}
+
+interface RecoveryResult {
+  scenario: 'recovery';
+  staleJobs: number;
+  indexMs: number;
+  crashDetectMs: number;
+  cleanPendingMs: number;
+  cleanOrphansMs: number;
+  recoverMs: number;
+  firstCallMs: number;
+  gcMs: number;
+  startupMs: number;
+  quarantined: number;
+  recovered: number;
+  collected: number;
+  recoveredPerSec: number;
+}
+
+// Extension modules import `vscode`; point it at the unit-test mock before loading them
+const benchDir = path.dirname(fileURLToPath(import.meta.url));
+const extensionDir = path.resolve(benchDir, '../../packages/extension');
+const moduleInternals = Module as unknown as { _resolveFilename(request: string, ...rest: unknown[]): string };
+const resolveFilename = moduleInternals._resolveFilename;
+moduleInternals._resolveFilename = function (request: string, ...rest: unknown[]) {
+  const target = request === 'vscode' ? path.join(extensionDir, 'test/__mocks__/vscode.ts') : request;
+  return resolveFilename.call(this, target, ...rest);
+};
+
+const require = createRequire(import.meta.url);
+const bridgeModule = (name: string) => require(path.join(extensionDir, 'src/core/fs-bridge', name));
+const processor: typeof import('../../packages/extension/src/core/fs-bridge/processor') = bridgeModule('processor');
+const recovery: typeof import('../../packages/extension/src/core/fs-bridge/recovery') = bridgeModule('recovery');
+const cleaner: typeof import('../../packages/extension/src/core/fs-bridge/cleaner') = bridgeModule('cleaner');
+const scanner: typeof import('../../packages/extension/src/core/fs-bridge/scanner') = bridgeModule('scanner');
+const jobIndex: typeof import('../../packages/extension/src/core/fs-bridge/job-index') = bridgeModule('job-index');
+const journal: typeof import('../../packages/extension/src/core/fs-bridge/journal') = bridgeModule('journal');
+const bridge: typeof import('../../packages/extension/src/core/fs-bridge/bridge') = bridgeModule('bridge');
+const { NodeFilesystem }: typeof import('../../packages/extension/src/core/fs-bridge/fs-abstraction') = bridgeModule('fs-abstraction');
+
+type ExtensionCommand = import('../../packages/extension/src/core/fs-bridge/types').CommandJson;
+type EventWriter = import('../../packages/extension/src/core/fs-bridge/processor').EventWriter;
+
+const BRIDGE_ID = 'bench-host';
+const CALL_TIMEOUT_MS = 60000;
+const SAFETY_SCAN_MS = 2000;
+
+function parseArgs(argv: string[]) {
+  let scenarios = SCENARIOS;
+  let iterations = 200;
+  let clients = [1, 10, 50];
+  let payloads = [64 * 1024, 1024 * 1024, 8 * 1024 * 1024];
+  let events = 1000;
+  let stale = 10000;
+  let json = false;
+  const list = (value: string) => value.split(',').map(s => parseInt(s.trim(), 10)).filter(n => n > 0);
+
+  for (let i = 0; i < argv.length; i++) {
+    switch (argv[i]) {
+      case '--scenarios':
+        scenarios = argv[++i].split(',').map(s => s.trim()) as Scenario[];
+        break;
+      case '--iterations':
+        iterations = parseInt(argv[++i], 10);
+        break;
+      case '--clients':
+        clients = list(argv[++i]);
+        break;
+      case '--payloads':
+        payloads = list(argv[++i]);
+        break;
+      case '--events':
+        events = parseInt(argv[++i], 10);
+        break;
+      case '--stale':
+        stale = parseInt(argv[++i], 10);
+        break;
+      case '--json':
+        json = true;
+        break;
+    }
+  }
+
+  return { scenarios, iterations, clients, payloads, events, stale, json };
+}
+
+function percentile(sorted: number[], p: number): number {
+  if (sorted.length === 0) return 0;
+  const idx = Math.min(sorted.length - 1, Math.ceil((p / 100) * sorted.length) - 1);
+  return sorted[Math.max(0, idx)];
+}
+
+const round = (n: number) => Math.round(n * 100) / 100;
+const elapsedMs = (start: bigint) => Number(process.hrtime.bigint() - start) / 1e6;
+
+/**
+ * Array result of roughly `bytes` serialized bytes (arrays may be written as NDJSON)
+ */
+const payloads = new Map<number, unknown[]>();
+function payloadOf(bytes: number): unknown[] {
+  let payload = payloads.get(bytes);
+  if (!payload) {
+    const text = 'x'.repeat(100);
+    payload = Array.from({ length: Math.max(1, Math.round(bytes / 120)) }, (_, i) => ({ i, text }));
+    payloads.set(bytes, payload);
+  }
+  return payload;
+}
+
+/**
+ * Stub scripts: no-op, fixed-size result, or a stream of progress events
+ */
+async function stubExecutor(command: ExtensionCommand, eventWriter: EventWriter): Promise<{ data: unknown }> {
+  switch (command.scriptName) {
+    case 'bench.payload':
+      return { data: payloadOf(command.params.bytes) };
+    case 'bench.events': {
+      const count: number = command.params.events;
+      for (let i = 0; i < count; i++) {
+        eventWriter.writeProgress(Math.floor((i * 100) / count), `step ${i}`);
+      }
+      return { data: { events: count } };
+    }
+    default:
+      return { data: { pong: true } };
+  }
+}
+
+/**
+ * The extension's bridge services for one workspace, minus VS Code
+ *
+ * Mirrors BridgeManager.setupBridgeServices(): journal and job index,
+ * heartbeat, a watcher that claims and launches jobs as command.json lands,
+ * and the periodic safety scan.
+ */
+class HeadlessHost {
+  private timers: NodeJS.Timeout[] = [];
+  private watcher?: FSWatcher;
+  private index?: InstanceType<typeof jobIndex.JobIndex>;
+  private jobJournal?: InstanceType<typeof journal.JobJournal>;
+
+  readonly executeDir: string;
+  readonly hostJsonPath: string;
+
+  constructor(readonly bridgeDir: string) {
+    this.executeDir = path.join(bridgeDir, 'execute');
+    this.hostJsonPath = path.join(bridgeDir, 'host.json');
+  }
+
+  /**
+   * Prepare a bridge directory the way a previous session left it
+   */
+  static async create(workspace: string): Promise<HeadlessHost> {
+    const host = new HeadlessHost(path.join(workspace, '.vsc-bridge'));
+    await fs.mkdir(host.executeDir, { recursive: true });
+    await fs.writeFile(host.hostJsonPath, JSON.stringify({ bridgeId: BRIDGE_ID, workspace, pid: process.pid }));
+    return host;
+  }
+
+  /**
+   * Replay the journal and index execute/ (startup step 0)
+   */
+  async openIndex(): Promise<void> {
+    this.jobJournal = await journal.JobJournal.open(this.bridgeDir);
+    journal.registerJobJournal(this.jobJournal);
+    this.index = await jobIndex.JobIndex.build(this.executeDir, this.jobJournal);
+    jobIndex.registerJobIndex(this.index);
+    this.index.watch();
+    this.jobJournal.reconcile(this.index.all());
+  }
+
+  /**
+   * Start serving jobs: heartbeat, watcher and safety scan
+   */
+  serve(): void {
+    this.timers.push(bridge.startHealthHeartbeat(this.hostJsonPath));
+
+    this.watcher = watch(this.executeDir, { recursive: true }, (_event, filename) => {
+      if (filename && path.basename(filename.toString()) === 'command.json') {
+        this.onCommand(path.join(this.executeDir, path.dirname(filename.toString())));
+      }
+    });
+
+    const nodeFs = new NodeFilesystem();
+    this.timers.push(setInterval(async () => {
+      const unclaimed = await scanner.scanForUnclaimedJobs(
+        this.executeDir,
+        processor.jobScheduler.runningCount + processor.jobScheduler.queuedCount,
+        processor.jobScheduler.capacity,
+        nodeFs
+      );
+      for (const jobDir of unclaimed) {
+        this.onCommand(jobDir);
+      }
+    }, SAFETY_SCAN_MS));
+  }
+
+  private onCommand(jobDir: string): void {
+    if (!existsSync(path.join(jobDir, 'command.json'))) {
+      return;
+    }
+    jobIndex.noteJobMarker(jobDir, 'command.json');
+    try {
+      if (processor.claimJobAtomic(jobDir, BRIDGE_ID)) {
+        processor.launchJob(jobDir, BRIDGE_ID, stubExecutor);
+      }
+    } catch {
+      // Job directory vanished between the event and the claim
+    }
+  }
+
+  async stop(): Promise<void> {
+    while (processor.jobScheduler.runningCount + processor.jobScheduler.queuedCount > 0) {
+      await new Promise(resolve => setTimeout(resolve, 10));
+    }
+    this.timers.forEach(timer => clearInterval(timer));
+    this.watcher?.close();
+    if (this.index) {
+      jobIndex.unregisterJobIndex(this.index);
+    }
+    if (this.jobJournal) {
+      journal.unregisterJobJournal(this.jobJournal);
+      this.jobJournal.close();
+    }
+  }
+}
+
+/**
+ * Run a workspace with a serving host for the duration of `fn`
+ */
+async function withHost<T>(fn: (host: HeadlessHost) => Promise<T>): Promise<T> {
+  const workspace = await fs.mkdtemp(path.join(os.tmpdir(), 'vscb-headless-'));
+  const host = await HeadlessHost.create(workspace);
+  try {
+    await host.openIndex();
+    host.serve();
+    return await fn(host);
+  } finally {
+    await host.stop();
+    await fs.rm(workspace, { recursive: true, force: true });
+  }
+}
+
+let seq = 0;
+
+/**
+ * One client call through runCommand(); returns its latency and response
+ */
+async function call(
+  host: HeadlessHost,
+  scriptName: string,
+  params: Record<string, unknown>,
+  onEvent?: (event: any) => void
+): Promise<{ ms: number; response: any }> {
+  const payload: CommandJson = {
+    version: 1,
+    clientId: 'bench',
+    id: sortableId(seq++),
+    createdAt: new Date().toISOString(),
+    scriptName,
+    params,
+    timeout: CALL_TIMEOUT_MS
+  };
+  const start = process.hrtime.bigint();
+  const response = await runCommand(host.bridgeDir, payload, { timeout: CALL_TIMEOUT_MS, transport: 'filesystem', onEvent });
+  return { ms: elapsedMs(start), response };
+}
+
+/**
+ * `calls` calls spread over `clients` concurrent callers
+ */
+async function load(
+  scenario: LoadResult['scenario'],
+  clients: number,
+  calls: number,
+  makeCall: (host: HeadlessHost) => Promise<{ ms: number; ok: boolean }>
+): Promise<LoadResult> {
+  return withHost(async host => {
+    processor.resetFloodProtection();
+    // Warm up module caches and the first watcher registration
+    await makeCall(host);
+
+    const samples: number[] = [];
+    let failures = 0;
+    let next = 0;
+    const start = process.hrtime.bigint();
+    await Promise.all(Array.from({ length: clients }, async () => {
+      while (next++ < calls) {
+        const { ms, ok } = await makeCall(host);
+        samples.push(ms);
+        if (!ok) failures++;
+      }
+    }));
+    const wallMs = elapsedMs(start);
+
+    const sorted = [...samples].sort((a, b) => a - b);
+    return {
+      scenario,
+      clients,
+      calls: samples.length,
+      failures,
+      p50Ms: round(percentile(sorted, 50)),
+      p95Ms: round(percentile(sorted, 95)),
+      p99Ms: round(percentile(sorted, 99)),
+      meanMs: round(samples.reduce((a, b) => a + b, 0) / Math.max(1, samples.length)),
+      maxMs: round(sorted[sorted.length - 1] ?? 0),
+      callsPerSec: round((samples.length * 1000) / wallMs)
+    };
+  });
+}
+
+async function benchPayload(bytes: number, iterations: number): Promise<LoadResult> {
+  const expected = payloadOf(bytes).length;
+  const result = await load('payload', 1, iterations, async host => {
+    const { ms, response } = await call(host, 'bench.payload', { bytes });
+    return { ms, ok: response.ok === true && Array.isArray(response.data) && response.data.length === expected };
+  });
+  const serialized = Buffer.byteLength(JSON.stringify(payloadOf(bytes)));
+  return { ...result, payloadBytes: serialized, mbPerSec: round((result.callsPerSec * serialized) / (1024 * 1024)) };
+}
+
+async function benchEvents(events: number, iterations: number): Promise<LoadResult> {
+  const result = await load('events', 1, iterations, async host => {
+    let received = 0;
+    const { ms, response } = await call(host, 'bench.events', { events }, event => {
+      if (event.type === 'progress') received++;
+    });
+    return { ms, ok: response.ok === true && received === events };
+  });
+  return { ...result, eventsPerJob: events, eventsPerSec: round(result.callsPerSec * events) };
+}
+
+/**
+ * Leave `count` jobs claimed by a dead host whose lease expired long ago
+ */
+async function populateStaleJobs(executeDir: string, count: number): Promise<void> {
+  const claimedAt = new Date(Date.now() - 24 * 60 * 60 * 1000).toISOString();
+  const BATCH = 256;
+  for (let start = 0; start < count; start += BATCH) {
+    const jobs: Promise<void>[] = [];
+    for (let i = start; i < Math.min(count, start + BATCH); i++) {
+      jobs.push((async () => {
+        const id = `20250101T000000000Z-${String(i).padStart(6, '0')}`;
+        const jobDir = path.join(executeDir, id);
+        await fs.mkdir(jobDir);
+        const command = { version: 1, clientId: 'crashed', id, createdAt: claimedAt, scriptName: 'bench.noop', params: {} };
+        await fs.writeFile(path.join(jobDir, 'command.json'), JSON.stringify(command));
+        await fs.writeFile(path.join(jobDir, 'claimed.json'), JSON.stringify({ bridgeId: 'crashed-host', claimedAt, pid: 2 ** 22 + 1 }));
+      })());
+    }
+    await Promise.all(jobs);
+  }
+}
+
+/**
+ * Extension startup over stale jobs, in BridgeManager.setupBridgeServices() order
+ */
+async function benchRecovery(staleJobs: number): Promise<RecoveryResult> {
+  const workspace = await fs.mkdtemp(path.join(os.tmpdir(), 'vscb-headless-'));
+  const host = await HeadlessHost.create(workspace);
+  await populateStaleJobs(host.executeDir, staleJobs);
+
+  const timed = async <T>(fn: () => Promise<T>): Promise<[T, number]> => {
+    const start = process.hrtime.bigint();
+    const value = await fn();
+    return [value, round(elapsedMs(start))];
+  };
+
+  try {
+    const startup = process.hrtime.bigint();
+    const [, indexMs] = await timed(() => host.openIndex());
+    const [crash, crashDetectMs] = await timed(() => recovery.detectCrashedJobs(host.executeDir, BRIDGE_ID));
+    const [, cleanPendingMs] = await timed(() => recovery.cleanAllPendingJobs(host.executeDir));
+    const [, cleanOrphansMs] = await timed(() => recovery.cleanOrphanedJobs(host.executeDir));
+    const [recovered, recoverMs] = await timed(() =>
+      recovery.recoverStaleJobs(host.executeDir, BRIDGE_ID, 60000, stubExecutor)
+    );
+    host.serve();
+    const [first, firstCallMs] = await timed(() => call(host, 'bench.noop', {}));
+    const startupMs = round(elapsedMs(startup));
+    if (first.response.ok !== true) {
+      throw new Error(`First call after recovery failed: ${JSON.stringify(first.response)}`);
+    }
+
+    // Everything is finished now; collect it all
+    const [gc, gcMs] = await timed(() => cleaner.cleanOldJobs(host.executeDir, 0));
+
+    return {
+      scenario: 'recovery',
+      staleJobs,
+      indexMs,
+      crashDetectMs,
+      cleanPendingMs,
+      cleanOrphansMs,
+      recoverMs,
+      firstCallMs,
+      gcMs,
+      startupMs,
+      quarantined: crash.quarantined,
+      recovered: recovered.recovered,
+      collected: gc.deleted,
+      recoveredPerSec: round((recovered.recovered * 1000) / Math.max(1, recoverMs))
+    };
+  } finally {
+    await host.stop();
+    await fs.rm(workspace, { recursive: true, force: true });
+  }
+}
+
+async function main(): Promise<void> {
+  const opts = parseArgs(process.argv.slice(2));
+  const print = console.log;
+  // The processor logs every job; keep the output to the results
+  console.log = console.info = console.warn = () => {};
+
+  const results: Array<LoadResult | RecoveryResult> = [];
+  const noop = (host: HeadlessHost) => call(host, 'bench.noop', {}).then(({ ms, response }) => ({ ms, ok: response.ok === true }));
+
+  if (opts.scenarios.includes('single')) {
+    results.push(await load('single', 1, opts.iterations, noop));
+  }
+  if (opts.scenarios.includes('concurrent')) {
+    for (const clients of opts.clients) {
+      results.push(await load('concurrent', clients, Math.max(opts.iterations, clients), noop));
+    }
+  }
+  if (opts.scenarios.includes('payload')) {
+    for (const bytes of opts.payloads) {
+      results.push(await benchPayload(bytes, Math.max(1, Math.ceil(opts.iterations / 10))));
+    }
+  }
+  if (opts.scenarios.includes('events')) {
+    results.push(await benchEvents(opts.events, Math.max(1, Math.ceil(opts.iterations / 10))));
+  }
+  if (opts.scenarios.includes('recovery')) {
+    results.push(await benchRecovery(opts.stale));
+  }
+
+  if (opts.json) {
+    print(JSON.stringify({ platform: process.platform, node: process.version, results }, null, 2));
+    return;
+  }
+
+  print(`Headless fs-bridge (${process.platform}, node ${process.version})\n`);
+  print('scenario    clients  size/events   calls  failed  p50 (ms)  p95 (ms)  p99 (ms)  calls/s');
+  for (const r of results) {
+    if (r.scenario === 'recovery') continue;
+    const detail = r.payloadBytes ?? r.eventsPerJob ?? '';
+    print(
+      `${r.scenario.padEnd(10)}  ${String(r.clients).padStart(7)}  ${String(detail).padStart(11)}  ${String(r.calls).padStart(6)}  ` +
+      `${String(r.failures).padStart(6)}  ${String(r.p50Ms).padStart(8)}  ${String(r.p95Ms).padStart(8)}  ` +
+      `${String(r.p99Ms).padStart(8)}  ${String(r.callsPerSec).padStart(7)}`
+    );
+  }
+  for (const r of results) {
+    if (r.scenario !== 'recovery') continue;
+    print(`\nRecovery over ${r.staleJobs} stale jobs (startup ${r.startupMs} ms)`);
+    print(`  index ${r.indexMs} ms, crash detection ${r.crashDetectMs} ms (${r.quarantined} quarantined)`);
+    print(`  clean pending ${r.cleanPendingMs} ms, clean orphans ${r.cleanOrphansMs} ms`);
+    print(`  recover ${r.recoverMs} ms (${r.recovered} recovered, ${r.recoveredPerSec}/s)`);
+    print(`  first call ${r.firstCallMs} ms, GC ${r.gcMs} ms (${r.collected} collected)`);
+  }
+}
+
+main().then(() => process.exit(0), err => {
+  console.error(err);
+  process.exit(1);
+});
@@ -0,0 +1,197 @@
+#!/usr/bin/env npx tsx
+/**
+ * vscb CLI Startup Benchmark
+ *
+ * Spawns the built CLI (dist/index.js) repeatedly and measures wall-clock time
+ * per invocation for `vscb --help` and `vscb script run debug.status`. The
+ * script run goes against a fake bridge in a temp workspace that answers each
+ * job as soon as command.json lands, so the numbers are dominated by process
+ * start, command loading and manifest/metadata resolution.
+ *
+ * Each case is timed twice: 'cold' with an empty metadata cache before every
+ * run (VSC_BRIDGE_NO_CACHE=1) and 'warm' with a cache populated by a first,
+ * untimed run.
+ *
+ * Build the CLI first (npm run build:cli).
+ *
+ * Usage:
+ *   npx tsx scripts/bench/cli-startup.ts [options]
+ *
+ * Options:
+ *   --iterations <n>  Runs per case and cache mode (default: 20)
+ *   --cli <path>      CLI entry point (default: dist/index.js)
+ *   --json            Output results as JSON
+ *
+ * @module scripts/bench/cli-startup
+ */
+
+import { spawn } from 'child_process';
+import { promises as fs } from 'fs';
+import * as os from 'os';
+import * as path from 'path';
+
+type CacheMode = 'cold' | 'warm';
+
+interface CaseResult {
+  name: string;
+  cache: CacheMode;
+  iterations: number;
+  failures: number;
+  p50Ms: number;
+  p95Ms: number;
+  meanMs: number;
+  maxMs: number;
+}
+
+const CASES: { name: string; args: string[] }[] = [
+  { name: '--help', args: ['--help'] },
+  { name: 'script run debug.status', args: ['script', 'run', 'debug.status'] },
+];
+
+function parseArgs(argv: string[]): { iterations: number; cli: string; json: boolean } {
+  let iterations = 20;
+  let cli = path.resolve('dist', 'index.js');
+  let json = false;
+
+  for (let i = 0; i < argv.length; i++) {
+    const arg = argv[i];
+    if (arg === '--iterations') {
+      iterations = parseInt(argv[++i], 10);
+    } else if (arg === '--cli') {
+      cli = path.resolve(argv[++i]);
+    } else if (arg === '--json') {
+      json = true;
+    }
+  }
+
+  return { iterations, cli, json };
+}
+
+function percentile(sorted: number[], p: number): number {
+  if (sorted.length === 0) return 0;
+  const idx = Math.min(sorted.length - 1, Math.ceil((p / 100) * sorted.length) - 1);
+  return sorted[Math.max(0, idx)];
+}
+
+/**
+ * Answer every job the CLI submits, like an idle extension would
+ *
+ * @returns stop function
+ */
+function startFakeBridge(executeDir: string): () => void {
+  const answered = new Set<string>();
+  const timer = setInterval(async () => {
+    let jobs: string[];
+    try {
+      jobs = await fs.readdir(executeDir);
+    } catch {
+      return;
+    }
+    for (const id of jobs) {
+      if (answered.has(id)) continue;
+      const jobDir = path.join(executeDir, id);
+      try {
+        await fs.access(path.join(jobDir, 'command.json'));
+      } catch {
+        continue;
+      }
+      answered.add(id);
+      await fs.writeFile(path.join(jobDir, 'claimed.json'), JSON.stringify({ bridgeId: 'bench', pid: process.pid }));
+      await fs.writeFile(path.join(jobDir, 'response.json'), JSON.stringify({ ok: true, type: 'success', data: { isActive: false } }));
+      await fs.writeFile(path.join(jobDir, 'done'), '');
+    }
+  }, 2);
+  return () => clearInterval(timer);
+}
+
+function runCli(cli: string, args: string[], cwd: string, env: NodeJS.ProcessEnv): Promise<{ ms: number; code: number | null }> {
+  return new Promise((resolve, reject) => {
+    const start = process.hrtime.bigint();
+    const child = spawn(process.execPath, [cli, ...args], { cwd, env, stdio: 'ignore' });
+    child.on('error', reject);
+    child.on('exit', code => resolve({ ms: Number(process.hrtime.bigint() - start) / 1e6, code }));
+  });
+}
+
+async function benchCase(
+  cli: string,
+  testCase: { name: string; args: string[] },
+  cache: CacheMode,
+  iterations: number,
+  cwd: string,
+  cacheDir: string
+): Promise<CaseResult> {
+  const env: NodeJS.ProcessEnv = { ...process.env, VSC_BRIDGE_CACHE_DIR: cacheDir };
+  if (cache === 'cold') {
+    env.VSC_BRIDGE_NO_CACHE = '1';
+  } else {
+    delete env.VSC_BRIDGE_NO_CACHE;
+    await runCli(cli, testCase.args, cwd, env);
+  }
+
+  const samples: number[] = [];
+  let failures = 0;
+  for (let i = 0; i < iterations; i++) {
+    const { ms, code } = await runCli(cli, testCase.args, cwd, env);
+    samples.push(ms);
+    if (code !== 0) failures++;
+  }
+
+  const sorted = [...samples].sort((a, b) => a - b);
+  const round = (n: number) => Math.round(n * 100) / 100;
+  return {
+    name: testCase.name,
+    cache,
+    iterations,
+    failures,
+    p50Ms: round(percentile(sorted, 50)),
+    p95Ms: round(percentile(sorted, 95)),
+    meanMs: round(samples.reduce((a, b) => a + b, 0) / samples.length),
+    maxMs: round(sorted[sorted.length - 1])
+  };
+}
+
+async function main(): Promise<void> {
+  const { iterations, cli, json } = parseArgs(process.argv.slice(2));
+  await fs.access(cli).catch(() => {
+    throw new Error(`CLI not found at ${cli}; run 'npm run build:cli' first`);
+  });
+
+  const workspace = await fs.mkdtemp(path.join(os.tmpdir(), 'vscb-startup-'));
+  const bridgeDir = path.join(workspace, '.vsc-bridge');
+  const executeDir = path.join(bridgeDir, 'execute');
+  await fs.mkdir(executeDir, { recursive: true });
+  await fs.writeFile(path.join(bridgeDir, 'host.json'), JSON.stringify({ bridgeId: 'bench', workspace, pid: process.pid }));
+  const stopBridge = startFakeBridge(executeDir);
+
+  try {
+    const results: CaseResult[] = [];
+    for (const testCase of CASES) {
+      for (const cache of ['cold', 'warm'] as CacheMode[]) {
+        results.push(await benchCase(cli, testCase, cache, iterations, workspace, path.join(workspace, 'cache')));
+      }
+    }
+
+    if (json) {
+      console.log(JSON.stringify({ platform: process.platform, node: process.version, results }, null, 2));
+      return;
+    }
+
+    console.log(`vscb startup (${iterations} runs per case, ${process.platform}, node ${process.version})\n`);
+    console.log('case                       cache   p50 (ms)   p95 (ms)   mean (ms)   max (ms)   failed');
+    for (const r of results) {
+      console.log(
+        `${r.name.padEnd(25)}  ${r.cache.padEnd(5)}  ${String(r.p50Ms).padStart(9)}   ${String(r.p95Ms).padStart(8)}   ` +
+        `${String(r.meanMs).padStart(9)}   ${String(r.maxMs).padStart(8)}   ${String(r.failures).padStart(6)}`
+      );
+    }
+  } finally {
+    stopBridge();
+    await fs.rm(workspace, { recursive: true, force: true });
+  }
+}
+
+main().catch(err => {
+  console.error(err);
+  process.exit(1);
+});
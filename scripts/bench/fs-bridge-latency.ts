@@ -0,0 +1,158 @@
+#!/usr/bin/env npx tsx
+/**
+ * fs-bridge Client Wait-Mode Latency Comparison
+ *
+ * Measures CLI round-trip latency of runCommand() against an in-process fake
+ * extension that answers as soon as command.json lands. Because the responder
+ * does no work, the numbers isolate the client's wait overhead: legacy
+ * fixed-interval polling ('poll') versus fs.watch notifications ('watch').
+ *
+ * Usage:
+ *   npx tsx scripts/bench/fs-bridge-latency.ts [options]
+ *
+ * Options:
+ *   --iterations <n>  Round-trips per mode (default: 200)
+ *   --modes <list>    Comma-separated wait modes (default: poll,watch)
+ *   --json            Output results as JSON
+ *
+ * @module scripts/bench/fs-bridge-latency
+ */
+
+import { promises as fs, watch } from 'fs';
+import * as os from 'os';
+import * as path from 'path';
+import { runCommand, sortableId, type CommandJson, type WaitMode } from '../../src/lib/fs-bridge.js';
+
+interface ModeResult {
+  mode: WaitMode;
+  iterations: number;
+  p50Ms: number;
+  p99Ms: number;
+  meanMs: number;
+  maxMs: number;
+}
+
+function parseArgs(argv: string[]): { iterations: number; modes: WaitMode[]; json: boolean } {
+  let iterations = 200;
+  let modes: WaitMode[] = ['poll', 'watch'];
+  let json = false;
+
+  for (let i = 0; i < argv.length; i++) {
+    const arg = argv[i];
+    if (arg === '--iterations') {
+      iterations = parseInt(argv[++i], 10);
+    } else if (arg === '--modes') {
+      modes = argv[++i].split(',') as WaitMode[];
+    } else if (arg === '--json') {
+      json = true;
+    }
+  }
+
+  return { iterations, modes, json };
+}
+
+function percentile(sorted: number[], p: number): number {
+  if (sorted.length === 0) return 0;
+  const idx = Math.min(sorted.length - 1, Math.ceil((p / 100) * sorted.length) - 1);
+  return sorted[Math.max(0, idx)];
+}
+
+/**
+ * Answer a single job the moment its command.json appears
+ */
+function respondWhenCommandLands(jobDir: string): Promise<void> {
+  return new Promise((resolve, reject) => {
+    let answered = false;
+    const watcher = watch(jobDir, async (_event, filename) => {
+      if (answered || filename?.toString() !== 'command.json') return;
+      answered = true;
+      watcher.close();
+      try {
+        await fs.writeFile(path.join(jobDir, 'claimed.json'), JSON.stringify({ bridgeId: 'bench', pid: process.pid }));
+        await fs.writeFile(path.join(jobDir, 'response.json'), JSON.stringify({ ok: true, type: 'success', data: { pong: true } }));
+        await fs.writeFile(path.join(jobDir, 'done'), '');
+        resolve();
+      } catch (err) {
+        reject(err);
+      }
+    });
+  });
+}
+
+async function benchMode(bridgeDir: string, mode: WaitMode, iterations: number): Promise<ModeResult> {
+  const samples: number[] = [];
+
+  for (let i = 0; i < iterations; i++) {
+    const id = sortableId(i);
+    const jobDir = path.join(bridgeDir, 'execute', id);
+    await fs.mkdir(jobDir, { recursive: true });
+    const responder = respondWhenCommandLands(jobDir);
+
+    const payload: CommandJson = {
+      version: 1,
+      clientId: 'bench',
+      id,
+      createdAt: new Date().toISOString(),
+      scriptName: 'debug.status',
+      params: {}
+    };
+
+    const start = process.hrtime.bigint();
+    const response = await runCommand(bridgeDir, payload, { timeout: 10000, waitMode: mode });
+    samples.push(Number(process.hrtime.bigint() - start) / 1e6);
+    await responder;
+
+    if (!response.ok) {
+      throw new Error(`Round-trip failed in ${mode} mode: ${JSON.stringify(response)}`);
+    }
+
+    await fs.rm(jobDir, { recursive: true, force: true });
+  }
+
+  const sorted = [...samples].sort((a, b) => a - b);
+  const round = (n: number) => Math.round(n * 100) / 100;
+  return {
+    mode,
+    iterations,
+    p50Ms: round(percentile(sorted, 50)),
+    p99Ms: round(percentile(sorted, 99)),
+    meanMs: round(samples.reduce((a, b) => a + b, 0) / samples.length),
+    maxMs: round(sorted[sorted.length - 1])
+  };
+}
+
+async function main(): Promise<void> {
+  const { iterations, modes, json } = parseArgs(process.argv.slice(2));
+
+  const tempDir = await fs.mkdtemp(path.join(os.tmpdir(), 'vscb-latency-'));
+  const bridgeDir = path.join(tempDir, '.vsc-bridge');
+  await fs.mkdir(path.join(bridgeDir, 'execute'), { recursive: true });
+  await fs.writeFile(path.join(bridgeDir, 'host.json'), JSON.stringify({ bridgeId: 'bench', pid: process.pid }));
+
+  try {
+    const results: ModeResult[] = [];
+    for (const mode of modes) {
+      results.push(await benchMode(bridgeDir, mode, iterations));
+    }
+
+    if (json) {
+      console.log(JSON.stringify({ platform: process.platform, node: process.version, results }, null, 2));
+      return;
+    }
+
+    console.log(`fs-bridge round-trip latency (${iterations} iterations, ${process.platform}, node ${process.version})\n`);
+    console.log('mode    p50 (ms)   p99 (ms)   mean (ms)   max (ms)');
+    for (const r of results) {
+      console.log(
+        `${r.mode.padEnd(6)}  ${String(r.p50Ms).padStart(8)}   ${String(r.p99Ms).padStart(8)}   ${String(r.meanMs).padStart(9)}   ${String(r.maxMs).padStart(8)}`
+      );
+    }
+  } finally {
+    await fs.rm(tempDir, { recursive: true, force: true });
+  }
+}
+
+main().catch(err => {
+  console.error(err);
+  process.exit(1);
+});
@@ -0,0 +1,204 @@
+#!/usr/bin/env npx tsx
+/**
+ * fs-bridge Job Index vs Directory Walk
+ *
+ * Populates a temp execute/ directory with N retained job directories (a mix
+ * of done, DLQ, kept and a few unclaimed jobs) and compares the per-pass cost
+ * of the extension's periodic scans when they walk the tree against the same
+ * lookups served from JobIndex.
+ *
+ * The walk replicates the marker checks scanForUnclaimedJobs() and
+ * getJobStats() perform per job (those modules import vscode, so they are not
+ * loaded here). The indexed pass is what the safety scan does with a live
+ * index: one reconcile() readdir plus in-memory lookups.
+ *
+ * Usage:
+ *   npx tsx scripts/bench/job-index.ts [options]
+ *
+ * Options:
+ *   --sizes <list>    Comma-separated job counts (default: 1000,10000,50000)
+ *   --passes <n>      Scan passes timed per size (default: 10)
+ *   --json            Output results as JSON
+ *
+ * @module scripts/bench/job-index
+ */
+
+import { promises as fs } from 'fs';
+import * as os from 'os';
+import * as path from 'path';
+import { JobIndex } from '../../packages/extension/src/core/fs-bridge/job-index';
+
+interface SizeResult {
+  jobs: number;
+  buildMs: number;
+  walkScanMs: number;
+  walkStatsMs: number;
+  indexScanMs: number;
+  indexStatsMs: number;
+  speedup: number;
+}
+
+function parseArgs(argv: string[]): { sizes: number[]; passes: number; json: boolean } {
+  let sizes = [1000, 10000, 50000];
+  let passes = 10;
+  let json = false;
+
+  for (let i = 0; i < argv.length; i++) {
+    const arg = argv[i];
+    if (arg === '--sizes') {
+      sizes = argv[++i].split(',').map(n => parseInt(n, 10));
+    } else if (arg === '--passes') {
+      passes = parseInt(argv[++i], 10);
+    } else if (arg === '--json') {
+      json = true;
+    }
+  }
+
+  return { sizes, passes, json };
+}
+
+async function exists(filePath: string): Promise<boolean> {
+  try {
+    await fs.access(filePath);
+    return true;
+  } catch {
+    return false;
+  }
+}
+
+/**
+ * Create `count` job directories; ~1% unclaimed, 2% DLQ, 1% kept, rest done
+ */
+async function populate(executeDir: string, count: number): Promise<void> {
+  const BATCH = 256;
+  for (let start = 0; start < count; start += BATCH) {
+    const jobs: Promise<void>[] = [];
+    for (let i = start; i < Math.min(count, start + BATCH); i++) {
+      jobs.push((async () => {
+        const jobDir = path.join(executeDir, `job-${String(i).padStart(6, '0')}`);
+        await fs.mkdir(jobDir);
+        await fs.writeFile(path.join(jobDir, 'command.json'), '{}');
+        if (i % 100 === 0) return;
+        await fs.writeFile(path.join(jobDir, 'claimed.json'), '{}');
+        if (i % 50 === 1) {
+          await fs.writeFile(path.join(jobDir, 'dlq'), '{}');
+          return;
+        }
+        await fs.writeFile(path.join(jobDir, 'response.json'), '{}');
+        await fs.writeFile(path.join(jobDir, 'done'), '');
+        if (i % 100 === 2) {
+          await fs.writeFile(path.join(jobDir, 'keep'), '');
+        }
+      })());
+    }
+    await Promise.all(jobs);
+  }
+}
+
+/**
+ * scanForUnclaimedJobs() marker sequence
+ */
+async function walkScan(executeDir: string): Promise<number> {
+  let unclaimed = 0;
+  for (const entry of await fs.readdir(executeDir, { withFileTypes: true })) {
+    if (!entry.isDirectory()) continue;
+    const jobDir = path.join(executeDir, entry.name);
+    if (!await exists(path.join(jobDir, 'command.json'))) continue;
+    if (await exists(path.join(jobDir, 'dlq'))) continue;
+    if (await exists(path.join(jobDir, 'claimed.json'))) continue;
+    if (await exists(path.join(jobDir, 'done'))) continue;
+    unclaimed++;
+  }
+  return unclaimed;
+}
+
+/**
+ * getJobStats() marker sequence
+ */
+async function walkStats(executeDir: string): Promise<number> {
+  let completed = 0;
+  for (const entry of await fs.readdir(executeDir, { withFileTypes: true })) {
+    if (!entry.isDirectory()) continue;
+    const jobDir = path.join(executeDir, entry.name);
+    try {
+      await fs.stat(path.join(jobDir, 'done'));
+      completed++;
+    } catch {
+      // incomplete
+    }
+    await exists(path.join(jobDir, 'keep'));
+  }
+  return completed;
+}
+
+async function timePasses(passes: number, fn: () => Promise<unknown> | unknown): Promise<number> {
+  const start = process.hrtime.bigint();
+  for (let i = 0; i < passes; i++) {
+    await fn();
+  }
+  return Number(process.hrtime.bigint() - start) / 1e6 / passes;
+}
+
+async function benchSize(jobs: number, passes: number): Promise<SizeResult> {
+  const tempDir = await fs.mkdtemp(path.join(os.tmpdir(), 'vscb-job-index-'));
+  const executeDir = path.join(tempDir, 'execute');
+  await fs.mkdir(executeDir);
+
+  try {
+    await populate(executeDir, jobs);
+
+    const buildStart = process.hrtime.bigint();
+    const index = await JobIndex.build(executeDir);
+    const buildMs = Number(process.hrtime.bigint() - buildStart) / 1e6;
+
+    const walkScanMs = await timePasses(passes, () => walkScan(executeDir));
+    const walkStatsMs = await timePasses(passes, () => walkStats(executeDir));
+    const indexScanMs = await timePasses(passes, async () => {
+      await index.reconcile();
+      return index.unclaimedJobDirs();
+    });
+    const indexStatsMs = await timePasses(passes, () => index.counts());
+
+    const round = (n: number) => Math.round(n * 100) / 100;
+    return {
+      jobs,
+      buildMs: round(buildMs),
+      walkScanMs: round(walkScanMs),
+      walkStatsMs: round(walkStatsMs),
+      indexScanMs: round(indexScanMs),
+      indexStatsMs: round(indexStatsMs),
+      speedup: round(walkScanMs / Math.max(indexScanMs, 0.001))
+    };
+  } finally {
+    await fs.rm(tempDir, { recursive: true, force: true });
+  }
+}
+
+async function main(): Promise<void> {
+  const { sizes, passes, json } = parseArgs(process.argv.slice(2));
+
+  const results: SizeResult[] = [];
+  for (const size of sizes) {
+    results.push(await benchSize(size, passes));
+  }
+
+  if (json) {
+    console.log(JSON.stringify({ platform: process.platform, node: process.version, passes, results }, null, 2));
+    return;
+  }
+
+  console.log(`Job index vs directory walk (${passes} passes per size, ${process.platform}, node ${process.version})\n`);
+  console.log('   jobs   build (ms)   walk scan   walk stats   index scan   index stats   scan speedup');
+  for (const r of results) {
+    console.log(
+      `${String(r.jobs).padStart(7)}   ${String(r.buildMs).padStart(10)}   ${String(r.walkScanMs).padStart(9)}   ` +
+      `${String(r.walkStatsMs).padStart(10)}   ${String(r.indexScanMs).padStart(10)}   ` +
+      `${String(r.indexStatsMs).padStart(11)}   ${String(r.speedup).padStart(11)}x`
+    );
+  }
+}
+
+main().catch(err => {
+  console.error(err);
+  process.exit(1);
+});
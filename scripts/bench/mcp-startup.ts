@@ -0,0 +1,215 @@
+#!/usr/bin/env npx tsx
+/**
+ * vscb MCP Cold-Start Benchmark
+ *
+ * Spawns `vscb mcp` repeatedly and measures wall-clock time from process
+ * spawn to the first `tools/list` response (initialize → initialized →
+ * tools/list over stdio), which is what an agent waits for before it can
+ * call any tool.
+ *
+ * Each run is timed twice:
+ * - 'catalog': the manifest in dist/ with the precomputed dist/mcp-catalog.json
+ * - 'generated': a copy of the manifest in a temp directory without a catalog,
+ *   so tools are generated and every doc is parsed at startup
+ *
+ * Build the CLI first (npm run build:cli), which also writes the catalog.
+ *
+ * Usage:
+ *   npx tsx scripts/bench/mcp-startup.ts [options]
+ *
+ * Options:
+ *   --iterations <n>  Runs per mode (default: 20)
+ *   --cli <path>      CLI entry point (default: dist/index.js)
+ *   --json            Output results as JSON
+ *
+ * @module scripts/bench/mcp-startup
+ */
+
+import { spawn } from 'child_process';
+import { promises as fs } from 'fs';
+import * as os from 'os';
+import * as path from 'path';
+
+type CatalogMode = 'catalog' | 'generated';
+
+interface ModeResult {
+  mode: CatalogMode;
+  iterations: number;
+  failures: number;
+  tools: number;
+  p50Ms: number;
+  p95Ms: number;
+  meanMs: number;
+  maxMs: number;
+}
+
+function parseArgs(argv: string[]): { iterations: number; cli: string; json: boolean } {
+  let iterations = 20;
+  let cli = path.resolve('dist', 'index.js');
+  let json = false;
+
+  for (let i = 0; i < argv.length; i++) {
+    const arg = argv[i];
+    if (arg === '--iterations') {
+      iterations = parseInt(argv[++i], 10);
+    } else if (arg === '--cli') {
+      cli = path.resolve(argv[++i]);
+    } else if (arg === '--json') {
+      json = true;
+    }
+  }
+
+  return { iterations, cli, json };
+}
+
+function percentile(sorted: number[], p: number): number {
+  if (sorted.length === 0) return 0;
+  const idx = Math.min(sorted.length - 1, Math.ceil((p / 100) * sorted.length) - 1);
+  return sorted[Math.max(0, idx)];
+}
+
+/**
+ * Start `vscb mcp`, list its tools and stop it
+ *
+ * @returns time to the tools/list response and the number of tools listed
+ */
+function timeToToolsList(
+  cli: string,
+  workspace: string,
+  env: NodeJS.ProcessEnv
+): Promise<{ ms: number; tools: number }> {
+  return new Promise((resolve, reject) => {
+    const start = process.hrtime.bigint();
+    const child = spawn(process.execPath, [cli, 'mcp', '--workspace', workspace], {
+      cwd: workspace,
+      env,
+      stdio: ['pipe', 'pipe', 'ignore']
+    });
+    const send = (message: object) => child.stdin.write(JSON.stringify({ jsonrpc: '2.0', ...message }) + '\n');
+    const timer = setTimeout(() => {
+      child.kill();
+      reject(new Error('No tools/list response within 30s'));
+    }, 30000);
+
+    let buffered = '';
+    child.stdout.setEncoding('utf8');
+    child.stdout.on('data', (chunk: string) => {
+      buffered += chunk;
+      let newline: number;
+      while ((newline = buffered.indexOf('\n')) >= 0) {
+        const line = buffered.slice(0, newline);
+        buffered = buffered.slice(newline + 1);
+        const message = JSON.parse(line);
+        if (message.id === 1) {
+          send({ method: 'notifications/initialized' });
+          send({ id: 2, method: 'tools/list', params: {} });
+        } else if (message.id === 2) {
+          const ms = Number(process.hrtime.bigint() - start) / 1e6;
+          clearTimeout(timer);
+          child.kill();
+          resolve({ ms, tools: message.result?.tools?.length ?? 0 });
+        }
+      }
+    });
+    child.on('error', reject);
+    child.on('exit', code => {
+      clearTimeout(timer);
+      reject(new Error(`vscb mcp exited with code ${code} before tools/list`));
+    });
+
+    send({
+      id: 1,
+      method: 'initialize',
+      params: {
+        protocolVersion: '2025-06-18',
+        capabilities: {},
+        clientInfo: { name: 'mcp-startup-bench', version: '1.0.0' }
+      }
+    });
+  });
+}
+
+async function benchMode(
+  cli: string,
+  mode: CatalogMode,
+  manifestPath: string,
+  iterations: number,
+  workspace: string
+): Promise<ModeResult> {
+  const env: NodeJS.ProcessEnv = { ...process.env, VSC_BRIDGE_MANIFEST_PATH: manifestPath };
+
+  const samples: number[] = [];
+  let failures = 0;
+  let tools = 0;
+  for (let i = 0; i < iterations; i++) {
+    try {
+      const run = await timeToToolsList(cli, workspace, env);
+      samples.push(run.ms);
+      tools = run.tools;
+    } catch {
+      failures++;
+    }
+  }
+
+  const sorted = [...samples].sort((a, b) => a - b);
+  const round = (n: number) => Math.round(n * 100) / 100;
+  return {
+    mode,
+    iterations,
+    failures,
+    tools,
+    p50Ms: round(percentile(sorted, 50)),
+    p95Ms: round(percentile(sorted, 95)),
+    meanMs: round(samples.length ? samples.reduce((a, b) => a + b, 0) / samples.length : 0),
+    maxMs: round(sorted[sorted.length - 1] ?? 0)
+  };
+}
+
+async function main(): Promise<void> {
+  const { iterations, cli, json } = parseArgs(process.argv.slice(2));
+  await fs.access(cli).catch(() => {
+    throw new Error(`CLI not found at ${cli}; run 'npm run build:cli' first`);
+  });
+  const distManifest = path.join(path.dirname(cli), 'manifest.json');
+  await fs.access(path.join(path.dirname(cli), 'mcp-catalog.json')).catch(() => {
+    throw new Error(`No mcp-catalog.json next to ${distManifest}; run 'npm run build:cli' first`);
+  });
+
+  const workspace = await fs.mkdtemp(path.join(os.tmpdir(), 'vscb-mcp-startup-'));
+  const bridgeDir = path.join(workspace, '.vsc-bridge');
+  await fs.mkdir(path.join(bridgeDir, 'execute'), { recursive: true });
+  await fs.writeFile(path.join(bridgeDir, 'host.json'), JSON.stringify({ bridgeId: 'bench', workspace, pid: process.pid }));
+
+  // Same manifest without a catalog next to it
+  const uncatalogued = path.join(workspace, 'manifest', 'manifest.json');
+  await fs.mkdir(path.dirname(uncatalogued));
+  await fs.copyFile(distManifest, uncatalogued);
+
+  try {
+    const results: ModeResult[] = [
+      await benchMode(cli, 'catalog', distManifest, iterations, workspace),
+      await benchMode(cli, 'generated', uncatalogued, iterations, workspace)
+    ];
+
+    if (json) {
+      console.log(JSON.stringify({ platform: process.platform, node: process.version, results }, null, 2));
+      return;
+    }
+
+    console.log(`vscb mcp → first tools/list (${iterations} runs per mode, ${process.platform}, node ${process.version})\n`);
+    console.log('mode        tools   p50 (ms)   p95 (ms)   mean (ms)   max (ms)   failed');
+    for (const r of results) {
+      console.log(
+        `${r.mode.padEnd(10)}  ${String(r.tools).padStart(5)}  ${String(r.p50Ms).padStart(9)}   ${String(r.p95Ms).padStart(8)}   ` +
+        `${String(r.meanMs).padStart(9)}   ${String(r.maxMs).padStart(8)}   ${String(r.failures).padStart(6)}`
+      );
+    }
+  } finally {
+    await fs.rm(workspace, { recursive: true, force: true });
+  }
+}
+
+main().catch(err => {
+  console.error(err);
+  process.exit(1);
+});
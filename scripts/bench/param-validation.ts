@@ -0,0 +1,182 @@
+#!/usr/bin/env npx tsx
+/**
+ * Parameter Validation Micro-Benchmark
+ *
+ * Validates a representative set of params for every script in the manifest
+ * and reports the per-call cost of:
+ * - 'compile': compiling the validator on every call (alias map, field checks
+ *   and regexes rebuilt each time, like validateParams() before validators were cached)
+ * - 'cached': the validator shared through getValidator()
+ * - 'zod': the extension's generated zod schema, which the extension now skips
+ *   when the client sends a matching paramsSchemaHash
+ *
+ * Sample params give every parameter a valid value (numbers as strings, so
+ * coercion runs) and are checked to pass before timing.
+ *
+ * Usage:
+ *   npx tsx scripts/bench/param-validation.ts [options]
+ *
+ * Options:
+ *   --manifest <path>  Manifest to read (default: dist/manifest.json)
+ *   --iterations <n>   Calls per script and mode (default: 2000)
+ *   --json             Output results as JSON
+ *
+ * @module scripts/bench/param-validation
+ */
+
+import * as fs from 'fs';
+import * as path from 'path';
+import { compileValidator, getValidator } from '../../src/lib/param-validator';
+import type { ManifestV2, ParamDefinition } from '../../src/lib/manifest-loader';
+import { scriptSchemas, scriptSchemaHashes } from '../../packages/extension/src/vsc-scripts/generated/schemas';
+
+type Mode = 'compile' | 'cached' | 'zod';
+
+interface ModeResult {
+  mode: Mode;
+  scripts: number;
+  callsPerScript: number;
+  p50Us: number;
+  p95Us: number;
+  meanUs: number;
+  totalMs: number;
+}
+
+function parseArgs(argv: string[]): { manifest: string; iterations: number; json: boolean } {
+  let manifest = path.resolve('dist', 'manifest.json');
+  let iterations = 2000;
+  let json = false;
+
+  for (let i = 0; i < argv.length; i++) {
+    const arg = argv[i];
+    if (arg === '--manifest') {
+      manifest = path.resolve(argv[++i]);
+    } else if (arg === '--iterations') {
+      iterations = parseInt(argv[++i], 10);
+    } else if (arg === '--json') {
+      json = true;
+    }
+  }
+
+  return { manifest, iterations, json };
+}
+
+function percentile(sorted: number[], p: number): number {
+  if (sorted.length === 0) return 0;
+  const idx = Math.min(sorted.length - 1, Math.ceil((p / 100) * sorted.length) - 1);
+  return sorted[Math.max(0, idx)];
+}
+
+/**
+ * A valid value for a parameter, as a CLI user or agent would send it
+ */
+function sampleValue(def: ParamDefinition): unknown {
+  if (def.default !== undefined) {
+    return def.type === 'number' ? String(def.default) : def.default;
+  }
+  switch (def.type) {
+    case 'enum':
+      return def.values?.[0];
+    case 'number':
+      return String(def.min ?? 1);
+    case 'boolean':
+      return 'true';
+    case 'array':
+      return [];
+    case 'object':
+      return {};
+    default:
+      return def.resolve ? 'src/index.ts' : 'value';
+  }
+}
+
+function sampleParams(params: Record<string, ParamDefinition> = {}): Record<string, unknown> {
+  const sample: Record<string, unknown> = {};
+  for (const [name, def] of Object.entries(params)) {
+    if (!def.pattern) {
+      sample[name] = sampleValue(def);
+    }
+  }
+  return sample;
+}
+
+/**
+ * Time `iterations` calls of `run` and return the mean µs per call
+ */
+function timeCalls(iterations: number, run: () => unknown): number {
+  const start = process.hrtime.bigint();
+  for (let i = 0; i < iterations; i++) {
+    run();
+  }
+  return Number(process.hrtime.bigint() - start) / 1e3 / iterations;
+}
+
+function summarize(mode: Mode, perScriptUs: number[], iterations: number): ModeResult {
+  const sorted = [...perScriptUs].sort((a, b) => a - b);
+  const round = (n: number) => Math.round(n * 1000) / 1000;
+  const sum = perScriptUs.reduce((a, b) => a + b, 0);
+  return {
+    mode,
+    scripts: perScriptUs.length,
+    callsPerScript: iterations,
+    p50Us: round(percentile(sorted, 50)),
+    p95Us: round(percentile(sorted, 95)),
+    meanUs: round(perScriptUs.length ? sum / perScriptUs.length : 0),
+    totalMs: round((sum * iterations) / 1000)
+  };
+}
+
+async function main(): Promise<void> {
+  const { manifest: manifestPath, iterations, json } = parseArgs(process.argv.slice(2));
+  if (!fs.existsSync(manifestPath)) {
+    throw new Error(`Manifest not found at ${manifestPath}; run 'just build-manifest' or pass --manifest`);
+  }
+  const manifest: ManifestV2 = JSON.parse(fs.readFileSync(manifestPath, 'utf-8'));
+
+  const cases = Object.entries(manifest.scripts).map(([alias, entry]) => {
+    const params = sampleParams(entry.metadata.params);
+    const validation = getValidator(entry.metadata).validate(params);
+    if (!validation.valid) {
+      throw new Error(`Sample params for ${alias} do not validate: ${JSON.stringify(validation.errors)}`);
+    }
+    return { alias, metadata: entry.metadata, params };
+  });
+
+  // zod only for scripts whose generated schema matches this manifest
+  const zodCases = cases.filter(c => scriptSchemaHashes[c.alias] === getValidator(c.metadata).schemaHash);
+
+  const timings: Record<Mode, number[]> = { compile: [], cached: [], zod: [] };
+  for (const { metadata, params } of cases) {
+    timings.compile.push(timeCalls(iterations, () => compileValidator(metadata).validate(params)));
+    timings.cached.push(timeCalls(iterations, () => getValidator(metadata).validate(params)));
+  }
+  for (const { alias, params } of zodCases) {
+    const schema = (scriptSchemas as Record<string, { safeParse(value: unknown): unknown }>)[alias];
+    const coerced = getValidator(manifest.scripts[alias].metadata).validate(params).coercedParams;
+    timings.zod.push(timeCalls(iterations, () => schema.safeParse(coerced)));
+  }
+
+  const results = (Object.keys(timings) as Mode[]).map(mode => summarize(mode, timings[mode], iterations));
+
+  if (json) {
+    console.log(JSON.stringify({ platform: process.platform, node: process.version, results }, null, 2));
+    return;
+  }
+
+  console.log(`Parameter validation, ${cases.length} scripts × ${iterations} calls (${process.platform}, node ${process.version})\n`);
+  console.log('mode      scripts   p50 (µs)   p95 (µs)   mean (µs)   total (ms)');
+  for (const r of results) {
+    console.log(
+      `${r.mode.padEnd(8)}  ${String(r.scripts).padStart(7)}  ${String(r.p50Us).padStart(9)}  ${String(r.p95Us).padStart(9)}   ` +
+      `${String(r.meanUs).padStart(9)}   ${String(r.totalMs).padStart(10)}`
+    );
+  }
+  if (zodCases.length < cases.length) {
+    console.log(`\n${cases.length - zodCases.length} script(s) skipped for zod: generated schemas are from a different manifest`);
+  }
+}
+
+main().catch(err => {
+  console.error(err);
+  process.exit(1);
+});
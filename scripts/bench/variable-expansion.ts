@@ -0,0 +1,226 @@
+#!/usr/bin/env npx tsx
+/**
+ * listVariables() Expansion: Sequential vs Pipelined
+ *
+ * Serves a wide, deep object graph (the shape of test/python/wide_graph.py:
+ * every node has `width` children, every third child is a shared object and
+ * every node links back to the root) from a simulated debug adapter that
+ * answers each `variables` request after a fixed latency. It then expands the
+ * same roots with the one-request-at-a-time walk listVariables() used before
+ * VariableExpander, and with VariableExpander at each concurrency.
+ *
+ * Both walks produce the same tree; the benchmark checks this and reports
+ * wall time, request counts and the peak number of requests in flight.
+ *
+ * Usage:
+ *   npx tsx scripts/bench/variable-expansion.ts [options]
+ *
+ * Options:
+ *   --width <n>          Children per node (default: 8)
+ *   --depth <n>          maxDepth passed to the walk (default: 5)
+ *   --latency <ms>       Simulated round-trip per request (default: 2)
+ *   --concurrency <list> Comma-separated pool sizes (default: 1,4,8,16)
+ *   --json               Output results as JSON
+ *
+ * @module scripts/bench/variable-expansion
+ */
+
+import { VariableExpander } from '../../packages/extension/src/core/runtime-inspection/VariableExpander';
+import { MemoryBudget } from '../../packages/extension/src/core/runtime-inspection/MemoryBudget';
+
+interface RunResult {
+  mode: string;
+  concurrency: number;
+  wallMs: number;
+  requests: number;
+  maxInFlight: number;
+  speedup: number;
+}
+
+const MAX_NODES = 20000;
+const MAX_BYTES = 5 * 1024 * 1024;
+const MAX_CHILDREN = 50;
+
+function parseArgs(argv: string[]) {
+  let width = 8;
+  let depth = 5;
+  let latency = 2;
+  let concurrency = [1, 4, 8, 16];
+  let json = false;
+
+  for (let i = 0; i < argv.length; i++) {
+    switch (argv[i]) {
+      case '--width':
+        width = parseInt(argv[++i], 10);
+        break;
+      case '--depth':
+        depth = parseInt(argv[++i], 10);
+        break;
+      case '--latency':
+        latency = parseFloat(argv[++i]);
+        break;
+      case '--concurrency':
+        concurrency = argv[++i].split(',').map(s => parseInt(s.trim(), 10)).filter(n => n > 0);
+        break;
+      case '--json':
+        json = true;
+        break;
+    }
+  }
+
+  return { width, depth, latency, concurrency, json };
+}
+
+/**
+ * Simulated adapter: reference 1 is the root; reference n's children are
+ * n*width+1.., with every third child pointing at the shared object (2) and a
+ * `root` field pointing back at 1
+ */
+function simulatedSession(width: number, latency: number) {
+  const stats = { requests: 0, inFlight: 0, maxInFlight: 0 };
+  const limit = 200000;
+
+  const children = (ref: number) => {
+    const vars = [{ name: 'root', value: '<Node root>', variablesReference: 1 }];
+    for (let i = 0; i < width; i++) {
+      const child = ref * width + i + 3;
+      const variablesReference = i % 3 === 2 ? 2 : child < limit ? child : 0;
+      vars.push({ name: `[${i}]`, value: `<Node ${child}>`, variablesReference });
+    }
+    return vars;
+  };
+
+  const request = async (_command: string, args: any) => {
+    stats.requests++;
+    stats.inFlight++;
+    stats.maxInFlight = Math.max(stats.maxInFlight, stats.inFlight);
+    await new Promise(resolve => setTimeout(resolve, latency));
+    stats.inFlight--;
+    return { variables: children(args.variablesReference).slice(0, args.count) };
+  };
+
+  return { request, stats };
+}
+
+const estimateSize = (variable: any) => 100 + variable.name.length * 2 + String(variable.value).length * 2;
+
+/**
+ * The expansion loop listVariables() ran before VariableExpander
+ */
+async function sequentialExpand(request: (command: string, args: any) => Promise<any>, roots: any[], maxDepth: number) {
+  const budget = new MemoryBudget(MAX_NODES, MAX_BYTES);
+  const visited = new Set<number>();
+
+  const expand = async (variable: any, depth: number): Promise<any> => {
+    if (depth >= maxDepth) {
+      return { ...variable, truncated: true, truncatedReason: 'maxDepth', expandable: variable.variablesReference > 0 };
+    }
+    if (variable.variablesReference === 0) {
+      return variable;
+    }
+    if (visited.has(variable.variablesReference)) {
+      return {
+        ...variable,
+        cycle: true,
+        value: '[Circular Reference]',
+        originalValue: variable.value,
+        cycleVia: 'variablesReference'
+      };
+    }
+    visited.add(variable.variablesReference);
+
+    const response = await request('variables', { variablesReference: variable.variablesReference, count: MAX_CHILDREN });
+    const all = response?.variables || [];
+    const toExpand = all.slice(0, MAX_CHILDREN);
+    const children: any[] = [];
+    for (const child of toExpand) {
+      if (!budget.addNode(estimateSize(child)).ok) {
+        return { ...variable, children, childrenShown: children.length, totalChildren: all.length, truncated: true, truncatedReason: 'budget' };
+      }
+      children.push(await expand(child, depth + 1));
+    }
+    return {
+      ...variable,
+      children,
+      childrenShown: toExpand.length,
+      totalChildren: variable.namedVariables || variable.indexedVariables || all.length,
+      childrenTruncated: all.length > MAX_CHILDREN
+    };
+  };
+
+  const expanded: any[] = [];
+  for (const root of roots) {
+    expanded.push(await expand(root, 1));
+  }
+  return expanded;
+}
+
+async function main(): Promise<void> {
+  const { width, depth, latency, concurrency, json } = parseArgs(process.argv.slice(2));
+  const roots = [
+    { name: 'graph', value: '<Node root>', variablesReference: 1 },
+    { name: 'shared', value: '<Node shared>', variablesReference: 2 }
+  ];
+  const round = (n: number) => Math.round(n * 100) / 100;
+
+  const baseline = simulatedSession(width, latency);
+  let start = process.hrtime.bigint();
+  const expected = JSON.stringify(await sequentialExpand(baseline.request, roots, depth));
+  const baselineMs = Number(process.hrtime.bigint() - start) / 1e6;
+
+  const results: RunResult[] = [{
+    mode: 'sequential',
+    concurrency: 1,
+    wallMs: round(baselineMs),
+    requests: baseline.stats.requests,
+    maxInFlight: baseline.stats.maxInFlight,
+    speedup: 1
+  }];
+
+  for (const n of concurrency) {
+    const session = simulatedSession(width, latency);
+    const expander = new VariableExpander(session.request, {
+      maxDepth: depth,
+      maxChildren: MAX_CHILDREN,
+      concurrency: n,
+      budget: new MemoryBudget(MAX_NODES, MAX_BYTES),
+      estimateSize
+    });
+
+    start = process.hrtime.bigint();
+    const tree = JSON.stringify(await expander.expandAll(roots));
+    const wallMs = Number(process.hrtime.bigint() - start) / 1e6;
+
+    if (tree !== expected) {
+      throw new Error(`Pipelined tree differs from the sequential walk at concurrency ${n}`);
+    }
+
+    results.push({
+      mode: 'pipelined',
+      concurrency: n,
+      wallMs: round(wallMs),
+      requests: session.stats.requests,
+      maxInFlight: session.stats.maxInFlight,
+      speedup: round(baselineMs / Math.max(wallMs, 0.001))
+    });
+  }
+
+  if (json) {
+    console.log(JSON.stringify({ platform: process.platform, node: process.version, width, depth, latency, results }, null, 2));
+    return;
+  }
+
+  console.log(`listVariables expansion (width ${width}, maxDepth ${depth}, ${latency}ms per request, node ${process.version})\n`);
+  console.log('         mode   concurrency   wall (ms)   requests   max in flight   speedup');
+  for (const r of results) {
+    console.log(
+      `${r.mode.padStart(13)}   ${String(r.concurrency).padStart(11)}   ${String(r.wallMs).padStart(9)}   ` +
+      `${String(r.requests).padStart(8)}   ${String(r.maxInFlight).padStart(13)}   ${String(r.speedup).padStart(6)}x`
+    );
+  }
+}
+
+main().catch(err => {
+  console.error(err);
+  process.exit(1);
+});
@@ -2803,6 +2803,11 @@ var path = require("path");
 var yaml = require_js_yaml();
 var SCRIPTS_DIR = path.resolve(process.cwd(), "packages", "extension", "src", "vsc-scripts");
 var OUTPUT_FILE = path.join(SCRIPTS_DIR, "manifest.json");
+function findExportName(source, alias) {
+  const escaped = alias.replace(/[.*+?^${}()|[\]\\]/g, "\\$&");
+  const pattern = new RegExp(`@RegisterScript\\(\\s*['"\`]${escaped}['"\`]\\s*\\)\\s*export\\s+class\\s+(\\w+)`);
+  return pattern.exec(source)?.[1];
+}
 async function discoverScripts(dir, baseDir = dir) {
   const entries = [];
   const items = fs.readdirSync(dir, { withFileTypes: true });
@@ -2824,7 +2829,8 @@ async function discoverScripts(dir, baseDir = dir) {
           const runtimeRelPath = relPath.replace(/\.ts$/, ".js");
           entries.push({
             metadata,
-            scriptRelPath: runtimeRelPath
+            scriptRelPath: runtimeRelPath,
+            exportName: findExportName(fs.readFileSync(scriptPath, "utf-8"), metadata.alias)
           });
           console.log(`\u2713 Discovered script: ${metadata.alias} (${relPath})`);
         } catch (error) {
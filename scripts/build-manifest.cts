@@ -23,6 +23,7 @@ interface ScriptMetadata {
     dangerOnly?: boolean;
     params?: ScriptParams;
     response?: string;
+    priority?: 'fast' | 'normal' | 'blocking';
     errors?: string[];
     cli?: {
         command: string;
@@ -38,6 +39,7 @@ interface ScriptMetadata {
 interface ManifestEntry {
     metadata: ScriptMetadata;
     scriptRelPath: string;
+    exportName?: string;
 }
 
 interface ScriptManifest {
@@ -49,6 +51,17 @@ interface ScriptManifest {
 const SCRIPTS_DIR = path.resolve(process.cwd(), 'packages', 'extension', 'src', 'vsc-scripts');
 const OUTPUT_FILE = path.join(SCRIPTS_DIR, 'manifest.json');
 
+/**
+ * Name of the exported class registered under `alias` in a script source.
+ * Lets the registry resolve the class on first use without scanning every
+ * decorated export at activation.
+ */
+function findExportName(source: string, alias: string): string | undefined {
+    const escaped = alias.replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
+    const pattern = new RegExp(`@RegisterScript\\(\\s*['"\`]${escaped}['"\`]\\s*\\)\\s*export\\s+class\\s+(\\w+)`);
+    return pattern.exec(source)?.[1];
+}
+
 async function discoverScripts(dir: string, baseDir: string = dir): Promise<ManifestEntry[]> {
     const entries: ManifestEntry[] = [];
     const items = fs.readdirSync(dir, { withFileTypes: true });
@@ -84,7 +97,8 @@ async function discoverScripts(dir: string, baseDir: string = dir): Promise<Mani
 
                     entries.push({
                         metadata,
-                        scriptRelPath: runtimeRelPath
+                        scriptRelPath: runtimeRelPath,
+                        exportName: findExportName(fs.readFileSync(scriptPath, 'utf-8'), metadata.alias)
                     });
 
                     console.log(`✓ Discovered script: ${metadata.alias} (${relPath})`);
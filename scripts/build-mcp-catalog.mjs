@@ -0,0 +1,26 @@
+// scripts/build-mcp-catalog.mjs
+// Usage: node scripts/build-mcp-catalog.mjs
+//
+// Writes dist/mcp-catalog.json: the MCP tool definitions, tool name → alias
+// map and doc front matter the MCP server would otherwise build at startup.
+// Runs as part of build:cli, after tsc, copy-manifest and copy-docs.
+
+import { existsSync } from 'node:fs';
+import { resolve, relative } from 'node:path';
+import { fileURLToPath, pathToFileURL } from 'node:url';
+import process from 'node:process';
+
+const root = fileURLToPath(new URL('..', import.meta.url));
+const manifestPath = resolve(root, 'dist', 'manifest.json');
+const catalogModule = resolve(root, 'dist', 'lib', 'mcp', 'tool-catalog.js');
+
+for (const file of [manifestPath, catalogModule]) {
+  if (!existsSync(file)) {
+    console.error(`ERROR: ${relative(root, file)} not found; run tsc and copy-manifest first`);
+    process.exit(1);
+  }
+}
+
+const { writeToolCatalog } = await import(pathToFileURL(catalogModule).href);
+const catalogPath = writeToolCatalog(manifestPath);
+console.log(`✓ Wrote ${relative(root, catalogPath)}`);
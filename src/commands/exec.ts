@@ -3,7 +3,11 @@ import { isSuccess } from '../lib/client.js';
 import { output, log } from '../lib/formatter.js';
 import { requireDangerAcknowledgement } from '../lib/danger.js';
 import { findBridgeRoot, runCommand, sortableId, type CommandJson } from '../lib/fs-bridge.js';
+import { parseBatchSpec, createBatchCommand, type BatchSpec } from '../lib/batch.js';
+import { manifestLoader, type ScriptMetadata } from '../lib/manifest-loader.js';
+import { getValidator, formatValidationErrors } from '../lib/param-validator.js';
 import chalk from 'chalk';
+import path from 'path';
 
 export default class Exec extends Command {
   static description = 'Execute arbitrary JavaScript in VS Code (DANGER MODE)';
@@ -11,6 +15,7 @@ export default class Exec extends Command {
   static examples = [
     '<%= config.bin %> <%= command.id %> "vscode.window.showInformationMessage(\'Hello\')"',
     '<%= config.bin %> <%= command.id %> --file ./script.js --yes',
+    '<%= config.bin %> <%= command.id %> --batch ./steps.json --stop-on-error',
   ];
 
   static flags = {
@@ -28,6 +33,16 @@ export default class Exec extends Command {
       description: 'Read script from file',
       exclusive: ['script'],
     }),
+    batch: Flags.string({
+      char: 'b',
+      description: 'Run a JSON list of {scriptName, params} steps as one bridge job ("-" reads stdin). Steps use normal script permissions; danger mode is not required',
+      exclusive: ['script', 'file'],
+    }),
+    'stop-on-error': Flags.boolean({
+      description: 'With --batch: stop at the first failing step',
+      default: false,
+      dependsOn: ['batch'],
+    }),
     timeout: Flags.integer({
       description: 'Request timeout in milliseconds',
       default: 30000,
@@ -48,6 +63,11 @@ export default class Exec extends Command {
   async run(): Promise<void> {
     const { args, flags } = await this.parse(Exec);
 
+    if (flags.batch) {
+      await this.runBatch(flags.batch, flags);
+      return;
+    }
+
     // Get script content
     let script: string;
     if (flags.file) {
@@ -110,4 +130,87 @@ export default class Exec extends Command {
 
     await output(response, { format: flags.json ? 'json' : 'pretty' });
   }
-}
\ No newline at end of file
+
+  private async runBatch(source: string, flags: any): Promise<void> {
+    let spec: BatchSpec;
+    try {
+      const text = source === '-'
+        ? await readStdin()
+        : await (await import('fs-extra')).readFile(source, 'utf-8');
+      spec = parseBatchSpec(text);
+    } catch (error: any) {
+      this.error(error.message);
+    }
+
+    if (flags['stop-on-error']) {
+      spec.stopOnError = true;
+    }
+
+    // Validate and coerce each step up front so a typo fails before anything runs
+    let workspaceRoot = process.cwd();
+    const bridgeRoot = await findBridgeRoot();
+    try {
+      const fs = await import('fs-extra');
+      const hostJson = JSON.parse(await fs.readFile(path.join(bridgeRoot, 'host.json'), 'utf-8'));
+      if (hostJson?.workspace) workspaceRoot = hostJson.workspace;
+    } catch { /* best-effort */ }
+
+    for (const [index, step] of spec.steps.entries()) {
+      let metadata: ScriptMetadata | null;
+      try {
+        metadata = manifestLoader.getScriptMetadata(step.scriptName);
+      } catch {
+        metadata = null;
+      }
+      if (!metadata) {
+        log(`Warning: Step ${index} script '${step.scriptName}' not found in manifest, skipping validation`);
+        continue;
+      }
+
+      const validator = getValidator(metadata);
+      const validation = validator.validate(step.params ?? {}, { workspaceRoot });
+      if (!validation.valid) {
+        console.error(`Step ${index} (${step.scriptName}):`);
+        console.error(formatValidationErrors(validation.errors, metadata));
+        this.exit(1);
+      }
+      step.params = validation.coercedParams || step.params;
+      step.paramsSchemaHash = validator.schemaHash;
+    }
+
+    log(`Running batch of ${spec.steps.length} step(s)...`);
+
+    const command = createBatchCommand(spec, `cli-${process.pid}`, flags.timeout);
+    const response = await runCommand(bridgeRoot, command, { timeout: flags.timeout, verbose: flags.verbose });
+
+    const data = isSuccess(response) ? response.data as any : undefined;
+    if (!flags.json && data) {
+      for (const step of data.steps ?? []) {
+        const mark = step.ok ? chalk.green('✓') : chalk.red('✗');
+        const detail = step.ok ? '' : ` - [${step.envelope?.error?.code}] ${step.envelope?.error?.message}`;
+        console.error(`${mark} ${step.index}: ${step.scriptName} (${step.durationMs}ms)${detail}`);
+      }
+      if (data.skipped > 0) {
+        console.error(chalk.yellow(`  ${data.skipped} step(s) skipped after failure`));
+      }
+    }
+
+    await output(response, { format: flags.json ? 'json' : 'pretty' });
+
+    // A batch that ran but had failing steps exits non-zero in both modes
+    if (data?.failed > 0) {
+      this.exit(1);
+    }
+  }
+}
+
+/**
+ * Read all of stdin as UTF-8
+ */
+async function readStdin(): Promise<string> {
+  const chunks: Buffer[] = [];
+  for await (const chunk of process.stdin) {
+    chunks.push(Buffer.isBuffer(chunk) ? chunk : Buffer.from(chunk));
+  }
+  return Buffer.concat(chunks).toString('utf-8');
+}
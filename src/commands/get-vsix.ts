@@ -1,10 +1,8 @@
 import { Command, Flags } from '@oclif/core';
 import * as path from 'path';
 import { stat } from 'fs/promises';
-import * as fs from 'fs-extra';
 import chalk from 'chalk';
 import { execSync } from 'child_process';
-import { GitHubClient, formatBytes } from '../lib/github.js';
 
 export default class GetVsix extends Command {
   static description = 'Download VSIX extension from GitHub releases';
@@ -71,6 +69,11 @@ export default class GetVsix extends Command {
         this.log(chalk.cyan('━'.repeat(45)));
       }
 
+      // Loaded here rather than at the top so other commands don't import them on startup
+      const [{ GitHubClient, formatBytes }, fs] = await Promise.all([
+        import('../lib/github.js'),
+        import('fs-extra'),
+      ]);
       const client = new GitHubClient();
 
       // Determine which release to fetch
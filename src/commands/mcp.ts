@@ -1,6 +1,4 @@
 import { Command, Flags } from '@oclif/core';
-import { StdioServerTransport } from '@modelcontextprotocol/sdk/server/stdio.js';
-import { createMcpServer } from '../lib/mcp/server.js';
 import * as fs from 'fs';
 import * as path from 'path';
 
@@ -47,6 +45,13 @@ export default class Mcp extends Command {
       // Per Critical Insight #4: Check CLI vs extension version compatibility
       await this.checkVersionCompatibility(flags.workspace);
 
+      // The MCP SDK, zod schemas and tool generator are only loaded for this
+      // command, so other vscb commands (and --help) don't pay for them at startup
+      const [{ StdioServerTransport }, { createMcpServer }] = await Promise.all([
+        import('@modelcontextprotocol/sdk/server/stdio.js'),
+        import('../lib/mcp/server.js'),
+      ]);
+
       // Create server using factory (Critical Discovery 05 - factory pattern for testing)
       console.error('Starting VSC-Bridge MCP server...'); // stderr logging (Critical Insight #1)
       const server = createMcpServer({
@@ -3,7 +3,7 @@ import { isSuccess } from '../lib/client.js';
 import { output, log } from '../lib/formatter.js';
 import { findBridgeRoot, runCommand, sortableId, type CommandJson } from '../lib/fs-bridge.js';
 import { manifestLoader } from '../lib/manifest-loader.js';
-import { validateParams, formatValidationErrors } from '../lib/param-validator.js';
+import { getValidator, formatValidationErrors } from '../lib/param-validator.js';
 import { discoverScripts, findScript } from '../lib/discoverScripts.js';
 import { extractMetadata } from '../lib/extractMetadata.js';
 import { isWSL, wslToWindows } from '../lib/wsl.js';
@@ -232,21 +232,24 @@ export default class Script extends Command {
     }
 
     let validatedParams = rawParams;
+    let paramsSchemaHash: string | undefined;
 
     // Validate parameters unless --no-validate flag is set
     if (!flags['no-validate']) {
       try {
         const metadata = manifestLoader.getScriptMetadata(scriptName);
         if (metadata) {
-          // Read workspace root from host.json if available, fallback to CWD
+          // Read workspace root and platform from host.json if available, fallback to CWD
           let workspaceRoot = process.cwd();
+          let hostJson: any;
           try {
             const bridgeRoot = await findBridgeRoot();
-            const hostJson = JSON.parse(await fs.promises.readFile(path.join(bridgeRoot, 'host.json'), 'utf8'));
+            hostJson = JSON.parse(await fs.promises.readFile(path.join(bridgeRoot, 'host.json'), 'utf8'));
             if (hostJson?.workspace) workspaceRoot = hostJson.workspace;
           } catch { /* best-effort */ }
 
-          const validation = validateParams(metadata, rawParams, { workspaceRoot });
+          const validator = getValidator(metadata);
+          const validation = validator.validate(rawParams, { workspaceRoot });
 
           if (!validation.valid) {
             // Format and display validation errors
@@ -260,10 +263,8 @@ export default class Script extends Command {
 
           // NEW: translate resolved paths to match extension host platform (e.g., WSL -> Windows)
           try {
-            // 1) Read host.json to detect extension platform (win32/darwin/linux)
-            const bridgeRoot = await findBridgeRoot();
-            const hostJson = JSON.parse(await fs.promises.readFile(path.join(bridgeRoot, 'host.json'), 'utf8'));
-            const hostPlatform = hostJson.platform as NodeJS.Platform | undefined; // 'win32' | 'linux' | 'darwin'
+            // 1) Use host.json (read above) to detect extension platform (win32/darwin/linux)
+            const hostPlatform = hostJson?.platform as NodeJS.Platform | undefined; // 'win32' | 'linux' | 'darwin'
 
             // 2) If CLI is running in WSL and extension is Windows, translate any path-like params
             if (hostPlatform === 'win32' && isWSL()) {
@@ -283,6 +284,7 @@ export default class Script extends Command {
           }
 
           validatedParams = params;
+          paramsSchemaHash = validator.schemaHash;
           log(`✓ Parameters validated for '${scriptName}'`);
         } else {
           log(`Warning: Script '${scriptName}' not found in manifest, skipping validation`);
@@ -327,11 +329,38 @@ export default class Script extends Command {
       createdAt: new Date().toISOString(),
       scriptName,
       params: validatedParams,
-      timeout: flags.timeout
+      timeout: flags.timeout,
+      // Lets the extension skip validating these params a second time
+      ...(paramsSchemaHash && { paramsSchemaHash })
     };
-    const response = await runCommand(bridgeRoot, command, { timeout: flags.timeout, verbose: flags.verbose });
 
-    await output(response, { format: flags.json ? 'json' : undefined });
+    // Streaming scripts send each result as a 'record' event: print them as
+    // NDJSON as they arrive, and let Ctrl+C cancel the job instead of the CLI
+    const streaming = validatedParams.stream === true;
+    const abort = new AbortController();
+    const onSigint = () => abort.abort();
+    if (streaming) {
+      process.once('SIGINT', onSigint);
+    }
+
+    try {
+      const response = await runCommand(bridgeRoot, command, {
+        timeout: flags.timeout,
+        verbose: flags.verbose,
+        ...(streaming && {
+          signal: abort.signal,
+          onEvent: (event: any) => {
+            if (event?.type === 'record') {
+              process.stdout.write(JSON.stringify(event.data) + '\n');
+            }
+          }
+        })
+      });
+
+      await output(response, { format: flags.json ? 'json' : undefined });
+    } finally {
+      process.off('SIGINT', onSigint);
+    }
   }
 
   private async runScriptFile(filePath: string, flags: any): Promise<void> {
@@ -0,0 +1,87 @@
+/**
+ * Batch command jobs
+ *
+ * A batch carries an ordered list of script invocations that the extension
+ * runs inside one claimed job, so an N-step workflow pays one bridge pickup
+ * instead of N. Step results come back as an array of per-step envelopes.
+ */
+import { sortableId, type CommandJson } from './fs-bridge.js';
+
+/**
+ * Reserved script name understood by the extension's executor
+ */
+export const BATCH_SCRIPT_NAME = '@batch';
+
+/**
+ * Mirrors MAX_BATCH_STEPS in the extension
+ */
+export const MAX_BATCH_STEPS = 100;
+
+export type BatchStep = {
+  scriptName: string;
+  params?: Record<string, unknown>;
+  /** Set when params were validated client-side (see CommandJson.paramsSchemaHash) */
+  paramsSchemaHash?: string;
+};
+
+export type BatchSpec = {
+  steps: BatchStep[];
+  stopOnError?: boolean;
+};
+
+/**
+ * Parse a batch file
+ *
+ * Accepts either a bare array of steps or `{ "steps": [...], "stopOnError": true }`.
+ *
+ * @throws Error describing the first problem found
+ */
+export function parseBatchSpec(text: string): BatchSpec {
+  let raw: any;
+  try {
+    raw = JSON.parse(text);
+  } catch (error: any) {
+    throw new Error(`Batch file is not valid JSON: ${error.message}`);
+  }
+
+  const spec: BatchSpec = Array.isArray(raw) ? { steps: raw } : raw;
+  if (!spec || !Array.isArray(spec.steps) || spec.steps.length === 0) {
+    throw new Error('Batch must contain a non-empty "steps" array');
+  }
+  if (spec.steps.length > MAX_BATCH_STEPS) {
+    throw new Error(`Batch has ${spec.steps.length} steps (maximum ${MAX_BATCH_STEPS})`);
+  }
+
+  spec.steps.forEach((step, index) => {
+    if (!step || typeof step.scriptName !== 'string' || !step.scriptName) {
+      throw new Error(`Batch step ${index} is missing "scriptName"`);
+    }
+    if (step.params !== undefined && (typeof step.params !== 'object' || step.params === null || Array.isArray(step.params))) {
+      throw new Error(`Batch step ${index}: "params" must be an object`);
+    }
+  });
+
+  return { steps: spec.steps, stopOnError: spec.stopOnError === true };
+}
+
+/**
+ * Build the CommandJson for a batch job
+ */
+export function createBatchCommand(spec: BatchSpec, clientId: string, timeout?: number): CommandJson {
+  return {
+    version: 1,
+    clientId,
+    id: sortableId(Date.now()),
+    createdAt: new Date().toISOString(),
+    scriptName: BATCH_SCRIPT_NAME,
+    params: {
+      steps: spec.steps.map(step => ({
+        scriptName: step.scriptName,
+        params: step.params ?? {},
+        ...(step.paramsSchemaHash && { paramsSchemaHash: step.paramsSchemaHash })
+      })),
+      stopOnError: spec.stopOnError === true
+    },
+    timeout
+  };
+}
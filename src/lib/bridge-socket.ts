@@ -0,0 +1,341 @@
+/**
+ * Local socket client for the bridge
+ *
+ * When the extension advertises a socket endpoint in host.json, same-host
+ * clients can send commands over a Unix domain socket / named pipe instead
+ * of the execute/ file queue. One connection per endpoint is cached and
+ * multiplexes concurrent requests by command id.
+ *
+ * Wire format (NDJSON) mirrors packages/extension/src/core/fs-bridge/socket-server.ts.
+ */
+import { promises as fs } from 'fs';
+import net from 'net';
+import path from 'path';
+import type { CommandJson } from './fs-bridge.js';
+
+/**
+ * Socket endpoint as advertised in host.json
+ */
+export type SocketEndpoint = {
+  path: string;
+  token: string;
+};
+
+export type SocketRequestOptions = {
+  timeout: number;
+  onEvent?: (e: any) => void;
+  signal?: AbortSignal;
+};
+
+/**
+ * Socket protocol version spoken by this client
+ */
+export const SOCKET_PROTOCOL_VERSION = 1;
+
+/**
+ * Upper bound for connect + hello/welcome handshake
+ */
+export const SOCKET_CONNECT_TIMEOUT_MS = 1000;
+
+/**
+ * Directory under the bridge root where the extension writes large socket
+ * results (one subdirectory per command id, referenced by the envelope's dataRef)
+ */
+export const SOCKET_DATA_DIR = 'socket-data';
+
+type PendingRequest = {
+  onEvent?: (e: any) => void;
+  resolve: (envelope: any) => void;
+};
+
+/**
+ * Raised when no usable socket connection could be established
+ * Callers treat this as "fall back to the file queue"
+ */
+export class SocketUnavailableError extends Error {
+  constructor(message: string) {
+    super(message);
+    this.name = 'SocketUnavailableError';
+  }
+}
+
+function errorEnvelope(code: string, message: string): any {
+  return {
+    ok: false,
+    type: 'error',
+    error: { code, message },
+    meta: { timestamp: new Date().toISOString() }
+  };
+}
+
+/**
+ * Read the socket endpoint from host.json
+ *
+ * Returns undefined when the bridge does not advertise one, or when the
+ * extension runs on a different platform (e.g. CLI in WSL, VS Code on
+ * Windows) where the path is not reachable from this process.
+ */
+export async function readSocketEndpoint(bridgeRoot: string): Promise<SocketEndpoint | undefined> {
+  try {
+    const hostData = await fs.readFile(path.join(bridgeRoot, 'host.json'), 'utf8');
+    const host = JSON.parse(hostData);
+    if (!host.socket || typeof host.socket.path !== 'string' || typeof host.socket.token !== 'string') {
+      return undefined;
+    }
+    if (host.platform && host.platform !== process.platform) {
+      return undefined;
+    }
+    return { path: host.socket.path, token: host.socket.token };
+  } catch {
+    return undefined;
+  }
+}
+
+/**
+ * A single authenticated connection to the bridge socket
+ */
+export class BridgeSocketClient {
+  private pending = new Map<string, PendingRequest>();
+  /** Pieces of the frame still being received (joined once its newline arrives) */
+  private partial: string[] = [];
+  private _closed = false;
+
+  private constructor(private socket: net.Socket) {
+    socket.setEncoding('utf8');
+    socket.on('data', (chunk: string) => this.onData(chunk));
+    socket.on('error', () => this.shutdown('Bridge socket error'));
+    socket.on('close', () => this.shutdown('Bridge socket closed'));
+    // Idle connections must not keep a one-shot CLI process alive
+    socket.unref();
+  }
+
+  /**
+   * Connect and complete the hello/welcome handshake
+   *
+   * @throws SocketUnavailableError when the endpoint is unreachable or rejects the token
+   */
+  static connect(
+    endpoint: SocketEndpoint,
+    timeoutMs: number = SOCKET_CONNECT_TIMEOUT_MS
+  ): Promise<BridgeSocketClient> {
+    return new Promise((resolve, reject) => {
+      const socket = net.connect(endpoint.path);
+      let buffer = '';
+      let settled = false;
+
+      const fail = (message: string) => {
+        if (settled) return;
+        settled = true;
+        clearTimeout(timer);
+        socket.destroy();
+        reject(new SocketUnavailableError(message));
+      };
+
+      const timer = setTimeout(() => fail('Timed out connecting to bridge socket'), timeoutMs);
+
+      const onData = (chunk: string) => {
+        buffer += chunk;
+        const newline = buffer.indexOf('\n');
+        if (newline === -1) return;
+
+        let frame: any;
+        try {
+          frame = JSON.parse(buffer.slice(0, newline));
+        } catch {
+          fail('Invalid handshake from bridge socket');
+          return;
+        }
+        if (frame.type !== 'welcome') {
+          fail(frame.message || 'Bridge socket rejected handshake');
+          return;
+        }
+
+        settled = true;
+        clearTimeout(timer);
+        socket.off('data', onData);
+        socket.off('error', onError);
+        const client = new BridgeSocketClient(socket);
+        // Anything that arrived after the welcome frame belongs to the client
+        const rest = buffer.slice(newline + 1);
+        if (rest) client.onData(rest);
+        resolve(client);
+      };
+
+      const onError = (err: Error) => fail(`Bridge socket unavailable: ${err.message}`);
+
+      socket.setEncoding('utf8');
+      socket.on('data', onData);
+      socket.on('error', onError);
+      socket.once('connect', () => {
+        socket.write(JSON.stringify({
+          type: 'hello',
+          version: SOCKET_PROTOCOL_VERSION,
+          token: endpoint.token
+        }) + '\n');
+      });
+    });
+  }
+
+  get closed(): boolean {
+    return this._closed;
+  }
+
+  /**
+   * Send a command and resolve with its response envelope
+   *
+   * Never rejects: timeouts, cancellation and dropped connections come back
+   * as error envelopes, matching runCommand() on the file queue.
+   */
+  request(payload: CommandJson, opts: SocketRequestOptions): Promise<any> {
+    if (this._closed) {
+      return Promise.resolve(errorEnvelope('E_BRIDGE_UNAVAILABLE', 'Bridge socket closed'));
+    }
+
+    return new Promise(resolve => {
+      let cancelSent = false;
+
+      const sendCancel = () => {
+        if (cancelSent) return;
+        cancelSent = true;
+        this.send({ type: 'cancel', id: payload.id });
+      };
+
+      const finish = (envelope: any) => {
+        clearTimeout(timer);
+        opts.signal?.removeEventListener('abort', sendCancel);
+        this.pending.delete(payload.id);
+        if (this.pending.size === 0) {
+          this.socket.unref();
+        }
+        resolve(envelope);
+      };
+
+      const timer = setTimeout(() => {
+        sendCancel();
+        finish(errorEnvelope('E_TIMEOUT', `Command timed out after ${opts.timeout}ms`));
+      }, opts.timeout);
+
+      this.pending.set(payload.id, { onEvent: opts.onEvent, resolve: finish });
+      this.socket.ref();
+
+      if (opts.signal) {
+        // Keep waiting after abort so the bridge can acknowledge with E_CANCELLED
+        if (opts.signal.aborted) {
+          sendCancel();
+        } else {
+          opts.signal.addEventListener('abort', sendCancel, { once: true });
+        }
+      }
+
+      this.send({ type: 'request', command: payload });
+    });
+  }
+
+  /**
+   * Close the connection; in-flight requests resolve with E_BRIDGE_UNAVAILABLE
+   */
+  close(): void {
+    this.socket.destroy();
+    this.shutdown('Bridge socket closed');
+  }
+
+  private send(frame: unknown): void {
+    if (!this._closed) {
+      this.socket.write(JSON.stringify(frame) + '\n');
+    }
+  }
+
+  private onData(chunk: string): void {
+    // Only the new chunk is searched for a newline, so a large response
+    // arriving in many chunks is scanned once rather than once per chunk
+    let start = 0;
+    let newline: number;
+    while ((newline = chunk.indexOf('\n', start)) !== -1) {
+      this.partial.push(chunk.slice(start, newline));
+      const line = this.partial.join('');
+      this.partial = [];
+      start = newline + 1;
+      if (!line.trim()) continue;
+
+      let frame: any;
+      try {
+        frame = JSON.parse(line);
+      } catch {
+        console.error('Malformed socket frame:', line);
+        continue;
+      }
+
+      if (frame.type === 'event') {
+        this.pending.get(frame.id)?.onEvent?.(frame.event);
+      } else if (frame.type === 'response') {
+        this.pending.get(frame.id)?.resolve(frame.envelope);
+      } else if (frame.type === 'error') {
+        this.shutdown(`Bridge socket error: ${frame.message}`);
+      }
+    }
+
+    if (start < chunk.length) {
+      this.partial.push(chunk.slice(start));
+    }
+  }
+
+  private shutdown(reason: string): void {
+    if (this._closed) return;
+    this._closed = true;
+    for (const request of [...this.pending.values()]) {
+      request.resolve(errorEnvelope('E_BRIDGE_UNAVAILABLE', `${reason} before the command completed`));
+    }
+    this.pending.clear();
+  }
+}
+
+/**
+ * Live connections keyed by socket path + token
+ */
+const clients = new Map<string, Promise<BridgeSocketClient>>();
+
+/**
+ * Get (or open) the shared connection for an endpoint
+ *
+ * Concurrent callers share one in-progress connect. Closed or failed
+ * connections are evicted so the next call reconnects.
+ *
+ * @throws SocketUnavailableError when the endpoint cannot be reached
+ */
+export async function getSocketClient(endpoint: SocketEndpoint): Promise<BridgeSocketClient> {
+  const key = `${endpoint.path}\0${endpoint.token}`;
+  const cached = clients.get(key);
+  if (cached) {
+    try {
+      const client = await cached;
+      if (!client.closed) return client;
+    } catch {
+      // Previous attempt failed; retry below
+    }
+    if (clients.get(key) === cached) clients.delete(key);
+  }
+
+  const connecting = BridgeSocketClient.connect(endpoint);
+  clients.set(key, connecting);
+  try {
+    return await connecting;
+  } catch (err) {
+    if (clients.get(key) === connecting) clients.delete(key);
+    throw err;
+  }
+}
+
+/**
+ * Close every cached connection (tests, long-lived hosts shutting down)
+ */
+export async function closeSocketClients(): Promise<void> {
+  const pending = [...clients.values()];
+  clients.clear();
+  for (const connecting of pending) {
+    try {
+      (await connecting).close();
+    } catch {
+      // Never connected
+    }
+  }
+}
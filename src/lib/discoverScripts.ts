@@ -10,7 +10,8 @@ import * as fs from 'fs';
 import * as path from 'path';
 import * as os from 'os';
 import { fileURLToPath } from 'url';
-import { extractMetadata } from './extractMetadata.js';
+import { extractMetadata, type ExtractedMetadata } from './extractMetadata.js';
+import { fileSignature, readCache, writeCache } from './metadata-cache.js';
 
 export interface DiscoveredScript {
     path: string;
@@ -78,8 +79,21 @@ function discoverJsFiles(dir: string): string[] {
     return files;
 }
 
+/**
+ * Extracted metadata per script file of one location, with each file's signature
+ */
+type LocationCache = Record<string, { signature: string; metadata: ExtractedMetadata }>;
+
+/**
+ * Cache namespace for discovered script metadata (one entry per location)
+ */
+const CACHE_NAMESPACE = 'discovery';
+
 /**
  * Discover all scripts from standard locations
+ *
+ * Metadata is extracted only for files that are new or changed since the last
+ * run; unchanged files are answered from the on-disk metadata cache.
  */
 export async function discoverScripts(): Promise<DiscoveredScript[]> {
     const scripts: DiscoveredScript[] = [];
@@ -88,10 +102,23 @@ export async function discoverScripts(): Promise<DiscoveredScript[]> {
 
     for (const location of locations) {
         const jsFiles = discoverJsFiles(location.path);
+        const cached = readCache<LocationCache>(CACHE_NAMESPACE, location.path, location.path) ?? {};
+        const current: LocationCache = {};
+        let changed = Object.keys(cached).length !== jsFiles.length;
 
         for (const filePath of jsFiles) {
             try {
-                const metadata = await extractMetadata(filePath);
+                const signature = fileSignature(filePath);
+                let metadata = signature && cached[filePath]?.signature === signature
+                    ? cached[filePath].metadata
+                    : undefined;
+                if (!metadata) {
+                    metadata = await extractMetadata(filePath);
+                    changed = true;
+                }
+                if (signature) {
+                    current[filePath] = { signature, metadata };
+                }
 
                 // Generate a unique name if needed
                 let scriptName = metadata.name;
@@ -115,6 +142,10 @@ export async function discoverScripts(): Promise<DiscoveredScript[]> {
                 console.error(`Failed to extract metadata from ${filePath}:`, error);
             }
         }
+
+        if (changed) {
+            writeCache(CACHE_NAMESPACE, location.path, location.path, current);
+        }
     }
 
     // Sort by location priority: workspace > user > builtin
@@ -1,10 +1,13 @@
 /**
  * Filesystem bridge client for CLI
  */
-import { promises as fs } from 'fs';
+import { promises as fs, createReadStream, watch, type FSWatcher } from 'fs';
 import path from 'path';
 import crypto from 'crypto';
+import readline from 'readline';
+import { createGunzip } from 'zlib';
 import { release } from 'os';
+import { readSocketEndpoint, getSocketClient, SOCKET_DATA_DIR, type SocketEndpoint } from './bridge-socket.js';
 
 export type CommandJson = {
   version: 1;
@@ -15,6 +18,40 @@ export type CommandJson = {
   params: Record<string, unknown>;
   timeout?: number;
   scriptContent?: string;  // For dynamic script execution
+  accept?: LargeDataEncoding[];  // Large-result encodings this client reads (defaults to all)
+  paramsSchemaHash?: string;  // Params already validated against these definitions (see paramSchemaHash)
+};
+
+/**
+ * Encodings the extension may use for results too large to inline
+ * - ndjson: array results as one JSON value per line
+ * - gzip: compressed data file
+ */
+export type LargeDataEncoding = 'ndjson' | 'gzip';
+
+/**
+ * Large-result encodings readJobResult() understands
+ */
+export const SUPPORTED_DATA_ENCODINGS: LargeDataEncoding[] = ['ndjson', 'gzip'];
+
+/**
+ * How the client waits for job state changes
+ * - 'watch': fs.watch notifications on the job directory, slow poll as safety net (default)
+ * - 'poll': fixed-interval polling only (50ms native, 150ms WSL)
+ */
+export type WaitMode = 'watch' | 'poll';
+
+/**
+ * Which channel carries the command
+ * - 'auto': local socket when host.json advertises one, else the file queue (default)
+ * - 'socket': local socket only; E_BRIDGE_UNAVAILABLE if it cannot be reached
+ * - 'filesystem': execute/ file queue only
+ */
+export type TransportMode = 'auto' | 'socket' | 'filesystem';
+
+export type BridgeHealth = {
+  healthy: boolean;
+  lastSeen: Date;
 };
 
 export type RunOptions = {
@@ -22,6 +59,12 @@ export type RunOptions = {
   onEvent?: (e: any) => void;
   signal?: AbortSignal;
   verbose?: boolean;
+  waitMode?: WaitMode;
+  transport?: TransportMode;
+  /** Health already known to the caller; skips the host.json stat */
+  health?: BridgeHealth;
+  /** Socket endpoint already read from host.json (null: none advertised) */
+  socketEndpoint?: SocketEndpoint | null;
 };
 
 /**
@@ -30,6 +73,18 @@ export type RunOptions = {
  */
 export const PICKUP_TIMEOUT_MS = 5000;
 
+/**
+ * Safety poll interval used in 'watch' mode
+ * Only matters when a notification is dropped; normal wakeups come from fs.watch
+ */
+export const WATCH_FALLBACK_POLL_MS = 500;
+
+/**
+ * host.json older than this means the extension stopped heartbeating
+ * (it touches the file every ~10s)
+ */
+export const HEALTH_STALE_MS = 30000;
+
 /**
  * Error code: E_BRIDGE_UNAVAILABLE
  * Used when: Health check fails (bridge not running or crashed)
@@ -148,7 +203,7 @@ export async function runCommand(
   opts?: RunOptions
 ): Promise<any> {
   // Pre-submission health check (Phase 2)
-  const health = await checkBridgeHealth(bridgeRoot);
+  const health = opts?.health ?? await checkBridgeHealth(bridgeRoot);
   if (!health.healthy) {
     // Calculate age for diagnostic detail
     const lastSeenTime = health.lastSeen.getTime();
@@ -172,125 +227,192 @@ export async function runCommand(
     );
   }
 
+  // Local socket fast path (falls back to the file queue if unreachable)
+  const transport = resolveTransportMode(opts?.transport);
+  if (transport !== 'filesystem') {
+    const endpoint = opts?.socketEndpoint !== undefined
+      ? opts.socketEndpoint ?? undefined
+      : await readSocketEndpoint(bridgeRoot);
+    let envelope: any;
+    try {
+      if (!endpoint) {
+        throw new Error('host.json does not advertise a socket endpoint');
+      }
+      const client = await getSocketClient(endpoint);
+      if (opts?.verbose) {
+        process.stderr.write(`[DEBUG] Using socket transport: ${endpoint.path}\n`);
+      }
+      envelope = await client.request({ accept: SUPPORTED_DATA_ENCODINGS, ...payload }, {
+        timeout: opts?.timeout || 30000,
+        onEvent: opts?.onEvent,
+        signal: opts?.signal
+      });
+    } catch (err: any) {
+      if (transport === 'socket') {
+        return makeErrorEnvelope('E_BRIDGE_UNAVAILABLE', `Bridge socket is unavailable: ${err.message}`);
+      }
+      if (opts?.verbose && endpoint) {
+        process.stderr.write(`[DEBUG] Socket unavailable (${err.message}), using file queue\n`);
+      }
+    }
+
+    if (envelope) {
+      if (!envelope.dataRef) {
+        return envelope;
+      }
+      // Large result: written to a data file like a file-queue response, ours to remove
+      const dataDir = path.join(bridgeRoot, SOCKET_DATA_DIR, payload.id);
+      try {
+        return await resolveDataRef(dataDir, envelope);
+      } catch (err: any) {
+        return makeErrorEnvelope('E_NO_RESPONSE', `Could not read result data: ${err.message}`);
+      } finally {
+        await fs.rm(dataDir, { recursive: true, force: true }).catch(() => {});
+      }
+    }
+  }
+
   const jobDir = path.join(bridgeRoot, 'execute', payload.id);
 
   // Create job directory with restricted permissions
   await fs.mkdir(jobDir, { recursive: true, mode: 0o700 });
 
-  // Write command atomically (write to tmp, fsync, then rename)
-  const commandPath = path.join(jobDir, 'command.json');
-  const tmpPath = `${commandPath}.tmp`;
+  // Start watching BEFORE the command lands so no state change can slip
+  // between the write and the first wait
+  const notifier = new JobDirNotifier(jobDir, resolveWaitMode(opts?.waitMode));
+  let eventTail: EventTail | undefined;
 
-  // Write to temp file with fsync for durability
-  const fd = await fs.open(tmpPath, 'w');
   try {
-    await fd.writeFile(JSON.stringify(payload, null, 2));
-    await fd.sync(); // Ensure data is flushed to disk before rename
-    await fd.close();
-  } catch (err) {
-    await fd.close();
-    throw err;
-  }
+    // Write command atomically (write to tmp, fsync, then rename)
+    const commandPath = path.join(jobDir, 'command.json');
+    const tmpPath = `${commandPath}.tmp`;
 
-  await fs.rename(tmpPath, commandPath);
+    // Write to temp file with fsync for durability
+    const fd = await fs.open(tmpPath, 'w');
+    try {
+      await fd.writeFile(JSON.stringify({ accept: SUPPORTED_DATA_ENCODINGS, ...payload }));
+      await fd.sync(); // Ensure data is flushed to disk before rename
+      await fd.close();
+    } catch (err) {
+      await fd.close();
+      throw err;
+    }
 
-  // Phase 4: Track overall start time
-  const totalTimeout = opts?.timeout || 30000; // Duration: total time budget
-  const overallStartTime = Date.now(); // NEW: Absolute timestamp - track overall start for absolute deadline
+    await fs.rename(tmpPath, commandPath);
+
+    // Phase 4: Track overall start time
+    const totalTimeout = opts?.timeout || 30000; // Duration: total time budget
+    const overallStartTime = Date.now(); // NEW: Absolute timestamp - track overall start for absolute deadline
+
+    // Phase 3: Wait for pickup acknowledgment
+    // Respect total timeout: don't wait longer than the caller's budget
+    const pickupLimit = Math.min(totalTimeout, PICKUP_TIMEOUT_MS);
+    const pickupStartTime = Date.now(); // NEW: Absolute timestamp - pickup phase start
+    const pickupResult = await waitForPickupAck(jobDir, pickupLimit, opts?.signal, notifier);
+    const pickupEndTime = Date.now(); // NEW: Absolute timestamp - pickup phase end
+    const pickupDuration = pickupEndTime - pickupStartTime; // NEW: Duration - actual pickup time
+
+    if (!pickupResult.claimed) {
+      const pickupElapsed = Date.now() - overallStartTime;
+      // If we've exhausted the total timeout budget, return E_TIMEOUT (not E_PICKUP_TIMEOUT)
+      if (pickupElapsed >= totalTimeout) {
+        return makeErrorEnvelope(
+          'E_TIMEOUT',
+          `Command timed out after ${totalTimeout}ms`
+        );
+      }
+      // Otherwise, pickup timeout occurred within budget (bridge overloaded/crashed)
+      return makeErrorEnvelope(
+        'E_PICKUP_TIMEOUT',
+        `Bridge did not pick up job within 5 seconds. The extension might be overloaded, at capacity, crashed, or not installed. If extension crashed, try restarting VS Code. Check bridge logs and capacity settings (MAX_CONCURRENT).\n\n` +
+        `To install the VS Code extension:\n` +
+        `  vscb get-vsix --install\n\n` +
+        `Or download manually:\n` +
+        `  vscb get-vsix`
+      );
+    }
+
+    // Phase 5: Verbose logging - log pickup duration when verbose flag enabled
+    if (opts?.verbose) {
+      process.stderr.write(`[DEBUG] Job claimed in ${pickupDuration}ms\n`);
+    }
 
-  // Phase 3: Wait for pickup acknowledgment
-  // Respect total timeout: don't wait longer than the caller's budget
-  const pickupLimit = Math.min(totalTimeout, PICKUP_TIMEOUT_MS);
-  const pickupStartTime = Date.now(); // NEW: Absolute timestamp - pickup phase start
-  const pickupResult = await waitForPickupAck(jobDir, pickupLimit, opts?.signal);
-  const pickupEndTime = Date.now(); // NEW: Absolute timestamp - pickup phase end
-  const pickupDuration = pickupEndTime - pickupStartTime; // NEW: Duration - actual pickup time
+    // Phase 4: Calculate remaining timeout for execution phase
+    const remainingTimeout = totalTimeout - pickupDuration; // Duration: time left for execution
 
-  if (!pickupResult.claimed) {
-    const pickupElapsed = Date.now() - overallStartTime;
-    // If we've exhausted the total timeout budget, return E_TIMEOUT (not E_PICKUP_TIMEOUT)
-    if (pickupElapsed >= totalTimeout) {
+    // Edge case: pickup consumed full timeout (T013)
+    if (remainingTimeout <= 0) {
       return makeErrorEnvelope(
         'E_TIMEOUT',
         `Command timed out after ${totalTimeout}ms`
       );
     }
-    // Otherwise, pickup timeout occurred within budget (bridge overloaded/crashed)
-    return makeErrorEnvelope(
-      'E_PICKUP_TIMEOUT',
-      `Bridge did not pick up job within 5 seconds. The extension might be overloaded, at capacity, crashed, or not installed. If extension crashed, try restarting VS Code. Check bridge logs and capacity settings (MAX_CONCURRENT).\n\n` +
-      `To install the VS Code extension:\n` +
-      `  vscb get-vsix --install\n\n` +
-      `Or download manually:\n` +
-      `  vscb get-vsix`
-    );
-  }
-
-  // Phase 5: Verbose logging - log pickup duration when verbose flag enabled
-  if (opts?.verbose) {
-    process.stderr.write(`[DEBUG] Job claimed in ${pickupDuration}ms\n`);
-  }
-
-  // Phase 4: Calculate remaining timeout for execution phase
-  const remainingTimeout = totalTimeout - pickupDuration; // Duration: time left for execution
 
-  // Edge case: pickup consumed full timeout (T013)
-  if (remainingTimeout <= 0) {
-    return makeErrorEnvelope(
-      'E_TIMEOUT',
-      `Command timed out after ${totalTimeout}ms`
-    );
-  }
+    // Stream events to the caller while the job runs
+    if (opts?.onEvent) {
+      eventTail = tailEvents(path.join(jobDir, 'events.ndjson'), opts.onEvent, opts.waitMode);
+    }
 
-  // Setup timeout for execution phase
-  const executionStartTime = Date.now(); // NEW: Absolute timestamp - execution phase start
+    // Setup timeout for execution phase
+    const executionStartTime = Date.now(); // NEW: Absolute timestamp - execution phase start
+    const donePath = path.join(jobDir, 'done');
+    let cancelSent = false;
+
+    // Wait for completion
+    while (true) {
+      // Phase 4: Absolute deadline check (safety net)
+      const totalElapsed = Date.now() - overallStartTime; // Duration: total time since start
+      if (totalElapsed > totalTimeout) {
+        return makeErrorEnvelope('E_TIMEOUT', `Command timed out after ${totalTimeout}ms`);
+      }
 
-  // Poll for completion
-  const pollInterval = isWSL() ? 150 : 50; // Higher interval for WSL
+      // Phase 4: Remaining timeout check
+      const executionElapsed = Date.now() - executionStartTime; // Duration: time in execution phase
+      if (executionElapsed > remainingTimeout) {
+        return makeErrorEnvelope('E_TIMEOUT', `Command timed out after ${totalTimeout}ms`);
+      }
 
-  while (true) {
-    // Phase 4: Absolute deadline check (safety net)
-    const totalElapsed = Date.now() - overallStartTime; // Duration: total time since start
-    if (totalElapsed > totalTimeout) {
-      return makeErrorEnvelope('E_TIMEOUT', `Command timed out after ${totalTimeout}ms`);
-    }
+      // Check for abort signal (write the sentinel once; our own write would
+      // otherwise wake the watcher and spin this loop)
+      if (opts?.signal?.aborted && !cancelSent) {
+        cancelSent = true;
+        await cancelCommand(bridgeRoot, payload.id);
+        // Continue waiting for actual cancellation
+      }
 
-    // Phase 4: Remaining timeout check
-    const executionElapsed = Date.now() - executionStartTime; // Duration: time in execution phase
-    if (executionElapsed > remainingTimeout) {
-      return makeErrorEnvelope('E_TIMEOUT', `Command timed out after ${totalTimeout}ms`);
-    }
+      // Check for done file
+      try {
+        await fs.access(donePath);
+        // Done! Read response
+        break;
+      } catch {
+        // Not done yet, continue waiting
+      }
 
-    // Check for abort signal
-    if (opts?.signal?.aborted) {
-      await cancelCommand(bridgeRoot, payload.id);
-      // Continue polling for actual cancellation
+      // Sleep until the job directory changes (or the fallback interval elapses)
+      const untilDeadline = remainingTimeout - (Date.now() - executionStartTime);
+      await notifier.wait(Math.max(1, Math.min(notifier.fallbackMs, untilDeadline + 1)), opts?.signal);
     }
 
-    // Check for done file
-    const donePath = path.join(jobDir, 'done');
-    try {
-      await fs.access(donePath);
-      // Done! Read response
-      break;
-    } catch {
-      // Not done yet, continue polling
+    // Deliver any events written just before the done marker
+    if (eventTail) {
+      await eventTail.stop();
+      eventTail = undefined;
     }
 
-    // Check for events if handler provided
-    if (opts?.onEvent) {
-      const eventsPath = path.join(jobDir, 'events.ndjson');
-      try {
-        // We'll implement watchEvents separately
-        // For now just check if file exists
-        await fs.access(eventsPath);
-      } catch {}
+    return await readJobResult(jobDir);
+  } finally {
+    notifier.close();
+    if (eventTail) {
+      await eventTail.stop();
     }
-
-    // Wait before next poll
-    await new Promise(resolve => setTimeout(resolve, pollInterval));
   }
+}
 
+/**
+ * Read the final envelope for a completed job
+ */
+async function readJobResult(jobDir: string): Promise<any> {
   // Read response or error
   const errorPath = path.join(jobDir, 'error.json');
   const responsePath = path.join(jobDir, 'response.json');
@@ -306,15 +428,7 @@ export async function runCommand(
       const response = JSON.parse(responseData);
 
       // Check for dataRef (large payload)
-      if (response.dataRef) {
-        const dataPath = path.join(jobDir, response.dataRef);
-        const largeDataText = await fs.readFile(dataPath, 'utf8');
-        // Parse as JSON to maintain envelope type parity
-        response.data = JSON.parse(largeDataText);
-        delete response.dataRef;
-      }
-
-      return response;
+      return response.dataRef ? await resolveDataRef(jobDir, response) : response;
     } catch {
       // No response either
       return makeErrorEnvelope('E_NO_RESPONSE', 'Command completed without response');
@@ -322,11 +436,180 @@ export async function runCommand(
   }
 }
 
+/**
+ * Replace a response's dataRef with the data it references (in `dataDir`)
+ */
+async function resolveDataRef(dataDir: string, response: any): Promise<any> {
+  response.data = await readLargeData(
+    path.join(dataDir, response.dataRef),
+    response.dataFormat,
+    response.dataEncoding
+  );
+  delete response.dataRef;
+  delete response.dataFormat;
+  delete response.dataEncoding;
+  return response;
+}
+
+/**
+ * Read a large result written beside response.json (or in the socket data dir)
+ *
+ * The file is streamed (and gunzipped when needed). NDJSON files are parsed
+ * one line at a time, so only the decoded result is held, never the whole
+ * file text.
+ */
+async function readLargeData(
+  dataPath: string,
+  format: 'json' | 'ndjson' = 'json',
+  encoding?: 'gzip'
+): Promise<unknown> {
+  const file = createReadStream(dataPath);
+  const input = encoding === 'gzip' ? file.pipe(createGunzip()) : file;
+  file.on('error', err => input.destroy(err));
+
+  if (format === 'ndjson') {
+    const items: unknown[] = [];
+    const lines = readline.createInterface({ input, crlfDelay: Infinity });
+    for await (const line of lines) {
+      if (line) {
+        items.push(JSON.parse(line));
+      }
+    }
+    return items;
+  }
+
+  // Parse as JSON to maintain envelope type parity
+  const chunks: Buffer[] = [];
+  for await (const chunk of input) {
+    chunks.push(chunk as Buffer);
+  }
+  return JSON.parse(Buffer.concat(chunks).toString('utf8'));
+}
+
 // Helper to detect WSL (imported from wsl.ts in real impl)
 function isWSL(): boolean {
   return /microsoft|wsl/i.test(release());
 }
 
+/**
+ * Legacy fixed poll interval (higher for WSL)
+ */
+function legacyPollInterval(): number {
+  return isWSL() ? 150 : 50;
+}
+
+/**
+ * Resolve wait mode: explicit option, then VSCB_WAIT_MODE, then 'watch'
+ */
+function resolveWaitMode(mode?: WaitMode): WaitMode {
+  if (mode) return mode;
+  return process.env.VSCB_WAIT_MODE === 'poll' ? 'poll' : 'watch';
+}
+
+/**
+ * Resolve transport: explicit option, then VSCB_TRANSPORT, then 'auto'
+ */
+function resolveTransportMode(mode?: TransportMode): TransportMode {
+  if (mode) return mode;
+  const env = process.env.VSCB_TRANSPORT;
+  return env === 'socket' || env === 'filesystem' ? env : 'auto';
+}
+
+/**
+ * Wakes waiters when something in a directory changes
+ *
+ * fs.watch is an optimisation, not a guarantee: network shares, WSL /mnt
+ * drives written from Windows, and some container mounts drop notifications.
+ * Every wait is therefore still bounded by a fallback poll interval, and if
+ * the watcher cannot be created we degrade to plain legacy polling.
+ */
+class JobDirNotifier {
+  private watcher: FSWatcher | null = null;
+  private pending = false;
+  private wakers = new Set<() => void>();
+
+  /** Upper bound for a single wait when no notification arrives */
+  readonly fallbackMs: number;
+
+  constructor(dir: string, mode: WaitMode, fileFilter?: string) {
+    if (mode === 'watch') {
+      try {
+        this.watcher = watch(dir, (_event, filename) => {
+          // filename can be null on some platforms; treat that as relevant
+          if (fileFilter && filename && filename.toString() !== fileFilter) return;
+          this.notify();
+        });
+        // Directory removal (e.g. job cleanup) surfaces as an error event
+        this.watcher.on('error', () => this.closeWatcher());
+      } catch {
+        this.watcher = null;
+      }
+    }
+
+    // Inotify does not see writes made by Windows processes under /mnt, so
+    // keep the legacy cadence on WSL even when the watcher is up
+    this.fallbackMs = this.watcher && !isWSL() ? WATCH_FALLBACK_POLL_MS : legacyPollInterval();
+  }
+
+  /**
+   * Wake all current waiters (or the next one, if nobody is waiting yet)
+   */
+  notify(): void {
+    this.pending = true;
+    for (const wake of this.wakers) {
+      wake();
+    }
+    this.wakers.clear();
+  }
+
+  /**
+   * Resolve on the next change, abort, or after maxMs - whichever is first
+   *
+   * Changes that happened since the previous wait resolve immediately, so a
+   * check-then-wait loop cannot miss an event that lands between the two.
+   * An already-aborted signal does not short-circuit the wait (callers keep
+   * waiting for the bridge to acknowledge cancellation).
+   */
+  wait(maxMs: number, signal?: AbortSignal): Promise<void> {
+    if (this.pending) {
+      this.pending = false;
+      return Promise.resolve();
+    }
+    if (signal?.aborted) {
+      signal = undefined;
+    }
+
+    return new Promise(resolve => {
+      const done = () => {
+        clearTimeout(timer);
+        signal?.removeEventListener('abort', done);
+        this.wakers.delete(done);
+        this.pending = false;
+        resolve();
+      };
+      const timer = setTimeout(done, maxMs);
+      signal?.addEventListener('abort', done, { once: true });
+      this.wakers.add(done);
+    });
+  }
+
+  close(): void {
+    this.closeWatcher();
+    this.notify();
+  }
+
+  private closeWatcher(): void {
+    if (this.watcher) {
+      try {
+        this.watcher.close();
+      } catch {
+        // Already closed
+      }
+      this.watcher = null;
+    }
+  }
+}
+
 /**
  * Wait for bridge to claim job by creating claimed.json
  * Returns when claimed.json detected or timeout expires
@@ -335,20 +618,22 @@ function isWSL(): boolean {
  * @param jobDir - Absolute path to job directory
  * @param timeoutMs - Maximum time to wait for pickup (typically PICKUP_TIMEOUT_MS)
  * @param signal - Optional AbortSignal for cancellation during pickup
+ * @param notifier - Change notifier for jobDir
  * @returns Promise resolving to { claimed: boolean }
  */
 async function waitForPickupAck(
   jobDir: string,
   timeoutMs: number,
-  signal?: AbortSignal
+  signal: AbortSignal | undefined,
+  notifier: JobDirNotifier
 ): Promise<{ claimed: boolean }> {
   const startTime = Date.now();
-  const pollInterval = isWSL() ? 150 : 50;
   const claimedPath = path.join(jobDir, 'claimed.json');
 
   while (true) {
     // Check timeout
-    if (Date.now() - startTime > timeoutMs) {
+    const elapsed = Date.now() - startTime;
+    if (elapsed > timeoutMs) {
       return { claimed: false };
     }
 
@@ -366,8 +651,8 @@ async function waitForPickupAck(
       // File doesn't exist yet
     }
 
-    // Wait before next poll
-    await new Promise(resolve => setTimeout(resolve, pollInterval));
+    // Sleep until the job directory changes (bounded by the remaining pickup budget)
+    await notifier.wait(Math.max(1, Math.min(notifier.fallbackMs, timeoutMs - elapsed + 1)), signal);
   }
 }
 
@@ -386,22 +671,35 @@ export async function cancelCommand(bridgeRoot: string, id: string): Promise<voi
 }
 
 /**
- * Watch events from an event stream file with robust partial line handling
+ * Handle on a running event tail
  */
-export async function watchEvents(
+type EventTail = {
+  /** Read whatever is left in the file, then stop tailing */
+  stop(): Promise<void>;
+};
+
+/**
+ * Tail an NDJSON event file, invoking cb for each complete line
+ *
+ * Reads are triggered by change notifications on the parent directory (the
+ * file may not exist yet), with the notifier's fallback poll as a safety net.
+ */
+function tailEvents(
   eventPath: string,
-  cb: (e: any) => void
-): Promise<() => void> {
+  cb: (e: any) => void,
+  waitMode?: WaitMode
+): EventTail {
   let watching = true;
   let byteOffset = 0;
   let partialLine = ''; // Buffer for incomplete lines
 
-  // Polling-based approach for reliability
-  const pollInterval = isWSL() ? 150 : 50;
-
-  const poll = async () => {
-    if (!watching) return;
+  const notifier = new JobDirNotifier(
+    path.dirname(eventPath),
+    resolveWaitMode(waitMode),
+    path.basename(eventPath)
+  );
 
+  const readNew = async () => {
     try {
       // Check if file exists and get size
       const stats = await fs.stat(eventPath);
@@ -445,18 +743,41 @@ export async function watchEvents(
         console.error('Error reading events:', err.message);
       }
     }
+  };
 
-    if (watching) {
-      setTimeout(poll, pollInterval);
+  // Single reader loop: reads never overlap, so offsets stay consistent
+  const loop = (async () => {
+    while (watching) {
+      await readNew();
+      if (!watching) break;
+      await notifier.wait(notifier.fallbackMs);
+    }
+  })();
+
+  return {
+    async stop() {
+      if (!watching) return;
+      watching = false;
+      notifier.close();
+      await loop;
+      await readNew();
     }
   };
+}
 
-  // Start polling
-  poll();
+/**
+ * Watch events from an event stream file with robust partial line handling
+ */
+export async function watchEvents(
+  eventPath: string,
+  cb: (e: any) => void,
+  opts?: { waitMode?: WaitMode }
+): Promise<() => void> {
+  const tail = tailEvents(eventPath, cb, opts?.waitMode);
 
   // Return unsubscribe function
   return () => {
-    watching = false;
+    tail.stop().catch(() => {});
   };
 }
 
@@ -465,7 +786,7 @@ export async function watchEvents(
  */
 export async function checkBridgeHealth(
   bridgeRoot: string
-): Promise<{ healthy: boolean; lastSeen: Date }> {
+): Promise<BridgeHealth> {
   const hostPath = path.join(bridgeRoot, 'host.json');
 
   try {
@@ -475,7 +796,7 @@ export async function checkBridgeHealth(
 
     // Consider healthy if updated within 30 seconds
     // (Extension updates every ~10s)
-    const healthy = age < 30000;
+    const healthy = age < HEALTH_STALE_MS;
 
     return {
       healthy,
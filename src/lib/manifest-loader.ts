@@ -1,6 +1,17 @@
 import * as fs from 'fs';
 import * as path from 'path';
 import { fileURLToPath } from 'url';
+import { fileSignature, readCache, writeCache } from './metadata-cache.js';
+
+/**
+ * Cache namespace for per-script manifest metadata
+ */
+const CACHE_NAMESPACE = 'manifest';
+
+/**
+ * Cache key marking that every script of a manifest has been cached
+ */
+const INDEX_KEY = '__index__';
 
 /**
  * Parameter definition from metadata
@@ -67,9 +78,15 @@ export interface ManifestV2 {
 
 /**
  * Manifest loader with caching and fallback paths
+ *
+ * The parsed manifest is cached in memory for the life of the process. Each
+ * script's metadata is also cached on disk (see metadata-cache.ts), so a
+ * command that needs one script, like `vscb script run debug.status`, reads a
+ * small entry instead of parsing the whole manifest on every invocation.
  */
 export class ManifestLoader {
     private cache: ManifestV2 | null = null;
+    private loadedPath: string | null = null;
     private searchPaths: string[] = [];
 
     constructor() {
@@ -131,6 +148,8 @@ export class ManifestLoader {
 
                     // Cache and return
                     this.cache = manifest;
+                    this.loadedPath = searchPath;
+                    this.cacheScripts(searchPath, manifest);
                     return manifest;
                 }
             } catch (error) {
@@ -152,12 +171,67 @@ export class ManifestLoader {
      */
     clearCache(): void {
         this.cache = null;
+        this.loadedPath = null;
+    }
+
+    /**
+     * First search path that exists, without reading it
+     *
+     * This is the file load() reads, so files built alongside the manifest
+     * (such as the MCP tool catalog) can be found without parsing it.
+     */
+    resolvePath(): string | null {
+        for (const searchPath of this.searchPaths) {
+            if (fs.existsSync(searchPath)) {
+                return searchPath;
+            }
+        }
+        return null;
+    }
+
+    /**
+     * Write each script's metadata to the on-disk cache, once per manifest build
+     */
+    private cacheScripts(manifestPath: string, manifest: ManifestV2): void {
+        const signature = fileSignature(manifestPath);
+        if (!signature || readCache<string[]>(CACHE_NAMESPACE, INDEX_KEY, signature)) {
+            return;
+        }
+        for (const [alias, entry] of Object.entries(manifest.scripts)) {
+            writeCache(CACHE_NAMESPACE, alias, signature, entry.metadata);
+        }
+        writeCache(CACHE_NAMESPACE, INDEX_KEY, signature, Object.keys(manifest.scripts));
+    }
+
+    /**
+     * Script metadata from the on-disk cache, if it matches the manifest on disk
+     *
+     * Only entries written from the manifest that load() would pick are
+     * accepted, so an invalid or rebuilt manifest falls through to a full load.
+     */
+    private getCachedScriptMetadata(alias: string): ScriptMetadata | undefined {
+        const manifestPath = this.resolvePath();
+        const signature = manifestPath ? fileSignature(manifestPath) : null;
+        if (!signature) {
+            return undefined;
+        }
+        const metadata = readCache<ScriptMetadata>(CACHE_NAMESPACE, alias, signature);
+        if (metadata) {
+            this.loadedPath = manifestPath;
+        }
+        return metadata;
     }
 
     /**
      * Get metadata for a specific script
      */
     getScriptMetadata(alias: string): ScriptMetadata | null {
+        if (!this.cache) {
+            const cached = this.getCachedScriptMetadata(alias);
+            if (cached) {
+                return cached;
+            }
+        }
         const manifest = this.load();
         const entry = manifest.scripts[alias];
         return entry?.metadata || null;
@@ -201,21 +275,14 @@ export class ManifestLoader {
      * Get the path where manifest was loaded from
      */
     getLoadedPath(): string | null {
-        // Try to find which path worked
-        for (const searchPath of this.searchPaths) {
-            if (fs.existsSync(searchPath)) {
-                try {
-                    const content = fs.readFileSync(searchPath, 'utf-8');
-                    const manifest = JSON.parse(content) as ManifestV2;
-                    if (manifest.version === 2) {
-                        return searchPath;
-                    }
-                } catch {
-                    continue;
-                }
+        if (!this.loadedPath) {
+            try {
+                this.load();
+            } catch {
+                return null;
             }
         }
-        return null;
+        return this.loadedPath;
     }
 }
 
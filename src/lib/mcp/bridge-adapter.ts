@@ -10,7 +10,7 @@
  * - Wrap success/error responses in MCP envelope format
  * - Handle timeouts and cancellation signals
  * - Cleanup job directories after execution
- * - Detect and handle large payloads (>25k tokens)
+ * - Spill large payloads (>25k tokens) to the bridge's spill store
  *
  * @module cli/lib/mcp/bridge-adapter
  */
@@ -18,7 +18,9 @@
 import { promises as fs } from 'fs';
 import path from 'path';
 import os from 'os';
-import { runCommand, sortableId, CommandJson } from '../fs-bridge.js';
+import { runCommand, sortableId, CommandJson, type BridgeHealth } from '../fs-bridge.js';
+import type { SocketEndpoint } from '../bridge-socket.js';
+import { estimateTokens, getSpillStore, SPILL_TOKEN_THRESHOLD } from './spill-store.js';
 
 /**
  * Options for bridge adapter execution.
@@ -50,6 +52,25 @@ export interface BridgeAdapterOptions {
    * by fs-bridge's cancel file mechanism.
    */
   signal?: AbortSignal;
+
+  /**
+   * Bridge health already tracked by the caller (see BridgeClient).
+   *
+   * When set, fs-bridge skips its own host.json check for this call.
+   */
+  health?: BridgeHealth;
+
+  /**
+   * Socket endpoint already read from host.json (null: none advertised).
+   */
+  socketEndpoint?: SocketEndpoint | null;
+
+  /**
+   * Schema hash of the validator `args` already passed (see getValidator).
+   *
+   * Sent with the command so the extension skips validating them again.
+   */
+  paramsSchemaHash?: string;
 }
 
 /**
@@ -64,7 +85,7 @@ export interface ToolResponse {
    *
    * For success: JSON stringified data
    * For error: Error code and message
-   * For large payloads: Temp file path with token count
+   * For large payloads: Spill descriptor (id for result_page, size, summary)
    */
   content: Array<{
     type: 'text';
@@ -74,7 +95,8 @@ export interface ToolResponse {
   /**
    * Full fs-bridge envelope preserved for debugging and advanced use cases.
    *
-   * Contains: {ok, type, data, meta, error?}
+   * Contains: {ok, type, data, meta, error?}. For spilled results `data` is
+   * replaced by the spill descriptor rather than duplicating the payload.
    */
   structuredContent?: unknown;
 
@@ -96,7 +118,7 @@ export interface ToolResponse {
  *
  * Implementation follows four critical insights:
  * - Insight #1: Use same timeout for adapter and fs-bridge (no +1000ms)
- * - Insight #2: Use tiktoken to detect large payloads, spill to temp files
+ * - Insight #2: Estimate tokens to detect large payloads, spill to the spill store
  * - Insight #3: Always cleanup job directories in finally block
  * - Insight #4: Simple AbortSignal pass-through (defer semantics)
  *
@@ -132,12 +154,13 @@ export async function executeToolViaBridge(
     const commandId = sortableId(Date.now());
     const commandJson: CommandJson = {
       version: 1,
-      clientId: 'mcp-server',
+      clientId: `mcp-${process.pid}`,
       id: commandId,
       createdAt: new Date().toISOString(),
       scriptName: toolName,
       params: args,
-      timeout: options.timeout
+      timeout: options.timeout,
+      ...(options.paramsSchemaHash && { paramsSchemaHash: options.paramsSchemaHash })
     };
 
     jobDir = path.join(options.bridgeRoot, 'execute', commandId);
@@ -147,12 +170,18 @@ export async function executeToolViaBridge(
     const envelope = await runCommand(
       options.bridgeRoot,
       commandJson,
-      { timeout, signal: options.signal, verbose: false }  // Phase 5: MCP always uses verbose: false
+      {
+        timeout,
+        signal: options.signal,
+        verbose: false,  // Phase 5: MCP always uses verbose: false
+        health: options.health,
+        socketEndpoint: options.socketEndpoint
+      }
     );
 
     // Wrap response in MCP format
     if (envelope.ok) {
-      return wrapSuccessResponse(envelope);
+      return await wrapSuccessResponse(envelope, options.bridgeRoot);
     } else {
       return wrapErrorResponse(envelope);
     }
@@ -173,29 +202,34 @@ export async function executeToolViaBridge(
 /**
  * Wrap a success response from fs-bridge in MCP format.
  *
- * Implements Insight #2: Use tiktoken to detect large payloads (>25k tokens)
- * and spill to temporary files when exceeded.
+ * Implements Insight #2: payloads estimated above SPILL_TOKEN_THRESHOLD are
+ * written to the bridge's spill store. The response then carries only a spill
+ * descriptor, which the agent pages through with the `result_page` tool.
  *
  * @param envelope - fs-bridge success envelope
+ * @param bridgeRoot - Bridge root owning the spill store
  * @returns MCP-formatted success response
  */
-function wrapSuccessResponse(envelope: any): ToolResponse {
-  const dataStr = JSON.stringify(envelope.data);
+async function wrapSuccessResponse(envelope: any, bridgeRoot: string): Promise<ToolResponse> {
+  const dataStr = JSON.stringify(envelope.data) ?? 'null';
+
+  // Short results need no estimate at all (every token is at least one character)
+  const estimatedTokens = dataStr.length > SPILL_TOKEN_THRESHOLD
+    ? estimateTokens(dataStr, SPILL_TOKEN_THRESHOLD)
+    : 0;
 
-  // TODO (Phase 6): Add tiktoken measurement for large payload detection
-  // For now, use simple character count as proxy (1 token ≈ 4 characters)
-  const estimatedTokens = Math.ceil(dataStr.length / 4);
+  if (estimatedTokens > SPILL_TOKEN_THRESHOLD) {
+    const spill = await getSpillStore(bridgeRoot).spill(envelope.data, dataStr, estimateTokens(dataStr));
+    const next = spill.records
+      ? `Fetch records with result_page({ id: "${spill.id}" }) and follow nextCursor.`
+      : `Fetch the JSON text with result_page({ id: "${spill.id}" }) and follow nextCursor.`;
 
-  // Insight #2: Spill large payloads to temp files
-  if (estimatedTokens > 25000) {
-    // TODO: Implement temp file spillover
-    // For now, return truncated response with warning
     return {
       content: [{
         type: 'text',
-        text: `⚠️ Response too large (est. ${estimatedTokens} tokens > 25k limit). Truncated preview:\n${dataStr.substring(0, 1000)}...`
+        text: JSON.stringify({ spilled: true, ...spill, next }, null, 2)
       }],
-      structuredContent: envelope
+      structuredContent: { ok: envelope.ok, type: envelope.type, meta: envelope.meta, data: { spilled: true, ...spill } }
     };
   }
 
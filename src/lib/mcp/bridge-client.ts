@@ -0,0 +1,286 @@
+/**
+ * Long-lived bridge client for the MCP server.
+ *
+ * The MCP server is a single process that serves many tool calls, so state
+ * the one-shot CLI has to rediscover on every run can be kept here:
+ * - The bridge root is found once (findBridgeRoot walks up the tree) and only
+ *   looked up again after the bridge disappears
+ * - Health follows the host.json heartbeat: the file is stat'ed at most once
+ *   per HEALTH_CHECK_INTERVAL_MS and only re-parsed (for the socket endpoint)
+ *   when the heartbeat has rewritten it
+ * - Concurrent identical calls to read-only, idempotent scripts share one
+ *   bridge request, so agents firing parallel `debug_status` or
+ *   `breakpoint_list` calls hit the extension once
+ *
+ * Only in-flight requests are shared; a call that starts after the shared one
+ * finished gets a fresh result.
+ *
+ * @module cli/lib/mcp/bridge-client
+ */
+
+import { promises as fs } from 'fs';
+import path from 'path';
+import { findBridgeRoot, HEALTH_STALE_MS, type BridgeHealth } from '../fs-bridge.js';
+import { readSocketEndpoint, type SocketEndpoint } from '../bridge-socket.js';
+import type { ScriptMetadata } from '../manifest-loader.js';
+import { executeToolViaBridge, type ToolResponse } from './bridge-adapter.js';
+
+/**
+ * How long a healthy host.json check is trusted before stat'ing again.
+ */
+export const HEALTH_CHECK_INTERVAL_MS = 1000;
+
+/**
+ * Options for creating a bridge client.
+ */
+export interface BridgeClientOptions {
+  /**
+   * Workspace directory to start bridge root discovery from.
+   *
+   * @default process.cwd()
+   */
+  workspace?: string;
+}
+
+/**
+ * Options for a single tool call.
+ */
+export interface BridgeCallOptions {
+  /** Timeout in milliseconds for the bridge request */
+  timeout?: number;
+
+  /** Cancellation for this call (not used for shared calls) */
+  signal?: AbortSignal;
+
+  /**
+   * Whether identical concurrent calls may share one bridge request.
+   *
+   * Only set for scripts whose metadata marks them read-only and idempotent
+   * (see isShareableScript).
+   */
+  shareable?: boolean;
+
+  /** Schema hash of pre-validated args (see BridgeAdapterOptions.paramsSchemaHash) */
+  paramsSchemaHash?: string;
+}
+
+/**
+ * Bridge client counters.
+ */
+export interface BridgeClientStats {
+  /** Tool calls made through the client */
+  calls: number;
+
+  /** Calls that joined an identical in-flight request */
+  shared: number;
+
+  /** Bridge root discoveries (findBridgeRoot walks) */
+  rootLookups: number;
+
+  /** host.json parses */
+  hostReads: number;
+}
+
+interface HostState {
+  bridgeRoot: string;
+  checkedAt: number;
+  mtimeMs: number;
+  size: number;
+  health: BridgeHealth;
+  socketEndpoint: SocketEndpoint | null;
+}
+
+/**
+ * Whether concurrent identical calls to a script can share one request.
+ *
+ * Requires the script's MCP safety metadata to declare it both read-only and
+ * idempotent (e.g. debug.status, breakpoint.list).
+ */
+export function isShareableScript(metadata: ScriptMetadata | undefined): boolean {
+  const safety = (metadata?.mcp as any)?.safety;
+  return safety?.read_only === true && safety?.idempotent === true;
+}
+
+/**
+ * JSON with object keys sorted, so equal arguments give equal keys.
+ */
+function stableStringify(value: unknown): string {
+  if (Array.isArray(value)) {
+    return `[${value.map(stableStringify).join(',')}]`;
+  }
+  if (value && typeof value === 'object') {
+    const entries = Object.keys(value as Record<string, unknown>)
+      .sort()
+      .map(key => `${JSON.stringify(key)}:${stableStringify((value as Record<string, unknown>)[key])}`);
+    return `{${entries.join(',')}}`;
+  }
+  return JSON.stringify(value) ?? 'undefined';
+}
+
+/**
+ * Persistent bridge client owned by one MCP server.
+ *
+ * @example
+ * ```typescript
+ * const bridge = new BridgeClient({ workspace: '/my/project' });
+ * const [a, b] = await Promise.all([
+ *   bridge.execute('debug.status', {}, { shareable: true }),
+ *   bridge.execute('debug.status', {}, { shareable: true })
+ * ]);
+ * // One bridge job; a and b are the same response
+ * ```
+ */
+export class BridgeClient {
+  private root: Promise<string> | undefined;
+  private host: HostState | undefined;
+  private inFlight = new Map<string, Promise<ToolResponse>>();
+  private counters: BridgeClientStats = { calls: 0, shared: 0, rootLookups: 0, hostReads: 0 };
+
+  constructor(private readonly options: BridgeClientOptions = {}) {}
+
+  /**
+   * Bridge root for the workspace, discovered once.
+   *
+   * A failed lookup is not cached, so a bridge that starts later is found on
+   * the next call.
+   */
+  getBridgeRoot(): Promise<string> {
+    if (!this.root) {
+      this.counters.rootLookups++;
+      const lookup = findBridgeRoot(this.options.workspace ?? process.cwd());
+      this.root = lookup;
+      lookup.catch(() => {
+        if (this.root === lookup) {
+          this.root = undefined;
+        }
+      });
+    }
+    return this.root;
+  }
+
+  /**
+   * Current bridge health, following host.json heartbeats.
+   *
+   * @param force - Stat host.json even if the last check is recent
+   */
+  async getHealth(force = false): Promise<BridgeHealth> {
+    const host = await this.getHostState(await this.getBridgeRoot(), force);
+    if (force && host.mtimeMs === 0) {
+      // host.json is gone: look for the bridge again (throws if there is none)
+      return (await this.getHostState(await this.getBridgeRoot(), true)).health;
+    }
+    return host.health;
+  }
+
+  /**
+   * Execute a script via the bridge.
+   *
+   * @param scriptName - Script alias (e.g. 'debug.status')
+   * @param args - Script parameters
+   * @param options - Timeout, cancellation and sharing
+   * @returns MCP-formatted tool response
+   */
+  execute(
+    scriptName: string,
+    args: Record<string, unknown>,
+    options: BridgeCallOptions = {}
+  ): Promise<ToolResponse> {
+    this.counters.calls++;
+    if (!options.shareable) {
+      return this.dispatch(scriptName, args, options);
+    }
+
+    const key = `${scriptName}\0${stableStringify(args)}`;
+    const pending = this.inFlight.get(key);
+    if (pending) {
+      this.counters.shared++;
+      return pending;
+    }
+
+    // A shared request must not be cancelled by whichever caller started it
+    const request = this.dispatch(scriptName, args, { ...options, signal: undefined })
+      .finally(() => this.inFlight.delete(key));
+    this.inFlight.set(key, request);
+    return request;
+  }
+
+  /**
+   * Client counters.
+   */
+  stats(): BridgeClientStats {
+    return { ...this.counters };
+  }
+
+  /**
+   * Forget the bridge root and health, e.g. after the bridge went away.
+   */
+  invalidate(): void {
+    this.root = undefined;
+    this.host = undefined;
+  }
+
+  private async dispatch(
+    scriptName: string,
+    args: Record<string, unknown>,
+    options: BridgeCallOptions
+  ): Promise<ToolResponse> {
+    const bridgeRoot = await this.getBridgeRoot();
+    const host = await this.getHostState(bridgeRoot);
+
+    const response = await executeToolViaBridge(scriptName, args, {
+      bridgeRoot,
+      timeout: options.timeout,
+      signal: options.signal,
+      health: host.health,
+      socketEndpoint: host.socketEndpoint,
+      paramsSchemaHash: options.paramsSchemaHash
+    });
+
+    if (response.isError && (response.structuredContent as any)?.error?.code === 'E_BRIDGE_UNAVAILABLE') {
+      // Re-check (and rediscover if needed) on the next call instead of trusting stale state
+      this.invalidate();
+    }
+    return response;
+  }
+
+  private async getHostState(bridgeRoot: string, force = false): Promise<HostState> {
+    const now = Date.now();
+    const cached = this.host?.bridgeRoot === bridgeRoot ? this.host : undefined;
+    if (cached && !force && cached.health.healthy && now - cached.checkedAt < HEALTH_CHECK_INTERVAL_MS) {
+      return cached;
+    }
+
+    let stat;
+    try {
+      stat = await fs.stat(path.join(bridgeRoot, 'host.json'));
+    } catch {
+      // Bridge directory gone (workspace closed or moved): rediscover next time
+      this.invalidate();
+      return {
+        bridgeRoot,
+        checkedAt: now,
+        mtimeMs: 0,
+        size: 0,
+        health: { healthy: false, lastSeen: new Date(0) },
+        socketEndpoint: null
+      };
+    }
+
+    const health: BridgeHealth = {
+      healthy: now - stat.mtimeMs < HEALTH_STALE_MS,
+      lastSeen: stat.mtime
+    };
+
+    // host.json unchanged since the last parse: reuse the endpoint
+    let socketEndpoint: SocketEndpoint | null;
+    if (cached && cached.mtimeMs === stat.mtimeMs && cached.size === stat.size) {
+      socketEndpoint = cached.socketEndpoint;
+    } else {
+      this.counters.hostReads++;
+      socketEndpoint = (await readSocketEndpoint(bridgeRoot)) ?? null;
+    }
+
+    this.host = { bridgeRoot, checkedAt: now, mtimeMs: stat.mtimeMs, size: stat.size, health, socketEndpoint };
+    return this.host;
+  }
+}
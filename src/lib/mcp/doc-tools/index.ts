@@ -7,6 +7,7 @@
  * - DocFrontMatterSchema: Zod schema for validation
  * - DocFrontMatter: TypeScript type (inferred from schema)
  * - DocEntry: Interface for parsed documentation
+ * - DocCatalogEntry: DocEntry without its body (precomputed tool catalog)
  * - DocSummary: Summary format for catalog browsing (Phase 5)
  * - DocContent: Full doc content format (Phase 5)
  * - DocMetadata: Enriched frontmatter structure (Phase 5)
@@ -44,6 +45,7 @@ export {
   DocFrontMatterSchema,
   type DocFrontMatter,
   type DocEntry,
+  type DocCatalogEntry,
   type DocSummary,
   type DocContent,
   type DocMetadata
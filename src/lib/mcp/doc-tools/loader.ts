@@ -13,6 +13,7 @@ const __dirname = dirname(__filename);
 
 export class DocLoader {
   private cache: DocEntry[] | null = null;
+  private documents = new Map<string, DocEntry>();
 
   /**
    * Load documentation files from the docs directory.
@@ -63,6 +64,28 @@ export class DocLoader {
     return validEntries;
   }
 
+  /**
+   * Load a single documentation file.
+   *
+   * Used when docs come from the precomputed tool catalog: only the doc being
+   * fetched is read and parsed, instead of every file at startup.
+   *
+   * @param filePath Doc file name, as stored in DocEntry.filePath
+   * @param docsDir Optional docs directory path (defaults to ../docs relative to loader.js)
+   * @returns Parsed documentation entry
+   * @throws Error if the file cannot be read or parsed
+   */
+  loadDocument(filePath: string, docsDir?: string): DocEntry {
+    const loaded = this.cache?.find(entry => entry.filePath === filePath) ?? this.documents.get(filePath);
+    if (loaded) return loaded;
+
+    const dir = docsDir ?? join(__dirname, '../docs');
+    const markdown = readFileSync(join(dir, basename(filePath)), 'utf-8');
+    const entry = parseDocument(markdown, basename(filePath));
+    this.documents.set(filePath, entry);
+    return entry;
+  }
+
   /**
    * Discover all .md files in the docs directory.
    *
@@ -87,6 +110,7 @@ export class DocLoader {
    */
   clearCache(): void {
     this.cache = null;
+    this.documents.clear();
   }
 }
 
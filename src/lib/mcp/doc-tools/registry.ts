@@ -10,9 +10,11 @@
  * - O(N) linear search (YAGNI - no hash map optimization)
  * - ID normalization: "debugging-guide" ↔ "docs_debugging_guide"
  * - Filter logic: category exact match, tags OR match
+ * - Entries may come without a body (precomputed tool catalog); the body is
+ *   then loaded on first getDocById()
  */
 
-import type { DocEntry, DocSummary, DocContent, DocMetadata } from './types.js';
+import type { DocEntry, DocCatalogEntry, DocSummary, DocContent, DocMetadata } from './types.js';
 
 /**
  * Custom error for document not found
@@ -44,15 +46,18 @@ export class InvalidDocIdError extends Error {
  * unified catalog and retrieval operations.
  */
 export class DocRegistry {
-  private entries: DocEntry[];
+  private entries: Array<DocEntry | DocCatalogEntry>;
+  private loadContent?: (entry: DocCatalogEntry) => string;
 
   /**
    * Create a new DocRegistry
    *
-   * @param entries - Array of DocEntry objects from docLoader
+   * @param entries - DocEntry objects from docLoader, or body-less entries from the tool catalog
+   * @param loadContent - Reads the markdown body of an entry that has none
    */
-  constructor(entries: DocEntry[]) {
+  constructor(entries: Array<DocEntry | DocCatalogEntry>, loadContent?: (entry: DocCatalogEntry) => string) {
     this.entries = entries;
+    this.loadContent = loadContent;
   }
 
   /**
@@ -151,11 +156,29 @@ export class DocRegistry {
     return {
       id: this.stripDocsPrefix(entry.frontMatter.tool_name),
       summary: entry.frontMatter.summary,
-      content: entry.content,
+      content: this.getContent(entry),
       metadata
     };
   }
 
+  /**
+   * Markdown body of an entry, loaded on first use for catalog entries
+   *
+   * @param entry - Registry entry
+   * @returns Markdown content without front matter
+   */
+  private getContent(entry: DocEntry | DocCatalogEntry): string {
+    if ('content' in entry) {
+      return entry.content;
+    }
+    if (!this.loadContent) {
+      throw new Error(`Document "${entry.filePath}" has no content and no loader`);
+    }
+    const loaded: DocEntry = { ...entry, content: this.loadContent(entry) };
+    this.entries[this.entries.indexOf(entry)] = loaded;
+    return loaded.content;
+  }
+
   /**
    * Normalize document ID for lookup
    *
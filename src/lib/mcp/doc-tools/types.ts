@@ -104,6 +104,18 @@ export interface DocEntry {
   filePath: string;
 }
 
+/**
+ * Documentation entry without its markdown body.
+ *
+ * Stored in the precomputed MCP tool catalog, so docs_list can be answered
+ * without reading any doc file. The body is read from `filePath` when the
+ * doc is fetched.
+ *
+ * @property frontMatter - Validated YAML front matter
+ * @property filePath - Doc file name, relative to the docs directory
+ */
+export type DocCatalogEntry = Pick<DocEntry, 'frontMatter' | 'filePath'>;
+
 // ============================================================================
 // Phase 5: Unified API Types and Enrichment Schema
 // ============================================================================
@@ -15,10 +15,16 @@ export { isValidMcpServerOptions } from './types.js';
 // Phase 2: Bridge adapter
 export type { BridgeAdapterOptions, ToolResponse } from './bridge-adapter.js';
 export { executeToolViaBridge } from './bridge-adapter.js';
+export type { BridgeClientOptions, BridgeCallOptions, BridgeClientStats } from './bridge-client.js';
+export { BridgeClient, isShareableScript } from './bridge-client.js';
+export type { SpillDescriptor, SpillPage, SpillPageOptions } from './spill-store.js';
+export { SpillStore, SpillNotFoundError, getSpillStore, estimateTokens, SPILL_TOKEN_THRESHOLD } from './spill-store.js';
 
 // Phase 3: Tool generator
 export type { McpTool, ToolMetadata, JSONSchema, ParameterHint } from './tool-generator.js';
 export { generateMcpTools, aliasToToolName, paramsToJsonSchema } from './tool-generator.js';
+export type { ToolCatalog } from './tool-catalog.js';
+export { getToolCatalog, loadToolCatalog, writeToolCatalog, buildToolCatalog, CATALOG_FILENAME } from './tool-catalog.js';
 
 // Phase 4: Server factory
 export { createMcpServer } from './server.js';
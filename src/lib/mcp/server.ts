@@ -10,11 +10,15 @@
 
 import { Server } from '@modelcontextprotocol/sdk/server/index.js';
 import { ListToolsRequestSchema, CallToolRequestSchema } from '@modelcontextprotocol/sdk/types.js';
-import { generateMcpTools, aliasToToolName } from './tool-generator.js';
+import { getToolCatalog } from './tool-catalog.js';
 import { manifestLoader } from '../manifest-loader.js';
-import { executeToolViaBridge, type ToolResponse } from './bridge-adapter.js';
+import { getValidator, type CompiledValidator } from '../param-validator.js';
+import type { ToolResponse } from './bridge-adapter.js';
+import { BridgeClient } from './bridge-client.js';
+import { getSpillStore, SpillNotFoundError, DEFAULT_PAGE_BYTES, MAX_PAGE_BYTES } from './spill-store.js';
 import { docLoader, DocRegistry, createDocsListTool, createDocsGetTool } from './doc-tools/index.js';
-import { findBridgeRoot, checkBridgeHealth } from '../fs-bridge.js';
+import { readSocketEndpoint } from '../bridge-socket.js';
+import { BATCH_SCRIPT_NAME, MAX_BATCH_STEPS } from '../batch.js';
 import type { McpTool } from './tool-generator.js';
 
 /**
@@ -51,10 +55,13 @@ export interface McpServerOptions {
  * `InMemoryTransport` (for testing).
  *
  * **Architecture**:
- * 1. Loads `manifest.json` from CLI dist directory
- * 2. Generates MCP tool definitions using `generateMcpTools()`
+ * 1. Loads the precomputed tool catalog built next to `manifest.json`, or
+ *    generates it from the manifest and docs if it is missing or outdated
+ * 2. Doc bodies are read only when docs_get asks for them
  * 3. Caches tools array in memory (no regeneration per request)
  * 4. Registers `tools/list` handler to return cached tools
+ * 5. Owns one BridgeClient for the server's lifetime (cached bridge root and
+ *    health, shared in-flight read-only calls)
  *
  * **Usage (CLI)**:
  * ```typescript
@@ -95,13 +102,14 @@ export function createMcpServer(options: McpServerOptions = {}): Server {
     }
   );
 
-  // Load manifest and generate MCP tools (cached for lifetime of server)
-  const manifest = manifestLoader.load();
-  const functionalTools = generateMcpTools(manifest);
+  // Load the tool catalog (cached for lifetime of server): one read of the
+  // build-time catalog, or generated from the manifest if there is none
+  const catalog = getToolCatalog();
+  const functionalTools = catalog.tools;
 
-  // Phase 5 T019-T020: Load documentation and create unified doc tools
-  const docEntries = docLoader.load();
-  const registry = new DocRegistry(docEntries);
+  // Phase 5 T019-T020: Unified doc tools over the catalog's doc metadata;
+  // a doc's body is read and parsed on its first docs_get
+  const registry = new DocRegistry(catalog.docs, entry => docLoader.loadDocument(entry.filePath).content);
   const docsListTool = createDocsListTool(registry);
   const docsGetTool = createDocsGetTool(registry);
 
@@ -133,6 +141,87 @@ export function createMcpServer(options: McpServerOptions = {}): Server {
                      'Use this before executing other tools to ensure bridge is available. ' +
                      'This tool works even if the bridge is down because it performs a local filesystem check.'
       }
+    },
+
+    // Special local tool: result_page (pages of a spilled large result)
+    {
+      name: 'result_page',
+      description: 'Read one page of a large tool result that was spilled instead of returned inline. ' +
+                   'Large results return {"spilled": true, "id": ...}; pass that id here and follow nextCursor until it is null.',
+      inputSchema: {
+        type: 'object',
+        properties: {
+          id: { type: 'string', description: 'Spill id from the spilled result' },
+          cursor: { type: 'integer', minimum: 0, description: 'nextCursor from the previous page (default 0)' },
+          maxBytes: {
+            type: 'integer',
+            minimum: 1024,
+            maximum: MAX_PAGE_BYTES,
+            description: `Page size limit in bytes (default ${DEFAULT_PAGE_BYTES})`
+          },
+          mode: {
+            type: 'string',
+            enum: ['records', 'bytes'],
+            description: "'records' pages the result's record array (default when it has one); 'bytes' pages the raw JSON"
+          }
+        },
+        required: ['id'],
+        additionalProperties: false
+      },
+      _meta: {
+        category: 'utility',
+        tags: ['pagination', 'large-result']
+      },
+      annotations: {
+        readOnlyHint: true,
+        idempotentHint: true,
+        when_to_use: 'Use after a tool returned a spilled result (e.g. large debug_list_variables or dap_logs output). ' +
+                     'Works locally without crossing the bridge.'
+      }
+    },
+
+    // Special tool: bridge_batch (several tool calls in one bridge round-trip)
+    {
+      name: 'bridge_batch',
+      description: 'Run several VSC-Bridge tools in order as a single bridge job. ' +
+                   'Returns one result per step with its envelope and timing. ' +
+                   'Use for fixed sequences such as setting several breakpoints and then starting a debug session.',
+      inputSchema: {
+        type: 'object',
+        properties: {
+          steps: {
+            type: 'array',
+            description: 'Tool calls to run in order',
+            minItems: 1,
+            maxItems: MAX_BATCH_STEPS,
+            items: {
+              type: 'object',
+              properties: {
+                tool: { type: 'string', description: 'Tool name as listed by tools/list (e.g. breakpoint_set)' },
+                args: { type: 'object', description: 'Arguments for the tool', additionalProperties: true }
+              },
+              required: ['tool'],
+              additionalProperties: false
+            }
+          },
+          stopOnError: {
+            type: 'boolean',
+            description: 'Stop at the first failing step (remaining steps are skipped)',
+            default: false
+          }
+        },
+        required: ['steps'],
+        additionalProperties: false
+      },
+      _meta: {
+        category: 'utility',
+        tags: ['batch', 'workflow', 'bridge']
+      },
+      annotations: {
+        when_to_use: 'Use when you already know a sequence of tool calls and do not need to inspect ' +
+                     'intermediate results before deciding the next call. ' +
+                     'Use individual tools when a later step depends on an earlier result.'
+      }
     }
   ];
 
@@ -141,13 +230,29 @@ export function createMcpServer(options: McpServerOptions = {}): Server {
     console.warn(`[MCP SERVER] Tool count (${tools.length}) exceeds recommended threshold (50)`);
   }
 
-  // Build reverse lookup map: MCP tool name → script alias
+  // Reverse lookup map: MCP tool name → script alias
   // This enables bijective transformation for aliases with hyphens (e.g., test.debug-single)
-  const toolNameToAliasMap = new Map<string, string>();
-  for (const [alias, entry] of Object.entries(manifest.scripts)) {
-    const toolName = entry.metadata.mcp?.tool || aliasToToolName(alias);
-    toolNameToAliasMap.set(toolName, alias);
-  }
+  const toolNameToAliasMap = new Map(Object.entries(catalog.toolNameToAlias));
+  const shareableAliases = new Set(catalog.shareable);
+
+  // Compiled validators for this server's manifest, built on first call per script
+  const validators = new Map<string, CompiledValidator | null>();
+  const validateToolArgs = (alias: string, args: Record<string, unknown>) => {
+    if (!validators.has(alias)) {
+      let metadata;
+      try {
+        metadata = manifestLoader.getScriptMetadata(alias);
+      } catch {
+        metadata = null;
+      }
+      validators.set(alias, metadata ? getValidator(metadata) : null);
+    }
+    return validateWith(validators.get(alias)!, alias, args);
+  };
+
+  // One bridge client for all calls: bridge root and health are tracked
+  // across calls instead of being rediscovered per request
+  const bridge = new BridgeClient({ workspace: options.workspace });
 
   // Register tools/list handler - returns all generated tool definitions
   // Phase 5 T003: Include ALL optional MCP fields (title, annotations, outputSchema)
@@ -173,7 +278,58 @@ export function createMcpServer(options: McpServerOptions = {}): Server {
     try {
       // T030: Special case for local tools that don't cross the bridge
       if (toolName === 'bridge_status') {
-        return await executeBridgeStatus(options.workspace);
+        return await executeBridgeStatus(bridge);
+      }
+
+      // Batch: translate tool names to aliases, then one '@batch' job
+      if (toolName === 'bridge_batch') {
+        const { steps, stopOnError } = (args ?? {}) as {
+          steps?: Array<{ tool: string; args?: Record<string, unknown> }>;
+          stopOnError?: boolean;
+        };
+        if (!Array.isArray(steps) || steps.length === 0) {
+          return {
+            isError: true,
+            content: [{ type: 'text', text: 'E_INVALID_PARAMS: "steps" must be a non-empty array' }]
+          };
+        }
+
+        const unknown = steps.filter(step => !toolNameToAliasMap.has(step?.tool));
+        if (unknown.length > 0) {
+          return {
+            isError: true,
+            content: [{
+              type: 'text',
+              text: `E_INVALID_PARAMS: Unknown or non-bridge tool(s) in batch: ${unknown.map(s => s?.tool).join(', ')}`
+            }]
+          };
+        }
+
+        // Validate each step as its own tool call would be
+        const validated = [];
+        for (const [index, step] of steps.entries()) {
+          const scriptName = toolNameToAliasMap.get(step.tool)!;
+          const result = validateToolArgs(scriptName, step.args ?? {});
+          if ('error' in result) {
+            return invalidParams(`Batch step ${index} (${step.tool}): ${result.error}`);
+          }
+          validated.push({ scriptName, params: result.params, paramsSchemaHash: result.paramsSchemaHash });
+        }
+
+        // Budget is the sum of the per-tool timeouts
+        const timeout = steps.reduce((total, step) => {
+          const stepTool = tools.find(t => t.name === step.tool);
+          return total + (stepTool?.annotations?.timeout ?? options.timeout ?? 30000);
+        }, 0);
+
+        return await bridge.execute(
+          BATCH_SCRIPT_NAME,
+          {
+            steps: validated,
+            stopOnError: stopOnError === true
+          },
+          { timeout }
+        );
       }
 
       // T020: Check if tool exists before execution
@@ -188,7 +344,7 @@ export function createMcpServer(options: McpServerOptions = {}): Server {
         };
       }
 
-      // Phase 5 T021-T022: Unified doc handlers (BEFORE findBridgeRoot per Insight #1)
+      // Phase 5 T021-T022: Unified doc handlers (BEFORE bridge operations per Insight #1)
       // Place these checks before bridge operations to avoid unnecessary I/O
 
       // T021: docs_list handler - catalog browsing with filtering
@@ -241,6 +397,37 @@ export function createMcpServer(options: McpServerOptions = {}): Server {
         }
       }
 
+      // result_page: read a page of a spilled result (local, no bridge job)
+      if (toolName === 'result_page') {
+        const { id, cursor, maxBytes, mode } = (args ?? {}) as {
+          id?: string;
+          cursor?: number;
+          maxBytes?: number;
+          mode?: 'records' | 'bytes';
+        };
+        if (!id) {
+          return {
+            isError: true,
+            content: [{ type: 'text', text: 'E_INVALID_PARAMS: Missing required parameter "id"' }]
+          };
+        }
+
+        try {
+          const store = getSpillStore(await bridge.getBridgeRoot());
+          const page = await store.page(id, { cursor, maxBytes, mode });
+          return {
+            content: [{ type: 'text', text: JSON.stringify(page) }]
+          };
+        } catch (error) {
+          const errorMessage = error instanceof Error ? error.message : String(error);
+          const code = error instanceof SpillNotFoundError ? 'E_NOT_FOUND' : 'E_INVALID_PARAMS';
+          return {
+            isError: true,
+            content: [{ type: 'text', text: `${code}: ${errorMessage}` }]
+          };
+        }
+      }
+
       // T022: Extract timeout from tool metadata, fallback to server default
       const timeout = tool.annotations?.timeout ?? options.timeout ?? 30000;
 
@@ -248,15 +435,19 @@ export function createMcpServer(options: McpServerOptions = {}): Server {
       // This ensures bijective transformation for hyphenated aliases (e.g., test.debug-single)
       const scriptAlias = toolNameToAliasMap.get(toolName) || toolName.replace(/_/g, '.');
 
-      // Find bridge root (default to process.cwd() per Insight #4)
-      const workspace = options.workspace ?? process.cwd();
-      const bridgeRoot = await findBridgeRoot(workspace);
+      // Validate and coerce with the script's compiled validator; the extension
+      // then skips its own validation of these params
+      const validated = validateToolArgs(scriptAlias, args || {});
+      if ('error' in validated) {
+        return invalidParams(validated.error);
+      }
 
-      // Execute tool via bridge adapter
-      const response = await executeToolViaBridge(
+      // Execute tool via the server's bridge client (bridge root defaults to
+      // process.cwd() per Insight #4); identical concurrent read-only calls share one job
+      const response = await bridge.execute(
         scriptAlias,
-        args || {},
-        { bridgeRoot, timeout }
+        validated.params,
+        { timeout, shareable: shareableAliases.has(scriptAlias), paramsSchemaHash: validated.paramsSchemaHash }
       );
 
       return response;
@@ -277,6 +468,41 @@ export function createMcpServer(options: McpServerOptions = {}): Server {
   return server;
 }
 
+/**
+ * Validate and coerce tool arguments with the script's compiled validator.
+ *
+ * Paths are left as given; the extension resolves them against its own
+ * workspace. Without a validator (script missing from the manifest) the
+ * arguments are passed through unchanged for the extension to validate.
+ *
+ * @returns Coerced params and their schema hash, or the validation error text
+ */
+function validateWith(
+  validator: CompiledValidator | null,
+  alias: string,
+  args: Record<string, unknown>
+): { params: Record<string, unknown>; paramsSchemaHash?: string } | { error: string } {
+  if (!validator) {
+    return { params: args };
+  }
+
+  const validation = validator.validate(args, { resolvePaths: false });
+  if (!validation.valid) {
+    const details = validation.errors
+      .map(e => `${e.field}: ${e.message}${e.suggestion ? ` (did you mean '${e.suggestion}'?)` : ''}`)
+      .join('; ');
+    return { error: `Invalid parameters for ${alias}: ${details}` };
+  }
+  return { params: validation.coercedParams!, paramsSchemaHash: validator.schemaHash };
+}
+
+function invalidParams(message: string): ToolResponse {
+  return {
+    isError: true,
+    content: [{ type: 'text', text: `E_INVALID_PARAMS: ${message}` }]
+  };
+}
+
 /**
  * Execute bridge_status tool locally (does not cross the bridge).
  *
@@ -286,19 +512,21 @@ export function createMcpServer(options: McpServerOptions = {}): Server {
  * fs-bridge IPC mechanism.
  *
  * The health check works by:
- * 1. Finding the .vsc-bridge directory
- * 2. Checking the mtime of host.json
+ * 1. Finding the .vsc-bridge directory (cached by the bridge client)
+ * 2. Checking the mtime of host.json (always re-checked for this tool)
  * 3. If mtime is < 30 seconds old → healthy (extension updates it every 5s)
  * 4. If mtime is > 30 seconds old → unhealthy (extension crashed/stopped)
  *
- * @param workspace - Workspace directory to check (defaults to cwd)
+ * @param bridge - The server's bridge client
  * @returns MCP-formatted tool response
  */
-async function executeBridgeStatus(workspace?: string): Promise<ToolResponse> {
+async function executeBridgeStatus(bridge: BridgeClient): Promise<ToolResponse> {
   try {
-    const startDir = workspace ?? process.cwd();
-    const bridgeRoot = await findBridgeRoot(startDir);
-    const health = await checkBridgeHealth(bridgeRoot);
+    const health = await bridge.getHealth(true);
+    const bridgeRoot = await bridge.getBridgeRoot();
+    const socketEndpoint = process.env.VSCB_TRANSPORT === 'filesystem'
+      ? undefined
+      : await readSocketEndpoint(bridgeRoot);
 
     const lastSeenAgo = Math.round((Date.now() - health.lastSeen.getTime()) / 1000);
 
@@ -307,7 +535,7 @@ async function executeBridgeStatus(workspace?: string): Promise<ToolResponse> {
       lastSeen: health.lastSeen.toISOString(),
       lastSeenAgo,
       bridgeRoot,
-      transport: 'filesystem'
+      transport: socketEndpoint ? 'socket' : 'filesystem'
     };
 
     return {
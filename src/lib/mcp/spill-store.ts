@@ -0,0 +1,400 @@
+/**
+ * Spill store for oversized MCP tool results.
+ *
+ * A tool result larger than SPILL_TOKEN_THRESHOLD is not useful inline: it
+ * overflows the agent's context. The bridge adapter writes such results here
+ * instead and returns a short summary; the agent then pulls the data in
+ * bounded pages with the `result_page` tool.
+ *
+ * Storage is scoped to the bridge (`<bridgeRoot>/cache/mcp-spill/`; the
+ * extension's activation cleanup keeps `cache/`, so spills survive a window
+ * reload):
+ * - `<id>.json` holds the compact JSON of the result (paged by byte cursor)
+ * - `<id>.ndjson` holds one line per record when the result has a record
+ *   array, such as `variables` or `logs` (paged by record cursor)
+ *
+ * Entries are kept for SPILL_MAX_AGE_MS and at most SPILL_MAX_ENTRIES per
+ * store; older ones are deleted as new results spill.
+ *
+ * @module cli/lib/mcp/spill-store
+ */
+
+import { promises as fs } from 'fs';
+import path from 'path';
+import { sortableId } from '../fs-bridge.js';
+
+/**
+ * Results estimated above this many tokens are spilled.
+ */
+export const SPILL_TOKEN_THRESHOLD = 25000;
+
+/**
+ * Default page size for result_page (~8k tokens).
+ */
+export const DEFAULT_PAGE_BYTES = 32 * 1024;
+
+/**
+ * Largest page result_page returns, kept below SPILL_TOKEN_THRESHOLD.
+ */
+export const MAX_PAGE_BYTES = 96 * 1024;
+
+/**
+ * Spilled results older than this are deleted.
+ */
+export const SPILL_MAX_AGE_MS = 30 * 60 * 1000;
+
+/**
+ * Spilled results kept per store; the oldest is deleted beyond this.
+ */
+export const SPILL_MAX_ENTRIES = 32;
+
+/**
+ * Directory under the bridge root (inside the cache/ directory the extension
+ * keeps across reloads).
+ */
+export const SPILL_DIR = path.join('cache', 'mcp-spill');
+
+/**
+ * Inline preview of the non-record fields kept in the spill summary.
+ */
+const SUMMARY_MAX_BYTES = 2048;
+
+/**
+ * Descriptor returned in place of a spilled result.
+ */
+export interface SpillDescriptor {
+  /** Id to pass to result_page */
+  id: string;
+
+  /** Size of the compact JSON result */
+  bytes: number;
+
+  /** Estimated tokens of the full result */
+  estimatedTokens: number;
+
+  /** Record array available for record paging */
+  records?: {
+    /** Property of the result holding the records ('' when the result is the array) */
+    path: string;
+    count: number;
+  };
+
+  /** Result without the record array, when small enough to inline */
+  summary?: unknown;
+}
+
+/**
+ * Options for reading a page.
+ */
+export interface SpillPageOptions {
+  /**
+   * Record index (record mode) or byte offset (bytes mode) to start from.
+   *
+   * @default 0
+   */
+  cursor?: number;
+
+  /**
+   * Page size limit in bytes, capped at MAX_PAGE_BYTES.
+   *
+   * @default DEFAULT_PAGE_BYTES
+   */
+  maxBytes?: number;
+
+  /**
+   * 'records' pages the record array; 'bytes' pages the raw JSON text.
+   *
+   * @default 'records' when the result has a record array, else 'bytes'
+   */
+  mode?: 'records' | 'bytes';
+}
+
+/**
+ * One page of a spilled result.
+ */
+export interface SpillPage {
+  id: string;
+  mode: 'records' | 'bytes';
+  cursor: number;
+
+  /** Cursor for the next page, null on the last page */
+  nextCursor: number | null;
+
+  /** Records in this page (records mode) */
+  records?: unknown[];
+
+  /** JSON text in this page (bytes mode) */
+  text?: string;
+
+  /** Total records (records mode) or bytes (bytes mode) */
+  total: number;
+}
+
+/**
+ * Raised for unknown or expired spill ids.
+ */
+export class SpillNotFoundError extends Error {
+  constructor(id: string) {
+    super(`Spilled result '${id}' not found (expired or from an earlier server process)`);
+    this.name = 'SpillNotFoundError';
+  }
+}
+
+interface SpillEntry {
+  id: string;
+  createdAt: number;
+  jsonPath: string;
+  bytes: number;
+  records?: {
+    path: string;
+    file: string;
+    /** Byte offset of each line, plus the end offset */
+    offsets: number[];
+  };
+}
+
+/**
+ * Cheap single-pass token estimate with early exit.
+ *
+ * Runs of letters and digits count one token per 4 characters, and every
+ * other non-space character counts as one token. That tracks tokenizers on
+ * punctuation-dense JSON better than a flat chars/4. The scan stops as soon as
+ * the count passes `stopAfter`, so checking a huge result against the spill
+ * threshold only reads the start of it.
+ */
+export function estimateTokens(text: string, stopAfter = Infinity): number {
+  let tokens = 0;
+  let run = 0;
+  for (let i = 0; i < text.length; i++) {
+    const c = text.charCodeAt(i);
+    const isWord = (c >= 48 && c <= 57) || (c >= 65 && c <= 90) || (c >= 97 && c <= 122) || c === 95 || c > 127;
+    if (isWord) {
+      run++;
+      continue;
+    }
+    if (run > 0) {
+      tokens += Math.ceil(run / 4);
+      run = 0;
+    }
+    if (c !== 32 && c !== 10 && c !== 13 && c !== 9) {
+      tokens++;
+    }
+    if (tokens > stopAfter) {
+      return tokens;
+    }
+  }
+  return tokens + Math.ceil(run / 4);
+}
+
+/**
+ * The record array of a result: the result itself, or its largest top-level array.
+ */
+function findRecords(data: unknown): { path: string; items: unknown[] } | undefined {
+  if (Array.isArray(data)) {
+    return { path: '', items: data };
+  }
+  if (!data || typeof data !== 'object') {
+    return undefined;
+  }
+  let best: { path: string; items: unknown[] } | undefined;
+  for (const [key, value] of Object.entries(data as Record<string, unknown>)) {
+    if (Array.isArray(value) && value.length > (best?.items.length ?? 0)) {
+      best = { path: key, items: value };
+    }
+  }
+  return best;
+}
+
+/**
+ * Length of the longest prefix of `buf` that does not end inside a UTF-8 character.
+ */
+function utf8Boundary(buf: Buffer): number {
+  // Find the start of the last character (continuation bytes are 10xxxxxx)
+  let start = buf.length - 1;
+  while (start > 0 && (buf[start] & 0xc0) === 0x80) {
+    start--;
+  }
+  if (start < 0) {
+    return 0;
+  }
+  const lead = buf[start];
+  const width = lead >= 0xf0 ? 4 : lead >= 0xe0 ? 3 : lead >= 0xc0 ? 2 : 1;
+  return start + width > buf.length ? start : buf.length;
+}
+
+/**
+ * Spilled results of one bridge.
+ */
+export class SpillStore {
+  private entries = new Map<string, SpillEntry>();
+  private seq = 0;
+  private swept = false;
+
+  constructor(readonly dir: string) {}
+
+  /**
+   * Write a result to the store.
+   *
+   * @param data - The result (envelope data)
+   * @param json - Its compact JSON (already built by the caller)
+   * @param estimatedTokens - Token estimate for the descriptor
+   */
+  async spill(data: unknown, json: string, estimatedTokens: number): Promise<SpillDescriptor> {
+    await fs.mkdir(this.dir, { recursive: true });
+    await this.evict();
+
+    const id = `spill-${sortableId(this.seq++)}`;
+    const jsonPath = path.join(this.dir, `${id}.json`);
+    await fs.writeFile(jsonPath, json);
+    const entry: SpillEntry = { id, createdAt: Date.now(), jsonPath, bytes: Buffer.byteLength(json) };
+
+    const descriptor: SpillDescriptor = { id, bytes: entry.bytes, estimatedTokens };
+    const found = findRecords(data);
+    if (found && found.items.length > 0) {
+      const lines = found.items.map(item => JSON.stringify(item) ?? 'null');
+      const offsets = [0];
+      for (const line of lines) {
+        offsets.push(offsets[offsets.length - 1] + Buffer.byteLength(line) + 1);
+      }
+      const file = path.join(this.dir, `${id}.ndjson`);
+      await fs.writeFile(file, lines.join('\n') + '\n');
+      entry.records = { path: found.path, file, offsets };
+      descriptor.records = { path: found.path, count: lines.length };
+
+      if (found.path) {
+        const rest = { ...(data as Record<string, unknown>), [found.path]: `[${lines.length} records]` };
+        if (Buffer.byteLength(JSON.stringify(rest)) <= SUMMARY_MAX_BYTES) {
+          descriptor.summary = rest;
+        }
+      }
+    }
+
+    this.entries.set(id, entry);
+    return descriptor;
+  }
+
+  /**
+   * Read one bounded page of a spilled result.
+   *
+   * Record pages hold whole records and at least one, so a single record
+   * larger than maxBytes is returned on its own.
+   *
+   * @throws SpillNotFoundError for unknown or expired ids
+   */
+  async page(id: string, options: SpillPageOptions = {}): Promise<SpillPage> {
+    const entry = this.entries.get(id);
+    if (!entry || Date.now() - entry.createdAt > SPILL_MAX_AGE_MS) {
+      throw new SpillNotFoundError(id);
+    }
+
+    try {
+      return await this.readPage(entry, options);
+    } catch (error: any) {
+      // Files deleted behind the store's back (e.g. the bridge directory was wiped)
+      if (error?.code === 'ENOENT') {
+        this.entries.delete(id);
+        throw new SpillNotFoundError(id);
+      }
+      throw error;
+    }
+  }
+
+  private async readPage(entry: SpillEntry, options: SpillPageOptions): Promise<SpillPage> {
+    const { id } = entry;
+    const maxBytes = Math.max(1024, Math.min(options.maxBytes ?? DEFAULT_PAGE_BYTES, MAX_PAGE_BYTES));
+    const cursor = Math.max(0, Math.floor(options.cursor ?? 0));
+    const mode = options.mode ?? (entry.records ? 'records' : 'bytes');
+
+    if (mode === 'records') {
+      if (!entry.records) {
+        throw new Error(`Spilled result '${id}' has no record array; use mode 'bytes'`);
+      }
+      const { offsets, file } = entry.records;
+      const count = offsets.length - 1;
+      let end = Math.min(cursor + 1, count);
+      while (end < count && offsets[end + 1] - offsets[cursor] <= maxBytes) {
+        end++;
+      }
+      const text = cursor < count ? await readRange(file, offsets[cursor], offsets[end]) : '';
+      return {
+        id,
+        mode,
+        cursor,
+        nextCursor: end < count ? end : null,
+        records: text.split('\n').filter(line => line.length > 0).map(line => JSON.parse(line)),
+        total: count
+      };
+    }
+
+    const start = Math.min(cursor, entry.bytes);
+    const raw = await readBytes(entry.jsonPath, start, Math.min(maxBytes, entry.bytes - start));
+    const end = start + (start + raw.length < entry.bytes ? utf8Boundary(raw) : raw.length);
+    return {
+      id,
+      mode,
+      cursor: start,
+      nextCursor: end < entry.bytes ? end : null,
+      text: raw.subarray(0, end - start).toString('utf8'),
+      total: entry.bytes
+    };
+  }
+
+  /**
+   * Delete expired entries, the oldest beyond SPILL_MAX_ENTRIES, and (once)
+   * files left behind by earlier server processes.
+   */
+  private async evict(): Promise<void> {
+    const now = Date.now();
+    const expired = [...this.entries.values()].filter(e => now - e.createdAt > SPILL_MAX_AGE_MS);
+    const live = [...this.entries.values()].filter(e => now - e.createdAt <= SPILL_MAX_AGE_MS);
+    const excess = live.slice(0, Math.max(0, live.length - SPILL_MAX_ENTRIES + 1));
+
+    for (const entry of [...expired, ...excess]) {
+      this.entries.delete(entry.id);
+      await fs.rm(entry.jsonPath, { force: true });
+      if (entry.records) {
+        await fs.rm(entry.records.file, { force: true });
+      }
+    }
+
+    if (!this.swept) {
+      this.swept = true;
+      for (const name of await fs.readdir(this.dir).catch(() => [] as string[])) {
+        const file = path.join(this.dir, name);
+        const stat = await fs.stat(file).catch(() => undefined);
+        if (stat && now - stat.mtimeMs > SPILL_MAX_AGE_MS) {
+          await fs.rm(file, { force: true });
+        }
+      }
+    }
+  }
+}
+
+async function readBytes(file: string, start: number, length: number): Promise<Buffer> {
+  const handle = await fs.open(file, 'r');
+  try {
+    const buf = Buffer.alloc(Math.max(0, length));
+    const { bytesRead } = await handle.read(buf, 0, buf.length, start);
+    return buf.subarray(0, bytesRead);
+  } finally {
+    await handle.close();
+  }
+}
+
+async function readRange(file: string, start: number, end: number): Promise<string> {
+  return (await readBytes(file, start, end - start)).toString('utf8');
+}
+
+const stores = new Map<string, SpillStore>();
+
+/**
+ * Spill store for a bridge root (one per root per process).
+ */
+export function getSpillStore(bridgeRoot: string): SpillStore {
+  let store = stores.get(bridgeRoot);
+  if (!store) {
+    store = new SpillStore(path.join(bridgeRoot, SPILL_DIR));
+    stores.set(bridgeRoot, store);
+  }
+  return store;
+}
@@ -0,0 +1,157 @@
+/**
+ * Precomputed MCP tool catalog.
+ *
+ * Answering tools/list from scratch means parsing the full manifest,
+ * generating a JSON Schema for every script, and reading and parsing the YAML
+ * front matter of every doc. None of that changes between builds, so the
+ * build writes the result to `mcp-catalog.json` next to `manifest.json`
+ * (see scripts/build-mcp-catalog.mjs) and the server loads it with one read.
+ *
+ * Doc bodies are not part of the catalog: docs_list is served from the stored
+ * front matter and docs_get reads and parses a doc only when it is requested.
+ *
+ * The catalog records a hash of the manifest it was built from. A missing
+ * catalog, one written by another catalog version, or one built from a
+ * different manifest is ignored, and the tools are generated at startup as
+ * before.
+ *
+ * @module cli/lib/mcp/tool-catalog
+ */
+
+import { createHash } from 'crypto';
+import * as fs from 'fs';
+import path from 'path';
+import { manifestLoader, type ManifestV2 } from '../manifest-loader.js';
+import { generateMcpTools, aliasToToolName, type McpTool } from './tool-generator.js';
+import { isShareableScript } from './bridge-client.js';
+import { docLoader } from './doc-tools/loader.js';
+import type { DocEntry, DocCatalogEntry } from './doc-tools/types.js';
+
+/**
+ * Bumped when the catalog layout or tool generation changes, so catalogs
+ * from older builds are not used.
+ */
+export const CATALOG_VERSION = 1;
+
+/**
+ * Catalog file name, next to manifest.json.
+ */
+export const CATALOG_FILENAME = 'mcp-catalog.json';
+
+/**
+ * Everything the MCP server derives from the manifest and docs at startup.
+ */
+export interface ToolCatalog {
+  /** Generated tools for the manifest scripts */
+  tools: McpTool[];
+
+  /** MCP tool name → script alias */
+  toolNameToAlias: Record<string, string>;
+
+  /** Aliases whose identical concurrent calls may share a bridge request */
+  shareable: string[];
+
+  /** Doc front matter, without bodies */
+  docs: DocCatalogEntry[];
+}
+
+interface CatalogFile extends ToolCatalog {
+  version: number;
+  manifestHash: string;
+}
+
+/**
+ * Content hash of a manifest, recorded in the catalog built from it.
+ */
+export function hashManifest(content: string | Buffer): string {
+  return createHash('sha256').update(content).digest('hex');
+}
+
+/**
+ * Catalog path for a manifest path.
+ */
+export function getCatalogPath(manifestPath: string): string {
+  return path.join(path.dirname(manifestPath), CATALOG_FILENAME);
+}
+
+/**
+ * Build the catalog for a manifest and its docs.
+ *
+ * @param manifest - Parsed manifest
+ * @param docs - Parsed docs (bodies are dropped)
+ */
+export function buildToolCatalog(manifest: ManifestV2, docs: Array<DocEntry | DocCatalogEntry>): ToolCatalog {
+  const toolNameToAlias: Record<string, string> = {};
+  const shareable: string[] = [];
+  for (const [alias, entry] of Object.entries(manifest.scripts)) {
+    toolNameToAlias[entry.metadata.mcp?.tool || aliasToToolName(alias)] = alias;
+    if (isShareableScript(entry.metadata)) {
+      shareable.push(alias);
+    }
+  }
+
+  return {
+    tools: generateMcpTools(manifest),
+    toolNameToAlias,
+    shareable,
+    docs: docs.map(({ frontMatter, filePath }) => ({ frontMatter, filePath }))
+  };
+}
+
+/**
+ * Write the catalog for a manifest next to it.
+ *
+ * @param manifestPath - Manifest to build from
+ * @param docs - Parsed docs (defaults to the docs shipped with the CLI)
+ * @returns Path of the written catalog
+ */
+export function writeToolCatalog(manifestPath: string, docs: DocEntry[] = docLoader.load()): string {
+  const content = fs.readFileSync(manifestPath);
+  const catalog: CatalogFile = {
+    version: CATALOG_VERSION,
+    manifestHash: hashManifest(content),
+    ...buildToolCatalog(JSON.parse(content.toString('utf-8')) as ManifestV2, docs)
+  };
+
+  const catalogPath = getCatalogPath(manifestPath);
+  const tmpPath = `${catalogPath}.${process.pid}.tmp`;
+  fs.writeFileSync(tmpPath, JSON.stringify(catalog));
+  fs.renameSync(tmpPath, catalogPath);
+  return catalogPath;
+}
+
+/**
+ * Read the catalog next to a manifest, if it was built from that manifest.
+ *
+ * @param manifestPath - Manifest the server would load
+ * @returns The catalog, or null if it is missing, outdated or unreadable
+ */
+export function loadToolCatalog(manifestPath: string): ToolCatalog | null {
+  let catalog: CatalogFile;
+  try {
+    catalog = JSON.parse(fs.readFileSync(getCatalogPath(manifestPath), 'utf-8'));
+    if (catalog.version !== CATALOG_VERSION || catalog.manifestHash !== hashManifest(fs.readFileSync(manifestPath))) {
+      return null;
+    }
+  } catch {
+    return null;
+  }
+
+  const { tools, toolNameToAlias, shareable, docs } = catalog;
+  return { tools, toolNameToAlias, shareable, docs };
+}
+
+/**
+ * Tool catalog for the MCP server.
+ *
+ * Uses the precomputed catalog when it matches the manifest the loader
+ * resolves, and otherwise generates it from the manifest and docs.
+ */
+export function getToolCatalog(): ToolCatalog {
+  const manifestPath = manifestLoader.resolvePath();
+  const catalog = manifestPath ? loadToolCatalog(manifestPath) : null;
+  if (catalog) {
+    return catalog;
+  }
+  return buildToolCatalog(manifestLoader.load(), docLoader.load());
+}
@@ -0,0 +1,115 @@
+/**
+ * On-disk metadata cache for CLI cold starts
+ *
+ * Every `vscb` invocation is a fresh process, so anything derived from files
+ * (the resolved manifest, metadata extracted from discovered scripts) would
+ * otherwise be re-read and re-parsed on every run. Entries are stored as small
+ * JSON files under ~/.vscbridge/cache/cli and are keyed by a signature of the
+ * files they were derived from (path, mtime and size): an edited or rebuilt
+ * file simply stops matching and is re-read.
+ *
+ * The cache is best-effort. Any read or write failure behaves like a miss, and
+ * setting VSC_BRIDGE_NO_CACHE=1 disables it entirely.
+ */
+
+import * as fs from 'fs';
+import * as os from 'os';
+import * as path from 'path';
+import { createHash } from 'crypto';
+
+/**
+ * Bump when the shape of any cached entry changes
+ */
+export const CACHE_VERSION = 1;
+
+interface CacheFile<T> {
+    version: number;
+    signature: string;
+    data: T;
+}
+
+/**
+ * Directory holding the CLI cache (VSC_BRIDGE_CACHE_DIR overrides)
+ */
+export function getCacheDir(): string {
+    return process.env.VSC_BRIDGE_CACHE_DIR || path.join(os.homedir(), '.vscbridge', 'cache', 'cli');
+}
+
+/**
+ * Whether the cache is turned off for this process
+ */
+export function isCacheDisabled(): boolean {
+    const value = process.env.VSC_BRIDGE_NO_CACHE;
+    return !!value && value !== '0' && value !== 'false';
+}
+
+/**
+ * Signature of a file's current contents: path, mtime and size
+ *
+ * @returns null when the file cannot be stat'ed
+ */
+export function fileSignature(filePath: string): string | null {
+    try {
+        const stat = fs.statSync(filePath);
+        return `${filePath}:${stat.mtimeMs}:${stat.size}`;
+    } catch {
+        return null;
+    }
+}
+
+/**
+ * Path of a cache entry; keys may contain any characters
+ */
+function entryPath(namespace: string, key: string): string {
+    const safe = key.replace(/[^A-Za-z0-9._-]/g, '_').slice(0, 80);
+    const digest = createHash('sha1').update(key).digest('hex').slice(0, 8);
+    return path.join(getCacheDir(), namespace, `${safe}-${digest}.json`);
+}
+
+/**
+ * Read a cached value, if one exists for exactly this signature
+ */
+export function readCache<T>(namespace: string, key: string, signature: string): T | undefined {
+    if (isCacheDisabled()) {
+        return undefined;
+    }
+    try {
+        const entry = JSON.parse(fs.readFileSync(entryPath(namespace, key), 'utf-8')) as CacheFile<T>;
+        if (entry.version === CACHE_VERSION && entry.signature === signature) {
+            return entry.data;
+        }
+    } catch {
+        // Missing or corrupt entry: treat as a miss
+    }
+    return undefined;
+}
+
+/**
+ * Store a value under a signature
+ *
+ * Written to a temp file and renamed so a concurrent reader never sees a
+ * partial entry.
+ */
+export function writeCache<T>(namespace: string, key: string, signature: string, data: T): void {
+    if (isCacheDisabled()) {
+        return;
+    }
+    const target = entryPath(namespace, key);
+    const tmp = `${target}.${process.pid}.tmp`;
+    try {
+        fs.mkdirSync(path.dirname(target), { recursive: true });
+        const entry: CacheFile<T> = { version: CACHE_VERSION, signature, data };
+        fs.writeFileSync(tmp, JSON.stringify(entry));
+        fs.renameSync(tmp, target);
+    } catch {
+        // Read-only home, full disk, ...: run uncached
+        try { fs.rmSync(tmp, { force: true }); } catch { /* ignore */ }
+    }
+}
+
+/**
+ * Remove every cached entry
+ */
+export function clearMetadataCache(): void {
+    fs.rmSync(getCacheDir(), { recursive: true, force: true });
+}
@@ -1,4 +1,5 @@
 import { type ScriptMetadata, type ParamDefinition } from './manifest-loader.js';
+import { createHash } from 'crypto';
 import * as path from 'path';
 
 // Debug logging utility for path resolution
@@ -73,24 +74,6 @@ function buildAliasMap(params: Record<string, ParamDefinition>): Record<string,
     return aliasMap;
 }
 
-/**
- * Normalize parameter names using alias mapping
- */
-function normalizeParams(
-    params: Record<string, any>,
-    aliasMap: Record<string, string>
-): Record<string, any> {
-    const normalized: Record<string, any> = {};
-
-    for (const [name, value] of Object.entries(params)) {
-        // Check if this is an alias
-        const canonicalName = aliasMap[name] || name;
-        normalized[canonicalName] = value;
-    }
-
-    return normalized;
-}
-
 /**
  * Validation error structure
  */
@@ -116,218 +99,314 @@ export interface ValidationResult {
 }
 
 /**
- * Validate parameters against script metadata
+ * Options for a validation call
  */
-export function validateParams(
-    metadata: ScriptMetadata,
-    params: Record<string, any>,
-    options: { workspaceRoot?: string } = {}
-): ValidationResult {
-    const errors: ValidationError[] = [];
-    const coercedParams: Record<string, any> = {};
-    const paramDefs = metadata.params || {};
-
-    // Build alias map and normalize parameters
-    const aliasMap = buildAliasMap(paramDefs);
-    const normalizedParams = normalizeParams(params, aliasMap);
-
-    // Check for required parameters (using normalized params)
-    for (const [name, def] of Object.entries(paramDefs)) {
-        if (def.required && !(name in normalizedParams)) {
-            errors.push({
-                field: name,
-                message: 'Missing required parameter'
-            });
-        }
-    }
+export interface ValidateOptions {
+    /** Base for 'workspace-relative' paths */
+    workspaceRoot?: string;
+
+    /**
+     * Resolve paths of params with a `resolve` strategy (default: true).
+     *
+     * The MCP server passes false: agents send paths relative to the
+     * workspace, which the extension resolves, not to the server's cwd.
+     */
+    resolvePaths?: boolean;
+}
 
-    // Validate and coerce provided parameters
-    for (const [name, value] of Object.entries(normalizedParams)) {
-        const def = paramDefs[name];
-
-        if (!def) {
-            // Unknown parameter
-            const suggestion = findClosestMatch(name, Object.keys(paramDefs));
-            errors.push({
-                field: name,
-                message: 'Unknown parameter',
-                suggestion: suggestion || undefined
-            });
-            continue;
-        }
+/**
+ * Parameter validator compiled from one script's metadata
+ */
+export interface CompiledValidator {
+    /** Script alias */
+    alias: string;
+
+    /**
+     * Hash of the script's parameter definitions (see paramSchemaHash).
+     *
+     * Sent with pre-validated params so the extension can skip validating
+     * them again when its schema was generated from the same definitions.
+     */
+    schemaHash: string;
+
+    /** Validate and coerce params */
+    validate(params: Record<string, any>, options?: ValidateOptions): ValidationResult;
+}
 
-        // Skip null or undefined values for optional params
-        if (value === null || value === undefined) {
-            if (def.required) {
-                errors.push({
-                    field: name,
-                    message: 'Required parameter cannot be null or undefined'
-                });
-            }
-            continue;
-        }
+/**
+ * Checks and coerces one parameter value (not null or undefined)
+ *
+ * Writes the coerced value to `out` and returns undefined, or returns the error.
+ * Throws if the value cannot be coerced to the parameter type.
+ */
+type FieldCheck = (value: any, out: Record<string, any>, options: ValidateOptions) => ValidationError | undefined;
 
-        // Try to coerce and validate the value
-        try {
-            const coercedValue = coerceValue(value, def.type, def.values);
+/**
+ * Hash of a script's parameter definitions
+ *
+ * The extension's schema generator computes the same hash from the same
+ * manifest (generate-zod-schemas.ts), so equal hashes mean the CLI and the
+ * extension validate against the same definitions.
+ */
+export function paramSchemaHash(params: Record<string, ParamDefinition> | undefined): string {
+    return createHash('sha256').update(JSON.stringify(params ?? {})).digest('hex').slice(0, 16);
+}
 
-            // Additional validation for specific types
-            if (def.type === 'enum' && def.values) {
-                if (!def.values.includes(coercedValue)) {
-                    errors.push({
+/**
+ * Build the check for one parameter, specialised to its type and constraints
+ */
+function compileField(name: string, def: ParamDefinition): FieldCheck {
+    switch (def.type) {
+        case 'enum': {
+            const allowed = def.values ? new Set<any>(def.values) : undefined;
+            return (value, out) => {
+                const coercedValue = coerceValue(value, def.type, def.values);
+                if (allowed && !allowed.has(coercedValue)) {
+                    return {
                         field: name,
-                        message: `Value must be one of: ${def.values.join(', ')}`,
+                        message: `Value must be one of: ${def.values!.join(', ')}`,
                         expected: def.values,
                         received: coercedValue
-                    });
-                    continue;
+                    };
                 }
-            }
+                out[name] = coercedValue;
+                return undefined;
+            };
+        }
 
-            // Validate number constraints
-            if (def.type === 'number' && typeof coercedValue === 'number') {
-                if (def.min !== undefined && coercedValue < def.min) {
-                    errors.push({
-                        field: name,
-                        message: `Value must be >= ${def.min}`,
-                        expected: `>= ${def.min}`,
-                        received: coercedValue
-                    });
-                    continue;
-                }
-                if (def.max !== undefined && coercedValue > def.max) {
-                    errors.push({
-                        field: name,
-                        message: `Value must be <= ${def.max}`,
-                        expected: `<= ${def.max}`,
-                        received: coercedValue
-                    });
-                    continue;
+        case 'number':
+            return (value, out) => {
+                const coercedValue = coerceValue(value, def.type);
+                if (typeof coercedValue === 'number') {
+                    if (def.min !== undefined && coercedValue < def.min) {
+                        return { field: name, message: `Value must be >= ${def.min}`, expected: `>= ${def.min}`, received: coercedValue };
+                    }
+                    if (def.max !== undefined && coercedValue > def.max) {
+                        return { field: name, message: `Value must be <= ${def.max}`, expected: `<= ${def.max}`, received: coercedValue };
+                    }
+                    if (def.integer && !Number.isInteger(coercedValue)) {
+                        return { field: name, message: 'Value must be an integer', expected: 'integer', received: coercedValue };
+                    }
                 }
-                if (def.integer && !Number.isInteger(coercedValue)) {
-                    errors.push({
-                        field: name,
-                        message: 'Value must be an integer',
-                        expected: 'integer',
-                        received: coercedValue
-                    });
-                    continue;
+                out[name] = coercedValue;
+                return undefined;
+            };
+
+        case 'string': {
+            // Compile the pattern once; an invalid pattern fails every value, as before
+            let regex: RegExp | undefined;
+            let invalidPattern = false;
+            if (def.pattern) {
+                try {
+                    regex = new RegExp(def.pattern);
+                } catch {
+                    invalidPattern = true;
                 }
             }
 
-            // Validate string constraints and apply path resolution
-            if (def.type === 'string' && typeof coercedValue === 'string') {
+            return (value, out, options) => {
+                const coercedValue: string = coerceValue(value, def.type);
+
                 // Apply path resolution if specified
                 let resolvedValue = coercedValue;
                 let originalPath: string | undefined;
                 let resolvedPath: string | undefined;
                 let resolutionStrategy: string | undefined;
-
-                if (def.resolve) {
+                if (def.resolve && options.resolvePaths !== false) {
                     originalPath = coercedValue;
                     resolvedValue = resolvePath(coercedValue, def.resolve, options.workspaceRoot);
                     resolvedPath = resolvedValue;
                     resolutionStrategy = def.resolve;
                 }
+                const pathDetails = { originalPath, resolvedPath, resolutionStrategy };
 
                 // Empty string policy: Required strings must be non-empty unless minLength: 0 is set
                 if (def.required && resolvedValue === '' && def.minLength !== 0) {
-                    errors.push({
+                    return {
                         field: name,
                         message: 'Required string cannot be empty',
                         expected: 'non-empty string',
                         received: 'empty string',
-                        originalPath,
-                        resolvedPath,
-                        resolutionStrategy
-                    });
-                    continue;
+                        ...pathDetails
+                    };
                 }
-
                 if (def.minLength !== undefined && resolvedValue.length < def.minLength) {
-                    errors.push({
+                    return {
                         field: name,
                         message: `String length must be >= ${def.minLength}`,
                         expected: `length >= ${def.minLength}`,
                         received: `length ${resolvedValue.length}`,
-                        originalPath,
-                        resolvedPath,
-                        resolutionStrategy
-                    });
-                    continue;
+                        ...pathDetails
+                    };
                 }
                 if (def.maxLength !== undefined && resolvedValue.length > def.maxLength) {
-                    errors.push({
+                    return {
                         field: name,
                         message: `String length must be <= ${def.maxLength}`,
                         expected: `length <= ${def.maxLength}`,
                         received: `length ${resolvedValue.length}`,
-                        originalPath,
-                        resolvedPath,
-                        resolutionStrategy
-                    });
-                    continue;
+                        ...pathDetails
+                    };
                 }
-
-                // Validate pattern if specified
-                if (def.pattern) {
-                    try {
-                        const regex = new RegExp(def.pattern);
-                        if (!regex.test(resolvedValue)) {
-                            errors.push({
-                                field: name,
-                                message: `String does not match pattern: ${def.pattern}`,
-                                expected: `matches /${def.pattern}/`,
-                                received: resolvedValue,
-                                originalPath,
-                                resolvedPath,
-                                resolutionStrategy
-                            });
-                            continue;
-                        }
-                    } catch (e) {
-                        errors.push({
-                            field: name,
-                            message: `Invalid regex pattern: ${def.pattern}`,
-                            expected: 'valid regex',
-                            received: def.pattern,
-                            originalPath,
-                            resolvedPath,
-                            resolutionStrategy
-                        });
-                        continue;
-                    }
+                if (invalidPattern) {
+                    return {
+                        field: name,
+                        message: `Invalid regex pattern: ${def.pattern}`,
+                        expected: 'valid regex',
+                        received: def.pattern,
+                        ...pathDetails
+                    };
+                }
+                if (regex && !regex.test(resolvedValue)) {
+                    return {
+                        field: name,
+                        message: `String does not match pattern: ${def.pattern}`,
+                        expected: `matches /${def.pattern}/`,
+                        received: resolvedValue,
+                        ...pathDetails
+                    };
                 }
 
                 // Use resolved value for strings with resolution strategy
-                coercedParams[name] = resolvedValue;
-            } else {
-                coercedParams[name] = coercedValue;
-            }
-        } catch (error: any) {
-            errors.push({
-                field: name,
-                message: error.message || `Failed to validate ${name}`,
-                expected: def.type,
-                received: typeof value
-            });
+                out[name] = resolvedValue;
+                return undefined;
+            };
         }
+
+        default:
+            return (value, out) => {
+                out[name] = coerceValue(value, def.type, def.values);
+                return undefined;
+            };
     }
+}
 
-    // Apply default values for missing optional parameters
-    for (const [name, def] of Object.entries(paramDefs)) {
-        if (!def.required && !(name in params) && def.default !== undefined) {
-            coercedParams[name] = def.default;
-        }
+/**
+ * Compile a script's parameter definitions into a validator
+ *
+ * Alias lookup, per-field checks and regexes are built once here instead of
+ * on every call. Prefer getValidator(), which caches the result.
+ */
+export function compileValidator(metadata: ScriptMetadata): CompiledValidator {
+    const paramDefs = metadata.params || {};
+    const names = Object.keys(paramDefs);
+    const aliasMap = new Map(Object.entries(buildAliasMap(paramDefs)));
+    const fields = new Map<string, { def: ParamDefinition; check: FieldCheck }>();
+    for (const name of names) {
+        fields.set(name, { def: paramDefs[name], check: compileField(name, paramDefs[name]) });
     }
+    const required = names.filter(name => paramDefs[name].required);
+    const defaults = names
+        .filter(name => !paramDefs[name].required && paramDefs[name].default !== undefined)
+        .map(name => [name, paramDefs[name].default] as const);
 
     return {
-        valid: errors.length === 0,
-        errors,
-        coercedParams: errors.length === 0 ? coercedParams : undefined
+        alias: metadata.alias,
+        schemaHash: paramSchemaHash(metadata.params),
+        validate(params: Record<string, any>, options: ValidateOptions = {}): ValidationResult {
+            const errors: ValidationError[] = [];
+            const coercedParams: Record<string, any> = {};
+
+            // Normalize aliases to canonical parameter names
+            let normalizedParams = params;
+            if (aliasMap.size > 0) {
+                normalizedParams = {};
+                for (const name in params) {
+                    normalizedParams[aliasMap.get(name) ?? name] = params[name];
+                }
+            }
+
+            // Check for required parameters (using normalized params)
+            for (const name of required) {
+                if (!(name in normalizedParams)) {
+                    errors.push({ field: name, message: 'Missing required parameter' });
+                }
+            }
+
+            // Validate and coerce provided parameters
+            for (const name in normalizedParams) {
+                const value = normalizedParams[name];
+                const field = fields.get(name);
+
+                if (!field) {
+                    // Unknown parameter
+                    const suggestion = findClosestMatch(name, names);
+                    errors.push({ field: name, message: 'Unknown parameter', suggestion: suggestion || undefined });
+                    continue;
+                }
+
+                // Skip null or undefined values for optional params
+                if (value === null || value === undefined) {
+                    if (field.def.required) {
+                        errors.push({ field: name, message: 'Required parameter cannot be null or undefined' });
+                    }
+                    continue;
+                }
+
+                try {
+                    const error = field.check(value, coercedParams, options);
+                    if (error) {
+                        errors.push(error);
+                    }
+                } catch (error: any) {
+                    errors.push({
+                        field: name,
+                        message: error.message || `Failed to validate ${name}`,
+                        expected: field.def.type,
+                        received: typeof value
+                    });
+                }
+            }
+
+            // Apply default values for missing optional parameters
+            for (const [name, defaultValue] of defaults) {
+                if (!(name in params)) {
+                    coercedParams[name] = defaultValue;
+                }
+            }
+
+            return {
+                valid: errors.length === 0,
+                errors,
+                coercedParams: errors.length === 0 ? coercedParams : undefined
+            };
+        }
     };
 }
 
+/**
+ * Compiled validators, one per metadata object
+ *
+ * Metadata objects come from the loaded manifest (or its on-disk cache), so a
+ * rebuilt manifest gives new objects and new validators.
+ */
+const validators = new WeakMap<ScriptMetadata, CompiledValidator>();
+
+/**
+ * Compiled validator for a script, built on first use
+ *
+ * Shared by `vscb script run`, `vscb exec` and the MCP tool handlers.
+ */
+export function getValidator(metadata: ScriptMetadata): CompiledValidator {
+    let validator = validators.get(metadata);
+    if (!validator) {
+        validator = compileValidator(metadata);
+        validators.set(metadata, validator);
+    }
+    return validator;
+}
+
+/**
+ * Validate parameters against script metadata
+ */
+export function validateParams(
+    metadata: ScriptMetadata,
+    params: Record<string, any>,
+    options: ValidateOptions = {}
+): ValidationResult {
+    return getValidator(metadata).validate(params, options);
+}
+
 /**
  * Coerce a value to the expected type
  */
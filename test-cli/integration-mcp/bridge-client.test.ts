@@ -0,0 +1,140 @@
+/**
+ * Integration tests for the MCP server's long-lived bridge client.
+ *
+ * Uses a real fs-bridge job queue in a temp workspace with a fake extension
+ * that answers every job, counting how many jobs actually reach it.
+ *
+ * Test approach:
+ * - Real fs-bridge IPC (real file operations)
+ * - Fake extension writes claimed.json, response.json and done
+ * - Asserts on jobs seen by the fake extension and on client counters
+ */
+
+import { describe, test, expect, beforeEach, afterEach } from 'vitest';
+import { promises as fs } from 'fs';
+import path from 'path';
+import os from 'os';
+import { BridgeClient, isShareableScript } from '../../src/lib/mcp/bridge-client.js';
+import type { ScriptMetadata } from '../../src/lib/manifest-loader.js';
+
+describe('BridgeClient', () => {
+  let workspace: string;
+  let executeDir: string;
+  let jobs: string[];
+  let responder: NodeJS.Timeout;
+
+  beforeEach(async () => {
+    workspace = await fs.mkdtemp(path.join(os.tmpdir(), 'vsc-bridge-client-'));
+    executeDir = path.join(workspace, '.vsc-bridge', 'execute');
+    await fs.mkdir(executeDir, { recursive: true });
+    await fs.writeFile(
+      path.join(workspace, '.vsc-bridge', 'host.json'),
+      JSON.stringify({ bridgeId: 'test-bridge', workspace, startedAt: new Date().toISOString() })
+    );
+
+    // Fake extension: answer each job once, after a short delay so calls overlap
+    jobs = [];
+    responder = setInterval(async () => {
+      for (const id of await fs.readdir(executeDir).catch(() => [] as string[])) {
+        if (jobs.includes(id)) continue;
+        const jobDir = path.join(executeDir, id);
+        let command;
+        try {
+          command = JSON.parse(await fs.readFile(path.join(jobDir, 'command.json'), 'utf8'));
+        } catch {
+          continue;
+        }
+        jobs.push(id);
+        await new Promise(resolve => setTimeout(resolve, 20));
+        try {
+          await fs.writeFile(path.join(jobDir, 'claimed.json'), JSON.stringify({ bridgeId: 'test-bridge', pid: process.pid }));
+          await fs.writeFile(path.join(jobDir, 'response.json'), JSON.stringify({
+            ok: true,
+            type: 'success',
+            data: { script: command.scriptName, params: command.params, job: id },
+            meta: { requestId: id, timestamp: new Date().toISOString() }
+          }));
+          await fs.writeFile(path.join(jobDir, 'done'), '');
+        } catch {
+          // Workspace removed by afterEach
+        }
+      }
+    }, 5);
+  });
+
+  afterEach(async () => {
+    clearInterval(responder);
+    await fs.rm(workspace, { recursive: true, force: true });
+  });
+
+  test('concurrent identical read-only calls share one bridge job', async () => {
+    const bridge = new BridgeClient({ workspace });
+
+    const [a, b, c] = await Promise.all([
+      bridge.execute('debug.status', { verbose: true, depth: 1 }, { timeout: 5000, shareable: true }),
+      bridge.execute('debug.status', { depth: 1, verbose: true }, { timeout: 5000, shareable: true }),
+      bridge.execute('debug.status', { depth: 2, verbose: true }, { timeout: 5000, shareable: true })
+    ]);
+
+    expect(jobs).toHaveLength(2);
+    expect(a).toBe(b);
+    expect(a.isError).toBeUndefined();
+    expect((c.structuredContent as any).data.params.depth).toBe(2);
+    expect(bridge.stats()).toMatchObject({ calls: 3, shared: 1 });
+
+    // Finished requests are not reused
+    await bridge.execute('debug.status', { verbose: true, depth: 1 }, { timeout: 5000, shareable: true });
+    expect(jobs).toHaveLength(3);
+  });
+
+  test('does not share calls that are not marked shareable', async () => {
+    const bridge = new BridgeClient({ workspace });
+
+    await Promise.all([
+      bridge.execute('debug.step-over', {}, { timeout: 5000 }),
+      bridge.execute('debug.step-over', {}, { timeout: 5000 })
+    ]);
+
+    expect(jobs).toHaveLength(2);
+    expect(bridge.stats().shared).toBe(0);
+  });
+
+  test('discovers the bridge root and parses host.json once across calls', async () => {
+    const bridge = new BridgeClient({ workspace });
+
+    await bridge.execute('breakpoint.list', {}, { timeout: 5000 });
+    await bridge.execute('breakpoint.list', {}, { timeout: 5000 });
+
+    expect(await bridge.getBridgeRoot()).toBe(path.join(workspace, '.vsc-bridge'));
+    expect(bridge.stats()).toMatchObject({ calls: 2, rootLookups: 1, hostReads: 1 });
+    expect((await bridge.getHealth(true)).healthy).toBe(true);
+  });
+
+  test('reports an unhealthy bridge and looks it up again afterwards', async () => {
+    const bridge = new BridgeClient({ workspace });
+    await bridge.getBridgeRoot();
+
+    const stale = new Date(Date.now() - 60000);
+    await fs.utimes(path.join(workspace, '.vsc-bridge', 'host.json'), stale, stale);
+
+    const response = await bridge.execute('debug.status', {}, { timeout: 5000, shareable: true });
+    expect(response.isError).toBe(true);
+    expect((response.structuredContent as any).error.code).toBe('E_BRIDGE_UNAVAILABLE');
+    expect(jobs).toHaveLength(0);
+
+    await bridge.getBridgeRoot();
+    expect(bridge.stats().rootLookups).toBe(2);
+  });
+});
+
+describe('isShareableScript', () => {
+  const withSafety = (safety: Record<string, boolean>) =>
+    ({ alias: 'x.y', mcp: { tool: 'x_y', description: '', safety } } as unknown as ScriptMetadata);
+
+  test('requires read-only and idempotent safety metadata', () => {
+    expect(isShareableScript(withSafety({ idempotent: true, read_only: true }))).toBe(true);
+    expect(isShareableScript(withSafety({ idempotent: true, read_only: false }))).toBe(false);
+    expect(isShareableScript(withSafety({ idempotent: false, read_only: true }))).toBe(false);
+    expect(isShareableScript(undefined)).toBe(false);
+  });
+});
@@ -0,0 +1,158 @@
+/**
+ * Integration tests for large-result spillover and paged retrieval.
+ *
+ * Uses a real spill store under a temp bridge root and a real fs-bridge job
+ * (fake extension response) for the adapter path.
+ *
+ * Test approach:
+ * - Real files under <bridgeRoot>/cache/mcp-spill
+ * - Pages are checked for bounded size and for reassembling the full result
+ */
+
+import { describe, test, expect, beforeEach, afterEach } from 'vitest';
+import { promises as fs } from 'fs';
+import path from 'path';
+import os from 'os';
+import {
+  SpillStore,
+  SpillNotFoundError,
+  estimateTokens,
+  SPILL_DIR,
+  SPILL_TOKEN_THRESHOLD
+} from '../../src/lib/mcp/spill-store.js';
+import { executeToolViaBridge } from '../../src/lib/mcp/bridge-adapter.js';
+
+function variables(count: number) {
+  return Array.from({ length: count }, (_, i) => ({
+    name: `item_${i}`,
+    value: `'${'x'.repeat(40)}é${i}'`,
+    type: 'str',
+    variablesReference: 0
+  }));
+}
+
+describe('SpillStore', () => {
+  let bridgeRoot: string;
+
+  beforeEach(async () => {
+    bridgeRoot = await fs.mkdtemp(path.join(os.tmpdir(), 'vsc-bridge-spill-'));
+  });
+
+  afterEach(async () => {
+    await fs.rm(bridgeRoot, { recursive: true, force: true });
+  });
+
+  test('pages the record array in bounded pages that cover every record', async () => {
+    const store = new SpillStore(path.join(bridgeRoot, SPILL_DIR));
+    const data = { variables: variables(2000), metadata: { variableCount: 2000 } };
+    const json = JSON.stringify(data);
+
+    const spill = await store.spill(data, json, estimateTokens(json));
+    expect(spill.records).toEqual({ path: 'variables', count: 2000 });
+    expect(spill.summary).toEqual({ variables: '[2000 records]', metadata: { variableCount: 2000 } });
+
+    const seen: unknown[] = [];
+    let cursor: number | null = 0;
+    let pages = 0;
+    while (cursor !== null) {
+      const page = await store.page(spill.id, { cursor, maxBytes: 8192 });
+      expect(Buffer.byteLength(JSON.stringify(page.records))).toBeLessThanOrEqual(8192 + 2);
+      seen.push(...page.records!);
+      cursor = page.nextCursor;
+      pages++;
+    }
+    expect(pages).toBeGreaterThan(1);
+    expect(seen).toEqual(data.variables);
+  });
+
+  test('pages raw JSON by byte cursor without splitting characters', async () => {
+    const store = new SpillStore(path.join(bridgeRoot, SPILL_DIR));
+    const data = { text: 'é'.repeat(5000) };
+    const json = JSON.stringify(data);
+    const spill = await store.spill(data, json, estimateTokens(json));
+
+    let text = '';
+    let cursor: number | null = 0;
+    while (cursor !== null) {
+      const page = await store.page(spill.id, { cursor, maxBytes: 1025 });
+      expect(page.mode).toBe('bytes');
+      text += page.text;
+      cursor = page.nextCursor;
+    }
+    expect(text).toBe(json);
+  });
+
+  test('rejects unknown ids', async () => {
+    const store = new SpillStore(path.join(bridgeRoot, SPILL_DIR));
+    await expect(store.page('spill-missing')).rejects.toThrow(SpillNotFoundError);
+  });
+
+  test('reports results whose files were deleted as not found', async () => {
+    const store = new SpillStore(path.join(bridgeRoot, SPILL_DIR));
+    const data = { variables: variables(10) };
+    const json = JSON.stringify(data);
+    const spill = await store.spill(data, json, estimateTokens(json));
+
+    await fs.rm(path.join(bridgeRoot, SPILL_DIR), { recursive: true, force: true });
+
+    await expect(store.page(spill.id)).rejects.toThrow(SpillNotFoundError);
+    await expect(store.page(spill.id, { mode: 'bytes' })).rejects.toThrow(SpillNotFoundError);
+  });
+});
+
+describe('estimateTokens', () => {
+  test('counts punctuation and word runs and stops early', () => {
+    expect(estimateTokens('')).toBe(0);
+    expect(estimateTokens('{"a":1}')).toBe(7);
+    expect(estimateTokens('abcdefgh')).toBe(2);
+    expect(estimateTokens('{}'.repeat(1000), 10)).toBe(11);
+  });
+});
+
+describe('executeToolViaBridge spillover', () => {
+  let bridgeRoot: string;
+
+  beforeEach(async () => {
+    bridgeRoot = await fs.mkdtemp(path.join(os.tmpdir(), 'vsc-bridge-spill-'));
+    await fs.mkdir(path.join(bridgeRoot, 'execute'), { recursive: true });
+    await fs.writeFile(path.join(bridgeRoot, 'host.json'), JSON.stringify({ bridgeId: 'test-bridge' }));
+  });
+
+  afterEach(async () => {
+    await fs.rm(bridgeRoot, { recursive: true, force: true });
+  });
+
+  test('returns a spill descriptor instead of the payload for oversized results', async () => {
+    const data = { logs: variables(3000), matched: 3000 };
+    const executeDir = path.join(bridgeRoot, 'execute');
+
+    const respond = (async () => {
+      for (let i = 0; i < 200; i++) {
+        await new Promise(resolve => setTimeout(resolve, 10));
+        const [job] = await fs.readdir(executeDir);
+        if (!job) continue;
+        const jobDir = path.join(executeDir, job);
+        await fs.writeFile(path.join(jobDir, 'claimed.json'), JSON.stringify({ bridgeId: 'test-bridge' }));
+        await fs.writeFile(path.join(jobDir, 'response.json'), JSON.stringify({ ok: true, type: 'success', data, meta: {} }));
+        await fs.writeFile(path.join(jobDir, 'done'), '');
+        return;
+      }
+    })();
+
+    const [, result] = await Promise.all([
+      respond,
+      executeToolViaBridge('dap.logs', {}, { bridgeRoot, timeout: 5000 })
+    ]);
+
+    const text = result.content[0].text;
+    expect(estimateTokens(JSON.stringify(data))).toBeGreaterThan(SPILL_TOKEN_THRESHOLD);
+    expect(text.length).toBeLessThan(4096);
+    const descriptor = JSON.parse(text);
+    expect(descriptor).toMatchObject({ spilled: true, records: { path: 'logs', count: 3000 } });
+    expect((result.structuredContent as any).data.spilled).toBe(true);
+    expect(JSON.stringify(result.structuredContent).length).toBeLessThan(4096);
+
+    const files = await fs.readdir(path.join(bridgeRoot, SPILL_DIR));
+    expect(files).toContain(`${descriptor.id}.ndjson`);
+  });
+});
@@ -0,0 +1,106 @@
+/**
+ * Integration tests for the precomputed MCP tool catalog.
+ *
+ * Builds a catalog from the fixture manifest and a doc in a temp directory,
+ * then loads it back the way the server does at startup.
+ *
+ * Test approach:
+ * - Real catalog and manifest files in a temp directory
+ * - Catalog must match runtime tool generation and be dropped once the manifest changes
+ * - Doc bodies are only read when a doc is fetched
+ */
+
+import { describe, test, expect, beforeEach, afterEach } from 'vitest';
+import * as fs from 'fs';
+import path from 'path';
+import os from 'os';
+import { fileURLToPath } from 'url';
+import {
+  writeToolCatalog,
+  loadToolCatalog,
+  getCatalogPath,
+  buildToolCatalog
+} from '../../src/lib/mcp/tool-catalog.js';
+import { generateMcpTools } from '../../src/lib/mcp/tool-generator.js';
+import { DocLoader } from '../../src/lib/mcp/doc-tools/loader.js';
+import { DocRegistry } from '../../src/lib/mcp/doc-tools/registry.js';
+import type { ManifestV2 } from '../../src/lib/manifest-loader.js';
+
+const fixturesDir = path.join(path.dirname(fileURLToPath(import.meta.url)), 'fixtures');
+
+const DOC = `---
+tool_name: docs_catalog_test
+description: Catalog test documentation used to check lazy doc loading
+summary: Catalog test documentation for lazy loading
+category: guides
+tags: [testing]
+---
+
+# Catalog test
+
+Body text.
+`;
+
+describe('MCP tool catalog', () => {
+  let tempDir: string;
+  let manifestPath: string;
+  let docsDir: string;
+
+  beforeEach(() => {
+    tempDir = fs.mkdtempSync(path.join(os.tmpdir(), 'vscb-catalog-'));
+    manifestPath = path.join(tempDir, 'manifest.json');
+    fs.copyFileSync(path.join(fixturesDir, 'test-manifest.json'), manifestPath);
+    docsDir = path.join(tempDir, 'docs');
+    fs.mkdirSync(docsDir);
+    fs.writeFileSync(path.join(docsDir, 'docs_catalog_test.md'), DOC);
+  });
+
+  afterEach(() => {
+    fs.rmSync(tempDir, { recursive: true, force: true });
+  });
+
+  test('loads the same tools and aliases as runtime generation', () => {
+    const manifest: ManifestV2 = JSON.parse(fs.readFileSync(manifestPath, 'utf-8'));
+    const docs = new DocLoader().load(docsDir);
+
+    expect(writeToolCatalog(manifestPath, docs)).toBe(getCatalogPath(manifestPath));
+    const catalog = loadToolCatalog(manifestPath)!;
+
+    expect(catalog).toEqual(buildToolCatalog(manifest, docs));
+    expect(catalog.tools).toEqual(generateMcpTools(manifest));
+    expect(catalog.toolNameToAlias.add_breakpoint).toBe('breakpoint.set');
+    expect(catalog.docs).toEqual([{ frontMatter: docs[0].frontMatter, filePath: 'docs_catalog_test.md' }]);
+  });
+
+  test('is ignored once the manifest changes or the catalog is unreadable', () => {
+    writeToolCatalog(manifestPath, new DocLoader().load(docsDir));
+
+    const manifest = JSON.parse(fs.readFileSync(manifestPath, 'utf-8'));
+    manifest.generatedAt = '2026-01-01T00:00:00.000Z';
+    fs.writeFileSync(manifestPath, JSON.stringify(manifest));
+    expect(loadToolCatalog(manifestPath)).toBeNull();
+
+    fs.writeFileSync(getCatalogPath(manifestPath), '{not json');
+    expect(loadToolCatalog(manifestPath)).toBeNull();
+    expect(loadToolCatalog(path.join(tempDir, 'missing', 'manifest.json'))).toBeNull();
+  });
+
+  test('reads a doc body only when the doc is fetched', () => {
+    writeToolCatalog(manifestPath, new DocLoader().load(docsDir));
+    const catalog = loadToolCatalog(manifestPath)!;
+
+    const loader = new DocLoader();
+    const loaded: string[] = [];
+    const registry = new DocRegistry(catalog.docs, entry => {
+      loaded.push(entry.filePath);
+      return loader.loadDocument(entry.filePath, docsDir).content;
+    });
+
+    expect(registry.getAllSummaries({ tags: ['testing'] })).toHaveLength(1);
+    expect(loaded).toHaveLength(0);
+
+    expect(registry.getDocById('catalog-test').content).toContain('Body text.');
+    registry.getDocById('catalog-test');
+    expect(loaded).toEqual(['docs_catalog_test.md']);
+  });
+});
@@ -0,0 +1,56 @@
+/**
+ * Tests for batch command parsing
+ */
+import { describe, it, expect } from 'vitest';
+import {
+  parseBatchSpec,
+  createBatchCommand,
+  BATCH_SCRIPT_NAME,
+  MAX_BATCH_STEPS
+} from '../../src/lib/batch.js';
+
+describe('parseBatchSpec', () => {
+  it('accepts a bare array of steps', () => {
+    const spec = parseBatchSpec(JSON.stringify([
+      { scriptName: 'breakpoint.set', params: { path: '/a.py', line: 3 } },
+      { scriptName: 'debug.start' }
+    ]));
+
+    expect(spec.steps).toHaveLength(2);
+    expect(spec.stopOnError).toBe(false);
+  });
+
+  it('accepts an object with stopOnError', () => {
+    const spec = parseBatchSpec(JSON.stringify({
+      steps: [{ scriptName: 'debug.start' }],
+      stopOnError: true
+    }));
+
+    expect(spec.stopOnError).toBe(true);
+  });
+
+  it('rejects invalid JSON, empty batches and malformed steps', () => {
+    expect(() => parseBatchSpec('{')).toThrow(/not valid JSON/);
+    expect(() => parseBatchSpec('[]')).toThrow(/non-empty/);
+    expect(() => parseBatchSpec('[{"params":{}}]')).toThrow(/scriptName/);
+    expect(() => parseBatchSpec('[{"scriptName":"x","params":[1]}]')).toThrow(/params/);
+  });
+
+  it('rejects batches over the step limit', () => {
+    const steps = Array.from({ length: MAX_BATCH_STEPS + 1 }, () => ({ scriptName: 'x' }));
+    expect(() => parseBatchSpec(JSON.stringify(steps))).toThrow(/maximum/);
+  });
+});
+
+describe('createBatchCommand', () => {
+  it('builds an @batch command with normalised params', () => {
+    const command = createBatchCommand({ steps: [{ scriptName: 'debug.start' }] }, 'cli-1', 60000);
+
+    expect(command.scriptName).toBe(BATCH_SCRIPT_NAME);
+    expect(command.timeout).toBe(60000);
+    expect(command.params).toEqual({
+      steps: [{ scriptName: 'debug.start', params: {} }],
+      stopOnError: false
+    });
+  });
+});
@@ -0,0 +1,243 @@
+/**
+ * Tests for the local socket transport client
+ */
+import { describe, it, expect, beforeEach, afterEach } from 'vitest';
+import { promises as fs } from 'fs';
+import net from 'net';
+import path from 'path';
+import os from 'os';
+import {
+  readSocketEndpoint,
+  getSocketClient,
+  closeSocketClients,
+  SocketUnavailableError,
+  SOCKET_DATA_DIR,
+  type SocketEndpoint
+} from '../../src/lib/bridge-socket.js';
+import { runCommand, sortableId, type CommandJson } from '../../src/lib/fs-bridge.js';
+
+const TOKEN = 'test-token';
+
+/**
+ * Minimal stand-in for the extension's socket server: authenticates the
+ * hello frame, then answers each request with one event and an echo response
+ */
+function startFakeServer(socketPath: string, opts?: { holdRequests?: boolean }): Promise<net.Server> {
+  const server = net.createServer(socket => {
+    let buffer = '';
+    let authed = false;
+    socket.setEncoding('utf8');
+    // The client may hang up before a late reply (e.g. a cancel ack after a timeout)
+    socket.on('error', () => undefined);
+    socket.on('data', (chunk: string) => {
+      buffer += chunk;
+      let newline: number;
+      while ((newline = buffer.indexOf('\n')) !== -1) {
+        const frame = JSON.parse(buffer.slice(0, newline));
+        buffer = buffer.slice(newline + 1);
+
+        if (!authed) {
+          if (frame.token !== TOKEN) {
+            socket.end(JSON.stringify({ type: 'error', message: 'Authentication failed' }) + '\n');
+            return;
+          }
+          authed = true;
+          socket.write(JSON.stringify({ type: 'welcome', version: 1, bridgeId: 'fake' }) + '\n');
+          continue;
+        }
+
+        if (frame.type === 'request') {
+          if (opts?.holdRequests) continue;
+          const id = frame.command.id;
+          if (frame.command.params.dataRef) {
+            // Large result the test wrote under socket-data/<id>/
+            socket.write(JSON.stringify({
+              type: 'response', id,
+              envelope: { ok: true, type: 'success', dataRef: frame.command.params.dataRef, dataFormat: 'ndjson' }
+            }) + '\n');
+            continue;
+          }
+          socket.write(JSON.stringify({
+            type: 'event', id,
+            event: { ts: Date.now(), seq: 0, type: 'log', level: 'info', text: 'hi' }
+          }) + '\n');
+          socket.write(JSON.stringify({
+            type: 'response', id,
+            envelope: { ok: true, type: 'success', data: { echo: frame.command.params } }
+          }) + '\n');
+        } else if (frame.type === 'cancel') {
+          socket.write(JSON.stringify({
+            type: 'response', id: frame.id,
+            envelope: { ok: false, type: 'error', error: { code: 'E_CANCELLED', message: 'cancelled' } }
+          }) + '\n');
+        }
+      }
+    });
+  });
+
+  return new Promise((resolve, reject) => {
+    server.once('error', reject);
+    server.listen(socketPath, () => resolve(server));
+  });
+}
+
+function makeCommand(params: Record<string, unknown> = {}): CommandJson {
+  return {
+    version: 1,
+    clientId: 'test',
+    id: sortableId(1),
+    createdAt: new Date().toISOString(),
+    scriptName: 'test.echo',
+    params
+  };
+}
+
+describe.skipIf(process.platform === 'win32')('Bridge Socket Transport', () => {
+  let tempDir: string;
+  let bridgeDir: string;
+  let socketPath: string;
+  let server: net.Server | undefined;
+
+  const writeHost = async (socket?: SocketEndpoint, platform: string = process.platform) => {
+    await fs.writeFile(path.join(bridgeDir, 'host.json'), JSON.stringify({
+      bridgeId: 'fake',
+      version: 1,
+      platform,
+      workspace: tempDir,
+      pid: process.pid,
+      startedAt: new Date().toISOString(),
+      wslAware: true,
+      socket
+    }));
+  };
+
+  beforeEach(async () => {
+    tempDir = await fs.mkdtemp(path.join(os.tmpdir(), 'sock-'));
+    bridgeDir = path.join(tempDir, '.vsc-bridge');
+    await fs.mkdir(path.join(bridgeDir, 'execute'), { recursive: true });
+    socketPath = path.join(tempDir, 'b.sock');
+  });
+
+  afterEach(async () => {
+    await closeSocketClients();
+    if (server) {
+      await new Promise(resolve => server!.close(resolve));
+      server = undefined;
+    }
+    await fs.rm(tempDir, { recursive: true, force: true });
+  });
+
+  it('reads the advertised endpoint from host.json', async () => {
+    await writeHost({ path: socketPath, token: TOKEN });
+    expect(await readSocketEndpoint(bridgeDir)).toEqual({ path: socketPath, token: TOKEN });
+  });
+
+  it('ignores endpoints advertised by a host on another platform', async () => {
+    await writeHost({ path: socketPath, token: TOKEN }, process.platform === 'linux' ? 'win32' : 'linux');
+    expect(await readSocketEndpoint(bridgeDir)).toBeUndefined();
+  });
+
+  it('rejects with SocketUnavailableError on a bad token', async () => {
+    server = await startFakeServer(socketPath);
+    await expect(getSocketClient({ path: socketPath, token: 'wrong' }))
+      .rejects.toBeInstanceOf(SocketUnavailableError);
+  });
+
+  it('runs commands over the socket and streams events', async () => {
+    server = await startFakeServer(socketPath);
+    await writeHost({ path: socketPath, token: TOKEN });
+
+    const events: any[] = [];
+    const result = await runCommand(bridgeDir, makeCommand({ a: 1 }), {
+      onEvent: e => events.push(e)
+    });
+
+    expect(result.ok).toBe(true);
+    expect(result.data).toEqual({ echo: { a: 1 } });
+    expect(events).toHaveLength(1);
+    // No job directory is created on the socket path
+    expect(await fs.readdir(path.join(bridgeDir, 'execute'))).toEqual([]);
+  });
+
+  it('reuses one connection for concurrent requests', async () => {
+    server = await startFakeServer(socketPath);
+    await writeHost({ path: socketPath, token: TOKEN });
+
+    let connections = 0;
+    server.on('connection', () => connections++);
+
+    const results = await Promise.all(
+      [1, 2, 3].map(n => runCommand(bridgeDir, { ...makeCommand({ n }), id: sortableId(n) }))
+    );
+
+    expect(results.map(r => r.data.echo.n)).toEqual([1, 2, 3]);
+    expect(connections).toBe(1);
+  });
+
+  it('reassembles a large response frame received in many chunks', async () => {
+    server = await startFakeServer(socketPath);
+    await writeHost({ path: socketPath, token: TOKEN });
+
+    const text = 'x'.repeat(4 * 1024 * 1024);
+    const result = await runCommand(bridgeDir, makeCommand({ text }));
+
+    expect(result.ok).toBe(true);
+    expect(result.data.echo.text.length).toBe(text.length);
+  });
+
+  it('reads dataRef results from the socket data dir and removes them', async () => {
+    server = await startFakeServer(socketPath);
+    await writeHost({ path: socketPath, token: TOKEN });
+
+    const cmd = makeCommand({ dataRef: 'data.ndjson' });
+    const dataDir = path.join(bridgeDir, SOCKET_DATA_DIR, cmd.id);
+    await fs.mkdir(dataDir, { recursive: true });
+    await fs.writeFile(path.join(dataDir, 'data.ndjson'), '{"n":1}\n{"n":2}\n');
+
+    const result = await runCommand(bridgeDir, cmd);
+
+    expect(result.ok).toBe(true);
+    expect(result.data).toEqual([{ n: 1 }, { n: 2 }]);
+    expect(result.dataRef).toBeUndefined();
+    await expect(fs.access(dataDir)).rejects.toThrow();
+  });
+
+  it('sends cancel on abort and returns the bridge acknowledgement', async () => {
+    server = await startFakeServer(socketPath, { holdRequests: true });
+    await writeHost({ path: socketPath, token: TOKEN });
+
+    const controller = new AbortController();
+    setTimeout(() => controller.abort(), 50);
+    const result = await runCommand(bridgeDir, makeCommand(), { signal: controller.signal, timeout: 5000 });
+
+    expect(result.ok).toBe(false);
+    expect(result.error.code).toBe('E_CANCELLED');
+  });
+
+  it('times out when the bridge never answers', async () => {
+    server = await startFakeServer(socketPath, { holdRequests: true });
+    await writeHost({ path: socketPath, token: TOKEN });
+
+    const result = await runCommand(bridgeDir, makeCommand(), { timeout: 100 });
+    expect(result.error.code).toBe('E_TIMEOUT');
+  });
+
+  it('returns E_BRIDGE_UNAVAILABLE in socket-only mode when the socket is gone', async () => {
+    await writeHost({ path: socketPath, token: TOKEN });
+
+    const result = await runCommand(bridgeDir, makeCommand(), { transport: 'socket' });
+    expect(result.ok).toBe(false);
+    expect(result.error.code).toBe('E_BRIDGE_UNAVAILABLE');
+  });
+
+  it('falls back to the file queue when the socket is unreachable', async () => {
+    await writeHost({ path: socketPath, token: TOKEN });
+
+    // No server: the command must land in execute/ (and time out unclaimed)
+    const cmd = makeCommand();
+    const result = await runCommand(bridgeDir, cmd, { timeout: 200 });
+
+    expect(result.error.code).toBe('E_TIMEOUT');
+    await expect(fs.access(path.join(bridgeDir, 'execute', cmd.id, 'command.json'))).resolves.toBeUndefined();
+  });
+});
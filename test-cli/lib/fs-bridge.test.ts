@@ -5,6 +5,7 @@ import { describe, it, expect, beforeEach, afterEach } from 'vitest';
 import { promises as fs } from 'fs';
 import path from 'path';
 import os from 'os';
+import { gzipSync } from 'zlib';
 import {
   findBridgeRoot,
   sortableId,
@@ -14,6 +15,7 @@ import {
   checkBridgeHealth,
   makeErrorEnvelope,
   PICKUP_TIMEOUT_MS,
+  WATCH_FALLBACK_POLL_MS,
   type CommandJson
 } from '../../src/lib/fs-bridge.js';
 
@@ -329,6 +331,40 @@ describe('Command Execution', () => {
     expect(result.data.results[0].file).toBe('/test/file0.ts');
   });
 
+  it('should read gzipped NDJSON large payloads and advertise support for them', async () => {
+    const payload: CommandJson = {
+      version: 1,
+      clientId: 'test-cli',
+      id: 'test-dataref-ndjson',
+      createdAt: new Date().toISOString(),
+      scriptName: 'debug.list-variables',
+      params: {}
+    };
+
+    const jobDir = path.join(executeDir, payload.id);
+    await fs.mkdir(jobDir, { recursive: true });
+
+    const rows = Array.from({ length: 5000 }, (_, i) => ({ name: `v${i}`, value: String(i) }));
+
+    setTimeout(async () => {
+      await fs.writeFile(path.join(jobDir, 'claimed.json'), '{}');
+      await fs.writeFile(path.join(jobDir, 'response.json'),
+        JSON.stringify({ ok: true, dataRef: 'data.ndjson.gz', dataFormat: 'ndjson', dataEncoding: 'gzip' }));
+      await fs.writeFile(path.join(jobDir, 'data.ndjson.gz'),
+        gzipSync(rows.map(row => JSON.stringify(row)).join('\n') + '\n'));
+      await fs.writeFile(path.join(jobDir, 'done'), '');
+    }, 50);
+
+    const result = await runCommand(bridgeDir, payload, { timeout: 1000 });
+
+    expect(result.data).toEqual(rows);
+    expect(result.dataRef).toBeUndefined();
+    expect(result.dataFormat).toBeUndefined();
+
+    const command = JSON.parse(await fs.readFile(path.join(jobDir, 'command.json'), 'utf8'));
+    expect(command.accept).toEqual(['ndjson', 'gzip']);
+  });
+
   it('should handle concurrent commands', async () => {
     const commands = [];
 
@@ -1594,3 +1630,102 @@ describe('Error Message Enhancement - Phase 6', () => {
     });
   });
 });
+
+describe('Notification-Driven Waits', () => {
+  let tempDir: string;
+  let bridgeDir: string;
+  let executeDir: string;
+
+  beforeEach(async () => {
+    tempDir = await fs.mkdtemp(path.join(os.tmpdir(), 'cli-wait-test-'));
+    bridgeDir = path.join(tempDir, '.vsc-bridge');
+    executeDir = path.join(bridgeDir, 'execute');
+
+    await fs.mkdir(executeDir, { recursive: true });
+    await fs.writeFile(path.join(bridgeDir, 'host.json'), JSON.stringify({
+      pid: process.pid,
+      version: '1.0.0'
+    }));
+  });
+
+  afterEach(async () => {
+    await fs.rm(tempDir, { recursive: true, force: true });
+  });
+
+  function makePayload(id: string): CommandJson {
+    return {
+      version: 1,
+      clientId: 'test-cli',
+      id,
+      createdAt: new Date().toISOString(),
+      scriptName: 'debug.status',
+      params: {}
+    };
+  }
+
+  async function respondAfter(jobDir: string, delayMs: number, data: unknown): Promise<void> {
+    await new Promise(r => setTimeout(r, delayMs));
+    await fs.writeFile(path.join(jobDir, 'claimed.json'), '{}');
+    await fs.writeFile(path.join(jobDir, 'response.json'), JSON.stringify({ ok: true, data }));
+    await fs.writeFile(path.join(jobDir, 'done'), '');
+  }
+
+  it('should complete in watch mode', async () => {
+    const payload = makePayload('watch-mode');
+    const jobDir = path.join(executeDir, payload.id);
+    await fs.mkdir(jobDir, { recursive: true });
+
+    respondAfter(jobDir, 30, { mode: 'watch' });
+
+    const result = await runCommand(bridgeDir, payload, { timeout: 2000, waitMode: 'watch' });
+    expect(result.data).toEqual({ mode: 'watch' });
+  });
+
+  it('should complete in legacy poll mode', async () => {
+    const payload = makePayload('poll-mode');
+    const jobDir = path.join(executeDir, payload.id);
+    await fs.mkdir(jobDir, { recursive: true });
+
+    respondAfter(jobDir, 30, { mode: 'poll' });
+
+    const result = await runCommand(bridgeDir, payload, { timeout: 2000, waitMode: 'poll' });
+    expect(result.data).toEqual({ mode: 'poll' });
+  });
+
+  it('should wake on done marker without waiting for the fallback poll', async () => {
+    const payload = makePayload('watch-latency');
+    const jobDir = path.join(executeDir, payload.id);
+    await fs.mkdir(jobDir, { recursive: true });
+
+    // Claim immediately, complete later: completion must not wait WATCH_FALLBACK_POLL_MS
+    await fs.writeFile(path.join(jobDir, 'claimed.json'), '{}');
+    const start = Date.now();
+    respondAfter(jobDir, 100, 'fast');
+
+    const result = await runCommand(bridgeDir, payload, { timeout: 2000, waitMode: 'watch' });
+    const elapsed = Date.now() - start;
+
+    expect(result.data).toBe('fast');
+    expect(elapsed).toBeLessThan(100 + WATCH_FALLBACK_POLL_MS);
+  });
+
+  it('should deliver events to onEvent including ones written right before done', async () => {
+    const payload = makePayload('watch-events');
+    const jobDir = path.join(executeDir, payload.id);
+    await fs.mkdir(jobDir, { recursive: true });
+
+    setTimeout(async () => {
+      await fs.writeFile(path.join(jobDir, 'claimed.json'), '{}');
+      await fs.appendFile(path.join(jobDir, 'events.ndjson'), '{"type":"log","seq":0}\n');
+      await new Promise(r => setTimeout(r, 30));
+      await fs.appendFile(path.join(jobDir, 'events.ndjson'), '{"type":"log","seq":1}\n');
+      await fs.writeFile(path.join(jobDir, 'response.json'), JSON.stringify({ ok: true, data: null }));
+      await fs.writeFile(path.join(jobDir, 'done'), '');
+    }, 20);
+
+    const events: any[] = [];
+    await runCommand(bridgeDir, payload, { timeout: 2000, onEvent: e => events.push(e) });
+
+    expect(events.map(e => e.seq)).toEqual([0, 1]);
+  });
+});
@@ -0,0 +1,80 @@
+/**
+ * Tests for the CLI on-disk metadata cache and the loaders that use it
+ */
+import { describe, it, expect, beforeEach, afterEach } from 'vitest';
+import * as fs from 'fs';
+import path from 'path';
+import os from 'os';
+import { fileSignature, readCache, writeCache } from '../../src/lib/metadata-cache.js';
+import { ManifestLoader } from '../../src/lib/manifest-loader.js';
+
+describe('metadata cache', () => {
+  let tempDir: string;
+  const savedEnv = { ...process.env };
+
+  beforeEach(() => {
+    tempDir = fs.mkdtempSync(path.join(os.tmpdir(), 'vscb-cache-'));
+    process.env.VSC_BRIDGE_CACHE_DIR = path.join(tempDir, 'cache');
+    delete process.env.VSC_BRIDGE_NO_CACHE;
+  });
+
+  afterEach(() => {
+    process.env = { ...savedEnv };
+    fs.rmSync(tempDir, { recursive: true, force: true });
+  });
+
+  it('returns entries only for a matching signature', () => {
+    writeCache('ns', 'debug.status', 'sig-1', { alias: 'debug.status' });
+
+    expect(readCache('ns', 'debug.status', 'sig-1')).toEqual({ alias: 'debug.status' });
+    expect(readCache('ns', 'debug.status', 'sig-2')).toBeUndefined();
+    expect(readCache('ns', 'other', 'sig-1')).toBeUndefined();
+  });
+
+  it('changes the file signature when the file is edited', () => {
+    const file = path.join(tempDir, 'manifest.json');
+    fs.writeFileSync(file, '{}');
+    const before = fileSignature(file);
+
+    fs.writeFileSync(file, '{"version":2}');
+    expect(fileSignature(file)).not.toBe(before);
+    expect(fileSignature(path.join(tempDir, 'missing.json'))).toBeNull();
+  });
+
+  it('is disabled by VSC_BRIDGE_NO_CACHE', () => {
+    process.env.VSC_BRIDGE_NO_CACHE = '1';
+    writeCache('ns', 'key', 'sig', 1);
+
+    expect(readCache('ns', 'key', 'sig')).toBeUndefined();
+    expect(fs.existsSync(process.env.VSC_BRIDGE_CACHE_DIR!)).toBe(false);
+  });
+
+  it('serves script metadata to a new loader until the manifest changes', () => {
+    const manifestPath = path.join(tempDir, 'manifest.json');
+    const manifest = (description: string) => JSON.stringify({
+      version: 2,
+      generatedAt: '2025-01-01T00:00:00.000Z',
+      scripts: {
+        'debug.status': { metadata: { alias: 'debug.status', description }, scriptRelPath: 'debug/status.js' }
+      }
+    });
+    process.env.VSC_BRIDGE_MANIFEST_PATH = manifestPath;
+    fs.writeFileSync(manifestPath, manifest('first build'));
+
+    // First process parses the manifest and populates the cache
+    expect(new ManifestLoader().getScriptMetadata('debug.status')?.description).toBe('first build');
+
+    // A later process answers from the cache
+    const signature = fileSignature(manifestPath);
+    const cached = readCache<{ description: string }>('manifest', 'debug.status', signature!);
+    expect(cached?.description).toBe('first build');
+    const warm = new ManifestLoader();
+    expect(warm.getScriptMetadata('debug.status')?.description).toBe('first build');
+    expect(warm.getLoadedPath()).toBe(manifestPath);
+
+    // A rebuilt manifest no longer matches and is re-read
+    fs.writeFileSync(manifestPath, manifest('second build, longer'));
+    expect(new ManifestLoader().getScriptMetadata('debug.status')?.description).toBe('second build, longer');
+    expect(new ManifestLoader().getScriptMetadata('missing.alias')).toBeNull();
+  });
+});
@@ -4,6 +4,9 @@ import {
     coerceValue,
     findClosestMatch,
     formatValidationErrors,
+    compileValidator,
+    getValidator,
+    paramSchemaHash,
     type ValidationResult,
     type ValidationError
 } from '../../src/lib/param-validator';
@@ -962,3 +965,56 @@ describe("WSL/Windows path translation", () => {
     });
 });
 
+
+describe('Compiled validators', () => {
+    const metadata: ScriptMetadata = {
+        alias: 'test.compiled',
+        description: 'Compiled validator test',
+        params: {
+            path: { type: 'string', required: true, aliases: ['file'], resolve: 'workspace-relative' },
+            line: { type: 'number', required: true, min: 1, integer: true },
+            pattern: { type: 'string', pattern: '^[a-z]+$' },
+            depth: { type: 'number', default: 2 }
+        }
+    } as ScriptMetadata;
+
+    it('should compile once per metadata object', () => {
+        const validator = getValidator(metadata);
+
+        expect(getValidator(metadata)).toBe(validator);
+        expect(getValidator({ ...metadata })).not.toBe(validator);
+        expect(validator.schemaHash).toBe(paramSchemaHash(metadata.params));
+        expect(validator.schemaHash).toHaveLength(16);
+    });
+
+    it('should match validateParams results', () => {
+        const cases: Record<string, any>[] = [
+            { file: 'src/a.ts', line: '3' },
+            { path: 'src/a.ts', line: '0', pattern: 'ABC' },
+            { path: 'src/a.ts', line: 2.5, depth: 'x', extra: 1 },
+            {}
+        ];
+
+        for (const params of cases) {
+            expect(compileValidator(metadata).validate(params, { workspaceRoot: '/ws' }))
+                .toEqual(validateParams(metadata, params, { workspaceRoot: '/ws' }));
+        }
+        expect(validateParams(metadata, { file: 'src/a.ts', line: '3' }, { workspaceRoot: '/ws' }).coercedParams)
+            .toEqual({ path: '/ws/src/a.ts', line: 3, depth: 2 });
+    });
+
+    it('should leave paths unresolved when resolvePaths is false', () => {
+        const result = getValidator(metadata).validate({ path: 'src/a.ts', line: 1 }, { resolvePaths: false });
+
+        expect(result.coercedParams).toEqual({ path: 'src/a.ts', line: 1, depth: 2 });
+    });
+
+    it('should change the schema hash when a definition changes', () => {
+        const changed = { ...metadata.params, line: { type: 'number', required: true, min: 0 } } as ScriptMetadata['params'];
+
+        expect(paramSchemaHash(changed)).not.toBe(paramSchemaHash(metadata.params));
+        expect(paramSchemaHash(undefined)).toBe(paramSchemaHash({}));
+        // Same value as the extension's generate-zod-schemas.ts
+        expect(paramSchemaHash(undefined)).toBe('44136fa355b3678a');
+    });
+});
@@ -0,0 +1,41 @@
+# Wide, deep object graph for list-variables expansion benchmarks
+#
+# Set a breakpoint on the `print` line in main() and run:
+#   vscb script run debug.list-variables --param maxDepth=5
+#
+# Every node has WIDTH children down to DEPTH levels; every third child is a
+# shared object and every node links back to the root (cycles).
+
+WIDTH = 8
+DEPTH = 5
+
+
+class Node:
+    def __init__(self, name, root=None):
+        self.name = name
+        self.root = root
+        self.children = []
+
+
+def build(name, depth, root, shared):
+    node = Node(name, root)
+    if depth == 0:
+        return node
+    for i in range(WIDTH):
+        if i % 3 == 2:
+            node.children.append(shared)
+        else:
+            node.children.append(build(f"{name}.{i}", depth - 1, root or node, shared))
+    return node
+
+
+def main():
+    shared = Node("shared")
+    graph = build("root", DEPTH, None, shared)
+    index = {f"k{i}": graph.children[i % WIDTH] for i in range(WIDTH * 4)}
+    print(f"graph ready: {len(index)} index entries")  # breakpoint here
+    return graph
+
+
+if __name__ == '__main__':
+    main()